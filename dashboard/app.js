@@ -24,6 +24,25 @@ let universes = [];
 let records = [];
 let chartInstances = [];
 let activeView = "signals";
+let activeUniverse = null;
+let manifest = null;
+let renderedViews = {};
+
+// Full-universe table state: the columns it shows, the matching record
+// positions in display order, and the worker (or main-thread fallback)
+// that answers queries. Only the rows in view are rendered.
+let tableData = null;
+let tableRows = new Int32Array(0);
+let tableSort = { field: "rank", descending: false };
+let tableQueryId = 0;
+let localTable = null;
+let tableRowHeight = 41;
+let scrollFrame = null;
+let tableWorker = createTableWorker();
+
+const DATA_ROOT = "data/";
+const jsonCache = new Map();
+const TABLE_OVERSCAN = 10;
 
 const VIEW_OPTIONS = [
   { id: "signals", label: "Signals" },
@@ -31,6 +50,111 @@ const VIEW_OPTIONS = [
   { id: "charts", label: "Charts" },
 ];
 
+function fetchJson(path) {
+  if (!jsonCache.has(path)) {
+    const request = fetch(`${DATA_ROOT}${path}`).then((response) => {
+      if (!response.ok) {
+        throw new Error(`${response.status} loading ${path}`);
+      }
+      return response.json();
+    });
+    request.catch(() => jsonCache.delete(path));
+    jsonCache.set(path, request);
+  }
+  return jsonCache.get(path);
+}
+
+function loadScript(src) {
+  return new Promise((resolve, reject) => {
+    const script = document.createElement("script");
+    script.src = src;
+    script.onload = resolve;
+    script.onerror = () => reject(new Error(`Failed to load ${src}`));
+    document.body.appendChild(script);
+  });
+}
+
+// The full bundle is only used when the split files cannot be fetched,
+// e.g. when index.html is opened from disk.
+function loadManifest() {
+  return fetchJson("manifest.json").catch(() => {
+    const bundle = window.TOP50_DATA
+      ? Promise.resolve()
+      : loadScript(`${DATA_ROOT}top50_signals.js`);
+    return bundle.then(() => window.TOP50_DATA);
+  });
+}
+
+function loadRecords(universe) {
+  if (universe.records) {
+    return Promise.resolve({
+      records: universe.records,
+      analyst_panel: universe.analyst_panel || [],
+    });
+  }
+  return fetchJson(universe.records_path);
+}
+
+function loadTableIndex(universe) {
+  if (!universe.index_path) {
+    return Promise.resolve(null);
+  }
+  return fetchJson(universe.index_path).catch(() => null);
+}
+
+function loadSepa(universe) {
+  if (universe.sepa_candidates) {
+    return Promise.resolve({ sepa_candidates: universe.sepa_candidates });
+  }
+  return fetchJson(universe.sepa_path);
+}
+
+function loadCharts(universe) {
+  if (universe.sepa_charts) {
+    return Promise.resolve(universe.sepa_charts);
+  }
+  const axis = manifest.chart_axis_path
+    ? fetchJson(manifest.chart_axis_path)
+    : Promise.resolve(null);
+  const charts = Promise.all(
+    (universe.charts || []).map((chart) => fetchJson(chart.path))
+  );
+  return Promise.all([axis, charts]).then(([axisData, chartData]) =>
+    chartData.map((chart) => decodeChart(chart, axisData))
+  );
+}
+
+// Charts written with CHART_ENCODING=f32 hold base64 float32 series that
+// index into a shared date axis; NaN marks missing points.
+function decodeFloat32(encoded) {
+  const binary = atob(encoded);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i += 1) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return new Float32Array(bytes.buffer);
+}
+
+function decodeChart(chart, axis) {
+  if (chart.encoding !== "f32") {
+    return chart;
+  }
+  return {
+    ticker: chart.ticker,
+    rs_score: chart.rs_score,
+    dates: axis.dates.slice(chart.axis_start, chart.axis_start + chart.length),
+    close: decodeFloat32(chart.close),
+    ma50: decodeFloat32(chart.ma50),
+    ma150: decodeFloat32(chart.ma150),
+    ma200: decodeFloat32(chart.ma200),
+    rs_line: decodeFloat32(chart.rs_line),
+  };
+}
+
+function formatNumber(value, digits) {
+  return value === null || value === undefined ? "-" : Number(value).toFixed(digits);
+}
+
 function badge(action) {
   const klass = action.toLowerCase();
   return `<span class="badge ${klass}">${action}</span>`;
@@ -51,8 +175,8 @@ function renderTable(rows) {
       <tr>
         <td>${row.ticker}</td>
         <td>${row.rank}</td>
-        <td>${Number(composite).toFixed(4)}</td>
-        <td>${Number(momentum).toFixed(4)}</td>
+        <td>${formatNumber(composite, 4)}</td>
+        <td>${formatNumber(momentum, 4)}</td>
         <td>${badge(row.action)}</td>
       </tr>
     `;
@@ -87,10 +211,10 @@ function renderSepaTable(rows) {
       (row) => `
       <tr>
         <td>${row.ticker}</td>
-        <td>${row.rs_score === null ? "-" : row.rs_score.toFixed(4)}</td>
-        <td>${row.ma_50 === null ? "-" : row.ma_50.toFixed(2)}</td>
-        <td>${row.ma_150 === null ? "-" : row.ma_150.toFixed(2)}</td>
-        <td>${row.ma_200 === null ? "-" : row.ma_200.toFixed(2)}</td>
+        <td>${formatNumber(row.rs_score, 4)}</td>
+        <td>${formatNumber(row.ma_50, 2)}</td>
+        <td>${formatNumber(row.ma_150, 2)}</td>
+        <td>${formatNumber(row.ma_200, 2)}</td>
       </tr>
     `
     )
@@ -126,9 +250,9 @@ function renderAnalystTable(rows) {
         <td>${row.ticker}</td>
         <td>${row.consensus ?? "-"}</td>
         <td>${row.analyst_count ?? "-"}</td>
-        <td>${row.target_consensus === null ? "-" : row.target_consensus.toFixed(2)}</td>
-        <td>${row.target_low === null ? "-" : row.target_low.toFixed(2)}</td>
-        <td>${row.target_high === null ? "-" : row.target_high.toFixed(2)}</td>
+        <td>${formatNumber(row.target_consensus, 2)}</td>
+        <td>${formatNumber(row.target_low, 2)}</td>
+        <td>${formatNumber(row.target_high, 2)}</td>
       </tr>
     `
     )
@@ -167,9 +291,7 @@ function renderCharts(charts) {
       (item, index) => `
       <div class="chart-card">
         <h3>${item.ticker}</h3>
-        <p class="chart-meta">RS score: ${
-          item.rs_score === null ? "-" : item.rs_score.toFixed(4)
-        }</p>
+        <p class="chart-meta">RS score: ${formatNumber(item.rs_score, 4)}</p>
         <canvas id="chart-${index}" height="180"></canvas>
       </div>
     `
@@ -216,7 +338,7 @@ function renderCharts(charts) {
       ],
     };
 
-    if (item.rs_line && item.rs_line.some((val) => val !== null)) {
+    if (item.rs_line && item.rs_line.some((val) => Number.isFinite(val))) {
       data.datasets.push({
         label: "RS Line",
         data: item.rs_line,
@@ -274,45 +396,268 @@ function renderCharts(charts) {
   });
 }
 
+function createTableWorker() {
+  if (!window.Worker) {
+    return null;
+  }
+  try {
+    const worker = new Worker("table_worker.js");
+    worker.onmessage = (event) => {
+      if (event.data.id === tableQueryId) {
+        showTableRows(event.data.rows);
+      }
+    };
+    // e.g. blocked on file://: answer queries on the main thread instead.
+    worker.onerror = () => {
+      worker.terminate();
+      tableWorker = null;
+      refreshFullTable();
+    };
+    return worker;
+  } catch (error) {
+    return null;
+  }
+}
+
+function tableColumns(rows) {
+  const columns = {
+    ticker: [],
+    rank: [],
+    composite_score: [],
+    momentum_12_1: [],
+    action: [],
+  };
+  rows.forEach((row) => {
+    columns.ticker.push(row.ticker);
+    columns.rank.push(row.rank);
+    columns.composite_score.push(
+      row.composite_score !== undefined ? row.composite_score : row.signal_12_1
+    );
+    columns.momentum_12_1.push(
+      row.momentum_12_1 !== undefined ? row.momentum_12_1 : row.signal_12_1
+    );
+    columns.action.push(row.action);
+  });
+  return columns;
+}
+
+function renderFullTableShell() {
+  const header = [
+    ["ticker", "Ticker"],
+    ["rank", "Rank"],
+    ["composite_score", "Composite"],
+    ["momentum_12_1", "Momentum"],
+  ]
+    .map(([field, label]) => `<th class="sortable" data-sort="${field}">${label}</th>`)
+    .join("");
+  fullTable.innerHTML = `
+    <div class="virtual-scroll" id="fullScroll">
+      <table class="table virtual-table">
+        <thead>
+          <tr>${header}<th>Action</th></tr>
+        </thead>
+        <tbody id="fullRows"></tbody>
+      </table>
+    </div>
+    <p class="table-count" id="fullCount"></p>
+  `;
+
+  const scroll = document.getElementById("fullScroll");
+  scroll.addEventListener("scroll", () => {
+    if (scrollFrame === null) {
+      scrollFrame = requestAnimationFrame(() => {
+        scrollFrame = null;
+        renderVisibleRows();
+      });
+    }
+  });
+  scroll.querySelector("thead").addEventListener("click", (event) => {
+    const th = event.target.closest("th[data-sort]");
+    if (!th) {
+      return;
+    }
+    const field = th.dataset.sort;
+    tableSort = {
+      field,
+      descending: tableSort.field === field ? !tableSort.descending : false,
+    };
+    refreshFullTable();
+  });
+}
+
+function loadTable(rows, index) {
+  if (!document.getElementById("fullRows")) {
+    renderFullTableShell();
+  }
+  tableData = { columns: tableColumns(rows), index };
+  localTable = null;
+  if (tableWorker) {
+    tableWorker.postMessage({ type: "load", columns: tableData.columns, index });
+  }
+  refreshFullTable();
+}
+
 function refreshFullTable() {
-  const query = searchInput.value.trim().toUpperCase();
-  const filter = actionFilter.value;
+  if (!tableData) {
+    return;
+  }
+  tableQueryId += 1;
+  const query = {
+    search: searchInput.value.trim().toUpperCase(),
+    action: actionFilter.value,
+    sort: tableSort.field,
+    descending: tableSort.descending,
+  };
+  if (tableWorker) {
+    tableWorker.postMessage({ type: "query", id: tableQueryId, query });
+    return;
+  }
+  localTable = localTable || prepareTable(tableData.columns, tableData.index);
+  showTableRows(queryTable(localTable, query));
+}
 
-  const filtered = records.filter((row) => {
-    const matchesTicker = row.ticker.includes(query);
-    const matchesAction = filter === "ALL" || row.action === filter;
-    return matchesTicker && matchesAction;
+function showTableRows(rows) {
+  const scroll = document.getElementById("fullScroll");
+  if (!scroll) {
+    return;
+  }
+  tableRows = rows;
+  scroll.scrollTop = 0;
+  scroll.querySelectorAll("th[data-sort]").forEach((th) => {
+    const sorted = th.dataset.sort === tableSort.field;
+    th.classList.toggle("sorted-asc", sorted && !tableSort.descending);
+    th.classList.toggle("sorted-desc", sorted && tableSort.descending);
   });
+  document.getElementById("fullCount").textContent =
+    `${rows.length} of ${tableData.columns.ticker.length} records`;
+  renderVisibleRows();
+}
+
+function spacerRow(height) {
+  if (height <= 0) {
+    return "";
+  }
+  return `<tr class="virtual-spacer"><td colspan="5" style="height: ${height}px"></td></tr>`;
+}
+
+function renderVisibleRows() {
+  const scroll = document.getElementById("fullScroll");
+  const body = document.getElementById("fullRows");
+  if (!scroll || !body) {
+    return;
+  }
+  if (!tableRows.length) {
+    body.innerHTML = `<tr><td colspan="5">No records</td></tr>`;
+    return;
+  }
+
+  const total = tableRows.length;
+  const first = Math.max(0, Math.floor(scroll.scrollTop / tableRowHeight) - TABLE_OVERSCAN);
+  const count = Math.ceil(scroll.clientHeight / tableRowHeight) + 2 * TABLE_OVERSCAN;
+  const last = Math.min(total, first + count);
+  const columns = tableData.columns;
+
+  let html = spacerRow(first * tableRowHeight);
+  for (let k = first; k < last; k += 1) {
+    const i = tableRows[k];
+    html += `
+      <tr>
+        <td>${columns.ticker[i]}</td>
+        <td>${columns.rank[i]}</td>
+        <td>${formatNumber(columns.composite_score[i], 4)}</td>
+        <td>${formatNumber(columns.momentum_12_1[i], 4)}</td>
+        <td>${badge(columns.action[i])}</td>
+      </tr>
+    `;
+  }
+  html += spacerRow((total - last) * tableRowHeight);
+  body.innerHTML = html;
+
+  // Spacer heights assume every row is as tall as the first one rendered.
+  const row = body.querySelector("tr:not(.virtual-spacer)");
+  if (row && row.offsetHeight && row.offsetHeight !== tableRowHeight) {
+    tableRowHeight = row.offsetHeight;
+    renderVisibleRows();
+  }
+}
 
-  fullTable.innerHTML = renderTable(filtered);
+function resetFullTable() {
+  tableData = null;
+  localTable = null;
+  tableRows = new Int32Array(0);
+  fullTable.innerHTML = "<p>Loading...</p>";
+}
+
+function renderView(viewId) {
+  const universe = activeUniverse;
+  if (!universe || renderedViews[viewId] === universe.id) {
+    return;
+  }
+  renderedViews[viewId] = universe.id;
+
+  const stillActive = () => activeUniverse === universe;
+  const onError = (target) => (error) => {
+    renderedViews[viewId] = null;
+    if (stillActive()) {
+      target.innerHTML = `<p>Error: ${error}</p>`;
+    }
+  };
+
+  if (viewId === "signals") {
+    Promise.all([loadRecords(universe), loadTableIndex(universe)])
+      .then(([data, index]) => {
+        if (!stillActive()) {
+          return;
+        }
+        records = data.records || [];
+        const buys = records.filter((row) => row.action === "BUY");
+        const sells = records.filter((row) => row.action === "SELL");
+        buyTable.innerHTML = renderTable(buys);
+        sellTable.innerHTML = renderTable(sells);
+        analystTable.innerHTML = renderAnalystTable(data.analyst_panel || []);
+        loadTable(records, index);
+      })
+      .catch(onError(fullTable));
+  } else if (viewId === "sepa") {
+    loadSepa(universe)
+      .then((data) => {
+        if (stillActive()) {
+          sepaTable.innerHTML = renderSepaTable(data.sepa_candidates || []);
+        }
+      })
+      .catch(onError(sepaTable));
+  } else if (viewId === "charts") {
+    loadCharts(universe)
+      .then((charts) => {
+        if (stillActive()) {
+          renderCharts(charts);
+        }
+      })
+      .catch(onError(sepaCharts));
+  }
 }
 
 function setActiveUniverse(universe) {
-  records = universe.records;
+  activeUniverse = universe;
+  renderedViews = {};
+  records = [];
+  resetFullTable();
 
-  const fundamentalsDate = universe.fundamentals_as_of
-    ? ` | Fundamentals ${universe.fundamentals_as_of}`
+  const fundamentalsDate = manifest.fundamentals_as_of
+    ? ` | Fundamentals ${manifest.fundamentals_as_of}`
     : "";
-  asOf.textContent = `As of ${universe.as_of_date} | ${universe.name}${fundamentalsDate}`;
+  asOf.textContent = `As of ${manifest.as_of_date} | ${universe.name}${fundamentalsDate}`;
 
   buyCount.textContent = universe.buy_count;
   sellCount.textContent = universe.sell_count;
   universeSize.textContent = universe.universe_size;
   sepaCount.textContent = universe.sepa_count ?? 0;
 
-  const buys = records.filter((row) => row.action === "BUY");
-  const sells = records.filter((row) => row.action === "SELL");
-
-  buyTable.innerHTML = renderTable(buys);
-  sellTable.innerHTML = renderTable(sells);
-  analystTable.innerHTML = renderAnalystTable(universe.analyst_panel || []);
-  sepaTable.innerHTML = renderSepaTable(universe.sepa_candidates || []);
-  renderCharts(universe.sepa_charts || []);
-  refreshFullTable();
-
   [...universeTabs.children].forEach((tab) => {
     tab.classList.toggle("active", tab.dataset.id === universe.id);
   });
+
+  renderView(activeView);
 }
 
 function setActiveView(viewId) {
@@ -330,6 +675,8 @@ function setActiveView(viewId) {
   [...viewTabs.children].forEach((tab) => {
     tab.classList.toggle("active", tab.dataset.id === viewId);
   });
+
+  renderView(viewId);
 }
 
 function renderTabs() {
@@ -365,6 +712,7 @@ function renderTabs() {
 }
 
 function applyData(data) {
+  manifest = data;
   universes = data.universes || [];
   signalName.textContent = data.signal;
 
@@ -373,30 +721,19 @@ function applyData(data) {
     return;
   }
 
-  universes = universes.map((universe) => ({
-    ...universe,
-    as_of_date: data.as_of_date,
-    fundamentals_as_of: data.fundamentals_as_of,
-  }));
-
   renderTabs();
-  setActiveUniverse(universes[0]);
   setActiveView(activeView);
+  setActiveUniverse(universes[0]);
 }
 
-if (window.TOP50_DATA) {
-  applyData(window.TOP50_DATA);
-} else {
-  fetch("data/top50_signals.json")
-    .then((response) => response.json())
-    .then((data) => {
-      applyData(data);
-    })
-    .catch((error) => {
-      asOf.textContent = "Failed to load data.";
-      fullTable.innerHTML = `<p>Error: ${error}</p>`;
-    });
-}
+loadManifest()
+  .then((data) => {
+    applyData(data);
+  })
+  .catch((error) => {
+    asOf.textContent = "Failed to load data.";
+    fullTable.innerHTML = `<p>Error: ${error}</p>`;
+  });
 
 searchInput.addEventListener("input", refreshFullTable);
 actionFilter.addEventListener("change", refreshFullTable);
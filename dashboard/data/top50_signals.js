@@ -1 +1 @@
-window.TOP50_DATA = {"as_of_date": "2026-01-15", "fundamentals_as_of": "2026-01-13", "analyst_as_of": "2026-01-15", "signal": "Composite (momentum + quality + value)", "universes": [{"id": "nasdaq100", "name": "Nasdaq-100", "universe_size": 101, "buy_count": 20, "sell_count": 20, "sepa_count": 16, "sepa_candidates": [{"ticker": "AMD", "momentum_12_1": 0.788095443190628, "quality_raw": 0.0951, "value_raw": 0.09452618151937896, "composite_score": 0.37913335614184335, "rs_score": 0.7742766958194931, "ma_50": 220.8818, "ma_150": 189.622, "ma_200": 168.0457, "sepa_pass": true, "rank": 1, "action": "BUY"}, {"ticker": "GOOGL", "momentum_12_1": 0.6251186333438787, "quality_raw": 0.3295, "value_raw": 0.06402903919249622, "composite_score": 0.1883405690028275, "rs_score": 0.5655858819028958, "ma_50": 308.3118, "ma_150": 246.83226666666664, "ma_200": 225.4986, "sepa_pass": true, "rank": 6, "action": "BUY"}, {"ticker": "GOOG", "momentum_12_1": 0.6190526040303583, "quality_raw": 0.3295, "value_raw": 0.06336250731105852, "composite_score": 0.17505309160458452, "rs_score": 0.5548090549397409, "ma_50": 309.0062, "ma_150": 247.56580000000002, "ma_200": 226.4766, "sepa_pass": true, "rank": 7, "action": "BUY"}, {"ticker": "AMAT", "momentum_12_1": 0.5045781744889144, "quality_raw": 0.3195, "value_raw": 0.056827489183746235, "composite_score": -0.003804501820427242, "rs_score": 0.6484615653929449, "ma_50": 258.2126, "ma_150": 213.57453333333333, "ma_200": 198.68505000000002, "sepa_pass": true, "rank": 10, "action": "BUY"}, {"ticker": "ASML", "momentum_12_1": 0.47743416316940324, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.619498894639799, "ma_50": 1093.2814, "ma_150": 926.3482666666666, "ma_200": 870.2119, "sepa_pass": true, "rank": 29, "action": "HOLD"}, {"ticker": "FER", "momentum_12_1": 0.6654320987654321, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.4736884123570031, "ma_50": 65.4328, "ma_150": 59.083933333333334, "ma_200": 56.4502, "sepa_pass": true, "rank": 52, "action": "HOLD"}, {"ticker": "IDXX", "momentum_12_1": 0.6734347753386043, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.5120449091367694, "ma_50": 707.2912, "ma_150": 638.7735333333334, "ma_200": 595.70185, "sepa_pass": true, "rank": 57, "action": "HOLD"}, {"ticker": "INTC", "momentum_12_1": 0.9536458333333333, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.3276390296409535, "ma_50": 38.8428, "ma_150": 31.081066666666665, "ma_200": 28.441550000000003, "sepa_pass": true, "rank": 59, "action": "HOLD"}, {"ticker": "KLAC", "momentum_12_1": 0.7470125203205658, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.0140924610834048, "ma_50": 1238.6016, "ma_150": 1062.0411333333334, "ma_200": 976.8653499999999, "sepa_pass": true, "rank": 63, "action": "HOLD"}, {"ticker": "LRCX", "momentum_12_1": 1.1889155342392752, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.7082545372348783, "ma_50": 169.94100000000003, "ma_150": 132.83653333333336, "ma_200": 118.59145000000001, "sepa_pass": true, "rank": 64, "action": "HOLD"}, {"ticker": "MNST", "momentum_12_1": 0.49401197604790403, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.3660621833335682, "ma_50": 74.2336, "ma_150": 67.366, "ma_200": 65.69109999999999, "sepa_pass": true, "rank": 69, "action": "HOLD"}, {"ticker": "MPWR", "momentum_12_1": 0.6095344658054453, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.5224632252127841, "ma_50": 943.696, "ma_150": 878.0216666666666, "ma_200": 813.5032500000001, "sepa_pass": true, "rank": 70, "action": "HOLD"}, {"ticker": "MU", "momentum_12_1": 1.4394001643385375, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 2.268552478011263, "ma_50": 263.18379999999996, "ma_150": 184.52453333333332, "ma_200": 160.00695, "sepa_pass": true, "rank": 73, "action": "HOLD"}, {"ticker": "STX", "momentum_12_1": 2.130329935328291, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 2.322098089160848, "ma_50": 281.60040000000004, "ma_150": 214.82273333333336, "ma_200": 185.14995, "sepa_pass": true, "rank": 89, "action": "SELL"}, {"ticker": "WBD", "momentum_12_1": 2.05344295991778, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.739029916931121, "ma_50": 26.231199999999998, "ma_150": 18.548933333333334, "ma_200": 16.15805, "sepa_pass": true, "rank": 97, "action": "SELL"}, {"ticker": "WDC", "momentum_12_1": 2.62877030162413, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 3.495638045319784, "ma_50": 173.8678, "ma_150": 118.0162, "ma_200": 99.66234999999999, "sepa_pass": true, "rank": 99, "action": "SELL"}], "sepa_charts": [{"ticker": "AMD", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [100.75, 101.67, 98.85, 100.31, 96.63, 96.76, 100.79, 98.11, 100.97, 104.59, 103.51, 106.23, 107.14, 106.44, 113.85, 114.81, 110.19, 106.65, 103.22, 102.74, 102.78, 102.96, 93.8, 85.76, 83.64, 78.21, 96.84, 88.7, 93.4, 94.5, 95.29, 88.29, 87.5, 85.56, 86.26, 90.39, 94.47, 96.65, 96.39, 96.06, 97.35, 96.65, 98.8, 100.59, 98.62, 100.36, 101.7, 102.84, 108.12, 112.46, 117.72, 114.99, 117.17, 114.74, 113.51, 112.06, 110.71, 110.31, 114.56, 112.86, 113.03, 110.73, 114.63, 117.31, 118.58, 115.69, 116.19, 121.73, 123.24, 121.14, 118.5, 116.16, 126.39, 127.1, 126.79, 128.24, 129.58, 138.43, 143.4, 143.68, 143.81, 141.9, 136.11, 138.52, 137.91, 134.8, 137.82, 138.41, 144.16, 146.42, 146.24, 155.61, 160.08, 160.41, 156.99, 157.0, 154.72, 158.65, 162.12, 166.47, 173.66, 177.44, 179.51, 176.31, 171.7, 176.78, 174.31, 163.12, 172.4, 172.76, 172.28, 174.95, 184.42, 180.95, 177.51, 176.14, 166.55, 165.2, 163.71, 167.76, 163.36, 166.62, 167.13, 168.58, 162.63, 162.32, 162.13, 161.79, 151.14, 151.41, 155.82, 159.54, 155.67, 158.57, 161.16, 160.46, 159.16, 157.92, 157.39, 159.79, 160.9, 160.88, 161.27, 159.46, 161.36, 161.79, 164.01, 169.73, 164.67, 203.71, 211.51, 235.56, 232.89, 214.9, 216.42, 218.09, 238.6, 234.56, 233.08, 240.56, 238.03, 230.23, 234.99, 252.92, 259.67, 258.01, 264.33, 254.84, 256.12, 259.65, 250.05, 256.33, 237.7, 233.54, 243.98, 237.52, 258.89, 247.96, 246.81, 240.52, 230.29, 223.55, 206.02, 203.78, 215.05, 206.13, 214.24, 217.53, 219.76, 215.24, 217.6, 215.98, 217.97, 221.11, 221.62, 221.42, 221.43, 210.78, 207.58, 209.17, 198.11, 201.06, 213.43, 214.95, 214.9, 215.04, 214.99, 215.61, 215.34, 214.16, 223.47, 221.08, 214.35, 210.02, 204.68, 203.17, 207.69, 220.97, 223.6, 227.92], "ma50": [116.04, 115.6452, 115.2446, 114.8666, 114.3072, 113.7166, 113.2312, 112.68959999999998, 112.2602, 111.93620000000001, 111.59380000000002, 111.211, 110.76280000000001, 110.345, 110.18520000000001, 110.16059999999999, 110.01800000000001, 109.8292, 109.4944, 109.18039999999999, 108.80679999999998, 108.42039999999999, 107.8214, 107.0758, 106.29180000000001, 105.55580000000002, 105.2092, 104.6362, 104.12700000000001, 103.698, 103.3184, 102.6942, 102.204, 101.712, 101.28599999999999, 100.8842, 100.5516, 100.2502, 99.9418, 99.60099999999998, 99.2624, 98.9016, 98.5942, 98.3892, 98.19940000000001, 98.1274, 98.0666, 98.13320000000002, 98.2984, 98.58300000000001, 98.9224, 99.18880000000001, 99.55519999999999, 99.84380000000002, 100.1814, 100.4874, 100.6858, 100.92980000000001, 101.2016, 101.36699999999999, 101.5574, 101.6474, 101.79719999999999, 102.01460000000002, 102.1092, 102.1268, 102.24680000000001, 102.5484, 102.94879999999999, 103.3168, 103.6312, 103.8952, 104.54700000000001, 105.37379999999999, 106.23679999999999, 107.2374, 107.89220000000002, 108.88679999999998, 109.88680000000001, 110.8704, 111.8408, 112.91300000000001, 113.8852, 114.94439999999999, 115.97740000000002, 116.8656, 117.7326, 118.5678, 119.5232, 120.53040000000001, 121.5082, 122.68740000000001, 123.91300000000001, 125.10940000000001, 126.27680000000001, 127.40960000000001, 128.47, 129.5862, 130.6662, 131.7464, 132.86520000000002, 134.1142, 135.361, 136.5924, 137.7562, 139.0506, 140.3226, 141.37879999999998, 142.53560000000002, 143.7336, 144.9186, 146.203, 147.5988, 148.8716, 150.05020000000002, 151.2592, 152.2664, 153.1358, 153.9452, 154.8776, 155.7748, 156.784, 157.59879999999998, 158.4284, 159.14520000000002, 159.8268, 160.4778, 160.945, 161.0998, 161.25439999999998, 161.49460000000002, 161.8474, 162.23860000000002, 162.6396, 163.1046, 163.61780000000002, 164.0446, 164.4348, 164.6994, 164.9668, 165.26, 165.36539999999997, 165.3892, 165.3702, 165.45759999999999, 165.5534, 165.73919999999998, 165.9608, 166.0118, 166.7566, 167.5136, 168.676, 169.74359999999996, 170.5154, 171.4098, 172.23600000000002, 173.5218, 174.9506, 176.16420000000002, 177.52020000000002, 178.83520000000001, 179.94080000000002, 180.9522, 182.3916, 184.0348, 185.6722, 187.62780000000004, 189.4206, 191.26879999999997, 193.1066, 194.84040000000002, 196.63459999999998, 198.046, 199.3452, 200.9722, 202.47619999999998, 204.4114, 206.13479999999998, 208.0482, 209.8304, 211.3198, 212.6, 213.607, 214.5112, 215.58900000000003, 216.50240000000002, 217.60399999999998, 218.7962, 220.0436, 221.1526, 222.2866, 223.3886, 224.52259999999998, 225.75560000000002, 226.96079999999998, 228.1534, 229.30180000000001, 230.12279999999998, 230.98100000000002, 231.0902, 230.8222, 230.1322, 229.74300000000002, 229.74399999999997, 229.71359999999996, 229.65259999999998, 229.18040000000002, 228.8014, 228.4466, 227.9186, 227.62739999999997, 227.44439999999997, 227.0316, 226.1736, 225.0738, 223.977, 222.84419999999997, 222.1668, 221.5164, 220.8818], "ma150": [136.75300000000001, 136.49913333333336, 136.2352, 135.94073333333333, 135.70133333333334, 135.46306666666666, 135.2362, 135.0224, 134.83773333333332, 134.6262, 134.42113333333336, 134.21753333333334, 133.99093333333332, 133.76219999999998, 133.5388, 133.3138, 133.01319999999998, 132.68153333333333, 132.3176, 131.9912, 131.6432, 131.32966666666667, 130.95166666666665, 130.5476666666667, 130.13533333333334, 129.66633333333334, 129.399, 129.0512, 128.74426666666668, 128.47859999999997, 128.19286666666667, 127.8292, 127.41346666666666, 126.97873333333334, 126.5384, 126.12713333333333, 125.75146666666667, 125.40720000000002, 125.00486666666666, 124.6056, 124.20960000000001, 123.79846666666667, 123.37700000000002, 122.93099999999998, 122.49280000000002, 122.068, 121.68099999999998, 121.3014, 120.93653333333333, 120.54693333333334, 120.19193333333334, 119.80653333333333, 119.44753333333334, 119.11793333333333, 118.75540000000001, 118.40066666666665, 118.09446666666666, 117.78899999999999, 117.51106666666666, 117.22366666666669, 116.92453333333333, 116.63546666666666, 116.38026666666667, 116.1394, 115.88840000000002, 115.59353333333333, 115.25980000000001, 115.08066666666669, 114.9418, 114.80366666666666, 114.65559999999998, 114.4856, 114.36086666666667, 114.2094, 114.06833333333333, 113.94093333333333, 113.84726666666667, 113.84146666666668, 113.87186666666666, 113.93039999999998, 113.96293333333332, 113.97966666666667, 113.96973333333332, 113.97659999999999, 113.97366666666666, 113.93146666666668, 113.93213333333333, 113.9466, 113.99313333333335, 114.02219999999998, 114.0506, 114.12806666666668, 114.25286666666666, 114.39833333333333, 114.57246666666668, 114.76753333333335, 114.93133333333331, 115.11833333333334, 115.35306666666666, 115.61826666666667, 115.94253333333334, 116.31606666666667, 116.72026666666667, 117.10093333333333, 117.41493333333332, 117.75153333333336, 118.07986666666666, 118.33273333333335, 118.66579999999999, 119.01226666666666, 119.35660000000001, 119.68713333333334, 120.05293333333333, 120.41040000000001, 120.78153333333333, 121.18220000000001, 121.5104, 121.83780000000002, 122.12946666666667, 122.45826666666666, 122.7376, 123.0332, 123.3224, 123.626, 123.89126666666665, 124.20666666666666, 124.5264, 124.82266666666668, 125.03786666666667, 125.27426666666666, 125.55126666666666, 125.81819999999999, 126.10926666666666, 126.432, 126.78933333333332, 127.12253333333334, 127.44293333333334, 127.75093333333334, 128.05479999999997, 128.36606666666665, 128.67686666666668, 128.98479999999998, 129.2988, 129.62293333333335, 129.9779333333333, 130.36346666666668, 130.7586, 131.22673333333336, 131.65879999999999, 132.362, 133.1004, 133.993, 134.88660000000002, 135.65053333333333, 136.44913333333332, 137.258, 138.17673333333332, 139.0864, 139.96713333333332, 140.8736, 141.7704, 142.59706666666665, 143.4494, 144.42593333333332, 145.39806666666667, 146.35273333333333, 147.38033333333334, 148.36826666666667, 149.3876, 150.43366666666665, 151.41546666666667, 152.43793333333332, 153.39726666666667, 154.38246666666666, 155.4514, 156.51346666666666, 157.5938, 158.65553333333332, 159.67826666666667, 160.65173333333334, 161.55173333333335, 162.45346666666666, 163.24360000000001, 164.03173333333334, 164.89033333333333, 165.66193333333334, 166.46040000000002, 167.26626666666667, 168.08873333333332, 168.88326666666669, 169.68493333333333, 170.48046666666667, 171.2749333333333, 172.07840000000002, 172.89839999999998, 173.70546666666667, 174.50366666666667, 175.2232666666667, 175.8863333333333, 176.53106666666667, 177.067, 177.64079999999998, 178.2825333333333, 178.9506, 179.62653333333333, 180.31306666666666, 181.00826666666669, 181.71026666666668, 182.38213333333334, 183.05746666666667, 183.79373333333334, 184.5294, 185.1942, 185.81226666666666, 186.38626666666667, 186.96946666666668, 187.57946666666666, 188.24106666666665, 188.91013333333333, 189.622], "ma200": [143.35335, 143.06334999999999, 142.74450000000002, 142.4237, 142.0752, 141.7357, 141.41205, 141.10045, 140.7735, 140.4384, 140.13025, 139.82765, 139.52884999999998, 139.2433, 139.0126, 138.7558, 138.47285, 138.16675, 137.88115, 137.60004999999998, 137.31275, 137.02805, 136.6989, 136.3357, 135.98075, 135.5629, 135.24095, 134.8832, 134.54895, 134.23375, 133.91285, 133.54325, 133.19230000000002, 132.79855, 132.41035000000002, 132.0028, 131.5817, 131.17945, 130.7416, 130.31220000000002, 129.8909, 129.475, 129.08125, 128.78705, 128.5013, 128.2452, 127.97435, 127.71855, 127.536, 127.4067, 127.29535, 127.17155000000001, 127.0652, 126.91650000000001, 126.82135, 126.71915000000001, 126.5986, 126.49925000000002, 126.42869999999999, 126.31139999999999, 126.20519999999999, 126.075, 125.9425, 125.82530000000001, 125.6814, 125.51705, 125.3216, 125.14824999999999, 124.97540000000001, 124.82260000000001, 124.64020000000001, 124.47104999999999, 124.3505, 124.2542, 124.16069999999999, 124.0591, 124.0223, 124.01010000000001, 124.0299, 124.07655000000001, 124.10485, 124.10015, 124.03139999999999, 123.97015000000002, 123.89815, 123.81174999999999, 123.74674999999999, 123.69734999999999, 123.63445, 123.5868, 123.53424999999999, 123.52069999999999, 123.51100000000001, 123.47560000000001, 123.43879999999999, 123.4034, 123.37825000000001, 123.3726, 123.36895, 123.3468, 123.36025000000001, 123.38345, 123.4259, 123.48655000000001, 123.50560000000002, 123.56315000000001, 123.6515, 123.68645000000001, 123.76720000000002, 123.85115, 123.92304999999999, 124.02735000000001, 124.1849, 124.32244999999999, 124.42885, 124.50995, 124.51145000000001, 124.59445, 124.69265, 124.82215000000001, 124.93540000000002, 125.06020000000001, 125.17035000000001, 125.26414999999999, 125.33755000000001, 125.41239999999999, 125.50490000000002, 125.61734999999999, 125.67885, 125.76140000000001, 125.84585000000001, 125.9466, 126.03694999999999, 126.14235000000001, 126.2564, 126.35305, 126.46025, 126.56864999999999, 126.66969999999999, 126.75835000000001, 126.85295, 126.9374, 127.03694999999999, 127.14129999999999, 127.29375, 127.464, 127.6333, 127.82894999999999, 128.01775, 128.40285, 128.8353, 129.40605, 129.97609999999997, 130.45455, 130.91365, 131.37265, 131.94035, 132.4872, 133.0404, 133.63925, 134.22625, 134.75055, 135.27775, 135.9057, 136.59484999999998, 137.3047, 138.03975, 138.7335, 139.4143, 140.12035, 140.7633, 141.43355, 142.0033, 142.5558, 143.16150000000002, 143.77405, 144.49765000000002, 145.1507, 145.79045, 146.4133, 146.9934, 147.51364999999998, 147.9837, 148.4518, 148.98925, 149.4675, 149.9832, 150.51225, 151.05200000000002, 151.56269999999998, 152.0793, 152.58575000000002, 153.10475, 153.65609999999998, 154.22365, 154.81095, 155.39440000000002, 155.95075, 156.48935, 157.04405, 157.53085, 158.0278, 158.6007, 159.1739, 159.76525, 160.35665, 160.92765, 161.51515, 162.087, 162.63485, 163.23465, 163.80890000000002, 164.34495000000004, 164.86285, 165.317, 165.7588, 166.24630000000002, 166.8179, 167.4198, 168.0457], "rs_line": [1.0, 0.9984008591959306, 0.9882510356381893, 0.9972577973850104, 0.9869604531357853, 0.9965725757352311, 1.0325997571934968, 1.0187230496170816, 1.0272021546614531, 1.0558873755832403, 1.0564022938368285, 1.0724818004230872, 1.0848060122390177, 1.080603907165636, 1.135496993701088, 1.1423256966764488, 1.1096048249954602, 1.0768169916988881, 1.063604315936991, 1.051599167952223, 1.049045554777481, 1.0442742564050989, 1.0006832120379063, 0.9718025511639274, 0.9494706352500976, 0.9019571350546057, 1.0106680013637648, 0.9681379890631162, 1.001566499744258, 1.0036256124768348, 1.01485818656167, 0.9616830397971159, 0.9517202128015115, 0.953310620258546, 0.9367382111640178, 0.9666097411248219, 0.9894142392790501, 1.00498475223417, 1.0018991249931586, 0.9922186931825709, 1.0051443796083062, 0.9908944150450756, 0.9981208408178691, 1.0220650827653137, 1.0104945407653054, 1.0240167398171383, 1.030508927706485, 1.0433898435652582, 1.0618674355956632, 1.0972453311363735, 1.1470998637366232, 1.1150515932861025, 1.1290395443797905, 1.1044161542904136, 1.0962627824419662, 1.1008084052718907, 1.087117853812709, 1.090634398218572, 1.1095852677279368, 1.0994805661636546, 1.0968071772527164, 1.075691923057767, 1.1073410724420818, 1.1268044914862265, 1.13930910415936, 1.1169400962304679, 1.1103651114156925, 1.1622603651641505, 1.1700438394734982, 1.1533958989895856, 1.1237936593560716, 1.114057593176802, 1.2007464326833939, 1.217898811646406, 1.215111346874871, 1.235542718164617, 1.2362421189574404, 1.3062440706206795, 1.3523838702157067, 1.344505335127505, 1.3390688310294798, 1.3149968583523548, 1.2617489704734126, 1.2782949252193687, 1.2627137800808073, 1.2435049303965189, 1.272060686163379, 1.2698911387043732, 1.3189268400454137, 1.3443295294272781, 1.3401196568223244, 1.4321046294942432, 1.4683337020979352, 1.4624112007532828, 1.4322811141810081, 1.4296614631954443, 1.4086978643224508, 1.4322946235489704, 1.4631373616260195, 1.4960763073059415, 1.5610853350397966, 1.5992832523819989, 1.6199804401765938, 1.597093225313377, 1.5812510526708181, 1.6036594656164764, 1.5893105892313375, 1.4759778478002108, 1.561254827622409, 1.5524099963728204, 1.551164117901748, 1.5586111368829065, 1.6373734570771623, 1.6064155934145352, 1.5795745911630692, 1.567724738177334, 1.4904553976806778, 1.4823128148327918, 1.4748602006077856, 1.4884881896261375, 1.4558554023493617, 1.4787170066647828, 1.4798712546273025, 1.4874427554299423, 1.443552732846416, 1.451557524913594, 1.442043156458293, 1.4270922756428095, 1.3370247278652794, 1.3361309008630116, 1.3718757588960655, 1.4005786609170734, 1.3553413220924269, 1.3810521905592148, 1.3961764441410638, 1.3920288081810663, 1.3824686103352561, 1.3653185201826754, 1.3577840058234327, 1.3719975148893049, 1.3890898851487894, 1.3933501581881163, 1.4032015743937039, 1.3795493575764792, 1.3920746522584955, 1.3905463057510892, 1.4048397004514164, 1.4521620080946054, 1.4088911279894003, 1.7366830500227906, 1.8098903518921337, 2.003737720096557, 1.9867816780901686, 1.884236028627595, 1.8688869614474453, 1.8856117346799026, 2.0538236778291834, 2.032892708897365, 2.008663986521415, 2.051786361709198, 2.0302377079470006, 1.9739714614188137, 2.002906204537778, 2.1382551674548673, 2.16972374751097, 2.150142504557304, 2.201753102332601, 2.1463109522819326, 2.150038730283511, 2.1755890004873883, 2.120284158133353, 2.1660288149982305, 2.0303871402339566, 1.9928909913801693, 2.0499910975269415, 1.9911540052824899, 2.1690940440767816, 2.112573731653395, 2.1031201827822446, 2.0687955868713552, 1.9975785986389196, 1.931652278616502, 1.8077329352036486, 1.7704421638705117, 1.8412553049057583, 1.7484367789709088, 1.8047682400826197, 1.8225351421865386, 1.8496633795346402, 1.8082704136099559, 1.8217887187247004, 1.806904720390551, 1.8200959327814077, 1.8518791523384748, 1.8577539093946955, 1.8438487699569572, 1.8396511097914705, 1.7702037406613038, 1.7459668268107595, 1.7641607281930074, 1.689469795715926, 1.7017764434046967, 1.7955407731366635, 1.7971322726703034, 1.7885397572742487, 1.7834314485847582, 1.7831975787624887, 1.7947358120052936, 1.7946799911855968, 1.798168149949988, 1.8729052750767652, 1.84061591226968, 1.7740343443313353, 1.7438188498526488, 1.6996527839581697, 1.6760295764677307, 1.7106303877487121, 1.823657051837926, 1.8544774208500847, 1.8851725889183717], "rs_score": 0.7742766958194931}, {"ticker": "GOOGL", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [170.92, 173.02, 172.35, 173.86, 165.87, 164.04, 167.11, 162.76, 165.49, 164.29, 160.67, 163.89, 162.8, 163.99, 167.68, 170.56, 165.06, 162.24, 154.33, 154.64, 157.07, 157.04, 150.72, 145.6, 146.75, 144.7, 158.71, 152.82, 157.14, 159.07, 156.31, 153.33, 151.16, 147.67, 151.47, 155.35, 159.28, 161.96, 160.61, 160.16, 158.8, 161.3, 164.03, 164.21, 163.23, 151.38, 154.28, 152.75, 158.46, 159.53, 165.37, 163.96, 166.19, 166.54, 163.98, 168.56, 170.87, 168.47, 172.9, 172.36, 171.86, 171.74, 169.03, 166.18, 168.05, 168.21, 173.68, 176.09, 178.6, 177.35, 175.7, 174.67, 176.77, 175.95, 173.32, 166.64, 165.19, 166.77, 170.68, 173.54, 178.53, 176.23, 175.84, 178.64, 179.53, 176.79, 174.36, 176.62, 177.62, 180.19, 181.56, 182.0, 182.97, 183.58, 185.06, 190.1, 191.34, 190.23, 192.17, 193.18, 192.58, 195.75, 196.53, 191.9, 189.13, 195.04, 194.67, 196.09, 196.52, 201.42, 201.0, 203.34, 201.96, 202.94, 203.9, 203.5, 201.57, 199.32, 199.75, 206.09, 208.49, 207.14, 207.48, 211.64, 212.91, 211.35, 230.66, 232.3, 235.0, 234.04, 239.63, 239.17, 240.37, 240.8, 251.61, 251.16, 249.53, 252.03, 254.72, 252.53, 251.66, 247.14, 245.79, 246.54, 244.05, 243.1, 244.9, 245.69, 245.35, 250.43, 245.76, 244.62, 241.53, 236.57, 244.15, 245.45, 251.03, 251.46, 253.3, 256.55, 250.46, 251.69, 253.08, 259.92, 269.27, 267.47, 274.57, 281.48, 281.19, 283.72, 277.54, 284.31, 284.75, 278.83, 290.1, 291.31, 286.71, 278.57, 276.41, 285.02, 284.28, 292.81, 289.45, 299.66, 318.58, 323.44, 319.95, 320.18, 314.89, 315.81, 319.63, 317.62, 321.27, 313.72, 317.08, 320.21, 312.43, 309.29, 308.22, 306.57, 296.72, 302.46, 307.16, 309.78, 314.35, 314.09, 313.51, 313.56, 313.85, 313.0, 315.15, 316.54, 314.34, 321.98, 325.44, 328.57, 331.86, 335.97, 335.84, 332.78], "ma50": [189.49400000000003, 189.1864, 188.8632, 188.5122, 187.937, 187.2956, 186.72580000000002, 186.12580000000003, 185.6108, 185.11059999999998, 184.5354, 183.9774, 183.296, 182.666, 182.1406, 181.71099999999998, 181.19199999999998, 180.6436, 179.81920000000002, 179.05380000000002, 178.2752, 177.455, 176.502, 175.45440000000002, 174.3852, 173.44299999999998, 172.7112, 171.8594, 170.9848, 170.08579999999998, 169.18740000000003, 168.1264, 167.32299999999998, 166.44439999999997, 165.767, 165.1446, 164.62380000000002, 164.19080000000002, 163.6802, 163.17880000000002, 162.67940000000002, 162.2, 161.7894, 161.4804, 161.16, 160.6792, 160.3102, 159.9952, 159.75879999999998, 159.6092, 159.49820000000003, 159.317, 159.19379999999998, 159.0474, 159.00959999999998, 159.1, 159.17520000000002, 159.2894, 159.4376, 159.59900000000002, 159.8228, 159.97979999999998, 160.1044, 160.1482, 160.1556, 160.1086, 160.281, 160.55800000000002, 161.0434, 161.4976, 161.8702, 162.2228, 162.7438, 163.35080000000002, 163.8822, 164.321, 164.45059999999998, 164.7296, 165.0004, 165.28979999999999, 165.73420000000002, 166.19219999999999, 166.68579999999997, 167.3052, 167.8664, 168.2952, 168.5968, 168.89, 169.2302, 169.6308, 170.086, 170.5, 170.8788, 171.2662, 171.7028, 172.4772, 173.2184, 173.968, 174.64219999999997, 175.3152, 175.8594, 176.4952, 177.102, 177.6092, 178.11219999999997, 178.6418, 179.1178, 179.6702, 180.14260000000002, 180.7238, 181.3066, 181.93859999999998, 182.59720000000002, 183.3324, 184.0494, 184.7552, 185.313, 185.77759999999998, 186.20059999999998, 186.77540000000002, 187.4312, 188.0806, 188.6948, 189.4086, 190.2004, 191.09459999999999, 192.40400000000002, 193.7146, 195.00099999999998, 196.21099999999998, 197.433, 198.6918, 199.9824, 201.2256, 202.6672, 204.1546, 205.658, 207.1662, 208.7082, 210.155, 211.55699999999996, 212.8598, 214.1162, 215.3754, 216.5552, 217.61520000000002, 218.6864, 219.7956, 220.85920000000002, 222.00420000000003, 223.06779999999998, 224.0452, 224.9452, 225.8386, 226.93900000000002, 227.9472, 229.0744, 230.1818, 231.3174, 232.42, 233.40919999999997, 234.37620000000004, 235.39860000000002, 236.5382, 237.84560000000002, 239.125, 240.585, 242.2282, 243.857, 245.40959999999998, 246.7906, 248.33399999999997, 249.87939999999998, 251.2232, 252.767, 254.3662, 255.4872, 256.4126, 257.24080000000004, 258.2604, 259.1534, 260.2262, 261.20779999999996, 262.385, 263.7244, 265.17, 266.5784, 267.94140000000004, 269.1448, 270.4104, 271.76980000000003, 273.1794, 274.689, 276.0326, 277.4932, 279.0354, 280.386, 281.658, 282.91540000000003, 284.0382, 285.05740000000003, 286.2142, 287.5268, 288.991, 290.395, 291.76779999999997, 293.0174, 294.25939999999997, 295.4704, 296.5994, 297.8932, 299.1902, 300.41540000000003, 301.6566, 302.78, 304.002, 305.14779999999996, 306.23760000000004, 307.3306, 308.3118], "ma150": [174.79013333333333, 174.8134, 174.82713333333334, 174.8426, 174.81, 174.79253333333335, 174.84493333333333, 174.87473333333332, 174.91840000000002, 174.93346666666667, 174.91346666666666, 174.92413333333332, 174.91506666666666, 174.9392, 174.98173333333335, 175.0324, 175.02166666666668, 174.98873333333333, 174.91193333333334, 174.85086666666666, 174.79386666666664, 174.73306666666667, 174.64, 174.525, 174.4248, 174.30026666666666, 174.30926666666667, 174.28506666666667, 174.2844, 174.33873333333332, 174.3894, 174.42053333333334, 174.42053333333334, 174.37373333333332, 174.3338, 174.31573333333333, 174.31546666666668, 174.3298, 174.3196, 174.29673333333335, 174.2764, 174.2698, 174.28673333333333, 174.2966, 174.2918, 174.19533333333334, 174.1106, 174.0232, 173.97386666666665, 173.92366666666666, 173.9396, 173.9368, 173.96566666666666, 173.99540000000002, 174.00033333333332, 174.02433333333335, 174.06040000000002, 174.08246666666668, 174.14893333333333, 174.20853333333332, 174.26046666666667, 174.30446666666668, 174.34613333333334, 174.3692, 174.38773333333333, 174.39766666666665, 174.42433333333332, 174.43519999999998, 174.48513333333332, 174.52553333333336, 174.5686, 174.60146666666665, 174.6032, 174.5712, 174.53766666666667, 174.44626666666665, 174.3367333333333, 174.25599999999997, 174.22333333333333, 174.23033333333333, 174.25186666666667, 174.23926666666665, 174.23833333333334, 174.31173333333334, 174.4102, 174.47113333333334, 174.5060666666667, 174.55533333333332, 174.61313333333334, 174.67113333333333, 174.73926666666665, 174.79013333333333, 174.859, 174.91813333333332, 174.98273333333333, 175.0156, 174.98853333333332, 174.977, 174.99266666666668, 174.96946666666668, 174.9505333333333, 174.99953333333335, 175.053, 175.05626666666666, 175.0196, 175.01246666666668, 175.00626666666665, 175.02846666666667, 175.06366666666665, 175.1444666666667, 175.22160000000002, 175.2986, 175.33253333333334, 175.38219999999998, 175.44853333333336, 175.52493333333334, 175.59533333333331, 175.65973333333332, 175.68773333333334, 175.7756, 175.85886666666664, 175.9194666666667, 175.98020000000002, 176.07126666666667, 176.15593333333334, 176.2862, 176.52193333333332, 176.76786666666663, 176.9954, 177.19553333333332, 177.45153333333334, 177.67013333333333, 177.99706666666668, 178.3250666666667, 178.7668666666667, 179.19813333333335, 179.6262, 180.0823333333333, 180.53953333333334, 180.9882, 181.4408, 181.85326666666668, 182.26146666666665, 182.7073333333333, 183.13933333333333, 183.59053333333335, 184.07166666666666, 184.5862666666667, 185.0867333333333, 185.64286666666666, 186.1418, 186.61913333333334, 187.08033333333333, 187.49839999999998, 188.02026666666669, 188.56300000000002, 189.12246666666667, 189.7138, 190.29919999999998, 190.9142666666667, 191.51286666666667, 192.0982, 192.7000666666667, 193.3396, 194.01686666666666, 194.66293333333334, 195.393, 196.18793333333332, 197.03366666666668, 197.8942, 198.69733333333335, 199.54579999999999, 200.4393333333333, 201.32753333333335, 202.2832, 203.2606, 204.11393333333334, 204.95226666666667, 205.7474, 206.5870666666667, 207.4402, 208.37006666666665, 209.292, 210.30526666666668, 211.41933333333333, 212.53993333333335, 213.61106666666666, 214.6658666666667, 215.6944, 216.73206666666664, 217.80426666666665, 218.8464, 219.8946666666667, 220.8914, 221.91706666666664, 223.0426, 224.09693333333334, 225.14053333333334, 226.1389333333333, 227.11919999999998, 227.9948666666667, 228.9182, 229.85800000000003, 230.81293333333335, 231.81539999999998, 232.7856, 233.7365333333333, 234.7038, 235.64346666666668, 236.5810666666667, 237.53633333333332, 238.50166666666667, 239.47040000000004, 240.50906666666668, 241.55833333333334, 242.6274, 243.68193333333335, 244.74779999999998, 245.79606666666663, 246.83226666666664], "ma200": [175.78710000000004, 175.78965, 175.7805, 175.7695, 175.71425, 175.64520000000002, 175.59885000000003, 175.54489999999998, 175.49740000000003, 175.43684999999996, 175.3607, 175.31959999999998, 175.27109999999996, 175.2252, 175.19465, 175.1704, 175.11204999999998, 175.05095, 174.94754999999998, 174.83765, 174.73405, 174.64344999999997, 174.5131, 174.3549, 174.2132, 174.0552, 173.9506, 173.8186, 173.68415000000002, 173.56009999999998, 173.41459999999998, 173.2705, 173.11135000000002, 172.92350000000002, 172.75175000000002, 172.5755, 172.42675, 172.29165, 172.1388, 172.01175000000003, 171.8804, 171.75424999999998, 171.6548, 171.57075, 171.49845000000002, 171.36705, 171.2301, 171.08489999999998, 171.01405, 170.97529999999998, 170.96715, 170.9393, 170.9188, 170.8938, 170.85989999999998, 170.8694, 170.9275, 170.9784, 171.0482, 171.09985, 171.1408, 171.18805, 171.21239999999997, 171.24145000000001, 171.2752, 171.30145000000002, 171.3365, 171.38105, 171.44480000000004, 171.51255, 171.56294999999997, 171.6055, 171.66595, 171.73145, 171.78915, 171.80544999999998, 171.84459999999999, 171.8962, 171.9634, 172.07649999999998, 172.2256, 172.36345, 172.48684999999998, 172.6066, 172.71695, 172.81060000000002, 172.88580000000002, 172.96985, 173.04725000000002, 173.13025, 173.2288, 173.32735, 173.43475, 173.539, 173.64455, 173.7658, 173.88754999999998, 174.0094, 174.14094999999998, 174.27155, 174.41955000000002, 174.5764, 174.74974999999998, 174.89885, 175.02829999999997, 175.1787, 175.32475, 175.47940000000003, 175.64735000000002, 175.83735000000001, 176.02200000000002, 176.213, 176.4089, 176.61, 176.80315000000002, 176.98705, 177.1465, 177.2708, 177.41400000000002, 177.588, 177.78425, 177.97125, 178.1261, 178.28055, 178.45335000000003, 178.60835, 178.85354999999998, 179.12064999999998, 179.41775, 179.72549999999998, 180.04715, 180.3524, 180.67435, 181.0402, 181.47445, 181.892, 182.29405, 182.70804999999996, 183.1369, 183.5421, 183.94369999999998, 184.30755000000002, 184.6733, 185.03244999999998, 185.37584999999999, 185.66550000000004, 185.91299999999998, 186.18165000000002, 186.4593, 186.72815, 186.97985, 187.26095, 187.52605, 187.75185000000002, 187.99945, 188.24615000000003, 188.52329999999998, 188.8168, 189.12709999999998, 189.46335000000002, 189.76850000000002, 190.06799999999998, 190.34904999999998, 190.6712, 191.04780000000002, 191.42495000000002, 191.84275000000002, 192.30184999999997, 192.73005, 193.1841, 193.5918, 194.0231, 194.455, 194.85925000000003, 195.3087, 195.8062, 196.26324999999997, 196.67905, 197.05675, 197.46175, 197.87699999999998, 198.30915000000002, 198.79975, 199.34005000000002, 200.00625, 200.6911, 201.36425000000003, 202.04710000000003, 202.69085000000004, 203.34375, 204.02305, 204.6848, 205.36835, 206.03865, 206.7278, 207.45175, 208.15025000000003, 208.85420000000002, 209.5439, 210.2417, 210.8707, 211.5179, 212.19195, 212.87154999999998, 213.61395000000002, 214.36419999999998, 215.09619999999998, 215.8502, 216.59199999999998, 217.33555, 218.10795, 218.8712, 219.62890000000004, 220.41885, 221.20765, 221.9977, 222.8317, 223.70035, 224.6079, 225.4986], "rs_line": [1.0, 1.0015222471653846, 1.0156733631898103, 1.018861275880589, 0.9986373082701272, 0.995898328421807, 1.009181273899741, 0.9961912177502313, 0.9924016829014344, 0.9776665010131604, 0.9665715128731917, 0.975320551457749, 0.97164364084594, 0.9813664443306116, 0.9857944976637679, 1.0003214636443147, 0.9797610379619266, 0.9655864182832008, 0.9373866477436436, 0.933006531675223, 0.944998564699879, 0.9388765570078784, 0.9478002777720728, 0.9725385119193274, 0.9819690371229379, 0.9836584212344727, 0.9763604914428061, 0.9832093684710064, 0.9932803252939144, 0.9958189333480393, 0.981289080573404, 0.9844637892017295, 0.9691484241404805, 0.9698578848315622, 0.9695887738650744, 0.9792514185569345, 0.9833263083096816, 0.9926989283180861, 0.9840491030169937, 0.9751491651624649, 0.966485096563211, 0.9747922333908585, 0.9767909669767034, 0.9835026063589606, 0.9858733447404348, 0.9104730079079566, 0.9214942010097341, 0.9135197194329285, 0.91735215956018, 0.9174875891268196, 0.9498605960675675, 0.937184223141237, 0.9439517193388968, 0.9449060634947982, 0.9335199409311694, 0.976040440177493, 0.9890261341085038, 0.9818362285732294, 0.987131113798249, 0.9897742877256068, 0.9830226718044995, 0.9834363053119847, 0.9624963214910764, 0.9409021478948448, 0.9517454500404297, 0.9572779204504603, 0.978360785024414, 0.9910433918762447, 0.9995029260902544, 0.9953462786013301, 0.9821824262219464, 0.9874645891129726, 0.9899182337769526, 0.99381854826513, 0.9791109905735883, 0.9463802833600758, 0.9289695615724746, 0.9276074171827923, 0.9488239441612393, 0.957233687946858, 0.9798896954331027, 0.9626631145679851, 0.9608437528162931, 0.9717386184811809, 0.9689432978415278, 0.9613189110616788, 0.948625109829891, 0.9551928768783067, 0.9578995493882071, 0.9751876482144562, 0.9807306401253636, 0.9873265247826007, 0.9892811869278388, 0.9865420520169118, 0.9952243756075879, 1.0203938818347051, 1.0269028040509622, 1.0123331623344891, 1.0223186085493097, 1.0233686253050376, 1.0204464056736402, 1.0399867398596023, 1.0454473082320452, 1.0246616152028558, 1.0266989685153434, 1.042929330597557, 1.0462553064150881, 1.0458761122497309, 1.0490482386530153, 1.0668859540950488, 1.0667707886901394, 1.067821886752417, 1.0569568578007835, 1.0619868775804793, 1.069514585320844, 1.0676487689685423, 1.0632916750571282, 1.0542239281597754, 1.0607538248399317, 1.0778692083555248, 1.0952415662243968, 1.0836126845434126, 1.0829238815183364, 1.1007384441850487, 1.1139872542476486, 1.1140806733363435, 1.2093147040749634, 1.2078187324021417, 1.2254061469643382, 1.2174095625632053, 1.2436121046310036, 1.2376469949066906, 1.2336051908401915, 1.2362255582227522, 1.2848816184670144, 1.2843520413590623, 1.2776040681056078, 1.2844028368729565, 1.2952952409812715, 1.2781118969681036, 1.2806801193041526, 1.2616922246227567, 1.2606161237078404, 1.2572598473089862, 1.2410738447820309, 1.2316034878173447, 1.2365093337876762, 1.2390707648913648, 1.2373745570664298, 1.258481225624933, 1.239609022788649, 1.2265449272472637, 1.2145700214348878, 1.222674145491896, 1.24278081598438, 1.25092630998259, 1.2737098688967217, 1.284640433629536, 1.2867365702364097, 1.2898313048906405, 1.259231966541383, 1.2720292195287672, 1.271514236429095, 1.2952936191321076, 1.326242086096835, 1.3138868139911828, 1.34811647262877, 1.3974129330297913, 1.3914090780549249, 1.4012984748285997, 1.3872187948033923, 1.4161494835280142, 1.4337240678498469, 1.402535741896054, 1.4368043942627355, 1.4395018621128481, 1.415983255666242, 1.3989969334177994, 1.3883765212844226, 1.445086661286918, 1.4535409589312025, 1.491393863397753, 1.49709931713738, 1.534620982488504, 1.6078489368873965, 1.6171661013547525, 1.5887485429053936, 1.581259407322659, 1.5622663966064523, 1.5639340726492554, 1.577389054205842, 1.5663244516743304, 1.5813204921414843, 1.5488117510830897, 1.566751984780585, 1.5717935879224447, 1.5300439509206432, 1.5311294264845996, 1.528141137453832, 1.5241249697744066, 1.4915678881207182, 1.5090267831523405, 1.5231989677930737, 1.5266804347565555, 1.5421542616178372, 1.5354774735894863, 1.5327974696146769, 1.5385246386746823, 1.5418304408900616, 1.5491320922255503, 1.556919169789904, 1.5534400044897152, 1.533523215232611, 1.5758750529691192, 1.592971124774679, 1.5977255346099, 1.6111934059073454, 1.6344156972515929, 1.641853271451545, 1.6224752036341814], "rs_score": 0.5655858819028958}, {"ticker": "GOOG", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [172.61, 174.99, 174.21, 175.75, 167.81, 165.98, 169.0, 164.73, 167.62, 166.57, 162.67, 166.28, 165.05, 166.25, 169.93, 172.79, 167.14, 164.08, 156.06, 156.23, 158.88, 158.86, 152.63, 147.74, 149.24, 146.58, 161.06, 155.37, 159.4, 161.47, 158.68, 155.5, 153.36, 149.86, 153.9, 157.72, 161.47, 163.85, 162.42, 162.06, 160.89, 162.79, 165.81, 166.05, 165.2, 152.8, 155.75, 154.38, 159.58, 160.89, 166.81, 165.4, 167.43, 167.87, 165.32, 170.06, 171.98, 169.59, 173.98, 173.38, 172.96, 172.85, 170.37, 167.71, 169.39, 169.81, 174.92, 177.63, 180.01, 178.79, 176.97, 175.88, 177.94, 177.23, 173.98, 167.73, 166.01, 167.74, 171.49, 174.43, 178.27, 177.39, 176.91, 179.76, 180.55, 177.56, 175.16, 177.66, 178.7, 181.31, 182.81, 183.1, 183.77, 184.7, 185.94, 191.15, 192.11, 191.51, 193.2, 194.08, 193.42, 196.43, 197.44, 192.86, 189.95, 195.75, 195.32, 196.92, 197.28, 202.09, 201.63, 204.16, 203.03, 203.82, 204.91, 204.29, 202.49, 200.19, 200.62, 206.72, 209.16, 207.95, 208.21, 212.37, 213.53, 211.99, 231.1, 232.66, 235.17, 234.16, 239.94, 239.56, 240.78, 241.38, 251.76, 251.42, 249.85, 252.33, 255.24, 252.88, 252.34, 247.83, 246.57, 247.18, 244.36, 243.55, 245.54, 246.43, 246.45, 251.51, 247.13, 245.46, 242.21, 237.49, 244.64, 246.19, 251.71, 251.88, 253.79, 257.02, 251.34, 252.53, 253.73, 260.51, 269.93, 268.43, 275.17, 281.9, 281.82, 284.12, 278.06, 284.75, 285.34, 279.7, 290.59, 291.74, 287.43, 279.12, 276.98, 285.6, 284.96, 292.99, 289.98, 299.65, 318.47, 323.64, 320.28, 320.12, 315.12, 316.02, 320.62, 318.39, 322.09, 314.45, 317.75, 321.0, 313.7, 310.52, 309.32, 307.73, 298.06, 303.75, 308.61, 311.33, 315.68, 315.67, 314.96, 314.39, 314.55, 313.8, 315.32, 317.32, 314.55, 322.43, 326.01, 329.14, 332.73, 336.43, 336.31, 333.16], "ma50": [191.0992, 190.796, 190.4862, 190.142, 189.5784, 188.9466, 188.38459999999998, 187.79840000000002, 187.297, 186.81959999999998, 186.26039999999998, 185.7234, 185.0652, 184.456, 183.9468, 183.53920000000002, 183.03619999999998, 182.4968, 181.6784, 180.91480000000004, 180.1414, 179.32600000000002, 178.378, 177.3412, 176.28799999999998, 175.34419999999997, 174.62400000000002, 173.78779999999998, 172.9232, 172.0406, 171.16140000000004, 170.11720000000003, 169.3184, 168.4494, 167.78459999999998, 167.175, 166.66299999999998, 166.2314, 165.72220000000002, 165.226, 164.7278, 164.24099999999999, 163.8244, 163.5138, 163.194, 162.7026, 162.3236, 162.007, 161.7542, 161.5988, 161.4828, 161.291, 161.1554, 160.99779999999998, 160.948, 161.0296, 161.0892, 161.18640000000002, 161.3136, 161.44979999999998, 161.6556, 161.787, 161.8934, 161.9226, 161.9118, 161.8522, 162.0078, 162.27880000000002, 162.75779999999997, 163.209, 163.5708, 163.91119999999998, 164.41740000000001, 165.0072, 165.502, 165.925, 166.024, 166.2714, 166.51319999999998, 166.77239999999998, 167.16420000000002, 167.602, 168.07299999999998, 168.671, 169.20399999999998, 169.60080000000002, 169.87460000000002, 170.1508, 170.47639999999998, 170.8614, 171.2998, 171.70600000000002, 172.06519999999998, 172.4382, 172.85299999999998, 173.62, 174.34720000000002, 175.08980000000003, 175.76219999999998, 176.426, 176.9582, 177.5788, 178.179, 178.67879999999997, 179.1714, 179.6852, 180.15200000000002, 180.6986, 181.16459999999998, 181.7388, 182.31220000000002, 182.9384, 183.5916, 184.31380000000001, 185.02419999999998, 185.71380000000002, 186.2652, 186.7164, 187.1286, 187.68719999999996, 188.331, 188.97240000000002, 189.5778, 190.28060000000002, 191.0716, 191.95680000000002, 193.2586, 194.55700000000002, 195.8306, 197.0252, 198.25859999999997, 199.502, 200.77939999999998, 202.0118, 203.43600000000004, 204.9132, 206.40699999999998, 207.90039999999996, 209.43120000000002, 210.8626, 212.2532, 213.5478, 214.80380000000002, 216.0534, 217.2218, 218.2698, 219.3384, 220.43679999999998, 221.5018, 222.65040000000002, 223.72459999999998, 224.7052, 225.6006, 226.4932, 227.58700000000002, 228.59579999999997, 229.7236, 230.8228, 231.953, 233.0516, 234.0458, 235.01319999999998, 236.02719999999997, 237.16099999999997, 238.4614, 239.74419999999998, 241.1978, 242.832, 244.456, 246.00400000000002, 247.382, 248.918, 250.4606, 251.80720000000002, 253.3484, 254.9434, 256.07, 256.9992, 257.8354, 258.8642, 259.76460000000003, 260.8332, 261.8172, 262.9826, 264.3168, 265.7612, 267.1698, 268.5256, 269.7232, 270.986, 272.3516, 273.76279999999997, 275.2732, 276.6186, 278.08639999999997, 279.6354, 280.99859999999995, 282.2804, 283.5378, 284.6622, 285.68080000000003, 286.8466, 288.1746, 289.65139999999997, 291.07219999999995, 292.4618, 293.7268, 294.97700000000003, 296.1922, 297.32779999999997, 298.6074, 299.90319999999997, 301.11960000000005, 302.358, 303.4796, 304.6938, 305.845, 306.9356, 308.0254, 309.0062], "ma150": [176.33566666666667, 176.3614, 176.37706666666668, 176.3944, 176.36346666666668, 176.34733333333332, 176.40306666666666, 176.431, 176.4768, 176.495, 176.47686666666667, 176.4924, 176.48653333333334, 176.51466666666667, 176.55973333333333, 176.6134, 176.605, 176.57246666666666, 176.49533333333332, 176.4336, 176.37660000000002, 176.31613333333334, 176.22446666666664, 176.11273333333332, 176.01833333333335, 175.8948, 175.91113333333334, 175.89486666666667, 175.90019999999998, 175.96246666666667, 176.02339999999998, 176.06, 176.06806666666665, 176.0302, 176.00039999999998, 175.99193333333335, 175.99986666666666, 176.02013333333335, 176.01466666666667, 175.99746666666667, 175.98293333333334, 175.97726666666668, 175.99606666666668, 176.0108666666667, 176.01026666666667, 175.91433333333333, 175.82986666666667, 175.74366666666666, 175.69279999999998, 175.64166666666668, 175.65779999999998, 175.65580000000003, 175.68493333333333, 175.71620000000001, 175.72153333333333, 175.74626666666668, 175.78013333333334, 175.79913333333334, 175.86226666666667, 175.9178, 175.96553333333335, 176.00573333333332, 176.045, 176.0662, 176.0822, 176.09199999999998, 176.11720000000003, 176.12713333333332, 176.17593333333332, 176.21686666666665, 176.25880000000004, 176.2886, 176.286, 176.25233333333335, 176.21313333333333, 176.1182, 176.00279999999998, 175.9178, 175.87873333333334, 175.88233333333332, 175.89213333333333, 175.8775333333333, 175.87473333333335, 175.94486666666666, 176.03806666666665, 176.09226666666666, 176.12253333333334, 176.16813333333334, 176.22286666666668, 176.27839999999998, 176.34366666666665, 176.39039999999997, 176.45346666666666, 176.5082, 176.56713333333335, 176.59793333333332, 176.56726666666665, 176.5531333333333, 176.56526666666667, 176.53806666666668, 176.5134, 176.55526666666668, 176.60686666666666, 176.6062, 176.56593333333333, 176.5538, 176.54193333333333, 176.56113333333334, 176.59173333333334, 176.6694, 176.74273333333332, 176.81626666666668, 176.8500666666667, 176.89746666666667, 176.96093333333332, 177.0350666666667, 177.10306666666665, 177.16400000000002, 177.18826666666666, 177.27033333333335, 177.34773333333334, 177.4032, 177.45773333333332, 177.543, 177.62053333333333, 177.742, 177.96886666666666, 178.2054, 178.42233333333334, 178.61273333333332, 178.8614, 179.07373333333334, 179.39026666666666, 179.71073333333334, 180.14153333333334, 180.56300000000002, 180.98153333333332, 181.42753333333334, 181.8766, 182.31666666666666, 182.76026666666667, 183.16493333333332, 183.56446666666668, 184.00179999999997, 184.42293333333333, 184.86413333333334, 185.3364, 185.84453333333335, 186.3394, 186.89173333333332, 187.38853333333333, 187.85833333333332, 188.31166666666667, 188.72326666666666, 189.23546666666667, 189.77020000000002, 190.32160000000002, 190.9026, 191.47706666666664, 192.08006666666665, 192.6712, 193.24620000000002, 193.8374, 194.4658, 195.13246666666666, 195.77006666666665, 196.49026666666666, 197.27573333333333, 198.1141333333333, 198.9667333333333, 199.76126666666667, 200.60053333333332, 201.48526666666666, 202.365, 203.30733333333336, 204.27506666666665, 205.1175333333333, 205.94253333333333, 206.7264, 207.55393333333333, 208.39579999999998, 209.3124, 210.2232, 211.2218, 212.31893333333335, 213.42506666666665, 214.4838, 215.5256, 216.54359999999997, 217.57, 218.63486666666668, 219.6722, 220.71406666666667, 221.70340000000002, 222.72040000000004, 223.84173333333334, 224.89473333333333, 225.93566666666672, 226.93393333333336, 227.91286666666667, 228.78786666666662, 229.7102, 230.6514, 231.6078, 232.6102, 233.58093333333332, 234.5341333333333, 235.4994666666667, 236.4366, 237.37273333333334, 238.32180000000002, 239.28493333333333, 240.24613333333332, 241.2776, 242.32173333333336, 243.38393333333332, 244.436, 245.4946666666667, 246.53666666666666, 247.56580000000002], "ma200": [177.3255, 177.33105, 177.32495, 177.31724999999997, 177.264, 177.19619999999998, 177.1512, 177.09955000000002, 177.05599999999998, 176.99875, 176.92510000000001, 176.8887, 176.84414999999998, 176.80329999999998, 176.7773, 176.7559, 176.69984999999997, 176.6405, 176.53764999999999, 176.42785, 176.32444999999998, 176.23504999999997, 176.10635000000002, 175.95115, 175.81509999999997, 175.65945, 175.56345, 175.43635000000003, 175.30545, 175.18595000000002, 175.04505, 174.90545000000003, 174.7498, 174.56605, 174.39860000000002, 174.22740000000002, 174.08235000000002, 173.9494, 173.7982, 173.672, 173.54255, 173.41555, 173.31709999999998, 173.23425000000003, 173.16415, 173.0312, 172.89320000000004, 172.7471, 172.67315000000002, 172.6318, 172.62245, 172.59380000000002, 172.57165, 172.54524999999998, 172.50959999999998, 172.5179, 172.5746, 172.61985, 172.68599999999998, 172.73370000000003, 172.77155, 172.81605, 172.83825000000002, 172.86665000000002, 172.89775, 172.92309999999998, 172.9557, 172.99905, 173.06095000000002, 173.12744999999998, 173.17515, 173.21490000000003, 173.27270000000001, 173.33635, 173.38925, 173.40235, 173.43935000000002, 173.489, 173.55344999999997, 173.66494999999998, 173.8086, 173.94549999999998, 174.0693, 174.1904, 174.3013, 174.39415, 174.46855, 174.5528, 174.63009999999997, 174.71345000000002, 174.81215, 174.90945, 175.01335000000003, 175.1177, 175.22095000000002, 175.34074999999996, 175.45919999999998, 175.5802, 175.71015000000003, 175.83774999999997, 175.9829, 176.13655, 176.30845000000002, 176.45685, 176.58399999999997, 176.731, 176.87310000000002, 177.024, 177.18785, 177.37305, 177.5522, 177.7389, 177.93164999999996, 178.1281, 178.3177, 178.49745, 178.65419999999997, 178.77445, 178.9141, 179.08445, 179.27685000000002, 179.45954999999998, 179.60895, 179.7594, 179.92774999999997, 180.07785, 180.31675000000004, 180.5776, 180.86669999999998, 181.16805, 181.48375, 181.78365000000002, 182.1009, 182.4616, 182.88755, 183.2975, 183.69365000000002, 184.10119999999998, 184.52495000000002, 184.92445, 185.32104999999999, 185.67974999999998, 186.04104999999998, 186.3945, 186.7308, 187.0159, 187.26005, 187.52405000000002, 187.7994, 188.06615000000002, 188.31619999999998, 188.59274999999997, 188.8553, 189.07795000000002, 189.32120000000003, 189.5643, 189.83734999999996, 190.12654999999998, 190.43205, 190.76495, 191.06850000000003, 191.3655, 191.64434999999997, 191.96335, 192.33605, 192.71235000000001, 193.12675, 193.581, 194.0052, 194.45375, 194.8563, 195.28189999999998, 195.70845, 196.10905, 196.5525, 197.04235, 197.49415000000002, 197.90384999999998, 198.27560000000003, 198.6756, 199.08720000000002, 199.51359999999997, 199.997, 200.5287, 201.18535, 201.86255, 202.5286, 203.20205, 203.83825000000002, 204.484, 205.1581, 205.81439999999998, 206.49165000000002, 207.15599999999998, 207.83880000000002, 208.55695, 209.25195, 209.9535, 210.639, 211.33435, 211.9616, 212.6054, 213.27740000000003, 213.95530000000002, 214.69465, 215.44310000000002, 216.1729, 216.9212, 217.65585000000002, 218.392, 219.15524999999997, 219.91044999999997, 220.65795000000003, 221.43885000000003, 222.21925000000002, 223.00100000000003, 223.82895, 224.6907, 225.59195000000003, 226.4766], "rs_line": [1.0, 1.003008136168886, 1.016582870412665, 1.019853160749407, 1.0004254037923002, 0.9978101896585073, 1.010602527949618, 0.9983772072256459, 0.9953332310048609, 0.9815294219862624, 0.969021908089805, 0.9798551233074241, 0.9754276729052205, 0.9851501410275207, 0.9892410128884254, 1.0034781866121523, 0.9823938919566549, 0.9669762105426711, 0.9386138127774636, 0.9333707943072664, 0.9465293124479317, 0.9404586351369144, 0.9504139058523524, 0.9771707518503222, 0.9888532747667251, 0.9866825151108879, 0.9811163926110829, 0.989828399255112, 0.9977008287653639, 1.0009465222789256, 0.9864142248835803, 0.9886212375071571, 0.9736266259958725, 0.9746046651281045, 0.9754982721554762, 0.984456774142242, 0.9870864458669709, 0.9944504811957814, 0.9853956152695362, 0.9770566823054655, 0.9696179498226922, 0.9741646087616079, 0.9777233806467304, 0.9847856818378495, 0.9880026708560561, 0.9100156476709866, 0.9211661344163993, 0.9142283316939894, 0.914790884541429, 0.9162496385636216, 0.9487508093000464, 0.9361587396921363, 0.9416838078522447, 0.9431268251612408, 0.9319337617490374, 0.9750848208931009, 0.9857046932079057, 0.978686615392161, 0.9835718839637055, 0.9858835320851078, 0.9796283275780793, 0.9801015903851533, 0.9606282229089227, 0.9402678695763396, 0.949941786578121, 0.9569217477454423, 0.9756984760442324, 0.9899225650393416, 0.9975304896156778, 0.9936036088124741, 0.9795959483573531, 0.9845700006123349, 0.9867139760692027, 0.9912472509736465, 0.9732165894569236, 0.9432441173725952, 0.9244403902017754, 0.9238678498309084, 0.9439929124393428, 0.9527226573859112, 0.9688826561422118, 0.9595123208637805, 0.9572258313470016, 0.968257218909025, 0.9649076653994797, 0.9560527564369776, 0.9436471310801288, 0.9514101582338728, 0.9542882738831531, 0.9716418138370778, 0.9778144478753359, 0.9835686835361137, 0.9838783611633894, 0.9828428069696122, 0.9901664451824058, 1.0159842209176784, 1.0209405972948369, 1.0091665428203072, 1.0177350453485374, 1.0180700268603669, 1.014862787908907, 1.0333817310120772, 1.0400048594272582, 1.0197050889615018, 1.021054521007657, 1.0364775397504098, 1.039470795246777, 1.0400196766730239, 1.0427944097126365, 1.0599543496831971, 1.0596370605003047, 1.0616309902303993, 1.0521533567943937, 1.0561490755437513, 1.0642889931106714, 1.061299672218158, 1.0576866670724887, 1.0484586378065224, 1.0549429546752698, 1.070578640116588, 1.0880034012756117, 1.0771990569530063, 1.0760939944594785, 1.0937208230503452, 1.1062925647415038, 1.1065134431751389, 1.1997587414115645, 1.1978466054311483, 1.2142861541605328, 1.2061081727869813, 1.2330291360022407, 1.2275277652661774, 1.2236107009506971, 1.2270703155701481, 1.2730600211886474, 1.273093672370539, 1.2667176000411977, 1.273341331126619, 1.2852315892448698, 1.2673521708410038, 1.2715677535020995, 1.2528272549632196, 1.2522349325756097, 1.248181995289288, 1.2304836832906911, 1.221802520671792, 1.2276025925880294, 1.2306346485556343, 1.2307529164280675, 1.2515337806144495, 1.234314784913458, 1.2187065921316969, 1.2060643416780321, 1.215411434878285, 1.2330827200113452, 1.242413124064594, 1.2646556509805391, 1.2741873588979498, 1.2766030912430557, 1.2795425871647352, 1.2512840426326237, 1.2637787165561087, 1.2622987505979775, 1.285523020730795, 1.3164759249406432, 1.305692349393672, 1.33783436370881, 1.3857957446964222, 1.3808728885014032, 1.3895348251532118, 1.3762103835721802, 1.4044543490917647, 1.4226282599128004, 1.3931370322222563, 1.4251399524739294, 1.4275119352244494, 1.4056406350472808, 1.38803464572619, 1.3776181384910686, 1.4338499030385634, 1.4427523855745745, 1.4776996706833236, 1.4851558678878487, 1.5195450156966623, 1.591556990161854, 1.602322846074072, 1.574815940674202, 1.5654841027612898, 1.548100396724346, 1.549651582789924, 1.5667829232722725, 1.554748823397821, 1.5698346061397224, 1.5372162237605396, 1.5546903211519383, 1.560244233501692, 1.5212221054797257, 1.522167810815849, 1.518579679044974, 1.514913001090725, 1.4836341909871118, 1.5006251414871203, 1.5154056564057379, 1.5192969560431706, 1.5335161468393277, 1.528092280383805, 1.5248099249732252, 1.5274937965546866, 1.5301397731205442, 1.5378854365843355, 1.5425072146668115, 1.5420209147421513, 1.519523171870232, 1.5626267669062026, 1.580137302698058, 1.584827011791208, 1.5996009689600887, 1.620629248051958, 1.6280533565711426, 1.608424337015259], "rs_score": 0.5548090549397409}, {"ticker": "AMAT", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [152.87, 155.32, 151.54, 155.68, 149.99, 146.99, 149.06, 149.95, 155.66, 155.46, 153.51, 154.46, 154.38, 152.12, 154.95, 153.64, 150.68, 147.68, 145.06, 145.12, 145.66, 147.75, 135.51, 126.95, 132.85, 128.96, 149.73, 138.24, 144.94, 144.53, 145.45, 138.19, 137.46, 135.56, 138.3, 143.58, 150.17, 151.55, 150.79, 149.55, 150.71, 148.96, 155.1, 154.61, 153.03, 155.81, 156.0, 155.61, 167.99, 173.03, 174.14, 174.75, 165.57, 165.94, 165.73, 162.23, 160.52, 157.51, 161.83, 161.59, 159.48, 156.75, 157.27, 161.74, 161.93, 164.19, 166.74, 169.79, 173.77, 172.79, 175.0, 170.59, 176.55, 174.09, 172.84, 169.46, 171.96, 180.18, 183.07, 183.52, 183.21, 183.07, 183.76, 190.01, 191.05, 190.78, 194.99, 195.39, 198.03, 197.93, 197.1, 199.29, 194.81, 192.52, 190.44, 192.61, 187.14, 187.01, 188.12, 185.69, 190.27, 188.41, 189.39, 180.06, 179.99, 182.82, 179.15, 178.14, 183.15, 184.87, 184.38, 188.45, 190.03, 188.24, 161.76, 163.53, 162.22, 160.96, 159.84, 162.49, 161.99, 164.51, 164.39, 165.27, 160.76, 157.57, 156.25, 158.24, 162.75, 162.05, 163.5, 163.42, 170.15, 167.8, 170.93, 173.54, 178.13, 189.76, 190.1, 200.52, 200.87, 201.44, 199.6, 203.92, 204.95, 204.74, 217.74, 223.59, 217.53, 223.91, 211.56, 217.51, 220.3, 209.95, 219.48, 218.19, 227.58, 227.72, 224.99, 228.13, 226.0, 220.56, 228.47, 228.75, 231.33, 227.64, 235.75, 232.55, 233.1, 237.71, 230.19, 240.89, 233.53, 230.07, 235.08, 228.67, 230.73, 223.23, 226.01, 228.71, 225.12, 235.13, 220.23, 224.01, 230.91, 242.46, 249.97, 252.25, 254.75, 265.33, 268.63, 269.44, 268.0, 268.16, 267.14, 275.15, 270.11, 259.21, 261.27, 258.84, 248.27, 253.5, 256.41, 259.01, 260.23, 260.78, 261.9, 263.05, 259.97, 256.99, 268.87, 284.32, 296.01, 292.2, 281.64, 301.18, 307.24, 304.87, 301.89, 319.08], "ma50": [173.90559999999996, 173.703, 173.505, 173.3468, 172.99740000000003, 172.5698, 172.2, 171.8624, 171.7028, 171.55939999999998, 171.35219999999998, 171.0402, 170.5782, 170.06420000000003, 169.6234, 169.26319999999998, 168.85960000000003, 168.34019999999998, 167.6738, 166.8466, 165.9188, 165.0164, 163.8164, 162.5414, 161.4634, 160.5512, 160.08880000000002, 159.34799999999998, 158.6124, 157.89600000000002, 157.22899999999998, 156.4216, 155.5574, 154.61260000000001, 153.7786, 152.977, 152.3164, 151.7296, 151.06, 150.667, 150.2412, 149.7392, 149.321, 148.9736, 148.66279999999998, 148.4682, 148.21800000000002, 148.1974, 148.3958, 148.81380000000001, 149.2392, 149.62779999999998, 149.9084, 150.11360000000002, 150.4284, 150.7332, 150.9624, 151.1136, 151.237, 151.3596, 151.47899999999998, 151.5248, 151.5826, 151.775, 151.91459999999998, 152.12560000000002, 152.4468, 152.889, 153.46320000000003, 154.0166, 154.6034, 155.06019999999998, 155.881, 156.8238, 157.6236, 158.4336, 158.8782, 159.717, 160.4796, 161.2594, 162.0146, 162.9122, 163.8382, 164.9272, 165.9822, 166.9262, 167.8226, 168.69940000000003, 169.64419999999998, 170.61180000000002, 171.53959999999998, 172.5462, 173.34040000000002, 174.09859999999998, 174.8468, 175.58280000000002, 176.2056, 176.83360000000002, 177.23620000000003, 177.4894, 177.812, 178.08520000000001, 178.5616, 178.84400000000002, 179.12920000000003, 179.541, 179.9136, 180.32620000000003, 180.75260000000003, 181.2182, 181.71620000000001, 182.3502, 183.0054, 183.5354, 183.532, 183.5188, 183.4284, 183.2518, 182.9732, 182.76719999999997, 182.507, 182.38539999999998, 182.1422, 181.96580000000003, 181.7242, 181.48640000000003, 181.1722, 180.7334, 180.327, 179.89759999999998, 179.5034, 179.1104, 178.8382, 178.394, 177.99160000000003, 177.6468, 177.3096, 177.19699999999997, 177.0384, 177.0902, 177.16559999999998, 177.20860000000002, 177.3044, 177.53240000000002, 177.82260000000002, 178.0652, 178.6772, 179.4088, 179.99699999999996, 180.76139999999998, 181.18720000000002, 181.7692, 182.3874, 182.9852, 183.775, 184.4824, 185.45100000000002, 186.44259999999997, 187.27939999999998, 188.14460000000003, 188.977, 189.6192, 190.388, 191.19819999999999, 192.5896, 193.8718, 195.34240000000003, 196.7742, 198.23940000000002, 199.74380000000002, 201.1078, 202.6354, 204.0182, 205.31419999999997, 206.8006, 208.22259999999997, 209.71219999999997, 211.01199999999997, 212.27719999999997, 213.6104, 214.84279999999998, 216.27700000000002, 217.2786, 218.40279999999998, 219.6024, 220.98080000000002, 222.41760000000002, 223.66740000000001, 224.96040000000002, 226.2566, 227.61180000000002, 228.9718, 230.3398, 231.6246, 232.86839999999995, 234.2766, 235.32399999999998, 236.0364, 236.91120000000004, 237.60980000000004, 238.34399999999997, 239.0638, 239.78599999999997, 240.76719999999997, 241.5822, 242.43399999999997, 243.12039999999996, 243.827, 244.5266, 245.10379999999998, 245.9612, 247.2364, 248.58720000000002, 249.8562, 250.8624, 252.3332, 253.763, 255.2094, 256.5852, 258.2126], "ma150": [183.56406666666666, 183.22906666666668, 182.92773333333332, 182.55093333333332, 182.24220000000003, 182.01006666666666, 181.7912, 181.5688, 181.41646666666668, 181.18253333333334, 180.93140000000002, 180.67386666666667, 180.3644, 180.03433333333334, 179.65513333333334, 179.29340000000002, 178.89166666666668, 178.5018, 178.07473333333334, 177.70753333333334, 177.32746666666668, 177.0042666666667, 176.60253333333333, 176.1629333333333, 175.76206666666664, 175.30673333333334, 175.08246666666668, 174.7882, 174.55286666666666, 174.35139999999998, 174.1374, 173.87166666666667, 173.54846666666666, 173.2308, 172.89633333333333, 172.603, 172.34686666666667, 172.11626666666666, 171.81013333333334, 171.52606666666668, 171.2372, 170.91840000000002, 170.637, 170.27033333333333, 169.9244, 169.61613333333335, 169.34146666666666, 169.03786666666667, 168.82719999999998, 168.63426666666666, 168.461, 168.2868, 168.02353333333332, 167.77006666666665, 167.50786666666667, 167.16346666666666, 166.96013333333332, 166.77960000000002, 166.63686666666666, 166.47173333333333, 166.30519999999999, 166.1302, 165.96066666666667, 165.81393333333332, 165.65, 165.509, 165.35313333333335, 165.24973333333332, 165.19766666666666, 165.12706666666665, 165.08159999999998, 164.97566666666665, 164.9025333333333, 164.76919999999998, 164.64126666666667, 164.5139333333333, 164.41626666666667, 164.3988666666667, 164.37933333333334, 164.47693333333333, 164.56013333333334, 164.65186666666665, 164.74033333333333, 164.83540000000002, 164.9432, 165.0514, 165.19666666666666, 165.35713333333334, 165.5126, 165.61033333333333, 165.70326666666668, 165.82413333333332, 165.976, 166.10600000000002, 166.22986666666665, 166.3928, 166.49953333333335, 166.61906666666667, 166.7442, 166.85273333333333, 166.9856, 167.13866666666667, 167.325, 167.4348, 167.51833333333335, 167.61466666666666, 167.692, 167.7674, 167.89746666666667, 168.04573333333332, 168.18246666666667, 168.30506666666668, 168.3887333333333, 168.4582, 168.35666666666665, 168.30253333333334, 168.2449333333333, 168.16033333333334, 168.03673333333333, 167.8768, 167.67640000000003, 167.4873333333333, 167.27986666666666, 167.11033333333333, 166.93706666666665, 166.82373333333334, 166.7130666666667, 166.59946666666664, 166.473, 166.351, 166.249, 166.14806666666667, 166.07793333333333, 165.97793333333334, 165.91746666666668, 165.85, 165.8162, 165.87533333333332, 165.9142, 166.12300000000002, 166.31546666666665, 166.498, 166.65526666666668, 166.8682, 167.11073333333334, 167.37206666666668, 167.70026666666666, 168.14659999999998, 168.54299999999998, 169.02153333333334, 169.41279999999998, 169.8274, 170.28580000000002, 170.6476, 171.11086666666668, 171.58553333333336, 172.109, 172.62746666666666, 173.08966666666666, 173.57413333333335, 174.0574, 174.49806666666666, 174.992, 175.50286666666668, 176.01206666666664, 176.5054, 177.07253333333335, 177.63833333333332, 178.22526666666667, 178.8425333333333, 179.40606666666667, 180.027, 180.68046666666666, 181.36793333333333, 182.0494666666667, 182.71419999999998, 183.25419999999997, 183.82080000000002, 184.36126666666667, 184.92246666666665, 185.4536, 186.09986666666666, 186.65166666666667, 187.24133333333333, 187.85873333333333, 188.51793333333333, 189.18326666666667, 189.8546, 190.5476666666667, 191.31953333333334, 192.10566666666665, 192.90886666666665, 193.66153333333332, 194.41853333333333, 195.17926666666665, 195.97486666666666, 196.7356, 197.42626666666666, 198.04813333333334, 198.62019999999998, 199.1144, 199.6394, 200.245, 200.86546666666666, 201.49546666666666, 202.15246666666667, 202.82833333333335, 203.53193333333334, 204.1862, 204.8222, 205.55146666666667, 206.40193333333335, 207.3268666666667, 208.1966, 208.99466666666666, 209.90793333333335, 210.84459999999999, 211.74513333333334, 212.5992666666667, 213.57453333333333], "ma200": [194.7042, 194.39335, 194.0809, 193.7989, 193.4491, 193.08505000000002, 192.7396, 192.3996, 192.07345, 191.74415000000002, 191.41645, 191.10604999999998, 190.80254999999997, 190.4921, 190.20574999999997, 189.8571, 189.50175, 189.1315, 188.716, 188.29174999999998, 187.83180000000002, 187.38280000000003, 186.8752, 186.29565, 185.72075, 185.16559999999998, 184.7372, 184.27919999999997, 183.83255, 183.39435, 182.95895000000002, 182.46994999999998, 181.9702, 181.44369999999998, 180.91864999999999, 180.4236, 179.94299999999998, 179.4434, 178.9225, 178.46395, 178.0005, 177.51754999999997, 177.06385000000003, 176.73655000000002, 176.41345, 176.1412, 175.80384999999998, 175.48365, 175.29094999999998, 175.14449999999997, 174.98284999999998, 174.82875, 174.67289999999997, 174.4416, 174.28875, 174.19084999999998, 174.084, 173.955, 173.8716, 173.7268, 173.5683, 173.3866, 173.16895, 172.9695, 172.72, 172.50145, 172.28045000000003, 172.0986, 171.92184999999998, 171.7848, 171.64645000000002, 171.51825, 171.42215, 171.32815000000002, 171.22744999999998, 171.08844999999997, 171.0314, 171.02039999999997, 171.03454999999997, 171.0784, 171.10670000000002, 171.1318, 171.1209, 171.15489999999997, 171.1678, 171.18380000000002, 171.21579999999997, 171.26205000000002, 171.26865, 171.2975, 171.31280000000004, 171.32535, 171.31285, 171.2274, 171.155, 171.1078, 171.0575, 170.98680000000002, 170.92945000000003, 170.84805, 170.79875, 170.7364, 170.65805, 170.53855000000004, 170.4132, 170.25785, 170.19850000000002, 170.16625, 170.16580000000002, 170.15834999999998, 170.15795000000003, 170.1852, 170.22185000000002, 170.2443, 170.1205, 170.01145, 169.87195, 169.75024999999997, 169.64155000000002, 169.53709999999998, 169.43794999999997, 169.3281, 169.21245, 169.06835000000004, 168.912, 168.75705, 168.60524999999998, 168.4825, 168.36625, 168.3321, 168.29595, 168.26649999999998, 168.2648, 168.22505, 168.20530000000002, 168.20025, 168.22490000000002, 168.31710000000004, 168.39405, 168.4803, 168.56885, 168.67025, 168.80810000000002, 168.96259999999998, 169.12805, 169.3109, 169.54395, 169.81650000000002, 170.05740000000003, 170.32989999999998, 170.53600000000003, 170.79629999999997, 171.09060000000002, 171.3224, 171.5825, 171.83160000000004, 172.13174999999998, 172.43619999999999, 172.74294999999998, 173.07045000000002, 173.3811, 173.6336, 173.88855, 174.1432, 174.41490000000002, 174.69485, 175.01930000000002, 175.3138, 175.5874, 175.84355, 176.03425, 176.27434999999997, 176.46445, 176.6613, 176.90294999999998, 177.17345, 177.46285, 177.70260000000002, 177.92405, 178.16585000000003, 178.39745, 178.68030000000002, 178.8781, 179.08415000000002, 179.3387, 179.6327, 179.96654999999998, 180.32335, 180.67574999999997, 181.1564, 181.63954999999999, 182.11645000000001, 182.5764, 183.0573, 183.55015, 184.09820000000002, 184.6062, 185.11905000000002, 185.63505, 186.1686, 186.6456, 187.1365, 187.66084999999998, 188.1775, 188.72870000000003, 189.29765, 189.86185, 190.42735000000002, 190.94889999999998, 191.45655, 192.03334999999998, 192.68265, 193.3908, 194.0912, 194.72465, 195.46235000000001, 196.24515000000002, 197.0311, 197.81525, 198.68505000000002], "rs_line": [1.0, 1.0052227146690131, 0.9984830036501455, 1.0200438045547073, 1.0096546875845396, 0.99775439912974, 1.006464542762254, 1.0261529930786855, 1.0436704345299495, 1.0343532586517472, 1.0325390559393244, 1.0277359998184301, 1.0301827352060007, 1.0178195152301783, 1.018514751916125, 1.0074820499458352, 1.0000104866117705, 0.9827103113857839, 0.9851144706192504, 0.9789504973780928, 0.9798257065167116, 0.9876346465942077, 0.9527696403045687, 0.9480882340390883, 0.9939209881288154, 0.9801700458438766, 1.0298769752627321, 0.9944207007991614, 1.0243395939173223, 1.0116277159419371, 1.0209266655020262, 0.9920186709505354, 0.985372343672652, 0.9954466852277335, 0.9898143636022055, 1.011923121670223, 1.0365498924770113, 1.0385713648684225, 1.032969140818718, 1.0180615352441258, 1.0255512110480867, 1.006509724258796, 1.032668111264214, 1.0353426692288037, 1.033399723140247, 1.0477665280547048, 1.0417852236942748, 1.0405065751221518, 1.087352819049656, 1.1126276781354574, 1.118335996769394, 1.116798603652726, 1.0514706663663138, 1.05266886978191, 1.054883419491665, 1.0503041373743973, 1.0388233856950686, 1.0263493868735267, 1.0330218325012543, 1.0374920598692623, 1.0199187417590594, 1.0035821922685675, 1.0012713561373576, 1.023891087431526, 1.0253691030655407, 1.0447287654025343, 1.0501700831919398, 1.068416788118531, 1.0872966125668615, 1.0842569820088748, 1.0937777006701728, 1.078269691713183, 1.1054245421018627, 1.0994165509486766, 1.0916869566052199, 1.0760296721860196, 1.0812242710238906, 1.1205299912131141, 1.1378651644367264, 1.131807064430542, 1.1243092375506156, 1.118104230206078, 1.1226818367186444, 1.1556273964380226, 1.1528664286787602, 1.1598805158564827, 1.1861256936441074, 1.1814739384387887, 1.194069785752795, 1.1976771110822024, 1.190383264619987, 1.2087752033057308, 1.177664888730046, 1.156742542065672, 1.1450837141701702, 1.155939698291876, 1.1229510196495014, 1.1127046544804322, 1.1189386220843471, 1.0998388875673881, 1.127249249093278, 1.1191816975919653, 1.1264215673458338, 1.07496260615779, 1.092450326168539, 1.0930134755549177, 1.0765298485739159, 1.0623236837620922, 1.093115984623504, 1.0948445622178775, 1.0941062192587185, 1.1064779388740518, 1.1119485319687352, 1.101371989442327, 0.9486614275898367, 0.9592505246347692, 0.9567567468144734, 0.9518545117841044, 0.9490386680499809, 0.9501811348151159, 0.9514446146495346, 0.962217008034461, 0.9593292933136962, 0.9610611632168373, 0.9404436491761762, 0.9286638533999201, 0.915920312187397, 0.9198975113560914, 0.9488636467230758, 0.94246726192982, 0.9487070510441277, 0.9455095350579454, 0.9763341870096455, 0.9631719150833875, 0.9759422723149241, 0.9922104977293046, 1.0197206306021172, 1.081245484935136, 1.0808326594787243, 1.1347082518406535, 1.142910371120732, 1.1498116791398405, 1.1445896212073463, 1.1627011318580316, 1.1652989424807347, 1.1597363478361382, 1.2291855637318208, 1.2607576858436857, 1.2266054723216928, 1.258069101266883, 1.1931023668707361, 1.219386396682643, 1.238615732059203, 1.213214399991079, 1.2491177570186696, 1.243294897477955, 1.2910694340678124, 1.3007219515747008, 1.2778747494913356, 1.2823716648978227, 1.270417365389822, 1.2463169411895116, 1.283403447494335, 1.2745598953822692, 1.2739060832136289, 1.2502649949683076, 1.2941858633655225, 1.2908155197673357, 1.2896380934088638, 1.312679698877218, 1.2864012451344282, 1.341548423189602, 1.314665120928218, 1.2939129212878278, 1.3017758767664467, 1.2633877108378577, 1.2740602367949307, 1.2534459059223841, 1.2692634776586946, 1.2965053973063974, 1.2869618290408722, 1.3390139747930112, 1.2735739160102106, 1.2826565443281528, 1.3029870359831859, 1.3554129173957672, 1.3878149435557978, 1.3928704198619766, 1.4131264775717824, 1.4690938458320517, 1.4822327974850462, 1.4856160225260027, 1.4748747422882664, 1.4802021961154597, 1.4758456658493693, 1.5100827893464273, 1.4789805371848312, 1.4347241058113827, 1.44831428686356, 1.4387751692416262, 1.395375416475386, 1.414091729956415, 1.4216659277825041, 1.4271903972730542, 1.4273889617225226, 1.4253917455512155, 1.4316586900509016, 1.4430876984174554, 1.4279346610808077, 1.4221026850195557, 1.4851205934221399, 1.560069391173988, 1.6146102589656892, 1.5989825143835295, 1.5413523416306922, 1.6374611915412811, 1.667789141493999, 1.6582398002672913, 1.6501418067252571, 1.7393663052090942], "rs_score": 0.6484615653929449}, {"ticker": "ASML", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [708.22, 739.75, 714.84, 732.22, 683.11, 690.21, 703.37, 694.59, 714.0, 730.33, 731.11, 734.91, 734.06, 716.22, 727.84, 726.74, 705.76, 690.63, 674.58, 662.63, 667.34, 669.01, 623.22, 605.55, 615.84, 595.37, 687.26, 649.55, 668.81, 672.87, 683.16, 634.93, 640.16, 624.69, 638.69, 657.98, 675.0, 677.27, 672.76, 666.11, 668.08, 666.72, 690.33, 683.36, 679.99, 700.39, 708.03, 706.21, 750.2, 763.9, 768.91, 758.36, 748.1, 749.13, 748.76, 737.17, 740.7, 732.49, 756.79, 746.51, 747.07, 736.77, 746.53, 747.25, 742.78, 747.76, 753.02, 770.2, 784.97, 784.09, 786.21, 761.0, 775.23, 759.86, 761.64, 756.53, 779.72, 813.36, 815.24, 798.09, 795.95, 801.39, 790.47, 799.59, 794.5, 785.09, 794.1, 799.83, 802.09, 801.93, 806.73, 823.02, 754.45, 744.91, 734.58, 719.68, 705.48, 716.93, 725.08, 711.25, 729.99, 718.49, 721.45, 694.71, 689.82, 699.36, 689.63, 690.96, 713.12, 722.32, 721.31, 741.79, 755.57, 755.21, 742.16, 747.55, 743.61, 749.49, 735.4, 754.89, 754.46, 763.2, 770.0, 763.46, 742.62, 725.85, 736.82, 753.43, 781.7, 796.25, 805.13, 793.14, 804.16, 813.87, 867.3, 878.42, 872.27, 927.8, 932.15, 957.8, 963.51, 946.94, 949.55, 951.52, 962.61, 968.09, 1003.27, 1030.17, 1032.22, 1043.3, 1002.3, 987.81, 980.54, 936.19, 984.66, 983.18, 1009.81, 1019.59, 1029.27, 1042.15, 1025.02, 1011.57, 1036.41, 1033.1, 1059.98, 1052.48, 1070.84, 1075.45, 1059.23, 1066.82, 1030.14, 1043.75, 1029.2, 1016.96, 1038.79, 1022.42, 1037.33, 1019.86, 1006.98, 1020.0, 1004.06, 1039.33, 981.04, 966.57, 987.82, 1003.22, 1040.97, 1060.0, 1087.99, 1108.78, 1140.92, 1110.08, 1099.47, 1119.69, 1111.44, 1119.32, 1122.84, 1080.85, 1087.82, 1076.05, 1015.43, 1036.31, 1056.02, 1056.98, 1061.84, 1065.52, 1072.75, 1065.99, 1072.14, 1069.86, 1163.78, 1228.19, 1242.19, 1228.47, 1194.32, 1273.88, 1281.23, 1270.16, 1263.72, 1331.6], "ma50": [730.7379999999998, 731.1432, 731.2348, 731.7656000000002, 731.0070000000001, 730.4170000000001, 730.1672, 729.7872, 730.1442, 730.8892000000001, 731.503, 731.914, 731.225, 730.3978, 730.075, 729.8296, 729.3966, 728.4834, 727.4490000000001, 725.6959999999999, 723.9162000000001, 722.0364, 719.1666, 716.3528, 714.0246, 712.1290000000001, 712.2072000000001, 710.9452, 709.5816, 708.2528, 707.2948000000001, 705.3652000000001, 703.3166, 701.0278, 699.2476000000001, 697.5255999999999, 695.966, 694.388, 692.3034, 690.5945999999999, 689.0718, 687.5102, 686.455, 685.3779999999999, 684.2586, 683.6626000000001, 682.8846000000001, 683.0548, 683.8772, 685.158, 686.3718000000001, 686.7440000000001, 687.4091999999999, 687.7473999999999, 689.0604, 689.9995999999999, 690.7462, 691.5042, 692.36, 692.6836, 693.0028, 693.04, 693.2894, 693.91, 694.2087999999999, 694.6292, 695.5744, 697.1658, 699.3736, 701.8027999999999, 704.1801999999999, 706.02, 709.0602, 712.1464, 715.0624, 718.2855999999999, 720.1347999999999, 723.4110000000001, 726.3395999999999, 728.844, 731.0998, 734.429, 737.4352, 740.9331999999999, 744.0493999999999, 746.5916000000001, 748.9736, 751.4248, 754.0114, 756.7278, 759.5008, 762.6267999999999, 763.9091999999999, 765.1402, 766.232, 766.6178, 766.5668000000001, 766.7811999999999, 766.2787999999999, 765.2258, 764.4474, 763.65, 763.117, 762.0286, 760.8498, 760.0936, 759.0722000000001, 758.2416000000001, 757.3681999999999, 756.8843999999999, 756.3692, 756.4696, 756.6504000000001, 756.8096, 756.7972, 756.793, 756.6048, 756.1906, 755.1992, 754.6152000000001, 753.9802000000001, 754.0242000000002, 753.9196000000001, 753.9916000000001, 753.6111999999999, 752.9976000000001, 752.1396000000001, 750.941, 750.2702, 750.2334, 750.4169999999999, 750.252, 750.5258, 750.8114000000002, 752.2674000000001, 754.1339999999999, 755.6974, 758.2567999999999, 760.8580000000001, 763.9754, 767.1110000000001, 769.5894000000001, 773.4914, 777.6236, 782.1842, 787.1524000000001, 793.1081999999999, 799.373, 805.5158, 812.1568000000001, 817.6029999999998, 822.9894, 828.1712000000001, 833.0008, 838.8976000000001, 844.5740000000001, 850.9775999999999, 857.5501999999999, 863.8732000000001, 870.2698000000001, 876.3439999999999, 881.7395999999999, 887.3564, 892.9141999999999, 899.2706, 905.3692, 911.9138, 918.433, 924.9096, 931.1482000000001, 936.6618000000001, 942.2728, 947.4567999999999, 952.5268, 958.4502, 964.3815999999999, 970.3917999999999, 975.7203999999999, 980.2259999999999, 984.7009999999999, 988.6796, 993.6034000000001, 997.141, 1000.1949999999998, 1002.6054, 1005.1014, 1008.4753999999999, 1011.1194, 1014.2361999999999, 1017.2558, 1020.804, 1024.0668, 1027.0652, 1030.4286, 1033.4052000000001, 1036.4298, 1038.8211999999999, 1039.8348, 1040.9468000000002, 1041.6018, 1041.8644, 1042.8344, 1044.344, 1046.7598, 1048.3034, 1049.9502, 1051.2089999999998, 1052.1370000000002, 1052.9944, 1053.5486, 1056.3238000000001, 1060.6562, 1064.7718, 1068.6792, 1071.366, 1075.7939999999999, 1080.0018, 1083.896, 1087.9858, 1093.2814], "ma150": [762.1614000000001, 761.2894, 760.3200666666667, 758.9568666666667, 757.6195333333334, 756.8252666666666, 756.0454, 755.0559333333333, 754.2402666666667, 753.2648, 752.4018666666667, 751.6155333333334, 750.7126666666667, 749.6236, 748.2875333333334, 747.0080666666667, 745.4921333333334, 743.9218000000001, 742.1282666666666, 740.4944, 738.8949333333333, 737.4662666666667, 735.6885333333333, 733.8046666666667, 731.9922, 729.9355333333333, 728.8813333333333, 727.8018000000001, 726.9565333333333, 726.4237333333334, 725.9793333333333, 725.203, 724.1364666666667, 722.9666, 721.7821333333333, 720.8150666666668, 719.9438, 719.2066666666667, 718.1706666666668, 717.3095333333334, 716.4067333333332, 715.4248666666666, 714.5725333333332, 713.4453333333333, 712.3683333333333, 711.4826, 710.7204666666668, 709.8806000000001, 709.3325333333333, 708.8718666666666, 708.5496, 708.1102666666667, 707.4582666666666, 706.8926666666666, 706.2798, 705.3791333333334, 705.4476, 705.7740666666666, 706.1486666666667, 706.3036666666667, 706.5234666666666, 706.6292000000001, 706.8819333333333, 707.1248666666668, 707.3320666666666, 707.5928, 707.8453333333333, 708.4211333333333, 709.1705999999999, 709.8996666666667, 710.6666666666666, 711.2302666666667, 711.9889333333333, 712.5399333333334, 713.1544, 713.7225333333333, 714.4594666666667, 715.3924666666667, 716.2076666666667, 717.1374, 718.0088666666667, 718.9370666666666, 719.8173333333334, 720.6668666666667, 721.4776666666667, 722.1484666666666, 722.9626666666667, 723.825, 724.5948666666667, 725.1979333333334, 725.7890666666667, 726.4764, 726.7627333333334, 727.0022666666667, 727.1893333333334, 727.2854, 727.2257333333333, 727.2512666666667, 727.2946000000001, 727.2204, 727.1857333333334, 727.1790666666667, 727.2536666666667, 727.1805333333333, 726.9724, 726.8367333333333, 726.6618666666667, 726.511, 726.6241333333334, 726.8190666666667, 726.9583333333334, 727.1412, 727.0549333333332, 727.0391333333333, 727.027, 727.0839333333333, 727.1919333333333, 727.2799333333334, 727.3406, 727.3713333333334, 727.3588666666667, 727.3602, 727.3821333333333, 727.4969333333333, 727.5660666666666, 727.8040666666667, 728.1605333333333, 728.4324, 728.7304666666668, 729.1100666666666, 729.6038666666667, 730.0154000000001, 730.4258666666666, 730.9241333333334, 731.8548, 732.7504000000001, 733.5456666666666, 734.6898666666666, 735.7242666666667, 737.0992666666666, 738.5612000000001, 739.9088, 741.2852, 742.7139333333333, 744.2249333333334, 745.8109333333333, 747.5198666666666, 749.7363333333333, 751.8906, 754.1802, 756.1407333333333, 757.7944666666666, 759.5658, 760.9256, 762.9359333333333, 764.8890666666666, 766.9319999999999, 769.0986666666666, 771.2004666666667, 773.2792666666667, 775.2386666666666, 777.0830666666666, 779.0987333333334, 781.2112666666666, 783.4255333333333, 785.5971333333334, 788.031, 790.5964666666666, 793.1608000000001, 795.8554, 798.2740666666667, 800.7723333333332, 803.4788666666667, 806.2216000000001, 809.0412666666667, 811.8882666666667, 814.2220666666667, 816.6908, 818.9452666666667, 821.2594666666666, 823.3988, 826.0948, 828.3673333333332, 830.6465333333334, 832.9740666666667, 835.2756666666666, 837.7154666666667, 840.267, 843.0352, 845.9863333333333, 849.1386000000001, 852.0943333333333, 854.8219333333334, 857.7308, 860.6071333333333, 863.4, 866.1654, 868.663, 870.9137999999999, 872.9948, 874.6382666666666, 876.4912666666667, 878.5440666666668, 880.5963999999999, 882.6835999999998, 884.8726000000001, 887.0862666666667, 889.3096, 891.4119333333334, 893.5675999999999, 896.3456666666667, 899.6217999999999, 902.9262, 906.1343333333333, 909.1446, 912.6520666666667, 916.1734666666666, 919.5065333333334, 922.6982, 926.3482666666666], "ma200": [821.0608, 820.0724500000001, 819.04895, 818.0852, 816.80355, 815.6282500000001, 814.53345, 813.33515, 812.12405, 810.8164499999999, 809.6826000000001, 808.52655, 807.3951000000001, 806.1488, 805.03395, 803.46095, 801.7266999999999, 800.0377500000001, 798.2021, 796.3352, 794.3276, 792.4091000000001, 790.3857, 788.1511, 785.9234, 783.6465499999999, 781.89985, 780.13755, 778.3649, 776.64625, 774.9220000000001, 772.9830000000001, 771.0163500000001, 768.90035, 766.73675, 764.65425, 762.6423, 760.7288000000001, 758.5978499999999, 756.6159, 754.53, 752.54545, 750.65615, 749.41265, 748.1918499999999, 747.2169500000001, 746.0508, 744.9177999999999, 744.30505, 743.8114, 743.2139999999999, 742.6530499999999, 742.09235, 741.1545, 740.4797500000001, 740.11885, 739.7206, 739.168, 738.7702, 738.1195000000001, 737.5520999999999, 736.9716500000001, 736.35685, 735.6952, 734.7678500000001, 733.91335, 733.0127, 732.2328, 731.4395999999999, 730.8215000000001, 730.21625, 729.6047, 729.03145, 728.3901, 727.7597499999999, 727.0230500000001, 726.6946999999999, 726.7041, 726.8023, 727.0287999999999, 727.25945, 727.5095000000001, 727.4611499999999, 727.4582500000001, 727.3489500000001, 727.2592, 727.20125, 727.2611999999999, 727.1308499999999, 727.1640999999998, 727.1802499999999, 727.2253499999999, 726.9067, 726.36905, 725.83425, 725.2664, 724.68205, 724.10575, 723.5691, 722.9603500000001, 722.52405, 721.9951999999998, 721.37295, 720.6766499999999, 719.9223, 719.05775, 718.85375, 718.89095, 718.95355, 718.9488500000001, 718.9849, 719.0893, 719.3240499999999, 719.5460499999999, 719.6983499999999, 719.8928500000001, 720.0352, 720.3635, 720.6777500000001, 721.07855, 721.49505, 721.92875, 722.4716000000001, 722.90285, 723.2686, 723.5412999999999, 723.8795, 724.2796, 724.7233, 725.4114, 726.1109, 726.7658, 727.4944499999999, 728.2029999999999, 729.1751, 730.14485, 731.1463500000001, 732.43295, 733.66065, 734.8923000000001, 736.11955, 737.25465, 738.4449000000001, 739.6576, 740.9380500000001, 742.2521500000001, 743.6963499999999, 745.2817000000001, 746.8499, 748.4544999999999, 749.79005, 751.1316499999999, 752.4830499999999, 753.6356, 754.9536999999999, 756.27105, 757.7408, 759.2708, 760.9364, 762.6817500000001, 764.3047499999999, 765.7908, 767.1303, 768.5079000000001, 770.0879, 771.6552499999999, 773.3724000000001, 775.0682, 776.7328499999999, 778.3155499999999, 779.6846, 781.0883500000001, 782.4008, 783.7544, 785.2870999999999, 786.94845, 788.7183499999999, 790.2544, 791.60435, 793.0078, 794.3728, 795.9124, 797.1046500000001, 798.24185, 799.5424499999999, 800.83815, 802.2781, 803.7972500000001, 805.3522499999999, 807.1383999999999, 809.1219, 810.9482999999999, 812.7301999999999, 814.6425999999999, 816.52, 818.46565, 820.3452000000001, 822.26095, 824.1546500000001, 826.0355999999999, 827.57165, 829.05445, 830.76035, 832.38415, 834.2778, 836.15435, 838.00125, 839.85825, 841.64895, 843.3466000000001, 845.50995, 847.9763499999999, 850.5169999999999, 853.07825, 855.41065, 858.1463500000001, 861.0237, 863.92135, 866.8670500000001, 870.2119], "rs_line": [1.0, 1.0334131038695051, 1.0166613616571514, 1.0355752567682102, 0.9925566019304959, 1.011279461761447, 1.0251213584175773, 1.026002103614575, 1.0333290646380466, 1.0488742966676528, 1.0614672982533466, 1.055489152628323, 1.0573258949853344, 1.0343915870999842, 1.0326799405748712, 1.028646521534916, 1.011020732966655, 0.9919809853376729, 0.9888412276111476, 0.9648474081428261, 0.968968724057548, 0.9652849058614456, 0.9458276924084263, 0.9761580470391933, 0.9945171461757677, 0.9767590137126724, 1.0203558778266544, 1.0085631516976132, 1.0202639451522397, 1.016594980293082, 1.0350404679149876, 0.9838370094551948, 0.9905277383746265, 0.9901593139558396, 0.9866787311858946, 1.0009683414929649, 1.0056917362989524, 1.0018352785605178, 0.994784584687905, 0.978785763481956, 0.9812910351086176, 0.9724020666631733, 0.9921099246450232, 0.987757111920095, 0.991170498686586, 1.016630671411066, 1.0206088575138916, 1.01928414248099, 1.0481373400370102, 1.0602762667112642, 1.0658678230124061, 1.0461336559744583, 1.0254848434093842, 1.025774649899613, 1.0287267905127766, 1.0301622694819925, 1.034686993788533, 1.030250595783313, 1.0427493540987842, 1.0345703055900535, 1.0312755485381369, 1.0181960535903931, 1.0259052422308947, 1.021071903871919, 1.0152364249228005, 1.0270064190943742, 1.023718224186059, 1.0461312801824298, 1.0601818663591116, 1.06202225216453, 1.060678237505944, 1.038275399854695, 1.0477219192358345, 1.0358004784262724, 1.0383832804912039, 1.0369009645932643, 1.0582325171674616, 1.0918269037272847, 1.0937376926429936, 1.062416843976331, 1.0543297711421413, 1.0564844433633007, 1.0424258803166022, 1.0496942149910056, 1.0348560211264615, 1.0302768294020153, 1.042671850737642, 1.0439352958208328, 1.043940874325081, 1.0474146990543427, 1.0516772378800896, 1.0775179230551253, 0.9844530802319638, 0.966092561374932, 0.9533936250825058, 0.9322874972513319, 0.9137617477694044, 0.9207588608503047, 0.9309177241720913, 0.9093203553007234, 0.9335135495417489, 0.9212371781033566, 0.9261988331182716, 0.8952281712513268, 0.9037393283582752, 0.9025196773030896, 0.8944982343960801, 0.889410804807531, 0.918704867483982, 0.923357206524521, 0.9238930663174568, 0.9401164900679628, 0.9543140150465464, 0.9537705832005552, 0.9394890584033695, 0.9465181213313951, 0.9466652522793592, 0.956692855496629, 0.9424886765427986, 0.9528345925888211, 0.956501388316205, 0.9635475846592031, 0.9699226789933707, 0.9582909066691466, 0.937725012570175, 0.9233916998628324, 0.9322945569192855, 0.9454099248406822, 0.9837324587216222, 0.999587373960033, 1.0084037666128411, 0.9905231686289246, 0.9960086009718158, 1.0083724529723432, 1.0688807653301189, 1.0840779684107744, 1.0778272331455554, 1.1411114996602365, 1.143974186726482, 1.169918014984738, 1.1833341528588999, 1.1666955559108327, 1.1753336852699312, 1.171063034945594, 1.181391596397553, 1.183658394566923, 1.2225063878555125, 1.253840302865351, 1.256354171862781, 1.2653022841420032, 1.2201014910296863, 1.1953349403054074, 1.1899850030421628, 1.1677227837021136, 1.2096195716661022, 1.2092787548862967, 1.236543081804288, 1.257080068174833, 1.261852133028985, 1.264491237903013, 1.2437251035899646, 1.2338198839894297, 1.2566655025184839, 1.2424976799623226, 1.2599612921863643, 1.2477323218073033, 1.2688889465333442, 1.2885228871334666, 1.2649400128641153, 1.2716176411347195, 1.2426256913929905, 1.2546949459293697, 1.2506227300790929, 1.2345338632749054, 1.2416591009353424, 1.2193008351666126, 1.2363940665668753, 1.2360831154174583, 1.220672194341648, 1.248082878622696, 1.238982951281915, 1.277569713163656, 1.224583689788314, 1.1946216067659885, 1.2031762398547825, 1.2105473451400528, 1.2474868075103385, 1.2633959617144177, 1.3027042300721365, 1.325142688279231, 1.3588489354152897, 1.3211522283025756, 1.3060439945983224, 1.3340709440608145, 1.325385221901719, 1.325987967408423, 1.3270697510915668, 1.2913267532305839, 1.3016205221397665, 1.2910648974131915, 1.231887055774269, 1.2477954172109014, 1.2638304604062987, 1.2571474864171266, 1.2571819360912335, 1.2571168366811667, 1.265775242859984, 1.2622972254654168, 1.2711320797988546, 1.2778967363682043, 1.387536259613138, 1.4546420612965292, 1.462525449410944, 1.4510491955249452, 1.41085497689605, 1.4949528128935003, 1.501220765787895, 1.4912317930350258, 1.4909994298385294, 1.5668208220580369], "rs_score": 0.619498894639799}], "analyst_panel": [{"ticker": "AMD", "consensus": "Buy", "analyst_count": 69, "target_consensus": 288.56, "target_high": 380.0, "target_low": 200.0}, {"ticker": "AAPL", "consensus": "Buy", "analyst_count": 109, "target_consensus": 299.08, "target_high": 350.0, "target_low": 220.0}, {"ticker": "CSCO", "consensus": "Buy", "analyst_count": 72, "target_consensus": 82.67, "target_high": 91.0, "target_low": 69.0}, {"ticker": "LIN", "consensus": "Buy", "analyst_count": 28, "target_consensus": 500.33, "target_high": 516.0, "target_low": 490.0}, {"ticker": "NVDA", "consensus": "Buy", "analyst_count": 79, "target_consensus": 264.34, "target_high": 352.0, "target_low": 140.0}, {"ticker": "GOOGL", "consensus": "Buy", "analyst_count": 81, "target_consensus": 321.55, "target_high": 390.0, "target_low": 190.0}, {"ticker": "GOOG", "consensus": "Buy", "analyst_count": 79, "target_consensus": 335.83, "target_high": 400.0, "target_low": 275.0}, {"ticker": "META", "consensus": "Buy", "analyst_count": 51, "target_consensus": 853.64, "target_high": 1117.0, "target_low": 718.0}, {"ticker": "MSFT", "consensus": "Buy", "analyst_count": 78, "target_consensus": 642.57, "target_high": 675.0, "target_low": 560.0}, {"ticker": "AMAT", "consensus": "Buy", "analyst_count": 53, "target_consensus": 327.71, "target_high": 400.0, "target_low": 273.0}], "records": [{"ticker": "AMD", "momentum_12_1": 0.788095443190628, "quality_raw": 0.0951, "value_raw": 0.09452618151937896, "composite_score": 0.37913335614184335, "rs_score": 0.7742766958194931, "ma_50": 220.8818, "ma_150": 189.622, "ma_200": 168.0457, "sepa_pass": true, "rank": 1, "action": "BUY"}, {"ticker": "AAPL", "momentum_12_1": 0.17502572016460904, "quality_raw": 1.0155, "value_raw": 0.024022500205415416, "composite_score": 0.3529099831088211, "rs_score": -0.08216035307509584, "ma_50": 271.8, "ma_150": 244.37146666666663, "ma_200": 233.89355, "sepa_pass": false, "rank": 2, "action": "BUY"}, {"ticker": "CSCO", "momentum_12_1": 0.3188943199056127, "quality_raw": 0.22999999999999998, "value_raw": 0.09775157340438317, "composite_score": 0.33676431351413233, "rs_score": 0.07930204441706468, "ma_50": 76.25319999999999, "ma_150": 71.08366666666666, "ma_200": 68.3506, "sepa_pass": false, "rank": 3, "action": "BUY"}, {"ticker": "LIN", "momentum_12_1": -0.024105408504762615, "quality_raw": 0.2295, "value_raw": 0.1099619087429132, "composite_score": 0.3004808827873502, "rs_score": -0.15918841776010906, "ma_50": 419.7618, "ma_150": 451.05233333333325, "ma_200": 451.99244999999996, "sepa_pass": false, "rank": 4, "action": "BUY"}, {"ticker": "NVDA", "momentum_12_1": 0.337962962962963, "quality_raw": 0.853, "value_raw": 0.024126633456409537, "composite_score": 0.21407423047797844, "rs_score": 0.23014358337501561, "ma_50": 184.80579999999998, "ma_150": 178.0998, "ma_200": 163.67565000000002, "sepa_pass": false, "rank": 5, "action": "BUY"}, {"ticker": "GOOGL", "momentum_12_1": 0.6251186333438787, "quality_raw": 0.3295, "value_raw": 0.06402903919249622, "composite_score": 0.1883405690028275, "rs_score": 0.5655858819028958, "ma_50": 308.3118, "ma_150": 246.83226666666664, "ma_200": 225.4986, "sepa_pass": true, "rank": 6, "action": "BUY"}, {"ticker": "GOOG", "momentum_12_1": 0.6190526040303583, "quality_raw": 0.3295, "value_raw": 0.06336250731105852, "composite_score": 0.17505309160458452, "rs_score": 0.5548090549397409, "ma_50": 309.0062, "ma_150": 247.56580000000002, "ma_200": 226.4766, "sepa_pass": true, "rank": 7, "action": "BUY"}, {"ticker": "META", "momentum_12_1": 0.089625578460244, "quality_raw": 0.36350000000000005, "value_raw": 0.07755147518732639, "composite_score": 0.10367678944751772, "rs_score": -0.14434947127055975, "ma_50": 639.5024, "ma_150": 701.7938666666666, "ma_200": 675.5459, "sepa_pass": false, "rank": 8, "action": "BUY"}, {"ticker": "MSFT", "momentum_12_1": 0.1423003825149758, "quality_raw": 0.40549999999999997, "value_raw": 0.06572201422783852, "composite_score": 0.02848214280116308, "rs_score": -0.09041575740967156, "ma_50": 485.92400000000004, "ma_150": 501.8477333333333, "ma_200": 481.87035, "sepa_pass": false, "rank": 9, "action": "BUY"}, {"ticker": "AMAT", "momentum_12_1": 0.5045781744889144, "quality_raw": 0.3195, "value_raw": 0.056827489183746235, "composite_score": -0.003804501820427242, "rs_score": 0.6484615653929449, "ma_50": 258.2126, "ma_150": 213.57453333333333, "ma_200": 198.68505000000002, "sepa_pass": true, "rank": 10, "action": "BUY"}, {"ticker": "ADBE", "momentum_12_1": -0.14916042741876867, "quality_raw": 0.4595, "value_raw": 0.06787007666444826, "composite_score": -0.039850067438592505, "rs_score": -0.4522148629228322, "ma_50": 334.91700000000003, "ma_150": 350.9085333333333, "ma_200": 359.36814999999996, "sepa_pass": false, "rank": 11, "action": "BUY"}, {"ticker": "AMZN", "momentum_12_1": 0.021950771491550336, "quality_raw": 0.177, "value_raw": 0.08427315656231318, "composite_score": -0.1174002598924316, "rs_score": -0.09525467596766757, "ma_50": 233.5716, "ma_150": 227.33353333333332, "ma_200": 218.9884, "sepa_pass": false, "rank": 12, "action": "BUY"}, {"ticker": "QCOM", "momentum_12_1": 0.12367579765561332, "quality_raw": 0.2475, "value_raw": 0.0704765646060991, "composite_score": -0.14851660671576283, "rs_score": -0.17736838798164634, "ma_50": 172.6342, "ma_150": 164.8264, "ma_200": 159.90565, "sepa_pass": false, "rank": 13, "action": "BUY"}, {"ticker": "PEP", "momentum_12_1": 0.04325629527423258, "quality_raw": 0.2705, "value_raw": 0.06926667443418705, "composite_score": -0.18124380604221776, "rs_score": -0.17785136934720325, "ma_50": 145.3918, "ma_150": 143.45873333333336, "ma_200": 141.5461, "sepa_pass": false, "rank": 14, "action": "BUY"}, {"ticker": "TXN", "momentum_12_1": -0.08025839793281653, "quality_raw": 0.3325, "value_raw": 0.06256967670011147, "composite_score": -0.26145426151467216, "rs_score": -0.21166329594044175, "ma_50": 173.3788, "ma_150": 185.10913333333335, "ma_200": 181.7561, "sepa_pass": false, "rank": 15, "action": "BUY"}, {"ticker": "NFLX", "momentum_12_1": 0.13194109126026055, "quality_raw": 0.3555, "value_raw": 0.047645953631097575, "composite_score": -0.3111529705126157, "rs_score": -0.12613531447622028, "ma_50": 100.126, "ma_150": 114.14659999999999, "ma_200": 113.10865, "sepa_pass": false, "rank": 16, "action": "BUY"}, {"ticker": "INTU", "momentum_12_1": 0.04937479961526137, "quality_raw": 0.1885, "value_raw": 0.06509757634069804, "composite_score": -0.3586089596169952, "rs_score": -0.299992689927284, "ma_50": 650.7474000000001, "ma_150": 692.2347333333332, "ma_200": 683.04015, "sepa_pass": false, "rank": 17, "action": "BUY"}, {"ticker": "AVGO", "momentum_12_1": 0.5122830440587451, "quality_raw": 0.314, "value_raw": 0.031593982966663936, "composite_score": -0.36917723562271226, "rs_score": 0.33754112131874625, "ma_50": 358.3914000000001, "ma_150": 327.14300000000003, "ma_200": 297.1488, "sepa_pass": false, "rank": 18, "action": "BUY"}, {"ticker": "COST", "momentum_12_1": -0.06178384919812918, "quality_raw": 0.1698, "value_raw": 0.04679939889876032, "composite_score": -0.7170410039052181, "rs_score": -0.14594138821134806, "ma_50": 897.0008, "ma_150": 935.5766000000001, "ma_200": 950.4989, "sepa_pass": false, "rank": 19, "action": "BUY"}, {"ticker": "ABNB", "momentum_12_1": 0.032993730407523625, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.14984268404765677, "ma_50": 127.1356, "ma_150": 128.11433333333335, "ma_200": 127.34485000000001, "sepa_pass": false, "rank": 20, "action": "BUY"}, {"ticker": "ADI", "momentum_12_1": 0.3064989517819705, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.21837977038169432, "ma_50": 265.627, "ma_150": 247.87306666666666, "ma_200": 236.51824999999997, "sepa_pass": false, "rank": 21, "action": "HOLD"}, {"ticker": "ADP", "momentum_12_1": -0.09167266618670511, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.29698471474520993, "ma_50": 257.8352, "ma_150": 283.87899999999996, "ma_200": 289.7277, "sepa_pass": false, "rank": 22, "action": "HOLD"}, {"ticker": "ADSK", "momentum_12_1": 0.025935092550632755, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.2748156246159108, "ma_50": 294.6444, "ma_150": 301.733, "ma_200": 296.2151, "sepa_pass": false, "rank": 23, "action": "HOLD"}, {"ticker": "AEP", "momentum_12_1": 0.225079365079365, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.07446442646635032, "ma_50": 118.10780000000001, "ma_150": 113.01433333333331, "ma_200": 110.8672, "sepa_pass": false, "rank": 24, "action": "HOLD"}, {"ticker": "ALNY", "momentum_12_1": 0.6277909442434826, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.30471482690510054, "ma_50": 421.1410000000001, "ma_150": 413.70526666666666, "ma_200": 377.16134999999997, "sepa_pass": false, "rank": 25, "action": "HOLD"}, {"ticker": "AMGN", "momentum_12_1": 0.21793335829277405, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.04657700543029564, "ma_50": 329.9602, "ma_150": 303.8013333333334, "ma_200": 298.55870000000004, "sepa_pass": false, "rank": 26, "action": "HOLD"}, {"ticker": "APP", "momentum_12_1": 1.1027437790027719, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.7013769224435946, "ma_50": 637.6604, "ma_150": 535.7149333333333, "ma_200": 481.28950000000003, "sepa_pass": false, "rank": 27, "action": "HOLD"}, {"ticker": "ARM", "momentum_12_1": -0.1120234185349136, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.43856355020577886, "ma_50": 128.8162, "ma_150": 143.62019999999998, "ma_200": 137.19245, "sepa_pass": false, "rank": 28, "action": "HOLD"}, {"ticker": "ASML", "momentum_12_1": 0.47743416316940324, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.619498894639799, "ma_50": 1093.2814, "ma_150": 926.3482666666666, "ma_200": 870.2119, "sepa_pass": true, "rank": 29, "action": "HOLD"}, {"ticker": "AXON", "momentum_12_1": -0.048309761986892075, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.09004522929891068, "ma_50": 575.3398000000001, "ma_150": 692.9241333333333, "ma_200": 683.2527, "sepa_pass": false, "rank": 30, "action": "HOLD"}, {"ticker": "AZN", "momentum_12_1": 0.4006424965580542, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.24878787467690255, "ma_50": 90.74340000000001, "ma_150": 81.67233333333333, "ma_200": 78.70085, "sepa_pass": false, "rank": 31, "action": "HOLD"}, {"ticker": "BKNG", "momentum_12_1": 0.1420625636926347, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.10234287659372265, "ma_50": 5165.1378, "ma_150": 5369.134866666666, "ma_200": 5286.880700000001, "sepa_pass": false, "rank": 32, "action": "HOLD"}, {"ticker": "BKR", "momentum_12_1": 0.040381628577767836, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.035266820518058406, "ma_50": 47.903, "ma_150": 45.43026666666667, "ma_200": 43.4592, "sepa_pass": false, "rank": 33, "action": "HOLD"}, {"ticker": "CCEP", "momentum_12_1": 0.22114490636206652, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.00374406683046824, "ma_50": 90.319, "ma_150": 91.38273333333333, "ma_200": 90.7581, "sepa_pass": false, "rank": 34, "action": "HOLD"}, {"ticker": "CDNS", "momentum_12_1": 0.08239573065026007, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.09932370419319003, "ma_50": 318.70779999999996, "ma_150": 331.21073333333334, "ma_200": 320.51945, "sepa_pass": false, "rank": 35, "action": "HOLD"}, {"ticker": "CEG", "momentum_12_1": 0.23633468342160824, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.008081190527288395, "ma_50": 353.1982, "ma_150": 340.4886, "ma_200": 318.70525, "sepa_pass": false, "rank": 36, "action": "HOLD"}, {"ticker": "CHTR", "momentum_12_1": -0.39495798319327735, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.6270420180358491, "ma_50": 206.2888, "ma_150": 269.9508, "ma_200": 297.63870000000003, "sepa_pass": false, "rank": 37, "action": "HOLD"}, {"ticker": "CMCSA", "momentum_12_1": -0.27350192413413965, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.40975331047266206, "ma_50": 27.361200000000004, "ma_150": 30.945533333333334, "ma_200": 31.83455, "sepa_pass": false, "rank": 38, "action": "HOLD"}, {"ticker": "CPRT", "momentum_12_1": -0.3121664887940234, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.45530298387736734, "ma_50": 39.6994, "ma_150": 44.294466666666665, "ma_200": 47.6658, "sepa_pass": false, "rank": 39, "action": "HOLD"}, {"ticker": "CRWD", "momentum_12_1": 0.40061487185380984, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.11829336056077122, "ma_50": 499.531, "ma_150": 481.3867333333334, "ma_200": 466.04565, "sepa_pass": false, "rank": 40, "action": "HOLD"}, {"ticker": "CSGP", "momentum_12_1": -0.0841833069961212, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.2785262722792686, "ma_50": 66.45859999999999, "ma_150": 78.58666666666667, "ma_200": 78.24065, "sepa_pass": false, "rank": 41, "action": "HOLD"}, {"ticker": "CSX", "momentum_12_1": 0.15681393901680152, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.05959390958327382, "ma_50": 35.721199999999996, "ma_150": 34.812266666666666, "ma_200": 33.49305, "sepa_pass": false, "rank": 42, "action": "HOLD"}, {"ticker": "CTAS", "momentum_12_1": -0.019918868317037708, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.171865165629832, "ma_50": 187.18439999999998, "ma_150": 201.88340000000002, "ma_200": 204.85995, "sepa_pass": false, "rank": 43, "action": "HOLD"}, {"ticker": "CTSH", "momentum_12_1": 0.08915381624983798, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.08989585006186718, "ma_50": 79.9074, "ma_150": 74.65653333333333, "ma_200": 75.05795, "sepa_pass": false, "rank": 44, "action": "HOLD"}, {"ticker": "DASH", "momentum_12_1": 0.34045945786334353, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.051803875405634026, "ma_50": 216.8718, "ma_150": 240.08073333333334, "ma_200": 228.5122, "sepa_pass": false, "rank": 45, "action": "HOLD"}, {"ticker": "DDOG", "momentum_12_1": 0.0207674619143432, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.3205309425732843, "ma_50": 152.6872, "ma_150": 145.06153333333333, "ma_200": 135.4394, "sepa_pass": false, "rank": 46, "action": "HOLD"}, {"ticker": "DXCM", "momentum_12_1": -0.16976127320954904, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.3144539348658042, "ma_50": 64.3986, "ma_150": 72.62606666666667, "ma_200": 73.76150000000001, "sepa_pass": false, "rank": 47, "action": "HOLD"}, {"ticker": "EA", "momentum_12_1": 0.4405643738977072, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.25118400318592715, "ma_50": 203.0154, "ma_150": 182.6688, "ma_200": 173.6106, "sepa_pass": false, "rank": 48, "action": "HOLD"}, {"ticker": "EXC", "momentum_12_1": 0.15690928270042193, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.024734388080565495, "ma_50": 44.5616, "ma_150": 44.54026666666667, "ma_200": 44.63575, "sepa_pass": false, "rank": 49, "action": "HOLD"}, {"ticker": "FANG", "momentum_12_1": -0.1329356145880234, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.34019828087983295, "ma_50": 149.6184, "ma_150": 145.16719999999998, "ma_200": 143.11455, "sepa_pass": false, "rank": 50, "action": "HOLD"}, {"ticker": "FAST", "momentum_12_1": 0.15486845673989702, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.008392974698617772, "ma_50": 41.1434, "ma_150": 44.240333333333325, "ma_200": 43.2542, "sepa_pass": false, "rank": 51, "action": "HOLD"}, {"ticker": "FER", "momentum_12_1": 0.6654320987654321, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.4736884123570031, "ma_50": 65.4328, "ma_150": 59.083933333333334, "ma_200": 56.4502, "sepa_pass": true, "rank": 52, "action": "HOLD"}, {"ticker": "FTNT", "momentum_12_1": -0.118607417018056, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.3638573483458559, "ma_50": 80.98459999999999, "ma_150": 86.88126666666668, "ma_200": 90.27815000000001, "sepa_pass": false, "rank": 53, "action": "HOLD"}, {"ticker": "GEHC", "momentum_12_1": 0.003803637228099399, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.2082835504929661, "ma_50": 80.685, "ma_150": 76.58093333333333, "ma_200": 74.65685, "sepa_pass": false, "rank": 54, "action": "HOLD"}, {"ticker": "GILD", "momentum_12_1": 0.3162637362637364, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.14349983550175938, "ma_50": 123.09480000000002, "ma_150": 117.16779999999999, "ma_200": 114.33825, "sepa_pass": false, "rank": 55, "action": "HOLD"}, {"ticker": "HON", "momentum_12_1": -0.09633867276887875, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.20495441048109064, "ma_50": 196.97580000000002, "ma_150": 209.75686666666667, "ma_200": 210.39700000000002, "sepa_pass": false, "rank": 56, "action": "HOLD"}, {"ticker": "IDXX", "momentum_12_1": 0.6734347753386043, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.5120449091367694, "ma_50": 707.2912, "ma_150": 638.7735333333334, "ma_200": 595.70185, "sepa_pass": true, "rank": 57, "action": "HOLD"}, {"ticker": "INSM", "momentum_12_1": 1.8835847122565523, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.143231844596779, "ma_50": 188.37220000000002, "ma_150": 149.60353333333333, "ma_200": 129.81745, "sepa_pass": false, "rank": 58, "action": "HOLD"}, {"ticker": "INTC", "momentum_12_1": 0.9536458333333333, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.3276390296409535, "ma_50": 38.8428, "ma_150": 31.081066666666665, "ma_200": 28.441550000000003, "sepa_pass": true, "rank": 59, "action": "HOLD"}, {"ticker": "ISRG", "momentum_12_1": 0.038301662707838524, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.18446261327274383, "ma_50": 565.1342, "ma_150": 511.58386666666667, "ma_200": 514.5472, "sepa_pass": false, "rank": 60, "action": "HOLD"}, {"ticker": "KDP", "momentum_12_1": -0.06133590237636477, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.29307387980027966, "ma_50": 27.7792, "ma_150": 29.583266666666667, "ma_200": 30.68225, "sepa_pass": false, "rank": 61, "action": "HOLD"}, {"ticker": "KHC", "momentum_12_1": -0.14663880181121558, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.3443742061653857, "ma_50": 24.433600000000002, "ma_150": 25.855866666666667, "ma_200": 26.44405, "sepa_pass": false, "rank": 62, "action": "HOLD"}, {"ticker": "KLAC", "momentum_12_1": 0.7470125203205658, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.0140924610834048, "ma_50": 1238.6016, "ma_150": 1062.0411333333334, "ma_200": 976.8653499999999, "sepa_pass": true, "rank": 63, "action": "HOLD"}, {"ticker": "LRCX", "momentum_12_1": 1.1889155342392752, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.7082545372348783, "ma_50": 169.94100000000003, "ma_150": 132.83653333333336, "ma_200": 118.59145000000001, "sepa_pass": true, "rank": 64, "action": "HOLD"}, {"ticker": "MAR", "momentum_12_1": 0.11597872879209925, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.010465252335194686, "ma_50": 302.3804, "ma_150": 278.9567333333334, "ma_200": 271.14245, "sepa_pass": false, "rank": 65, "action": "HOLD"}, {"ticker": "MCHP", "momentum_12_1": 0.1810829817158932, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.11986828421198026, "ma_50": 62.4472, "ma_150": 65.59586666666668, "ma_200": 62.0914, "sepa_pass": false, "rank": 66, "action": "HOLD"}, {"ticker": "MDLZ", "momentum_12_1": -0.049737302977233, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.1855250100554855, "ma_50": 55.318200000000004, "ma_150": 61.129066666666674, "ma_200": 62.47815, "sepa_pass": false, "rank": 67, "action": "HOLD"}, {"ticker": "MELI", "momentum_12_1": 0.12154926123824583, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.007846240290223738, "ma_50": 2063.7158, "ma_150": 2259.7414666666664, "ma_200": 2270.53, "sepa_pass": false, "rank": 68, "action": "HOLD"}, {"ticker": "MNST", "momentum_12_1": 0.49401197604790403, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.3660621833335682, "ma_50": 74.2336, "ma_150": 67.366, "ma_200": 65.69109999999999, "sepa_pass": true, "rank": 69, "action": "HOLD"}, {"ticker": "MPWR", "momentum_12_1": 0.6095344658054453, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.5224632252127841, "ma_50": 943.696, "ma_150": 878.0216666666666, "ma_200": 813.5032500000001, "sepa_pass": true, "rank": 70, "action": "HOLD"}, {"ticker": "MRVL", "momentum_12_1": -0.2685763888888889, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.49128458147015763, "ma_50": 86.9826, "ma_150": 80.27746666666667, "ma_200": 75.14775, "sepa_pass": false, "rank": 71, "action": "HOLD"}, {"ticker": "MSTR", "momentum_12_1": -0.5263173276441535, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.6895390787067489, "ma_50": 182.29980000000003, "ma_150": 297.9762, "ma_200": 313.57125, "sepa_pass": false, "rank": 72, "action": "HOLD"}, {"ticker": "MU", "momentum_12_1": 1.4394001643385375, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 2.268552478011263, "ma_50": 263.18379999999996, "ma_150": 184.52453333333332, "ma_200": 160.00695, "sepa_pass": true, "rank": 73, "action": "HOLD"}, {"ticker": "NXPI", "momentum_12_1": 0.10065042966339077, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.05623553713490925, "ma_50": 217.13219999999998, "ma_150": 220.39399999999998, "ma_200": 212.96099999999998, "sepa_pass": false, "rank": 74, "action": "HOLD"}, {"ticker": "ODFL", "momentum_12_1": -0.14246814072541114, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.2184906584830707, "ma_50": 150.86599999999999, "ma_150": 150.62606666666667, "ma_200": 152.8198, "sepa_pass": false, "rank": 75, "action": "HOLD"}, {"ticker": "ORLY", "momentum_12_1": 0.1849545397932495, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.022755373979256532, "ma_50": 95.56559999999999, "ma_150": 97.89646666666667, "ma_200": 96.32879999999999, "sepa_pass": false, "rank": 76, "action": "HOLD"}, {"ticker": "PANW", "momentum_12_1": 0.089693985226873, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.08848830064395696, "ma_50": 193.4914, "ma_150": 196.34946666666667, "ma_200": 192.7795, "sepa_pass": false, "rank": 77, "action": "HOLD"}, {"ticker": "PAYX", "momentum_12_1": -0.1858019899795358, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.4091955856531918, "ma_50": 112.38960000000002, "ma_150": 128.43413333333336, "ma_200": 134.07585, "sepa_pass": false, "rank": 78, "action": "HOLD"}, {"ticker": "PCAR", "momentum_12_1": 0.025045372050816583, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.0826755499113756, "ma_50": 107.8828, "ma_150": 101.06166666666667, "ma_200": 98.8544, "sepa_pass": false, "rank": 79, "action": "HOLD"}, {"ticker": "PDD", "momentum_12_1": 0.12503821461326825, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.09435730175617274, "ma_50": 118.6968, "ma_150": 119.555, "ma_200": 115.96955, "sepa_pass": false, "rank": 80, "action": "HOLD"}, {"ticker": "PLTR", "momentum_12_1": 1.780306478531331, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.4975146175638787, "ma_50": 178.60039999999998, "ma_150": 169.31146666666666, "ma_200": 155.0075, "sepa_pass": false, "rank": 81, "action": "HOLD"}, {"ticker": "PYPL", "momentum_12_1": -0.30328056893782984, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.5381902890101132, "ma_50": 61.162200000000006, "ma_150": 67.42293333333333, "ma_200": 67.4614, "sepa_pass": false, "rank": 82, "action": "SELL"}, {"ticker": "REGN", "momentum_12_1": 0.08938005702954244, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.11513529838023717, "ma_50": 739.1175999999999, "ma_150": 624.1758000000001, "ma_200": 610.016, "sepa_pass": false, "rank": 83, "action": "SELL"}, {"ticker": "ROP", "momentum_12_1": -0.13137128199103165, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.3778701833845609, "ma_50": 443.2824, "ma_150": 499.08673333333337, "ma_200": 515.59875, "sepa_pass": false, "rank": 84, "action": "SELL"}, {"ticker": "ROST", "momentum_12_1": 0.23578326180257503, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.11052976640776313, "ma_50": 176.82960000000003, "ma_150": 155.0713333333333, "ma_200": 151.5942, "sepa_pass": false, "rank": 85, "action": "SELL"}, {"ticker": "SBUX", "momentum_12_1": -0.08241108842806477, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.18677127084971645, "ma_50": 85.7062, "ma_150": 87.499, "ma_200": 86.94630000000001, "sepa_pass": false, "rank": 86, "action": "SELL"}, {"ticker": "SHOP", "momentum_12_1": 0.5731719318964668, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.3658390099578517, "ma_50": 159.7812, "ma_150": 146.11273333333332, "ma_200": 133.97905, "sepa_pass": false, "rank": 87, "action": "SELL"}, {"ticker": "SNPS", "momentum_12_1": -0.07278326127742885, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.15266659615777933, "ma_50": 450.2332, "ma_150": 503.54633333333334, "ma_200": 492.98595, "sepa_pass": false, "rank": 88, "action": "SELL"}, {"ticker": "STX", "momentum_12_1": 2.130329935328291, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 2.322098089160848, "ma_50": 281.60040000000004, "ma_150": 214.82273333333336, "ma_200": 185.14995, "sepa_pass": true, "rank": 89, "action": "SELL"}, {"ticker": "TEAM", "momentum_12_1": -0.35401785714285716, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.667720818843895, "ma_50": 154.8756, "ma_150": 169.7798, "ma_200": 180.0075, "sepa_pass": false, "rank": 90, "action": "SELL"}, {"ticker": "TMUS", "momentum_12_1": -0.08413483985432813, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.29884181201870974, "ma_50": 203.2706, "ma_150": 225.12366666666665, "ma_200": 230.8043, "sepa_pass": false, "rank": 91, "action": "SELL"}, {"ticker": "TRI", "momentum_12_1": -0.14670464845267384, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.38079249524143244, "ma_50": 133.16119999999998, "ma_150": 163.46373333333335, "ma_200": 168.92415, "sepa_pass": false, "rank": 92, "action": "SELL"}, {"ticker": "TSLA", "momentum_12_1": 0.19918760722575435, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.08253354074960062, "ma_50": 443.204, "ma_150": 392.63013333333333, "ma_200": 368.2787, "sepa_pass": false, "rank": 93, "action": "SELL"}, {"ticker": "TTWO", "momentum_12_1": 0.35844025995667383, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.1681906043784973, "ma_50": 246.08720000000002, "ma_150": 243.21020000000004, "ma_200": 237.9157, "sepa_pass": false, "rank": 94, "action": "SELL"}, {"ticker": "VRSK", "momentum_12_1": -0.2020549197411241, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.37711495283250673, "ma_50": 220.11, "ma_150": 252.89446666666666, "ma_200": 265.1512, "sepa_pass": false, "rank": 95, "action": "SELL"}, {"ticker": "VRTX", "momentum_12_1": 0.10700578147014506, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.122807941160193, "ma_50": 444.06140000000005, "ma_150": 428.6038666666667, "ma_200": 437.47360000000003, "sepa_pass": false, "rank": 96, "action": "SELL"}, {"ticker": "WBD", "momentum_12_1": 2.05344295991778, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.739029916931121, "ma_50": 26.231199999999998, "ma_150": 18.548933333333334, "ma_200": 16.15805, "sepa_pass": true, "rank": 97, "action": "SELL"}, {"ticker": "WDAY", "momentum_12_1": -0.12652928504653904, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.4057085295997894, "ma_50": 218.0632, "ma_150": 228.46206666666666, "ma_200": 232.44695, "sepa_pass": false, "rank": 98, "action": "SELL"}, {"ticker": "WDC", "momentum_12_1": 2.62877030162413, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 3.495638045319784, "ma_50": 173.8678, "ma_150": 118.0162, "ma_200": 99.66234999999999, "sepa_pass": true, "rank": 99, "action": "SELL"}, {"ticker": "XEL", "momentum_12_1": 0.18164794007490648, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.01299767447889666, "ma_50": 77.0468, "ma_150": 74.87493333333333, "ma_200": 73.6082, "sepa_pass": false, "rank": 100, "action": "SELL"}, {"ticker": "ZS", "momentum_12_1": 0.2470085007309546, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.048846793449991655, "ma_50": 255.0636, "ma_150": 281.3416, "ma_200": 269.79834999999997, "sepa_pass": false, "rank": 101, "action": "SELL"}]}, {"id": "sp500_top100", "name": "S&P 500 Top 100", "universe_size": 100, "buy_count": 20, "sell_count": 20, "sepa_count": 18, "sepa_candidates": [{"ticker": "GS", "momentum_12_1": 0.5565062201459243, "quality_raw": 0.2535, "value_raw": 0.21985553326875074, "composite_score": 0.702436425675696, "rs_score": 0.5184242902571943, "ma_50": 860.4442, "ma_150": 779.3773333333334, "ma_200": 725.0052499999999, "sepa_pass": true, "rank": 2, "action": "BUY"}, {"ticker": "GOOGL", "momentum_12_1": 0.6251186333438787, "quality_raw": 0.3295, "value_raw": 0.06402903919249622, "composite_score": 0.20134199940525457, "rs_score": 0.5655858819028958, "ma_50": 308.3118, "ma_150": 246.83226666666664, "ma_200": 225.4986, "sepa_pass": true, "rank": 11, "action": "BUY"}, {"ticker": "GOOG", "momentum_12_1": 0.6190526040303583, "quality_raw": 0.3295, "value_raw": 0.06336250731105852, "composite_score": 0.19292090791385777, "rs_score": 0.5548090549397409, "ma_50": 309.0062, "ma_150": 247.56580000000002, "ma_200": 226.4766, "sepa_pass": true, "rank": 12, "action": "BUY"}, {"ticker": "AMD", "momentum_12_1": 0.788095443190628, "quality_raw": 0.0951, "value_raw": 0.09452618151937896, "composite_score": 0.18268794052711645, "rs_score": 0.7742766958194931, "ma_50": 220.8818, "ma_150": 189.622, "ma_200": 168.0457, "sepa_pass": true, "rank": 13, "action": "BUY"}, {"ticker": "GE", "momentum_12_1": 0.7017980323419655, "quality_raw": 0.3135, "value_raw": 0.03928423873539992, "composite_score": 0.14670573167513923, "rs_score": 0.6199738330636229, "ma_50": 304.46659999999997, "ma_150": 286.1451333333333, "ma_200": 267.96305, "sepa_pass": true, "rank": 14, "action": "BUY"}, {"ticker": "RTX", "momentum_12_1": 0.5243157277977737, "quality_raw": 0.11549999999999999, "value_raw": 0.1366630870909524, "composite_score": 0.14418707321920898, "rs_score": 0.4836098451873949, "ma_50": 179.5464, "ma_150": 164.68246666666667, "ma_200": 156.13425, "sepa_pass": true, "rank": 15, "action": "BUY"}, {"ticker": "CAT", "momentum_12_1": 0.5872110234949, "quality_raw": 0.32, "value_raw": 0.051190988442212385, "composite_score": 0.09983312940370344, "rs_score": 0.5527168525724782, "ma_50": 584.4526000000001, "ma_150": 490.19660000000005, "ma_200": 448.8512, "sepa_pass": true, "rank": 17, "action": "BUY"}, {"ticker": "AMAT", "momentum_12_1": 0.5045781744889144, "quality_raw": 0.3195, "value_raw": 0.056827489183746235, "composite_score": 0.04691505190461263, "rs_score": 0.6484615653929449, "ma_50": 258.2126, "ma_150": 213.57453333333333, "ma_200": 198.68505000000002, "sepa_pass": true, "rank": 18, "action": "BUY"}, {"ticker": "APH", "momentum_12_1": 0.8485840330155119, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.0062192677700745, "ma_50": 137.8244, "ma_150": 121.04359999999998, "ma_200": 110.42455, "sepa_pass": true, "rank": 50, "action": "HOLD"}, {"ticker": "C", "momentum_12_1": 0.5346938775510204, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.4090676010695249, "ma_50": 109.57379999999999, "ma_150": 99.1636, "ma_200": 91.96185, "sepa_pass": true, "rank": 59, "action": "HOLD"}, {"ticker": "GEV", "momentum_12_1": 0.782425574216502, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.49105921485520576, "ma_50": 622.397, "ma_150": 601.8785333333333, "ma_200": 550.5402, "sepa_pass": true, "rank": 67, "action": "HOLD"}, {"ticker": "INTC", "momentum_12_1": 0.9536458333333333, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.3276390296409535, "ma_50": 38.8428, "ma_150": 31.081066666666665, "ma_200": 28.441550000000003, "sepa_pass": true, "rank": 70, "action": "HOLD"}, {"ticker": "JNJ", "momentum_12_1": 0.4795854922279792, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.3278635546841313, "ma_50": 203.8932, "ma_150": 183.67506666666668, "ma_200": 176.2321, "sepa_pass": true, "rank": 72, "action": "HOLD"}, {"ticker": "KLAC", "momentum_12_1": 0.7470125203205658, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.0140924610834048, "ma_50": 1238.6016, "ma_150": 1062.0411333333334, "ma_200": 976.8653499999999, "sepa_pass": true, "rank": 74, "action": "HOLD"}, {"ticker": "LRCX", "momentum_12_1": 1.1889155342392752, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.7082545372348783, "ma_50": 169.94100000000003, "ma_150": 132.83653333333336, "ma_200": 118.59145000000001, "sepa_pass": true, "rank": 77, "action": "HOLD"}, {"ticker": "MS", "momentum_12_1": 0.42665703739367666, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.34547725785472316, "ma_50": 173.97299999999998, "ma_150": 157.30393333333333, "ma_200": 147.97070000000002, "sepa_pass": true, "rank": 79, "action": "HOLD"}, {"ticker": "MU", "momentum_12_1": 1.4394001643385375, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 2.268552478011263, "ma_50": 263.18379999999996, "ma_150": 184.52453333333332, "ma_200": 160.00695, "sepa_pass": true, "rank": 80, "action": "HOLD"}, {"ticker": "NEM", "momentum_12_1": 1.4823207171314743, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.6548468649663188, "ma_50": 95.9446, "ma_150": 80.2424, "ma_200": 73.24535, "sepa_pass": true, "rank": 82, "action": "SELL"}], "sepa_charts": [{"ticker": "GS", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [581.14, 593.07, 567.67, 559.67, 531.66, 531.43, 535.71, 524.81, 541.41, 551.34, 551.78, 557.34, 562.68, 565.14, 580.1, 585.94, 573.92, 558.92, 543.12, 546.29, 548.45, 563.1, 511.23, 470.81, 465.51, 462.22, 516.87, 489.8, 494.44, 503.98, 507.89, 499.05, 509.49, 501.36, 519.99, 529.18, 545.37, 544.86, 546.4, 548.92, 547.55, 553.83, 566.1, 559.56, 549.36, 551.92, 565.7, 567.1, 591.34, 603.81, 611.6, 615.9, 619.03, 612.3, 606.52, 593.46, 598.23, 598.54, 615.73, 608.44, 604.86, 600.45, 598.72, 603.83, 599.21, 605.88, 614.0, 613.52, 614.87, 624.17, 625.11, 613.54, 627.85, 624.64, 635.24, 640.8, 646.88, 662.11, 669.87, 687.16, 690.81, 707.75, 706.46, 715.89, 723.68, 710.93, 697.28, 696.56, 709.12, 704.95, 713.3, 702.51, 708.82, 705.84, 708.26, 706.0, 700.41, 717.52, 719.18, 728.98, 723.65, 731.98, 730.75, 723.59, 709.57, 726.03, 720.91, 724.74, 719.74, 721.27, 719.24, 743.38, 744.69, 747.2, 730.72, 730.96, 721.38, 720.68, 715.95, 741.89, 738.79, 748.95, 749.67, 751.22, 745.25, 730.85, 730.56, 748.9, 738.21, 741.85, 763.92, 769.58, 784.73, 780.06, 786.76, 785.53, 794.22, 804.31, 805.0, 805.56, 806.32, 792.43, 794.76, 802.51, 804.12, 796.35, 785.51, 779.38, 789.98, 796.78, 789.65, 776.51, 779.96, 764.36, 786.78, 770.76, 767.93, 758.09, 750.77, 763.32, 758.98, 744.6, 750.78, 783.88, 789.99, 792.09, 783.06, 790.16, 789.37, 785.52, 790.83, 793.09, 787.58, 786.34, 797.2, 810.31, 838.97, 805.5, 790.91, 775.56, 776.3, 785.99, 773.7, 774.03, 790.71, 802.32, 816.01, 826.04, 810.86, 815.21, 836.57, 837.83, 854.56, 866.69, 876.58, 889.24, 911.03, 887.96, 889.59, 879.15, 872.33, 876.3, 893.48, 899.0, 901.71, 910.78, 907.04, 892.18, 884.42, 879.0, 914.34, 948.44, 955.47, 941.02, 934.83, 938.98, 949.55, 938.15, 932.67, 975.86], "ma50": [613.3996000000001, 614.2560000000001, 614.5296, 614.4010000000001, 613.6186, 612.5914, 611.681, 610.6536, 610.0107999999999, 609.5852, 609.1214, 608.6656, 608.2514, 607.9518, 607.9534, 608.4722, 608.6916, 608.4394, 607.1834, 605.8494, 604.2995999999999, 602.8668, 600.4368, 597.063, 593.6351999999999, 590.214, 587.7954, 584.8438, 581.8186, 579.0902000000001, 576.6006000000001, 573.898, 571.1788, 568.0416, 565.3234, 562.8964, 560.859, 558.7762, 556.7252000000001, 554.4926, 551.9997999999999, 549.7134000000001, 548.1902, 546.8694, 545.3338, 544.0740000000001, 543.0326, 542.2146, 541.5956, 541.5666, 542.1758, 542.6324, 543.6596, 544.7121999999999, 546.2094, 547.45, 548.7004000000001, 550.175, 551.6614, 552.8034, 553.865, 554.7272, 555.448, 556.2218, 556.604, 557.0028000000001, 557.8044, 558.8964000000001, 560.3314, 561.889, 563.4222, 564.431, 566.7633999999999, 569.84, 573.2346, 576.8062, 579.4064, 582.8526, 586.3612, 590.0247999999999, 593.6831999999999, 597.8572, 601.7966, 606.0872, 610.161, 613.7959999999999, 616.8342, 619.8682, 623.1226, 626.2432, 629.5581999999999, 632.5318, 635.3862, 638.3118, 641.4898, 644.5714, 647.2656, 650.274, 652.8308000000001, 655.3342, 657.5752, 659.8968, 662.1311999999999, 664.357, 666.418, 669.0694, 671.523, 674.047, 676.1272, 678.3838000000001, 680.6714, 683.53, 686.4494, 689.3168, 691.947, 694.4486, 696.5962000000001, 698.7394, 700.7610000000001, 703.1153999999999, 705.3889999999999, 708.0972, 710.5336, 713.0651999999999, 715.2653999999999, 717.0664, 718.74, 720.4758, 721.8426, 722.9364, 724.3986, 725.6352, 727.2006000000001, 728.4839999999999, 729.7456, 731.2376, 733.1764, 735.3314, 737.2489999999999, 739.2611999999999, 741.1216, 742.92, 744.6388000000001, 746.5722000000001, 748.4893999999999, 750.2964, 751.9984, 753.2356, 754.6516, 756.0075999999999, 757.3276, 758.2182, 759.2024, 760.0178, 761.562, 762.4566, 763.3969999999999, 764.064, 764.6846, 765.5255999999999, 766.3204, 766.3448000000001, 766.4666000000001, 767.2002, 768.3856, 769.6082000000001, 770.8417999999999, 772.2314, 773.6998, 774.5724, 775.6131999999999, 776.4960000000001, 777.2542, 777.9566, 778.9956000000001, 780.5848, 782.753, 783.885, 784.939, 785.6132000000001, 785.8608, 786.189, 785.9684, 785.8478, 785.9268, 786.2625999999999, 786.6984, 787.133, 787.2502000000001, 787.4432, 788.0482000000001, 788.9562000000001, 790.1522, 791.4358, 792.885, 794.7428, 797.2532000000001, 799.4248, 801.4169999999999, 803.0644, 804.7180000000001, 806.7138, 808.9842, 811.677, 813.9756, 816.776, 819.5581999999999, 822.24, 824.913, 827.2266000000001, 830.3338, 834.4105999999999, 838.5044, 841.6472, 844.5440000000001, 847.4817999999999, 850.8116, 853.7714, 856.6374000000001, 860.4442], "ma150": [555.8738666666667, 556.5428666666667, 556.9562000000001, 557.2938, 557.5040666666666, 557.9093333333333, 558.4206, 558.7845333333333, 559.2405333333332, 559.6776666666667, 560.0878, 560.5667333333333, 561.0383333333333, 561.4812666666667, 562.0218, 562.5663333333333, 563.0279333333333, 563.4384666666666, 563.7495333333334, 564.0731333333333, 564.3333333333334, 564.7015333333333, 564.728, 564.5111999999999, 564.2139333333334, 563.8937333333334, 564.0898, 564.0842, 564.1279333333332, 564.2904, 564.4192, 564.6320000000001, 564.8874666666667, 565.0694666666667, 565.3428, 565.6362666666666, 566.0361333333333, 566.4380000000001, 566.7218, 567.0584, 567.3926666666666, 567.7647333333334, 568.2644666666666, 568.6820666666667, 569.0210666666667, 569.3998, 569.9033333333333, 570.4040666666667, 571.1056666666667, 571.83, 572.6098666666667, 573.4054, 574.1644, 574.8882666666667, 575.4897333333333, 575.9611333333334, 576.4667999999999, 576.9246666666667, 577.5028666666666, 578.0358, 578.6162, 579.1638666666666, 579.7073333333334, 580.2362, 580.8136, 581.3622666666666, 581.9603999999999, 582.5545333333334, 583.2017333333333, 583.9005333333333, 584.6581333333334, 585.2353333333333, 585.4478, 585.7309333333334, 586.0374666666667, 586.2938666666666, 586.6558, 587.1084, 587.6501333333333, 588.2742666666667, 588.9597333333334, 589.8022, 590.6324, 591.4309333333333, 592.2369333333334, 592.9562666666667, 593.5681333333333, 594.1756666666666, 594.846, 595.5342666666667, 596.2757333333334, 596.9677333333334, 597.7145333333334, 598.4222666666666, 599.1831999999999, 599.9896666666666, 600.7086666666667, 601.5480666666667, 602.4394, 603.3904, 604.3835333333333, 605.5950666666666, 606.7734666666666, 607.8234, 608.7486666666667, 609.7036, 610.6348, 611.6252, 612.5998, 613.5908000000001, 614.5526, 615.6409333333334, 616.7162666666667, 617.8301333333334, 618.8348, 619.9745333333334, 621.0307333333334, 622.0250666666667, 622.7586, 623.6179333333333, 624.3702666666667, 625.1316666666667, 625.9112666666667, 626.6560666666667, 627.3784, 628.0288666666667, 628.6472666666666, 629.3907333333333, 630.0074666666667, 630.6838, 631.5608, 632.4634666666667, 633.392, 634.2042666666666, 635.0766666666667, 635.9766666666667, 636.9565333333334, 637.9919333333333, 639.0322666666666, 639.999, 640.8932000000001, 641.7217333333333, 642.7384, 643.9177999999999, 645.1043333333333, 646.3139333333334, 647.4322, 648.5747333333334, 649.6926666666666, 650.9694666666667, 652.3595333333333, 653.5824666666666, 654.9977333333333, 656.3623333333333, 658.0631333333332, 659.6586666666667, 661.2067999999999, 662.762, 664.1577333333333, 665.5709333333333, 666.9522666666667, 668.2006666666667, 669.4546666666666, 670.9129333333333, 672.3122, 673.6865333333333, 675.0808, 676.6224, 678.2640666666666, 679.8589333333333, 681.4748, 683.0080666666667, 684.8504, 686.9539333333333, 689.1652, 691.4857999999999, 693.6331333333334, 695.7378, 697.7142666666667, 699.5248, 701.3141999999999, 703.2271333333333, 704.9885333333333, 706.8063333333333, 708.6111333333333, 710.4320666666666, 712.2363333333333, 714.1108666666667, 715.8739333333333, 717.6492000000001, 719.5759999999999, 721.4693333333333, 723.3924, 725.4399333333332, 727.6214, 729.8702, 732.1724, 734.3114666666667, 736.2998, 738.1354, 739.8736, 741.6096, 743.4392666666666, 745.3506, 747.3185333333334, 749.4340000000001, 751.4927333333334, 753.4503333333333, 755.2416000000001, 757.0453333333334, 759.1085333333333, 761.4284666666667, 763.8068000000001, 766.0547333333333, 768.2922, 770.5128666666667, 772.7498666666667, 774.9140666666667, 777.0327333333333, 779.3773333333334], "ma200": [533.4737, 534.1086, 534.62435, 535.0841, 535.4277000000001, 535.7328, 536.09945, 536.43275, 536.8339, 537.29155, 537.7646, 538.30015, 538.83095, 539.38175, 540.0057499999999, 540.62705, 541.20615, 541.7262, 542.1740500000001, 542.68415, 543.1829, 543.76665, 544.0904999999999, 544.1936499999999, 544.23405, 544.2549, 544.58835, 544.7269, 544.9122, 545.1528, 545.46245, 545.6961, 545.92525, 546.104, 546.36435, 546.6864999999999, 547.08925, 547.4494, 547.78695, 548.1354, 548.47375, 548.78175, 549.0971499999999, 549.3840500000001, 549.6998, 550.03475, 550.42805, 550.8027999999999, 551.326, 551.8865000000001, 552.44935, 553.06525, 553.63205, 554.1484, 554.6804, 555.2945, 555.99055, 556.63215, 557.34575, 557.9591, 558.5321, 559.10685, 559.64075, 560.1664, 560.66735, 561.17545, 561.72205, 562.30295, 562.895, 563.5271, 564.10555, 564.6339, 565.23685, 565.8434, 566.4691, 567.12185, 567.91895, 568.7763, 569.68625, 570.7239999999999, 571.7352000000001, 572.9383, 574.11475, 575.3239, 576.54735, 577.6762, 578.73565, 579.79555, 580.822, 581.8546, 582.93405, 583.9565, 585.0449000000001, 586.0895, 587.13825, 588.1927, 589.2438999999999, 590.3715500000001, 591.53695, 592.70605, 593.8512000000001, 595.02825, 596.1561, 597.25545, 598.2218, 599.2382, 600.23085, 601.20525, 602.15895, 603.1228, 604.13, 605.2554, 606.3928500000001, 607.50635, 608.59695, 609.63385, 610.6193499999999, 611.6007500000001, 612.59155, 613.70425, 614.84085, 615.9508000000001, 616.71925, 617.5645000000001, 618.34445, 618.987, 619.67685, 620.45025, 621.1982499999999, 621.9398, 622.81945, 623.76045, 624.77445, 625.6942, 626.6141, 627.5266, 628.4702000000001, 629.4646, 630.4467500000001, 631.466, 632.4872, 633.4558000000001, 634.4456, 635.45975, 636.5097499999999, 637.56635, 638.5311, 639.46995, 640.4924500000001, 641.5447, 642.6195499999999, 643.75085, 644.8807, 645.872, 646.952, 647.89185, 648.82535, 649.7349, 650.621, 651.5745000000001, 652.49455, 653.3169, 654.15385, 655.17265, 656.2225, 657.3829499999999, 658.4835, 659.5766500000001, 660.4938999999999, 661.35655, 662.181, 662.9727500000001, 663.747, 664.4812, 665.2827000000001, 666.16785, 667.1736999999999, 668.0143, 668.74035, 669.41615, 670.1358, 670.89485, 671.5361, 672.11515, 672.7891999999999, 673.5481500000001, 674.3919999999999, 675.2772, 676.08675, 676.8600499999999, 677.6819499999999, 678.53035, 679.59185, 680.7973000000001, 682.0495, 683.4211499999999, 684.88745, 686.2872500000001, 687.62375, 688.9932000000001, 690.4491499999999, 691.8652999999999, 693.4943499999999, 695.1909999999999, 697.04125, 698.938, 700.7946500000002, 702.6315000000001, 704.34655, 705.98485, 707.79765, 709.7531499999999, 711.7171, 713.5965000000001, 715.37015, 717.13535, 719.0134999999999, 720.9096499999999, 722.8574000000001, 725.0052499999999], "rs_line": [1.0, 1.00967677001132, 0.9838997124592525, 0.9646272451028295, 0.9414256877122947, 0.9489065080042531, 0.9514996053420027, 0.944733345063673, 0.9548917127983928, 0.9649642459175425, 0.9762864631294688, 0.9754999436889636, 0.9877026204660896, 0.9946768278204299, 1.0030442785465803, 1.0107125582903247, 1.0019401925923201, 0.9783516375566021, 0.9702336159033167, 0.9693892713259851, 0.9704810532545954, 0.9901382796301677, 0.9455279962536964, 0.9249179904316828, 0.9161378243167615, 0.9241375808387821, 0.9351889065692381, 0.926822799183337, 0.919201654048932, 0.9279349136379014, 0.937760596225965, 0.9423859134710988, 0.9607296411573194, 0.9684509350572313, 0.9789670168571893, 0.9810665959576669, 0.9902384168997188, 0.9822155967611713, 0.9846162373699425, 0.9829652456558515, 0.9801229573978472, 0.9843879414004192, 0.9914792277382245, 0.9856771541435491, 0.9758662391637657, 0.9763079398878118, 0.9937594468671828, 0.9974898151438506, 1.0068523965877962, 1.0213397846070753, 1.0331960501999806, 1.0354029034110261, 1.0341146859906862, 1.0217542435114093, 1.015523455337698, 1.0106874124786267, 1.0184090534498647, 1.0259395484059066, 1.0339089069947773, 1.027612917520723, 1.017549879031352, 1.0112621270180884, 1.002700352967067, 1.0055241522288976, 0.9980986314468796, 1.0141097613879455, 1.0172547176517706, 1.0155441679804342, 1.012040830615754, 1.0302865025369827, 1.0277534877367833, 1.0201363138321844, 1.034091040973953, 1.0376711289698615, 1.0554391444265974, 1.070338247906128, 1.0699255782238952, 1.0831498555317811, 1.0952307916438326, 1.1147779434062104, 1.1151588014271012, 1.1370681205580895, 1.1353631327183606, 1.145326115775459, 1.1487354342774716, 1.1369693209265246, 1.1157504724916143, 1.107954284502108, 1.124760232116847, 1.1220906318331592, 1.1332191601520292, 1.1208668949437506, 1.1271661560247284, 1.115600288390818, 1.1202456773975453, 1.1145576709248655, 1.1055745256067158, 1.1230279936494663, 1.1252535516328825, 1.1357890171833414, 1.1277678233681558, 1.1437664709624416, 1.1432842844154116, 1.136344891953853, 1.1328960533484194, 1.1418206015965289, 1.1395458653486856, 1.1368918261423573, 1.1299948341946027, 1.1236353396568404, 1.122692974488702, 1.148150942489781, 1.1462504943407172, 1.1500069704015043, 1.127282058988004, 1.1278977156457777, 1.11918718930735, 1.121079925052076, 1.1182080822009373, 1.141197413386379, 1.1414524161746598, 1.152325170655091, 1.1508108260038985, 1.1491206757770083, 1.1468279311495067, 1.133064817353208, 1.1265099984602212, 1.145218873769981, 1.1321506789194462, 1.134945050977528, 1.1660139552617084, 1.1712671847431206, 1.184481537211783, 1.177826603024493, 1.1816520293266481, 1.1814313658316309, 1.1959869853998835, 1.20554825877212, 1.2039646046685637, 1.199129002176129, 1.206829792278173, 1.1898258721674366, 1.1988552906696939, 1.2036500053742223, 1.202684711265979, 1.186593734333246, 1.1664669739630027, 1.156032388724013, 1.171772579511288, 1.1776356025955965, 1.1714406359549538, 1.1451191220711139, 1.1535486673487627, 1.1618795978654672, 1.177885942636315, 1.155313833647586, 1.145984218377947, 1.139057266455666, 1.1216916315730248, 1.1287029263013977, 1.122302191017959, 1.106792668659033, 1.1094001272068232, 1.1489211567752304, 1.144375480541712, 1.1443780574239055, 1.1307887699710875, 1.1537304947773923, 1.1488086392456336, 1.1410641482969281, 1.1625580057835867, 1.161853985210651, 1.166295599853611, 1.163313912593442, 1.1612596176166379, 1.1776606161736631, 1.218635495165153, 1.1897619571769658, 1.1684030756753505, 1.156501162513244, 1.1674080094421295, 1.177431317062228, 1.1769601818194, 1.1658488946590948, 1.173697234467521, 1.1798332580891657, 1.1917376137140865, 1.1998366262277727, 1.1831892486623878, 1.187337480605254, 1.2142432266725456, 1.2151836242456007, 1.2370988448336664, 1.258439465017436, 1.2738992346792661, 1.283783315806161, 1.312187725382906, 1.2928601288388515, 1.297193184899622, 1.2854820593490843, 1.2897012716748977, 1.2858607113530884, 1.3031335569873022, 1.303066474399195, 1.3010481059377563, 1.309528456662702, 1.3042832935816262, 1.2875034409173713, 1.2778655229935294, 1.2795141810703723, 1.3285215057738107, 1.3689508757029432, 1.3709445099824251, 1.3545774867476181, 1.3458037325605365, 1.3428970674054181, 1.355884575165405, 1.3422902120109346, 1.3410409636720375, 1.399331088167003], "rs_score": 0.5184242902571943}, {"ticker": "GOOGL", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [170.92, 173.02, 172.35, 173.86, 165.87, 164.04, 167.11, 162.76, 165.49, 164.29, 160.67, 163.89, 162.8, 163.99, 167.68, 170.56, 165.06, 162.24, 154.33, 154.64, 157.07, 157.04, 150.72, 145.6, 146.75, 144.7, 158.71, 152.82, 157.14, 159.07, 156.31, 153.33, 151.16, 147.67, 151.47, 155.35, 159.28, 161.96, 160.61, 160.16, 158.8, 161.3, 164.03, 164.21, 163.23, 151.38, 154.28, 152.75, 158.46, 159.53, 165.37, 163.96, 166.19, 166.54, 163.98, 168.56, 170.87, 168.47, 172.9, 172.36, 171.86, 171.74, 169.03, 166.18, 168.05, 168.21, 173.68, 176.09, 178.6, 177.35, 175.7, 174.67, 176.77, 175.95, 173.32, 166.64, 165.19, 166.77, 170.68, 173.54, 178.53, 176.23, 175.84, 178.64, 179.53, 176.79, 174.36, 176.62, 177.62, 180.19, 181.56, 182.0, 182.97, 183.58, 185.06, 190.1, 191.34, 190.23, 192.17, 193.18, 192.58, 195.75, 196.53, 191.9, 189.13, 195.04, 194.67, 196.09, 196.52, 201.42, 201.0, 203.34, 201.96, 202.94, 203.9, 203.5, 201.57, 199.32, 199.75, 206.09, 208.49, 207.14, 207.48, 211.64, 212.91, 211.35, 230.66, 232.3, 235.0, 234.04, 239.63, 239.17, 240.37, 240.8, 251.61, 251.16, 249.53, 252.03, 254.72, 252.53, 251.66, 247.14, 245.79, 246.54, 244.05, 243.1, 244.9, 245.69, 245.35, 250.43, 245.76, 244.62, 241.53, 236.57, 244.15, 245.45, 251.03, 251.46, 253.3, 256.55, 250.46, 251.69, 253.08, 259.92, 269.27, 267.47, 274.57, 281.48, 281.19, 283.72, 277.54, 284.31, 284.75, 278.83, 290.1, 291.31, 286.71, 278.57, 276.41, 285.02, 284.28, 292.81, 289.45, 299.66, 318.58, 323.44, 319.95, 320.18, 314.89, 315.81, 319.63, 317.62, 321.27, 313.72, 317.08, 320.21, 312.43, 309.29, 308.22, 306.57, 296.72, 302.46, 307.16, 309.78, 314.35, 314.09, 313.51, 313.56, 313.85, 313.0, 315.15, 316.54, 314.34, 321.98, 325.44, 328.57, 331.86, 335.97, 335.84, 332.78], "ma50": [189.49400000000003, 189.1864, 188.8632, 188.5122, 187.937, 187.2956, 186.72580000000002, 186.12580000000003, 185.6108, 185.11059999999998, 184.5354, 183.9774, 183.296, 182.666, 182.1406, 181.71099999999998, 181.19199999999998, 180.6436, 179.81920000000002, 179.05380000000002, 178.2752, 177.455, 176.502, 175.45440000000002, 174.3852, 173.44299999999998, 172.7112, 171.8594, 170.9848, 170.08579999999998, 169.18740000000003, 168.1264, 167.32299999999998, 166.44439999999997, 165.767, 165.1446, 164.62380000000002, 164.19080000000002, 163.6802, 163.17880000000002, 162.67940000000002, 162.2, 161.7894, 161.4804, 161.16, 160.6792, 160.3102, 159.9952, 159.75879999999998, 159.6092, 159.49820000000003, 159.317, 159.19379999999998, 159.0474, 159.00959999999998, 159.1, 159.17520000000002, 159.2894, 159.4376, 159.59900000000002, 159.8228, 159.97979999999998, 160.1044, 160.1482, 160.1556, 160.1086, 160.281, 160.55800000000002, 161.0434, 161.4976, 161.8702, 162.2228, 162.7438, 163.35080000000002, 163.8822, 164.321, 164.45059999999998, 164.7296, 165.0004, 165.28979999999999, 165.73420000000002, 166.19219999999999, 166.68579999999997, 167.3052, 167.8664, 168.2952, 168.5968, 168.89, 169.2302, 169.6308, 170.086, 170.5, 170.8788, 171.2662, 171.7028, 172.4772, 173.2184, 173.968, 174.64219999999997, 175.3152, 175.8594, 176.4952, 177.102, 177.6092, 178.11219999999997, 178.6418, 179.1178, 179.6702, 180.14260000000002, 180.7238, 181.3066, 181.93859999999998, 182.59720000000002, 183.3324, 184.0494, 184.7552, 185.313, 185.77759999999998, 186.20059999999998, 186.77540000000002, 187.4312, 188.0806, 188.6948, 189.4086, 190.2004, 191.09459999999999, 192.40400000000002, 193.7146, 195.00099999999998, 196.21099999999998, 197.433, 198.6918, 199.9824, 201.2256, 202.6672, 204.1546, 205.658, 207.1662, 208.7082, 210.155, 211.55699999999996, 212.8598, 214.1162, 215.3754, 216.5552, 217.61520000000002, 218.6864, 219.7956, 220.85920000000002, 222.00420000000003, 223.06779999999998, 224.0452, 224.9452, 225.8386, 226.93900000000002, 227.9472, 229.0744, 230.1818, 231.3174, 232.42, 233.40919999999997, 234.37620000000004, 235.39860000000002, 236.5382, 237.84560000000002, 239.125, 240.585, 242.2282, 243.857, 245.40959999999998, 246.7906, 248.33399999999997, 249.87939999999998, 251.2232, 252.767, 254.3662, 255.4872, 256.4126, 257.24080000000004, 258.2604, 259.1534, 260.2262, 261.20779999999996, 262.385, 263.7244, 265.17, 266.5784, 267.94140000000004, 269.1448, 270.4104, 271.76980000000003, 273.1794, 274.689, 276.0326, 277.4932, 279.0354, 280.386, 281.658, 282.91540000000003, 284.0382, 285.05740000000003, 286.2142, 287.5268, 288.991, 290.395, 291.76779999999997, 293.0174, 294.25939999999997, 295.4704, 296.5994, 297.8932, 299.1902, 300.41540000000003, 301.6566, 302.78, 304.002, 305.14779999999996, 306.23760000000004, 307.3306, 308.3118], "ma150": [174.79013333333333, 174.8134, 174.82713333333334, 174.8426, 174.81, 174.79253333333335, 174.84493333333333, 174.87473333333332, 174.91840000000002, 174.93346666666667, 174.91346666666666, 174.92413333333332, 174.91506666666666, 174.9392, 174.98173333333335, 175.0324, 175.02166666666668, 174.98873333333333, 174.91193333333334, 174.85086666666666, 174.79386666666664, 174.73306666666667, 174.64, 174.525, 174.4248, 174.30026666666666, 174.30926666666667, 174.28506666666667, 174.2844, 174.33873333333332, 174.3894, 174.42053333333334, 174.42053333333334, 174.37373333333332, 174.3338, 174.31573333333333, 174.31546666666668, 174.3298, 174.3196, 174.29673333333335, 174.2764, 174.2698, 174.28673333333333, 174.2966, 174.2918, 174.19533333333334, 174.1106, 174.0232, 173.97386666666665, 173.92366666666666, 173.9396, 173.9368, 173.96566666666666, 173.99540000000002, 174.00033333333332, 174.02433333333335, 174.06040000000002, 174.08246666666668, 174.14893333333333, 174.20853333333332, 174.26046666666667, 174.30446666666668, 174.34613333333334, 174.3692, 174.38773333333333, 174.39766666666665, 174.42433333333332, 174.43519999999998, 174.48513333333332, 174.52553333333336, 174.5686, 174.60146666666665, 174.6032, 174.5712, 174.53766666666667, 174.44626666666665, 174.3367333333333, 174.25599999999997, 174.22333333333333, 174.23033333333333, 174.25186666666667, 174.23926666666665, 174.23833333333334, 174.31173333333334, 174.4102, 174.47113333333334, 174.5060666666667, 174.55533333333332, 174.61313333333334, 174.67113333333333, 174.73926666666665, 174.79013333333333, 174.859, 174.91813333333332, 174.98273333333333, 175.0156, 174.98853333333332, 174.977, 174.99266666666668, 174.96946666666668, 174.9505333333333, 174.99953333333335, 175.053, 175.05626666666666, 175.0196, 175.01246666666668, 175.00626666666665, 175.02846666666667, 175.06366666666665, 175.1444666666667, 175.22160000000002, 175.2986, 175.33253333333334, 175.38219999999998, 175.44853333333336, 175.52493333333334, 175.59533333333331, 175.65973333333332, 175.68773333333334, 175.7756, 175.85886666666664, 175.9194666666667, 175.98020000000002, 176.07126666666667, 176.15593333333334, 176.2862, 176.52193333333332, 176.76786666666663, 176.9954, 177.19553333333332, 177.45153333333334, 177.67013333333333, 177.99706666666668, 178.3250666666667, 178.7668666666667, 179.19813333333335, 179.6262, 180.0823333333333, 180.53953333333334, 180.9882, 181.4408, 181.85326666666668, 182.26146666666665, 182.7073333333333, 183.13933333333333, 183.59053333333335, 184.07166666666666, 184.5862666666667, 185.0867333333333, 185.64286666666666, 186.1418, 186.61913333333334, 187.08033333333333, 187.49839999999998, 188.02026666666669, 188.56300000000002, 189.12246666666667, 189.7138, 190.29919999999998, 190.9142666666667, 191.51286666666667, 192.0982, 192.7000666666667, 193.3396, 194.01686666666666, 194.66293333333334, 195.393, 196.18793333333332, 197.03366666666668, 197.8942, 198.69733333333335, 199.54579999999999, 200.4393333333333, 201.32753333333335, 202.2832, 203.2606, 204.11393333333334, 204.95226666666667, 205.7474, 206.5870666666667, 207.4402, 208.37006666666665, 209.292, 210.30526666666668, 211.41933333333333, 212.53993333333335, 213.61106666666666, 214.6658666666667, 215.6944, 216.73206666666664, 217.80426666666665, 218.8464, 219.8946666666667, 220.8914, 221.91706666666664, 223.0426, 224.09693333333334, 225.14053333333334, 226.1389333333333, 227.11919999999998, 227.9948666666667, 228.9182, 229.85800000000003, 230.81293333333335, 231.81539999999998, 232.7856, 233.7365333333333, 234.7038, 235.64346666666668, 236.5810666666667, 237.53633333333332, 238.50166666666667, 239.47040000000004, 240.50906666666668, 241.55833333333334, 242.6274, 243.68193333333335, 244.74779999999998, 245.79606666666663, 246.83226666666664], "ma200": [175.78710000000004, 175.78965, 175.7805, 175.7695, 175.71425, 175.64520000000002, 175.59885000000003, 175.54489999999998, 175.49740000000003, 175.43684999999996, 175.3607, 175.31959999999998, 175.27109999999996, 175.2252, 175.19465, 175.1704, 175.11204999999998, 175.05095, 174.94754999999998, 174.83765, 174.73405, 174.64344999999997, 174.5131, 174.3549, 174.2132, 174.0552, 173.9506, 173.8186, 173.68415000000002, 173.56009999999998, 173.41459999999998, 173.2705, 173.11135000000002, 172.92350000000002, 172.75175000000002, 172.5755, 172.42675, 172.29165, 172.1388, 172.01175000000003, 171.8804, 171.75424999999998, 171.6548, 171.57075, 171.49845000000002, 171.36705, 171.2301, 171.08489999999998, 171.01405, 170.97529999999998, 170.96715, 170.9393, 170.9188, 170.8938, 170.85989999999998, 170.8694, 170.9275, 170.9784, 171.0482, 171.09985, 171.1408, 171.18805, 171.21239999999997, 171.24145000000001, 171.2752, 171.30145000000002, 171.3365, 171.38105, 171.44480000000004, 171.51255, 171.56294999999997, 171.6055, 171.66595, 171.73145, 171.78915, 171.80544999999998, 171.84459999999999, 171.8962, 171.9634, 172.07649999999998, 172.2256, 172.36345, 172.48684999999998, 172.6066, 172.71695, 172.81060000000002, 172.88580000000002, 172.96985, 173.04725000000002, 173.13025, 173.2288, 173.32735, 173.43475, 173.539, 173.64455, 173.7658, 173.88754999999998, 174.0094, 174.14094999999998, 174.27155, 174.41955000000002, 174.5764, 174.74974999999998, 174.89885, 175.02829999999997, 175.1787, 175.32475, 175.47940000000003, 175.64735000000002, 175.83735000000001, 176.02200000000002, 176.213, 176.4089, 176.61, 176.80315000000002, 176.98705, 177.1465, 177.2708, 177.41400000000002, 177.588, 177.78425, 177.97125, 178.1261, 178.28055, 178.45335000000003, 178.60835, 178.85354999999998, 179.12064999999998, 179.41775, 179.72549999999998, 180.04715, 180.3524, 180.67435, 181.0402, 181.47445, 181.892, 182.29405, 182.70804999999996, 183.1369, 183.5421, 183.94369999999998, 184.30755000000002, 184.6733, 185.03244999999998, 185.37584999999999, 185.66550000000004, 185.91299999999998, 186.18165000000002, 186.4593, 186.72815, 186.97985, 187.26095, 187.52605, 187.75185000000002, 187.99945, 188.24615000000003, 188.52329999999998, 188.8168, 189.12709999999998, 189.46335000000002, 189.76850000000002, 190.06799999999998, 190.34904999999998, 190.6712, 191.04780000000002, 191.42495000000002, 191.84275000000002, 192.30184999999997, 192.73005, 193.1841, 193.5918, 194.0231, 194.455, 194.85925000000003, 195.3087, 195.8062, 196.26324999999997, 196.67905, 197.05675, 197.46175, 197.87699999999998, 198.30915000000002, 198.79975, 199.34005000000002, 200.00625, 200.6911, 201.36425000000003, 202.04710000000003, 202.69085000000004, 203.34375, 204.02305, 204.6848, 205.36835, 206.03865, 206.7278, 207.45175, 208.15025000000003, 208.85420000000002, 209.5439, 210.2417, 210.8707, 211.5179, 212.19195, 212.87154999999998, 213.61395000000002, 214.36419999999998, 215.09619999999998, 215.8502, 216.59199999999998, 217.33555, 218.10795, 218.8712, 219.62890000000004, 220.41885, 221.20765, 221.9977, 222.8317, 223.70035, 224.6079, 225.4986], "rs_line": [1.0, 1.0015222471653846, 1.0156733631898103, 1.018861275880589, 0.9986373082701272, 0.995898328421807, 1.009181273899741, 0.9961912177502313, 0.9924016829014344, 0.9776665010131604, 0.9665715128731917, 0.975320551457749, 0.97164364084594, 0.9813664443306116, 0.9857944976637679, 1.0003214636443147, 0.9797610379619266, 0.9655864182832008, 0.9373866477436436, 0.933006531675223, 0.944998564699879, 0.9388765570078784, 0.9478002777720728, 0.9725385119193274, 0.9819690371229379, 0.9836584212344727, 0.9763604914428061, 0.9832093684710064, 0.9932803252939144, 0.9958189333480393, 0.981289080573404, 0.9844637892017295, 0.9691484241404805, 0.9698578848315622, 0.9695887738650744, 0.9792514185569345, 0.9833263083096816, 0.9926989283180861, 0.9840491030169937, 0.9751491651624649, 0.966485096563211, 0.9747922333908585, 0.9767909669767034, 0.9835026063589606, 0.9858733447404348, 0.9104730079079566, 0.9214942010097341, 0.9135197194329285, 0.91735215956018, 0.9174875891268196, 0.9498605960675675, 0.937184223141237, 0.9439517193388968, 0.9449060634947982, 0.9335199409311694, 0.976040440177493, 0.9890261341085038, 0.9818362285732294, 0.987131113798249, 0.9897742877256068, 0.9830226718044995, 0.9834363053119847, 0.9624963214910764, 0.9409021478948448, 0.9517454500404297, 0.9572779204504603, 0.978360785024414, 0.9910433918762447, 0.9995029260902544, 0.9953462786013301, 0.9821824262219464, 0.9874645891129726, 0.9899182337769526, 0.99381854826513, 0.9791109905735883, 0.9463802833600758, 0.9289695615724746, 0.9276074171827923, 0.9488239441612393, 0.957233687946858, 0.9798896954331027, 0.9626631145679851, 0.9608437528162931, 0.9717386184811809, 0.9689432978415278, 0.9613189110616788, 0.948625109829891, 0.9551928768783067, 0.9578995493882071, 0.9751876482144562, 0.9807306401253636, 0.9873265247826007, 0.9892811869278388, 0.9865420520169118, 0.9952243756075879, 1.0203938818347051, 1.0269028040509622, 1.0123331623344891, 1.0223186085493097, 1.0233686253050376, 1.0204464056736402, 1.0399867398596023, 1.0454473082320452, 1.0246616152028558, 1.0266989685153434, 1.042929330597557, 1.0462553064150881, 1.0458761122497309, 1.0490482386530153, 1.0668859540950488, 1.0667707886901394, 1.067821886752417, 1.0569568578007835, 1.0619868775804793, 1.069514585320844, 1.0676487689685423, 1.0632916750571282, 1.0542239281597754, 1.0607538248399317, 1.0778692083555248, 1.0952415662243968, 1.0836126845434126, 1.0829238815183364, 1.1007384441850487, 1.1139872542476486, 1.1140806733363435, 1.2093147040749634, 1.2078187324021417, 1.2254061469643382, 1.2174095625632053, 1.2436121046310036, 1.2376469949066906, 1.2336051908401915, 1.2362255582227522, 1.2848816184670144, 1.2843520413590623, 1.2776040681056078, 1.2844028368729565, 1.2952952409812715, 1.2781118969681036, 1.2806801193041526, 1.2616922246227567, 1.2606161237078404, 1.2572598473089862, 1.2410738447820309, 1.2316034878173447, 1.2365093337876762, 1.2390707648913648, 1.2373745570664298, 1.258481225624933, 1.239609022788649, 1.2265449272472637, 1.2145700214348878, 1.222674145491896, 1.24278081598438, 1.25092630998259, 1.2737098688967217, 1.284640433629536, 1.2867365702364097, 1.2898313048906405, 1.259231966541383, 1.2720292195287672, 1.271514236429095, 1.2952936191321076, 1.326242086096835, 1.3138868139911828, 1.34811647262877, 1.3974129330297913, 1.3914090780549249, 1.4012984748285997, 1.3872187948033923, 1.4161494835280142, 1.4337240678498469, 1.402535741896054, 1.4368043942627355, 1.4395018621128481, 1.415983255666242, 1.3989969334177994, 1.3883765212844226, 1.445086661286918, 1.4535409589312025, 1.491393863397753, 1.49709931713738, 1.534620982488504, 1.6078489368873965, 1.6171661013547525, 1.5887485429053936, 1.581259407322659, 1.5622663966064523, 1.5639340726492554, 1.577389054205842, 1.5663244516743304, 1.5813204921414843, 1.5488117510830897, 1.566751984780585, 1.5717935879224447, 1.5300439509206432, 1.5311294264845996, 1.528141137453832, 1.5241249697744066, 1.4915678881207182, 1.5090267831523405, 1.5231989677930737, 1.5266804347565555, 1.5421542616178372, 1.5354774735894863, 1.5327974696146769, 1.5385246386746823, 1.5418304408900616, 1.5491320922255503, 1.556919169789904, 1.5534400044897152, 1.533523215232611, 1.5758750529691192, 1.592971124774679, 1.5977255346099, 1.6111934059073454, 1.6344156972515929, 1.641853271451545, 1.6224752036341814], "rs_score": 0.5655858819028958}, {"ticker": "GOOG", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [172.61, 174.99, 174.21, 175.75, 167.81, 165.98, 169.0, 164.73, 167.62, 166.57, 162.67, 166.28, 165.05, 166.25, 169.93, 172.79, 167.14, 164.08, 156.06, 156.23, 158.88, 158.86, 152.63, 147.74, 149.24, 146.58, 161.06, 155.37, 159.4, 161.47, 158.68, 155.5, 153.36, 149.86, 153.9, 157.72, 161.47, 163.85, 162.42, 162.06, 160.89, 162.79, 165.81, 166.05, 165.2, 152.8, 155.75, 154.38, 159.58, 160.89, 166.81, 165.4, 167.43, 167.87, 165.32, 170.06, 171.98, 169.59, 173.98, 173.38, 172.96, 172.85, 170.37, 167.71, 169.39, 169.81, 174.92, 177.63, 180.01, 178.79, 176.97, 175.88, 177.94, 177.23, 173.98, 167.73, 166.01, 167.74, 171.49, 174.43, 178.27, 177.39, 176.91, 179.76, 180.55, 177.56, 175.16, 177.66, 178.7, 181.31, 182.81, 183.1, 183.77, 184.7, 185.94, 191.15, 192.11, 191.51, 193.2, 194.08, 193.42, 196.43, 197.44, 192.86, 189.95, 195.75, 195.32, 196.92, 197.28, 202.09, 201.63, 204.16, 203.03, 203.82, 204.91, 204.29, 202.49, 200.19, 200.62, 206.72, 209.16, 207.95, 208.21, 212.37, 213.53, 211.99, 231.1, 232.66, 235.17, 234.16, 239.94, 239.56, 240.78, 241.38, 251.76, 251.42, 249.85, 252.33, 255.24, 252.88, 252.34, 247.83, 246.57, 247.18, 244.36, 243.55, 245.54, 246.43, 246.45, 251.51, 247.13, 245.46, 242.21, 237.49, 244.64, 246.19, 251.71, 251.88, 253.79, 257.02, 251.34, 252.53, 253.73, 260.51, 269.93, 268.43, 275.17, 281.9, 281.82, 284.12, 278.06, 284.75, 285.34, 279.7, 290.59, 291.74, 287.43, 279.12, 276.98, 285.6, 284.96, 292.99, 289.98, 299.65, 318.47, 323.64, 320.28, 320.12, 315.12, 316.02, 320.62, 318.39, 322.09, 314.45, 317.75, 321.0, 313.7, 310.52, 309.32, 307.73, 298.06, 303.75, 308.61, 311.33, 315.68, 315.67, 314.96, 314.39, 314.55, 313.8, 315.32, 317.32, 314.55, 322.43, 326.01, 329.14, 332.73, 336.43, 336.31, 333.16], "ma50": [191.0992, 190.796, 190.4862, 190.142, 189.5784, 188.9466, 188.38459999999998, 187.79840000000002, 187.297, 186.81959999999998, 186.26039999999998, 185.7234, 185.0652, 184.456, 183.9468, 183.53920000000002, 183.03619999999998, 182.4968, 181.6784, 180.91480000000004, 180.1414, 179.32600000000002, 178.378, 177.3412, 176.28799999999998, 175.34419999999997, 174.62400000000002, 173.78779999999998, 172.9232, 172.0406, 171.16140000000004, 170.11720000000003, 169.3184, 168.4494, 167.78459999999998, 167.175, 166.66299999999998, 166.2314, 165.72220000000002, 165.226, 164.7278, 164.24099999999999, 163.8244, 163.5138, 163.194, 162.7026, 162.3236, 162.007, 161.7542, 161.5988, 161.4828, 161.291, 161.1554, 160.99779999999998, 160.948, 161.0296, 161.0892, 161.18640000000002, 161.3136, 161.44979999999998, 161.6556, 161.787, 161.8934, 161.9226, 161.9118, 161.8522, 162.0078, 162.27880000000002, 162.75779999999997, 163.209, 163.5708, 163.91119999999998, 164.41740000000001, 165.0072, 165.502, 165.925, 166.024, 166.2714, 166.51319999999998, 166.77239999999998, 167.16420000000002, 167.602, 168.07299999999998, 168.671, 169.20399999999998, 169.60080000000002, 169.87460000000002, 170.1508, 170.47639999999998, 170.8614, 171.2998, 171.70600000000002, 172.06519999999998, 172.4382, 172.85299999999998, 173.62, 174.34720000000002, 175.08980000000003, 175.76219999999998, 176.426, 176.9582, 177.5788, 178.179, 178.67879999999997, 179.1714, 179.6852, 180.15200000000002, 180.6986, 181.16459999999998, 181.7388, 182.31220000000002, 182.9384, 183.5916, 184.31380000000001, 185.02419999999998, 185.71380000000002, 186.2652, 186.7164, 187.1286, 187.68719999999996, 188.331, 188.97240000000002, 189.5778, 190.28060000000002, 191.0716, 191.95680000000002, 193.2586, 194.55700000000002, 195.8306, 197.0252, 198.25859999999997, 199.502, 200.77939999999998, 202.0118, 203.43600000000004, 204.9132, 206.40699999999998, 207.90039999999996, 209.43120000000002, 210.8626, 212.2532, 213.5478, 214.80380000000002, 216.0534, 217.2218, 218.2698, 219.3384, 220.43679999999998, 221.5018, 222.65040000000002, 223.72459999999998, 224.7052, 225.6006, 226.4932, 227.58700000000002, 228.59579999999997, 229.7236, 230.8228, 231.953, 233.0516, 234.0458, 235.01319999999998, 236.02719999999997, 237.16099999999997, 238.4614, 239.74419999999998, 241.1978, 242.832, 244.456, 246.00400000000002, 247.382, 248.918, 250.4606, 251.80720000000002, 253.3484, 254.9434, 256.07, 256.9992, 257.8354, 258.8642, 259.76460000000003, 260.8332, 261.8172, 262.9826, 264.3168, 265.7612, 267.1698, 268.5256, 269.7232, 270.986, 272.3516, 273.76279999999997, 275.2732, 276.6186, 278.08639999999997, 279.6354, 280.99859999999995, 282.2804, 283.5378, 284.6622, 285.68080000000003, 286.8466, 288.1746, 289.65139999999997, 291.07219999999995, 292.4618, 293.7268, 294.97700000000003, 296.1922, 297.32779999999997, 298.6074, 299.90319999999997, 301.11960000000005, 302.358, 303.4796, 304.6938, 305.845, 306.9356, 308.0254, 309.0062], "ma150": [176.33566666666667, 176.3614, 176.37706666666668, 176.3944, 176.36346666666668, 176.34733333333332, 176.40306666666666, 176.431, 176.4768, 176.495, 176.47686666666667, 176.4924, 176.48653333333334, 176.51466666666667, 176.55973333333333, 176.6134, 176.605, 176.57246666666666, 176.49533333333332, 176.4336, 176.37660000000002, 176.31613333333334, 176.22446666666664, 176.11273333333332, 176.01833333333335, 175.8948, 175.91113333333334, 175.89486666666667, 175.90019999999998, 175.96246666666667, 176.02339999999998, 176.06, 176.06806666666665, 176.0302, 176.00039999999998, 175.99193333333335, 175.99986666666666, 176.02013333333335, 176.01466666666667, 175.99746666666667, 175.98293333333334, 175.97726666666668, 175.99606666666668, 176.0108666666667, 176.01026666666667, 175.91433333333333, 175.82986666666667, 175.74366666666666, 175.69279999999998, 175.64166666666668, 175.65779999999998, 175.65580000000003, 175.68493333333333, 175.71620000000001, 175.72153333333333, 175.74626666666668, 175.78013333333334, 175.79913333333334, 175.86226666666667, 175.9178, 175.96553333333335, 176.00573333333332, 176.045, 176.0662, 176.0822, 176.09199999999998, 176.11720000000003, 176.12713333333332, 176.17593333333332, 176.21686666666665, 176.25880000000004, 176.2886, 176.286, 176.25233333333335, 176.21313333333333, 176.1182, 176.00279999999998, 175.9178, 175.87873333333334, 175.88233333333332, 175.89213333333333, 175.8775333333333, 175.87473333333335, 175.94486666666666, 176.03806666666665, 176.09226666666666, 176.12253333333334, 176.16813333333334, 176.22286666666668, 176.27839999999998, 176.34366666666665, 176.39039999999997, 176.45346666666666, 176.5082, 176.56713333333335, 176.59793333333332, 176.56726666666665, 176.5531333333333, 176.56526666666667, 176.53806666666668, 176.5134, 176.55526666666668, 176.60686666666666, 176.6062, 176.56593333333333, 176.5538, 176.54193333333333, 176.56113333333334, 176.59173333333334, 176.6694, 176.74273333333332, 176.81626666666668, 176.8500666666667, 176.89746666666667, 176.96093333333332, 177.0350666666667, 177.10306666666665, 177.16400000000002, 177.18826666666666, 177.27033333333335, 177.34773333333334, 177.4032, 177.45773333333332, 177.543, 177.62053333333333, 177.742, 177.96886666666666, 178.2054, 178.42233333333334, 178.61273333333332, 178.8614, 179.07373333333334, 179.39026666666666, 179.71073333333334, 180.14153333333334, 180.56300000000002, 180.98153333333332, 181.42753333333334, 181.8766, 182.31666666666666, 182.76026666666667, 183.16493333333332, 183.56446666666668, 184.00179999999997, 184.42293333333333, 184.86413333333334, 185.3364, 185.84453333333335, 186.3394, 186.89173333333332, 187.38853333333333, 187.85833333333332, 188.31166666666667, 188.72326666666666, 189.23546666666667, 189.77020000000002, 190.32160000000002, 190.9026, 191.47706666666664, 192.08006666666665, 192.6712, 193.24620000000002, 193.8374, 194.4658, 195.13246666666666, 195.77006666666665, 196.49026666666666, 197.27573333333333, 198.1141333333333, 198.9667333333333, 199.76126666666667, 200.60053333333332, 201.48526666666666, 202.365, 203.30733333333336, 204.27506666666665, 205.1175333333333, 205.94253333333333, 206.7264, 207.55393333333333, 208.39579999999998, 209.3124, 210.2232, 211.2218, 212.31893333333335, 213.42506666666665, 214.4838, 215.5256, 216.54359999999997, 217.57, 218.63486666666668, 219.6722, 220.71406666666667, 221.70340000000002, 222.72040000000004, 223.84173333333334, 224.89473333333333, 225.93566666666672, 226.93393333333336, 227.91286666666667, 228.78786666666662, 229.7102, 230.6514, 231.6078, 232.6102, 233.58093333333332, 234.5341333333333, 235.4994666666667, 236.4366, 237.37273333333334, 238.32180000000002, 239.28493333333333, 240.24613333333332, 241.2776, 242.32173333333336, 243.38393333333332, 244.436, 245.4946666666667, 246.53666666666666, 247.56580000000002], "ma200": [177.3255, 177.33105, 177.32495, 177.31724999999997, 177.264, 177.19619999999998, 177.1512, 177.09955000000002, 177.05599999999998, 176.99875, 176.92510000000001, 176.8887, 176.84414999999998, 176.80329999999998, 176.7773, 176.7559, 176.69984999999997, 176.6405, 176.53764999999999, 176.42785, 176.32444999999998, 176.23504999999997, 176.10635000000002, 175.95115, 175.81509999999997, 175.65945, 175.56345, 175.43635000000003, 175.30545, 175.18595000000002, 175.04505, 174.90545000000003, 174.7498, 174.56605, 174.39860000000002, 174.22740000000002, 174.08235000000002, 173.9494, 173.7982, 173.672, 173.54255, 173.41555, 173.31709999999998, 173.23425000000003, 173.16415, 173.0312, 172.89320000000004, 172.7471, 172.67315000000002, 172.6318, 172.62245, 172.59380000000002, 172.57165, 172.54524999999998, 172.50959999999998, 172.5179, 172.5746, 172.61985, 172.68599999999998, 172.73370000000003, 172.77155, 172.81605, 172.83825000000002, 172.86665000000002, 172.89775, 172.92309999999998, 172.9557, 172.99905, 173.06095000000002, 173.12744999999998, 173.17515, 173.21490000000003, 173.27270000000001, 173.33635, 173.38925, 173.40235, 173.43935000000002, 173.489, 173.55344999999997, 173.66494999999998, 173.8086, 173.94549999999998, 174.0693, 174.1904, 174.3013, 174.39415, 174.46855, 174.5528, 174.63009999999997, 174.71345000000002, 174.81215, 174.90945, 175.01335000000003, 175.1177, 175.22095000000002, 175.34074999999996, 175.45919999999998, 175.5802, 175.71015000000003, 175.83774999999997, 175.9829, 176.13655, 176.30845000000002, 176.45685, 176.58399999999997, 176.731, 176.87310000000002, 177.024, 177.18785, 177.37305, 177.5522, 177.7389, 177.93164999999996, 178.1281, 178.3177, 178.49745, 178.65419999999997, 178.77445, 178.9141, 179.08445, 179.27685000000002, 179.45954999999998, 179.60895, 179.7594, 179.92774999999997, 180.07785, 180.31675000000004, 180.5776, 180.86669999999998, 181.16805, 181.48375, 181.78365000000002, 182.1009, 182.4616, 182.88755, 183.2975, 183.69365000000002, 184.10119999999998, 184.52495000000002, 184.92445, 185.32104999999999, 185.67974999999998, 186.04104999999998, 186.3945, 186.7308, 187.0159, 187.26005, 187.52405000000002, 187.7994, 188.06615000000002, 188.31619999999998, 188.59274999999997, 188.8553, 189.07795000000002, 189.32120000000003, 189.5643, 189.83734999999996, 190.12654999999998, 190.43205, 190.76495, 191.06850000000003, 191.3655, 191.64434999999997, 191.96335, 192.33605, 192.71235000000001, 193.12675, 193.581, 194.0052, 194.45375, 194.8563, 195.28189999999998, 195.70845, 196.10905, 196.5525, 197.04235, 197.49415000000002, 197.90384999999998, 198.27560000000003, 198.6756, 199.08720000000002, 199.51359999999997, 199.997, 200.5287, 201.18535, 201.86255, 202.5286, 203.20205, 203.83825000000002, 204.484, 205.1581, 205.81439999999998, 206.49165000000002, 207.15599999999998, 207.83880000000002, 208.55695, 209.25195, 209.9535, 210.639, 211.33435, 211.9616, 212.6054, 213.27740000000003, 213.95530000000002, 214.69465, 215.44310000000002, 216.1729, 216.9212, 217.65585000000002, 218.392, 219.15524999999997, 219.91044999999997, 220.65795000000003, 221.43885000000003, 222.21925000000002, 223.00100000000003, 223.82895, 224.6907, 225.59195000000003, 226.4766], "rs_line": [1.0, 1.003008136168886, 1.016582870412665, 1.019853160749407, 1.0004254037923002, 0.9978101896585073, 1.010602527949618, 0.9983772072256459, 0.9953332310048609, 0.9815294219862624, 0.969021908089805, 0.9798551233074241, 0.9754276729052205, 0.9851501410275207, 0.9892410128884254, 1.0034781866121523, 0.9823938919566549, 0.9669762105426711, 0.9386138127774636, 0.9333707943072664, 0.9465293124479317, 0.9404586351369144, 0.9504139058523524, 0.9771707518503222, 0.9888532747667251, 0.9866825151108879, 0.9811163926110829, 0.989828399255112, 0.9977008287653639, 1.0009465222789256, 0.9864142248835803, 0.9886212375071571, 0.9736266259958725, 0.9746046651281045, 0.9754982721554762, 0.984456774142242, 0.9870864458669709, 0.9944504811957814, 0.9853956152695362, 0.9770566823054655, 0.9696179498226922, 0.9741646087616079, 0.9777233806467304, 0.9847856818378495, 0.9880026708560561, 0.9100156476709866, 0.9211661344163993, 0.9142283316939894, 0.914790884541429, 0.9162496385636216, 0.9487508093000464, 0.9361587396921363, 0.9416838078522447, 0.9431268251612408, 0.9319337617490374, 0.9750848208931009, 0.9857046932079057, 0.978686615392161, 0.9835718839637055, 0.9858835320851078, 0.9796283275780793, 0.9801015903851533, 0.9606282229089227, 0.9402678695763396, 0.949941786578121, 0.9569217477454423, 0.9756984760442324, 0.9899225650393416, 0.9975304896156778, 0.9936036088124741, 0.9795959483573531, 0.9845700006123349, 0.9867139760692027, 0.9912472509736465, 0.9732165894569236, 0.9432441173725952, 0.9244403902017754, 0.9238678498309084, 0.9439929124393428, 0.9527226573859112, 0.9688826561422118, 0.9595123208637805, 0.9572258313470016, 0.968257218909025, 0.9649076653994797, 0.9560527564369776, 0.9436471310801288, 0.9514101582338728, 0.9542882738831531, 0.9716418138370778, 0.9778144478753359, 0.9835686835361137, 0.9838783611633894, 0.9828428069696122, 0.9901664451824058, 1.0159842209176784, 1.0209405972948369, 1.0091665428203072, 1.0177350453485374, 1.0180700268603669, 1.014862787908907, 1.0333817310120772, 1.0400048594272582, 1.0197050889615018, 1.021054521007657, 1.0364775397504098, 1.039470795246777, 1.0400196766730239, 1.0427944097126365, 1.0599543496831971, 1.0596370605003047, 1.0616309902303993, 1.0521533567943937, 1.0561490755437513, 1.0642889931106714, 1.061299672218158, 1.0576866670724887, 1.0484586378065224, 1.0549429546752698, 1.070578640116588, 1.0880034012756117, 1.0771990569530063, 1.0760939944594785, 1.0937208230503452, 1.1062925647415038, 1.1065134431751389, 1.1997587414115645, 1.1978466054311483, 1.2142861541605328, 1.2061081727869813, 1.2330291360022407, 1.2275277652661774, 1.2236107009506971, 1.2270703155701481, 1.2730600211886474, 1.273093672370539, 1.2667176000411977, 1.273341331126619, 1.2852315892448698, 1.2673521708410038, 1.2715677535020995, 1.2528272549632196, 1.2522349325756097, 1.248181995289288, 1.2304836832906911, 1.221802520671792, 1.2276025925880294, 1.2306346485556343, 1.2307529164280675, 1.2515337806144495, 1.234314784913458, 1.2187065921316969, 1.2060643416780321, 1.215411434878285, 1.2330827200113452, 1.242413124064594, 1.2646556509805391, 1.2741873588979498, 1.2766030912430557, 1.2795425871647352, 1.2512840426326237, 1.2637787165561087, 1.2622987505979775, 1.285523020730795, 1.3164759249406432, 1.305692349393672, 1.33783436370881, 1.3857957446964222, 1.3808728885014032, 1.3895348251532118, 1.3762103835721802, 1.4044543490917647, 1.4226282599128004, 1.3931370322222563, 1.4251399524739294, 1.4275119352244494, 1.4056406350472808, 1.38803464572619, 1.3776181384910686, 1.4338499030385634, 1.4427523855745745, 1.4776996706833236, 1.4851558678878487, 1.5195450156966623, 1.591556990161854, 1.602322846074072, 1.574815940674202, 1.5654841027612898, 1.548100396724346, 1.549651582789924, 1.5667829232722725, 1.554748823397821, 1.5698346061397224, 1.5372162237605396, 1.5546903211519383, 1.560244233501692, 1.5212221054797257, 1.522167810815849, 1.518579679044974, 1.514913001090725, 1.4836341909871118, 1.5006251414871203, 1.5154056564057379, 1.5192969560431706, 1.5335161468393277, 1.528092280383805, 1.5248099249732252, 1.5274937965546866, 1.5301397731205442, 1.5378854365843355, 1.5425072146668115, 1.5420209147421513, 1.519523171870232, 1.5626267669062026, 1.580137302698058, 1.584827011791208, 1.5996009689600887, 1.620629248051958, 1.6280533565711426, 1.608424337015259], "rs_score": 0.5548090549397409}, {"ticker": "AMD", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [100.75, 101.67, 98.85, 100.31, 96.63, 96.76, 100.79, 98.11, 100.97, 104.59, 103.51, 106.23, 107.14, 106.44, 113.85, 114.81, 110.19, 106.65, 103.22, 102.74, 102.78, 102.96, 93.8, 85.76, 83.64, 78.21, 96.84, 88.7, 93.4, 94.5, 95.29, 88.29, 87.5, 85.56, 86.26, 90.39, 94.47, 96.65, 96.39, 96.06, 97.35, 96.65, 98.8, 100.59, 98.62, 100.36, 101.7, 102.84, 108.12, 112.46, 117.72, 114.99, 117.17, 114.74, 113.51, 112.06, 110.71, 110.31, 114.56, 112.86, 113.03, 110.73, 114.63, 117.31, 118.58, 115.69, 116.19, 121.73, 123.24, 121.14, 118.5, 116.16, 126.39, 127.1, 126.79, 128.24, 129.58, 138.43, 143.4, 143.68, 143.81, 141.9, 136.11, 138.52, 137.91, 134.8, 137.82, 138.41, 144.16, 146.42, 146.24, 155.61, 160.08, 160.41, 156.99, 157.0, 154.72, 158.65, 162.12, 166.47, 173.66, 177.44, 179.51, 176.31, 171.7, 176.78, 174.31, 163.12, 172.4, 172.76, 172.28, 174.95, 184.42, 180.95, 177.51, 176.14, 166.55, 165.2, 163.71, 167.76, 163.36, 166.62, 167.13, 168.58, 162.63, 162.32, 162.13, 161.79, 151.14, 151.41, 155.82, 159.54, 155.67, 158.57, 161.16, 160.46, 159.16, 157.92, 157.39, 159.79, 160.9, 160.88, 161.27, 159.46, 161.36, 161.79, 164.01, 169.73, 164.67, 203.71, 211.51, 235.56, 232.89, 214.9, 216.42, 218.09, 238.6, 234.56, 233.08, 240.56, 238.03, 230.23, 234.99, 252.92, 259.67, 258.01, 264.33, 254.84, 256.12, 259.65, 250.05, 256.33, 237.7, 233.54, 243.98, 237.52, 258.89, 247.96, 246.81, 240.52, 230.29, 223.55, 206.02, 203.78, 215.05, 206.13, 214.24, 217.53, 219.76, 215.24, 217.6, 215.98, 217.97, 221.11, 221.62, 221.42, 221.43, 210.78, 207.58, 209.17, 198.11, 201.06, 213.43, 214.95, 214.9, 215.04, 214.99, 215.61, 215.34, 214.16, 223.47, 221.08, 214.35, 210.02, 204.68, 203.17, 207.69, 220.97, 223.6, 227.92], "ma50": [116.04, 115.6452, 115.2446, 114.8666, 114.3072, 113.7166, 113.2312, 112.68959999999998, 112.2602, 111.93620000000001, 111.59380000000002, 111.211, 110.76280000000001, 110.345, 110.18520000000001, 110.16059999999999, 110.01800000000001, 109.8292, 109.4944, 109.18039999999999, 108.80679999999998, 108.42039999999999, 107.8214, 107.0758, 106.29180000000001, 105.55580000000002, 105.2092, 104.6362, 104.12700000000001, 103.698, 103.3184, 102.6942, 102.204, 101.712, 101.28599999999999, 100.8842, 100.5516, 100.2502, 99.9418, 99.60099999999998, 99.2624, 98.9016, 98.5942, 98.3892, 98.19940000000001, 98.1274, 98.0666, 98.13320000000002, 98.2984, 98.58300000000001, 98.9224, 99.18880000000001, 99.55519999999999, 99.84380000000002, 100.1814, 100.4874, 100.6858, 100.92980000000001, 101.2016, 101.36699999999999, 101.5574, 101.6474, 101.79719999999999, 102.01460000000002, 102.1092, 102.1268, 102.24680000000001, 102.5484, 102.94879999999999, 103.3168, 103.6312, 103.8952, 104.54700000000001, 105.37379999999999, 106.23679999999999, 107.2374, 107.89220000000002, 108.88679999999998, 109.88680000000001, 110.8704, 111.8408, 112.91300000000001, 113.8852, 114.94439999999999, 115.97740000000002, 116.8656, 117.7326, 118.5678, 119.5232, 120.53040000000001, 121.5082, 122.68740000000001, 123.91300000000001, 125.10940000000001, 126.27680000000001, 127.40960000000001, 128.47, 129.5862, 130.6662, 131.7464, 132.86520000000002, 134.1142, 135.361, 136.5924, 137.7562, 139.0506, 140.3226, 141.37879999999998, 142.53560000000002, 143.7336, 144.9186, 146.203, 147.5988, 148.8716, 150.05020000000002, 151.2592, 152.2664, 153.1358, 153.9452, 154.8776, 155.7748, 156.784, 157.59879999999998, 158.4284, 159.14520000000002, 159.8268, 160.4778, 160.945, 161.0998, 161.25439999999998, 161.49460000000002, 161.8474, 162.23860000000002, 162.6396, 163.1046, 163.61780000000002, 164.0446, 164.4348, 164.6994, 164.9668, 165.26, 165.36539999999997, 165.3892, 165.3702, 165.45759999999999, 165.5534, 165.73919999999998, 165.9608, 166.0118, 166.7566, 167.5136, 168.676, 169.74359999999996, 170.5154, 171.4098, 172.23600000000002, 173.5218, 174.9506, 176.16420000000002, 177.52020000000002, 178.83520000000001, 179.94080000000002, 180.9522, 182.3916, 184.0348, 185.6722, 187.62780000000004, 189.4206, 191.26879999999997, 193.1066, 194.84040000000002, 196.63459999999998, 198.046, 199.3452, 200.9722, 202.47619999999998, 204.4114, 206.13479999999998, 208.0482, 209.8304, 211.3198, 212.6, 213.607, 214.5112, 215.58900000000003, 216.50240000000002, 217.60399999999998, 218.7962, 220.0436, 221.1526, 222.2866, 223.3886, 224.52259999999998, 225.75560000000002, 226.96079999999998, 228.1534, 229.30180000000001, 230.12279999999998, 230.98100000000002, 231.0902, 230.8222, 230.1322, 229.74300000000002, 229.74399999999997, 229.71359999999996, 229.65259999999998, 229.18040000000002, 228.8014, 228.4466, 227.9186, 227.62739999999997, 227.44439999999997, 227.0316, 226.1736, 225.0738, 223.977, 222.84419999999997, 222.1668, 221.5164, 220.8818], "ma150": [136.75300000000001, 136.49913333333336, 136.2352, 135.94073333333333, 135.70133333333334, 135.46306666666666, 135.2362, 135.0224, 134.83773333333332, 134.6262, 134.42113333333336, 134.21753333333334, 133.99093333333332, 133.76219999999998, 133.5388, 133.3138, 133.01319999999998, 132.68153333333333, 132.3176, 131.9912, 131.6432, 131.32966666666667, 130.95166666666665, 130.5476666666667, 130.13533333333334, 129.66633333333334, 129.399, 129.0512, 128.74426666666668, 128.47859999999997, 128.19286666666667, 127.8292, 127.41346666666666, 126.97873333333334, 126.5384, 126.12713333333333, 125.75146666666667, 125.40720000000002, 125.00486666666666, 124.6056, 124.20960000000001, 123.79846666666667, 123.37700000000002, 122.93099999999998, 122.49280000000002, 122.068, 121.68099999999998, 121.3014, 120.93653333333333, 120.54693333333334, 120.19193333333334, 119.80653333333333, 119.44753333333334, 119.11793333333333, 118.75540000000001, 118.40066666666665, 118.09446666666666, 117.78899999999999, 117.51106666666666, 117.22366666666669, 116.92453333333333, 116.63546666666666, 116.38026666666667, 116.1394, 115.88840000000002, 115.59353333333333, 115.25980000000001, 115.08066666666669, 114.9418, 114.80366666666666, 114.65559999999998, 114.4856, 114.36086666666667, 114.2094, 114.06833333333333, 113.94093333333333, 113.84726666666667, 113.84146666666668, 113.87186666666666, 113.93039999999998, 113.96293333333332, 113.97966666666667, 113.96973333333332, 113.97659999999999, 113.97366666666666, 113.93146666666668, 113.93213333333333, 113.9466, 113.99313333333335, 114.02219999999998, 114.0506, 114.12806666666668, 114.25286666666666, 114.39833333333333, 114.57246666666668, 114.76753333333335, 114.93133333333331, 115.11833333333334, 115.35306666666666, 115.61826666666667, 115.94253333333334, 116.31606666666667, 116.72026666666667, 117.10093333333333, 117.41493333333332, 117.75153333333336, 118.07986666666666, 118.33273333333335, 118.66579999999999, 119.01226666666666, 119.35660000000001, 119.68713333333334, 120.05293333333333, 120.41040000000001, 120.78153333333333, 121.18220000000001, 121.5104, 121.83780000000002, 122.12946666666667, 122.45826666666666, 122.7376, 123.0332, 123.3224, 123.626, 123.89126666666665, 124.20666666666666, 124.5264, 124.82266666666668, 125.03786666666667, 125.27426666666666, 125.55126666666666, 125.81819999999999, 126.10926666666666, 126.432, 126.78933333333332, 127.12253333333334, 127.44293333333334, 127.75093333333334, 128.05479999999997, 128.36606666666665, 128.67686666666668, 128.98479999999998, 129.2988, 129.62293333333335, 129.9779333333333, 130.36346666666668, 130.7586, 131.22673333333336, 131.65879999999999, 132.362, 133.1004, 133.993, 134.88660000000002, 135.65053333333333, 136.44913333333332, 137.258, 138.17673333333332, 139.0864, 139.96713333333332, 140.8736, 141.7704, 142.59706666666665, 143.4494, 144.42593333333332, 145.39806666666667, 146.35273333333333, 147.38033333333334, 148.36826666666667, 149.3876, 150.43366666666665, 151.41546666666667, 152.43793333333332, 153.39726666666667, 154.38246666666666, 155.4514, 156.51346666666666, 157.5938, 158.65553333333332, 159.67826666666667, 160.65173333333334, 161.55173333333335, 162.45346666666666, 163.24360000000001, 164.03173333333334, 164.89033333333333, 165.66193333333334, 166.46040000000002, 167.26626666666667, 168.08873333333332, 168.88326666666669, 169.68493333333333, 170.48046666666667, 171.2749333333333, 172.07840000000002, 172.89839999999998, 173.70546666666667, 174.50366666666667, 175.2232666666667, 175.8863333333333, 176.53106666666667, 177.067, 177.64079999999998, 178.2825333333333, 178.9506, 179.62653333333333, 180.31306666666666, 181.00826666666669, 181.71026666666668, 182.38213333333334, 183.05746666666667, 183.79373333333334, 184.5294, 185.1942, 185.81226666666666, 186.38626666666667, 186.96946666666668, 187.57946666666666, 188.24106666666665, 188.91013333333333, 189.622], "ma200": [143.35335, 143.06334999999999, 142.74450000000002, 142.4237, 142.0752, 141.7357, 141.41205, 141.10045, 140.7735, 140.4384, 140.13025, 139.82765, 139.52884999999998, 139.2433, 139.0126, 138.7558, 138.47285, 138.16675, 137.88115, 137.60004999999998, 137.31275, 137.02805, 136.6989, 136.3357, 135.98075, 135.5629, 135.24095, 134.8832, 134.54895, 134.23375, 133.91285, 133.54325, 133.19230000000002, 132.79855, 132.41035000000002, 132.0028, 131.5817, 131.17945, 130.7416, 130.31220000000002, 129.8909, 129.475, 129.08125, 128.78705, 128.5013, 128.2452, 127.97435, 127.71855, 127.536, 127.4067, 127.29535, 127.17155000000001, 127.0652, 126.91650000000001, 126.82135, 126.71915000000001, 126.5986, 126.49925000000002, 126.42869999999999, 126.31139999999999, 126.20519999999999, 126.075, 125.9425, 125.82530000000001, 125.6814, 125.51705, 125.3216, 125.14824999999999, 124.97540000000001, 124.82260000000001, 124.64020000000001, 124.47104999999999, 124.3505, 124.2542, 124.16069999999999, 124.0591, 124.0223, 124.01010000000001, 124.0299, 124.07655000000001, 124.10485, 124.10015, 124.03139999999999, 123.97015000000002, 123.89815, 123.81174999999999, 123.74674999999999, 123.69734999999999, 123.63445, 123.5868, 123.53424999999999, 123.52069999999999, 123.51100000000001, 123.47560000000001, 123.43879999999999, 123.4034, 123.37825000000001, 123.3726, 123.36895, 123.3468, 123.36025000000001, 123.38345, 123.4259, 123.48655000000001, 123.50560000000002, 123.56315000000001, 123.6515, 123.68645000000001, 123.76720000000002, 123.85115, 123.92304999999999, 124.02735000000001, 124.1849, 124.32244999999999, 124.42885, 124.50995, 124.51145000000001, 124.59445, 124.69265, 124.82215000000001, 124.93540000000002, 125.06020000000001, 125.17035000000001, 125.26414999999999, 125.33755000000001, 125.41239999999999, 125.50490000000002, 125.61734999999999, 125.67885, 125.76140000000001, 125.84585000000001, 125.9466, 126.03694999999999, 126.14235000000001, 126.2564, 126.35305, 126.46025, 126.56864999999999, 126.66969999999999, 126.75835000000001, 126.85295, 126.9374, 127.03694999999999, 127.14129999999999, 127.29375, 127.464, 127.6333, 127.82894999999999, 128.01775, 128.40285, 128.8353, 129.40605, 129.97609999999997, 130.45455, 130.91365, 131.37265, 131.94035, 132.4872, 133.0404, 133.63925, 134.22625, 134.75055, 135.27775, 135.9057, 136.59484999999998, 137.3047, 138.03975, 138.7335, 139.4143, 140.12035, 140.7633, 141.43355, 142.0033, 142.5558, 143.16150000000002, 143.77405, 144.49765000000002, 145.1507, 145.79045, 146.4133, 146.9934, 147.51364999999998, 147.9837, 148.4518, 148.98925, 149.4675, 149.9832, 150.51225, 151.05200000000002, 151.56269999999998, 152.0793, 152.58575000000002, 153.10475, 153.65609999999998, 154.22365, 154.81095, 155.39440000000002, 155.95075, 156.48935, 157.04405, 157.53085, 158.0278, 158.6007, 159.1739, 159.76525, 160.35665, 160.92765, 161.51515, 162.087, 162.63485, 163.23465, 163.80890000000002, 164.34495000000004, 164.86285, 165.317, 165.7588, 166.24630000000002, 166.8179, 167.4198, 168.0457], "rs_line": [1.0, 0.9984008591959306, 0.9882510356381893, 0.9972577973850104, 0.9869604531357853, 0.9965725757352311, 1.0325997571934968, 1.0187230496170816, 1.0272021546614531, 1.0558873755832403, 1.0564022938368285, 1.0724818004230872, 1.0848060122390177, 1.080603907165636, 1.135496993701088, 1.1423256966764488, 1.1096048249954602, 1.0768169916988881, 1.063604315936991, 1.051599167952223, 1.049045554777481, 1.0442742564050989, 1.0006832120379063, 0.9718025511639274, 0.9494706352500976, 0.9019571350546057, 1.0106680013637648, 0.9681379890631162, 1.001566499744258, 1.0036256124768348, 1.01485818656167, 0.9616830397971159, 0.9517202128015115, 0.953310620258546, 0.9367382111640178, 0.9666097411248219, 0.9894142392790501, 1.00498475223417, 1.0018991249931586, 0.9922186931825709, 1.0051443796083062, 0.9908944150450756, 0.9981208408178691, 1.0220650827653137, 1.0104945407653054, 1.0240167398171383, 1.030508927706485, 1.0433898435652582, 1.0618674355956632, 1.0972453311363735, 1.1470998637366232, 1.1150515932861025, 1.1290395443797905, 1.1044161542904136, 1.0962627824419662, 1.1008084052718907, 1.087117853812709, 1.090634398218572, 1.1095852677279368, 1.0994805661636546, 1.0968071772527164, 1.075691923057767, 1.1073410724420818, 1.1268044914862265, 1.13930910415936, 1.1169400962304679, 1.1103651114156925, 1.1622603651641505, 1.1700438394734982, 1.1533958989895856, 1.1237936593560716, 1.114057593176802, 1.2007464326833939, 1.217898811646406, 1.215111346874871, 1.235542718164617, 1.2362421189574404, 1.3062440706206795, 1.3523838702157067, 1.344505335127505, 1.3390688310294798, 1.3149968583523548, 1.2617489704734126, 1.2782949252193687, 1.2627137800808073, 1.2435049303965189, 1.272060686163379, 1.2698911387043732, 1.3189268400454137, 1.3443295294272781, 1.3401196568223244, 1.4321046294942432, 1.4683337020979352, 1.4624112007532828, 1.4322811141810081, 1.4296614631954443, 1.4086978643224508, 1.4322946235489704, 1.4631373616260195, 1.4960763073059415, 1.5610853350397966, 1.5992832523819989, 1.6199804401765938, 1.597093225313377, 1.5812510526708181, 1.6036594656164764, 1.5893105892313375, 1.4759778478002108, 1.561254827622409, 1.5524099963728204, 1.551164117901748, 1.5586111368829065, 1.6373734570771623, 1.6064155934145352, 1.5795745911630692, 1.567724738177334, 1.4904553976806778, 1.4823128148327918, 1.4748602006077856, 1.4884881896261375, 1.4558554023493617, 1.4787170066647828, 1.4798712546273025, 1.4874427554299423, 1.443552732846416, 1.451557524913594, 1.442043156458293, 1.4270922756428095, 1.3370247278652794, 1.3361309008630116, 1.3718757588960655, 1.4005786609170734, 1.3553413220924269, 1.3810521905592148, 1.3961764441410638, 1.3920288081810663, 1.3824686103352561, 1.3653185201826754, 1.3577840058234327, 1.3719975148893049, 1.3890898851487894, 1.3933501581881163, 1.4032015743937039, 1.3795493575764792, 1.3920746522584955, 1.3905463057510892, 1.4048397004514164, 1.4521620080946054, 1.4088911279894003, 1.7366830500227906, 1.8098903518921337, 2.003737720096557, 1.9867816780901686, 1.884236028627595, 1.8688869614474453, 1.8856117346799026, 2.0538236778291834, 2.032892708897365, 2.008663986521415, 2.051786361709198, 2.0302377079470006, 1.9739714614188137, 2.002906204537778, 2.1382551674548673, 2.16972374751097, 2.150142504557304, 2.201753102332601, 2.1463109522819326, 2.150038730283511, 2.1755890004873883, 2.120284158133353, 2.1660288149982305, 2.0303871402339566, 1.9928909913801693, 2.0499910975269415, 1.9911540052824899, 2.1690940440767816, 2.112573731653395, 2.1031201827822446, 2.0687955868713552, 1.9975785986389196, 1.931652278616502, 1.8077329352036486, 1.7704421638705117, 1.8412553049057583, 1.7484367789709088, 1.8047682400826197, 1.8225351421865386, 1.8496633795346402, 1.8082704136099559, 1.8217887187247004, 1.806904720390551, 1.8200959327814077, 1.8518791523384748, 1.8577539093946955, 1.8438487699569572, 1.8396511097914705, 1.7702037406613038, 1.7459668268107595, 1.7641607281930074, 1.689469795715926, 1.7017764434046967, 1.7955407731366635, 1.7971322726703034, 1.7885397572742487, 1.7834314485847582, 1.7831975787624887, 1.7947358120052936, 1.7946799911855968, 1.798168149949988, 1.8729052750767652, 1.84061591226968, 1.7740343443313353, 1.7438188498526488, 1.6996527839581697, 1.6760295764677307, 1.7106303877487121, 1.823657051837926, 1.8544774208500847, 1.8851725889183717], "rs_score": 0.7742766958194931}, {"ticker": "GE", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [198.77, 202.5, 196.05, 193.85, 192.12, 191.72, 195.0, 192.42, 197.11, 202.03, 200.79, 205.57, 203.93, 204.13, 210.23, 212.13, 207.37, 205.88, 199.88, 200.15, 203.79, 199.77, 187.63, 166.81, 167.7, 169.37, 187.27, 181.51, 181.67, 186.0, 185.67, 182.45, 181.79, 178.35, 189.18, 193.61, 197.41, 198.43, 200.86, 200.5, 201.54, 203.61, 207.7, 208.94, 208.6, 209.92, 214.49, 214.96, 218.95, 221.58, 223.24, 229.38, 231.78, 235.29, 235.26, 233.54, 230.27, 232.79, 241.78, 243.67, 244.16, 245.91, 247.48, 248.87, 250.88, 251.92, 255.63, 251.41, 242.0, 245.52, 239.99, 236.6, 236.54, 235.75, 235.89, 239.37, 247.81, 248.75, 249.9, 251.0, 254.51, 257.39, 249.02, 244.75, 246.88, 248.65, 247.05, 250.33, 252.57, 255.42, 262.34, 264.67, 266.18, 260.28, 263.27, 262.86, 259.0, 263.18, 268.01, 271.59, 270.61, 270.31, 273.55, 271.08, 269.38, 276.23, 272.12, 272.28, 272.02, 275.01, 275.2, 279.63, 268.86, 269.7, 267.85, 268.45, 265.93, 266.44, 268.71, 266.53, 266.61, 273.94, 273.35, 276.0, 275.2, 275.39, 275.93, 282.27, 279.23, 276.05, 276.24, 283.41, 281.56, 281.69, 286.78, 292.97, 289.5, 297.09, 301.14, 301.02, 305.63, 300.3, 297.18, 294.98, 293.63, 300.82, 300.88, 299.45, 297.0, 298.22, 301.74, 302.56, 299.35, 291.49, 297.53, 300.08, 300.12, 299.84, 300.14, 302.68, 306.63, 297.89, 306.39, 303.87, 312.84, 309.79, 314.28, 310.75, 308.95, 308.62, 304.2, 305.11, 305.27, 307.27, 311.94, 310.72, 309.02, 304.17, 304.82, 300.13, 296.01, 300.82, 290.62, 287.44, 294.05, 293.44, 296.62, 298.45, 288.45, 289.32, 288.49, 291.86, 283.94, 287.19, 285.31, 283.6, 288.42, 299.81, 300.98, 298.73, 292.18, 301.69, 307.21, 314.73, 315.53, 316.75, 315.14, 311.58, 311.79, 308.03, 320.75, 324.32, 327.54, 323.64, 314.44, 321.59, 324.17, 327.23, 318.88, 319.94], "ma50": [190.0578, 190.90879999999999, 191.5338, 192.0434, 192.5054, 192.91000000000003, 193.36700000000002, 193.8138, 194.394, 195.0988, 195.7428, 196.415, 197.0446, 197.681, 198.4278, 199.2366, 199.95260000000002, 200.533, 200.9248, 201.333, 201.7518, 201.99719999999996, 201.98260000000002, 201.3028, 200.7218, 200.22, 200.0768, 199.725, 199.247, 198.8956, 198.5268, 198.13219999999998, 197.6764, 197.12220000000002, 196.80020000000002, 196.56799999999998, 196.3398, 196.1156, 195.96560000000002, 195.8102, 195.6394, 195.5016, 195.48080000000002, 195.66299999999998, 195.86079999999998, 196.0738, 196.3314, 196.602, 196.8414, 197.23379999999997, 197.7232, 198.26080000000002, 198.9754, 199.80419999999998, 200.667, 201.50339999999997, 202.20879999999997, 203.01620000000003, 203.90959999999998, 204.74239999999998, 205.6098, 206.4166, 207.28760000000003, 208.18239999999997, 208.99540000000002, 209.79120000000003, 210.75639999999999, 211.667, 212.5094, 213.4168, 214.14079999999998, 214.87740000000002, 215.85559999999998, 217.2344, 218.5982, 219.9982, 221.209, 222.55380000000002, 223.9184, 225.2184, 226.5952, 228.09400000000002, 229.4386, 230.7666, 231.92059999999998, 233.0214, 234.01420000000002, 235.0522, 236.0864, 237.1848, 238.4008, 239.622, 240.7916, 241.8184, 242.9118, 243.97060000000002, 244.8608, 245.8252, 246.8064, 247.8066, 248.75400000000002, 249.5726, 250.408, 251.12380000000002, 251.8062, 252.66, 253.497, 254.2868, 254.8916, 255.5184, 256.1392, 256.8136, 257.2412, 257.6578, 257.99719999999996, 258.32779999999997, 258.5338, 258.8344, 259.3686, 259.78880000000004, 260.3212, 261.068, 261.80420000000004, 262.60920000000004, 263.3954, 264.11580000000004, 264.6782, 265.3486, 265.9352, 266.4362, 266.8708, 267.39119999999997, 268.042, 268.7808, 269.5788, 270.4652, 271.31419999999997, 272.2494, 273.2208, 274.1328, 274.9986, 275.71119999999996, 276.33119999999997, 277.0252, 277.6324, 278.3916, 279.2292, 279.95459999999997, 280.5344, 281.067, 281.6896, 282.33459999999997, 282.8506, 283.25879999999995, 283.8218, 284.2988, 284.85880000000003, 285.41, 285.9724, 286.5258, 287.1544, 287.51959999999997, 288.2702, 288.9536, 289.8534, 290.6802, 291.6472, 292.5334, 293.3382, 294.18, 294.9318, 295.5552, 296.1936, 296.81899999999996, 297.5538, 298.26039999999995, 298.9222, 299.3602, 299.87199999999996, 300.35360000000003, 300.749, 301.0972, 301.2784, 301.3934, 301.5388, 301.5482, 301.6906, 301.7178, 301.464, 301.23, 300.88719999999995, 300.7184, 300.4536, 300.2978, 300.1314, 299.787, 299.5378, 299.545, 299.6246, 299.6348, 299.4436, 299.4262, 299.5834, 300.0482, 300.4082, 300.7416, 301.042, 301.2768, 301.5098, 301.6168, 301.8992, 302.42780000000005, 302.8508, 303.24620000000004, 303.27819999999997, 303.51419999999996, 303.712, 304.0416, 304.2402, 304.46659999999997], "ma150": [181.1338, 181.35133333333334, 181.5418, 181.69946666666667, 181.8486, 182.0582, 182.30246666666665, 182.50346666666667, 182.73666666666668, 182.97946666666667, 183.20386666666664, 183.46186666666665, 183.70166666666665, 183.94286666666667, 184.21146666666667, 184.49620000000002, 184.7391333333333, 184.97840000000002, 185.1696, 185.37273333333334, 185.58986666666667, 185.7802, 185.89113333333336, 185.8574, 185.8182, 185.7832, 185.93693333333334, 186.03793333333334, 186.15673333333334, 186.32186666666666, 186.45733333333334, 186.56046666666666, 186.6634, 186.72106666666667, 186.7937333333333, 186.87486666666666, 186.98873333333333, 187.08793333333332, 187.18593333333334, 187.27306666666667, 187.35886666666667, 187.4518666666667, 187.57433333333333, 187.73666666666668, 187.89146666666667, 188.03373333333334, 188.22166666666666, 188.41179999999997, 188.64553333333333, 188.87553333333335, 189.12406666666666, 189.40346666666667, 189.6868, 190.00126666666665, 190.29526666666666, 190.56799999999998, 190.83266666666665, 191.1034, 191.43113333333332, 191.77153333333334, 192.1044, 192.56606666666667, 193.00466666666668, 193.46553333333333, 193.94406666666666, 194.45446666666666, 194.99833333333333, 195.51013333333333, 195.97826666666666, 196.4704, 196.92526666666666, 197.3342, 197.70606666666666, 198.08540000000002, 198.42593333333332, 198.79133333333334, 199.2258, 199.6604, 200.13706666666664, 200.63086666666666, 201.14413333333331, 201.67633333333333, 202.14993333333334, 202.59026666666668, 203.02846666666667, 203.48473333333334, 203.90106666666668, 204.36593333333332, 204.83533333333332, 205.33520000000001, 205.87933333333334, 206.42613333333333, 207.04793333333333, 207.6126, 208.22560000000001, 208.8362, 209.4386, 210.09426666666667, 210.77426666666668, 211.4796, 212.17833333333334, 212.91406666666668, 213.63906666666668, 214.3238, 214.99286666666666, 215.6911333333333, 216.35760000000002, 217.03893333333335, 217.73173333333335, 218.4532, 219.16393333333335, 219.88173333333336, 220.52446666666665, 221.17373333333333, 221.80679999999998, 222.45186666666666, 223.08093333333332, 223.6781333333333, 224.26760000000004, 224.8462, 225.40460000000002, 225.98086666666666, 226.54746666666668, 227.04880000000006, 227.57180000000002, 228.1113333333333, 228.65466666666666, 229.2091333333333, 229.7002, 230.1834, 230.66426666666666, 231.20579999999998, 231.71900000000005, 232.22319999999996, 232.76653333333334, 233.3515333333333, 233.88939999999997, 234.4724, 235.09093333333334, 235.70926666666665, 236.34626666666668, 236.94493333333332, 237.53453333333334, 238.16886666666667, 238.80166666666668, 239.47866666666664, 240.14046666666667, 240.7939333333333, 241.39406666666667, 242.03580000000002, 242.72226666666666, 243.3893333333333, 244.07800000000003, 244.72893333333334, 245.43166666666667, 246.15406666666667, 246.85486666666665, 247.571, 248.25786666666667, 248.92886666666666, 249.63446666666667, 250.24993333333333, 250.93300000000002, 251.5979333333333, 252.282, 252.93306666666672, 253.6458, 254.34493333333336, 255.07206666666664, 255.7952, 256.4646, 257.16686666666664, 257.9511333333333, 258.8875333333333, 259.8491333333333, 260.7914666666666, 261.60313333333335, 262.42086666666665, 263.2418666666667, 264.00273333333337, 264.73833333333334, 265.5274666666666, 266.253, 266.9802666666667, 267.6794, 268.3449333333333, 269.0063333333333, 269.67313333333334, 270.2570666666667, 270.8492, 271.4288666666667, 272.0172, 272.52546666666666, 273.0471333333333, 273.55853333333334, 274.04973333333334, 274.5426, 275.1082666666667, 275.65513333333337, 276.16946666666666, 276.6290666666667, 277.1111333333333, 277.614, 278.14359999999994, 278.67873333333335, 279.2334666666667, 279.79926666666665, 280.32453333333336, 280.7912666666666, 281.2203333333333, 281.7309333333333, 282.2536666666667, 282.7874, 283.28586666666666, 283.7096, 284.17406666666665, 284.63100000000003, 285.13646666666665, 285.649, 286.1451333333333], "ma200": [176.3852, 176.58035, 176.755, 176.9248, 177.08900000000003, 177.24259999999998, 177.41355, 177.54935, 177.69825, 177.8656, 178.05155000000002, 178.2584, 178.45235, 178.6657, 178.90995000000004, 179.15785, 179.3916, 179.6114, 179.7966, 179.99555, 180.20925, 180.42965, 180.5884, 180.6063, 180.61995, 180.6418, 180.75695000000005, 180.86180000000002, 180.97150000000002, 181.09830000000002, 181.22415, 181.34154999999998, 181.45565, 181.54014999999998, 181.67105, 181.8366, 182.00600000000003, 182.1825, 182.3583, 182.55120000000002, 182.76385, 182.9841, 183.20835000000002, 183.46974999999998, 183.71880000000002, 183.97275000000002, 184.2314, 184.44619999999998, 184.72944999999999, 185.01399999999998, 185.28115000000003, 185.5787, 185.9002, 186.22564999999997, 186.5532, 186.9195, 187.27904999999998, 187.63165, 188.02989999999997, 188.42019999999997, 188.80535, 189.20054999999996, 189.59814999999998, 190.00275000000002, 190.40744999999998, 190.81994999999998, 191.24345000000002, 191.65055, 192.00455, 192.38375, 192.72760000000002, 193.05450000000002, 193.38225000000003, 193.70165, 194.01319999999998, 194.33695, 194.75494999999998, 195.1669, 195.59715, 196.04600000000002, 196.49179999999996, 196.94385000000003, 197.3572, 197.73245, 198.07545, 198.4115, 198.7451, 199.079, 199.41105000000005, 199.75100000000003, 200.11934999999997, 200.4944, 200.87865, 201.25710000000004, 201.64655, 202.01794999999998, 202.38145, 202.76515, 203.18575, 203.60829999999999, 204.03154999999998, 204.44574999999998, 204.8671, 205.28190000000004, 205.673, 206.091, 206.49875, 206.89925, 207.29625, 207.70825000000002, 208.1131, 208.62794999999997, 209.0638, 209.5136, 209.95735000000002, 210.4228, 210.88219999999998, 211.3412, 211.82585, 212.3, 212.77425, 213.26765, 213.7306, 214.21634999999998, 214.6683, 215.12245, 215.5889, 216.08245, 216.5866, 217.0822, 217.5758, 218.10505, 218.62294999999997, 219.1379, 219.66604999999998, 220.22985, 220.75435000000002, 221.3368, 221.93169999999998, 222.53459999999998, 223.15915, 223.74740000000003, 224.36875, 224.96574999999996, 225.5773, 226.22505, 226.88625, 227.55934999999997, 228.21429999999998, 228.87645, 229.55615, 230.2692, 230.94195, 231.55754999999996, 232.20010000000002, 232.84305, 233.4829, 234.1317, 234.79190000000003, 235.47134999999997, 236.16154999999998, 236.7912, 237.4609, 238.11870000000002, 238.81845, 239.50895, 240.2225, 240.89195, 241.53525000000002, 242.17965, 242.78640000000004, 243.37445000000002, 243.959, 244.49134999999998, 245.0673, 245.64860000000002, 246.22154999999998, 246.7469, 247.24315, 247.72595, 248.18545000000003, 248.67865, 249.10885, 249.51575, 249.95960000000002, 250.4007, 250.83970000000002, 251.28375, 251.68420000000003, 252.08945, 252.48149999999998, 252.8883, 253.2643, 253.70109999999997, 254.1341, 254.55575000000002, 254.9898, 255.4817, 255.9517, 256.43555, 256.9026, 257.39855, 257.95435, 258.55875, 259.1758, 259.80095, 260.40165, 260.99745, 261.57085, 262.10085, 262.70065, 263.2944, 263.91245, 264.51, 265.03105, 265.57835, 266.16234999999995, 266.7691, 267.3641, 267.96305], "rs_line": [1.0, 1.007932310274925, 0.9934629338840215, 0.9768395450746917, 0.9946139969201899, 1.0008631729545974, 1.0126127744245392, 1.0127150971255492, 1.0164041754213835, 1.0338023506470817, 1.038683717848261, 1.0519538868305414, 1.0465880648134251, 1.0504193666683994, 1.0627763003480322, 1.0698097176270283, 1.0584401319384904, 1.05363312721974, 1.0439502294834355, 1.0383899685941311, 1.054296636222496, 1.0270001916876297, 1.0145892843746633, 0.9580971800990277, 0.9649277431077209, 0.9900435920518017, 0.9906406904008999, 1.0041727131600469, 0.9874391609232076, 1.0012605122034717, 1.002291360706349, 1.0072992831646084, 1.002225496036773, 1.00723541200505, 1.0413056399273741, 1.0494283277215202, 1.0479669985409628, 1.0458253479734305, 1.058229081895319, 1.0497198665137397, 1.0547461870124013, 1.0580808232199823, 1.063547504285238, 1.0760675894144955, 1.0833717196117612, 1.0856615032669217, 1.1016206595490594, 1.1054431363082482, 1.0899421103416604, 1.0957978336588023, 1.1025980134709965, 1.1274171946516907, 1.1320429358156159, 1.1479304911893866, 1.1516562169818023, 1.1628310285726937, 1.1460969467188133, 1.1666023417921547, 1.1869769002396116, 1.2032165359882643, 1.200895699211962, 1.2108574402180972, 1.2117623110495865, 1.2116586847559705, 1.2217725962802728, 1.2327951731578515, 1.238235049080234, 1.2166973750223427, 1.1645550626503556, 1.1848733352528587, 1.1536009097773252, 1.1501646010738233, 1.1390358696959955, 1.1450160508448062, 1.14586860874884, 1.1689560769114384, 1.1983359964875377, 1.189738237270191, 1.194569175869733, 1.1905130192470346, 1.201193249921209, 1.209005305750866, 1.1700687244036454, 1.1448154964377524, 1.1457484735588641, 1.1626267203545408, 1.155778630511099, 1.1641424891596603, 1.17125622987239, 1.1886512558633724, 1.218529731926668, 1.2346281659078313, 1.2375345406062992, 1.2027436731568208, 1.2174520533506437, 1.213255528850107, 1.195268242182185, 1.2043130292848772, 1.226009177144968, 1.2371596809943228, 1.2330051928191232, 1.2348954491873598, 1.2512729616619245, 1.2446436165890673, 1.2574481844143126, 1.2701180354941561, 1.257596017825021, 1.2487703704722315, 1.2486237350611757, 1.252581342234244, 1.2559302865218906, 1.262704732268977, 1.2099297060647338, 1.2135969806058557, 1.2081008306143082, 1.2110705539831663, 1.2062460322351776, 1.2117791124919752, 1.2270257979897112, 1.1986635304137383, 1.2043235243174146, 1.2322749101905106, 1.2268255627077687, 1.234347695207732, 1.2381539226494083, 1.2482586970577816, 1.2439645757594624, 1.2619999008816718, 1.2520345545660785, 1.2347425578114088, 1.2327424875754793, 1.2610935505763814, 1.2425358490794907, 1.2435255467632687, 1.2592910745701822, 1.2882460023081346, 1.274571296503931, 1.3019044063581549, 1.3167890800230972, 1.3100663646841064, 1.3374098066690308, 1.3182803023955059, 1.310630507550774, 1.2935173905721875, 1.283988939463234, 1.3104929973635495, 1.3063031698352, 1.2985987895369135, 1.2879933336556784, 1.2886625268142933, 1.3087251932960158, 1.304502923551367, 1.2944127586756413, 1.295438397247171, 1.302298741203867, 1.3150667219955887, 1.309428749395792, 1.3171774638780254, 1.3110533936390205, 1.3085389850395366, 1.3256352784824275, 1.2945806090505425, 1.3236709398024717, 1.3021421587725752, 1.3249489908439205, 1.3085560132169114, 1.3268845050269122, 1.326570696679834, 1.3145745094905879, 1.310710599457598, 1.3074365943050201, 1.3068190336358623, 1.3216851673476864, 1.3290356960040375, 1.3285045097081731, 1.3202862258821475, 1.312332582630389, 1.3135325598062273, 1.316555024823497, 1.3084888048398065, 1.3014557206495134, 1.3175138840433567, 1.2925418191138216, 1.2657898455514462, 1.2761154450851457, 1.26160168762818, 1.2665301354980967, 1.2674258237937235, 1.2305770526517197, 1.232006691637039, 1.2242330455714303, 1.2376290959958547, 1.2017616753540479, 1.2191798851146007, 1.2122451192071813, 1.197040639908092, 1.2145589436003315, 1.2762453873651045, 1.2831644979617316, 1.2770614922173802, 1.2629574984156735, 1.2942910904070468, 1.3099941992317532, 1.3337515976309808, 1.331058237651644, 1.3315209681521134, 1.324887351149976, 1.3146054223150354, 1.3170998833551368, 1.310929014530399, 1.3625657432833103, 1.3686161634879261, 1.374032791076956, 1.362062773238922, 1.3234782434254606, 1.3446797057019024, 1.3533422316045105, 1.3688541724914363, 1.3405136764635155, 1.3413170270246495], "rs_score": 0.6199738330636229}], "analyst_panel": [{"ticker": "VZ", "consensus": "Hold", "analyst_count": 60, "target_consensus": 47.0, "target_high": 49.0, "target_low": 44.0}, {"ticker": "GS", "consensus": "Hold", "analyst_count": 54, "target_consensus": 821.25, "target_high": 1048.0, "target_low": 604.0}, {"ticker": "MA", "consensus": "Buy", "analyst_count": 63, "target_consensus": 674.36, "target_high": 735.0, "target_low": 610.0}, {"ticker": "JPM", "consensus": "Buy", "analyst_count": 60, "target_consensus": 326.33, "target_high": 391.0, "target_low": 245.0}, {"ticker": "AAPL", "consensus": "Buy", "analyst_count": 109, "target_consensus": 299.08, "target_high": 350.0, "target_low": 220.0}, {"ticker": "NVDA", "consensus": "Buy", "analyst_count": 79, "target_consensus": 264.34, "target_high": 352.0, "target_low": 140.0}, {"ticker": "ABBV", "consensus": "Buy", "analyst_count": 39, "target_consensus": 258.63, "target_high": 289.0, "target_low": 240.0}, {"ticker": "LLY", "consensus": "Buy", "analyst_count": 44, "target_consensus": 1151.07, "target_high": 1300.0, "target_low": 830.0}, {"ticker": "CVX", "consensus": "Buy", "analyst_count": 51, "target_consensus": 175.7, "target_high": 206.0, "target_low": 158.0}, {"ticker": "XOM", "consensus": "Hold", "analyst_count": 53, "target_consensus": 142.22, "target_high": 158.0, "target_low": 126.0}], "records": [{"ticker": "VZ", "momentum_12_1": 0.06583072100313458, "quality_raw": 0.219, "value_raw": 0.3715882497232148, "composite_score": 0.8498025296726462, "rs_score": -0.16081447088151246, "ma_50": 40.476, "ma_150": 41.8352, "ma_200": 42.25719999999999, "sepa_pass": false, "rank": 1, "action": "BUY"}, {"ticker": "GS", "momentum_12_1": 0.5565062201459243, "quality_raw": 0.2535, "value_raw": 0.21985553326875074, "composite_score": 0.702436425675696, "rs_score": 0.5184242902571943, "ma_50": 860.4442, "ma_150": 779.3773333333334, "ma_200": 725.0052499999999, "sepa_pass": true, "rank": 2, "action": "BUY"}, {"ticker": "MA", "momentum_12_1": 0.11808966248870378, "quality_raw": 1.2235, "value_raw": 0.021571933055408533, "composite_score": 0.6914663658974547, "rs_score": -0.12295950610747819, "ma_50": 556.7252, "ma_150": 565.6576000000001, "ma_200": 562.336, "sepa_pass": false, "rank": 3, "action": "BUY"}, {"ticker": "JPM", "momentum_12_1": 0.2931668485068897, "quality_raw": 0.3005, "value_raw": 0.22091988803136936, "composite_score": 0.5239470418231351, "rs_score": 0.06098246520890105, "ma_50": 314.933, "ma_150": 302.7558, "ma_200": 289.5181, "sepa_pass": false, "rank": 4, "action": "BUY"}, {"ticker": "AAPL", "momentum_12_1": 0.17502572016460904, "quality_raw": 1.0155, "value_raw": 0.024022500205415416, "composite_score": 0.48964684749808285, "rs_score": -0.08216035307509584, "ma_50": 271.8, "ma_150": 244.37146666666663, "ma_200": 233.89355, "sepa_pass": false, "rank": 5, "action": "BUY"}, {"ticker": "NVDA", "momentum_12_1": 0.337962962962963, "quality_raw": 0.853, "value_raw": 0.024126633456409537, "composite_score": 0.4335210078934402, "rs_score": 0.23014358337501561, "ma_50": 184.80579999999998, "ma_150": 178.0998, "ma_200": 163.67565000000002, "sepa_pass": false, "rank": 6, "action": "BUY"}, {"ticker": "ABBV", "momentum_12_1": 0.29564226716035313, "quality_raw": 0.8674999999999999, "value_raw": 0.012908238804082227, "composite_score": 0.3653583024174826, "rs_score": 0.04566333420755364, "ma_50": 226.2028, "ma_150": 213.8851333333333, "ma_200": 206.82614999999998, "sepa_pass": false, "rank": 7, "action": "BUY"}, {"ticker": "LLY", "momentum_12_1": 0.42593064934018887, "quality_raw": 0.724, "value_raw": 0.021946885231064188, "composite_score": 0.34121238573263407, "rs_score": 0.19767679706699615, "ma_50": 1039.663, "ma_150": 859.9914, "ma_200": 838.53955, "sepa_pass": false, "rank": 8, "action": "BUY"}, {"ticker": "CVX", "momentum_12_1": -0.04525175270873161, "quality_raw": 0.08585000000000001, "value_raw": 0.3148125481610467, "composite_score": 0.33705209467966935, "rs_score": -0.13000915391545198, "ma_50": 153.3648, "ma_150": 153.46859999999998, "ma_200": 150.06, "sepa_pass": false, "rank": 9, "action": "BUY"}, {"ticker": "XOM", "momentum_12_1": 0.07327743346700699, "quality_raw": 0.1125, "value_raw": 0.27562446877635494, "composite_score": 0.31400950176353276, "rs_score": -0.012122788319916644, "ma_50": 118.89, "ma_150": 114.09599999999999, "ma_200": 112.0509, "sepa_pass": false, "rank": 10, "action": "BUY"}, {"ticker": "GOOGL", "momentum_12_1": 0.6251186333438787, "quality_raw": 0.3295, "value_raw": 0.06402903919249622, "composite_score": 0.20134199940525457, "rs_score": 0.5655858819028958, "ma_50": 308.3118, "ma_150": 246.83226666666664, "ma_200": 225.4986, "sepa_pass": true, "rank": 11, "action": "BUY"}, {"ticker": "GOOG", "momentum_12_1": 0.6190526040303583, "quality_raw": 0.3295, "value_raw": 0.06336250731105852, "composite_score": 0.19292090791385777, "rs_score": 0.5548090549397409, "ma_50": 309.0062, "ma_150": 247.56580000000002, "ma_200": 226.4766, "sepa_pass": true, "rank": 12, "action": "BUY"}, {"ticker": "AMD", "momentum_12_1": 0.788095443190628, "quality_raw": 0.0951, "value_raw": 0.09452618151937896, "composite_score": 0.18268794052711645, "rs_score": 0.7742766958194931, "ma_50": 220.8818, "ma_150": 189.622, "ma_200": 168.0457, "sepa_pass": true, "rank": 13, "action": "BUY"}, {"ticker": "GE", "momentum_12_1": 0.7017980323419655, "quality_raw": 0.3135, "value_raw": 0.03928423873539992, "composite_score": 0.14670573167513923, "rs_score": 0.6199738330636229, "ma_50": 304.46659999999997, "ma_150": 286.1451333333333, "ma_200": 267.96305, "sepa_pass": true, "rank": 14, "action": "BUY"}, {"ticker": "RTX", "momentum_12_1": 0.5243157277977737, "quality_raw": 0.11549999999999999, "value_raw": 0.1366630870909524, "composite_score": 0.14418707321920898, "rs_score": 0.4836098451873949, "ma_50": 179.5464, "ma_150": 164.68246666666667, "ma_200": 156.13425, "sepa_pass": true, "rank": 15, "action": "BUY"}, {"ticker": "HD", "momentum_12_1": -0.09111971077957115, "quality_raw": 0.8795, "value_raw": 0.035775017960467434, "composite_score": 0.12101507637720095, "rs_score": -0.22370353702062107, "ma_50": 356.2317999999999, "ma_150": 376.8898, "ma_200": 373.3724, "sepa_pass": false, "rank": 16, "action": "BUY"}, {"ticker": "CAT", "momentum_12_1": 0.5872110234949, "quality_raw": 0.32, "value_raw": 0.051190988442212385, "composite_score": 0.09983312940370344, "rs_score": 0.5527168525724782, "ma_50": 584.4526000000001, "ma_150": 490.19660000000005, "ma_200": 448.8512, "sepa_pass": true, "rank": 17, "action": "BUY"}, {"ticker": "AMAT", "momentum_12_1": 0.5045781744889144, "quality_raw": 0.3195, "value_raw": 0.056827489183746235, "composite_score": 0.04691505190461263, "rs_score": 0.6484615653929449, "ma_50": 258.2126, "ma_150": 213.57453333333333, "ma_200": 198.68505000000002, "sepa_pass": true, "rank": 18, "action": "BUY"}, {"ticker": "ABT", "momentum_12_1": 0.13670146876658995, "quality_raw": 0.25, "value_raw": 0.1494925526238109, "composite_score": 0.012377533710979605, "rs_score": -0.0960352462984082, "ma_50": 126.0316, "ma_150": 129.50846666666666, "ma_200": 129.92690000000002, "sepa_pass": false, "rank": 19, "action": "BUY"}, {"ticker": "MRK", "momentum_12_1": 0.006121424987456159, "quality_raw": 0.40149999999999997, "value_raw": 0.12914399719326175, "composite_score": -0.0015456631484205656, "rs_score": -0.07543004545521637, "ma_50": 100.3824, "ma_150": 88.86526666666667, "ma_200": 86.49825000000001, "sepa_pass": false, "rank": 20, "action": "BUY"}, {"ticker": "V", "momentum_12_1": 0.12229447733669807, "quality_raw": 0.589, "value_raw": 0.04293549334116203, "composite_score": -0.021532728565480053, "rs_score": -0.12849510604768066, "ma_50": 339.1482, "ma_150": 344.03846666666664, "ma_200": 345.04519999999997, "sepa_pass": false, "rank": 21, "action": "HOLD"}, {"ticker": "AVGO", "momentum_12_1": 0.5122830440587451, "quality_raw": 0.314, "value_raw": 0.031593982966663936, "composite_score": -0.06003161351480746, "rs_score": 0.33754112131874625, "ma_50": 358.3914000000001, "ma_150": 327.14300000000003, "ma_200": 297.1488, "sepa_pass": false, "rank": 22, "action": "HOLD"}, {"ticker": "CSCO", "momentum_12_1": 0.3188943199056127, "quality_raw": 0.22999999999999998, "value_raw": 0.09775157340438317, "composite_score": -0.06458692514853656, "rs_score": 0.07930204441706468, "ma_50": 76.25319999999999, "ma_150": 71.08366666666666, "ma_200": 68.3506, "sepa_pass": false, "rank": 23, "action": "HOLD"}, {"ticker": "ORCL", "momentum_12_1": 0.18303371505341937, "quality_raw": 0.505, "value_raw": 0.03925764483074228, "composite_score": -0.0880335961350082, "rs_score": 0.02554596671045206, "ma_50": 207.1056, "ma_150": 240.09893333333332, "ma_200": 217.50695000000005, "sepa_pass": false, "rank": 24, "action": "HOLD"}, {"ticker": "IBM", "momentum_12_1": 0.4174971297359358, "quality_raw": 0.237, "value_raw": 0.06252304175456425, "composite_score": -0.11421312704409342, "rs_score": 0.17928464770448205, "ma_50": 303.77459999999996, "ma_150": 282.48173333333335, "ma_200": 274.53974999999997, "sepa_pass": false, "rank": 25, "action": "HOLD"}, {"ticker": "MSFT", "momentum_12_1": 0.1423003825149758, "quality_raw": 0.40549999999999997, "value_raw": 0.06572201422783852, "composite_score": -0.13995047084282455, "rs_score": -0.09041575740967156, "ma_50": 485.92400000000004, "ma_150": 501.8477333333333, "ma_200": 481.87035, "sepa_pass": false, "rank": 26, "action": "HOLD"}, {"ticker": "KO", "momentum_12_1": 0.14393939393939403, "quality_raw": 0.374, "value_raw": 0.0729157565986002, "composite_score": -0.14800932702354797, "rs_score": -0.05298637332487477, "ma_50": 70.4738, "ma_150": 69.3612, "ma_200": 69.89535000000001, "sepa_pass": false, "rank": 27, "action": "HOLD"}, {"ticker": "META", "momentum_12_1": 0.089625578460244, "quality_raw": 0.36350000000000005, "value_raw": 0.07755147518732639, "composite_score": -0.1917874089637177, "rs_score": -0.14434947127055975, "ma_50": 639.5024, "ma_150": 701.7938666666666, "ma_200": 675.5459, "sepa_pass": false, "rank": 28, "action": "HOLD"}, {"ticker": "DHR", "momentum_12_1": -0.03825435569396518, "quality_raw": 0.1377, "value_raw": 0.16179912179116002, "composite_score": -0.23965715247572308, "rs_score": -0.17947456910213777, "ma_50": 226.7066, "ma_150": 210.35646666666668, "ma_200": 205.9534, "sepa_pass": false, "rank": 29, "action": "HOLD"}, {"ticker": "NFLX", "momentum_12_1": 0.13194109126026055, "quality_raw": 0.3555, "value_raw": 0.047645953631097575, "composite_score": -0.2898226343771654, "rs_score": -0.12613531447622028, "ma_50": 100.126, "ma_150": 114.14659999999999, "ma_200": 113.10865, "sepa_pass": false, "rank": 30, "action": "HOLD"}, {"ticker": "TMO", "momentum_12_1": 0.03396829386523992, "quality_raw": 0.162, "value_raw": 0.12437151045747097, "composite_score": -0.30092025570665865, "rs_score": -0.06755328380572712, "ma_50": 584.2923999999999, "ma_150": 513.0844666666667, "ma_200": 490.2026, "sepa_pass": false, "rank": 31, "action": "HOLD"}, {"ticker": "PM", "momentum_12_1": 0.33713176331560724, "quality_raw": 0.2035, "value_raw": 0.0423908435777872, "composite_score": -0.3163605578475042, "rs_score": 0.267543646843621, "ma_50": 156.6446, "ma_150": 163.35920000000002, "ma_200": 164.78334999999998, "sepa_pass": false, "rank": 32, "action": "HOLD"}, {"ticker": "LIN", "momentum_12_1": -0.024105408504762615, "quality_raw": 0.2295, "value_raw": 0.1099619087429132, "composite_score": -0.32969543900495923, "rs_score": -0.15918841776010906, "ma_50": 419.7618, "ma_150": 451.05233333333325, "ma_200": 451.99244999999996, "sepa_pass": false, "rank": 33, "action": "HOLD"}, {"ticker": "ADBE", "momentum_12_1": -0.14916042741876867, "quality_raw": 0.4595, "value_raw": 0.06787007666444826, "composite_score": -0.33086385839267124, "rs_score": -0.4522148629228322, "ma_50": 334.91700000000003, "ma_150": 350.9085333333333, "ma_200": 359.36814999999996, "sepa_pass": false, "rank": 34, "action": "HOLD"}, {"ticker": "PG", "momentum_12_1": -0.09146112432703146, "quality_raw": 0.2975, "value_raw": 0.10308288876948203, "composite_score": -0.33444506177376415, "rs_score": -0.28361884774312895, "ma_50": 144.842, "ma_150": 151.81806666666665, "ma_200": 154.87130000000002, "sepa_pass": false, "rank": 35, "action": "HOLD"}, {"ticker": "QCOM", "momentum_12_1": 0.12367579765561332, "quality_raw": 0.2475, "value_raw": 0.0704765646060991, "composite_score": -0.338035014478611, "rs_score": -0.17736838798164634, "ma_50": 172.6342, "ma_150": 164.8264, "ma_200": 159.90565, "sepa_pass": false, "rank": 36, "action": "HOLD"}, {"ticker": "WMT", "momentum_12_1": 0.2863751514483974, "quality_raw": 0.13715, "value_raw": 0.06471179155911039, "composite_score": -0.35290886165508617, "rs_score": 0.12389228807617036, "ma_50": 110.60340000000001, "ma_150": 103.69233333333334, "ma_200": 101.53845, "sepa_pass": false, "rank": 37, "action": "HOLD"}, {"ticker": "PEP", "momentum_12_1": 0.04325629527423258, "quality_raw": 0.2705, "value_raw": 0.06926667443418705, "composite_score": -0.38804980010050133, "rs_score": -0.17785136934720325, "ma_50": 145.3918, "ma_150": 143.45873333333336, "ma_200": 141.5461, "sepa_pass": false, "rank": 38, "action": "HOLD"}, {"ticker": "CRM", "momentum_12_1": -0.21314211534895222, "quality_raw": 0.1805, "value_raw": 0.13766845042917022, "composite_score": -0.44882039805736246, "rs_score": -0.46723125945261557, "ma_50": 249.4302, "ma_150": 251.79940000000002, "ma_200": 255.77125000000004, "sepa_pass": false, "rank": 39, "action": "HOLD"}, {"ticker": "TXN", "momentum_12_1": -0.08025839793281653, "quality_raw": 0.3325, "value_raw": 0.06256967670011147, "composite_score": -0.4514463891192389, "rs_score": -0.21166329594044175, "ma_50": 173.3788, "ma_150": 185.10913333333335, "ma_200": 181.7561, "sepa_pass": false, "rank": 40, "action": "HOLD"}, {"ticker": "AMZN", "momentum_12_1": 0.021950771491550336, "quality_raw": 0.177, "value_raw": 0.08427315656231318, "composite_score": -0.46302595856212886, "rs_score": -0.09525467596766757, "ma_50": 233.5716, "ma_150": 227.33353333333332, "ma_200": 218.9884, "sepa_pass": false, "rank": 41, "action": "HOLD"}, {"ticker": "MCD", "momentum_12_1": 0.13193408622771519, "quality_raw": 0.2345, "value_raw": 0.03821169277799006, "composite_score": -0.4838465220703328, "rs_score": -0.0929980894726199, "ma_50": 308.0982, "ma_150": 304.3126, "ma_200": 306.2718, "sepa_pass": false, "rank": 42, "action": "HOLD"}, {"ticker": "UNH", "momentum_12_1": -0.372678118218266, "quality_raw": 0.10654999999999999, "value_raw": 0.18348029272769947, "composite_score": -0.49568589588622297, "rs_score": -0.5656414598086609, "ma_50": 330.0754, "ma_150": 320.9528666666667, "ma_200": 340.74545, "sepa_pass": false, "rank": 43, "action": "HOLD"}, {"ticker": "INTU", "momentum_12_1": 0.04937479961526137, "quality_raw": 0.1885, "value_raw": 0.06509757634069804, "composite_score": -0.5044541906137314, "rs_score": -0.299992689927284, "ma_50": 650.7474000000001, "ma_150": 692.2347333333332, "ma_200": 683.04015, "sepa_pass": false, "rank": 44, "action": "HOLD"}, {"ticker": "ACN", "momentum_12_1": -0.2129860454454282, "quality_raw": 0.21000000000000002, "value_raw": 0.11083743842364532, "composite_score": -0.5249614992449435, "rs_score": -0.36427621148343403, "ma_50": 262.2532, "ma_150": 262.3131333333333, "ma_200": 273.00530000000003, "sepa_pass": false, "rank": 45, "action": "HOLD"}, {"ticker": "COST", "momentum_12_1": -0.06178384919812918, "quality_raw": 0.1698, "value_raw": 0.04679939889876032, "composite_score": -0.7083792952521311, "rs_score": -0.14594138821134806, "ma_50": 897.0008, "ma_150": 935.5766000000001, "ma_200": 950.4989, "sepa_pass": false, "rank": 46, "action": "HOLD"}, {"ticker": "ADI", "momentum_12_1": 0.3064989517819705, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.21837977038169432, "ma_50": 265.627, "ma_150": 247.87306666666666, "ma_200": 236.51824999999997, "sepa_pass": false, "rank": 47, "action": "HOLD"}, {"ticker": "AMGN", "momentum_12_1": 0.21793335829277405, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.04657700543029564, "ma_50": 329.9602, "ma_150": 303.8013333333334, "ma_200": 298.55870000000004, "sepa_pass": false, "rank": 48, "action": "HOLD"}, {"ticker": "ANET", "momentum_12_1": 0.0955530415107475, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.0525730203691992, "ma_50": 129.6396, "ma_150": 129.8436, "ma_200": 118.52510000000001, "sepa_pass": false, "rank": 49, "action": "HOLD"}, {"ticker": "APH", "momentum_12_1": 0.8485840330155119, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.0062192677700745, "ma_50": 137.8244, "ma_150": 121.04359999999998, "ma_200": 110.42455, "sepa_pass": true, "rank": 50, "action": "HOLD"}, {"ticker": "AXP", "momentum_12_1": 0.2737048874683712, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.0007779296276362313, "ma_50": 368.14239999999995, "ma_150": 337.31733333333335, "ma_200": 322.0769, "sepa_pass": false, "rank": 51, "action": "HOLD"}, {"ticker": "BA", "momentum_12_1": 0.23039156987187148, "quality_raw": -0.102, "value_raw": null, "composite_score": NaN, "rs_score": 0.29426777669719417, "ma_50": 206.9242, "ma_150": 215.82086666666666, "ma_200": 208.2666, "sepa_pass": false, "rank": 52, "action": "HOLD"}, {"ticker": "BAC", "momentum_12_1": 0.20860637833114892, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.040709594212257505, "ma_50": 54.0876, "ma_150": 50.71653333333333, "ma_200": 48.33135, "sepa_pass": false, "rank": 53, "action": "HOLD"}, {"ticker": "BKNG", "momentum_12_1": 0.1420625636926347, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.10234287659372265, "ma_50": 5165.1378, "ma_150": 5369.134866666666, "ma_200": 5286.880700000001, "sepa_pass": false, "rank": 54, "action": "HOLD"}, {"ticker": "BLK", "momentum_12_1": 0.12353997736640476, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.011850712590657952, "ma_50": 1070.343, "ma_150": 1096.7300666666667, "ma_200": 1055.6694499999999, "sepa_pass": false, "rank": 55, "action": "HOLD"}, {"ticker": "BMY", "momentum_12_1": -0.026013634732687474, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.1732400518086339, "ma_50": 51.347, "ma_150": 47.950066666666665, "ma_200": 48.33005, "sepa_pass": false, "rank": 56, "action": "HOLD"}, {"ticker": "BSX", "momentum_12_1": -0.03617354939885009, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.24778351784118624, "ma_50": 97.24240000000002, "ma_150": 100.61466666666666, "ma_200": 100.65965, "sepa_pass": false, "rank": 57, "action": "HOLD"}, {"ticker": "BX", "momentum_12_1": -0.11209544058587284, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.23928750000705024, "ma_50": 150.1616, "ma_150": 159.82413333333332, "ma_200": 153.95735, "sepa_pass": false, "rank": 58, "action": "HOLD"}, {"ticker": "C", "momentum_12_1": 0.5346938775510204, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.4090676010695249, "ma_50": 109.57379999999999, "ma_150": 99.1636, "ma_200": 91.96185, "sepa_pass": true, "rank": 59, "action": "HOLD"}, {"ticker": "CB", "momentum_12_1": 0.17739444842002183, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.05494605817745879, "ma_50": 301.5608, "ma_150": 285.5090666666667, "ma_200": 286.19565, "sepa_pass": false, "rank": 60, "action": "HOLD"}, {"ticker": "COF", "momentum_12_1": 0.2982351667388481, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.093832908665062, "ma_50": 230.6332, "ma_150": 220.9106, "ma_200": 211.38745000000003, "sepa_pass": false, "rank": 61, "action": "HOLD"}, {"ticker": "COP", "momentum_12_1": -0.1003051106025934, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.24575913969543084, "ma_50": 92.1982, "ma_150": 92.83319999999999, "ma_200": 91.9596, "sepa_pass": false, "rank": 62, "action": "HOLD"}, {"ticker": "CRWD", "momentum_12_1": 0.40061487185380984, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.11829336056077122, "ma_50": 499.531, "ma_150": 481.3867333333334, "ma_200": 466.04565, "sepa_pass": false, "rank": 63, "action": "HOLD"}, {"ticker": "DE", "momentum_12_1": 0.1288427285975342, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.0023396688427608225, "ma_50": 477.7882, "ma_150": 484.4909333333333, "ma_200": 484.2068, "sepa_pass": false, "rank": 64, "action": "HOLD"}, {"ticker": "DIS", "momentum_12_1": 0.021920088790232883, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.14010051900869502, "ma_50": 110.02120000000001, "ma_150": 114.37066666666665, "ma_200": 110.8207, "sepa_pass": false, "rank": 65, "action": "HOLD"}, {"ticker": "ETN", "momentum_12_1": -0.020373963662021488, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.20866660921363578, "ma_50": 338.4758, "ma_150": 355.33466666666664, "ma_200": 341.6414, "sepa_pass": false, "rank": 66, "action": "HOLD"}, {"ticker": "GEV", "momentum_12_1": 0.782425574216502, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.49105921485520576, "ma_50": 622.397, "ma_150": 601.8785333333333, "ma_200": 550.5402, "sepa_pass": true, "rank": 67, "action": "HOLD"}, {"ticker": "GILD", "momentum_12_1": 0.3162637362637364, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.14349983550175938, "ma_50": 123.09480000000002, "ma_150": 117.16779999999999, "ma_200": 114.33825, "sepa_pass": false, "rank": 68, "action": "HOLD"}, {"ticker": "HON", "momentum_12_1": -0.09633867276887875, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.20495441048109064, "ma_50": 196.97580000000002, "ma_150": 209.75686666666667, "ma_200": 210.39700000000002, "sepa_pass": false, "rank": 69, "action": "HOLD"}, {"ticker": "INTC", "momentum_12_1": 0.9536458333333333, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.3276390296409535, "ma_50": 38.8428, "ma_150": 31.081066666666665, "ma_200": 28.441550000000003, "sepa_pass": true, "rank": 70, "action": "HOLD"}, {"ticker": "ISRG", "momentum_12_1": 0.038301662707838524, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.18446261327274383, "ma_50": 565.1342, "ma_150": 511.58386666666667, "ma_200": 514.5472, "sepa_pass": false, "rank": 71, "action": "HOLD"}, {"ticker": "JNJ", "momentum_12_1": 0.4795854922279792, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.3278635546841313, "ma_50": 203.8932, "ma_150": 183.67506666666668, "ma_200": 176.2321, "sepa_pass": true, "rank": 72, "action": "HOLD"}, {"ticker": "KKR", "momentum_12_1": -0.06153846153846154, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.27486126041589765, "ma_50": 127.1532, "ma_150": 132.56853333333333, "ma_200": 128.14345, "sepa_pass": false, "rank": 73, "action": "HOLD"}, {"ticker": "KLAC", "momentum_12_1": 0.7470125203205658, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.0140924610834048, "ma_50": 1238.6016, "ma_150": 1062.0411333333334, "ma_200": 976.8653499999999, "sepa_pass": true, "rank": 74, "action": "HOLD"}, {"ticker": "LMT", "momentum_12_1": -8.256615613255747e-05, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.003826262161010341, "ma_50": 480.8376, "ma_150": 470.84639999999996, "ma_200": 470.18379999999996, "sepa_pass": false, "rank": 75, "action": "HOLD"}, {"ticker": "LOW", "momentum_12_1": -0.009594330984513677, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.08623692083478196, "ma_50": 243.65740000000002, "ma_150": 242.09646666666663, "ma_200": 237.66389999999998, "sepa_pass": false, "rank": 76, "action": "HOLD"}, {"ticker": "LRCX", "momentum_12_1": 1.1889155342392752, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.7082545372348783, "ma_50": 169.94100000000003, "ma_150": 132.83653333333336, "ma_200": 118.59145000000001, "sepa_pass": true, "rank": 77, "action": "HOLD"}, {"ticker": "MDT", "momentum_12_1": 0.15624633431085044, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.027737314445067884, "ma_50": 98.363, "ma_150": 94.13406666666666, "ma_200": 91.69359999999999, "sepa_pass": false, "rank": 78, "action": "HOLD"}, {"ticker": "MS", "momentum_12_1": 0.42665703739367666, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.34547725785472316, "ma_50": 173.97299999999998, "ma_150": 157.30393333333333, "ma_200": 147.97070000000002, "sepa_pass": true, "rank": 79, "action": "HOLD"}, {"ticker": "MU", "momentum_12_1": 1.4394001643385375, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 2.268552478011263, "ma_50": 263.18379999999996, "ma_150": 184.52453333333332, "ma_200": 160.00695, "sepa_pass": true, "rank": 80, "action": "HOLD"}, {"ticker": "NEE", "momentum_12_1": 0.2010885554574875, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.020004431229655895, "ma_50": 82.31620000000001, "ma_150": 77.6414, "ma_200": 75.45815, "sepa_pass": false, "rank": 81, "action": "SELL"}, {"ticker": "NEM", "momentum_12_1": 1.4823207171314743, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.6548468649663188, "ma_50": 95.9446, "ma_150": 80.2424, "ma_200": 73.24535, "sepa_pass": true, "rank": 82, "action": "SELL"}, {"ticker": "NOW", "momentum_12_1": -0.25802385338892664, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.5530827131432348, "ma_50": 160.0116, "ma_150": 178.41753333333335, "ma_200": 180.29534999999998, "sepa_pass": false, "rank": 83, "action": "SELL"}, {"ticker": "PANW", "momentum_12_1": 0.089693985226873, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.08848830064395696, "ma_50": 193.4914, "ma_150": 196.34946666666667, "ma_200": 192.7795, "sepa_pass": false, "rank": 84, "action": "SELL"}, {"ticker": "PFE", "momentum_12_1": 0.0007572889057174681, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.20871714857436896, "ma_50": 25.287, "ma_150": 24.921266666666668, "ma_200": 24.46585, "sepa_pass": false, "rank": 85, "action": "SELL"}, {"ticker": "PGR", "momentum_12_1": -0.014180847514180805, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.3401787881768642, "ma_50": 222.1218, "ma_150": 236.74, "ma_200": 246.65315, "sepa_pass": false, "rank": 86, "action": "SELL"}, {"ticker": "PH", "momentum_12_1": 0.36546575787082114, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.270887974788633, "ma_50": 870.405, "ma_150": 779.0756, "ma_200": 739.9547, "sepa_pass": false, "rank": 87, "action": "SELL"}, {"ticker": "PLD", "momentum_12_1": 0.20847206807251184, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.038774804705696386, "ma_50": 127.4384, "ma_150": 117.21166666666667, "ma_200": 114.0544, "sepa_pass": false, "rank": 88, "action": "SELL"}, {"ticker": "PLTR", "momentum_12_1": 1.780306478531331, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 1.4975146175638787, "ma_50": 178.60039999999998, "ma_150": 169.31146666666666, "ma_200": 155.0075, "sepa_pass": false, "rank": 89, "action": "SELL"}, {"ticker": "SCHW", "momentum_12_1": 0.3171136300801769, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.23148660129333587, "ma_50": 96.7482, "ma_150": 94.9172, "ma_200": 91.78965, "sepa_pass": false, "rank": 90, "action": "SELL"}, {"ticker": "SPGI", "momentum_12_1": 0.03129192726071772, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.06319941236783966, "ma_50": 508.98159999999996, "ma_150": 516.3886666666667, "ma_200": 511.3081, "sepa_pass": false, "rank": 91, "action": "SELL"}, {"ticker": "SYK", "momentum_12_1": -0.02064498346196253, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.18988210229583447, "ma_50": 360.0298, "ma_150": 374.96166666666664, "ma_200": 374.2185, "sepa_pass": false, "rank": 92, "action": "SELL"}, {"ticker": "T", "momentum_12_1": 0.11513761467889894, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.10049552693397001, "ma_50": 24.807399999999998, "ma_150": 26.764333333333333, "ma_200": 26.93155, "sepa_pass": false, "rank": 93, "action": "SELL"}, {"ticker": "TJX", "momentum_12_1": 0.31424018785642405, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.12060000470524956, "ma_50": 152.1402, "ma_150": 140.0624, "ma_200": 136.95675, "sepa_pass": false, "rank": 94, "action": "SELL"}, {"ticker": "TMUS", "momentum_12_1": -0.08413483985432813, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.29884181201870974, "ma_50": 203.2706, "ma_150": 225.12366666666665, "ma_200": 230.8043, "sepa_pass": false, "rank": 95, "action": "SELL"}, {"ticker": "TSLA", "momentum_12_1": 0.19918760722575435, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.08253354074960062, "ma_50": 443.204, "ma_150": 392.63013333333333, "ma_200": 368.2787, "sepa_pass": false, "rank": 96, "action": "SELL"}, {"ticker": "UBER", "momentum_12_1": 0.26249228871067243, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.11232954989594002, "ma_50": 86.36699999999999, "ma_150": 90.987, "ma_200": 88.49785, "sepa_pass": false, "rank": 97, "action": "SELL"}, {"ticker": "UNP", "momentum_12_1": 0.048347719940709855, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": -0.18410131389379236, "ma_50": 229.71200000000002, "ma_150": 226.93106666666665, "ma_200": 225.4687, "sepa_pass": false, "rank": 98, "action": "SELL"}, {"ticker": "WELL", "momentum_12_1": 0.5013005438637976, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.2942229344253786, "ma_50": 192.38739999999999, "ma_150": 174.48486666666668, "ma_200": 168.0284, "sepa_pass": false, "rank": 99, "action": "SELL"}, {"ticker": "WFC", "momentum_12_1": 0.30495856159572976, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": 0.06058607276498784, "ma_50": 89.85459999999999, "ma_150": 84.01713333333333, "ma_200": 80.78475, "sepa_pass": false, "rank": 100, "action": "SELL"}]}, {"id": "sp500_bottom100", "name": "S&P 500 Bottom 100", "universe_size": 100, "buy_count": 20, "sell_count": 20, "sepa_count": 16, "sepa_candidates": [{"ticker": "HII", "momentum_12_1": 0.6672238261662362, "quality_raw": null, "value_raw": null, "composite_score": 1.0200732985022256, "rs_score": 0.9325344356076253, "ma_50": 333.8092, "ma_150": 290.52646666666664, "ma_200": 273.0526, "sepa_pass": true, "rank": 1, "action": "BUY"}, {"ticker": "IVZ", "momentum_12_1": 0.5705669481302775, "quality_raw": null, "value_raw": null, "composite_score": 0.8866923453815326, "rs_score": 0.5835899745545041, "ma_50": 25.6798, "ma_150": 22.367733333333334, "ma_200": 20.3233, "sepa_pass": true, "rank": 2, "action": "BUY"}, {"ticker": "TKO", "momentum_12_1": 0.44958423590245244, "quality_raw": null, "value_raw": null, "composite_score": 0.7197431349790349, "rs_score": 0.2705489124816587, "ma_50": 198.3362, "ma_150": 188.3748, "ma_200": 180.6787, "sepa_pass": true, "rank": 4, "action": "BUY"}, {"ticker": "HAS", "momentum_12_1": 0.43235605793006004, "quality_raw": null, "value_raw": null, "composite_score": 0.6959692365748702, "rs_score": 0.3455891061745695, "ma_50": 81.4898, "ma_150": 77.94893333333333, "ma_200": 73.78255, "sepa_pass": true, "rank": 5, "action": "BUY"}, {"ticker": "GL", "momentum_12_1": 0.2334473384197142, "quality_raw": null, "value_raw": null, "composite_score": 0.42148660138737254, "rs_score": 0.037140915109689754, "ma_50": 136.56719999999999, "ma_150": 134.73733333333334, "ma_200": 131.39555000000001, "sepa_pass": true, "rank": 8, "action": "BUY"}, {"ticker": "EVRG", "momentum_12_1": 0.2109132494690411, "quality_raw": null, "value_raw": null, "composite_score": 0.3903908498690057, "rs_score": 0.049005364117890915, "ma_50": 74.5674, "ma_150": 73.111, "ma_200": 71.5918, "sepa_pass": true, "rank": 11, "action": "BUY"}, {"ticker": "AES", "momentum_12_1": 0.16962025316455698, "quality_raw": null, "value_raw": null, "composite_score": 0.3334088811129659, "rs_score": 0.02953776381816864, "ma_50": 14.0026, "ma_150": 13.375399999999999, "ma_200": 12.704600000000001, "sepa_pass": true, "rank": 12, "action": "BUY"}, {"ticker": "SOLV", "momentum_12_1": 0.166690411739564, "quality_raw": null, "value_raw": null, "composite_score": 0.3293658678303243, "rs_score": -0.042995438706864286, "ma_50": 80.1182, "ma_150": 75.39473333333332, "ma_200": 74.0447, "sepa_pass": true, "rank": 13, "action": "BUY"}, {"ticker": "NDSN", "momentum_12_1": 0.14647316908538643, "quality_raw": null, "value_raw": null, "composite_score": 0.30146723144271687, "rs_score": 0.12195061860323442, "ma_50": 240.301, "ma_150": 228.5986, "ma_200": 220.27550000000002, "sepa_pass": true, "rank": 14, "action": "BUY"}, {"ticker": "AIZ", "momentum_12_1": 0.13929862264335235, "quality_raw": null, "value_raw": null, "composite_score": 0.291566768463857, "rs_score": -0.02926403440775882, "ma_50": 230.6496, "ma_150": 213.51033333333334, "ma_200": 209.2006, "sepa_pass": true, "rank": 15, "action": "BUY"}, {"ticker": "LNT", "momentum_12_1": 0.13566360962104174, "quality_raw": null, "value_raw": null, "composite_score": 0.28655065878419667, "rs_score": -0.02861926187430286, "ma_50": 66.3272, "ma_150": 65.34553333333334, "ma_200": 64.34195, "sepa_pass": true, "rank": 16, "action": "BUY"}, {"ticker": "TXT", "momentum_12_1": 0.12685802152742176, "quality_raw": null, "value_raw": null, "composite_score": 0.2743994517870255, "rs_score": 0.00984473611626524, "ma_50": 85.72959999999999, "ma_150": 82.80493333333334, "ma_200": 79.8357, "sepa_pass": true, "rank": 18, "action": "BUY"}, {"ticker": "CRL", "momentum_12_1": 0.11270215633423186, "quality_raw": null, "value_raw": null, "composite_score": 0.2548651689705116, "rs_score": 0.06585780771822214, "ma_50": 189.4452, "ma_150": 171.47233333333332, "ma_200": 160.9957, "sepa_pass": true, "rank": 19, "action": "BUY"}, {"ticker": "MRNA", "momentum_12_1": -0.13174695298897265, "quality_raw": null, "value_raw": null, "composite_score": -0.08246059463323009, "rs_score": -0.04683378908607305, "ma_50": 28.9584, "ma_150": 27.991333333333333, "ma_200": 27.564599999999995, "sepa_pass": true, "rank": 63, "action": "HOLD"}, {"ticker": "IPG", "momentum_12_1": NaN, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": null, "ma_50": null, "ma_150": null, "ma_200": null, "sepa_pass": true, "rank": 99, "action": "SELL"}, {"ticker": "WBA", "momentum_12_1": NaN, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": null, "ma_50": null, "ma_150": null, "ma_200": null, "sepa_pass": true, "rank": 100, "action": "SELL"}], "sepa_charts": [{"ticker": "HII", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [172.3, 193.59, 193.93, 195.97, 197.03, 195.01, 191.73, 195.51, 196.16, 207.13, 208.57, 207.43, 201.71, 201.47, 205.89, 206.25, 203.27, 203.15, 205.32, 204.04, 202.2, 204.93, 199.22, 184.95, 183.31, 187.54, 200.08, 200.89, 215.74, 219.95, 217.98, 215.6, 219.48, 217.86, 217.22, 217.93, 221.9, 226.05, 228.35, 230.37, 230.34, 227.48, 230.02, 233.18, 232.9, 230.21, 232.95, 231.63, 229.74, 225.73, 223.11, 228.16, 230.05, 229.35, 228.02, 223.38, 224.49, 224.74, 227.84, 225.6, 223.68, 223.06, 222.8, 227.96, 224.79, 224.78, 226.49, 228.07, 223.3, 226.15, 229.12, 232.73, 229.26, 234.08, 234.21, 234.54, 237.1, 231.63, 235.12, 239.83, 238.65, 241.46, 246.31, 250.15, 252.08, 253.53, 247.95, 248.92, 258.11, 258.18, 258.5, 253.68, 253.82, 255.35, 254.49, 252.93, 253.96, 265.56, 263.33, 264.82, 262.49, 260.84, 258.52, 278.86, 269.83, 265.67, 270.92, 267.49, 266.45, 264.69, 266.65, 268.0, 269.43, 267.46, 266.25, 267.6, 265.4, 267.09, 266.48, 269.98, 270.72, 271.74, 276.39, 275.27, 270.79, 269.71, 269.33, 269.98, 271.13, 269.94, 267.07, 271.93, 276.07, 274.71, 273.02, 273.19, 272.46, 274.69, 275.13, 276.16, 276.01, 277.51, 271.25, 278.77, 279.53, 287.91, 286.01, 282.22, 284.24, 288.49, 285.38, 290.83, 286.14, 282.99, 287.9, 291.94, 284.96, 282.66, 280.02, 285.77, 287.53, 283.64, 290.09, 299.91, 301.69, 299.14, 298.42, 319.07, 322.02, 317.54, 315.9, 306.68, 305.43, 309.56, 318.66, 324.19, 317.89, 312.67, 313.97, 309.74, 309.16, 309.74, 301.83, 305.49, 309.92, 314.73, 314.31, 313.62, 306.65, 307.2, 309.23, 315.88, 304.58, 315.88, 314.95, 323.14, 326.72, 326.92, 329.16, 326.8, 321.29, 322.63, 336.64, 353.52, 354.52, 355.45, 351.13, 345.73, 341.98, 340.07, 349.75, 363.48, 367.6, 356.45, 378.47, 386.99, 398.25, 411.66, 415.39, 418.86], "ma50": [185.755, 185.73800000000003, 185.86440000000002, 185.9748, 186.1072, 186.1582, 186.1562, 186.25800000000004, 186.41300000000004, 186.7762, 187.1954, 187.58239999999998, 187.88260000000002, 188.13100000000003, 188.45559999999998, 188.7802, 188.94279999999998, 189.05719999999997, 189.18959999999998, 189.25, 189.243, 189.1694, 189.0504, 188.6666, 188.2784, 187.96939999999998, 188.05560000000003, 188.21559999999997, 188.62040000000002, 189.0742, 189.50259999999997, 189.89939999999999, 190.37739999999997, 191.53959999999998, 192.5142, 193.5074, 194.59, 195.8412, 197.1918, 198.57379999999998, 199.7864, 200.86059999999998, 201.9032, 203.16099999999997, 204.44279999999998, 205.53740000000002, 206.7326, 207.87959999999998, 208.9628, 210.02380000000002, 211.04, 211.7314, 212.45379999999997, 213.1214, 213.7412, 214.3086, 214.96379999999996, 215.54840000000002, 216.18199999999996, 216.5514, 216.8536, 217.1662, 217.588, 218.1178, 218.49580000000003, 218.8664, 219.3308, 219.82920000000001, 220.18880000000001, 220.63099999999997, 221.16940000000002, 221.7254, 222.3262, 223.30880000000002, 224.3268, 225.2668, 226.0072, 226.622, 227.00959999999998, 227.40720000000002, 227.8206, 228.33780000000002, 228.87440000000004, 229.52020000000002, 230.21740000000003, 230.92940000000002, 231.45039999999997, 231.90779999999998, 232.503, 233.05920000000003, 233.62240000000003, 234.14640000000003, 234.62240000000003, 235.06580000000002, 235.49760000000003, 235.952, 236.37220000000002, 237.05079999999998, 237.72259999999997, 238.50440000000003, 239.292, 239.9456, 240.515, 241.5052, 242.3414, 243.18720000000002, 244.1158, 244.97079999999997, 245.74300000000002, 246.5248, 247.38420000000002, 248.28300000000002, 249.21559999999997, 250.00560000000002, 250.8348, 251.69120000000004, 252.46939999999998, 253.2498, 254.1134, 254.99, 255.822, 256.60220000000004, 257.5448, 258.3686, 259.1002, 259.8036, 260.4482, 261.2152, 261.9354, 262.5376, 263.106, 263.7154, 264.31059999999997, 264.8018, 265.2206, 265.61379999999997, 266.10400000000004, 266.61940000000004, 266.9598, 267.3194, 267.6696, 268.14619999999996, 268.4948, 268.9632, 269.464, 270.1636, 270.8046, 271.1378, 271.55600000000004, 272.0294, 272.4872, 273.087, 273.6394, 273.722, 274.0834, 274.60880000000003, 274.8896, 275.193, 275.4644, 275.886, 276.30359999999996, 276.6164, 277.0296, 277.6786, 278.38739999999996, 279.0182, 279.6786, 280.7182, 281.829, 282.7802, 283.68379999999996, 284.38259999999997, 284.9634, 285.6492, 286.6066, 287.6962, 288.6674, 289.52119999999996, 290.378, 291.17400000000004, 292.0158, 292.772, 293.2872, 293.9028, 294.64079999999996, 295.4716, 296.3086, 297.0872, 297.7176, 298.3384, 299.0028, 299.7702, 300.4368, 301.179, 301.8874, 302.592, 303.4062, 304.30019999999996, 305.1986, 305.96479999999997, 306.68300000000005, 307.319, 308.32899999999995, 309.7396, 311.072, 312.3422, 313.66560000000004, 314.927, 316.1662, 317.25219999999996, 318.4966, 320.0934, 321.6436, 322.7744, 324.31, 326.067, 328.0636, 329.91540000000003, 331.7828, 333.8092], "ma150": [222.9891333333333, 222.43066666666667, 221.8584666666667, 221.29840000000002, 220.83193333333335, 220.37633333333335, 219.94766666666666, 219.54073333333335, 219.15886666666668, 218.82933333333335, 218.49026666666668, 218.11493333333334, 217.70786666666666, 217.27346666666665, 216.84853333333334, 216.41973333333334, 215.96886666666668, 215.48833333333334, 215.04753333333332, 214.59373333333335, 214.11166666666668, 213.63226666666668, 213.11433333333332, 212.48033333333333, 211.81666666666666, 211.1818, 210.67933333333332, 210.19013333333334, 209.8222, 209.4938, 209.16206666666668, 208.86026666666666, 208.606, 208.33653333333334, 208.041, 207.72580000000002, 207.43573333333333, 207.14926666666668, 206.88473333333332, 206.63713333333334, 206.3852, 206.18626666666665, 206.00626666666665, 205.82506666666666, 205.62393333333333, 205.39613333333335, 205.1848, 204.9855333333333, 204.80079999999998, 204.58366666666666, 204.36186666666666, 204.16353333333333, 203.97666666666666, 203.82, 203.61086666666665, 203.36113333333333, 203.12886666666668, 202.8894, 202.66253333333333, 202.423, 202.17260000000002, 201.9456, 201.72426666666667, 201.54600000000002, 201.3524, 201.14986666666667, 200.96806666666666, 200.81859999999998, 201.07420000000002, 201.32033333333334, 201.5742, 201.83746666666667, 202.01113333333333, 202.25286666666668, 202.4632, 202.64926666666668, 202.86593333333332, 203.05013333333335, 203.3154, 203.62386666666666, 203.9062, 204.23853333333332, 204.61226666666667, 204.97793333333334, 205.33213333333333, 205.69646666666665, 206.0296, 206.35993333333334, 206.76119999999997, 207.18346666666667, 207.62766666666664, 208.03286666666668, 208.4658, 208.91513333333333, 209.3234, 209.7364, 210.15266666666668, 210.65073333333333, 211.12533333333334, 211.56900000000002, 212.029, 212.47166666666666, 212.9444, 213.53379999999999, 214.06326666666666, 214.55133333333333, 215.0786, 215.5924, 216.11266666666668, 216.61746666666667, 217.1444, 217.6772, 218.22873333333334, 218.7514666666667, 219.26206666666664, 219.77926666666667, 220.24766666666667, 220.71206666666666, 221.16393333333332, 221.62366666666668, 222.07813333333328, 222.49900000000005, 222.9738, 223.44799999999998, 223.90179999999998, 224.3466, 224.83700000000002, 225.3509333333334, 225.85513333333336, 226.3396666666667, 226.80973333333338, 227.31753333333336, 227.85413333333335, 228.62053333333336, 229.3174, 230.01686666666666, 230.7148, 231.45613333333338, 232.21820000000002, 232.98413333333335, 233.69279999999998, 234.38440000000003, 235.00679999999997, 235.73, 236.46813333333333, 237.21766666666667, 237.96980000000002, 238.68940000000003, 239.4138, 240.18586666666664, 240.93973333333338, 241.588, 242.2027333333333, 242.78286666666668, 243.38866666666664, 244.03486666666663, 244.6564, 245.2374, 245.79646666666667, 246.32073333333335, 246.84713333333332, 247.3552, 247.94439999999997, 248.60066666666665, 249.23933333333335, 249.8586, 250.49293333333335, 251.26573333333334, 252.0437333333333, 252.8004, 253.5584, 254.23673333333335, 254.94480000000001, 255.7755333333333, 256.67786666666666, 257.58886666666666, 258.37426666666664, 259.11946666666665, 259.77433333333335, 260.3729333333333, 260.9808, 261.6084, 262.1574, 262.7416, 263.3596, 264.0049333333334, 264.62100000000004, 265.20480000000003, 265.72679999999997, 266.239, 266.7649333333333, 267.35426666666666, 267.8513333333333, 268.4026666666667, 268.94966666666664, 269.56919999999997, 270.19433333333336, 270.82959999999997, 271.49240000000003, 272.16619999999995, 272.82073333333335, 273.45053333333334, 274.16113333333334, 274.9889333333333, 275.83226666666667, 276.7127333333333, 277.55699999999996, 278.3636, 279.1245333333333, 279.8876666666667, 280.72813333333335, 281.66426666666666, 282.6296, 283.4862, 284.51073333333335, 285.5921333333333, 286.73720000000003, 287.9611333333333, 289.2417333333333, 290.52646666666664], "ma200": [230.37054999999998, 230.08035, 229.7692, 229.47105, 229.17825000000002, 228.8845, 228.5707, 228.28385000000003, 227.98364999999998, 227.75555, 227.5569, 227.33795, 227.081, 226.83645, 226.61360000000002, 226.38705000000002, 226.15024999999997, 225.91995, 225.70685, 225.5043, 225.29885, 225.12219999999996, 224.926, 224.6406, 224.3275, 224.0284, 223.78425000000004, 223.5327, 223.3538, 223.20574999999997, 223.05605, 222.90239999999997, 222.76585000000003, 222.61775, 222.47324999999998, 222.34754999999998, 222.24204999999998, 222.16264999999999, 222.071, 221.96435000000002, 221.86135, 221.72115000000002, 221.53395, 221.36415, 221.19260000000003, 221.02655, 220.86065, 220.68535, 220.50755, 220.26645, 220.00185, 219.75584999999998, 219.50730000000004, 219.25415, 219.05925, 218.85940000000002, 218.70170000000002, 218.54264999999998, 218.41465, 218.25985, 218.0811, 217.87775, 217.67790000000002, 217.48455, 217.26035, 217.0314, 216.80934999999997, 216.57354999999998, 216.33285, 216.10305, 215.8761, 215.65555, 215.41729999999998, 215.18744999999998, 214.9442, 214.70305, 214.51129999999998, 214.2981, 214.11905, 213.97215, 213.8267, 213.72965, 213.67309999999998, 213.63244999999998, 213.58509999999998, 213.52669999999998, 213.43940000000003, 213.3389, 213.2893, 213.24265, 213.1945, 213.1763, 213.16030000000003, 213.13525, 213.09235, 213.03509999999997, 212.98165, 213.00185000000002, 213.03125, 213.06384999999997, 213.09440000000004, 213.10905, 213.11125, 213.24129999999997, 213.2935, 213.31765, 213.37560000000002, 213.40974999999997, 213.43265, 213.44845, 213.47549999999998, 213.52994999999999, 213.59709999999998, 213.6609, 213.72299999999998, 213.7852, 213.8434, 213.9264, 214.334, 214.73775, 215.13615, 215.52865000000003, 215.89455, 216.2818, 216.62245, 216.93785, 217.2615, 217.59140000000002, 217.9704, 218.35230000000004, 218.70615, 219.10775, 219.53685000000002, 219.9339, 220.30425, 220.6758, 221.0482, 221.4248, 221.81085, 222.21745, 222.63815, 223.06119999999999, 223.47305, 223.92715, 224.35855000000004, 224.8432, 225.31565000000003, 225.7725, 226.233, 226.6841, 227.14355000000003, 227.6255, 228.11814999999999, 228.58085000000003, 229.0683, 229.5657, 230.03134999999997, 230.49255000000002, 230.95059999999998, 231.43460000000002, 231.93420000000003, 232.412, 232.92894999999996, 233.48325, 234.0434, 234.58900000000003, 235.1054, 235.7136, 236.33019999999996, 236.91279999999998, 237.47955, 237.96990000000002, 238.47119999999998, 238.99829999999997, 239.578, 240.18400000000003, 240.79460000000003, 241.39350000000002, 241.98585000000003, 242.54825, 243.11125, 243.68115, 244.2124, 244.9411, 245.64825000000002, 246.38055, 247.11325, 247.86390000000003, 248.59305, 249.3227, 250.0203, 250.73085000000003, 251.36429999999996, 252.09225000000004, 252.82295, 253.56125, 254.3289, 255.0921, 255.86, 256.63059999999996, 257.37555, 258.02075, 258.7343, 259.52205, 260.3095, 261.1117, 261.9087, 262.6598, 263.38890000000004, 264.0536, 264.7595, 265.53974999999997, 266.3692, 267.1441, 268.007, 268.9107, 269.8856, 270.92814999999996, 271.9785, 273.0526], "rs_line": [1.0, 1.1116160782330793, 1.1336927760738562, 1.1392330619692537, 1.1767383470486072, 1.174437018416325, 1.1485883924573317, 1.187057100063903, 1.1669004186283851, 1.2227290119739627, 1.2446826776193836, 1.224543153147556, 1.194229096400887, 1.1960017948879487, 1.2007372526820876, 1.1999522489555858, 1.196903723424871, 1.1993823241530845, 1.2371070138987985, 1.22119710097529, 1.206775996196208, 1.2153779569340395, 1.2427577743699512, 1.225483238269113, 1.216783882072902, 1.264670247784098, 1.2210042935143364, 1.282129043477437, 1.3527681371551872, 1.3659149899447063, 1.3574831828879828, 1.3731847572150349, 1.3959053408371995, 1.4193873554740257, 1.3793305940574168, 1.362722972747535, 1.3589432491027862, 1.3744277117856378, 1.387882853550185, 1.391395268416482, 1.39066214386387, 1.363730391780852, 1.3587875397013915, 1.3853988370483559, 1.3953984597622549, 1.3735053828032961, 1.3802358319454064, 1.374165755153797, 1.3193519385430106, 1.2878186830491, 1.2712465529415888, 1.2937017754279894, 1.2962081217292405, 1.290851924950134, 1.2876957588668723, 1.28311382049915, 1.2889811158470112, 1.2992851069034395, 1.290379414805212, 1.2851279945933216, 1.269180782509406, 1.2670801373607032, 1.2585140840590225, 1.2803595946644248, 1.2628939609396643, 1.268970437848393, 1.2656273895853547, 1.2733088155818912, 1.2396496013826641, 1.259062250541257, 1.2705477897979953, 1.3051582909712034, 1.2735812500257604, 1.3115647692596857, 1.3124908547702543, 1.3213289619503181, 1.322686411005103, 1.2780525104049143, 1.2965825770215877, 1.3122890209144584, 1.299376568874043, 1.3084203600272433, 1.3351336649937682, 1.3498293484869324, 1.349607021441392, 1.3675611449087104, 1.338195222581307, 1.3354222063971444, 1.3808310389398244, 1.3860781255040147, 1.3851529263038738, 1.3651590495285764, 1.3613610117405626, 1.3612368753530824, 1.3576467210447551, 1.3467707632597894, 1.3520616519156563, 1.4018925332207088, 1.3896602072301043, 1.391644553777805, 1.3797467746114387, 1.3746996732858008, 1.3641905870149302, 1.4770640308466136, 1.453049947855889, 1.409228168700251, 1.444399463430567, 1.4152721309354732, 1.4109513348006995, 1.3907867565109373, 1.4038614620761036, 1.396106019744149, 1.3987672541202008, 1.38841066607178, 1.3853729670086543, 1.3927004177801652, 1.3887850828610855, 1.401351961169644, 1.4037832135285915, 1.400710376768892, 1.4107583723983994, 1.4101693985163941, 1.4310395100006372, 1.4202109981998214, 1.405479096740241, 1.4103244785161684, 1.4007459762353272, 1.3924889284457937, 1.4024822485677206, 1.3929049108789586, 1.3749169498383775, 1.3959016401247233, 1.4054737756711255, 1.3990180287064178, 1.3830481096900873, 1.3858174026979015, 1.3838336227970107, 1.3886713410115616, 1.3878779588320664, 1.386514064671682, 1.393345756598806, 1.4053892538974375, 1.3800537501472345, 1.41023437313237, 1.4101160063013816, 1.446939283088146, 1.4325092617526696, 1.411900279156599, 1.4220272562090885, 1.4381320264158846, 1.4279226110131777, 1.4465661850645315, 1.4273735856081604, 1.4508741891972674, 1.4537411492984982, 1.4759440711714753, 1.4342881044788265, 1.4324670377144968, 1.411078297272009, 1.4252305922474897, 1.434029663021709, 1.422021655466612, 1.4457851711127794, 1.4826105334060902, 1.4740199340624411, 1.457689321946925, 1.4534826913518635, 1.5713422756699722, 1.5806852951649375, 1.5557748453488183, 1.566306004721246, 1.5153397798525654, 1.525531367478356, 1.5446385998576517, 1.5656153736507183, 1.589146950779608, 1.5573984927977482, 1.5576728083544482, 1.5644052670792072, 1.5578421754452099, 1.5680932042708482, 1.5649892110659234, 1.548627862767892, 1.5519472721956886, 1.5516149126115726, 1.5610134652960908, 1.548242040841588, 1.5364565356839692, 1.5092000060301751, 1.5091116852160649, 1.513841878244446, 1.5452673280942226, 1.4871634891973324, 1.5469852210616928, 1.5437629843544007, 1.5734717480694054, 1.587210414714796, 1.6054438527409782, 1.6188898915053798, 1.611686539872543, 1.6021420525989214, 1.5967662882375604, 1.6560189519084856, 1.7282889757924338, 1.7252923672457703, 1.723754707279144, 1.7029775388454385, 1.6827843823168838, 1.6665670748350305, 1.669629238791267, 1.7140128929023655, 1.769514040844343, 1.7789912643713726, 1.7306096065573873, 1.8377060251043553, 1.8667304761627062, 1.9180333670662824, 1.9865902594779967, 2.0144920847945054, 2.0258036340041286], "rs_score": 0.9325344356076253}, {"ticker": "IVZ", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [16.0, 16.41, 15.75, 15.63, 14.82, 15.24, 15.25, 14.95, 15.28, 15.44, 15.33, 15.57, 15.52, 15.32, 15.86, 15.97, 15.69, 15.55, 15.19, 15.17, 15.19, 15.69, 13.83, 12.81, 12.71, 12.14, 13.65, 12.69, 12.78, 12.97, 13.08, 12.64, 12.8, 12.46, 13.49, 13.51, 14.07, 13.93, 13.94, 13.96, 13.93, 13.92, 14.41, 14.33, 14.18, 14.33, 14.75, 14.83, 15.59, 15.65, 15.48, 15.32, 15.44, 15.33, 15.16, 14.64, 14.58, 14.38, 14.76, 14.49, 14.75, 14.46, 14.38, 14.45, 14.42, 14.25, 14.39, 14.68, 14.81, 15.07, 14.95, 14.53, 14.83, 14.52, 14.72, 14.81, 14.93, 15.29, 15.25, 15.58, 15.7, 15.77, 16.17, 16.59, 16.73, 16.72, 16.69, 16.95, 17.4, 17.43, 17.34, 16.74, 16.88, 17.28, 19.92, 20.2, 21.25, 21.44, 21.43, 21.81, 21.68, 21.72, 21.48, 21.01, 20.61, 21.0, 21.17, 21.1, 20.57, 20.72, 20.45, 21.04, 21.52, 21.34, 21.12, 21.0, 20.83, 20.78, 20.67, 21.55, 21.62, 21.93, 22.05, 22.06, 21.89, 21.65, 21.7, 21.96, 21.99, 22.0, 22.23, 22.16, 22.55, 22.43, 22.34, 22.1, 22.17, 22.65, 22.49, 22.57, 22.43, 22.18, 22.36, 22.72, 23.0, 22.94, 23.09, 23.61, 24.04, 24.13, 24.1, 24.0, 23.9, 22.47, 23.29, 23.45, 23.6, 22.8, 22.79, 22.84, 22.94, 22.78, 22.68, 23.0, 23.46, 23.96, 24.1, 23.48, 23.7, 23.58, 23.24, 23.37, 23.39, 23.37, 23.64, 23.88, 24.66, 23.98, 23.52, 22.44, 22.66, 22.92, 22.7, 23.22, 23.81, 24.23, 24.53, 24.45, 24.66, 24.24, 24.39, 25.21, 26.24, 25.81, 26.54, 26.93, 27.0, 26.26, 26.04, 26.03, 26.4, 26.48, 27.0, 27.34, 27.09, 27.21, 26.96, 26.84, 26.46, 26.27, 26.94, 28.16, 28.25, 27.69, 28.27, 28.57, 28.76, 28.3, 28.25, 29.39], "ma50": [17.7334, 17.7244, 17.703799999999998, 17.6698, 17.616600000000002, 17.5664, 17.514, 17.4594, 17.4154, 17.3746, 17.328200000000002, 17.2846, 17.247, 17.2104, 17.1852, 17.1774, 17.1628, 17.1422, 17.105, 17.071, 17.0308, 16.994600000000002, 16.9228, 16.8274, 16.729, 16.616799999999998, 16.503, 16.3768, 16.248, 16.122799999999998, 16.0176, 15.9026, 15.783999999999999, 15.6498, 15.541400000000001, 15.4374, 15.344000000000001, 15.257, 15.1674, 15.0766, 14.9848, 14.8994, 14.8304, 14.7674, 14.698599999999999, 14.638599999999999, 14.5898, 14.542200000000001, 14.5062, 14.484000000000002, 14.4736, 14.4518, 14.445600000000002, 14.4396, 14.446399999999999, 14.4344, 14.421, 14.409600000000001, 14.399199999999999, 14.3802, 14.368599999999999, 14.346400000000001, 14.323599999999999, 14.3062, 14.2774, 14.243, 14.217, 14.1996, 14.192, 14.19, 14.1852, 14.161999999999999, 14.182, 14.216199999999999, 14.256400000000001, 14.309800000000001, 14.3354, 14.3874, 14.4368, 14.489, 14.5414, 14.604000000000001, 14.6714, 14.754000000000001, 14.818800000000001, 14.883, 14.9354, 14.9958, 15.065, 15.134400000000001, 15.2026, 15.259, 15.3084, 15.3674, 15.4822, 15.5996, 15.7296, 15.861799999999999, 15.978600000000002, 16.101799999999997, 16.225800000000003, 16.3538, 16.4746, 16.5882, 16.6972, 16.824399999999997, 16.956200000000003, 17.090600000000002, 17.2068, 17.331400000000002, 17.4454, 17.577, 17.7198, 17.8576, 17.991600000000002, 18.1266, 18.255399999999998, 18.377399999999998, 18.494600000000002, 18.6242, 18.7576, 18.905600000000003, 19.05, 19.2008, 19.3442, 19.481, 19.6164, 19.7498, 19.8846, 20.012999999999998, 20.143600000000003, 20.2714, 20.399, 20.5158, 20.627999999999997, 20.735599999999998, 20.8452, 20.9592, 21.061000000000003, 21.163800000000002, 21.265600000000003, 21.3744, 21.484, 21.5928, 21.6544, 21.7092, 21.746000000000002, 21.7894, 21.8416, 21.888, 21.9364, 21.982, 22.0304, 22.0596, 22.113200000000003, 22.162200000000002, 22.2108, 22.2448, 22.289199999999997, 22.3316, 22.3814, 22.416200000000003, 22.4394, 22.472599999999996, 22.5194, 22.5786, 22.643999999999995, 22.697999999999997, 22.7586, 22.799199999999995, 22.831599999999998, 22.8604, 22.887199999999996, 22.913400000000003, 22.948400000000003, 22.993000000000002, 23.052200000000003, 23.0926, 23.1232, 23.131999999999998, 23.1406, 23.1558, 23.1588, 23.1746, 23.204, 23.246600000000004, 23.2938, 23.329799999999995, 23.3732, 23.406599999999997, 23.445800000000006, 23.506400000000003, 23.583999999999996, 23.645799999999998, 23.7166, 23.796400000000002, 23.8746, 23.9276, 23.9676, 24.0056, 24.051599999999997, 24.1012, 24.163199999999996, 24.2606, 24.336599999999997, 24.4118, 24.479, 24.5598, 24.633200000000002, 24.7018, 24.781800000000004, 24.889399999999995, 25.000799999999998, 25.0946, 25.1908, 25.283, 25.376200000000004, 25.472600000000003, 25.5636, 25.6798], "ma150": [17.446, 17.442066666666665, 17.432266666666667, 17.421400000000002, 17.408066666666663, 17.404933333333336, 17.4068, 17.402933333333333, 17.4026, 17.4006, 17.39506666666667, 17.392333333333337, 17.38746666666667, 17.379733333333334, 17.37313333333333, 17.3672, 17.358866666666668, 17.3516, 17.3412, 17.330800000000004, 17.3174, 17.307466666666667, 17.286133333333336, 17.2584, 17.230400000000003, 17.197400000000002, 17.17826666666667, 17.153666666666666, 17.129733333333334, 17.111266666666666, 17.092266666666667, 17.070733333333333, 17.050733333333334, 17.028066666666668, 17.011266666666668, 16.993000000000002, 16.976133333333333, 16.957333333333334, 16.934599999999996, 16.9132, 16.89186666666667, 16.86766666666667, 16.848733333333332, 16.826, 16.802933333333332, 16.7814, 16.764733333333332, 16.74506666666667, 16.732533333333333, 16.7186, 16.704333333333334, 16.690733333333334, 16.6752, 16.659533333333336, 16.642666666666667, 16.622066666666665, 16.601266666666668, 16.575999999999997, 16.552533333333333, 16.524933333333333, 16.50313333333333, 16.479266666666664, 16.458466666666666, 16.43733333333333, 16.41593333333333, 16.391599999999997, 16.368000000000002, 16.347133333333336, 16.330266666666667, 16.312200000000004, 16.2954, 16.2732, 16.248133333333335, 16.223066666666668, 16.20133333333333, 16.17813333333333, 16.159066666666668, 16.143333333333334, 16.126733333333334, 16.1128, 16.101, 16.090999999999998, 16.082733333333334, 16.075466666666667, 16.068733333333334, 16.059199999999997, 16.049466666666667, 16.0422, 16.037599999999998, 16.0332, 16.0292, 16.020133333333334, 16.013333333333332, 16.009666666666664, 16.020066666666665, 16.03173333333333, 16.050666666666665, 16.070999999999998, 16.0936, 16.1184, 16.144266666666667, 16.176666666666666, 16.208000000000002, 16.232533333333333, 16.253400000000003, 16.275066666666667, 16.297066666666666, 16.319866666666666, 16.340466666666668, 16.362066666666667, 16.380733333333332, 16.402666666666665, 16.430133333333334, 16.458066666666667, 16.484733333333335, 16.515666666666664, 16.545066666666667, 16.573066666666666, 16.5972, 16.628400000000003, 16.657866666666667, 16.6874, 16.71826666666667, 16.748133333333335, 16.776533333333333, 16.802533333333333, 16.818266666666666, 16.837999999999997, 16.85646666666667, 16.874933333333335, 16.90086666666667, 16.926000000000002, 16.95146666666667, 16.9732, 16.996066666666668, 17.018666666666668, 17.041533333333334, 17.070666666666668, 17.0978, 17.124933333333335, 17.151, 17.177599999999998, 17.2076, 17.242533333333334, 17.2784, 17.3158, 17.355133333333335, 17.3978, 17.442133333333334, 17.491266666666668, 17.545266666666667, 17.595866666666666, 17.6502, 17.6958, 17.752266666666667, 17.807000000000002, 17.862666666666666, 17.915, 17.965066666666665, 18.0144, 18.065133333333332, 18.1132, 18.160933333333332, 18.212133333333334, 18.262800000000002, 18.316066666666668, 18.372133333333334, 18.425, 18.48173333333333, 18.537799999999997, 18.591466666666665, 18.642666666666667, 18.7064, 18.7768, 18.849666666666664, 18.927933333333332, 19.00133333333333, 19.0766, 19.1482, 19.211333333333332, 19.275199999999998, 19.343733333333333, 19.409733333333335, 19.481466666666666, 19.550266666666666, 19.62173333333333, 19.691466666666667, 19.761599999999998, 19.833066666666667, 19.901600000000002, 19.971333333333334, 20.046599999999998, 20.125466666666664, 20.202, 20.2844, 20.368399999999998, 20.450066666666665, 20.526266666666668, 20.595933333333335, 20.665133333333333, 20.737933333333334, 20.81233333333333, 20.8894, 20.969466666666666, 21.049, 21.1328, 21.21533333333333, 21.2984, 21.3764, 21.454933333333337, 21.5362, 21.627533333333336, 21.72, 21.80826666666667, 21.9006, 21.996066666666668, 22.091866666666665, 22.182666666666666, 22.272266666666667, 22.367733333333334], "ma200": [16.979650000000003, 16.98015, 16.97845, 16.9766, 16.9706, 16.967, 16.9643, 16.96175, 16.96, 16.959950000000003, 16.9609, 16.96195, 16.961000000000002, 16.95935, 16.9613, 16.96365, 16.965799999999998, 16.9684, 16.968400000000003, 16.969350000000002, 16.969350000000002, 16.97365, 16.97, 16.961100000000002, 16.95075, 16.936700000000002, 16.9295, 16.9164, 16.90485, 16.8948, 16.88595, 16.87435, 16.8641, 16.8514, 16.8436, 16.836550000000003, 16.8321, 16.8256, 16.81645, 16.8063, 16.7958, 16.7843, 16.77395, 16.76335, 16.7528, 16.7434, 16.7347, 16.72485, 16.7199, 16.7126, 16.7029, 16.6945, 16.6856, 16.67595, 16.66765, 16.662300000000002, 16.66035, 16.654600000000002, 16.65175, 16.6455, 16.63845, 16.63085, 16.6215, 16.61135, 16.5992, 16.58615, 16.573400000000003, 16.5636, 16.553900000000002, 16.5456, 16.53435, 16.5211, 16.5101, 16.49785, 16.486900000000002, 16.4755, 16.467550000000003, 16.4621, 16.456500000000002, 16.4557, 16.454549999999998, 16.45405, 16.4559, 16.45955, 16.46315, 16.4655, 16.46595, 16.46695, 16.4672, 16.468500000000002, 16.469549999999998, 16.4655, 16.46365, 16.46135, 16.47275, 16.48595, 16.50595, 16.52425, 16.54405, 16.5644, 16.5847, 16.6065, 16.62505, 16.6417, 16.6563, 16.67265, 16.69, 16.70465, 16.7161, 16.72655, 16.738699999999998, 16.7537, 16.773799999999998, 16.7924, 16.809849999999997, 16.82535, 16.839850000000002, 16.8547, 16.87135, 16.890200000000004, 16.91095, 16.9313, 16.948600000000003, 16.9675, 16.98705, 17.00385, 17.0234, 17.04495, 17.066200000000002, 17.08785, 17.11165, 17.1361, 17.1618, 17.18555, 17.20855, 17.2283, 17.2484, 17.27145, 17.29345, 17.31585, 17.3383, 17.3587, 17.381, 17.405450000000002, 17.42865, 17.4511, 17.4745, 17.5006, 17.5306, 17.5608, 17.5923, 17.628, 17.663600000000002, 17.6893, 17.71835, 17.746850000000002, 17.7755, 17.801099999999998, 17.82765, 17.85445, 17.8809, 17.90605, 17.932450000000003, 17.9617, 17.9934, 18.0314, 18.0698, 18.104300000000002, 18.137549999999997, 18.1711, 18.2013, 18.23065, 18.2605, 18.289450000000002, 18.3195, 18.35015, 18.37675, 18.40165, 18.42315, 18.4392, 18.4608, 18.48345, 18.503300000000003, 18.52355, 18.54805, 18.57565, 18.6046, 18.635450000000002, 18.66665, 18.69535, 18.7247, 18.7598, 18.801699999999997, 18.84335, 18.88795, 18.935950000000002, 18.985, 19.030250000000002, 19.073500000000003, 19.11985, 19.17185, 19.2222, 19.27845, 19.337, 19.39835, 19.458199999999998, 19.51675, 19.5762, 19.6321, 19.68625, 19.7443, 19.80725, 19.8709, 19.932750000000002, 19.9948, 20.0578, 20.12315, 20.1869, 20.252200000000002, 20.3233], "rs_line": [1.0, 1.014718961170377, 0.9915080276230552, 0.9784694271773858, 0.9531495504655892, 0.9883780939703555, 0.9838060506021079, 0.977482794421675, 0.9788406389367639, 0.9815214669840431, 0.985176976756622, 0.9898204776682595, 0.9895032626571645, 0.9793670874853718, 0.9960501585144927, 1.0005532747714871, 0.9948879464992348, 0.9886361933060591, 0.9855963403880071, 0.9777353679901322, 0.9762669349519582, 1.002060755154822, 0.9290541503633314, 0.9140447623100064, 0.9085276230223245, 0.8815914538349984, 0.8970392758193285, 0.8721683775591901, 0.862956371502416, 0.8673711557723699, 0.8771842971670915, 0.8669470760567668, 0.8766702760205924, 0.874191883319063, 0.9224563063063063, 0.909727246834261, 0.9279047769302529, 0.9120818275098068, 0.9123886266678768, 0.9079779730119786, 0.9056672873011866, 0.8986484502300929, 0.9166746727009669, 0.9168430684459904, 0.9148929402290623, 0.9206989886839526, 0.94112627420097, 0.9474379142006591, 0.9641296806120173, 0.9614906746302229, 0.9498324511989652, 0.935446008196999, 0.9368392797038033, 0.9291485038244935, 0.9219445896938517, 0.9055809285248603, 0.9015137886089626, 0.8952581115850184, 0.9002002029941639, 0.8888755678627941, 0.9012673714092027, 0.884536936493663, 0.8747160078284489, 0.8739899805398513, 0.8724096370379073, 0.8663113354691848, 0.8659302708882732, 0.8825857957577375, 0.8853817694169928, 0.9035020827790342, 0.8927595238095237, 0.8774890912897823, 0.887165846717993, 0.876107392097468, 0.8883087841456883, 0.8984923562966952, 0.8969132508539532, 0.9085036380566268, 0.9056194615561998, 0.9180339369473908, 0.920531256606658, 0.9202357165978797, 0.9438826803205701, 0.964028870174873, 0.9645620582403172, 0.9712230134690985, 0.9700117475900313, 0.9792504927410827, 1.002421223354958, 1.0076919638561945, 1.0005794161425074, 0.9701028305526087, 0.9749564256191726, 0.9919890452837401, 1.1443811147582779, 1.1582705122699875, 1.2183032590719716, 1.218827202346226, 1.2178554624696574, 1.2342368348767854, 1.227188275190756, 1.2327038535402828, 1.2206199760426188, 1.198407302082015, 1.195180768674001, 1.199563905128571, 1.2154368640221667, 1.2022094961914094, 1.1729942862791618, 1.1724060704981325, 1.159421291200151, 1.1803060573526893, 1.2031147947712013, 1.1929405767888983, 1.1834129056322267, 1.1769450489662678, 1.1737853620606118, 1.1740874222312767, 1.172576528203918, 1.2040078605631404, 1.2132583233458372, 1.2255234941719884, 1.2294282472202034, 1.2256452644393763, 1.2234967638167586, 1.2191164469676854, 1.2153452869170782, 1.2197133811929999, 1.2249273260305298, 1.2224812354545875, 1.2324125636215462, 1.2249905705217645, 1.2362758123869046, 1.2301084749243243, 1.2186845031850024, 1.2072543560606062, 1.212584783367214, 1.2330767938573974, 1.221709865149917, 1.2202824328174675, 1.2193507524012004, 1.2096084934200573, 1.225076893853051, 1.2377099513462875, 1.2494519195998073, 1.2415158440661684, 1.245390212431745, 1.271971903858223, 1.2951572002809282, 1.2953603840026207, 1.2985643457077953, 1.2855105406248606, 1.2838736292389297, 1.240586448347677, 1.2664271197816122, 1.2766870082901711, 1.2791744967451932, 1.2442866008718818, 1.2367208454371679, 1.2266760762699243, 1.2320651655767254, 1.2298658655286014, 1.2172487942122188, 1.2244167589516428, 1.2343426755589282, 1.2573106424475302, 1.264050066192409, 1.245226085933248, 1.2527840292642876, 1.2441060453068749, 1.2408760588827676, 1.243507980607456, 1.2580704636660651, 1.255758286510574, 1.2507493689833296, 1.2605615666178625, 1.3010118455325002, 1.286484323849771, 1.2620127096572562, 1.215386227409978, 1.2376953929826688, 1.2470789882739992, 1.2542260509095369, 1.27030343838672, 1.2836866710032449, 1.2941577471778614, 1.30119833965984, 1.289913793734178, 1.3069596998250697, 1.2823249159978285, 1.2858076042930882, 1.3280659236692531, 1.3797056979101343, 1.3611855645597766, 1.4008938349145, 1.4121143847171924, 1.4124980048464097, 1.3887166671555975, 1.3791659688863427, 1.382413588021271, 1.41766309204647, 1.4113017576537024, 1.430304955994064, 1.4393492180541156, 1.419698946886447, 1.42098921970509, 1.408076226622822, 1.4068221996074726, 1.3886002023260215, 1.3889195396820744, 1.4217369395611636, 1.4762891874600128, 1.4722516839883784, 1.4477338923692682, 1.478208456004989, 1.4840803341161555, 1.4916074716612004, 1.4706907548611212, 1.475343932875601, 1.5307114765110366], "rs_score": 0.5835899745545041}, {"ticker": "TKO", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [146.7, 152.3, 146.99, 143.73, 142.12, 145.15, 147.27, 140.85, 139.62, 145.63, 145.47, 149.85, 150.4, 149.88, 152.91, 154.6, 154.61, 151.88, 149.7, 152.81, 152.99, 158.58, 150.44, 139.58, 141.18, 138.96, 148.54, 145.09, 144.35, 148.13, 149.65, 147.96, 149.22, 143.09, 148.13, 150.96, 155.28, 157.1, 160.43, 162.96, 162.91, 163.16, 166.43, 166.83, 167.94, 169.68, 168.96, 159.66, 160.6, 164.48, 162.21, 161.46, 163.48, 163.99, 162.74, 159.84, 156.23, 157.72, 158.95, 158.81, 156.74, 157.81, 159.55, 163.11, 165.9, 168.92, 165.94, 163.33, 164.6, 164.92, 163.93, 163.08, 168.41, 167.96, 175.95, 174.96, 175.53, 176.89, 174.94, 176.16, 179.35, 181.95, 175.61, 177.46, 177.14, 176.34, 172.97, 171.8, 172.89, 172.0, 174.48, 168.79, 169.13, 169.35, 170.79, 168.7, 166.49, 167.71, 168.0, 170.05, 170.74, 168.15, 167.81, 168.01, 165.61, 165.76, 163.45, 155.61, 160.74, 163.29, 180.0, 186.02, 191.28, 191.0, 188.85, 185.56, 184.9, 182.61, 184.24, 186.17, 183.72, 185.16, 185.65, 190.14, 189.56, 185.35, 186.61, 190.08, 194.0, 200.47, 196.43, 195.13, 202.24, 202.44, 204.49, 200.29, 201.38, 202.8, 201.11, 199.67, 202.29, 195.79, 195.79, 199.04, 205.33, 201.96, 198.76, 198.0, 197.35, 198.15, 197.96, 194.15, 186.47, 187.05, 188.6, 189.97, 191.21, 187.83, 189.28, 186.82, 186.16, 186.97, 186.85, 186.85, 187.51, 187.45, 186.6, 187.78, 188.4, 187.71, 187.35, 187.24, 181.0, 182.56, 179.17, 179.68, 181.68, 182.64, 184.09, 184.75, 186.56, 188.37, 176.49, 178.17, 181.65, 187.42, 193.37, 193.89, 193.98, 194.64, 194.9, 200.87, 202.22, 203.82, 197.11, 196.94, 204.3, 208.42, 207.45, 210.65, 211.62, 211.61, 213.44, 215.49, 215.7, 217.98, 217.44, 216.11, 214.17, 209.0, 206.94, 203.65, 202.81, 202.91, 202.09, 199.63, 199.09, 208.89, 207.98, 208.88], "ma50": [152.82920000000001, 153.0324, 153.0964, 153.1002, 153.1076, 153.1134, 153.16400000000002, 153.1006, 153.0256, 153.096, 153.1508, 153.2998, 153.4752, 153.6366, 153.84799999999998, 154.1364, 154.381, 154.55640000000002, 154.6722, 154.8924, 155.1082, 155.3892, 155.5394, 155.2916, 155.05360000000002, 154.76319999999998, 154.5652, 154.3286, 154.0662, 153.9246, 153.7766, 153.58100000000002, 153.34500000000003, 152.9826, 152.6178, 152.1748, 151.7498, 151.359, 151.0778, 150.827, 150.6438, 150.5756, 150.62800000000001, 150.7882, 150.9318, 151.205, 151.3932, 151.58180000000002, 151.781, 152.1148, 152.425, 152.6082, 152.93800000000002, 153.3432, 153.7556, 154.0494, 154.2286, 154.566, 154.9526, 155.21620000000001, 155.4416, 155.6008, 155.78379999999999, 156.04840000000002, 156.3082, 156.59459999999999, 156.8212, 157.05020000000002, 157.3482, 157.5904, 157.8092, 157.8992, 158.2586, 158.8262, 159.5216, 160.2416, 160.78140000000002, 161.4174, 162.0292, 162.58980000000003, 163.1838, 163.86360000000002, 164.3914, 165.0788, 165.65900000000002, 166.1666, 166.5204, 166.81439999999998, 167.0636, 167.24439999999998, 167.4758, 167.5884, 167.64239999999998, 167.69279999999998, 167.7498, 167.7302, 167.68079999999998, 167.8418, 167.9898, 168.10119999999998, 168.27179999999996, 168.40560000000002, 168.49220000000003, 168.57260000000002, 168.63, 168.7484, 168.8928, 168.85060000000001, 168.88639999999998, 168.976, 169.44119999999998, 170.0054, 170.64, 171.19780000000003, 171.6568, 171.9896, 172.36880000000002, 172.75440000000003, 173.1472, 173.5722, 173.968, 174.40959999999998, 174.75439999999998, 175.19799999999998, 175.4702, 175.678, 175.8996, 176.1634, 176.54460000000003, 177.03080000000003, 177.37240000000003, 177.636, 178.1686, 178.66819999999998, 179.2152, 179.69420000000002, 180.26239999999999, 180.88240000000002, 181.4468, 182.0002, 182.55640000000002, 183.0964, 183.62960000000004, 184.2234, 184.9142, 185.57940000000002, 186.22480000000004, 186.8306, 187.4176, 187.97960000000003, 188.524, 189.04399999999998, 189.4172, 189.798, 190.25779999999997, 190.74200000000002, 191.2972, 191.9416, 192.51239999999999, 192.98300000000003, 193.10620000000003, 193.1252, 193.0366, 192.9536, 192.92679999999996, 192.9646, 192.9986, 193.10199999999998, 193.1852, 193.21599999999998, 193.2886, 193.3302, 193.2372, 193.08559999999997, 192.87779999999998, 192.7644, 192.66580000000002, 192.51699999999997, 192.31879999999998, 192.00439999999998, 191.80700000000002, 191.6718, 191.1568, 190.6714, 190.2146, 189.95719999999997, 189.797, 189.61879999999996, 189.47619999999998, 189.37560000000002, 189.2278, 189.32940000000002, 189.458, 189.55360000000002, 189.38920000000002, 189.28879999999998, 189.3996, 189.608, 189.81, 190.06, 190.3332, 190.68240000000003, 191.2218, 191.7906, 192.33259999999999, 192.89280000000002, 193.4174, 193.983, 194.48080000000002, 194.9244, 195.34, 195.6736, 195.9928, 196.31399999999996, 196.6056, 196.84920000000002, 197.099, 197.5212, 197.91279999999998, 198.3362], "ma150": [133.13920000000002, 133.43266666666668, 133.681, 133.9102, 134.1282666666667, 134.37693333333334, 134.64206666666666, 134.85413333333332, 135.0549333333333, 135.24633333333333, 135.43166666666667, 135.63066666666666, 135.842, 136.04966666666664, 136.28833333333333, 136.5404, 136.7846, 137.00466666666665, 137.20413333333332, 137.4378, 137.67086666666665, 137.94646666666668, 138.16279999999998, 138.30933333333334, 138.4724, 138.6106, 138.81393333333332, 138.9948, 139.18253333333334, 139.40046666666666, 139.6318, 139.85953333333333, 140.0964, 140.28373333333332, 140.50233333333333, 140.727, 140.95533333333336, 141.18633333333335, 141.42586666666668, 141.69933333333336, 141.97206666666668, 142.2472, 142.54933333333335, 142.83686666666668, 143.12313333333333, 143.42960000000002, 143.74093333333332, 143.97813333333335, 144.2062, 144.45513333333335, 144.69566666666668, 144.9254, 145.16613333333333, 145.41346666666666, 145.64826666666664, 145.8718, 146.0776, 146.278, 146.48413333333332, 146.67666666666668, 146.86246666666665, 147.05786666666665, 147.28153333333333, 147.60226666666668, 147.93993333333333, 148.29106666666667, 148.62486666666666, 148.9356, 149.25446666666664, 149.56013333333334, 149.86520000000002, 150.15980000000002, 150.48106666666666, 150.8148, 151.1866, 151.5594, 151.95326666666668, 152.34720000000002, 152.72833333333332, 153.1078, 153.47006666666667, 153.81046666666668, 154.09593333333333, 154.36640000000003, 154.6422, 154.90586666666667, 155.1438, 155.36773333333332, 155.60060000000001, 155.8476, 156.09720000000002, 156.30193333333335, 156.4684, 156.6368, 156.8439333333333, 157.02859999999998, 157.19633333333334, 157.3582, 157.53206666666668, 157.6854, 157.84199999999998, 158.01539999999997, 158.17553333333333, 158.33866666666668, 158.49773333333334, 158.63706666666667, 158.7618, 158.83906666666664, 158.95486666666667, 159.09606666666667, 159.34453333333335, 159.63533333333336, 159.96633333333332, 160.29426666666666, 160.60433333333333, 160.90686666666667, 161.19033333333334, 161.45366666666666, 161.72253333333333, 162.01833333333335, 162.29513333333333, 162.56599999999997, 162.8508, 163.10526666666667, 163.34846666666667, 163.56093333333334, 163.74873333333335, 163.9698, 164.21333333333334, 164.51506666666666, 164.7776, 165.02686666666668, 165.30166666666668, 165.57653333333334, 165.83066666666664, 166.01186666666666, 166.17753333333334, 166.35193333333333, 166.5294, 166.69053333333332, 166.892, 167.0868, 167.3, 167.56813333333332, 167.86526666666668, 168.17153333333334, 168.43293333333332, 168.7514, 169.0628, 169.39853333333332, 169.74026666666668, 170.01926666666665, 170.28246666666666, 170.57126666666665, 170.88113333333334, 171.1799333333333, 171.47286666666665, 171.78606666666667, 172.11713333333333, 172.39173333333332, 172.66299999999998, 172.91046666666668, 173.15346666666667, 173.39993333333334, 173.6306, 173.84959999999998, 174.06286666666668, 174.3022, 174.56019999999998, 174.79286666666667, 175.02193333333335, 175.213, 175.41673333333335, 175.70326666666665, 175.95653333333334, 176.228, 176.44893333333334, 176.69926666666666, 176.9642, 177.20833333333334, 177.4544, 177.7238, 177.9056, 178.1394666666667, 178.36293333333333, 178.60600000000002, 178.85993333333334, 179.1052, 179.32886666666664, 179.5400666666667, 179.75333333333333, 180.00473333333332, 180.24333333333334, 180.4899333333333, 180.6844, 180.86613333333332, 181.10173333333336, 181.42680000000001, 181.7391333333333, 182.04693333333333, 182.37633333333335, 182.71066666666667, 183.04373333333334, 183.38706666666664, 183.74013333333335, 184.12773333333334, 184.53580000000002, 184.92506666666668, 185.29319999999998, 185.62779999999998, 185.96246666666667, 186.26806666666667, 186.55646666666667, 186.8218, 187.06306666666669, 187.2678, 187.4888, 187.79253333333335, 188.08173333333335, 188.3748], "ma200": [126.72935, 126.96545, 127.1769, 127.3688, 127.54140000000001, 127.72949999999999, 127.931, 128.10655, 128.2672, 128.4523, 128.63549999999998, 128.8459, 129.05255, 129.26104999999998, 129.48770000000002, 129.7243, 129.95585, 130.1764, 130.3853, 130.611, 130.83625, 131.09199999999998, 131.31835, 131.49625, 131.67955, 131.8475, 132.05575, 132.24735, 132.43355000000003, 132.63594999999998, 132.84405, 133.0439, 133.25215, 133.41685, 133.5949, 133.79579999999999, 134.0113, 134.24304999999998, 134.49535, 134.76045, 135.0197, 135.30280000000002, 135.601, 135.91105, 136.22244999999998, 136.54915, 136.8658, 137.1362, 137.40395, 137.68785, 137.96065, 138.22655, 138.49525, 138.76845, 139.0351, 139.29505, 139.5387, 139.7821, 140.02935, 140.2388, 140.43415000000002, 140.6232, 140.82745, 141.04935, 141.2933, 141.55395, 141.79375, 142.01605, 142.24015, 142.47594999999998, 142.70545, 142.93465, 143.18675000000002, 143.43855, 143.7347, 144.01835, 144.3058, 144.60045, 144.8942, 145.1978, 145.5198, 145.86055, 146.17015, 146.4825, 146.79149999999998, 147.0869, 147.3466, 147.59335, 147.8353, 148.0856, 148.34799999999998, 148.5825, 148.8226, 149.05085, 149.2798, 149.50475, 149.7259, 149.94405, 150.15210000000002, 150.36665000000002, 150.5897, 150.79545, 150.99765000000002, 151.20325, 151.3937, 151.59095, 151.7814, 151.92115, 152.0847, 152.2515, 152.50715, 152.79475, 153.12115, 153.50115, 153.86915000000002, 154.21570000000003, 154.56085, 154.8903, 155.22765, 155.56315, 155.8909, 156.22225, 156.5494, 156.9106, 157.2575, 157.58905000000001, 157.93984999999998, 158.30125, 158.6824, 159.08855000000003, 159.44565, 159.76685, 160.1141, 160.44185, 160.78545, 161.10295, 161.42345, 161.7464, 162.06215, 162.38575, 162.712, 163.00055, 163.2587, 163.53345000000002, 163.8615, 164.1663, 164.45344999999998, 164.7263, 165.00345000000002, 165.25895, 165.5125, 165.77255000000002, 165.98595, 166.2035, 166.43775000000002, 166.6633, 166.89565, 167.11469999999997, 167.34425, 167.56779999999998, 167.78494999999998, 168.00780000000003, 168.2339, 168.4591, 168.68495, 168.92129999999997, 169.1424, 169.36575000000002, 169.5882, 169.81775000000002, 170.04350000000002, 170.25705, 170.4474, 170.60035, 170.73080000000002, 170.86180000000002, 170.97800000000004, 171.1066, 171.2397, 171.38739999999999, 171.53494999999998, 171.68810000000002, 171.76545, 171.85025000000002, 171.92664999999997, 171.9982, 172.08239999999998, 172.16864999999999, 172.2661, 172.36180000000002, 172.47595, 172.64745, 172.83950000000002, 173.06449999999998, 173.24625, 173.45085, 173.67460000000003, 173.96555, 174.2496, 174.5639, 174.88850000000002, 175.18505000000002, 175.5173, 175.87609999999998, 176.24400000000003, 176.60815, 176.95899999999997, 177.3353, 177.70805000000001, 178.02489999999997, 178.33225, 178.60125, 178.86329999999998, 179.12845000000002, 179.37435000000002, 179.59949999999998, 179.8219, 180.10694999999998, 180.39835000000002, 180.6787], "rs_line": [1.0, 1.0271336722873667, 1.0092373982904348, 0.9813537284063825, 0.9969144967028625, 1.0267035254321022, 1.0362005087464143, 1.0044183750464226, 0.9754974536369125, 1.0097020194672162, 1.019613100269674, 1.038997345259778, 1.0458351127108243, 1.0450096310105705, 1.0473788095628922, 1.0564152453858615, 1.0692485614176632, 1.053165368275343, 1.059382946435518, 1.0741808089645026, 1.0724170747234874, 1.104611073026262, 1.102229527843728, 1.0862540218779806, 1.1006662049444822, 1.100597086927553, 1.064662838607234, 1.0875921485719755, 1.0630768058593065, 1.0804331262448652, 1.094585509724064, 1.1068268952685603, 1.114662053406551, 1.094933844387108, 1.1047569597366176, 1.1086835638998007, 1.1169010629914384, 1.1218860304192355, 1.1452295395991783, 1.1560078399636868, 1.1551946725485356, 1.1488257460259188, 1.1547094853569893, 1.164160431917402, 1.1817838839581754, 1.189027776183404, 1.1757896893805804, 1.112488685952927, 1.0832401467305917, 1.1021322246443548, 1.0855342736339642, 1.0752631877527536, 1.0818630630060133, 1.0840522414070008, 1.0794183561791422, 1.0783544396796083, 1.053583962450571, 1.0709421599467497, 1.0573119728215679, 1.0625277912636295, 1.0445550655505207, 1.0528634963050831, 1.0585097574475575, 1.0759920519543842, 1.09469075110282, 1.120031080304369, 1.0890882748799753, 1.0709931890964437, 1.073235961781103, 1.0783980668584974, 1.0676812277277472, 1.0741543299318683, 1.0988069761925479, 1.1053160162824809, 1.1580712676745937, 1.1576784982064188, 1.1500900712108955, 1.1463370682476384, 1.1330651816126434, 1.132109547976947, 1.146912106234599, 1.1580020299299654, 1.1180136576556117, 1.1246930205405923, 1.1138859931226726, 1.1171806289901982, 1.0964310136321884, 1.0825229802746716, 1.0863274353373529, 1.0845478650534546, 1.0980901416934634, 1.0668390404525192, 1.0654259766358833, 1.0603230630589093, 1.0701228942467418, 1.0550270190795354, 1.0410569641593588, 1.0398391992261882, 1.0412924701556627, 1.049565007681685, 1.0540884758968887, 1.040844072217633, 1.0400492431492179, 1.0452096116676317, 1.047446935806776, 1.032698869291327, 1.0234964484895928, 0.9669968744407047, 0.9997132259653057, 1.0077150976654485, 1.1130388743577733, 1.1381471344937022, 1.1663374813117098, 1.1645218239784711, 1.1541154243283864, 1.1342561017232744, 1.1363868493380584, 1.1253025878858323, 1.1399203680456047, 1.1344402198456176, 1.1244597004091732, 1.1285480395091672, 1.1289622381873299, 1.1521861272219869, 1.1555630120565261, 1.138334107919217, 1.1398946858115206, 1.151467659472154, 1.178627832629743, 1.214951048009326, 1.1877207388318645, 1.1764592885892124, 1.2092768851931077, 1.2108778487457863, 1.2166623352980186, 1.1933164921195598, 1.2013031786636736, 1.2041476367377324, 1.191522259740919, 1.1774202122581054, 1.1993989387119455, 1.1645648052856898, 1.1699624538779267, 1.1826079318527083, 1.2165612763174938, 1.1921038308885736, 1.1692311369744421, 1.1634201743518644, 1.1596181936057093, 1.1601582547618003, 1.1633589780201905, 1.134205278174582, 1.0925044565680484, 1.1263452755199552, 1.1185161799617322, 1.1280191782653026, 1.1303638488447467, 1.1179963991043453, 1.1202680548757034, 1.0943267927982325, 1.090476985865802, 1.1009455112402986, 1.0937530416899146, 1.0848867379632587, 1.0760242009357541, 1.0728304498717567, 1.067452949006513, 1.0861487856827274, 1.0861720661340688, 1.0801669329815906, 1.0910278784160847, 1.0866216799901764, 1.0618011422382407, 1.0698991344206483, 1.0338986844971465, 1.0344734455732312, 1.0454064337129514, 1.0686637724480565, 1.0773243544871727, 1.0913543252274627, 1.1113792160203342, 1.1178433698251504, 1.0635549464430052, 1.0630892021480292, 1.0681319536892215, 1.0917912381984614, 1.1187290570677957, 1.1156477731563845, 1.1212848332835967, 1.1230198431491374, 1.1206394256330445, 1.1541220437889788, 1.159675820204613, 1.1723735082303188, 1.1347569001838371, 1.126308407649123, 1.165687969461977, 1.2021210069866886, 1.1983367007936898, 1.2201554331198499, 1.2394119664492536, 1.2300647062653298, 1.2331916071897722, 1.2373274731176105, 1.232898343473862, 1.2415629909161792, 1.238612864692337, 1.2354393601393436, 1.2258459310460323, 1.2051834796942082, 1.1911212415189594, 1.164429157472856, 1.1527704663602028, 1.1570685933464773, 1.1525096396117902, 1.1310006262125005, 1.1261726704533714, 1.1839747636524225, 1.1846396531483747, 1.1865347991338553], "rs_score": 0.2705489124816587}, {"ticker": "HAS", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [61.81, 63.04, 63.51, 64.35, 63.93, 62.95, 61.86, 59.3, 59.79, 60.22, 59.96, 60.62, 60.38, 60.57, 61.6, 61.04, 61.49, 61.38, 60.59, 61.49, 62.14, 62.69, 54.99, 53.96, 53.17, 50.71, 55.18, 51.0, 52.04, 53.35, 52.49, 51.88, 52.65, 51.54, 52.1, 52.69, 60.37, 60.99, 61.34, 61.57, 61.9, 60.71, 61.75, 61.19, 60.92, 61.43, 61.78, 61.52, 65.56, 65.83, 65.21, 66.47, 67.21, 68.18, 68.36, 66.28, 66.4, 65.83, 67.38, 66.28, 66.8, 66.71, 65.55, 65.68, 65.43, 65.18, 66.32, 67.57, 68.85, 69.04, 69.5, 67.81, 69.77, 67.5, 67.93, 68.63, 70.6, 72.58, 71.68, 72.31, 73.13, 73.82, 76.99, 78.22, 77.64, 76.55, 76.51, 76.68, 77.1, 75.37, 75.79, 74.84, 75.92, 77.19, 77.81, 77.67, 77.57, 76.84, 75.05, 74.98, 76.3, 76.3, 76.0, 75.16, 74.63, 76.89, 76.97, 77.05, 77.35, 77.49, 77.57, 78.25, 80.32, 80.55, 81.14, 81.51, 80.05, 79.69, 79.41, 81.85, 81.06, 81.6, 81.56, 81.6, 81.17, 79.75, 79.03, 80.4, 79.73, 79.36, 78.64, 77.66, 79.95, 78.38, 76.0, 74.69, 73.92, 74.88, 74.15, 74.71, 74.82, 75.23, 74.56, 75.59, 76.95, 75.85, 75.31, 75.17, 75.89, 74.78, 74.83, 75.57, 74.64, 70.95, 72.41, 73.14, 74.13, 74.4, 74.81, 74.79, 74.83, 75.16, 77.94, 76.7, 78.09, 77.94, 77.96, 76.55, 76.31, 75.85, 75.98, 76.87, 76.61, 76.57, 78.15, 78.43, 79.13, 78.9, 77.71, 77.04, 76.04, 76.47, 76.76, 79.2, 79.35, 81.57, 82.67, 82.6, 82.69, 81.65, 82.47, 81.85, 81.1, 81.13, 79.86, 82.16, 83.96, 81.55, 81.1, 80.41, 81.35, 82.03, 81.98, 81.56, 81.41, 81.63, 82.56, 82.83, 82.67, 82.0, 82.97, 85.58, 87.24, 87.02, 89.14, 86.72, 86.64, 86.87, 85.42, 86.89], "ma50": [59.4426, 59.541199999999996, 59.6812, 59.8166, 59.9596, 60.0756, 60.172799999999995, 60.224799999999995, 60.3064, 60.3926, 60.4632, 60.5396, 60.609399999999994, 60.678599999999996, 60.7684, 60.84839999999999, 60.930200000000006, 61.0254, 61.114, 61.18900000000001, 61.285, 61.3802, 61.335, 61.26339999999999, 61.1784, 61.018, 60.955799999999996, 60.80479999999999, 60.6544, 60.5646, 60.4816, 60.3762, 60.2512, 60.089000000000006, 59.95, 59.8156, 59.8212, 59.84660000000001, 59.868399999999994, 59.8834, 59.8964, 59.887800000000006, 59.7416, 59.614200000000004, 59.4916, 59.3492, 59.224399999999996, 59.1346, 59.143600000000006, 59.186400000000006, 59.254400000000004, 59.323, 59.397, 59.4736, 59.562200000000004, 59.6288, 59.7196, 59.8502, 60.001999999999995, 60.1232, 60.26, 60.38179999999999, 60.485200000000006, 60.587399999999995, 60.66400000000001, 60.7468, 60.8434, 60.96719999999999, 61.132400000000004, 61.2834, 61.430600000000005, 61.533, 61.82860000000001, 62.0994, 62.3946, 62.753, 63.061400000000006, 63.493, 63.885799999999996, 64.265, 64.6778, 65.1166, 65.60340000000001, 66.137, 66.6478, 67.125, 67.4478, 67.7616, 68.0768, 68.3528, 68.6306, 68.9132, 69.1966, 69.5166, 69.8544, 70.1792, 70.495, 70.8014, 70.99119999999999, 71.1742, 71.396, 71.5926, 71.7684, 71.908, 72.0334, 72.2456, 72.45700000000001, 72.6814, 72.8808, 73.105, 73.32039999999999, 73.5512, 73.8466, 74.144, 74.45819999999999, 74.78479999999999, 75.0594, 75.3018, 75.51299999999999, 75.7692, 76.0004, 76.2762, 76.512, 76.794, 77.0588, 77.2812, 77.4498, 77.6062, 77.76719999999999, 77.9082, 78.01839999999999, 78.0952, 78.1544, 78.1576, 78.12480000000001, 78.08760000000001, 78.0358, 77.9998, 77.9408, 77.9276, 77.90820000000001, 77.916, 77.8888, 77.85679999999999, 77.8396, 77.8032, 77.758, 77.7246, 77.7414, 77.7374, 77.708, 77.6934, 77.6662, 77.582, 77.5376, 77.46260000000001, 77.4058, 77.3528, 77.302, 77.248, 77.1932, 77.1314, 77.0838, 77.0068, 76.9458, 76.8744, 76.8326, 76.76979999999999, 76.7078, 76.5878, 76.4862, 76.3916, 76.29260000000001, 76.192, 76.13159999999999, 76.1052, 76.10719999999999, 76.0772, 76.0368, 75.9904, 75.9384, 75.91460000000001, 75.85079999999999, 75.8672, 75.9342, 76.0718, 76.24680000000001, 76.4012, 76.572, 76.7108, 76.8638, 76.9962, 77.127, 77.23780000000001, 77.29599999999999, 77.4222, 77.5952, 77.72279999999999, 77.827, 77.9396, 78.07, 78.19919999999999, 78.34599999999999, 78.5582, 78.73819999999999, 78.908, 79.0766, 79.24520000000001, 79.4024, 79.5466, 79.7094, 79.9178, 80.1038, 80.31020000000001, 80.5312, 80.70679999999999, 80.8804, 81.0868, 81.26899999999999, 81.4898], "ma150": [64.46893333333334, 64.45786666666667, 64.44453333333334, 64.4438, 64.4366, 64.4332, 64.4266, 64.39726666666667, 64.3752, 64.34986666666667, 64.32113333333334, 64.30466666666668, 64.28006666666666, 64.25306666666667, 64.22346666666665, 64.18813333333333, 64.15586666666667, 64.12586666666667, 64.086, 64.05046666666667, 64.01126666666667, 63.97246666666666, 63.886066666666665, 63.794333333333334, 63.69526666666666, 63.57893333333333, 63.49839999999999, 63.38513333333332, 63.28006666666667, 63.192400000000006, 63.091466666666676, 62.986666666666665, 62.8882, 62.78306666666666, 62.6722, 62.5582, 62.4912, 62.4234, 62.35353333333334, 62.28926666666666, 62.22546666666666, 62.150533333333335, 62.087266666666665, 62.01526666666667, 61.940733333333334, 61.868133333333326, 61.79406666666667, 61.7218, 61.68019999999999, 61.63699999999999, 61.58846666666667, 61.550866666666664, 61.517333333333326, 61.48959999999999, 61.46446666666667, 61.42920000000001, 61.39426666666666, 61.35573333333334, 61.32619999999999, 61.281800000000004, 61.24753333333333, 61.21866666666667, 61.18679999999999, 61.184000000000005, 61.177400000000006, 61.17326666666666, 61.17786666666667, 61.184000000000005, 61.205466666666666, 61.22693333333333, 61.24986666666666, 61.25553333333333, 61.29739999999999, 61.319799999999994, 61.34346666666666, 61.373333333333335, 61.4212, 61.48646666666667, 61.543933333333335, 61.61126666666667, 61.68753333333333, 61.767933333333325, 61.86886666666667, 61.97760000000001, 62.0784, 62.15973333333333, 62.243133333333326, 62.3284, 62.40806666666666, 62.479, 62.5488, 62.599333333333334, 62.65813333333333, 62.732866666666666, 62.818400000000004, 62.90046666666667, 62.9884, 63.07366666666666, 63.16226666666667, 63.25666666666667, 63.36433333333333, 63.48559999999999, 63.61553333333333, 63.73273333333334, 63.851733333333335, 63.983333333333334, 64.11646666666667, 64.25213333333333, 64.3964, 64.54026666666667, 64.6812, 64.82419999999999, 64.9804, 65.13666666666667, 65.29686666666667, 65.46, 65.611, 65.7648, 65.9198, 66.08053333333334, 66.23866666666666, 66.39646666666667, 66.55853333333333, 66.71893333333334, 66.87726666666667, 67.01740000000001, 67.15566666666668, 67.30133333333333, 67.43579999999999, 67.57926666666667, 67.72593333333333, 67.86266666666667, 68.003, 68.12786666666666, 68.24086666666666, 68.34273333333333, 68.43493333333333, 68.536, 68.62866666666667, 68.72126666666666, 68.81173333333334, 68.90566666666666, 68.94233333333334, 68.99586666666667, 69.06186666666666, 69.11053333333334, 69.15913333333333, 69.22019999999999, 69.29206666666667, 69.366, 69.4528, 69.53633333333333, 69.61053333333334, 69.65453333333333, 69.71106666666667, 69.779, 69.8608, 69.96146666666667, 70.0616, 70.15873333333333, 70.25786666666667, 70.3548, 70.47186666666667, 70.57939999999999, 70.68933333333334, 70.80199999999999, 70.9118, 71.01293333333334, 71.11773333333333, 71.21346666666668, 71.30573333333332, 71.40026666666667, 71.5444, 71.69513333333333, 71.86166666666666, 72.04646666666666, 72.20613333333334, 72.39213333333335, 72.56326666666666, 72.7212, 72.87819999999999, 73.04213333333333, 73.20286666666667, 73.38726666666666, 73.56893333333333, 73.76146666666668, 73.91013333333333, 74.05420000000001, 74.19653333333333, 74.33040000000001, 74.46753333333334, 74.60846666666667, 74.73746666666666, 74.8704, 74.99666666666667, 75.13486666666668, 75.28273333333333, 75.41626666666667, 75.51986666666666, 75.61706666666666, 75.72466666666666, 75.8284, 75.92686666666667, 76.01606666666666, 76.10306666666666, 76.2054, 76.31313333333333, 76.42646666666666, 76.5284, 76.6332, 76.74100000000001, 76.8668, 77.01140000000001, 77.15366666666667, 77.31173333333334, 77.45533333333333, 77.59079999999999, 77.71946666666666, 77.82993333333333, 77.94893333333333], "ma200": [63.236, 63.24865, 63.2688, 63.289899999999996, 63.29915, 63.3015, 63.30915, 63.303900000000006, 63.29955000000001, 63.291900000000005, 63.290549999999996, 63.29215, 63.29514999999999, 63.30465, 63.325199999999995, 63.33755, 63.35305, 63.36769999999999, 63.37825, 63.39375, 63.4129, 63.436249999999994, 63.4037, 63.36559999999999, 63.328149999999994, 63.278600000000004, 63.243199999999995, 63.189299999999996, 63.1525, 63.1291, 63.10075, 63.06764999999999, 63.0433, 63.015699999999995, 62.99105, 62.97155, 62.98925, 63.0115, 63.03245, 63.047399999999996, 63.0582, 63.0642, 63.062349999999995, 63.064949999999996, 63.068250000000006, 63.0804, 63.09005, 63.10625, 63.13695, 63.1585, 63.16530000000001, 63.17415, 63.182649999999995, 63.20125, 63.218, 63.2321, 63.249849999999995, 63.2605, 63.28189999999999, 63.2932, 63.30585, 63.32395, 63.33134999999999, 63.33665, 63.3336, 63.327799999999996, 63.327749999999995, 63.3362, 63.3476, 63.3587, 63.366099999999996, 63.3626, 63.37169999999999, 63.370599999999996, 63.370099999999994, 63.37245, 63.38915, 63.4121, 63.4315, 63.460550000000005, 63.48805, 63.519149999999996, 63.567, 63.62155, 63.6661, 63.6999, 63.73035, 63.75795, 63.78435, 63.805150000000005, 63.826750000000004, 63.8412, 63.8646, 63.890600000000006, 63.91915, 63.9459, 63.969300000000004, 63.9917, 64.00795, 64.0213, 64.04035, 64.06129999999999, 64.08009999999999, 64.0942, 64.1067, 64.1333, 64.15995, 64.18715, 64.21485, 64.2376, 64.26575, 64.3018, 64.35175, 64.424, 64.4976, 64.57615, 64.64825, 64.71345000000001, 64.78235, 64.8625, 64.9375, 65.0107, 65.10105, 65.18835, 65.2723, 65.3503, 65.42835, 65.5164, 65.59975, 65.6855, 65.77024999999999, 65.84975, 65.94025, 66.0226, 66.09, 66.1417, 66.1913, 66.24625, 66.29125, 66.34115, 66.38865, 66.4285, 66.4658, 66.51385, 66.5737, 66.62615, 66.6808, 66.73639999999999, 66.80705, 66.87684999999999, 66.95025, 67.03755, 67.1282, 67.19505, 67.2732, 67.35315, 67.4388, 67.5273, 67.62280000000001, 67.7172, 67.8092, 67.901, 68.00625, 68.1042, 68.2091, 68.3136, 68.41640000000001, 68.51604999999999, 68.6168, 68.70734999999999, 68.80054999999999, 68.89524999999999, 68.99205, 69.0872, 69.19085, 69.28935, 69.39354999999999, 69.4953, 69.58605, 69.68205, 69.77905, 69.87565, 69.96495, 70.0627, 70.1642, 70.275, 70.3879, 70.5023, 70.61449999999999, 70.71865000000001, 70.82475000000001, 70.9283, 70.98849999999999, 71.05635000000001, 71.1204, 71.18845, 71.26814999999999, 71.34585, 71.4258, 71.5094, 71.6071, 71.70205, 71.7944, 71.88045, 71.96785, 72.06125, 72.16475, 72.2824, 72.3968, 72.50569999999999, 72.62075, 72.74555000000001, 72.87985, 73.01209999999999, 73.1498, 73.2782, 73.40395, 73.5314, 73.65555, 73.78255], "rs_line": [1.0, 1.0090545341421349, 1.0349491887319242, 1.0427929172064312, 1.0643360865141354, 1.0568056288903958, 1.033024924763028, 1.0036536341515727, 0.9914673798023008, 0.9909562857558484, 0.9974587911561067, 0.9975737045914299, 0.9965058701547909, 1.0023180527370192, 1.0014285696249356, 0.9899449980613273, 1.0092922948085497, 1.0101694620866606, 1.0176618638439867, 1.025891606759494, 1.033816107876124, 1.0364076715806672, 0.9562331742210414, 0.9966702951566933, 0.9838309596736985, 0.9532428014953145, 0.9386890296985607, 0.9073401509013158, 0.9096126946247404, 0.9235505311777503, 0.9112151178154347, 0.921099865160999, 0.9334389668436375, 0.9360399415131909, 0.9222163486215462, 0.9184283708079826, 1.0306037728390312, 1.0337191429646555, 1.0392549456263098, 1.0366216795874132, 1.0417642576985688, 1.0145467555089835, 1.0168325787938877, 1.0134224196399568, 1.017454927163241, 1.0216760906396098, 1.020387244148607, 1.0173893215554124, 1.049517106079891, 1.046925622087807, 1.0357417582962962, 1.0506229384812213, 1.0556329314201656, 1.0696980719084561, 1.0761403407321817, 1.0612798774780061, 1.0627819456214016, 1.0609000570979756, 1.0637632797728638, 1.0524859874208066, 1.0565725655298557, 1.056330597442656, 1.0321483520322803, 1.0283311462347433, 1.024692018269764, 1.02573394475328, 1.0330655625541298, 1.0515890036461444, 1.0654687107610044, 1.0714648479355762, 1.0743340558440126, 1.0600615817045644, 1.0804225137856172, 1.0542794472633692, 1.0611554291028011, 1.0777910335120937, 1.0978842950374414, 1.1163423182674723, 1.1018821274817057, 1.1029374499253823, 1.1099302802097635, 1.1150713870611193, 1.163331682380622, 1.1765833673935115, 1.1587266603007438, 1.1510365796256237, 1.1510656615407375, 1.1467465427491705, 1.1497849556861093, 1.1279508150274726, 1.132076088357847, 1.1226834899265583, 1.1350897503971058, 1.1470581052666158, 1.1571189405977458, 1.152850984579187, 1.1512019116643262, 1.1307483239233858, 1.1040417911992462, 1.0983721512939677, 1.1179894271524229, 1.1209460468634327, 1.1179465175370913, 1.1097531966170666, 1.12028955104097, 1.1369338438420142, 1.1439163618349057, 1.1364009312322882, 1.1417819208842208, 1.1349982903504923, 1.1384212387866843, 1.136303869860574, 1.1623843101869669, 1.165604404104373, 1.1768974712706934, 1.1825214405588924, 1.1676750338443913, 1.1655206117241892, 1.1661036507188522, 1.1837553930471671, 1.1775122346424167, 1.1804141518006381, 1.1771533680989883, 1.1735745456692654, 1.1743940667170039, 1.1624632189390391, 1.1457587123322828, 1.1559598245627538, 1.1496564942048904, 1.1415170930938043, 1.128551541215595, 1.111275180744534, 1.1346150327682023, 1.1127065261354523, 1.0732056520805904, 1.0561611929029822, 1.046573221123729, 1.0552345275039405, 1.0426799435452494, 1.0456077067915746, 1.052878651621633, 1.0620270701874974, 1.057447191079634, 1.0659482970560152, 1.0820854958120485, 1.06261435109076, 1.0514664067987975, 1.0483041876485735, 1.0583609631826978, 1.0391541799260473, 1.043718583336989, 1.0477919598233372, 1.0379041474665576, 1.0139991693714057, 1.0192260148565258, 1.0307605462516776, 1.0400950473564, 1.0510412282673616, 1.0508681988011872, 1.0397730771943923, 1.0403446773859975, 1.05039353177256, 1.082824175250608, 1.056958735103688, 1.0635658850523744, 1.0587109829801598, 1.058474263296344, 1.0508882871335952, 1.044168421650481, 1.0359300325015985, 1.0501535626379623, 1.058785498888454, 1.06664879217796, 1.0650432062878479, 1.0703185235913144, 1.0716999078316563, 1.0806637491313922, 1.095704794730624, 1.0793556253414882, 1.0801124480969622, 1.075120681248385, 1.0770396159520854, 1.0978579850608385, 1.1215836736789673, 1.1074083824138146, 1.1277828958465104, 1.1351549020203766, 1.1280363895022907, 1.134444764117387, 1.1181057823984466, 1.125437606919176, 1.1161606579395773, 1.1038364233874844, 1.1075721969105399, 1.091176113456296, 1.115206246406346, 1.1369928872773027, 1.1163596492510357, 1.1118793018561899, 1.1054398769435052, 1.130805474626351, 1.1317118210942039, 1.124175283082741, 1.1114914393555317, 1.1043996210635911, 1.103502387086949, 1.1161876207212988, 1.1238428884969294, 1.1230434546880097, 1.122256440336415, 1.1334542237204368, 1.1613745630196266, 1.1769025492500356, 1.177730992642605, 1.2065456067128568, 1.1660782049254488, 1.1631757813581114, 1.168600283666845, 1.154770362466618, 1.1714527832550452], "rs_score": 0.3455891061745695}, {"ticker": "GL", "dates": ["2025-03-04", "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12", "2025-03-13", "2025-03-14", "2025-03-17", "2025-03-18", "2025-03-19", "2025-03-20", "2025-03-21", "2025-03-24", "2025-03-25", "2025-03-26", "2025-03-27", "2025-03-28", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03", "2025-04-04", "2025-04-07", "2025-04-08", "2025-04-09", "2025-04-10", "2025-04-11", "2025-04-14", "2025-04-15", "2025-04-16", "2025-04-17", "2025-04-21", "2025-04-22", "2025-04-23", "2025-04-24", "2025-04-25", "2025-04-28", "2025-04-29", "2025-04-30", "2025-05-01", "2025-05-02", "2025-05-05", "2025-05-06", "2025-05-07", "2025-05-08", "2025-05-09", "2025-05-12", "2025-05-13", "2025-05-14", "2025-05-15", "2025-05-16", "2025-05-19", "2025-05-20", "2025-05-21", "2025-05-22", "2025-05-23", "2025-05-27", "2025-05-28", "2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04", "2025-06-05", "2025-06-06", "2025-06-09", "2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-16", "2025-06-17", "2025-06-18", "2025-06-20", "2025-06-23", "2025-06-24", "2025-06-25", "2025-06-26", "2025-06-27", "2025-06-30", "2025-07-01", "2025-07-02", "2025-07-03", "2025-07-07", "2025-07-08", "2025-07-09", "2025-07-10", "2025-07-11", "2025-07-14", "2025-07-15", "2025-07-16", "2025-07-17", "2025-07-18", "2025-07-21", "2025-07-22", "2025-07-23", "2025-07-24", "2025-07-25", "2025-07-28", "2025-07-29", "2025-07-30", "2025-07-31", "2025-08-01", "2025-08-04", "2025-08-05", "2025-08-06", "2025-08-07", "2025-08-08", "2025-08-11", "2025-08-12", "2025-08-13", "2025-08-14", "2025-08-15", "2025-08-18", "2025-08-19", "2025-08-20", "2025-08-21", "2025-08-22", "2025-08-25", "2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29", "2025-09-02", "2025-09-03", "2025-09-04", "2025-09-05", "2025-09-08", "2025-09-09", "2025-09-10", "2025-09-11", "2025-09-12", "2025-09-15", "2025-09-16", "2025-09-17", "2025-09-18", "2025-09-19", "2025-09-22", "2025-09-23", "2025-09-24", "2025-09-25", "2025-09-26", "2025-09-29", "2025-09-30", "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16", "2025-10-17", "2025-10-20", "2025-10-21", "2025-10-22", "2025-10-23", "2025-10-24", "2025-10-27", "2025-10-28", "2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04", "2025-11-05", "2025-11-06", "2025-11-07", "2025-11-10", "2025-11-11", "2025-11-12", "2025-11-13", "2025-11-14", "2025-11-17", "2025-11-18", "2025-11-19", "2025-11-20", "2025-11-21", "2025-11-24", "2025-11-25", "2025-11-26", "2025-11-28", "2025-12-01", "2025-12-02", "2025-12-03", "2025-12-04", "2025-12-05", "2025-12-08", "2025-12-09", "2025-12-10", "2025-12-11", "2025-12-12", "2025-12-15", "2025-12-16", "2025-12-17", "2025-12-18", "2025-12-19", "2025-12-22", "2025-12-23", "2025-12-24", "2025-12-26", "2025-12-29", "2025-12-30", "2025-12-31", "2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08", "2026-01-09", "2026-01-12", "2026-01-13", "2026-01-14", "2026-01-15"], "close": [124.15, 126.22, 124.43, 125.49, 122.58, 124.57, 122.35, 121.95, 125.41, 127.62, 126.97, 127.4, 128.6, 126.83, 129.79, 129.9, 130.53, 131.42, 129.77, 131.72, 132.13, 133.09, 127.51, 117.22, 114.33, 113.29, 122.63, 118.6, 119.5, 121.23, 122.79, 121.22, 121.25, 117.17, 121.68, 122.79, 123.92, 122.96, 123.6, 123.97, 123.34, 117.72, 121.83, 121.49, 120.34, 120.96, 121.23, 121.94, 120.72, 120.09, 119.28, 120.57, 122.07, 122.21, 122.19, 120.2, 119.56, 119.41, 122.26, 120.05, 120.97, 121.87, 122.24, 122.8, 120.29, 119.77, 121.7, 120.66, 120.09, 119.78, 120.77, 119.79, 120.63, 119.41, 119.71, 120.59, 122.11, 122.91, 121.42, 123.04, 123.89, 124.29, 124.9, 120.29, 121.2, 121.21, 121.09, 117.6, 119.13, 118.13, 120.69, 117.74, 119.9, 121.6, 122.09, 120.29, 122.83, 124.81, 131.52, 135.13, 134.16, 143.27, 141.05, 140.47, 137.24, 139.34, 139.51, 141.23, 140.5, 140.55, 139.05, 139.74, 139.0, 138.56, 135.43, 135.99, 136.77, 139.1, 139.62, 141.24, 139.39, 139.69, 140.49, 140.46, 139.95, 139.95, 140.57, 141.45, 139.81, 140.37, 140.46, 139.02, 142.49, 142.27, 142.43, 140.86, 142.8, 143.63, 145.43, 145.25, 146.55, 143.3, 143.03, 144.56, 143.52, 142.97, 140.98, 139.44, 137.58, 134.0, 135.64, 136.03, 136.45, 136.0, 136.46, 139.87, 138.1, 133.61, 134.78, 135.43, 136.01, 135.63, 135.7, 133.62, 134.99, 134.37, 131.73, 132.44, 131.51, 130.64, 133.38, 133.75, 131.83, 132.24, 132.77, 132.31, 133.97, 133.16, 131.81, 131.43, 131.85, 130.74, 130.37, 132.42, 133.27, 135.37, 134.87, 134.73, 132.53, 131.15, 130.82, 130.82, 131.37, 133.02, 133.09, 134.91, 139.04, 139.46, 140.65, 140.74, 138.73, 138.53, 139.64, 142.53, 142.37, 143.5, 142.21, 141.76, 141.46, 139.86, 138.42, 140.63, 139.64, 139.76, 142.47, 141.95, 142.87, 141.93, 142.41, 139.82], "ma50": [118.1838, 118.61959999999999, 118.99, 119.31199999999998, 119.57199999999999, 119.84960000000001, 120.07959999999999, 120.3286, 120.63780000000001, 120.95980000000002, 121.25439999999999, 121.57220000000001, 121.92019999999998, 122.227, 122.5404, 122.89, 123.2418, 123.58959999999999, 123.86140000000002, 124.15099999999998, 124.4276, 124.6984, 124.83800000000001, 124.815, 124.71480000000001, 124.56360000000001, 124.58400000000002, 124.517, 124.461, 124.44380000000001, 124.45100000000001, 124.4272, 124.3908, 124.3348, 124.29899999999999, 124.3098, 124.3592, 124.389, 124.39020000000001, 124.43279999999999, 124.4226, 124.2966, 124.24780000000001, 124.22579999999999, 124.1782, 124.12780000000001, 124.1138, 124.069, 123.93480000000001, 123.7648, 123.6674, 123.5544, 123.5072, 123.4416, 123.4338, 123.34639999999999, 123.29060000000001, 123.23980000000002, 123.17679999999999, 123.02539999999999, 122.90540000000001, 122.7948, 122.66760000000001, 122.58699999999999, 122.39699999999999, 122.1944, 122.01780000000001, 121.8026, 121.609, 121.37020000000001, 121.14300000000001, 120.87700000000001, 120.7394, 120.7832, 120.8908, 121.0368, 121.0264, 121.1126, 121.15100000000001, 121.18719999999999, 121.2092, 121.27060000000002, 121.34360000000001, 121.406, 121.3964, 121.3648, 121.3082, 121.20100000000001, 121.1116, 120.99480000000001, 120.9418, 120.9422, 120.90360000000001, 120.9058, 120.9408, 120.92739999999999, 120.9594, 121.0168, 121.23279999999998, 121.5336, 121.8312, 122.2852, 122.66480000000001, 123.03, 123.331, 123.71379999999999, 124.1128, 124.5492, 124.91400000000002, 125.324, 125.6856, 126.043, 126.37820000000002, 126.6934, 126.9962, 127.3206, 127.62200000000001, 127.9908, 128.38139999999999, 128.81060000000002, 129.183, 129.58100000000002, 129.9782, 130.3992, 130.804, 131.19119999999998, 131.56040000000002, 131.93120000000002, 132.299, 132.6456, 132.97699999999998, 133.2716, 133.6234, 134.06300000000002, 134.48760000000001, 134.88060000000002, 135.31480000000002, 135.8354, 136.3614, 136.9038, 137.421, 137.93220000000002, 138.3948, 138.854, 139.2826, 139.7362, 140.0992, 140.3918, 140.513, 140.49040000000002, 140.52, 140.3752, 140.2832, 140.1938, 140.1782, 140.18880000000001, 140.16060000000002, 140.0082, 139.8938, 139.7914, 139.7306, 139.6484, 139.5824, 139.4836, 139.4748, 139.4424, 139.3416, 139.2084, 139.0462, 138.8342, 138.714, 138.59519999999998, 138.422, 138.2576, 138.114, 137.96120000000002, 137.82920000000001, 137.6634, 137.5034, 137.3246, 137.15240000000003, 136.98680000000002, 136.7444, 136.5474, 136.3642, 136.25439999999998, 136.0958, 135.9178, 135.6598, 135.3778, 135.0632, 134.81359999999998, 134.5804, 134.34959999999998, 134.141, 133.97979999999998, 133.941, 133.9414, 134.00279999999998, 134.1376, 134.1994, 134.24939999999998, 134.3132, 134.44379999999998, 134.562, 134.63459999999998, 134.71679999999998, 134.8798, 135.0134, 135.102, 135.15019999999998, 135.25019999999998, 135.329, 135.4518, 135.60139999999998, 135.75300000000001, 135.9758, 136.16559999999998, 136.3836, 136.56719999999999], "ma150": [108.90520000000001, 109.13286666666666, 109.33266666666668, 109.55100000000002, 109.74853333333333, 109.97293333333333, 110.19773333333333, 110.41753333333331, 110.66153333333335, 110.90360000000001, 111.13659999999999, 111.37593333333334, 111.61206666666665, 111.83113333333333, 112.05666666666667, 112.27673333333333, 112.49266666666668, 112.72033333333333, 112.93526666666668, 113.15373333333334, 113.36233333333332, 113.56846666666665, 113.73926666666667, 113.8304666666667, 113.8912, 113.94613333333335, 114.06246666666668, 114.14946666666668, 114.24893333333334, 114.37353333333333, 114.50306666666665, 114.62979999999999, 114.76253333333331, 114.8618, 114.98100000000001, 115.09160000000001, 115.20986666666667, 115.31859999999998, 115.4276, 115.54566666666666, 115.65, 115.71399999999998, 115.80346666666667, 115.88273333333333, 115.98899999999999, 116.08933333333331, 116.20613333333333, 116.31773333333334, 116.42353333333335, 116.514, 116.61926666666666, 116.72866666666665, 116.82780000000001, 116.933, 117.02906666666667, 117.1052, 117.1636, 117.22053333333332, 117.30859999999998, 117.37746666666668, 117.44899999999998, 117.52100000000002, 117.59686666666666, 117.68626666666665, 117.78719999999998, 117.88246666666666, 117.98093333333333, 118.07199999999999, 118.16860000000001, 118.27366666666666, 118.38886666666666, 118.4916, 118.55580000000002, 118.62786666666666, 118.69793333333335, 118.775, 118.85340000000001, 118.93900000000002, 119.02173333333332, 119.11400000000002, 119.20826666666667, 119.30806666666666, 119.41566666666665, 119.49099999999999, 119.56246666666667, 119.628, 119.6924, 119.73173333333335, 119.78433333333332, 119.83826666666668, 119.91293333333333, 119.99086666666668, 120.07946666666668, 120.19173333333335, 120.31060000000001, 120.42153333333333, 120.53993333333332, 120.67526666666667, 120.84926666666667, 121.03826666666666, 121.22746666666666, 121.48639999999999, 121.72066666666669, 121.92786666666667, 122.11226666666667, 122.30326666666667, 122.49433333333332, 122.70586666666665, 122.90953333333333, 123.10306666666666, 123.2818, 123.47, 123.65533333333333, 123.83579999999999, 123.97786666666667, 124.135, 124.29386666666666, 124.46100000000001, 124.61726666666667, 124.77726666666666, 124.91786666666667, 125.05213333333333, 125.18520000000002, 125.33246666666666, 125.46986666666669, 125.59719999999999, 125.7236, 125.85359999999999, 125.97033333333333, 126.09219999999999, 126.21239999999997, 126.32313333333332, 126.45259999999999, 126.60126666666669, 126.72766666666668, 126.85173333333334, 126.99406666666667, 127.14179999999998, 127.28773333333334, 127.4438, 127.59513333333334, 127.72366666666666, 127.84873333333334, 127.99520000000001, 128.13386666666668, 128.2638, 128.39079999999998, 128.49253333333334, 128.56019999999998, 128.59626666666665, 128.67286666666664, 128.73826666666668, 128.81840000000003, 128.88846666666666, 128.98100000000002, 129.083, 129.18800000000002, 129.26573333333334, 129.3282, 129.38026666666667, 129.44053333333335, 129.49540000000002, 129.54273333333336, 129.588, 129.62266666666665, 129.6524666666667, 129.66046666666668, 129.66726666666668, 129.67886666666666, 129.67166666666665, 129.68, 129.6844, 129.7132, 129.81333333333333, 129.93626666666665, 130.06306666666666, 130.13866666666667, 130.23573333333334, 130.31779999999998, 130.3858, 130.4462, 130.50966666666667, 130.57046666666668, 130.67213333333333, 130.7494, 130.83326666666665, 130.90626666666668, 130.98473333333334, 131.04426666666666, 131.09213333333335, 131.14200000000002, 131.22933333333333, 131.29293333333334, 131.3698, 131.4548, 131.54780000000002, 131.66653333333335, 131.78333333333333, 131.91619999999998, 132.05386666666666, 132.18353333333332, 132.30326666666664, 132.4204, 132.55586666666667, 132.69039999999998, 132.84573333333333, 132.9967333333333, 133.14573333333334, 133.27373333333335, 133.4058, 133.52213333333333, 133.6472, 133.76319999999998, 133.87626666666668, 134.02413333333334, 134.172, 134.31313333333335, 134.45493333333332, 134.60373333333334, 134.73733333333334], "ma200": [102.64385, 102.83605000000001, 103.0385, 103.23559999999999, 103.41845, 103.62465, 103.8084, 104.01540000000001, 104.23375, 104.45205, 104.67505, 104.90070000000001, 105.12989999999999, 105.35165, 105.59154999999998, 105.8233, 106.06975, 106.3202, 106.56095, 106.81639999999999, 107.0715, 107.33840000000001, 107.5865, 107.773, 107.94265000000001, 108.09625, 108.2941, 108.46865, 108.64859999999999, 108.8387, 109.04144999999998, 109.23615, 109.42825, 109.5987, 109.7949, 110.00145, 110.21645000000001, 110.4217, 110.62404999999998, 110.81774999999999, 111.00425000000001, 111.15880000000001, 111.32539999999999, 111.48820000000002, 111.64890000000001, 111.8124, 111.97364999999999, 112.13555000000001, 112.29775, 112.45280000000001, 112.59575, 112.73825, 112.87629999999999, 113.02365, 113.16985000000001, 113.31630000000001, 113.47095000000002, 113.62310000000001, 113.79035, 113.93404999999998, 114.07880000000002, 114.23065000000001, 114.37595000000002, 114.5201, 114.64175000000002, 114.75615000000002, 114.87394999999998, 114.9909, 115.10369999999999, 115.20785, 115.3075, 115.3956, 115.4893, 115.56864999999999, 115.6411, 115.71879999999999, 115.80345, 115.89025, 115.97445000000002, 116.07695, 116.17960000000001, 116.29, 116.40780000000001, 116.49785, 116.58484999999999, 116.6599, 116.73445000000001, 116.7892, 116.8486, 116.90795, 116.97295, 117.02105, 117.0785, 117.13849999999998, 117.22695, 117.29885, 117.39445000000002, 117.4925, 117.62584999999999, 117.76889999999999, 117.92225, 118.1178, 118.28705, 118.45725, 118.60455, 118.75734999999999, 118.90090000000001, 119.0527, 119.20995, 119.3641, 119.50815, 119.6515, 119.79220000000001, 119.93804999999999, 120.08945, 120.242, 120.39120000000001, 120.5517, 120.72179999999999, 120.90790000000001, 121.0874, 121.26395000000001, 121.4114, 121.5707, 121.72444999999999, 121.87905, 122.03014999999999, 122.18705, 122.34105, 122.49690000000001, 122.65045, 122.79895, 122.9676, 123.134, 123.29375, 123.44115, 123.598, 123.75765, 123.9286, 124.10465, 124.28995, 124.47619999999999, 124.6583, 124.8573, 125.0536, 125.2502, 125.42975, 125.60439999999998, 125.76520000000001, 125.9013, 126.05059999999999, 126.20859999999999, 126.36129999999999, 126.49435, 126.62875, 126.77465000000001, 126.9109, 127.03145, 127.15559999999999, 127.27515, 127.39400000000002, 127.51459999999999, 127.63709999999999, 127.74775, 127.85210000000001, 127.96185, 128.0558, 128.14785, 128.2245, 128.29149999999998, 128.36690000000002, 128.4379, 128.49439999999998, 128.56375, 128.6309, 128.68820000000002, 128.75, 128.80605, 128.8536, 128.90030000000002, 128.9474, 128.98905000000002, 129.02555, 129.08780000000002, 129.1368, 129.2024, 129.2695, 129.3358, 129.38074999999998, 129.4273, 129.46215, 129.49615, 129.53165, 129.5838, 129.63565, 129.69279999999998, 129.77835, 129.85475, 129.92085, 129.98160000000001, 130.05450000000002, 130.11605, 130.19209999999998, 130.2773, 130.37625, 130.4709, 130.5702, 130.66925, 130.7495, 130.81070000000003, 130.86795, 130.9341, 130.98930000000001, 131.05395, 131.11735000000002, 131.1776, 131.23930000000001, 131.29184999999998, 131.35505, 131.39555000000001], "rs_line": [1.0, 1.0058625276930293, 1.0095179293016965, 1.0124431828893765, 1.0160281005776666, 1.0411777232975281, 1.0172246553461566, 1.0275973898634176, 1.0353663932884731, 1.0455492759385883, 1.051590072411833, 1.0437836953086927, 1.0566708843036678, 1.0449174718594616, 1.0504914382123973, 1.048860454615523, 1.0666816460303408, 1.0768143485740418, 1.0851477438149806, 1.09410933981745, 1.0944237281417448, 1.0954430237568988, 1.1039168240814135, 1.0779368292100024, 1.0532368557757046, 1.0602627905204958, 1.0386011381715596, 1.0505014640176171, 1.0399181301788747, 1.0448365669457789, 1.0612540551507772, 1.0715021595925842, 1.0702403440142654, 1.059445001287027, 1.072324711595034, 1.0655948462694884, 1.0532318325037553, 1.0375757182840117, 1.0425786297170216, 1.0391536194135709, 1.0334626075846431, 0.9794315882352783, 0.9988005074353157, 1.0017575087246753, 1.000638737113157, 1.0015820038168124, 0.9968716418996362, 1.00398924045454, 0.9621478707918005, 0.9508474325021625, 0.9432285466048723, 0.9487952033793212, 0.9545528943839311, 0.9546034067212225, 0.9576670438852629, 0.9582171012827176, 0.9527391568881846, 0.9580834445690347, 0.960971259900147, 0.9490913314754853, 0.9526043660743578, 0.9607662746831837, 0.9582852166645252, 0.9572166239158179, 0.9379031136156588, 0.9383836690965559, 0.943813021512873, 0.9349049470228934, 0.9252426001352542, 0.9254937137789061, 0.9294491279416388, 0.9323305937662538, 0.9300199182809736, 0.9285486981145278, 0.9310217702120536, 0.9428527719393134, 0.9453989650660902, 0.9411951114309232, 0.929264594180472, 0.9343527409398604, 0.9361563744781619, 0.9347098917944279, 0.9396014847045885, 0.9008374607091296, 0.9005547313312706, 0.9073908623623563, 0.9069893660357562, 0.8755978302684192, 0.8844950469687757, 0.8801645461289683, 0.8975259565496716, 0.8793456273547705, 0.8924937952044619, 0.8996425165682401, 0.9039297927972099, 0.8889174141529964, 0.9075575670754881, 0.9144079629530507, 0.9632491541771587, 0.9855255170096223, 0.97869693398262, 1.0479183670126144, 1.0329815039973806, 1.0326074055889884, 1.025674534074841, 1.0257774783383546, 1.0322624837637435, 1.037045751624336, 1.0325502304559897, 1.024925777657259, 1.0159964979118037, 1.0102826579184987, 1.0015043947808486, 0.9982412895479008, 0.9779812409827584, 0.9822388874221907, 0.9932613238111248, 1.0128736687309816, 1.02075522664337, 1.016981412767845, 1.0080973349801106, 1.0060546804138313, 1.0095161351088398, 1.0057388031873227, 1.0080990952413316, 1.0156251603002184, 1.0146256819964474, 1.012515460070555, 1.0036830460729151, 1.0052337920888101, 1.0035582306895228, 0.9904066154627537, 1.0067612038981386, 1.0055431858222137, 1.001342969477402, 0.9916706281502093, 1.0065790498665297, 1.0077210660492437, 1.0181362212874274, 1.0120878237385222, 1.0267352169448045, 1.007169892768938, 1.0099315668711206, 1.0149203347076703, 1.004794842149374, 0.9971879657409677, 0.9799688708259172, 0.9681489175555488, 0.9552489848890598, 0.9270674780973508, 0.941905801150357, 0.9390146266140411, 0.9446505382557647, 0.9676897201296525, 0.9562893943293159, 0.9813850222769381, 0.9646832249152468, 0.9397185506637679, 0.942597029265736, 0.9373934897928587, 0.9414220468045646, 0.9436980307058348, 0.9386191470583989, 0.9167399454719557, 0.9153403190730887, 0.9087226517315388, 0.8904410718236427, 0.9051958377052508, 0.8959007471962913, 0.8883068889285964, 0.9178173298708452, 0.9171849375065656, 0.9138233592883279, 0.9157637318207228, 0.9053073248406138, 0.9001101675876193, 0.9108964188063012, 0.9206665512377807, 0.9114818603780425, 0.9174010328687462, 0.9281266899244031, 0.9167714668580844, 0.9283267910294749, 0.9336242004558513, 0.9259878597609108, 0.9318145553253577, 0.9220077435222415, 0.9160504491900813, 0.9052250859077946, 0.8941430784548937, 0.8888154457107671, 0.8881660970603552, 0.890209215516509, 0.9041063769124393, 0.9053635157110045, 0.9116978375418925, 0.9374262202238977, 0.9504775113342899, 0.9600382745161183, 0.9632846310113747, 0.9600917792973154, 0.9515223519340209, 0.9533403573574909, 0.9670461714016835, 0.9615657791079228, 0.9658004451417412, 0.9572153919676064, 0.957598957639725, 0.9567408046482138, 0.9529800248446831, 0.9414424126479959, 0.9501452990906417, 0.9378787728045775, 0.9417203093743741, 0.960078085885327, 0.950289269755968, 0.9549485462535426, 0.9505662452091959, 0.9584921670383114, 0.938504390819086], "rs_score": 0.037140915109689754}], "analyst_panel": [{"ticker": "HII", "consensus": "Hold", "analyst_count": 27, "target_consensus": 344.0, "target_high": 412.0, "target_low": 264.0}, {"ticker": "IVZ", "consensus": "Hold", "analyst_count": 28, "target_consensus": 27.97, "target_high": 31.0, "target_low": 24.0}, {"ticker": "WYNN", "consensus": "Buy", "analyst_count": 45, "target_consensus": 147.67, "target_high": 164.0, "target_low": 127.0}, {"ticker": "TKO", "consensus": "Buy", "analyst_count": 18, "target_consensus": 228.1, "target_high": 250.0, "target_low": 210.0}, {"ticker": "HAS", "consensus": "Buy", "analyst_count": 32, "target_consensus": 96.33, "target_high": 99.0, "target_low": 94.0}, {"ticker": "PSKY", "consensus": "Sell", "analyst_count": 28, "target_consensus": 13.5, "target_high": 16.0, "target_low": 12.0}, {"ticker": "ALLE", "consensus": "Hold", "analyst_count": 22, "target_consensus": 185.0, "target_high": 190.0, "target_low": 180.0}, {"ticker": "GL", "consensus": "Buy", "analyst_count": 28, "target_consensus": 167.0, "target_high": 176.0, "target_low": 158.0}, {"ticker": "BEN", "consensus": "Hold", "analyst_count": 27, "target_consensus": 25.0, "target_high": 25.0, "target_low": 25.0}, {"ticker": "UHS", "consensus": "Hold", "analyst_count": 43, "target_consensus": 241.5, "target_high": 274.0, "target_low": 203.0}], "records": [{"ticker": "HII", "momentum_12_1": 0.6672238261662362, "quality_raw": null, "value_raw": null, "composite_score": 1.0200732985022256, "rs_score": 0.9325344356076253, "ma_50": 333.8092, "ma_150": 290.52646666666664, "ma_200": 273.0526, "sepa_pass": true, "rank": 1, "action": "BUY"}, {"ticker": "IVZ", "momentum_12_1": 0.5705669481302775, "quality_raw": null, "value_raw": null, "composite_score": 0.8866923453815326, "rs_score": 0.5835899745545041, "ma_50": 25.6798, "ma_150": 22.367733333333334, "ma_200": 20.3233, "sepa_pass": true, "rank": 2, "action": "BUY"}, {"ticker": "WYNN", "momentum_12_1": 0.543398533007335, "quality_raw": null, "value_raw": null, "composite_score": 0.8492014892985479, "rs_score": 0.24581343876890793, "ma_50": 123.4302, "ma_150": 117.08273333333334, "ma_200": 108.7371, "sepa_pass": false, "rank": 3, "action": "BUY"}, {"ticker": "TKO", "momentum_12_1": 0.44958423590245244, "quality_raw": null, "value_raw": null, "composite_score": 0.7197431349790349, "rs_score": 0.2705489124816587, "ma_50": 198.3362, "ma_150": 188.3748, "ma_200": 180.6787, "sepa_pass": true, "rank": 4, "action": "BUY"}, {"ticker": "HAS", "momentum_12_1": 0.43235605793006004, "quality_raw": null, "value_raw": null, "composite_score": 0.6959692365748702, "rs_score": 0.3455891061745695, "ma_50": 81.4898, "ma_150": 77.94893333333333, "ma_200": 73.78255, "sepa_pass": true, "rank": 5, "action": "BUY"}, {"ticker": "PSKY", "momentum_12_1": 0.31115276476101217, "quality_raw": null, "value_raw": null, "composite_score": 0.5287156371130692, "rs_score": -0.08031161078391369, "ma_50": 14.228600000000002, "ma_150": 14.711266666666667, "ma_200": 13.941849999999999, "sepa_pass": false, "rank": 6, "action": "BUY"}, {"ticker": "ALLE", "momentum_12_1": 0.25672447013487476, "quality_raw": null, "value_raw": null, "composite_score": 0.4536077093433836, "rs_score": 0.07101089861975907, "ma_50": 162.3784, "ma_150": 163.57533333333333, "ma_200": 156.655, "sepa_pass": false, "rank": 7, "action": "BUY"}, {"ticker": "GL", "momentum_12_1": 0.2334473384197142, "quality_raw": null, "value_raw": null, "composite_score": 0.42148660138737254, "rs_score": 0.037140915109689754, "ma_50": 136.56719999999999, "ma_150": 134.73733333333334, "ma_200": 131.39555000000001, "sepa_pass": true, "rank": 8, "action": "BUY"}, {"ticker": "BEN", "momentum_12_1": 0.216898505924781, "quality_raw": null, "value_raw": null, "composite_score": 0.3986501608146931, "rs_score": 0.14894248146990763, "ma_50": 23.437200000000004, "ma_150": 23.8626, "ma_200": 22.906600000000005, "sepa_pass": false, "rank": 9, "action": "BUY"}, {"ticker": "UHS", "momentum_12_1": 0.21562771503040845, "quality_raw": null, "value_raw": null, "composite_score": 0.3968965421984841, "rs_score": -0.08026351886758976, "ma_50": 224.79840000000002, "ma_150": 199.03866666666667, "ma_200": 194.75915, "sepa_pass": false, "rank": 10, "action": "BUY"}, {"ticker": "EVRG", "momentum_12_1": 0.2109132494690411, "quality_raw": null, "value_raw": null, "composite_score": 0.3903908498690057, "rs_score": 0.049005364117890915, "ma_50": 74.5674, "ma_150": 73.111, "ma_200": 71.5918, "sepa_pass": true, "rank": 11, "action": "BUY"}, {"ticker": "AES", "momentum_12_1": 0.16962025316455698, "quality_raw": null, "value_raw": null, "composite_score": 0.3334088811129659, "rs_score": 0.02953776381816864, "ma_50": 14.0026, "ma_150": 13.375399999999999, "ma_200": 12.704600000000001, "sepa_pass": true, "rank": 12, "action": "BUY"}, {"ticker": "SOLV", "momentum_12_1": 0.166690411739564, "quality_raw": null, "value_raw": null, "composite_score": 0.3293658678303243, "rs_score": -0.042995438706864286, "ma_50": 80.1182, "ma_150": 75.39473333333332, "ma_200": 74.0447, "sepa_pass": true, "rank": 13, "action": "BUY"}, {"ticker": "NDSN", "momentum_12_1": 0.14647316908538643, "quality_raw": null, "value_raw": null, "composite_score": 0.30146723144271687, "rs_score": 0.12195061860323442, "ma_50": 240.301, "ma_150": 228.5986, "ma_200": 220.27550000000002, "sepa_pass": true, "rank": 14, "action": "BUY"}, {"ticker": "AIZ", "momentum_12_1": 0.13929862264335235, "quality_raw": null, "value_raw": null, "composite_score": 0.291566768463857, "rs_score": -0.02926403440775882, "ma_50": 230.6496, "ma_150": 213.51033333333334, "ma_200": 209.2006, "sepa_pass": true, "rank": 15, "action": "BUY"}, {"ticker": "LNT", "momentum_12_1": 0.13566360962104174, "quality_raw": null, "value_raw": null, "composite_score": 0.28655065878419667, "rs_score": -0.02861926187430286, "ma_50": 66.3272, "ma_150": 65.34553333333334, "ma_200": 64.34195, "sepa_pass": true, "rank": 16, "action": "BUY"}, {"ticker": "MGM", "momentum_12_1": 0.1293051359516617, "quality_raw": null, "value_raw": null, "composite_score": 0.27777632946953346, "rs_score": -0.11923911738825099, "ma_50": 34.8526, "ma_150": 35.1712, "ma_200": 34.186800000000005, "sepa_pass": false, "rank": 17, "action": "BUY"}, {"ticker": "TXT", "momentum_12_1": 0.12685802152742176, "quality_raw": null, "value_raw": null, "composite_score": 0.2743994517870255, "rs_score": 0.00984473611626524, "ma_50": 85.72959999999999, "ma_150": 82.80493333333334, "ma_200": 79.8357, "sepa_pass": true, "rank": 18, "action": "BUY"}, {"ticker": "CRL", "momentum_12_1": 0.11270215633423186, "quality_raw": null, "value_raw": null, "composite_score": 0.2548651689705116, "rs_score": 0.06585780771822214, "ma_50": 189.4452, "ma_150": 171.47233333333332, "ma_200": 160.9957, "sepa_pass": true, "rank": 19, "action": "BUY"}, {"ticker": "JKHY", "momentum_12_1": 0.08864651621511865, "quality_raw": null, "value_raw": null, "composite_score": 0.22166976402662297, "rs_score": -0.07949581594315824, "ma_50": 177.78099999999998, "ma_150": 168.75826666666669, "ma_200": 170.83519999999996, "sepa_pass": false, "rank": 20, "action": "BUY"}, {"ticker": "HSIC", "momentum_12_1": 0.08587063280482687, "quality_raw": null, "value_raw": null, "composite_score": 0.217839203982268, "rs_score": -0.0934755113066168, "ma_50": 74.8534, "ma_150": 70.47046666666667, "ma_200": 69.88225, "sepa_pass": false, "rank": 21, "action": "HOLD"}, {"ticker": "HST", "momentum_12_1": 0.07870370370370372, "quality_raw": null, "value_raw": null, "composite_score": 0.20794925249738136, "rs_score": -0.12016189628497242, "ma_50": 17.846, "ma_150": 16.907466666666664, "ma_200": 16.336, "sepa_pass": false, "rank": 22, "action": "HOLD"}, {"ticker": "HOLX", "momentum_12_1": 0.07108262108262098, "quality_raw": null, "value_raw": null, "composite_score": 0.19743259517855713, "rs_score": -0.12036666836474463, "ma_50": 74.6772, "ma_150": 69.66806666666666, "ma_200": 66.9498, "sepa_pass": false, "rank": 23, "action": "HOLD"}, {"ticker": "PNW", "momentum_12_1": 0.06162902450744845, "quality_raw": null, "value_raw": null, "composite_score": 0.1843871736085998, "rs_score": -0.0755004866172555, "ma_50": 88.74600000000001, "ma_150": 89.7432, "ma_200": 90.30895000000001, "sepa_pass": false, "rank": 24, "action": "HOLD"}, {"ticker": "DPZ", "momentum_12_1": 0.051480484522207215, "quality_raw": null, "value_raw": null, "composite_score": 0.17038276995393842, "rs_score": -0.20582729093842222, "ma_50": 416.2264, "ma_150": 435.1604, "ma_200": 444.74830000000003, "sepa_pass": false, "rank": 25, "action": "HOLD"}, {"ticker": "PNR", "momentum_12_1": 0.0474670921420024, "quality_raw": null, "value_raw": null, "composite_score": 0.1648445184420295, "rs_score": -0.12231443399420128, "ma_50": 104.86359999999999, "ma_150": 105.98793333333333, "ma_200": 102.46260000000001, "sepa_pass": false, "rank": 26, "action": "HOLD"}, {"ticker": "MTCH", "momentum_12_1": 0.029346797096875932, "quality_raw": null, "value_raw": null, "composite_score": 0.13983954959699815, "rs_score": -0.1918676496479914, "ma_50": 32.7042, "ma_150": 33.84153333333333, "ma_200": 32.81095, "sepa_pass": false, "rank": 27, "action": "HOLD"}, {"ticker": "SMCI", "momentum_12_1": 0.02751392073370451, "quality_raw": null, "value_raw": null, "composite_score": 0.13731028524209893, "rs_score": -0.2253853179952513, "ma_50": 33.2182, "ma_150": 43.5112, "ma_200": 41.89330000000001, "sepa_pass": false, "rank": 28, "action": "HOLD"}, {"ticker": "FFIV", "momentum_12_1": 0.01898415404284992, "quality_raw": null, "value_raw": null, "composite_score": 0.1255396959758072, "rs_score": -0.12750348065827288, "ma_50": 251.3888, "ma_150": 289.56533333333334, "ma_200": 285.33615, "sepa_pass": false, "rank": 29, "action": "HOLD"}, {"ticker": "BXP", "momentum_12_1": 0.018921610470906236, "quality_raw": null, "value_raw": null, "composite_score": 0.12545338943035558, "rs_score": -0.2342687808584063, "ma_50": 69.6392, "ma_150": 70.54833333333335, "ma_200": 69.336, "sepa_pass": false, "rank": 30, "action": "HOLD"}, {"ticker": "APA", "momentum_12_1": 0.016901408450704203, "quality_raw": null, "value_raw": null, "composite_score": 0.12266562640276585, "rs_score": -0.14234755654281583, "ma_50": 24.764200000000002, "ma_150": 22.551199999999998, "ma_200": 21.12955, "sepa_pass": false, "rank": 31, "action": "HOLD"}, {"ticker": "GEN", "momentum_12_1": 0.012896094325718366, "quality_raw": null, "value_raw": null, "composite_score": 0.11713852242016425, "rs_score": -0.21703058470441616, "ma_50": 26.7766, "ma_150": 28.358333333333334, "ma_200": 27.974149999999998, "sepa_pass": false, "rank": 32, "action": "HOLD"}, {"ticker": "J", "momentum_12_1": 0.012779313952619553, "quality_raw": null, "value_raw": null, "composite_score": 0.1169773721969601, "rs_score": -0.13155809065399215, "ma_50": 140.0468, "ma_150": 143.41806666666665, "ma_200": 138.07039999999998, "sepa_pass": false, "rank": 33, "action": "HOLD"}, {"ticker": "SJM", "momentum_12_1": -0.0022568933372583144, "quality_raw": null, "value_raw": null, "composite_score": 0.09622826773180128, "rs_score": -0.16086553320861952, "ma_50": 101.91339999999998, "ma_150": 104.76293333333332, "ma_200": 106.87465, "sepa_pass": false, "rank": 34, "action": "HOLD"}, {"ticker": "VTRS", "momentum_12_1": -0.005119453924914752, "quality_raw": null, "value_raw": null, "composite_score": 0.09227809814940174, "rs_score": -0.09346449709397264, "ma_50": 11.4642, "ma_150": 10.318200000000001, "ma_200": 9.82395, "sepa_pass": false, "rank": 35, "action": "HOLD"}, {"ticker": "LW", "momentum_12_1": -0.006018054162487463, "quality_raw": null, "value_raw": null, "composite_score": 0.09103808131255191, "rs_score": -0.45465786103106254, "ma_50": 52.97299999999999, "ma_150": 55.529199999999996, "ma_200": 55.01545, "sepa_pass": false, "rank": 36, "action": "HOLD"}, {"ticker": "GNRC", "momentum_12_1": -0.012897196261682176, "quality_raw": null, "value_raw": null, "composite_score": 0.08154525939974477, "rs_score": -0.18323324450234857, "ma_50": 150.986, "ma_150": 164.31306666666666, "ma_200": 153.08950000000002, "sepa_pass": false, "rank": 37, "action": "HOLD"}, {"ticker": "DAY", "momentum_12_1": -0.01716312056737579, "quality_raw": null, "value_raw": null, "composite_score": 0.07565852830107982, "rs_score": -0.2067581334796138, "ma_50": 69.0838, "ma_150": 65.08173333333333, "ma_200": 63.1277, "sepa_pass": false, "rank": 38, "action": "HOLD"}, {"ticker": "FRT", "momentum_12_1": -0.029431566798114872, "quality_raw": null, "value_raw": null, "composite_score": 0.05872877550110648, "rs_score": -0.20989904223875533, "ma_50": 99.145, "ma_150": 97.64073333333334, "ma_200": 96.80345000000001, "sepa_pass": false, "rank": 39, "action": "HOLD"}, {"ticker": "AVY", "momentum_12_1": -0.029686757170778066, "quality_raw": null, "value_raw": null, "composite_score": 0.058376627409582375, "rs_score": -0.19024257548643886, "ma_50": 177.997, "ma_150": 173.7682, "ma_200": 174.0819, "sepa_pass": false, "rank": 40, "action": "HOLD"}, {"ticker": "AOS", "momentum_12_1": -0.03410526315789486, "quality_raw": null, "value_raw": null, "composite_score": 0.052279342333688694, "rs_score": -0.17864167211343251, "ma_50": 67.1912, "ma_150": 69.07953333333333, "ma_200": 68.23335, "sepa_pass": false, "rank": 41, "action": "HOLD"}, {"ticker": "REG", "momentum_12_1": -0.034106991225587246, "quality_raw": null, "value_raw": null, "composite_score": 0.0522769576992938, "rs_score": -0.2004909826243545, "ma_50": 69.3854, "ma_150": 70.65646666666666, "ma_200": 70.8971, "sepa_pass": false, "rank": 42, "action": "HOLD"}, {"ticker": "NWS", "momentum_12_1": -0.03748766853008878, "quality_raw": null, "value_raw": null, "composite_score": 0.04761181673643177, "rs_score": -0.17949130029437477, "ma_50": 29.5994, "ma_150": 31.77733333333333, "ma_200": 31.681749999999997, "sepa_pass": false, "rank": 43, "action": "HOLD"}, {"ticker": "AKAM", "momentum_12_1": -0.04471185692205781, "quality_raw": null, "value_raw": null, "composite_score": 0.03764285071121208, "rs_score": -0.17853967058720577, "ma_50": 86.93299999999999, "ma_150": 80.20553333333332, "ma_200": 79.4915, "sepa_pass": false, "rank": 44, "action": "HOLD"}, {"ticker": "OMC", "momentum_12_1": -0.05049551675318542, "quality_raw": null, "value_raw": null, "composite_score": 0.02966173155573226, "rs_score": -0.2352758673230232, "ma_50": 76.3326, "ma_150": 75.76306666666667, "ma_200": 75.4744, "sepa_pass": false, "rank": 45, "action": "HOLD"}, {"ticker": "BALL", "momentum_12_1": -0.05148951820522263, "quality_raw": null, "value_raw": null, "composite_score": 0.028290066509539146, "rs_score": -0.16126007542218246, "ma_50": 50.62520000000001, "ma_150": 52.2038, "ma_200": 51.9818, "sepa_pass": false, "rank": 46, "action": "HOLD"}, {"ticker": "NWSA", "momentum_12_1": -0.05444646098003625, "quality_raw": null, "value_raw": null, "composite_score": 0.024209654917088777, "rs_score": -0.21988063158106708, "ma_50": 26.0346, "ma_150": 27.895133333333337, "ma_200": 27.7247, "sepa_pass": false, "rank": 47, "action": "HOLD"}, {"ticker": "EPAM", "momentum_12_1": -0.06463844797178142, "quality_raw": null, "value_raw": null, "composite_score": 0.01014529688302379, "rs_score": -0.23999765466239742, "ma_50": 197.44760000000002, "ma_150": 174.0548666666667, "ma_200": 172.0859, "sepa_pass": false, "rank": 48, "action": "HOLD"}, {"ticker": "KIM", "momentum_12_1": -0.06860517946388012, "quality_raw": null, "value_raw": null, "composite_score": 0.0046714347229697495, "rs_score": -0.24491132625788037, "ma_50": 20.3304, "ma_150": 21.174466666666667, "ma_200": 21.04995, "sepa_pass": false, "rank": 49, "action": "HOLD"}, {"ticker": "CPT", "momentum_12_1": -0.06994312122289359, "quality_raw": null, "value_raw": null, "composite_score": 0.0028251517613909205, "rs_score": -0.2260877152340317, "ma_50": 105.7052, "ma_150": 107.74733333333333, "ma_200": 109.66014999999999, "sepa_pass": false, "rank": 50, "action": "HOLD"}, {"ticker": "EG", "momentum_12_1": -0.08296589830886858, "quality_raw": null, "value_raw": null, "composite_score": -0.01514553439463682, "rs_score": -0.29264431392474755, "ma_50": 324.1356, "ma_150": 334.01013333333333, "ma_200": 337.1983, "sepa_pass": false, "rank": 51, "action": "HOLD"}, {"ticker": "MOS", "momentum_12_1": -0.08400884303610912, "quality_raw": null, "value_raw": null, "composite_score": -0.016584738356095124, "rs_score": -0.1728154041590957, "ma_50": 24.872600000000002, "ma_150": 30.784199999999995, "ma_200": 30.87395, "sepa_pass": false, "rank": 52, "action": "HOLD"}, {"ticker": "COO", "momentum_12_1": -0.08506340478060825, "quality_raw": null, "value_raw": null, "composite_score": -0.01803997313569961, "rs_score": -0.26533781545686563, "ma_50": 78.2756, "ma_150": 73.2774, "ma_200": 74.4914, "sepa_pass": false, "rank": 53, "action": "HOLD"}, {"ticker": "ESS", "momentum_12_1": -0.08858890529424168, "quality_raw": null, "value_raw": null, "composite_score": -0.022904961828599257, "rs_score": -0.29779512630364313, "ma_50": 257.4516, "ma_150": 265.44646666666665, "ma_200": 269.05, "sepa_pass": false, "rank": 54, "action": "HOLD"}, {"ticker": "SWK", "momentum_12_1": -0.09968431277319079, "quality_raw": null, "value_raw": null, "composite_score": -0.03821598836779838, "rs_score": -0.16425833153761205, "ma_50": 72.7686, "ma_150": 72.01926666666667, "ma_200": 70.05785, "sepa_pass": false, "rank": 55, "action": "HOLD"}, {"ticker": "MHK", "momentum_12_1": -0.11219939480809049, "quality_raw": null, "value_raw": null, "composite_score": -0.05548608444495053, "rs_score": -0.20415743476420645, "ma_50": 111.00959999999999, "ma_150": 117.72813333333335, "ma_200": 114.4795, "sepa_pass": false, "rank": 56, "action": "HOLD"}, {"ticker": "ZBH", "momentum_12_1": -0.11727628688759417, "quality_raw": null, "value_raw": null, "composite_score": -0.06249190460193075, "rs_score": -0.34144860923467113, "ma_50": 91.637, "ma_150": 96.16506666666668, "ma_200": 96.60045, "sepa_pass": false, "rank": 57, "action": "HOLD"}, {"ticker": "BBY", "momentum_12_1": -0.11968599033816418, "quality_raw": null, "value_raw": null, "composite_score": -0.06581715728447321, "rs_score": -0.36608077712233145, "ma_50": 73.4222, "ma_150": 73.2654, "ma_200": 71.8829, "sepa_pass": false, "rank": 58, "action": "HOLD"}, {"ticker": "TAP", "momentum_12_1": -0.12031740173463734, "quality_raw": null, "value_raw": null, "composite_score": -0.06668846883088511, "rs_score": -0.25453787876773193, "ma_50": 46.712999999999994, "ma_150": 47.84366666666667, "ma_200": 50.03530000000001, "sepa_pass": false, "rank": 59, "action": "HOLD"}, {"ticker": "MAA", "momentum_12_1": -0.1233401598731586, "quality_raw": null, "value_raw": null, "composite_score": -0.07085970185394329, "rs_score": -0.2942664558141125, "ma_50": 133.9092, "ma_150": 139.5032666666667, "ma_200": 144.07125, "sepa_pass": false, "rank": 60, "action": "HOLD"}, {"ticker": "INVH", "momentum_12_1": -0.13029421273844166, "quality_raw": null, "value_raw": null, "composite_score": -0.08045589633146483, "rs_score": -0.31414887853880724, "ma_50": 27.482200000000002, "ma_150": 29.533066666666667, "ma_200": 30.5527, "sepa_pass": false, "rank": 61, "action": "HOLD"}, {"ticker": "UDR", "momentum_12_1": -0.13109978150036417, "quality_raw": null, "value_raw": null, "composite_score": -0.08156753506274587, "rs_score": -0.2888091373898791, "ma_50": 35.7028, "ma_150": 37.5462, "ma_200": 38.5357, "sepa_pass": false, "rank": 62, "action": "HOLD"}, {"ticker": "MRNA", "momentum_12_1": -0.13174695298897265, "quality_raw": null, "value_raw": null, "composite_score": -0.08246059463323009, "rs_score": -0.04683378908607305, "ma_50": 28.9584, "ma_150": 27.991333333333333, "ma_200": 27.564599999999995, "sepa_pass": true, "rank": 63, "action": "HOLD"}, {"ticker": "MAS", "momentum_12_1": -0.14421302399156333, "quality_raw": null, "value_raw": null, "composite_score": -0.09966305829419375, "rs_score": -0.25032476331097553, "ma_50": 64.0078, "ma_150": 67.24633333333333, "ma_200": 66.19215, "sepa_pass": false, "rank": 64, "action": "HOLD"}, {"ticker": "IEX", "momentum_12_1": -0.1671017059755756, "quality_raw": null, "value_raw": null, "composite_score": -0.13124812787991155, "rs_score": -0.2787078831336649, "ma_50": 175.80559999999997, "ma_150": 171.4196, "ma_200": 172.9475, "sepa_pass": false, "rank": 65, "action": "HOLD"}, {"ticker": "NCLH", "momentum_12_1": -0.16730769230769238, "quality_raw": null, "value_raw": null, "composite_score": -0.13153237721493918, "rs_score": -0.30941225241032844, "ma_50": 20.573, "ma_150": 22.467666666666663, "ma_200": 21.260900000000003, "sepa_pass": false, "rank": 66, "action": "HOLD"}, {"ticker": "CF", "momentum_12_1": -0.1709653647752395, "quality_raw": null, "value_raw": null, "composite_score": -0.13657975563060923, "rs_score": -0.27735272387696064, "ma_50": 79.97, "ma_150": 86.2402, "ma_200": 85.3187, "sepa_pass": false, "rank": 67, "action": "HOLD"}, {"ticker": "MKTX", "momentum_12_1": -0.1727830863684624, "quality_raw": null, "value_raw": null, "composite_score": -0.1390881072713682, "rs_score": -0.3827681161837245, "ma_50": 172.21380000000002, "ma_150": 185.70073333333335, "ma_200": 194.0551, "sepa_pass": false, "rank": 68, "action": "HOLD"}, {"ticker": "DOC", "momentum_12_1": -0.1727904667328699, "quality_raw": null, "value_raw": null, "composite_score": -0.13909829175134578, "rs_score": -0.3176274384159813, "ma_50": 17.0496, "ma_150": 17.680266666666668, "ma_200": 17.726750000000003, "sepa_pass": false, "rank": 69, "action": "HOLD"}, {"ticker": "RVTY", "momentum_12_1": -0.17932576824318736, "quality_raw": null, "value_raw": null, "composite_score": -0.14811663335402983, "rs_score": -0.23375554226881767, "ma_50": 99.07199999999999, "ma_150": 94.41293333333334, "ma_200": 94.26209999999999, "sepa_pass": false, "rank": 70, "action": "HOLD"}, {"ticker": "LKQ", "momentum_12_1": -0.18155001340842047, "quality_raw": null, "value_raw": null, "composite_score": -0.1511859642298162, "rs_score": -0.27913222270552007, "ma_50": 30.4944, "ma_150": 32.0396, "ma_200": 34.146899999999995, "sepa_pass": false, "rank": 71, "action": "HOLD"}, {"ticker": "PAYC", "momentum_12_1": -0.1990061989570009, "quality_raw": null, "value_raw": null, "composite_score": -0.17527450002398007, "rs_score": -0.4373795016326205, "ma_50": 162.56599999999997, "ma_150": 200.9202, "ma_200": 210.0632, "sepa_pass": false, "rank": 72, "action": "HOLD"}, {"ticker": "HRL", "momentum_12_1": -0.20026657780739754, "quality_raw": null, "value_raw": null, "composite_score": -0.17701375061612654, "rs_score": -0.3653022121673327, "ma_50": 23.2252, "ma_150": 25.761466666666664, "ma_200": 26.847550000000002, "sepa_pass": false, "rank": 73, "action": "HOLD"}, {"ticker": "TECH", "momentum_12_1": -0.2146393683928811, "quality_raw": null, "value_raw": null, "composite_score": -0.1968473780438894, "rs_score": -0.25285742425975577, "ma_50": 61.1884, "ma_150": 57.2128, "ma_200": 55.43405, "sepa_pass": false, "rank": 74, "action": "HOLD"}, {"ticker": "CDW", "momentum_12_1": -0.22341337907375647, "quality_raw": null, "value_raw": null, "composite_score": -0.20895501002090114, "rs_score": -0.4799260075231403, "ma_50": 140.84859999999998, "ma_150": 158.23873333333333, "ma_200": 160.86345, "sepa_pass": false, "rank": 75, "action": "HOLD"}, {"ticker": "ALGN", "momentum_12_1": -0.22678893851563253, "quality_raw": null, "value_raw": null, "composite_score": -0.21361308862660042, "rs_score": -0.37428849419572174, "ma_50": 153.31539999999998, "ma_150": 153.83153333333334, "ma_200": 159.1286, "sepa_pass": false, "rank": 76, "action": "HOLD"}, {"ticker": "DVA", "momentum_12_1": -0.25895061728395063, "quality_raw": null, "value_raw": null, "composite_score": -0.2579943624194901, "rs_score": -0.5356943036923798, "ma_50": 116.76979999999999, "ma_150": 128.90640000000002, "ma_200": 132.28075, "sepa_pass": false, "rank": 77, "action": "HOLD"}, {"ticker": "CPB", "momentum_12_1": -0.2715794898222108, "quality_raw": null, "value_raw": null, "composite_score": -0.275421482870931, "rs_score": -0.49590730721380905, "ma_50": 29.0524, "ma_150": 30.9424, "ma_200": 32.20525, "sepa_pass": false, "rank": 78, "action": "HOLD"}, {"ticker": "SWKS", "momentum_12_1": -0.27519930108114, "quality_raw": null, "value_raw": null, "composite_score": -0.2804166149882064, "rs_score": -0.550608940946211, "ma_50": 65.38940000000001, "ma_150": 71.50793333333334, "ma_200": 69.95185, "sepa_pass": false, "rank": 79, "action": "HOLD"}, {"ticker": "CZR", "momentum_12_1": -0.2765893341367881, "quality_raw": null, "value_raw": null, "composite_score": -0.28233478095423975, "rs_score": -0.42524336465451684, "ma_50": 22.7452, "ma_150": 24.99573333333333, "ma_200": 25.50335, "sepa_pass": false, "rank": 80, "action": "HOLD"}, {"ticker": "ERIE", "momentum_12_1": -0.28200510280654345, "quality_raw": null, "value_raw": null, "composite_score": -0.2898082313876835, "rs_score": -0.4809632015862214, "ma_50": 286.5982, "ma_150": 321.5473333333333, "ma_200": 335.12655, "sepa_pass": false, "rank": 81, "action": "SELL"}, {"ticker": "POOL", "momentum_12_1": -0.29833961375412155, "quality_raw": null, "value_raw": null, "composite_score": -0.31234892050592533, "rs_score": -0.401197914934333, "ma_50": 241.9418, "ma_150": 284.68059999999997, "ma_200": 289.743, "sepa_pass": false, "rank": 82, "action": "SELL"}, {"ticker": "EMN", "momentum_12_1": -0.3046645645319126, "quality_raw": null, "value_raw": null, "composite_score": -0.32107699015110247, "rs_score": -0.42540906575247184, "ma_50": 62.896, "ma_150": 66.66213333333333, "ma_200": 69.8035, "sepa_pass": false, "rank": 83, "action": "SELL"}, {"ticker": "CAG", "momentum_12_1": -0.31132437619961606, "quality_raw": null, "value_raw": null, "composite_score": -0.33026714863637996, "rs_score": -0.5222330113059435, "ma_50": 17.273600000000002, "ma_150": 18.579333333333334, "ma_200": 19.9242, "sepa_pass": false, "rank": 84, "action": "SELL"}, {"ticker": "BLDR", "momentum_12_1": -0.3214910858995138, "quality_raw": null, "value_raw": null, "composite_score": -0.34429662545611833, "rs_score": -0.3529822561505105, "ma_50": 108.1332, "ma_150": 121.49073333333334, "ma_200": 120.0326, "sepa_pass": false, "rank": 85, "action": "SELL"}, {"ticker": "ZBRA", "momentum_12_1": -0.3273580121703853, "quality_raw": null, "value_raw": null, "composite_score": -0.35239264752716576, "rs_score": -0.5327142496017779, "ma_50": 253.34440000000004, "ma_150": 291.29926666666665, "ma_200": 284.79795, "sepa_pass": false, "rank": 86, "action": "SELL"}, {"ticker": "FDS", "momentum_12_1": -0.35700288438250005, "quality_raw": null, "value_raw": null, "composite_score": -0.39330087248889073, "rs_score": -0.551204795358496, "ma_50": 282.45059999999995, "ma_150": 336.7450666666666, "ma_200": 362.46979999999996, "sepa_pass": false, "rank": 87, "action": "SELL"}, {"ticker": "CLX", "momentum_12_1": -0.3603722568068918, "quality_raw": null, "value_raw": null, "composite_score": -0.39795041336498604, "rs_score": -0.48959985610387446, "ma_50": 103.47740000000002, "ma_150": 116.02806666666669, "ma_200": 121.08425000000001, "sepa_pass": false, "rank": 88, "action": "SELL"}, {"ticker": "BAX", "momentum_12_1": -0.3621815806662312, "quality_raw": null, "value_raw": null, "composite_score": -0.4004471766141872, "rs_score": -0.5237761673980188, "ma_50": 18.921999999999997, "ma_150": 23.137733333333337, "ma_200": 24.928849999999997, "sepa_pass": false, "rank": 89, "action": "SELL"}, {"ticker": "GDDY", "momentum_12_1": -0.3730504354871379, "quality_raw": null, "value_raw": null, "composite_score": -0.41544557346705946, "rs_score": -0.6454282851926161, "ma_50": 125.0442, "ma_150": 142.70406666666668, "ma_200": 151.99390000000002, "sepa_pass": false, "rank": 90, "action": "SELL"}, {"ticker": "LYB", "momentum_12_1": -0.42451201699641483, "quality_raw": null, "value_raw": null, "composite_score": -0.4864596071321237, "rs_score": -0.5134201479804336, "ma_50": 44.919000000000004, "ma_150": 51.276133333333334, "ma_200": 52.9943, "sepa_pass": false, "rank": 91, "action": "SELL"}, {"ticker": "MOH", "momentum_12_1": -0.43373125191307005, "quality_raw": null, "value_raw": null, "composite_score": -0.499181623042565, "rs_score": -0.5301152811436601, "ma_50": 158.986, "ma_150": 184.4118, "ma_200": 218.01229999999998, "sepa_pass": false, "rank": 92, "action": "SELL"}, {"ticker": "KMX", "momentum_12_1": -0.48573583008671606, "quality_raw": null, "value_raw": null, "composite_score": -0.5709449609900205, "rs_score": -0.5792500826710567, "ma_50": 38.864000000000004, "ma_150": 50.7966, "ma_200": 54.953, "sepa_pass": false, "rank": 93, "action": "SELL"}, {"ticker": "DECK", "momentum_12_1": -0.49553701368002323, "quality_raw": null, "value_raw": null, "composite_score": -0.5844700327278006, "rs_score": -0.6890276370257131, "ma_50": 94.95679999999999, "ma_150": 101.6978, "ma_200": 104.4417, "sepa_pass": false, "rank": 94, "action": "SELL"}, {"ticker": "IT", "momentum_12_1": -0.5071028411364547, "quality_raw": null, "value_raw": null, "composite_score": -0.6004302118802288, "rs_score": -0.7280832592746127, "ma_50": 237.33720000000002, "ma_150": 275.44846666666666, "ma_200": 312.11285, "sepa_pass": false, "rank": 95, "action": "SELL"}, {"ticker": "ARE", "momentum_12_1": -0.5152847357120949, "quality_raw": null, "value_raw": null, "composite_score": -0.6117207575610643, "rs_score": -0.6036069233972499, "ma_50": 50.724, "ma_150": 68.66833333333334, "ma_200": 70.1631, "sepa_pass": false, "rank": 96, "action": "SELL"}, {"ticker": "ENPH", "momentum_12_1": -0.5207028265851795, "quality_raw": null, "value_raw": null, "composite_score": -0.6191974125020371, "rs_score": -0.6487678967659729, "ma_50": 31.461, "ma_150": 35.2064, "ma_200": 38.3349, "sepa_pass": false, "rank": 97, "action": "SELL"}, {"ticker": "TTD", "momentum_12_1": -0.6900479616306955, "quality_raw": null, "value_raw": null, "composite_score": -0.8528839951611658, "rs_score": -0.8787330155800126, "ma_50": 39.4622, "ma_150": 54.061800000000005, "ma_200": 56.1748, "sepa_pass": false, "rank": 98, "action": "SELL"}, {"ticker": "IPG", "momentum_12_1": NaN, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": null, "ma_50": null, "ma_150": null, "ma_200": null, "sepa_pass": true, "rank": 99, "action": "SELL"}, {"ticker": "WBA", "momentum_12_1": NaN, "quality_raw": null, "value_raw": null, "composite_score": NaN, "rs_score": null, "ma_50": null, "ma_150": null, "ma_200": null, "sepa_pass": true, "rank": 100, "action": "SELL"}]}], "price_failures": []};
\ No newline at end of file
+window.TOP50_DATA = {"universes":[{"id":"nasdaq100","name":"Nasdaq-100","universe_size":101,"buy_count":20,"sell_count":20,"sepa_count":16,"sepa_candidates":[{"ticker":"AMD","momentum_12_1":0.7881,"quality_raw":0.0951,"value_raw":0.09453,"composite_score":0.37913,"rs_score":0.77428,"ma_50":220.88,"ma_150":189.62,"ma_200":168.05,"sepa_pass":true,"rank":1,"action":"BUY"},{"ticker":"GOOGL","momentum_12_1":0.62512,"quality_raw":0.3295,"value_raw":0.06403,"composite_score":0.18834,"rs_score":0.56559,"ma_50":308.31,"ma_150":246.83,"ma_200":225.5,"sepa_pass":true,"rank":6,"action":"BUY"},{"ticker":"GOOG","momentum_12_1":0.61905,"quality_raw":0.3295,"value_raw":0.06336,"composite_score":0.17505,"rs_score":0.55481,"ma_50":309.01,"ma_150":247.57,"ma_200":226.48,"sepa_pass":true,"rank":7,"action":"BUY"},{"ticker":"AMAT","momentum_12_1":0.50458,"quality_raw":0.3195,"value_raw":0.05683,"composite_score":-0.0038,"rs_score":0.64846,"ma_50":258.21,"ma_150":213.57,"ma_200":198.69,"sepa_pass":true,"rank":10,"action":"BUY"},{"ticker":"ASML","momentum_12_1":0.47743,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.6195,"ma_50":1093.28,"ma_150":926.35,"ma_200":870.21,"sepa_pass":true,"rank":29,"action":"HOLD"},{"ticker":"FER","momentum_12_1":0.66543,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.47369,"ma_50":65.43,"ma_150":59.08,"ma_200":56.45,"sepa_pass":true,"rank":52,"action":"HOLD"},{"ticker":"IDXX","momentum_12_1":0.67343,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.51204,"ma_50":707.29,"ma_150":638.77,"ma_200":595.7,"sepa_pass":true,"rank":57,"action":"HOLD"},{"ticker":"INTC","momentum_12_1":0.95365,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.32764,"ma_50":38.84,"ma_150":31.08,"ma_200":28.44,"sepa_pass":true,"rank":59,"action":"HOLD"},{"ticker":"KLAC","momentum_12_1":0.74701,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.01409,"ma_50":1238.6,"ma_150":1062.04,"ma_200":976.87,"sepa_pass":true,"rank":63,"action":"HOLD"},{"ticker":"LRCX","momentum_12_1":1.18892,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.70825,"ma_50":169.94,"ma_150":132.84,"ma_200":118.59,"sepa_pass":true,"rank":64,"action":"HOLD"},{"ticker":"MNST","momentum_12_1":0.49401,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.36606,"ma_50":74.23,"ma_150":67.37,"ma_200":65.69,"sepa_pass":true,"rank":69,"action":"HOLD"},{"ticker":"MPWR","momentum_12_1":0.60953,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.52246,"ma_50":943.7,"ma_150":878.02,"ma_200":813.5,"sepa_pass":true,"rank":70,"action":"HOLD"},{"ticker":"MU","momentum_12_1":1.4394,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":2.26855,"ma_50":263.18,"ma_150":184.52,"ma_200":160.01,"sepa_pass":true,"rank":73,"action":"HOLD"},{"ticker":"STX","momentum_12_1":2.13033,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":2.3221,"ma_50":281.6,"ma_150":214.82,"ma_200":185.15,"sepa_pass":true,"rank":89,"action":"SELL"},{"ticker":"WBD","momentum_12_1":2.05344,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.73903,"ma_50":26.23,"ma_150":18.55,"ma_200":16.16,"sepa_pass":true,"rank":97,"action":"SELL"},{"ticker":"WDC","momentum_12_1":2.62877,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":3.49564,"ma_50":173.87,"ma_150":118.02,"ma_200":99.66,"sepa_pass":true,"rank":99,"action":"SELL"}],"sepa_charts":[{"ticker":"AMD","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[100.75,101.67,98.85,100.31,96.63,96.76,100.79,98.11,100.97,104.59,103.51,106.23,107.14,106.44,113.85,114.81,110.19,106.65,103.22,102.74,102.78,102.96,93.8,85.76,83.64,78.21,96.84,88.7,93.4,94.5,95.29,88.29,87.5,85.56,86.26,90.39,94.47,96.65,96.39,96.06,97.35,96.65,98.8,100.59,98.62,100.36,101.7,102.84,108.12,112.46,117.72,114.99,117.17,114.74,113.51,112.06,110.71,110.31,114.56,112.86,113.03,110.73,114.63,117.31,118.58,115.69,116.19,121.73,123.24,121.14,118.5,116.16,126.39,127.1,126.79,128.24,129.58,138.43,143.4,143.68,143.81,141.9,136.11,138.52,137.91,134.8,137.82,138.41,144.16,146.42,146.24,155.61,160.08,160.41,156.99,157.0,154.72,158.65,162.12,166.47,173.66,177.44,179.51,176.31,171.7,176.78,174.31,163.12,172.4,172.76,172.28,174.95,184.42,180.95,177.51,176.14,166.55,165.2,163.71,167.76,163.36,166.62,167.13,168.58,162.63,162.32,162.13,161.79,151.14,151.41,155.82,159.54,155.67,158.57,161.16,160.46,159.16,157.92,157.39,159.79,160.9,160.88,161.27,159.46,161.36,161.79,164.01,169.73,164.67,203.71,211.51,235.56,232.89,214.9,216.42,218.09,238.6,234.56,233.08,240.56,238.03,230.23,234.99,252.92,259.67,258.01,264.33,254.84,256.12,259.65,250.05,256.33,237.7,233.54,243.98,237.52,258.89,247.96,246.81,240.52,230.29,223.55,206.02,203.78,215.05,206.13,214.24,217.53,219.76,215.24,217.6,215.98,217.97,221.11,221.62,221.42,221.43,210.78,207.58,209.17,198.11,201.06,213.43,214.95,214.9,215.04,214.99,215.61,215.34,214.16,223.47,221.08,214.35,210.02,204.68,203.17,207.69,220.97,223.6,227.92],"ma50":[116.04,115.65,115.24,114.87,114.31,113.72,113.23,112.69,112.26,111.94,111.59,111.21,110.76,110.34,110.19,110.16,110.02,109.83,109.49,109.18,108.81,108.42,107.82,107.08,106.29,105.56,105.21,104.64,104.13,103.7,103.32,102.69,102.2,101.71,101.29,100.88,100.55,100.25,99.94,99.6,99.26,98.9,98.59,98.39,98.2,98.13,98.07,98.13,98.3,98.58,98.92,99.19,99.56,99.84,100.18,100.49,100.69,100.93,101.2,101.37,101.56,101.65,101.8,102.01,102.11,102.13,102.25,102.55,102.95,103.32,103.63,103.9,104.55,105.37,106.24,107.24,107.89,108.89,109.89,110.87,111.84,112.91,113.89,114.94,115.98,116.87,117.73,118.57,119.52,120.53,121.51,122.69,123.91,125.11,126.28,127.41,128.47,129.59,130.67,131.75,132.87,134.11,135.36,136.59,137.76,139.05,140.32,141.38,142.54,143.73,144.92,146.2,147.6,148.87,150.05,151.26,152.27,153.14,153.95,154.88,155.77,156.78,157.6,158.43,159.15,159.83,160.48,160.94,161.1,161.25,161.49,161.85,162.24,162.64,163.1,163.62,164.04,164.43,164.7,164.97,165.26,165.37,165.39,165.37,165.46,165.55,165.74,165.96,166.01,166.76,167.51,168.68,169.74,170.52,171.41,172.24,173.52,174.95,176.16,177.52,178.84,179.94,180.95,182.39,184.03,185.67,187.63,189.42,191.27,193.11,194.84,196.63,198.05,199.35,200.97,202.48,204.41,206.13,208.05,209.83,211.32,212.6,213.61,214.51,215.59,216.5,217.6,218.8,220.04,221.15,222.29,223.39,224.52,225.76,226.96,228.15,229.3,230.12,230.98,231.09,230.82,230.13,229.74,229.74,229.71,229.65,229.18,228.8,228.45,227.92,227.63,227.44,227.03,226.17,225.07,223.98,222.84,222.17,221.52,220.88],"ma150":[136.75,136.5,136.24,135.94,135.7,135.46,135.24,135.02,134.84,134.63,134.42,134.22,133.99,133.76,133.54,133.31,133.01,132.68,132.32,131.99,131.64,131.33,130.95,130.55,130.14,129.67,129.4,129.05,128.74,128.48,128.19,127.83,127.41,126.98,126.54,126.13,125.75,125.41,125.0,124.61,124.21,123.8,123.38,122.93,122.49,122.07,121.68,121.3,120.94,120.55,120.19,119.81,119.45,119.12,118.76,118.4,118.09,117.79,117.51,117.22,116.92,116.64,116.38,116.14,115.89,115.59,115.26,115.08,114.94,114.8,114.66,114.49,114.36,114.21,114.07,113.94,113.85,113.84,113.87,113.93,113.96,113.98,113.97,113.98,113.97,113.93,113.93,113.95,113.99,114.02,114.05,114.13,114.25,114.4,114.57,114.77,114.93,115.12,115.35,115.62,115.94,116.32,116.72,117.1,117.41,117.75,118.08,118.33,118.67,119.01,119.36,119.69,120.05,120.41,120.78,121.18,121.51,121.84,122.13,122.46,122.74,123.03,123.32,123.63,123.89,124.21,124.53,124.82,125.04,125.27,125.55,125.82,126.11,126.43,126.79,127.12,127.44,127.75,128.05,128.37,128.68,128.98,129.3,129.62,129.98,130.36,130.76,131.23,131.66,132.36,133.1,133.99,134.89,135.65,136.45,137.26,138.18,139.09,139.97,140.87,141.77,142.6,143.45,144.43,145.4,146.35,147.38,148.37,149.39,150.43,151.42,152.44,153.4,154.38,155.45,156.51,157.59,158.66,159.68,160.65,161.55,162.45,163.24,164.03,164.89,165.66,166.46,167.27,168.09,168.88,169.68,170.48,171.27,172.08,172.9,173.71,174.5,175.22,175.89,176.53,177.07,177.64,178.28,178.95,179.63,180.31,181.01,181.71,182.38,183.06,183.79,184.53,185.19,185.81,186.39,186.97,187.58,188.24,188.91,189.62],"ma200":[143.35,143.06,142.74,142.42,142.08,141.74,141.41,141.1,140.77,140.44,140.13,139.83,139.53,139.24,139.01,138.76,138.47,138.17,137.88,137.6,137.31,137.03,136.7,136.34,135.98,135.56,135.24,134.88,134.55,134.23,133.91,133.54,133.19,132.8,132.41,132.0,131.58,131.18,130.74,130.31,129.89,129.47,129.08,128.79,128.5,128.25,127.97,127.72,127.54,127.41,127.3,127.17,127.07,126.92,126.82,126.72,126.6,126.5,126.43,126.31,126.21,126.08,125.94,125.83,125.68,125.52,125.32,125.15,124.98,124.82,124.64,124.47,124.35,124.25,124.16,124.06,124.02,124.01,124.03,124.08,124.1,124.1,124.03,123.97,123.9,123.81,123.75,123.7,123.63,123.59,123.53,123.52,123.51,123.48,123.44,123.4,123.38,123.37,123.37,123.35,123.36,123.38,123.43,123.49,123.51,123.56,123.65,123.69,123.77,123.85,123.92,124.03,124.18,124.32,124.43,124.51,124.51,124.59,124.69,124.82,124.94,125.06,125.17,125.26,125.34,125.41,125.5,125.62,125.68,125.76,125.85,125.95,126.04,126.14,126.26,126.35,126.46,126.57,126.67,126.76,126.85,126.94,127.04,127.14,127.29,127.46,127.63,127.83,128.02,128.4,128.84,129.41,129.98,130.45,130.91,131.37,131.94,132.49,133.04,133.64,134.23,134.75,135.28,135.91,136.59,137.3,138.04,138.73,139.41,140.12,140.76,141.43,142.0,142.56,143.16,143.77,144.5,145.15,145.79,146.41,146.99,147.51,147.98,148.45,148.99,149.47,149.98,150.51,151.05,151.56,152.08,152.59,153.1,153.66,154.22,154.81,155.39,155.95,156.49,157.04,157.53,158.03,158.6,159.17,159.77,160.36,160.93,161.52,162.09,162.63,163.23,163.81,164.34,164.86,165.32,165.76,166.25,166.82,167.42,168.05],"rs_line":[1.0,0.9984,0.98825,0.99726,0.98696,0.99657,1.0326,1.01872,1.0272,1.05589,1.0564,1.07248,1.08481,1.0806,1.1355,1.14233,1.1096,1.07682,1.0636,1.0516,1.04905,1.04427,1.00068,0.9718,0.94947,0.90196,1.01067,0.96814,1.00157,1.00363,1.01486,0.96168,0.95172,0.95331,0.93674,0.96661,0.98941,1.00498,1.0019,0.99222,1.00514,0.99089,0.99812,1.02207,1.01049,1.02402,1.03051,1.04339,1.06187,1.09725,1.1471,1.11505,1.12904,1.10442,1.09626,1.10081,1.08712,1.09063,1.10959,1.09948,1.09681,1.07569,1.10734,1.1268,1.13931,1.11694,1.11037,1.16226,1.17004,1.1534,1.12379,1.11406,1.20075,1.2179,1.21511,1.23554,1.23624,1.30624,1.35238,1.34451,1.33907,1.315,1.26175,1.27829,1.26271,1.2435,1.27206,1.26989,1.31893,1.34433,1.34012,1.4321,1.46833,1.46241,1.43228,1.42966,1.4087,1.43229,1.46314,1.49608,1.56109,1.59928,1.61998,1.59709,1.58125,1.60366,1.58931,1.47598,1.56125,1.55241,1.55116,1.55861,1.63737,1.60642,1.57957,1.56772,1.49046,1.48231,1.47486,1.48849,1.45586,1.47872,1.47987,1.48744,1.44355,1.45156,1.44204,1.42709,1.33702,1.33613,1.37188,1.40058,1.35534,1.38105,1.39618,1.39203,1.38247,1.36532,1.35778,1.372,1.38909,1.39335,1.4032,1.37955,1.39207,1.39055,1.40484,1.45216,1.40889,1.73668,1.80989,2.00374,1.98678,1.88424,1.86889,1.88561,2.05382,2.03289,2.00866,2.05179,2.03024,1.97397,2.00291,2.13826,2.16972,2.15014,2.20175,2.14631,2.15004,2.17559,2.12028,2.16603,2.03039,1.99289,2.04999,1.99115,2.16909,2.11257,2.10312,2.0688,1.99758,1.93165,1.80773,1.77044,1.84126,1.74844,1.80477,1.82254,1.84966,1.80827,1.82179,1.8069,1.8201,1.85188,1.85775,1.84385,1.83965,1.7702,1.74597,1.76416,1.68947,1.70178,1.79554,1.79713,1.78854,1.78343,1.7832,1.79474,1.79468,1.79817,1.87291,1.84062,1.77403,1.74382,1.69965,1.67603,1.71063,1.82366,1.85448,1.88517],"rs_score":0.77428},{"ticker":"GOOGL","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[170.92,173.02,172.35,173.86,165.87,164.04,167.11,162.76,165.49,164.29,160.67,163.89,162.8,163.99,167.68,170.56,165.06,162.24,154.33,154.64,157.07,157.04,150.72,145.6,146.75,144.7,158.71,152.82,157.14,159.07,156.31,153.33,151.16,147.67,151.47,155.35,159.28,161.96,160.61,160.16,158.8,161.3,164.03,164.21,163.23,151.38,154.28,152.75,158.46,159.53,165.37,163.96,166.19,166.54,163.98,168.56,170.87,168.47,172.9,172.36,171.86,171.74,169.03,166.18,168.05,168.21,173.68,176.09,178.6,177.35,175.7,174.67,176.77,175.95,173.32,166.64,165.19,166.77,170.68,173.54,178.53,176.23,175.84,178.64,179.53,176.79,174.36,176.62,177.62,180.19,181.56,182.0,182.97,183.58,185.06,190.1,191.34,190.23,192.17,193.18,192.58,195.75,196.53,191.9,189.13,195.04,194.67,196.09,196.52,201.42,201.0,203.34,201.96,202.94,203.9,203.5,201.57,199.32,199.75,206.09,208.49,207.14,207.48,211.64,212.91,211.35,230.66,232.3,235.0,234.04,239.63,239.17,240.37,240.8,251.61,251.16,249.53,252.03,254.72,252.53,251.66,247.14,245.79,246.54,244.05,243.1,244.9,245.69,245.35,250.43,245.76,244.62,241.53,236.57,244.15,245.45,251.03,251.46,253.3,256.55,250.46,251.69,253.08,259.92,269.27,267.47,274.57,281.48,281.19,283.72,277.54,284.31,284.75,278.83,290.1,291.31,286.71,278.57,276.41,285.02,284.28,292.81,289.45,299.66,318.58,323.44,319.95,320.18,314.89,315.81,319.63,317.62,321.27,313.72,317.08,320.21,312.43,309.29,308.22,306.57,296.72,302.46,307.16,309.78,314.35,314.09,313.51,313.56,313.85,313.0,315.15,316.54,314.34,321.98,325.44,328.57,331.86,335.97,335.84,332.78],"ma50":[189.49,189.19,188.86,188.51,187.94,187.3,186.73,186.13,185.61,185.11,184.54,183.98,183.3,182.67,182.14,181.71,181.19,180.64,179.82,179.05,178.28,177.46,176.5,175.45,174.39,173.44,172.71,171.86,170.98,170.09,169.19,168.13,167.32,166.44,165.77,165.14,164.62,164.19,163.68,163.18,162.68,162.2,161.79,161.48,161.16,160.68,160.31,160.0,159.76,159.61,159.5,159.32,159.19,159.05,159.01,159.1,159.18,159.29,159.44,159.6,159.82,159.98,160.1,160.15,160.16,160.11,160.28,160.56,161.04,161.5,161.87,162.22,162.74,163.35,163.88,164.32,164.45,164.73,165.0,165.29,165.73,166.19,166.69,167.31,167.87,168.3,168.6,168.89,169.23,169.63,170.09,170.5,170.88,171.27,171.7,172.48,173.22,173.97,174.64,175.32,175.86,176.5,177.1,177.61,178.11,178.64,179.12,179.67,180.14,180.72,181.31,181.94,182.6,183.33,184.05,184.76,185.31,185.78,186.2,186.78,187.43,188.08,188.69,189.41,190.2,191.09,192.4,193.71,195.0,196.21,197.43,198.69,199.98,201.23,202.67,204.15,205.66,207.17,208.71,210.16,211.56,212.86,214.12,215.38,216.56,217.62,218.69,219.8,220.86,222.0,223.07,224.05,224.95,225.84,226.94,227.95,229.07,230.18,231.32,232.42,233.41,234.38,235.4,236.54,237.85,239.12,240.59,242.23,243.86,245.41,246.79,248.33,249.88,251.22,252.77,254.37,255.49,256.41,257.24,258.26,259.15,260.23,261.21,262.38,263.72,265.17,266.58,267.94,269.14,270.41,271.77,273.18,274.69,276.03,277.49,279.04,280.39,281.66,282.92,284.04,285.06,286.21,287.53,288.99,290.39,291.77,293.02,294.26,295.47,296.6,297.89,299.19,300.42,301.66,302.78,304.0,305.15,306.24,307.33,308.31],"ma150":[174.79,174.81,174.83,174.84,174.81,174.79,174.84,174.87,174.92,174.93,174.91,174.92,174.92,174.94,174.98,175.03,175.02,174.99,174.91,174.85,174.79,174.73,174.64,174.53,174.42,174.3,174.31,174.29,174.28,174.34,174.39,174.42,174.42,174.37,174.33,174.32,174.32,174.33,174.32,174.3,174.28,174.27,174.29,174.3,174.29,174.2,174.11,174.02,173.97,173.92,173.94,173.94,173.97,174.0,174.0,174.02,174.06,174.08,174.15,174.21,174.26,174.3,174.35,174.37,174.39,174.4,174.42,174.44,174.49,174.53,174.57,174.6,174.6,174.57,174.54,174.45,174.34,174.26,174.22,174.23,174.25,174.24,174.24,174.31,174.41,174.47,174.51,174.56,174.61,174.67,174.74,174.79,174.86,174.92,174.98,175.02,174.99,174.98,174.99,174.97,174.95,175.0,175.05,175.06,175.02,175.01,175.01,175.03,175.06,175.14,175.22,175.3,175.33,175.38,175.45,175.52,175.6,175.66,175.69,175.78,175.86,175.92,175.98,176.07,176.16,176.29,176.52,176.77,177.0,177.2,177.45,177.67,178.0,178.33,178.77,179.2,179.63,180.08,180.54,180.99,181.44,181.85,182.26,182.71,183.14,183.59,184.07,184.59,185.09,185.64,186.14,186.62,187.08,187.5,188.02,188.56,189.12,189.71,190.3,190.91,191.51,192.1,192.7,193.34,194.02,194.66,195.39,196.19,197.03,197.89,198.7,199.55,200.44,201.33,202.28,203.26,204.11,204.95,205.75,206.59,207.44,208.37,209.29,210.31,211.42,212.54,213.61,214.67,215.69,216.73,217.8,218.85,219.89,220.89,221.92,223.04,224.1,225.14,226.14,227.12,227.99,228.92,229.86,230.81,231.82,232.79,233.74,234.7,235.64,236.58,237.54,238.5,239.47,240.51,241.56,242.63,243.68,244.75,245.8,246.83],"ma200":[175.79,175.79,175.78,175.77,175.71,175.65,175.6,175.54,175.5,175.44,175.36,175.32,175.27,175.23,175.19,175.17,175.11,175.05,174.95,174.84,174.73,174.64,174.51,174.35,174.21,174.06,173.95,173.82,173.68,173.56,173.41,173.27,173.11,172.92,172.75,172.58,172.43,172.29,172.14,172.01,171.88,171.75,171.65,171.57,171.5,171.37,171.23,171.08,171.01,170.98,170.97,170.94,170.92,170.89,170.86,170.87,170.93,170.98,171.05,171.1,171.14,171.19,171.21,171.24,171.28,171.3,171.34,171.38,171.44,171.51,171.56,171.61,171.67,171.73,171.79,171.81,171.84,171.9,171.96,172.08,172.23,172.36,172.49,172.61,172.72,172.81,172.89,172.97,173.05,173.13,173.23,173.33,173.43,173.54,173.64,173.77,173.89,174.01,174.14,174.27,174.42,174.58,174.75,174.9,175.03,175.18,175.32,175.48,175.65,175.84,176.02,176.21,176.41,176.61,176.8,176.99,177.15,177.27,177.41,177.59,177.78,177.97,178.13,178.28,178.45,178.61,178.85,179.12,179.42,179.73,180.05,180.35,180.67,181.04,181.47,181.89,182.29,182.71,183.14,183.54,183.94,184.31,184.67,185.03,185.38,185.67,185.91,186.18,186.46,186.73,186.98,187.26,187.53,187.75,188.0,188.25,188.52,188.82,189.13,189.46,189.77,190.07,190.35,190.67,191.05,191.42,191.84,192.3,192.73,193.18,193.59,194.02,194.46,194.86,195.31,195.81,196.26,196.68,197.06,197.46,197.88,198.31,198.8,199.34,200.01,200.69,201.36,202.05,202.69,203.34,204.02,204.68,205.37,206.04,206.73,207.45,208.15,208.85,209.54,210.24,210.87,211.52,212.19,212.87,213.61,214.36,215.1,215.85,216.59,217.34,218.11,218.87,219.63,220.42,221.21,222.0,222.83,223.7,224.61,225.5],"rs_line":[1.0,1.00152,1.01567,1.01886,0.99864,0.9959,1.00918,0.99619,0.9924,0.97767,0.96657,0.97532,0.97164,0.98137,0.98579,1.00032,0.97976,0.96559,0.93739,0.93301,0.945,0.93888,0.9478,0.97254,0.98197,0.98366,0.97636,0.98321,0.99328,0.99582,0.98129,0.98446,0.96915,0.96986,0.96959,0.97925,0.98333,0.9927,0.98405,0.97515,0.96649,0.97479,0.97679,0.9835,0.98587,0.91047,0.92149,0.91352,0.91735,0.91749,0.94986,0.93718,0.94395,0.94491,0.93352,0.97604,0.98903,0.98184,0.98713,0.98977,0.98302,0.98344,0.9625,0.9409,0.95175,0.95728,0.97836,0.99104,0.9995,0.99535,0.98218,0.98746,0.98992,0.99382,0.97911,0.94638,0.92897,0.92761,0.94882,0.95723,0.97989,0.96266,0.96084,0.97174,0.96894,0.96132,0.94863,0.95519,0.9579,0.97519,0.98073,0.98733,0.98928,0.98654,0.99522,1.02039,1.0269,1.01233,1.02232,1.02337,1.02045,1.03999,1.04545,1.02466,1.0267,1.04293,1.04626,1.04588,1.04905,1.06689,1.06677,1.06782,1.05696,1.06199,1.06951,1.06765,1.06329,1.05422,1.06075,1.07787,1.09524,1.08361,1.08292,1.10074,1.11399,1.11408,1.20931,1.20782,1.22541,1.21741,1.24361,1.23765,1.23361,1.23623,1.28488,1.28435,1.2776,1.2844,1.2953,1.27811,1.28068,1.26169,1.26062,1.25726,1.24107,1.2316,1.23651,1.23907,1.23737,1.25848,1.23961,1.22654,1.21457,1.22267,1.24278,1.25093,1.27371,1.28464,1.28674,1.28983,1.25923,1.27203,1.27151,1.29529,1.32624,1.31389,1.34812,1.39741,1.39141,1.4013,1.38722,1.41615,1.43372,1.40254,1.4368,1.4395,1.41598,1.399,1.38838,1.44509,1.45354,1.49139,1.4971,1.53462,1.60785,1.61717,1.58875,1.58126,1.56227,1.56393,1.57739,1.56632,1.58132,1.54881,1.56675,1.57179,1.53004,1.53113,1.52814,1.52412,1.49157,1.50903,1.5232,1.52668,1.54215,1.53548,1.5328,1.53852,1.54183,1.54913,1.55692,1.55344,1.53352,1.57588,1.59297,1.59773,1.61119,1.63442,1.64185,1.62248],"rs_score":0.56559},{"ticker":"GOOG","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[172.61,174.99,174.21,175.75,167.81,165.98,169.0,164.73,167.62,166.57,162.67,166.28,165.05,166.25,169.93,172.79,167.14,164.08,156.06,156.23,158.88,158.86,152.63,147.74,149.24,146.58,161.06,155.37,159.4,161.47,158.68,155.5,153.36,149.86,153.9,157.72,161.47,163.85,162.42,162.06,160.89,162.79,165.81,166.05,165.2,152.8,155.75,154.38,159.58,160.89,166.81,165.4,167.43,167.87,165.32,170.06,171.98,169.59,173.98,173.38,172.96,172.85,170.37,167.71,169.39,169.81,174.92,177.63,180.01,178.79,176.97,175.88,177.94,177.23,173.98,167.73,166.01,167.74,171.49,174.43,178.27,177.39,176.91,179.76,180.55,177.56,175.16,177.66,178.7,181.31,182.81,183.1,183.77,184.7,185.94,191.15,192.11,191.51,193.2,194.08,193.42,196.43,197.44,192.86,189.95,195.75,195.32,196.92,197.28,202.09,201.63,204.16,203.03,203.82,204.91,204.29,202.49,200.19,200.62,206.72,209.16,207.95,208.21,212.37,213.53,211.99,231.1,232.66,235.17,234.16,239.94,239.56,240.78,241.38,251.76,251.42,249.85,252.33,255.24,252.88,252.34,247.83,246.57,247.18,244.36,243.55,245.54,246.43,246.45,251.51,247.13,245.46,242.21,237.49,244.64,246.19,251.71,251.88,253.79,257.02,251.34,252.53,253.73,260.51,269.93,268.43,275.17,281.9,281.82,284.12,278.06,284.75,285.34,279.7,290.59,291.74,287.43,279.12,276.98,285.6,284.96,292.99,289.98,299.65,318.47,323.64,320.28,320.12,315.12,316.02,320.62,318.39,322.09,314.45,317.75,321.0,313.7,310.52,309.32,307.73,298.06,303.75,308.61,311.33,315.68,315.67,314.96,314.39,314.55,313.8,315.32,317.32,314.55,322.43,326.01,329.14,332.73,336.43,336.31,333.16],"ma50":[191.1,190.8,190.49,190.14,189.58,188.95,188.38,187.8,187.3,186.82,186.26,185.72,185.07,184.46,183.95,183.54,183.04,182.5,181.68,180.91,180.14,179.33,178.38,177.34,176.29,175.34,174.62,173.79,172.92,172.04,171.16,170.12,169.32,168.45,167.78,167.18,166.66,166.23,165.72,165.23,164.73,164.24,163.82,163.51,163.19,162.7,162.32,162.01,161.75,161.6,161.48,161.29,161.16,161.0,160.95,161.03,161.09,161.19,161.31,161.45,161.66,161.79,161.89,161.92,161.91,161.85,162.01,162.28,162.76,163.21,163.57,163.91,164.42,165.01,165.5,165.93,166.02,166.27,166.51,166.77,167.16,167.6,168.07,168.67,169.2,169.6,169.87,170.15,170.48,170.86,171.3,171.71,172.07,172.44,172.85,173.62,174.35,175.09,175.76,176.43,176.96,177.58,178.18,178.68,179.17,179.69,180.15,180.7,181.16,181.74,182.31,182.94,183.59,184.31,185.02,185.71,186.27,186.72,187.13,187.69,188.33,188.97,189.58,190.28,191.07,191.96,193.26,194.56,195.83,197.03,198.26,199.5,200.78,202.01,203.44,204.91,206.41,207.9,209.43,210.86,212.25,213.55,214.8,216.05,217.22,218.27,219.34,220.44,221.5,222.65,223.72,224.71,225.6,226.49,227.59,228.6,229.72,230.82,231.95,233.05,234.05,235.01,236.03,237.16,238.46,239.74,241.2,242.83,244.46,246.0,247.38,248.92,250.46,251.81,253.35,254.94,256.07,257.0,257.84,258.86,259.76,260.83,261.82,262.98,264.32,265.76,267.17,268.53,269.72,270.99,272.35,273.76,275.27,276.62,278.09,279.64,281.0,282.28,283.54,284.66,285.68,286.85,288.17,289.65,291.07,292.46,293.73,294.98,296.19,297.33,298.61,299.9,301.12,302.36,303.48,304.69,305.85,306.94,308.03,309.01],"ma150":[176.34,176.36,176.38,176.39,176.36,176.35,176.4,176.43,176.48,176.5,176.48,176.49,176.49,176.51,176.56,176.61,176.6,176.57,176.5,176.43,176.38,176.32,176.22,176.11,176.02,175.89,175.91,175.89,175.9,175.96,176.02,176.06,176.07,176.03,176.0,175.99,176.0,176.02,176.01,176.0,175.98,175.98,176.0,176.01,176.01,175.91,175.83,175.74,175.69,175.64,175.66,175.66,175.68,175.72,175.72,175.75,175.78,175.8,175.86,175.92,175.97,176.01,176.04,176.07,176.08,176.09,176.12,176.13,176.18,176.22,176.26,176.29,176.29,176.25,176.21,176.12,176.0,175.92,175.88,175.88,175.89,175.88,175.87,175.94,176.04,176.09,176.12,176.17,176.22,176.28,176.34,176.39,176.45,176.51,176.57,176.6,176.57,176.55,176.57,176.54,176.51,176.56,176.61,176.61,176.57,176.55,176.54,176.56,176.59,176.67,176.74,176.82,176.85,176.9,176.96,177.04,177.1,177.16,177.19,177.27,177.35,177.4,177.46,177.54,177.62,177.74,177.97,178.21,178.42,178.61,178.86,179.07,179.39,179.71,180.14,180.56,180.98,181.43,181.88,182.32,182.76,183.16,183.56,184.0,184.42,184.86,185.34,185.84,186.34,186.89,187.39,187.86,188.31,188.72,189.24,189.77,190.32,190.9,191.48,192.08,192.67,193.25,193.84,194.47,195.13,195.77,196.49,197.28,198.11,198.97,199.76,200.6,201.49,202.37,203.31,204.28,205.12,205.94,206.73,207.55,208.4,209.31,210.22,211.22,212.32,213.43,214.48,215.53,216.54,217.57,218.63,219.67,220.71,221.7,222.72,223.84,224.89,225.94,226.93,227.91,228.79,229.71,230.65,231.61,232.61,233.58,234.53,235.5,236.44,237.37,238.32,239.28,240.25,241.28,242.32,243.38,244.44,245.49,246.54,247.57],"ma200":[177.33,177.33,177.32,177.32,177.26,177.2,177.15,177.1,177.06,177.0,176.93,176.89,176.84,176.8,176.78,176.76,176.7,176.64,176.54,176.43,176.32,176.24,176.11,175.95,175.82,175.66,175.56,175.44,175.31,175.19,175.05,174.91,174.75,174.57,174.4,174.23,174.08,173.95,173.8,173.67,173.54,173.42,173.32,173.23,173.16,173.03,172.89,172.75,172.67,172.63,172.62,172.59,172.57,172.55,172.51,172.52,172.57,172.62,172.69,172.73,172.77,172.82,172.84,172.87,172.9,172.92,172.96,173.0,173.06,173.13,173.18,173.21,173.27,173.34,173.39,173.4,173.44,173.49,173.55,173.66,173.81,173.95,174.07,174.19,174.3,174.39,174.47,174.55,174.63,174.71,174.81,174.91,175.01,175.12,175.22,175.34,175.46,175.58,175.71,175.84,175.98,176.14,176.31,176.46,176.58,176.73,176.87,177.02,177.19,177.37,177.55,177.74,177.93,178.13,178.32,178.5,178.65,178.77,178.91,179.08,179.28,179.46,179.61,179.76,179.93,180.08,180.32,180.58,180.87,181.17,181.48,181.78,182.1,182.46,182.89,183.3,183.69,184.1,184.52,184.92,185.32,185.68,186.04,186.39,186.73,187.02,187.26,187.52,187.8,188.07,188.32,188.59,188.86,189.08,189.32,189.56,189.84,190.13,190.43,190.76,191.07,191.37,191.64,191.96,192.34,192.71,193.13,193.58,194.01,194.45,194.86,195.28,195.71,196.11,196.55,197.04,197.49,197.9,198.28,198.68,199.09,199.51,200.0,200.53,201.19,201.86,202.53,203.2,203.84,204.48,205.16,205.81,206.49,207.16,207.84,208.56,209.25,209.95,210.64,211.33,211.96,212.61,213.28,213.96,214.69,215.44,216.17,216.92,217.66,218.39,219.16,219.91,220.66,221.44,222.22,223.0,223.83,224.69,225.59,226.48],"rs_line":[1.0,1.00301,1.01658,1.01985,1.00043,0.99781,1.0106,0.99838,0.99533,0.98153,0.96902,0.97986,0.97543,0.98515,0.98924,1.00348,0.98239,0.96698,0.93861,0.93337,0.94653,0.94046,0.95041,0.97717,0.98885,0.98668,0.98112,0.98983,0.9977,1.00095,0.98641,0.98862,0.97363,0.9746,0.9755,0.98446,0.98709,0.99445,0.9854,0.97706,0.96962,0.97416,0.97772,0.98479,0.988,0.91002,0.92117,0.91423,0.91479,0.91625,0.94875,0.93616,0.94168,0.94313,0.93193,0.97508,0.9857,0.97869,0.98357,0.98588,0.97963,0.9801,0.96063,0.94027,0.94994,0.95692,0.9757,0.98992,0.99753,0.9936,0.9796,0.98457,0.98671,0.99125,0.97322,0.94324,0.92444,0.92387,0.94399,0.95272,0.96888,0.95951,0.95723,0.96826,0.96491,0.95605,0.94365,0.95141,0.95429,0.97164,0.97781,0.98357,0.98388,0.98284,0.99017,1.01598,1.02094,1.00917,1.01774,1.01807,1.01486,1.03338,1.04,1.01971,1.02105,1.03648,1.03947,1.04002,1.04279,1.05995,1.05964,1.06163,1.05215,1.05615,1.06429,1.0613,1.05769,1.04846,1.05494,1.07058,1.088,1.0772,1.07609,1.09372,1.10629,1.10651,1.19976,1.19785,1.21429,1.20611,1.23303,1.22753,1.22361,1.22707,1.27306,1.27309,1.26672,1.27334,1.28523,1.26735,1.27157,1.25283,1.25223,1.24818,1.23048,1.2218,1.2276,1.23063,1.23075,1.25153,1.23431,1.21871,1.20606,1.21541,1.23308,1.24241,1.26466,1.27419,1.2766,1.27954,1.25128,1.26378,1.2623,1.28552,1.31648,1.30569,1.33783,1.3858,1.38087,1.38953,1.37621,1.40445,1.42263,1.39314,1.42514,1.42751,1.40564,1.38803,1.37762,1.43385,1.44275,1.4777,1.48516,1.51955,1.59156,1.60232,1.57482,1.56548,1.5481,1.54965,1.56678,1.55475,1.56983,1.53722,1.55469,1.56024,1.52122,1.52217,1.51858,1.51491,1.48363,1.50063,1.51541,1.5193,1.53352,1.52809,1.52481,1.52749,1.53014,1.53789,1.54251,1.54202,1.51952,1.56263,1.58014,1.58483,1.5996,1.62063,1.62805,1.60842],"rs_score":0.55481},{"ticker":"AMAT","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[152.87,155.32,151.54,155.68,149.99,146.99,149.06,149.95,155.66,155.46,153.51,154.46,154.38,152.12,154.95,153.64,150.68,147.68,145.06,145.12,145.66,147.75,135.51,126.95,132.85,128.96,149.73,138.24,144.94,144.53,145.45,138.19,137.46,135.56,138.3,143.58,150.17,151.55,150.79,149.55,150.71,148.96,155.1,154.61,153.03,155.81,156.0,155.61,167.99,173.03,174.14,174.75,165.57,165.94,165.73,162.23,160.52,157.51,161.83,161.59,159.48,156.75,157.27,161.74,161.93,164.19,166.74,169.79,173.77,172.79,175.0,170.59,176.55,174.09,172.84,169.46,171.96,180.18,183.07,183.52,183.21,183.07,183.76,190.01,191.05,190.78,194.99,195.39,198.03,197.93,197.1,199.29,194.81,192.52,190.44,192.61,187.14,187.01,188.12,185.69,190.27,188.41,189.39,180.06,179.99,182.82,179.15,178.14,183.15,184.87,184.38,188.45,190.03,188.24,161.76,163.53,162.22,160.96,159.84,162.49,161.99,164.51,164.39,165.27,160.76,157.57,156.25,158.24,162.75,162.05,163.5,163.42,170.15,167.8,170.93,173.54,178.13,189.76,190.1,200.52,200.87,201.44,199.6,203.92,204.95,204.74,217.74,223.59,217.53,223.91,211.56,217.51,220.3,209.95,219.48,218.19,227.58,227.72,224.99,228.13,226.0,220.56,228.47,228.75,231.33,227.64,235.75,232.55,233.1,237.71,230.19,240.89,233.53,230.07,235.08,228.67,230.73,223.23,226.01,228.71,225.12,235.13,220.23,224.01,230.91,242.46,249.97,252.25,254.75,265.33,268.63,269.44,268.0,268.16,267.14,275.15,270.11,259.21,261.27,258.84,248.27,253.5,256.41,259.01,260.23,260.78,261.9,263.05,259.97,256.99,268.87,284.32,296.01,292.2,281.64,301.18,307.24,304.87,301.89,319.08],"ma50":[173.91,173.7,173.5,173.35,173.0,172.57,172.2,171.86,171.7,171.56,171.35,171.04,170.58,170.06,169.62,169.26,168.86,168.34,167.67,166.85,165.92,165.02,163.82,162.54,161.46,160.55,160.09,159.35,158.61,157.9,157.23,156.42,155.56,154.61,153.78,152.98,152.32,151.73,151.06,150.67,150.24,149.74,149.32,148.97,148.66,148.47,148.22,148.2,148.4,148.81,149.24,149.63,149.91,150.11,150.43,150.73,150.96,151.11,151.24,151.36,151.48,151.52,151.58,151.78,151.91,152.13,152.45,152.89,153.46,154.02,154.6,155.06,155.88,156.82,157.62,158.43,158.88,159.72,160.48,161.26,162.01,162.91,163.84,164.93,165.98,166.93,167.82,168.7,169.64,170.61,171.54,172.55,173.34,174.1,174.85,175.58,176.21,176.83,177.24,177.49,177.81,178.09,178.56,178.84,179.13,179.54,179.91,180.33,180.75,181.22,181.72,182.35,183.01,183.54,183.53,183.52,183.43,183.25,182.97,182.77,182.51,182.39,182.14,181.97,181.72,181.49,181.17,180.73,180.33,179.9,179.5,179.11,178.84,178.39,177.99,177.65,177.31,177.2,177.04,177.09,177.17,177.21,177.3,177.53,177.82,178.07,178.68,179.41,180.0,180.76,181.19,181.77,182.39,182.99,183.78,184.48,185.45,186.44,187.28,188.14,188.98,189.62,190.39,191.2,192.59,193.87,195.34,196.77,198.24,199.74,201.11,202.64,204.02,205.31,206.8,208.22,209.71,211.01,212.28,213.61,214.84,216.28,217.28,218.4,219.6,220.98,222.42,223.67,224.96,226.26,227.61,228.97,230.34,231.62,232.87,234.28,235.32,236.04,236.91,237.61,238.34,239.06,239.79,240.77,241.58,242.43,243.12,243.83,244.53,245.1,245.96,247.24,248.59,249.86,250.86,252.33,253.76,255.21,256.59,258.21],"ma150":[183.56,183.23,182.93,182.55,182.24,182.01,181.79,181.57,181.42,181.18,180.93,180.67,180.36,180.03,179.66,179.29,178.89,178.5,178.07,177.71,177.33,177.0,176.6,176.16,175.76,175.31,175.08,174.79,174.55,174.35,174.14,173.87,173.55,173.23,172.9,172.6,172.35,172.12,171.81,171.53,171.24,170.92,170.64,170.27,169.92,169.62,169.34,169.04,168.83,168.63,168.46,168.29,168.02,167.77,167.51,167.16,166.96,166.78,166.64,166.47,166.31,166.13,165.96,165.81,165.65,165.51,165.35,165.25,165.2,165.13,165.08,164.98,164.9,164.77,164.64,164.51,164.42,164.4,164.38,164.48,164.56,164.65,164.74,164.84,164.94,165.05,165.2,165.36,165.51,165.61,165.7,165.82,165.98,166.11,166.23,166.39,166.5,166.62,166.74,166.85,166.99,167.14,167.32,167.43,167.52,167.61,167.69,167.77,167.9,168.05,168.18,168.31,168.39,168.46,168.36,168.3,168.24,168.16,168.04,167.88,167.68,167.49,167.28,167.11,166.94,166.82,166.71,166.6,166.47,166.35,166.25,166.15,166.08,165.98,165.92,165.85,165.82,165.88,165.91,166.12,166.32,166.5,166.66,166.87,167.11,167.37,167.7,168.15,168.54,169.02,169.41,169.83,170.29,170.65,171.11,171.59,172.11,172.63,173.09,173.57,174.06,174.5,174.99,175.5,176.01,176.51,177.07,177.64,178.23,178.84,179.41,180.03,180.68,181.37,182.05,182.71,183.25,183.82,184.36,184.92,185.45,186.1,186.65,187.24,187.86,188.52,189.18,189.85,190.55,191.32,192.11,192.91,193.66,194.42,195.18,195.97,196.74,197.43,198.05,198.62,199.11,199.64,200.25,200.87,201.5,202.15,202.83,203.53,204.19,204.82,205.55,206.4,207.33,208.2,208.99,209.91,210.84,211.75,212.6,213.57],"ma200":[194.7,194.39,194.08,193.8,193.45,193.09,192.74,192.4,192.07,191.74,191.42,191.11,190.8,190.49,190.21,189.86,189.5,189.13,188.72,188.29,187.83,187.38,186.88,186.3,185.72,185.17,184.74,184.28,183.83,183.39,182.96,182.47,181.97,181.44,180.92,180.42,179.94,179.44,178.92,178.46,178.0,177.52,177.06,176.74,176.41,176.14,175.8,175.48,175.29,175.14,174.98,174.83,174.67,174.44,174.29,174.19,174.08,173.96,173.87,173.73,173.57,173.39,173.17,172.97,172.72,172.5,172.28,172.1,171.92,171.78,171.65,171.52,171.42,171.33,171.23,171.09,171.03,171.02,171.03,171.08,171.11,171.13,171.12,171.15,171.17,171.18,171.22,171.26,171.27,171.3,171.31,171.33,171.31,171.23,171.16,171.11,171.06,170.99,170.93,170.85,170.8,170.74,170.66,170.54,170.41,170.26,170.2,170.17,170.17,170.16,170.16,170.19,170.22,170.24,170.12,170.01,169.87,169.75,169.64,169.54,169.44,169.33,169.21,169.07,168.91,168.76,168.61,168.48,168.37,168.33,168.3,168.27,168.26,168.23,168.21,168.2,168.22,168.32,168.39,168.48,168.57,168.67,168.81,168.96,169.13,169.31,169.54,169.82,170.06,170.33,170.54,170.8,171.09,171.32,171.58,171.83,172.13,172.44,172.74,173.07,173.38,173.63,173.89,174.14,174.41,174.69,175.02,175.31,175.59,175.84,176.03,176.27,176.46,176.66,176.9,177.17,177.46,177.7,177.92,178.17,178.4,178.68,178.88,179.08,179.34,179.63,179.97,180.32,180.68,181.16,181.64,182.12,182.58,183.06,183.55,184.1,184.61,185.12,185.64,186.17,186.65,187.14,187.66,188.18,188.73,189.3,189.86,190.43,190.95,191.46,192.03,192.68,193.39,194.09,194.72,195.46,196.25,197.03,197.82,198.69],"rs_line":[1.0,1.00522,0.99848,1.02004,1.00965,0.99775,1.00646,1.02615,1.04367,1.03435,1.03254,1.02774,1.03018,1.01782,1.01851,1.00748,1.00001,0.98271,0.98511,0.97895,0.97983,0.98763,0.95277,0.94809,0.99392,0.98017,1.02988,0.99442,1.02434,1.01163,1.02093,0.99202,0.98537,0.99545,0.98981,1.01192,1.03655,1.03857,1.03297,1.01806,1.02555,1.00651,1.03267,1.03534,1.0334,1.04777,1.04179,1.04051,1.08735,1.11263,1.11834,1.1168,1.05147,1.05267,1.05488,1.0503,1.03882,1.02635,1.03302,1.03749,1.01992,1.00358,1.00127,1.02389,1.02537,1.04473,1.05017,1.06842,1.0873,1.08426,1.09378,1.07827,1.10542,1.09942,1.09169,1.07603,1.08122,1.12053,1.13787,1.13181,1.12431,1.1181,1.12268,1.15563,1.15287,1.15988,1.18613,1.18147,1.19407,1.19768,1.19038,1.20878,1.17766,1.15674,1.14508,1.15594,1.12295,1.1127,1.11894,1.09984,1.12725,1.11918,1.12642,1.07496,1.09245,1.09301,1.07653,1.06232,1.09312,1.09484,1.09411,1.10648,1.11195,1.10137,0.94866,0.95925,0.95676,0.95185,0.94904,0.95018,0.95144,0.96222,0.95933,0.96106,0.94044,0.92866,0.91592,0.9199,0.94886,0.94247,0.94871,0.94551,0.97633,0.96317,0.97594,0.99221,1.01972,1.08125,1.08083,1.13471,1.14291,1.14981,1.14459,1.1627,1.1653,1.15974,1.22919,1.26076,1.22661,1.25807,1.1931,1.21939,1.23862,1.21321,1.24912,1.24329,1.29107,1.30072,1.27787,1.28237,1.27042,1.24632,1.2834,1.27456,1.27391,1.25026,1.29419,1.29082,1.28964,1.31268,1.2864,1.34155,1.31467,1.29391,1.30178,1.26339,1.27406,1.25345,1.26926,1.29651,1.28696,1.33901,1.27357,1.28266,1.30299,1.35541,1.38781,1.39287,1.41313,1.46909,1.48223,1.48562,1.47487,1.4802,1.47585,1.51008,1.47898,1.43472,1.44831,1.43878,1.39538,1.41409,1.42167,1.42719,1.42739,1.42539,1.43166,1.44309,1.42793,1.4221,1.48512,1.56007,1.61461,1.59898,1.54135,1.63746,1.66779,1.65824,1.65014,1.73937],"rs_score":0.64846},{"ticker":"ASML","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[708.22,739.75,714.84,732.22,683.11,690.21,703.37,694.59,714.0,730.33,731.11,734.91,734.06,716.22,727.84,726.74,705.76,690.63,674.58,662.63,667.34,669.01,623.22,605.55,615.84,595.37,687.26,649.55,668.81,672.87,683.16,634.93,640.16,624.69,638.69,657.98,675.0,677.27,672.76,666.11,668.08,666.72,690.33,683.36,679.99,700.39,708.03,706.21,750.2,763.9,768.91,758.36,748.1,749.13,748.76,737.17,740.7,732.49,756.79,746.51,747.07,736.77,746.53,747.25,742.78,747.76,753.02,770.2,784.97,784.09,786.21,761.0,775.23,759.86,761.64,756.53,779.72,813.36,815.24,798.09,795.95,801.39,790.47,799.59,794.5,785.09,794.1,799.83,802.09,801.93,806.73,823.02,754.45,744.91,734.58,719.68,705.48,716.93,725.08,711.25,729.99,718.49,721.45,694.71,689.82,699.36,689.63,690.96,713.12,722.32,721.31,741.79,755.57,755.21,742.16,747.55,743.61,749.49,735.4,754.89,754.46,763.2,770.0,763.46,742.62,725.85,736.82,753.43,781.7,796.25,805.13,793.14,804.16,813.87,867.3,878.42,872.27,927.8,932.15,957.8,963.51,946.94,949.55,951.52,962.61,968.09,1003.27,1030.17,1032.22,1043.3,1002.3,987.81,980.54,936.19,984.66,983.18,1009.81,1019.59,1029.27,1042.15,1025.02,1011.57,1036.41,1033.1,1059.98,1052.48,1070.84,1075.45,1059.23,1066.82,1030.14,1043.75,1029.2,1016.96,1038.79,1022.42,1037.33,1019.86,1006.98,1020.0,1004.06,1039.33,981.04,966.57,987.82,1003.22,1040.97,1060.0,1087.99,1108.78,1140.92,1110.08,1099.47,1119.69,1111.44,1119.32,1122.84,1080.85,1087.82,1076.05,1015.43,1036.31,1056.02,1056.98,1061.84,1065.52,1072.75,1065.99,1072.14,1069.86,1163.78,1228.19,1242.19,1228.47,1194.32,1273.88,1281.23,1270.16,1263.72,1331.6],"ma50":[730.74,731.14,731.23,731.77,731.01,730.42,730.17,729.79,730.14,730.89,731.5,731.91,731.23,730.4,730.08,729.83,729.4,728.48,727.45,725.7,723.92,722.04,719.17,716.35,714.02,712.13,712.21,710.95,709.58,708.25,707.29,705.37,703.32,701.03,699.25,697.53,695.97,694.39,692.3,690.59,689.07,687.51,686.46,685.38,684.26,683.66,682.88,683.05,683.88,685.16,686.37,686.74,687.41,687.75,689.06,690.0,690.75,691.5,692.36,692.68,693.0,693.04,693.29,693.91,694.21,694.63,695.57,697.17,699.37,701.8,704.18,706.02,709.06,712.15,715.06,718.29,720.13,723.41,726.34,728.84,731.1,734.43,737.44,740.93,744.05,746.59,748.97,751.42,754.01,756.73,759.5,762.63,763.91,765.14,766.23,766.62,766.57,766.78,766.28,765.23,764.45,763.65,763.12,762.03,760.85,760.09,759.07,758.24,757.37,756.88,756.37,756.47,756.65,756.81,756.8,756.79,756.6,756.19,755.2,754.62,753.98,754.02,753.92,753.99,753.61,753.0,752.14,750.94,750.27,750.23,750.42,750.25,750.53,750.81,752.27,754.13,755.7,758.26,760.86,763.98,767.11,769.59,773.49,777.62,782.18,787.15,793.11,799.37,805.52,812.16,817.6,822.99,828.17,833.0,838.9,844.57,850.98,857.55,863.87,870.27,876.34,881.74,887.36,892.91,899.27,905.37,911.91,918.43,924.91,931.15,936.66,942.27,947.46,952.53,958.45,964.38,970.39,975.72,980.23,984.7,988.68,993.6,997.14,1000.19,1002.61,1005.1,1008.48,1011.12,1014.24,1017.26,1020.8,1024.07,1027.07,1030.43,1033.41,1036.43,1038.82,1039.83,1040.95,1041.6,1041.86,1042.83,1044.34,1046.76,1048.3,1049.95,1051.21,1052.14,1052.99,1053.55,1056.32,1060.66,1064.77,1068.68,1071.37,1075.79,1080.0,1083.9,1087.99,1093.28],"ma150":[762.16,761.29,760.32,758.96,757.62,756.83,756.05,755.06,754.24,753.26,752.4,751.62,750.71,749.62,748.29,747.01,745.49,743.92,742.13,740.49,738.89,737.47,735.69,733.8,731.99,729.94,728.88,727.8,726.96,726.42,725.98,725.2,724.14,722.97,721.78,720.82,719.94,719.21,718.17,717.31,716.41,715.42,714.57,713.45,712.37,711.48,710.72,709.88,709.33,708.87,708.55,708.11,707.46,706.89,706.28,705.38,705.45,705.77,706.15,706.3,706.52,706.63,706.88,707.12,707.33,707.59,707.85,708.42,709.17,709.9,710.67,711.23,711.99,712.54,713.15,713.72,714.46,715.39,716.21,717.14,718.01,718.94,719.82,720.67,721.48,722.15,722.96,723.83,724.59,725.2,725.79,726.48,726.76,727.0,727.19,727.29,727.23,727.25,727.29,727.22,727.19,727.18,727.25,727.18,726.97,726.84,726.66,726.51,726.62,726.82,726.96,727.14,727.05,727.04,727.03,727.08,727.19,727.28,727.34,727.37,727.36,727.36,727.38,727.5,727.57,727.8,728.16,728.43,728.73,729.11,729.6,730.02,730.43,730.92,731.85,732.75,733.55,734.69,735.72,737.1,738.56,739.91,741.29,742.71,744.22,745.81,747.52,749.74,751.89,754.18,756.14,757.79,759.57,760.93,762.94,764.89,766.93,769.1,771.2,773.28,775.24,777.08,779.1,781.21,783.43,785.6,788.03,790.6,793.16,795.86,798.27,800.77,803.48,806.22,809.04,811.89,814.22,816.69,818.95,821.26,823.4,826.09,828.37,830.65,832.97,835.28,837.72,840.27,843.04,845.99,849.14,852.09,854.82,857.73,860.61,863.4,866.17,868.66,870.91,872.99,874.64,876.49,878.54,880.6,882.68,884.87,887.09,889.31,891.41,893.57,896.35,899.62,902.93,906.13,909.14,912.65,916.17,919.51,922.7,926.35],"ma200":[821.06,820.07,819.05,818.09,816.8,815.63,814.53,813.34,812.12,810.82,809.68,808.53,807.4,806.15,805.03,803.46,801.73,800.04,798.2,796.34,794.33,792.41,790.39,788.15,785.92,783.65,781.9,780.14,778.36,776.65,774.92,772.98,771.02,768.9,766.74,764.65,762.64,760.73,758.6,756.62,754.53,752.55,750.66,749.41,748.19,747.22,746.05,744.92,744.31,743.81,743.21,742.65,742.09,741.15,740.48,740.12,739.72,739.17,738.77,738.12,737.55,736.97,736.36,735.7,734.77,733.91,733.01,732.23,731.44,730.82,730.22,729.6,729.03,728.39,727.76,727.02,726.69,726.7,726.8,727.03,727.26,727.51,727.46,727.46,727.35,727.26,727.2,727.26,727.13,727.16,727.18,727.23,726.91,726.37,725.83,725.27,724.68,724.11,723.57,722.96,722.52,722.0,721.37,720.68,719.92,719.06,718.85,718.89,718.95,718.95,718.98,719.09,719.32,719.55,719.7,719.89,720.04,720.36,720.68,721.08,721.5,721.93,722.47,722.9,723.27,723.54,723.88,724.28,724.72,725.41,726.11,726.77,727.49,728.2,729.18,730.14,731.15,732.43,733.66,734.89,736.12,737.25,738.44,739.66,740.94,742.25,743.7,745.28,746.85,748.45,749.79,751.13,752.48,753.64,754.95,756.27,757.74,759.27,760.94,762.68,764.3,765.79,767.13,768.51,770.09,771.66,773.37,775.07,776.73,778.32,779.68,781.09,782.4,783.75,785.29,786.95,788.72,790.25,791.6,793.01,794.37,795.91,797.1,798.24,799.54,800.84,802.28,803.8,805.35,807.14,809.12,810.95,812.73,814.64,816.52,818.47,820.35,822.26,824.15,826.04,827.57,829.05,830.76,832.38,834.28,836.15,838.0,839.86,841.65,843.35,845.51,847.98,850.52,853.08,855.41,858.15,861.02,863.92,866.87,870.21],"rs_line":[1.0,1.03341,1.01666,1.03558,0.99256,1.01128,1.02512,1.026,1.03333,1.04887,1.06147,1.05549,1.05733,1.03439,1.03268,1.02865,1.01102,0.99198,0.98884,0.96485,0.96897,0.96528,0.94583,0.97616,0.99452,0.97676,1.02036,1.00856,1.02026,1.01659,1.03504,0.98384,0.99053,0.99016,0.98668,1.00097,1.00569,1.00184,0.99478,0.97879,0.98129,0.9724,0.99211,0.98776,0.99117,1.01663,1.02061,1.01928,1.04814,1.06028,1.06587,1.04613,1.02548,1.02577,1.02873,1.03016,1.03469,1.03025,1.04275,1.03457,1.03128,1.0182,1.02591,1.02107,1.01524,1.02701,1.02372,1.04613,1.06018,1.06202,1.06068,1.03828,1.04772,1.0358,1.03838,1.0369,1.05823,1.09183,1.09374,1.06242,1.05433,1.05648,1.04243,1.04969,1.03486,1.03028,1.04267,1.04394,1.04394,1.04741,1.05168,1.07752,0.98445,0.96609,0.95339,0.93229,0.91376,0.92076,0.93092,0.90932,0.93351,0.92124,0.9262,0.89523,0.90374,0.90252,0.8945,0.88941,0.9187,0.92336,0.92389,0.94012,0.95431,0.95377,0.93949,0.94652,0.94667,0.95669,0.94249,0.95283,0.9565,0.96355,0.96992,0.95829,0.93773,0.92339,0.93229,0.94541,0.98373,0.99959,1.0084,0.99052,0.99601,1.00837,1.06888,1.08408,1.07783,1.14111,1.14397,1.16992,1.18333,1.1667,1.17533,1.17106,1.18139,1.18366,1.22251,1.25384,1.25635,1.2653,1.2201,1.19533,1.18999,1.16772,1.20962,1.20928,1.23654,1.25708,1.26185,1.26449,1.24373,1.23382,1.25667,1.2425,1.25996,1.24773,1.26889,1.28852,1.26494,1.27162,1.24263,1.25469,1.25062,1.23453,1.24166,1.2193,1.23639,1.23608,1.22067,1.24808,1.23898,1.27757,1.22458,1.19462,1.20318,1.21055,1.24749,1.2634,1.3027,1.32514,1.35885,1.32115,1.30604,1.33407,1.32539,1.32599,1.32707,1.29133,1.30162,1.29106,1.23189,1.2478,1.26383,1.25715,1.25718,1.25712,1.26578,1.2623,1.27113,1.2779,1.38754,1.45464,1.46253,1.45105,1.41085,1.49495,1.50122,1.49123,1.491,1.56682],"rs_score":0.6195}],"analyst_panel":[{"ticker":"AMD","consensus":"Buy","analyst_count":69,"target_consensus":288.56,"target_high":380.0,"target_low":200.0},{"ticker":"AAPL","consensus":"Buy","analyst_count":109,"target_consensus":299.08,"target_high":350.0,"target_low":220.0},{"ticker":"CSCO","consensus":"Buy","analyst_count":72,"target_consensus":82.67,"target_high":91.0,"target_low":69.0},{"ticker":"LIN","consensus":"Buy","analyst_count":28,"target_consensus":500.33,"target_high":516.0,"target_low":490.0},{"ticker":"NVDA","consensus":"Buy","analyst_count":79,"target_consensus":264.34,"target_high":352.0,"target_low":140.0},{"ticker":"GOOGL","consensus":"Buy","analyst_count":81,"target_consensus":321.55,"target_high":390.0,"target_low":190.0},{"ticker":"GOOG","consensus":"Buy","analyst_count":79,"target_consensus":335.83,"target_high":400.0,"target_low":275.0},{"ticker":"META","consensus":"Buy","analyst_count":51,"target_consensus":853.64,"target_high":1117.0,"target_low":718.0},{"ticker":"MSFT","consensus":"Buy","analyst_count":78,"target_consensus":642.57,"target_high":675.0,"target_low":560.0},{"ticker":"AMAT","consensus":"Buy","analyst_count":53,"target_consensus":327.71,"target_high":400.0,"target_low":273.0}],"records":[{"ticker":"AMD","momentum_12_1":0.7881,"quality_raw":0.0951,"value_raw":0.09453,"composite_score":0.37913,"rs_score":0.77428,"ma_50":220.88,"ma_150":189.62,"ma_200":168.05,"sepa_pass":true,"rank":1,"action":"BUY"},{"ticker":"AAPL","momentum_12_1":0.17503,"quality_raw":1.0155,"value_raw":0.02402,"composite_score":0.35291,"rs_score":-0.08216,"ma_50":271.8,"ma_150":244.37,"ma_200":233.89,"sepa_pass":false,"rank":2,"action":"BUY"},{"ticker":"CSCO","momentum_12_1":0.31889,"quality_raw":0.23,"value_raw":0.09775,"composite_score":0.33676,"rs_score":0.0793,"ma_50":76.25,"ma_150":71.08,"ma_200":68.35,"sepa_pass":false,"rank":3,"action":"BUY"},{"ticker":"LIN","momentum_12_1":-0.02411,"quality_raw":0.2295,"value_raw":0.10996,"composite_score":0.30048,"rs_score":-0.15919,"ma_50":419.76,"ma_150":451.05,"ma_200":451.99,"sepa_pass":false,"rank":4,"action":"BUY"},{"ticker":"NVDA","momentum_12_1":0.33796,"quality_raw":0.853,"value_raw":0.02413,"composite_score":0.21407,"rs_score":0.23014,"ma_50":184.81,"ma_150":178.1,"ma_200":163.68,"sepa_pass":false,"rank":5,"action":"BUY"},{"ticker":"GOOGL","momentum_12_1":0.62512,"quality_raw":0.3295,"value_raw":0.06403,"composite_score":0.18834,"rs_score":0.56559,"ma_50":308.31,"ma_150":246.83,"ma_200":225.5,"sepa_pass":true,"rank":6,"action":"BUY"},{"ticker":"GOOG","momentum_12_1":0.61905,"quality_raw":0.3295,"value_raw":0.06336,"composite_score":0.17505,"rs_score":0.55481,"ma_50":309.01,"ma_150":247.57,"ma_200":226.48,"sepa_pass":true,"rank":7,"action":"BUY"},{"ticker":"META","momentum_12_1":0.08963,"quality_raw":0.3635,"value_raw":0.07755,"composite_score":0.10368,"rs_score":-0.14435,"ma_50":639.5,"ma_150":701.79,"ma_200":675.55,"sepa_pass":false,"rank":8,"action":"BUY"},{"ticker":"MSFT","momentum_12_1":0.1423,"quality_raw":0.4055,"value_raw":0.06572,"composite_score":0.02848,"rs_score":-0.09042,"ma_50":485.92,"ma_150":501.85,"ma_200":481.87,"sepa_pass":false,"rank":9,"action":"BUY"},{"ticker":"AMAT","momentum_12_1":0.50458,"quality_raw":0.3195,"value_raw":0.05683,"composite_score":-0.0038,"rs_score":0.64846,"ma_50":258.21,"ma_150":213.57,"ma_200":198.69,"sepa_pass":true,"rank":10,"action":"BUY"},{"ticker":"ADBE","momentum_12_1":-0.14916,"quality_raw":0.4595,"value_raw":0.06787,"composite_score":-0.03985,"rs_score":-0.45221,"ma_50":334.92,"ma_150":350.91,"ma_200":359.37,"sepa_pass":false,"rank":11,"action":"BUY"},{"ticker":"AMZN","momentum_12_1":0.02195,"quality_raw":0.177,"value_raw":0.08427,"composite_score":-0.1174,"rs_score":-0.09525,"ma_50":233.57,"ma_150":227.33,"ma_200":218.99,"sepa_pass":false,"rank":12,"action":"BUY"},{"ticker":"QCOM","momentum_12_1":0.12368,"quality_raw":0.2475,"value_raw":0.07048,"composite_score":-0.14852,"rs_score":-0.17737,"ma_50":172.63,"ma_150":164.83,"ma_200":159.91,"sepa_pass":false,"rank":13,"action":"BUY"},{"ticker":"PEP","momentum_12_1":0.04326,"quality_raw":0.2705,"value_raw":0.06927,"composite_score":-0.18124,"rs_score":-0.17785,"ma_50":145.39,"ma_150":143.46,"ma_200":141.55,"sepa_pass":false,"rank":14,"action":"BUY"},{"ticker":"TXN","momentum_12_1":-0.08026,"quality_raw":0.3325,"value_raw":0.06257,"composite_score":-0.26145,"rs_score":-0.21166,"ma_50":173.38,"ma_150":185.11,"ma_200":181.76,"sepa_pass":false,"rank":15,"action":"BUY"},{"ticker":"NFLX","momentum_12_1":0.13194,"quality_raw":0.3555,"value_raw":0.04765,"composite_score":-0.31115,"rs_score":-0.12614,"ma_50":100.13,"ma_150":114.15,"ma_200":113.11,"sepa_pass":false,"rank":16,"action":"BUY"},{"ticker":"INTU","momentum_12_1":0.04937,"quality_raw":0.1885,"value_raw":0.0651,"composite_score":-0.35861,"rs_score":-0.29999,"ma_50":650.75,"ma_150":692.23,"ma_200":683.04,"sepa_pass":false,"rank":17,"action":"BUY"},{"ticker":"AVGO","momentum_12_1":0.51228,"quality_raw":0.314,"value_raw":0.03159,"composite_score":-0.36918,"rs_score":0.33754,"ma_50":358.39,"ma_150":327.14,"ma_200":297.15,"sepa_pass":false,"rank":18,"action":"BUY"},{"ticker":"COST","momentum_12_1":-0.06178,"quality_raw":0.1698,"value_raw":0.0468,"composite_score":-0.71704,"rs_score":-0.14594,"ma_50":897.0,"ma_150":935.58,"ma_200":950.5,"sepa_pass":false,"rank":19,"action":"BUY"},{"ticker":"ABNB","momentum_12_1":0.03299,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.14984,"ma_50":127.14,"ma_150":128.11,"ma_200":127.34,"sepa_pass":false,"rank":20,"action":"BUY"},{"ticker":"ADI","momentum_12_1":0.3065,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.21838,"ma_50":265.63,"ma_150":247.87,"ma_200":236.52,"sepa_pass":false,"rank":21,"action":"HOLD"},{"ticker":"ADP","momentum_12_1":-0.09167,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.29698,"ma_50":257.84,"ma_150":283.88,"ma_200":289.73,"sepa_pass":false,"rank":22,"action":"HOLD"},{"ticker":"ADSK","momentum_12_1":0.02594,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.27482,"ma_50":294.64,"ma_150":301.73,"ma_200":296.22,"sepa_pass":false,"rank":23,"action":"HOLD"},{"ticker":"AEP","momentum_12_1":0.22508,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.07446,"ma_50":118.11,"ma_150":113.01,"ma_200":110.87,"sepa_pass":false,"rank":24,"action":"HOLD"},{"ticker":"ALNY","momentum_12_1":0.62779,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.30471,"ma_50":421.14,"ma_150":413.71,"ma_200":377.16,"sepa_pass":false,"rank":25,"action":"HOLD"},{"ticker":"AMGN","momentum_12_1":0.21793,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.04658,"ma_50":329.96,"ma_150":303.8,"ma_200":298.56,"sepa_pass":false,"rank":26,"action":"HOLD"},{"ticker":"APP","momentum_12_1":1.10274,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.70138,"ma_50":637.66,"ma_150":535.71,"ma_200":481.29,"sepa_pass":false,"rank":27,"action":"HOLD"},{"ticker":"ARM","momentum_12_1":-0.11202,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.43856,"ma_50":128.82,"ma_150":143.62,"ma_200":137.19,"sepa_pass":false,"rank":28,"action":"HOLD"},{"ticker":"ASML","momentum_12_1":0.47743,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.6195,"ma_50":1093.28,"ma_150":926.35,"ma_200":870.21,"sepa_pass":true,"rank":29,"action":"HOLD"},{"ticker":"AXON","momentum_12_1":-0.04831,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.09005,"ma_50":575.34,"ma_150":692.92,"ma_200":683.25,"sepa_pass":false,"rank":30,"action":"HOLD"},{"ticker":"AZN","momentum_12_1":0.40064,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.24879,"ma_50":90.74,"ma_150":81.67,"ma_200":78.7,"sepa_pass":false,"rank":31,"action":"HOLD"},{"ticker":"BKNG","momentum_12_1":0.14206,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.10234,"ma_50":5165.14,"ma_150":5369.13,"ma_200":5286.88,"sepa_pass":false,"rank":32,"action":"HOLD"},{"ticker":"BKR","momentum_12_1":0.04038,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.03527,"ma_50":47.9,"ma_150":45.43,"ma_200":43.46,"sepa_pass":false,"rank":33,"action":"HOLD"},{"ticker":"CCEP","momentum_12_1":0.22114,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.00374,"ma_50":90.32,"ma_150":91.38,"ma_200":90.76,"sepa_pass":false,"rank":34,"action":"HOLD"},{"ticker":"CDNS","momentum_12_1":0.0824,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.09932,"ma_50":318.71,"ma_150":331.21,"ma_200":320.52,"sepa_pass":false,"rank":35,"action":"HOLD"},{"ticker":"CEG","momentum_12_1":0.23633,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.00808,"ma_50":353.2,"ma_150":340.49,"ma_200":318.71,"sepa_pass":false,"rank":36,"action":"HOLD"},{"ticker":"CHTR","momentum_12_1":-0.39496,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.62704,"ma_50":206.29,"ma_150":269.95,"ma_200":297.64,"sepa_pass":false,"rank":37,"action":"HOLD"},{"ticker":"CMCSA","momentum_12_1":-0.2735,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.40975,"ma_50":27.36,"ma_150":30.95,"ma_200":31.83,"sepa_pass":false,"rank":38,"action":"HOLD"},{"ticker":"CPRT","momentum_12_1":-0.31217,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.4553,"ma_50":39.7,"ma_150":44.29,"ma_200":47.67,"sepa_pass":false,"rank":39,"action":"HOLD"},{"ticker":"CRWD","momentum_12_1":0.40061,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.11829,"ma_50":499.53,"ma_150":481.39,"ma_200":466.05,"sepa_pass":false,"rank":40,"action":"HOLD"},{"ticker":"CSGP","momentum_12_1":-0.08418,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.27853,"ma_50":66.46,"ma_150":78.59,"ma_200":78.24,"sepa_pass":false,"rank":41,"action":"HOLD"},{"ticker":"CSX","momentum_12_1":0.15681,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.05959,"ma_50":35.72,"ma_150":34.81,"ma_200":33.49,"sepa_pass":false,"rank":42,"action":"HOLD"},{"ticker":"CTAS","momentum_12_1":-0.01992,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.17187,"ma_50":187.18,"ma_150":201.88,"ma_200":204.86,"sepa_pass":false,"rank":43,"action":"HOLD"},{"ticker":"CTSH","momentum_12_1":0.08915,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.0899,"ma_50":79.91,"ma_150":74.66,"ma_200":75.06,"sepa_pass":false,"rank":44,"action":"HOLD"},{"ticker":"DASH","momentum_12_1":0.34046,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.0518,"ma_50":216.87,"ma_150":240.08,"ma_200":228.51,"sepa_pass":false,"rank":45,"action":"HOLD"},{"ticker":"DDOG","momentum_12_1":0.02077,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.32053,"ma_50":152.69,"ma_150":145.06,"ma_200":135.44,"sepa_pass":false,"rank":46,"action":"HOLD"},{"ticker":"DXCM","momentum_12_1":-0.16976,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.31445,"ma_50":64.4,"ma_150":72.63,"ma_200":73.76,"sepa_pass":false,"rank":47,"action":"HOLD"},{"ticker":"EA","momentum_12_1":0.44056,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.25118,"ma_50":203.02,"ma_150":182.67,"ma_200":173.61,"sepa_pass":false,"rank":48,"action":"HOLD"},{"ticker":"EXC","momentum_12_1":0.15691,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.02473,"ma_50":44.56,"ma_150":44.54,"ma_200":44.64,"sepa_pass":false,"rank":49,"action":"HOLD"},{"ticker":"FANG","momentum_12_1":-0.13294,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.3402,"ma_50":149.62,"ma_150":145.17,"ma_200":143.11,"sepa_pass":false,"rank":50,"action":"HOLD"},{"ticker":"FAST","momentum_12_1":0.15487,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.00839,"ma_50":41.14,"ma_150":44.24,"ma_200":43.25,"sepa_pass":false,"rank":51,"action":"HOLD"},{"ticker":"FER","momentum_12_1":0.66543,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.47369,"ma_50":65.43,"ma_150":59.08,"ma_200":56.45,"sepa_pass":true,"rank":52,"action":"HOLD"},{"ticker":"FTNT","momentum_12_1":-0.11861,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.36386,"ma_50":80.98,"ma_150":86.88,"ma_200":90.28,"sepa_pass":false,"rank":53,"action":"HOLD"},{"ticker":"GEHC","momentum_12_1":0.0038,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.20828,"ma_50":80.69,"ma_150":76.58,"ma_200":74.66,"sepa_pass":false,"rank":54,"action":"HOLD"},{"ticker":"GILD","momentum_12_1":0.31626,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.1435,"ma_50":123.09,"ma_150":117.17,"ma_200":114.34,"sepa_pass":false,"rank":55,"action":"HOLD"},{"ticker":"HON","momentum_12_1":-0.09634,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.20495,"ma_50":196.98,"ma_150":209.76,"ma_200":210.4,"sepa_pass":false,"rank":56,"action":"HOLD"},{"ticker":"IDXX","momentum_12_1":0.67343,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.51204,"ma_50":707.29,"ma_150":638.77,"ma_200":595.7,"sepa_pass":true,"rank":57,"action":"HOLD"},{"ticker":"INSM","momentum_12_1":1.88358,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.14323,"ma_50":188.37,"ma_150":149.6,"ma_200":129.82,"sepa_pass":false,"rank":58,"action":"HOLD"},{"ticker":"INTC","momentum_12_1":0.95365,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.32764,"ma_50":38.84,"ma_150":31.08,"ma_200":28.44,"sepa_pass":true,"rank":59,"action":"HOLD"},{"ticker":"ISRG","momentum_12_1":0.0383,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.18446,"ma_50":565.13,"ma_150":511.58,"ma_200":514.55,"sepa_pass":false,"rank":60,"action":"HOLD"},{"ticker":"KDP","momentum_12_1":-0.06134,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.29307,"ma_50":27.78,"ma_150":29.58,"ma_200":30.68,"sepa_pass":false,"rank":61,"action":"HOLD"},{"ticker":"KHC","momentum_12_1":-0.14664,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.34437,"ma_50":24.43,"ma_150":25.86,"ma_200":26.44,"sepa_pass":false,"rank":62,"action":"HOLD"},{"ticker":"KLAC","momentum_12_1":0.74701,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.01409,"ma_50":1238.6,"ma_150":1062.04,"ma_200":976.87,"sepa_pass":true,"rank":63,"action":"HOLD"},{"ticker":"LRCX","momentum_12_1":1.18892,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.70825,"ma_50":169.94,"ma_150":132.84,"ma_200":118.59,"sepa_pass":true,"rank":64,"action":"HOLD"},{"ticker":"MAR","momentum_12_1":0.11598,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.01047,"ma_50":302.38,"ma_150":278.96,"ma_200":271.14,"sepa_pass":false,"rank":65,"action":"HOLD"},{"ticker":"MCHP","momentum_12_1":0.18108,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.11987,"ma_50":62.45,"ma_150":65.6,"ma_200":62.09,"sepa_pass":false,"rank":66,"action":"HOLD"},{"ticker":"MDLZ","momentum_12_1":-0.04974,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.18553,"ma_50":55.32,"ma_150":61.13,"ma_200":62.48,"sepa_pass":false,"rank":67,"action":"HOLD"},{"ticker":"MELI","momentum_12_1":0.12155,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.00785,"ma_50":2063.72,"ma_150":2259.74,"ma_200":2270.53,"sepa_pass":false,"rank":68,"action":"HOLD"},{"ticker":"MNST","momentum_12_1":0.49401,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.36606,"ma_50":74.23,"ma_150":67.37,"ma_200":65.69,"sepa_pass":true,"rank":69,"action":"HOLD"},{"ticker":"MPWR","momentum_12_1":0.60953,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.52246,"ma_50":943.7,"ma_150":878.02,"ma_200":813.5,"sepa_pass":true,"rank":70,"action":"HOLD"},{"ticker":"MRVL","momentum_12_1":-0.26858,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.49128,"ma_50":86.98,"ma_150":80.28,"ma_200":75.15,"sepa_pass":false,"rank":71,"action":"HOLD"},{"ticker":"MSTR","momentum_12_1":-0.52632,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.68954,"ma_50":182.3,"ma_150":297.98,"ma_200":313.57,"sepa_pass":false,"rank":72,"action":"HOLD"},{"ticker":"MU","momentum_12_1":1.4394,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":2.26855,"ma_50":263.18,"ma_150":184.52,"ma_200":160.01,"sepa_pass":true,"rank":73,"action":"HOLD"},{"ticker":"NXPI","momentum_12_1":0.10065,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.05624,"ma_50":217.13,"ma_150":220.39,"ma_200":212.96,"sepa_pass":false,"rank":74,"action":"HOLD"},{"ticker":"ODFL","momentum_12_1":-0.14247,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.21849,"ma_50":150.87,"ma_150":150.63,"ma_200":152.82,"sepa_pass":false,"rank":75,"action":"HOLD"},{"ticker":"ORLY","momentum_12_1":0.18495,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.02276,"ma_50":95.57,"ma_150":97.9,"ma_200":96.33,"sepa_pass":false,"rank":76,"action":"HOLD"},{"ticker":"PANW","momentum_12_1":0.08969,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.08849,"ma_50":193.49,"ma_150":196.35,"ma_200":192.78,"sepa_pass":false,"rank":77,"action":"HOLD"},{"ticker":"PAYX","momentum_12_1":-0.1858,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.4092,"ma_50":112.39,"ma_150":128.43,"ma_200":134.08,"sepa_pass":false,"rank":78,"action":"HOLD"},{"ticker":"PCAR","momentum_12_1":0.02505,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.08268,"ma_50":107.88,"ma_150":101.06,"ma_200":98.85,"sepa_pass":false,"rank":79,"action":"HOLD"},{"ticker":"PDD","momentum_12_1":0.12504,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.09436,"ma_50":118.7,"ma_150":119.56,"ma_200":115.97,"sepa_pass":false,"rank":80,"action":"HOLD"},{"ticker":"PLTR","momentum_12_1":1.78031,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.49751,"ma_50":178.6,"ma_150":169.31,"ma_200":155.01,"sepa_pass":false,"rank":81,"action":"HOLD"},{"ticker":"PYPL","momentum_12_1":-0.30328,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.53819,"ma_50":61.16,"ma_150":67.42,"ma_200":67.46,"sepa_pass":false,"rank":82,"action":"SELL"},{"ticker":"REGN","momentum_12_1":0.08938,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.11514,"ma_50":739.12,"ma_150":624.18,"ma_200":610.02,"sepa_pass":false,"rank":83,"action":"SELL"},{"ticker":"ROP","momentum_12_1":-0.13137,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.37787,"ma_50":443.28,"ma_150":499.09,"ma_200":515.6,"sepa_pass":false,"rank":84,"action":"SELL"},{"ticker":"ROST","momentum_12_1":0.23578,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.11053,"ma_50":176.83,"ma_150":155.07,"ma_200":151.59,"sepa_pass":false,"rank":85,"action":"SELL"},{"ticker":"SBUX","momentum_12_1":-0.08241,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.18677,"ma_50":85.71,"ma_150":87.5,"ma_200":86.95,"sepa_pass":false,"rank":86,"action":"SELL"},{"ticker":"SHOP","momentum_12_1":0.57317,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.36584,"ma_50":159.78,"ma_150":146.11,"ma_200":133.98,"sepa_pass":false,"rank":87,"action":"SELL"},{"ticker":"SNPS","momentum_12_1":-0.07278,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.15267,"ma_50":450.23,"ma_150":503.55,"ma_200":492.99,"sepa_pass":false,"rank":88,"action":"SELL"},{"ticker":"STX","momentum_12_1":2.13033,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":2.3221,"ma_50":281.6,"ma_150":214.82,"ma_200":185.15,"sepa_pass":true,"rank":89,"action":"SELL"},{"ticker":"TEAM","momentum_12_1":-0.35402,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.66772,"ma_50":154.88,"ma_150":169.78,"ma_200":180.01,"sepa_pass":false,"rank":90,"action":"SELL"},{"ticker":"TMUS","momentum_12_1":-0.08413,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.29884,"ma_50":203.27,"ma_150":225.12,"ma_200":230.8,"sepa_pass":false,"rank":91,"action":"SELL"},{"ticker":"TRI","momentum_12_1":-0.1467,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.38079,"ma_50":133.16,"ma_150":163.46,"ma_200":168.92,"sepa_pass":false,"rank":92,"action":"SELL"},{"ticker":"TSLA","momentum_12_1":0.19919,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.08253,"ma_50":443.2,"ma_150":392.63,"ma_200":368.28,"sepa_pass":false,"rank":93,"action":"SELL"},{"ticker":"TTWO","momentum_12_1":0.35844,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.16819,"ma_50":246.09,"ma_150":243.21,"ma_200":237.92,"sepa_pass":false,"rank":94,"action":"SELL"},{"ticker":"VRSK","momentum_12_1":-0.20205,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.37711,"ma_50":220.11,"ma_150":252.89,"ma_200":265.15,"sepa_pass":false,"rank":95,"action":"SELL"},{"ticker":"VRTX","momentum_12_1":0.10701,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.12281,"ma_50":444.06,"ma_150":428.6,"ma_200":437.47,"sepa_pass":false,"rank":96,"action":"SELL"},{"ticker":"WBD","momentum_12_1":2.05344,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.73903,"ma_50":26.23,"ma_150":18.55,"ma_200":16.16,"sepa_pass":true,"rank":97,"action":"SELL"},{"ticker":"WDAY","momentum_12_1":-0.12653,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.40571,"ma_50":218.06,"ma_150":228.46,"ma_200":232.45,"sepa_pass":false,"rank":98,"action":"SELL"},{"ticker":"WDC","momentum_12_1":2.62877,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":3.49564,"ma_50":173.87,"ma_150":118.02,"ma_200":99.66,"sepa_pass":true,"rank":99,"action":"SELL"},{"ticker":"XEL","momentum_12_1":0.18165,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.013,"ma_50":77.05,"ma_150":74.87,"ma_200":73.61,"sepa_pass":false,"rank":100,"action":"SELL"},{"ticker":"ZS","momentum_12_1":0.24701,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.04885,"ma_50":255.06,"ma_150":281.34,"ma_200":269.8,"sepa_pass":false,"rank":101,"action":"SELL"}]},{"id":"sp500_top100","name":"S&P 500 Top 100","universe_size":100,"buy_count":20,"sell_count":20,"sepa_count":18,"sepa_candidates":[{"ticker":"GS","momentum_12_1":0.55651,"quality_raw":0.2535,"value_raw":0.21986,"composite_score":0.70244,"rs_score":0.51842,"ma_50":860.44,"ma_150":779.38,"ma_200":725.01,"sepa_pass":true,"rank":2,"action":"BUY"},{"ticker":"GOOGL","momentum_12_1":0.62512,"quality_raw":0.3295,"value_raw":0.06403,"composite_score":0.20134,"rs_score":0.56559,"ma_50":308.31,"ma_150":246.83,"ma_200":225.5,"sepa_pass":true,"rank":11,"action":"BUY"},{"ticker":"GOOG","momentum_12_1":0.61905,"quality_raw":0.3295,"value_raw":0.06336,"composite_score":0.19292,"rs_score":0.55481,"ma_50":309.01,"ma_150":247.57,"ma_200":226.48,"sepa_pass":true,"rank":12,"action":"BUY"},{"ticker":"AMD","momentum_12_1":0.7881,"quality_raw":0.0951,"value_raw":0.09453,"composite_score":0.18269,"rs_score":0.77428,"ma_50":220.88,"ma_150":189.62,"ma_200":168.05,"sepa_pass":true,"rank":13,"action":"BUY"},{"ticker":"GE","momentum_12_1":0.7018,"quality_raw":0.3135,"value_raw":0.03928,"composite_score":0.14671,"rs_score":0.61997,"ma_50":304.47,"ma_150":286.15,"ma_200":267.96,"sepa_pass":true,"rank":14,"action":"BUY"},{"ticker":"RTX","momentum_12_1":0.52432,"quality_raw":0.1155,"value_raw":0.13666,"composite_score":0.14419,"rs_score":0.48361,"ma_50":179.55,"ma_150":164.68,"ma_200":156.13,"sepa_pass":true,"rank":15,"action":"BUY"},{"ticker":"CAT","momentum_12_1":0.58721,"quality_raw":0.32,"value_raw":0.05119,"composite_score":0.09983,"rs_score":0.55272,"ma_50":584.45,"ma_150":490.2,"ma_200":448.85,"sepa_pass":true,"rank":17,"action":"BUY"},{"ticker":"AMAT","momentum_12_1":0.50458,"quality_raw":0.3195,"value_raw":0.05683,"composite_score":0.04692,"rs_score":0.64846,"ma_50":258.21,"ma_150":213.57,"ma_200":198.69,"sepa_pass":true,"rank":18,"action":"BUY"},{"ticker":"APH","momentum_12_1":0.84858,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.00622,"ma_50":137.82,"ma_150":121.04,"ma_200":110.42,"sepa_pass":true,"rank":50,"action":"HOLD"},{"ticker":"C","momentum_12_1":0.53469,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.40907,"ma_50":109.57,"ma_150":99.16,"ma_200":91.96,"sepa_pass":true,"rank":59,"action":"HOLD"},{"ticker":"GEV","momentum_12_1":0.78243,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.49106,"ma_50":622.4,"ma_150":601.88,"ma_200":550.54,"sepa_pass":true,"rank":67,"action":"HOLD"},{"ticker":"INTC","momentum_12_1":0.95365,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.32764,"ma_50":38.84,"ma_150":31.08,"ma_200":28.44,"sepa_pass":true,"rank":70,"action":"HOLD"},{"ticker":"JNJ","momentum_12_1":0.47959,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.32786,"ma_50":203.89,"ma_150":183.68,"ma_200":176.23,"sepa_pass":true,"rank":72,"action":"HOLD"},{"ticker":"KLAC","momentum_12_1":0.74701,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.01409,"ma_50":1238.6,"ma_150":1062.04,"ma_200":976.87,"sepa_pass":true,"rank":74,"action":"HOLD"},{"ticker":"LRCX","momentum_12_1":1.18892,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.70825,"ma_50":169.94,"ma_150":132.84,"ma_200":118.59,"sepa_pass":true,"rank":77,"action":"HOLD"},{"ticker":"MS","momentum_12_1":0.42666,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.34548,"ma_50":173.97,"ma_150":157.3,"ma_200":147.97,"sepa_pass":true,"rank":79,"action":"HOLD"},{"ticker":"MU","momentum_12_1":1.4394,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":2.26855,"ma_50":263.18,"ma_150":184.52,"ma_200":160.01,"sepa_pass":true,"rank":80,"action":"HOLD"},{"ticker":"NEM","momentum_12_1":1.48232,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.65485,"ma_50":95.94,"ma_150":80.24,"ma_200":73.25,"sepa_pass":true,"rank":82,"action":"SELL"}],"sepa_charts":[{"ticker":"GS","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[581.14,593.07,567.67,559.67,531.66,531.43,535.71,524.81,541.41,551.34,551.78,557.34,562.68,565.14,580.1,585.94,573.92,558.92,543.12,546.29,548.45,563.1,511.23,470.81,465.51,462.22,516.87,489.8,494.44,503.98,507.89,499.05,509.49,501.36,519.99,529.18,545.37,544.86,546.4,548.92,547.55,553.83,566.1,559.56,549.36,551.92,565.7,567.1,591.34,603.81,611.6,615.9,619.03,612.3,606.52,593.46,598.23,598.54,615.73,608.44,604.86,600.45,598.72,603.83,599.21,605.88,614.0,613.52,614.87,624.17,625.11,613.54,627.85,624.64,635.24,640.8,646.88,662.11,669.87,687.16,690.81,707.75,706.46,715.89,723.68,710.93,697.28,696.56,709.12,704.95,713.3,702.51,708.82,705.84,708.26,706.0,700.41,717.52,719.18,728.98,723.65,731.98,730.75,723.59,709.57,726.03,720.91,724.74,719.74,721.27,719.24,743.38,744.69,747.2,730.72,730.96,721.38,720.68,715.95,741.89,738.79,748.95,749.67,751.22,745.25,730.85,730.56,748.9,738.21,741.85,763.92,769.58,784.73,780.06,786.76,785.53,794.22,804.31,805.0,805.56,806.32,792.43,794.76,802.51,804.12,796.35,785.51,779.38,789.98,796.78,789.65,776.51,779.96,764.36,786.78,770.76,767.93,758.09,750.77,763.32,758.98,744.6,750.78,783.88,789.99,792.09,783.06,790.16,789.37,785.52,790.83,793.09,787.58,786.34,797.2,810.31,838.97,805.5,790.91,775.56,776.3,785.99,773.7,774.03,790.71,802.32,816.01,826.04,810.86,815.21,836.57,837.83,854.56,866.69,876.58,889.24,911.03,887.96,889.59,879.15,872.33,876.3,893.48,899.0,901.71,910.78,907.04,892.18,884.42,879.0,914.34,948.44,955.47,941.02,934.83,938.98,949.55,938.15,932.67,975.86],"ma50":[613.4,614.26,614.53,614.4,613.62,612.59,611.68,610.65,610.01,609.59,609.12,608.67,608.25,607.95,607.95,608.47,608.69,608.44,607.18,605.85,604.3,602.87,600.44,597.06,593.64,590.21,587.8,584.84,581.82,579.09,576.6,573.9,571.18,568.04,565.32,562.9,560.86,558.78,556.73,554.49,552.0,549.71,548.19,546.87,545.33,544.07,543.03,542.21,541.6,541.57,542.18,542.63,543.66,544.71,546.21,547.45,548.7,550.17,551.66,552.8,553.87,554.73,555.45,556.22,556.6,557.0,557.8,558.9,560.33,561.89,563.42,564.43,566.76,569.84,573.23,576.81,579.41,582.85,586.36,590.02,593.68,597.86,601.8,606.09,610.16,613.8,616.83,619.87,623.12,626.24,629.56,632.53,635.39,638.31,641.49,644.57,647.27,650.27,652.83,655.33,657.58,659.9,662.13,664.36,666.42,669.07,671.52,674.05,676.13,678.38,680.67,683.53,686.45,689.32,691.95,694.45,696.6,698.74,700.76,703.12,705.39,708.1,710.53,713.07,715.27,717.07,718.74,720.48,721.84,722.94,724.4,725.64,727.2,728.48,729.75,731.24,733.18,735.33,737.25,739.26,741.12,742.92,744.64,746.57,748.49,750.3,752.0,753.24,754.65,756.01,757.33,758.22,759.2,760.02,761.56,762.46,763.4,764.06,764.68,765.53,766.32,766.34,766.47,767.2,768.39,769.61,770.84,772.23,773.7,774.57,775.61,776.5,777.25,777.96,779.0,780.58,782.75,783.88,784.94,785.61,785.86,786.19,785.97,785.85,785.93,786.26,786.7,787.13,787.25,787.44,788.05,788.96,790.15,791.44,792.88,794.74,797.25,799.42,801.42,803.06,804.72,806.71,808.98,811.68,813.98,816.78,819.56,822.24,824.91,827.23,830.33,834.41,838.5,841.65,844.54,847.48,850.81,853.77,856.64,860.44],"ma150":[555.87,556.54,556.96,557.29,557.5,557.91,558.42,558.78,559.24,559.68,560.09,560.57,561.04,561.48,562.02,562.57,563.03,563.44,563.75,564.07,564.33,564.7,564.73,564.51,564.21,563.89,564.09,564.08,564.13,564.29,564.42,564.63,564.89,565.07,565.34,565.64,566.04,566.44,566.72,567.06,567.39,567.76,568.26,568.68,569.02,569.4,569.9,570.4,571.11,571.83,572.61,573.41,574.16,574.89,575.49,575.96,576.47,576.92,577.5,578.04,578.62,579.16,579.71,580.24,580.81,581.36,581.96,582.55,583.2,583.9,584.66,585.24,585.45,585.73,586.04,586.29,586.66,587.11,587.65,588.27,588.96,589.8,590.63,591.43,592.24,592.96,593.57,594.18,594.85,595.53,596.28,596.97,597.71,598.42,599.18,599.99,600.71,601.55,602.44,603.39,604.38,605.6,606.77,607.82,608.75,609.7,610.63,611.63,612.6,613.59,614.55,615.64,616.72,617.83,618.83,619.97,621.03,622.03,622.76,623.62,624.37,625.13,625.91,626.66,627.38,628.03,628.65,629.39,630.01,630.68,631.56,632.46,633.39,634.2,635.08,635.98,636.96,637.99,639.03,640.0,640.89,641.72,642.74,643.92,645.1,646.31,647.43,648.57,649.69,650.97,652.36,653.58,655.0,656.36,658.06,659.66,661.21,662.76,664.16,665.57,666.95,668.2,669.45,670.91,672.31,673.69,675.08,676.62,678.26,679.86,681.47,683.01,684.85,686.95,689.17,691.49,693.63,695.74,697.71,699.52,701.31,703.23,704.99,706.81,708.61,710.43,712.24,714.11,715.87,717.65,719.58,721.47,723.39,725.44,727.62,729.87,732.17,734.31,736.3,738.14,739.87,741.61,743.44,745.35,747.32,749.43,751.49,753.45,755.24,757.05,759.11,761.43,763.81,766.05,768.29,770.51,772.75,774.91,777.03,779.38],"ma200":[533.47,534.11,534.62,535.08,535.43,535.73,536.1,536.43,536.83,537.29,537.76,538.3,538.83,539.38,540.01,540.63,541.21,541.73,542.17,542.68,543.18,543.77,544.09,544.19,544.23,544.25,544.59,544.73,544.91,545.15,545.46,545.7,545.93,546.1,546.36,546.69,547.09,547.45,547.79,548.14,548.47,548.78,549.1,549.38,549.7,550.03,550.43,550.8,551.33,551.89,552.45,553.07,553.63,554.15,554.68,555.29,555.99,556.63,557.35,557.96,558.53,559.11,559.64,560.17,560.67,561.18,561.72,562.3,562.89,563.53,564.11,564.63,565.24,565.84,566.47,567.12,567.92,568.78,569.69,570.72,571.74,572.94,574.11,575.32,576.55,577.68,578.74,579.8,580.82,581.85,582.93,583.96,585.04,586.09,587.14,588.19,589.24,590.37,591.54,592.71,593.85,595.03,596.16,597.26,598.22,599.24,600.23,601.21,602.16,603.12,604.13,605.26,606.39,607.51,608.6,609.63,610.62,611.6,612.59,613.7,614.84,615.95,616.72,617.56,618.34,618.99,619.68,620.45,621.2,621.94,622.82,623.76,624.77,625.69,626.61,627.53,628.47,629.46,630.45,631.47,632.49,633.46,634.45,635.46,636.51,637.57,638.53,639.47,640.49,641.54,642.62,643.75,644.88,645.87,646.95,647.89,648.83,649.73,650.62,651.57,652.49,653.32,654.15,655.17,656.22,657.38,658.48,659.58,660.49,661.36,662.18,662.97,663.75,664.48,665.28,666.17,667.17,668.01,668.74,669.42,670.14,670.89,671.54,672.12,672.79,673.55,674.39,675.28,676.09,676.86,677.68,678.53,679.59,680.8,682.05,683.42,684.89,686.29,687.62,688.99,690.45,691.87,693.49,695.19,697.04,698.94,700.79,702.63,704.35,705.98,707.8,709.75,711.72,713.6,715.37,717.14,719.01,720.91,722.86,725.01],"rs_line":[1.0,1.00968,0.9839,0.96463,0.94143,0.94891,0.9515,0.94473,0.95489,0.96496,0.97629,0.9755,0.9877,0.99468,1.00304,1.01071,1.00194,0.97835,0.97023,0.96939,0.97048,0.99014,0.94553,0.92492,0.91614,0.92414,0.93519,0.92682,0.9192,0.92793,0.93776,0.94239,0.96073,0.96845,0.97897,0.98107,0.99024,0.98222,0.98462,0.98297,0.98012,0.98439,0.99148,0.98568,0.97587,0.97631,0.99376,0.99749,1.00685,1.02134,1.0332,1.0354,1.03411,1.02175,1.01552,1.01069,1.01841,1.02594,1.03391,1.02761,1.01755,1.01126,1.0027,1.00552,0.9981,1.01411,1.01725,1.01554,1.01204,1.03029,1.02775,1.02014,1.03409,1.03767,1.05544,1.07034,1.06993,1.08315,1.09523,1.11478,1.11516,1.13707,1.13536,1.14533,1.14874,1.13697,1.11575,1.10795,1.12476,1.12209,1.13322,1.12087,1.12717,1.1156,1.12025,1.11456,1.10557,1.12303,1.12525,1.13579,1.12777,1.14377,1.14328,1.13634,1.1329,1.14182,1.13955,1.13689,1.12999,1.12364,1.12269,1.14815,1.14625,1.15001,1.12728,1.1279,1.11919,1.12108,1.11821,1.1412,1.14145,1.15233,1.15081,1.14912,1.14683,1.13306,1.12651,1.14522,1.13215,1.13495,1.16601,1.17127,1.18448,1.17783,1.18165,1.18143,1.19599,1.20555,1.20396,1.19913,1.20683,1.18983,1.19886,1.20365,1.20268,1.18659,1.16647,1.15603,1.17177,1.17764,1.17144,1.14512,1.15355,1.16188,1.17789,1.15531,1.14598,1.13906,1.12169,1.1287,1.1223,1.10679,1.1094,1.14892,1.14438,1.14438,1.13079,1.15373,1.14881,1.14106,1.16256,1.16185,1.1663,1.16331,1.16126,1.17766,1.21864,1.18976,1.1684,1.1565,1.16741,1.17743,1.17696,1.16585,1.1737,1.17983,1.19174,1.19984,1.18319,1.18734,1.21424,1.21518,1.2371,1.25844,1.2739,1.28378,1.31219,1.29286,1.29719,1.28548,1.2897,1.28586,1.30313,1.30307,1.30105,1.30953,1.30428,1.2875,1.27787,1.27951,1.32852,1.36895,1.37094,1.35458,1.3458,1.3429,1.35588,1.34229,1.34104,1.39933],"rs_score":0.51842},{"ticker":"GOOGL","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[170.92,173.02,172.35,173.86,165.87,164.04,167.11,162.76,165.49,164.29,160.67,163.89,162.8,163.99,167.68,170.56,165.06,162.24,154.33,154.64,157.07,157.04,150.72,145.6,146.75,144.7,158.71,152.82,157.14,159.07,156.31,153.33,151.16,147.67,151.47,155.35,159.28,161.96,160.61,160.16,158.8,161.3,164.03,164.21,163.23,151.38,154.28,152.75,158.46,159.53,165.37,163.96,166.19,166.54,163.98,168.56,170.87,168.47,172.9,172.36,171.86,171.74,169.03,166.18,168.05,168.21,173.68,176.09,178.6,177.35,175.7,174.67,176.77,175.95,173.32,166.64,165.19,166.77,170.68,173.54,178.53,176.23,175.84,178.64,179.53,176.79,174.36,176.62,177.62,180.19,181.56,182.0,182.97,183.58,185.06,190.1,191.34,190.23,192.17,193.18,192.58,195.75,196.53,191.9,189.13,195.04,194.67,196.09,196.52,201.42,201.0,203.34,201.96,202.94,203.9,203.5,201.57,199.32,199.75,206.09,208.49,207.14,207.48,211.64,212.91,211.35,230.66,232.3,235.0,234.04,239.63,239.17,240.37,240.8,251.61,251.16,249.53,252.03,254.72,252.53,251.66,247.14,245.79,246.54,244.05,243.1,244.9,245.69,245.35,250.43,245.76,244.62,241.53,236.57,244.15,245.45,251.03,251.46,253.3,256.55,250.46,251.69,253.08,259.92,269.27,267.47,274.57,281.48,281.19,283.72,277.54,284.31,284.75,278.83,290.1,291.31,286.71,278.57,276.41,285.02,284.28,292.81,289.45,299.66,318.58,323.44,319.95,320.18,314.89,315.81,319.63,317.62,321.27,313.72,317.08,320.21,312.43,309.29,308.22,306.57,296.72,302.46,307.16,309.78,314.35,314.09,313.51,313.56,313.85,313.0,315.15,316.54,314.34,321.98,325.44,328.57,331.86,335.97,335.84,332.78],"ma50":[189.49,189.19,188.86,188.51,187.94,187.3,186.73,186.13,185.61,185.11,184.54,183.98,183.3,182.67,182.14,181.71,181.19,180.64,179.82,179.05,178.28,177.46,176.5,175.45,174.39,173.44,172.71,171.86,170.98,170.09,169.19,168.13,167.32,166.44,165.77,165.14,164.62,164.19,163.68,163.18,162.68,162.2,161.79,161.48,161.16,160.68,160.31,160.0,159.76,159.61,159.5,159.32,159.19,159.05,159.01,159.1,159.18,159.29,159.44,159.6,159.82,159.98,160.1,160.15,160.16,160.11,160.28,160.56,161.04,161.5,161.87,162.22,162.74,163.35,163.88,164.32,164.45,164.73,165.0,165.29,165.73,166.19,166.69,167.31,167.87,168.3,168.6,168.89,169.23,169.63,170.09,170.5,170.88,171.27,171.7,172.48,173.22,173.97,174.64,175.32,175.86,176.5,177.1,177.61,178.11,178.64,179.12,179.67,180.14,180.72,181.31,181.94,182.6,183.33,184.05,184.76,185.31,185.78,186.2,186.78,187.43,188.08,188.69,189.41,190.2,191.09,192.4,193.71,195.0,196.21,197.43,198.69,199.98,201.23,202.67,204.15,205.66,207.17,208.71,210.16,211.56,212.86,214.12,215.38,216.56,217.62,218.69,219.8,220.86,222.0,223.07,224.05,224.95,225.84,226.94,227.95,229.07,230.18,231.32,232.42,233.41,234.38,235.4,236.54,237.85,239.12,240.59,242.23,243.86,245.41,246.79,248.33,249.88,251.22,252.77,254.37,255.49,256.41,257.24,258.26,259.15,260.23,261.21,262.38,263.72,265.17,266.58,267.94,269.14,270.41,271.77,273.18,274.69,276.03,277.49,279.04,280.39,281.66,282.92,284.04,285.06,286.21,287.53,288.99,290.39,291.77,293.02,294.26,295.47,296.6,297.89,299.19,300.42,301.66,302.78,304.0,305.15,306.24,307.33,308.31],"ma150":[174.79,174.81,174.83,174.84,174.81,174.79,174.84,174.87,174.92,174.93,174.91,174.92,174.92,174.94,174.98,175.03,175.02,174.99,174.91,174.85,174.79,174.73,174.64,174.53,174.42,174.3,174.31,174.29,174.28,174.34,174.39,174.42,174.42,174.37,174.33,174.32,174.32,174.33,174.32,174.3,174.28,174.27,174.29,174.3,174.29,174.2,174.11,174.02,173.97,173.92,173.94,173.94,173.97,174.0,174.0,174.02,174.06,174.08,174.15,174.21,174.26,174.3,174.35,174.37,174.39,174.4,174.42,174.44,174.49,174.53,174.57,174.6,174.6,174.57,174.54,174.45,174.34,174.26,174.22,174.23,174.25,174.24,174.24,174.31,174.41,174.47,174.51,174.56,174.61,174.67,174.74,174.79,174.86,174.92,174.98,175.02,174.99,174.98,174.99,174.97,174.95,175.0,175.05,175.06,175.02,175.01,175.01,175.03,175.06,175.14,175.22,175.3,175.33,175.38,175.45,175.52,175.6,175.66,175.69,175.78,175.86,175.92,175.98,176.07,176.16,176.29,176.52,176.77,177.0,177.2,177.45,177.67,178.0,178.33,178.77,179.2,179.63,180.08,180.54,180.99,181.44,181.85,182.26,182.71,183.14,183.59,184.07,184.59,185.09,185.64,186.14,186.62,187.08,187.5,188.02,188.56,189.12,189.71,190.3,190.91,191.51,192.1,192.7,193.34,194.02,194.66,195.39,196.19,197.03,197.89,198.7,199.55,200.44,201.33,202.28,203.26,204.11,204.95,205.75,206.59,207.44,208.37,209.29,210.31,211.42,212.54,213.61,214.67,215.69,216.73,217.8,218.85,219.89,220.89,221.92,223.04,224.1,225.14,226.14,227.12,227.99,228.92,229.86,230.81,231.82,232.79,233.74,234.7,235.64,236.58,237.54,238.5,239.47,240.51,241.56,242.63,243.68,244.75,245.8,246.83],"ma200":[175.79,175.79,175.78,175.77,175.71,175.65,175.6,175.54,175.5,175.44,175.36,175.32,175.27,175.23,175.19,175.17,175.11,175.05,174.95,174.84,174.73,174.64,174.51,174.35,174.21,174.06,173.95,173.82,173.68,173.56,173.41,173.27,173.11,172.92,172.75,172.58,172.43,172.29,172.14,172.01,171.88,171.75,171.65,171.57,171.5,171.37,171.23,171.08,171.01,170.98,170.97,170.94,170.92,170.89,170.86,170.87,170.93,170.98,171.05,171.1,171.14,171.19,171.21,171.24,171.28,171.3,171.34,171.38,171.44,171.51,171.56,171.61,171.67,171.73,171.79,171.81,171.84,171.9,171.96,172.08,172.23,172.36,172.49,172.61,172.72,172.81,172.89,172.97,173.05,173.13,173.23,173.33,173.43,173.54,173.64,173.77,173.89,174.01,174.14,174.27,174.42,174.58,174.75,174.9,175.03,175.18,175.32,175.48,175.65,175.84,176.02,176.21,176.41,176.61,176.8,176.99,177.15,177.27,177.41,177.59,177.78,177.97,178.13,178.28,178.45,178.61,178.85,179.12,179.42,179.73,180.05,180.35,180.67,181.04,181.47,181.89,182.29,182.71,183.14,183.54,183.94,184.31,184.67,185.03,185.38,185.67,185.91,186.18,186.46,186.73,186.98,187.26,187.53,187.75,188.0,188.25,188.52,188.82,189.13,189.46,189.77,190.07,190.35,190.67,191.05,191.42,191.84,192.3,192.73,193.18,193.59,194.02,194.46,194.86,195.31,195.81,196.26,196.68,197.06,197.46,197.88,198.31,198.8,199.34,200.01,200.69,201.36,202.05,202.69,203.34,204.02,204.68,205.37,206.04,206.73,207.45,208.15,208.85,209.54,210.24,210.87,211.52,212.19,212.87,213.61,214.36,215.1,215.85,216.59,217.34,218.11,218.87,219.63,220.42,221.21,222.0,222.83,223.7,224.61,225.5],"rs_line":[1.0,1.00152,1.01567,1.01886,0.99864,0.9959,1.00918,0.99619,0.9924,0.97767,0.96657,0.97532,0.97164,0.98137,0.98579,1.00032,0.97976,0.96559,0.93739,0.93301,0.945,0.93888,0.9478,0.97254,0.98197,0.98366,0.97636,0.98321,0.99328,0.99582,0.98129,0.98446,0.96915,0.96986,0.96959,0.97925,0.98333,0.9927,0.98405,0.97515,0.96649,0.97479,0.97679,0.9835,0.98587,0.91047,0.92149,0.91352,0.91735,0.91749,0.94986,0.93718,0.94395,0.94491,0.93352,0.97604,0.98903,0.98184,0.98713,0.98977,0.98302,0.98344,0.9625,0.9409,0.95175,0.95728,0.97836,0.99104,0.9995,0.99535,0.98218,0.98746,0.98992,0.99382,0.97911,0.94638,0.92897,0.92761,0.94882,0.95723,0.97989,0.96266,0.96084,0.97174,0.96894,0.96132,0.94863,0.95519,0.9579,0.97519,0.98073,0.98733,0.98928,0.98654,0.99522,1.02039,1.0269,1.01233,1.02232,1.02337,1.02045,1.03999,1.04545,1.02466,1.0267,1.04293,1.04626,1.04588,1.04905,1.06689,1.06677,1.06782,1.05696,1.06199,1.06951,1.06765,1.06329,1.05422,1.06075,1.07787,1.09524,1.08361,1.08292,1.10074,1.11399,1.11408,1.20931,1.20782,1.22541,1.21741,1.24361,1.23765,1.23361,1.23623,1.28488,1.28435,1.2776,1.2844,1.2953,1.27811,1.28068,1.26169,1.26062,1.25726,1.24107,1.2316,1.23651,1.23907,1.23737,1.25848,1.23961,1.22654,1.21457,1.22267,1.24278,1.25093,1.27371,1.28464,1.28674,1.28983,1.25923,1.27203,1.27151,1.29529,1.32624,1.31389,1.34812,1.39741,1.39141,1.4013,1.38722,1.41615,1.43372,1.40254,1.4368,1.4395,1.41598,1.399,1.38838,1.44509,1.45354,1.49139,1.4971,1.53462,1.60785,1.61717,1.58875,1.58126,1.56227,1.56393,1.57739,1.56632,1.58132,1.54881,1.56675,1.57179,1.53004,1.53113,1.52814,1.52412,1.49157,1.50903,1.5232,1.52668,1.54215,1.53548,1.5328,1.53852,1.54183,1.54913,1.55692,1.55344,1.53352,1.57588,1.59297,1.59773,1.61119,1.63442,1.64185,1.62248],"rs_score":0.56559},{"ticker":"GOOG","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[172.61,174.99,174.21,175.75,167.81,165.98,169.0,164.73,167.62,166.57,162.67,166.28,165.05,166.25,169.93,172.79,167.14,164.08,156.06,156.23,158.88,158.86,152.63,147.74,149.24,146.58,161.06,155.37,159.4,161.47,158.68,155.5,153.36,149.86,153.9,157.72,161.47,163.85,162.42,162.06,160.89,162.79,165.81,166.05,165.2,152.8,155.75,154.38,159.58,160.89,166.81,165.4,167.43,167.87,165.32,170.06,171.98,169.59,173.98,173.38,172.96,172.85,170.37,167.71,169.39,169.81,174.92,177.63,180.01,178.79,176.97,175.88,177.94,177.23,173.98,167.73,166.01,167.74,171.49,174.43,178.27,177.39,176.91,179.76,180.55,177.56,175.16,177.66,178.7,181.31,182.81,183.1,183.77,184.7,185.94,191.15,192.11,191.51,193.2,194.08,193.42,196.43,197.44,192.86,189.95,195.75,195.32,196.92,197.28,202.09,201.63,204.16,203.03,203.82,204.91,204.29,202.49,200.19,200.62,206.72,209.16,207.95,208.21,212.37,213.53,211.99,231.1,232.66,235.17,234.16,239.94,239.56,240.78,241.38,251.76,251.42,249.85,252.33,255.24,252.88,252.34,247.83,246.57,247.18,244.36,243.55,245.54,246.43,246.45,251.51,247.13,245.46,242.21,237.49,244.64,246.19,251.71,251.88,253.79,257.02,251.34,252.53,253.73,260.51,269.93,268.43,275.17,281.9,281.82,284.12,278.06,284.75,285.34,279.7,290.59,291.74,287.43,279.12,276.98,285.6,284.96,292.99,289.98,299.65,318.47,323.64,320.28,320.12,315.12,316.02,320.62,318.39,322.09,314.45,317.75,321.0,313.7,310.52,309.32,307.73,298.06,303.75,308.61,311.33,315.68,315.67,314.96,314.39,314.55,313.8,315.32,317.32,314.55,322.43,326.01,329.14,332.73,336.43,336.31,333.16],"ma50":[191.1,190.8,190.49,190.14,189.58,188.95,188.38,187.8,187.3,186.82,186.26,185.72,185.07,184.46,183.95,183.54,183.04,182.5,181.68,180.91,180.14,179.33,178.38,177.34,176.29,175.34,174.62,173.79,172.92,172.04,171.16,170.12,169.32,168.45,167.78,167.18,166.66,166.23,165.72,165.23,164.73,164.24,163.82,163.51,163.19,162.7,162.32,162.01,161.75,161.6,161.48,161.29,161.16,161.0,160.95,161.03,161.09,161.19,161.31,161.45,161.66,161.79,161.89,161.92,161.91,161.85,162.01,162.28,162.76,163.21,163.57,163.91,164.42,165.01,165.5,165.93,166.02,166.27,166.51,166.77,167.16,167.6,168.07,168.67,169.2,169.6,169.87,170.15,170.48,170.86,171.3,171.71,172.07,172.44,172.85,173.62,174.35,175.09,175.76,176.43,176.96,177.58,178.18,178.68,179.17,179.69,180.15,180.7,181.16,181.74,182.31,182.94,183.59,184.31,185.02,185.71,186.27,186.72,187.13,187.69,188.33,188.97,189.58,190.28,191.07,191.96,193.26,194.56,195.83,197.03,198.26,199.5,200.78,202.01,203.44,204.91,206.41,207.9,209.43,210.86,212.25,213.55,214.8,216.05,217.22,218.27,219.34,220.44,221.5,222.65,223.72,224.71,225.6,226.49,227.59,228.6,229.72,230.82,231.95,233.05,234.05,235.01,236.03,237.16,238.46,239.74,241.2,242.83,244.46,246.0,247.38,248.92,250.46,251.81,253.35,254.94,256.07,257.0,257.84,258.86,259.76,260.83,261.82,262.98,264.32,265.76,267.17,268.53,269.72,270.99,272.35,273.76,275.27,276.62,278.09,279.64,281.0,282.28,283.54,284.66,285.68,286.85,288.17,289.65,291.07,292.46,293.73,294.98,296.19,297.33,298.61,299.9,301.12,302.36,303.48,304.69,305.85,306.94,308.03,309.01],"ma150":[176.34,176.36,176.38,176.39,176.36,176.35,176.4,176.43,176.48,176.5,176.48,176.49,176.49,176.51,176.56,176.61,176.6,176.57,176.5,176.43,176.38,176.32,176.22,176.11,176.02,175.89,175.91,175.89,175.9,175.96,176.02,176.06,176.07,176.03,176.0,175.99,176.0,176.02,176.01,176.0,175.98,175.98,176.0,176.01,176.01,175.91,175.83,175.74,175.69,175.64,175.66,175.66,175.68,175.72,175.72,175.75,175.78,175.8,175.86,175.92,175.97,176.01,176.04,176.07,176.08,176.09,176.12,176.13,176.18,176.22,176.26,176.29,176.29,176.25,176.21,176.12,176.0,175.92,175.88,175.88,175.89,175.88,175.87,175.94,176.04,176.09,176.12,176.17,176.22,176.28,176.34,176.39,176.45,176.51,176.57,176.6,176.57,176.55,176.57,176.54,176.51,176.56,176.61,176.61,176.57,176.55,176.54,176.56,176.59,176.67,176.74,176.82,176.85,176.9,176.96,177.04,177.1,177.16,177.19,177.27,177.35,177.4,177.46,177.54,177.62,177.74,177.97,178.21,178.42,178.61,178.86,179.07,179.39,179.71,180.14,180.56,180.98,181.43,181.88,182.32,182.76,183.16,183.56,184.0,184.42,184.86,185.34,185.84,186.34,186.89,187.39,187.86,188.31,188.72,189.24,189.77,190.32,190.9,191.48,192.08,192.67,193.25,193.84,194.47,195.13,195.77,196.49,197.28,198.11,198.97,199.76,200.6,201.49,202.37,203.31,204.28,205.12,205.94,206.73,207.55,208.4,209.31,210.22,211.22,212.32,213.43,214.48,215.53,216.54,217.57,218.63,219.67,220.71,221.7,222.72,223.84,224.89,225.94,226.93,227.91,228.79,229.71,230.65,231.61,232.61,233.58,234.53,235.5,236.44,237.37,238.32,239.28,240.25,241.28,242.32,243.38,244.44,245.49,246.54,247.57],"ma200":[177.33,177.33,177.32,177.32,177.26,177.2,177.15,177.1,177.06,177.0,176.93,176.89,176.84,176.8,176.78,176.76,176.7,176.64,176.54,176.43,176.32,176.24,176.11,175.95,175.82,175.66,175.56,175.44,175.31,175.19,175.05,174.91,174.75,174.57,174.4,174.23,174.08,173.95,173.8,173.67,173.54,173.42,173.32,173.23,173.16,173.03,172.89,172.75,172.67,172.63,172.62,172.59,172.57,172.55,172.51,172.52,172.57,172.62,172.69,172.73,172.77,172.82,172.84,172.87,172.9,172.92,172.96,173.0,173.06,173.13,173.18,173.21,173.27,173.34,173.39,173.4,173.44,173.49,173.55,173.66,173.81,173.95,174.07,174.19,174.3,174.39,174.47,174.55,174.63,174.71,174.81,174.91,175.01,175.12,175.22,175.34,175.46,175.58,175.71,175.84,175.98,176.14,176.31,176.46,176.58,176.73,176.87,177.02,177.19,177.37,177.55,177.74,177.93,178.13,178.32,178.5,178.65,178.77,178.91,179.08,179.28,179.46,179.61,179.76,179.93,180.08,180.32,180.58,180.87,181.17,181.48,181.78,182.1,182.46,182.89,183.3,183.69,184.1,184.52,184.92,185.32,185.68,186.04,186.39,186.73,187.02,187.26,187.52,187.8,188.07,188.32,188.59,188.86,189.08,189.32,189.56,189.84,190.13,190.43,190.76,191.07,191.37,191.64,191.96,192.34,192.71,193.13,193.58,194.01,194.45,194.86,195.28,195.71,196.11,196.55,197.04,197.49,197.9,198.28,198.68,199.09,199.51,200.0,200.53,201.19,201.86,202.53,203.2,203.84,204.48,205.16,205.81,206.49,207.16,207.84,208.56,209.25,209.95,210.64,211.33,211.96,212.61,213.28,213.96,214.69,215.44,216.17,216.92,217.66,218.39,219.16,219.91,220.66,221.44,222.22,223.0,223.83,224.69,225.59,226.48],"rs_line":[1.0,1.00301,1.01658,1.01985,1.00043,0.99781,1.0106,0.99838,0.99533,0.98153,0.96902,0.97986,0.97543,0.98515,0.98924,1.00348,0.98239,0.96698,0.93861,0.93337,0.94653,0.94046,0.95041,0.97717,0.98885,0.98668,0.98112,0.98983,0.9977,1.00095,0.98641,0.98862,0.97363,0.9746,0.9755,0.98446,0.98709,0.99445,0.9854,0.97706,0.96962,0.97416,0.97772,0.98479,0.988,0.91002,0.92117,0.91423,0.91479,0.91625,0.94875,0.93616,0.94168,0.94313,0.93193,0.97508,0.9857,0.97869,0.98357,0.98588,0.97963,0.9801,0.96063,0.94027,0.94994,0.95692,0.9757,0.98992,0.99753,0.9936,0.9796,0.98457,0.98671,0.99125,0.97322,0.94324,0.92444,0.92387,0.94399,0.95272,0.96888,0.95951,0.95723,0.96826,0.96491,0.95605,0.94365,0.95141,0.95429,0.97164,0.97781,0.98357,0.98388,0.98284,0.99017,1.01598,1.02094,1.00917,1.01774,1.01807,1.01486,1.03338,1.04,1.01971,1.02105,1.03648,1.03947,1.04002,1.04279,1.05995,1.05964,1.06163,1.05215,1.05615,1.06429,1.0613,1.05769,1.04846,1.05494,1.07058,1.088,1.0772,1.07609,1.09372,1.10629,1.10651,1.19976,1.19785,1.21429,1.20611,1.23303,1.22753,1.22361,1.22707,1.27306,1.27309,1.26672,1.27334,1.28523,1.26735,1.27157,1.25283,1.25223,1.24818,1.23048,1.2218,1.2276,1.23063,1.23075,1.25153,1.23431,1.21871,1.20606,1.21541,1.23308,1.24241,1.26466,1.27419,1.2766,1.27954,1.25128,1.26378,1.2623,1.28552,1.31648,1.30569,1.33783,1.3858,1.38087,1.38953,1.37621,1.40445,1.42263,1.39314,1.42514,1.42751,1.40564,1.38803,1.37762,1.43385,1.44275,1.4777,1.48516,1.51955,1.59156,1.60232,1.57482,1.56548,1.5481,1.54965,1.56678,1.55475,1.56983,1.53722,1.55469,1.56024,1.52122,1.52217,1.51858,1.51491,1.48363,1.50063,1.51541,1.5193,1.53352,1.52809,1.52481,1.52749,1.53014,1.53789,1.54251,1.54202,1.51952,1.56263,1.58014,1.58483,1.5996,1.62063,1.62805,1.60842],"rs_score":0.55481},{"ticker":"AMD","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[100.75,101.67,98.85,100.31,96.63,96.76,100.79,98.11,100.97,104.59,103.51,106.23,107.14,106.44,113.85,114.81,110.19,106.65,103.22,102.74,102.78,102.96,93.8,85.76,83.64,78.21,96.84,88.7,93.4,94.5,95.29,88.29,87.5,85.56,86.26,90.39,94.47,96.65,96.39,96.06,97.35,96.65,98.8,100.59,98.62,100.36,101.7,102.84,108.12,112.46,117.72,114.99,117.17,114.74,113.51,112.06,110.71,110.31,114.56,112.86,113.03,110.73,114.63,117.31,118.58,115.69,116.19,121.73,123.24,121.14,118.5,116.16,126.39,127.1,126.79,128.24,129.58,138.43,143.4,143.68,143.81,141.9,136.11,138.52,137.91,134.8,137.82,138.41,144.16,146.42,146.24,155.61,160.08,160.41,156.99,157.0,154.72,158.65,162.12,166.47,173.66,177.44,179.51,176.31,171.7,176.78,174.31,163.12,172.4,172.76,172.28,174.95,184.42,180.95,177.51,176.14,166.55,165.2,163.71,167.76,163.36,166.62,167.13,168.58,162.63,162.32,162.13,161.79,151.14,151.41,155.82,159.54,155.67,158.57,161.16,160.46,159.16,157.92,157.39,159.79,160.9,160.88,161.27,159.46,161.36,161.79,164.01,169.73,164.67,203.71,211.51,235.56,232.89,214.9,216.42,218.09,238.6,234.56,233.08,240.56,238.03,230.23,234.99,252.92,259.67,258.01,264.33,254.84,256.12,259.65,250.05,256.33,237.7,233.54,243.98,237.52,258.89,247.96,246.81,240.52,230.29,223.55,206.02,203.78,215.05,206.13,214.24,217.53,219.76,215.24,217.6,215.98,217.97,221.11,221.62,221.42,221.43,210.78,207.58,209.17,198.11,201.06,213.43,214.95,214.9,215.04,214.99,215.61,215.34,214.16,223.47,221.08,214.35,210.02,204.68,203.17,207.69,220.97,223.6,227.92],"ma50":[116.04,115.65,115.24,114.87,114.31,113.72,113.23,112.69,112.26,111.94,111.59,111.21,110.76,110.34,110.19,110.16,110.02,109.83,109.49,109.18,108.81,108.42,107.82,107.08,106.29,105.56,105.21,104.64,104.13,103.7,103.32,102.69,102.2,101.71,101.29,100.88,100.55,100.25,99.94,99.6,99.26,98.9,98.59,98.39,98.2,98.13,98.07,98.13,98.3,98.58,98.92,99.19,99.56,99.84,100.18,100.49,100.69,100.93,101.2,101.37,101.56,101.65,101.8,102.01,102.11,102.13,102.25,102.55,102.95,103.32,103.63,103.9,104.55,105.37,106.24,107.24,107.89,108.89,109.89,110.87,111.84,112.91,113.89,114.94,115.98,116.87,117.73,118.57,119.52,120.53,121.51,122.69,123.91,125.11,126.28,127.41,128.47,129.59,130.67,131.75,132.87,134.11,135.36,136.59,137.76,139.05,140.32,141.38,142.54,143.73,144.92,146.2,147.6,148.87,150.05,151.26,152.27,153.14,153.95,154.88,155.77,156.78,157.6,158.43,159.15,159.83,160.48,160.94,161.1,161.25,161.49,161.85,162.24,162.64,163.1,163.62,164.04,164.43,164.7,164.97,165.26,165.37,165.39,165.37,165.46,165.55,165.74,165.96,166.01,166.76,167.51,168.68,169.74,170.52,171.41,172.24,173.52,174.95,176.16,177.52,178.84,179.94,180.95,182.39,184.03,185.67,187.63,189.42,191.27,193.11,194.84,196.63,198.05,199.35,200.97,202.48,204.41,206.13,208.05,209.83,211.32,212.6,213.61,214.51,215.59,216.5,217.6,218.8,220.04,221.15,222.29,223.39,224.52,225.76,226.96,228.15,229.3,230.12,230.98,231.09,230.82,230.13,229.74,229.74,229.71,229.65,229.18,228.8,228.45,227.92,227.63,227.44,227.03,226.17,225.07,223.98,222.84,222.17,221.52,220.88],"ma150":[136.75,136.5,136.24,135.94,135.7,135.46,135.24,135.02,134.84,134.63,134.42,134.22,133.99,133.76,133.54,133.31,133.01,132.68,132.32,131.99,131.64,131.33,130.95,130.55,130.14,129.67,129.4,129.05,128.74,128.48,128.19,127.83,127.41,126.98,126.54,126.13,125.75,125.41,125.0,124.61,124.21,123.8,123.38,122.93,122.49,122.07,121.68,121.3,120.94,120.55,120.19,119.81,119.45,119.12,118.76,118.4,118.09,117.79,117.51,117.22,116.92,116.64,116.38,116.14,115.89,115.59,115.26,115.08,114.94,114.8,114.66,114.49,114.36,114.21,114.07,113.94,113.85,113.84,113.87,113.93,113.96,113.98,113.97,113.98,113.97,113.93,113.93,113.95,113.99,114.02,114.05,114.13,114.25,114.4,114.57,114.77,114.93,115.12,115.35,115.62,115.94,116.32,116.72,117.1,117.41,117.75,118.08,118.33,118.67,119.01,119.36,119.69,120.05,120.41,120.78,121.18,121.51,121.84,122.13,122.46,122.74,123.03,123.32,123.63,123.89,124.21,124.53,124.82,125.04,125.27,125.55,125.82,126.11,126.43,126.79,127.12,127.44,127.75,128.05,128.37,128.68,128.98,129.3,129.62,129.98,130.36,130.76,131.23,131.66,132.36,133.1,133.99,134.89,135.65,136.45,137.26,138.18,139.09,139.97,140.87,141.77,142.6,143.45,144.43,145.4,146.35,147.38,148.37,149.39,150.43,151.42,152.44,153.4,154.38,155.45,156.51,157.59,158.66,159.68,160.65,161.55,162.45,163.24,164.03,164.89,165.66,166.46,167.27,168.09,168.88,169.68,170.48,171.27,172.08,172.9,173.71,174.5,175.22,175.89,176.53,177.07,177.64,178.28,178.95,179.63,180.31,181.01,181.71,182.38,183.06,183.79,184.53,185.19,185.81,186.39,186.97,187.58,188.24,188.91,189.62],"ma200":[143.35,143.06,142.74,142.42,142.08,141.74,141.41,141.1,140.77,140.44,140.13,139.83,139.53,139.24,139.01,138.76,138.47,138.17,137.88,137.6,137.31,137.03,136.7,136.34,135.98,135.56,135.24,134.88,134.55,134.23,133.91,133.54,133.19,132.8,132.41,132.0,131.58,131.18,130.74,130.31,129.89,129.47,129.08,128.79,128.5,128.25,127.97,127.72,127.54,127.41,127.3,127.17,127.07,126.92,126.82,126.72,126.6,126.5,126.43,126.31,126.21,126.08,125.94,125.83,125.68,125.52,125.32,125.15,124.98,124.82,124.64,124.47,124.35,124.25,124.16,124.06,124.02,124.01,124.03,124.08,124.1,124.1,124.03,123.97,123.9,123.81,123.75,123.7,123.63,123.59,123.53,123.52,123.51,123.48,123.44,123.4,123.38,123.37,123.37,123.35,123.36,123.38,123.43,123.49,123.51,123.56,123.65,123.69,123.77,123.85,123.92,124.03,124.18,124.32,124.43,124.51,124.51,124.59,124.69,124.82,124.94,125.06,125.17,125.26,125.34,125.41,125.5,125.62,125.68,125.76,125.85,125.95,126.04,126.14,126.26,126.35,126.46,126.57,126.67,126.76,126.85,126.94,127.04,127.14,127.29,127.46,127.63,127.83,128.02,128.4,128.84,129.41,129.98,130.45,130.91,131.37,131.94,132.49,133.04,133.64,134.23,134.75,135.28,135.91,136.59,137.3,138.04,138.73,139.41,140.12,140.76,141.43,142.0,142.56,143.16,143.77,144.5,145.15,145.79,146.41,146.99,147.51,147.98,148.45,148.99,149.47,149.98,150.51,151.05,151.56,152.08,152.59,153.1,153.66,154.22,154.81,155.39,155.95,156.49,157.04,157.53,158.03,158.6,159.17,159.77,160.36,160.93,161.52,162.09,162.63,163.23,163.81,164.34,164.86,165.32,165.76,166.25,166.82,167.42,168.05],"rs_line":[1.0,0.9984,0.98825,0.99726,0.98696,0.99657,1.0326,1.01872,1.0272,1.05589,1.0564,1.07248,1.08481,1.0806,1.1355,1.14233,1.1096,1.07682,1.0636,1.0516,1.04905,1.04427,1.00068,0.9718,0.94947,0.90196,1.01067,0.96814,1.00157,1.00363,1.01486,0.96168,0.95172,0.95331,0.93674,0.96661,0.98941,1.00498,1.0019,0.99222,1.00514,0.99089,0.99812,1.02207,1.01049,1.02402,1.03051,1.04339,1.06187,1.09725,1.1471,1.11505,1.12904,1.10442,1.09626,1.10081,1.08712,1.09063,1.10959,1.09948,1.09681,1.07569,1.10734,1.1268,1.13931,1.11694,1.11037,1.16226,1.17004,1.1534,1.12379,1.11406,1.20075,1.2179,1.21511,1.23554,1.23624,1.30624,1.35238,1.34451,1.33907,1.315,1.26175,1.27829,1.26271,1.2435,1.27206,1.26989,1.31893,1.34433,1.34012,1.4321,1.46833,1.46241,1.43228,1.42966,1.4087,1.43229,1.46314,1.49608,1.56109,1.59928,1.61998,1.59709,1.58125,1.60366,1.58931,1.47598,1.56125,1.55241,1.55116,1.55861,1.63737,1.60642,1.57957,1.56772,1.49046,1.48231,1.47486,1.48849,1.45586,1.47872,1.47987,1.48744,1.44355,1.45156,1.44204,1.42709,1.33702,1.33613,1.37188,1.40058,1.35534,1.38105,1.39618,1.39203,1.38247,1.36532,1.35778,1.372,1.38909,1.39335,1.4032,1.37955,1.39207,1.39055,1.40484,1.45216,1.40889,1.73668,1.80989,2.00374,1.98678,1.88424,1.86889,1.88561,2.05382,2.03289,2.00866,2.05179,2.03024,1.97397,2.00291,2.13826,2.16972,2.15014,2.20175,2.14631,2.15004,2.17559,2.12028,2.16603,2.03039,1.99289,2.04999,1.99115,2.16909,2.11257,2.10312,2.0688,1.99758,1.93165,1.80773,1.77044,1.84126,1.74844,1.80477,1.82254,1.84966,1.80827,1.82179,1.8069,1.8201,1.85188,1.85775,1.84385,1.83965,1.7702,1.74597,1.76416,1.68947,1.70178,1.79554,1.79713,1.78854,1.78343,1.7832,1.79474,1.79468,1.79817,1.87291,1.84062,1.77403,1.74382,1.69965,1.67603,1.71063,1.82366,1.85448,1.88517],"rs_score":0.77428},{"ticker":"GE","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[198.77,202.5,196.05,193.85,192.12,191.72,195.0,192.42,197.11,202.03,200.79,205.57,203.93,204.13,210.23,212.13,207.37,205.88,199.88,200.15,203.79,199.77,187.63,166.81,167.7,169.37,187.27,181.51,181.67,186.0,185.67,182.45,181.79,178.35,189.18,193.61,197.41,198.43,200.86,200.5,201.54,203.61,207.7,208.94,208.6,209.92,214.49,214.96,218.95,221.58,223.24,229.38,231.78,235.29,235.26,233.54,230.27,232.79,241.78,243.67,244.16,245.91,247.48,248.87,250.88,251.92,255.63,251.41,242.0,245.52,239.99,236.6,236.54,235.75,235.89,239.37,247.81,248.75,249.9,251.0,254.51,257.39,249.02,244.75,246.88,248.65,247.05,250.33,252.57,255.42,262.34,264.67,266.18,260.28,263.27,262.86,259.0,263.18,268.01,271.59,270.61,270.31,273.55,271.08,269.38,276.23,272.12,272.28,272.02,275.01,275.2,279.63,268.86,269.7,267.85,268.45,265.93,266.44,268.71,266.53,266.61,273.94,273.35,276.0,275.2,275.39,275.93,282.27,279.23,276.05,276.24,283.41,281.56,281.69,286.78,292.97,289.5,297.09,301.14,301.02,305.63,300.3,297.18,294.98,293.63,300.82,300.88,299.45,297.0,298.22,301.74,302.56,299.35,291.49,297.53,300.08,300.12,299.84,300.14,302.68,306.63,297.89,306.39,303.87,312.84,309.79,314.28,310.75,308.95,308.62,304.2,305.11,305.27,307.27,311.94,310.72,309.02,304.17,304.82,300.13,296.01,300.82,290.62,287.44,294.05,293.44,296.62,298.45,288.45,289.32,288.49,291.86,283.94,287.19,285.31,283.6,288.42,299.81,300.98,298.73,292.18,301.69,307.21,314.73,315.53,316.75,315.14,311.58,311.79,308.03,320.75,324.32,327.54,323.64,314.44,321.59,324.17,327.23,318.88,319.94],"ma50":[190.06,190.91,191.53,192.04,192.51,192.91,193.37,193.81,194.39,195.1,195.74,196.41,197.04,197.68,198.43,199.24,199.95,200.53,200.92,201.33,201.75,202.0,201.98,201.3,200.72,200.22,200.08,199.72,199.25,198.9,198.53,198.13,197.68,197.12,196.8,196.57,196.34,196.12,195.97,195.81,195.64,195.5,195.48,195.66,195.86,196.07,196.33,196.6,196.84,197.23,197.72,198.26,198.98,199.8,200.67,201.5,202.21,203.02,203.91,204.74,205.61,206.42,207.29,208.18,209.0,209.79,210.76,211.67,212.51,213.42,214.14,214.88,215.86,217.23,218.6,220.0,221.21,222.55,223.92,225.22,226.6,228.09,229.44,230.77,231.92,233.02,234.01,235.05,236.09,237.18,238.4,239.62,240.79,241.82,242.91,243.97,244.86,245.83,246.81,247.81,248.75,249.57,250.41,251.12,251.81,252.66,253.5,254.29,254.89,255.52,256.14,256.81,257.24,257.66,258.0,258.33,258.53,258.83,259.37,259.79,260.32,261.07,261.8,262.61,263.4,264.12,264.68,265.35,265.94,266.44,266.87,267.39,268.04,268.78,269.58,270.47,271.31,272.25,273.22,274.13,275.0,275.71,276.33,277.03,277.63,278.39,279.23,279.95,280.53,281.07,281.69,282.33,282.85,283.26,283.82,284.3,284.86,285.41,285.97,286.53,287.15,287.52,288.27,288.95,289.85,290.68,291.65,292.53,293.34,294.18,294.93,295.56,296.19,296.82,297.55,298.26,298.92,299.36,299.87,300.35,300.75,301.1,301.28,301.39,301.54,301.55,301.69,301.72,301.46,301.23,300.89,300.72,300.45,300.3,300.13,299.79,299.54,299.55,299.62,299.63,299.44,299.43,299.58,300.05,300.41,300.74,301.04,301.28,301.51,301.62,301.9,302.43,302.85,303.25,303.28,303.51,303.71,304.04,304.24,304.47],"ma150":[181.13,181.35,181.54,181.7,181.85,182.06,182.3,182.5,182.74,182.98,183.2,183.46,183.7,183.94,184.21,184.5,184.74,184.98,185.17,185.37,185.59,185.78,185.89,185.86,185.82,185.78,185.94,186.04,186.16,186.32,186.46,186.56,186.66,186.72,186.79,186.87,186.99,187.09,187.19,187.27,187.36,187.45,187.57,187.74,187.89,188.03,188.22,188.41,188.65,188.88,189.12,189.4,189.69,190.0,190.3,190.57,190.83,191.1,191.43,191.77,192.1,192.57,193.0,193.47,193.94,194.45,195.0,195.51,195.98,196.47,196.93,197.33,197.71,198.09,198.43,198.79,199.23,199.66,200.14,200.63,201.14,201.68,202.15,202.59,203.03,203.48,203.9,204.37,204.84,205.34,205.88,206.43,207.05,207.61,208.23,208.84,209.44,210.09,210.77,211.48,212.18,212.91,213.64,214.32,214.99,215.69,216.36,217.04,217.73,218.45,219.16,219.88,220.52,221.17,221.81,222.45,223.08,223.68,224.27,224.85,225.4,225.98,226.55,227.05,227.57,228.11,228.65,229.21,229.7,230.18,230.66,231.21,231.72,232.22,232.77,233.35,233.89,234.47,235.09,235.71,236.35,236.94,237.53,238.17,238.8,239.48,240.14,240.79,241.39,242.04,242.72,243.39,244.08,244.73,245.43,246.15,246.85,247.57,248.26,248.93,249.63,250.25,250.93,251.6,252.28,252.93,253.65,254.34,255.07,255.8,256.46,257.17,257.95,258.89,259.85,260.79,261.6,262.42,263.24,264.0,264.74,265.53,266.25,266.98,267.68,268.34,269.01,269.67,270.26,270.85,271.43,272.02,272.53,273.05,273.56,274.05,274.54,275.11,275.66,276.17,276.63,277.11,277.61,278.14,278.68,279.23,279.8,280.32,280.79,281.22,281.73,282.25,282.79,283.29,283.71,284.17,284.63,285.14,285.65,286.15],"ma200":[176.39,176.58,176.75,176.92,177.09,177.24,177.41,177.55,177.7,177.87,178.05,178.26,178.45,178.67,178.91,179.16,179.39,179.61,179.8,180.0,180.21,180.43,180.59,180.61,180.62,180.64,180.76,180.86,180.97,181.1,181.22,181.34,181.46,181.54,181.67,181.84,182.01,182.18,182.36,182.55,182.76,182.98,183.21,183.47,183.72,183.97,184.23,184.45,184.73,185.01,185.28,185.58,185.9,186.23,186.55,186.92,187.28,187.63,188.03,188.42,188.81,189.2,189.6,190.0,190.41,190.82,191.24,191.65,192.0,192.38,192.73,193.05,193.38,193.7,194.01,194.34,194.75,195.17,195.6,196.05,196.49,196.94,197.36,197.73,198.08,198.41,198.75,199.08,199.41,199.75,200.12,200.49,200.88,201.26,201.65,202.02,202.38,202.77,203.19,203.61,204.03,204.45,204.87,205.28,205.67,206.09,206.5,206.9,207.3,207.71,208.11,208.63,209.06,209.51,209.96,210.42,210.88,211.34,211.83,212.3,212.77,213.27,213.73,214.22,214.67,215.12,215.59,216.08,216.59,217.08,217.58,218.11,218.62,219.14,219.67,220.23,220.75,221.34,221.93,222.53,223.16,223.75,224.37,224.97,225.58,226.23,226.89,227.56,228.21,228.88,229.56,230.27,230.94,231.56,232.2,232.84,233.48,234.13,234.79,235.47,236.16,236.79,237.46,238.12,238.82,239.51,240.22,240.89,241.54,242.18,242.79,243.37,243.96,244.49,245.07,245.65,246.22,246.75,247.24,247.73,248.19,248.68,249.11,249.52,249.96,250.4,250.84,251.28,251.68,252.09,252.48,252.89,253.26,253.7,254.13,254.56,254.99,255.48,255.95,256.44,256.9,257.4,257.95,258.56,259.18,259.8,260.4,261.0,261.57,262.1,262.7,263.29,263.91,264.51,265.03,265.58,266.16,266.77,267.36,267.96],"rs_line":[1.0,1.00793,0.99346,0.97684,0.99461,1.00086,1.01261,1.01272,1.0164,1.0338,1.03868,1.05195,1.04659,1.05042,1.06278,1.06981,1.05844,1.05363,1.04395,1.03839,1.0543,1.027,1.01459,0.9581,0.96493,0.99004,0.99064,1.00417,0.98744,1.00126,1.00229,1.0073,1.00223,1.00724,1.04131,1.04943,1.04797,1.04583,1.05823,1.04972,1.05475,1.05808,1.06355,1.07607,1.08337,1.08566,1.10162,1.10544,1.08994,1.0958,1.1026,1.12742,1.13204,1.14793,1.15166,1.16283,1.1461,1.1666,1.18698,1.20322,1.2009,1.21086,1.21176,1.21166,1.22177,1.2328,1.23824,1.2167,1.16456,1.18487,1.1536,1.15016,1.13904,1.14502,1.14587,1.16896,1.19834,1.18974,1.19457,1.19051,1.20119,1.20901,1.17007,1.14482,1.14575,1.16263,1.15578,1.16414,1.17126,1.18865,1.21853,1.23463,1.23753,1.20274,1.21745,1.21326,1.19527,1.20431,1.22601,1.23716,1.23301,1.2349,1.25127,1.24464,1.25745,1.27012,1.2576,1.24877,1.24862,1.25258,1.25593,1.2627,1.20993,1.2136,1.2081,1.21107,1.20625,1.21178,1.22703,1.19866,1.20432,1.23227,1.22683,1.23435,1.23815,1.24826,1.24396,1.262,1.25203,1.23474,1.23274,1.26109,1.24254,1.24353,1.25929,1.28825,1.27457,1.3019,1.31679,1.31007,1.33741,1.31828,1.31063,1.29352,1.28399,1.31049,1.3063,1.2986,1.28799,1.28866,1.30873,1.3045,1.29441,1.29544,1.3023,1.31507,1.30943,1.31718,1.31105,1.30854,1.32564,1.29458,1.32367,1.30214,1.32495,1.30856,1.32688,1.32657,1.31457,1.31071,1.30744,1.30682,1.32169,1.32904,1.3285,1.32029,1.31233,1.31353,1.31656,1.30849,1.30146,1.31751,1.29254,1.26579,1.27612,1.2616,1.26653,1.26743,1.23058,1.23201,1.22423,1.23763,1.20176,1.21918,1.21225,1.19704,1.21456,1.27625,1.28316,1.27706,1.26296,1.29429,1.30999,1.33375,1.33106,1.33152,1.32489,1.31461,1.3171,1.31093,1.36257,1.36862,1.37403,1.36206,1.32348,1.34468,1.35334,1.36885,1.34051,1.34132],"rs_score":0.61997}],"analyst_panel":[{"ticker":"VZ","consensus":"Hold","analyst_count":60,"target_consensus":47.0,"target_high":49.0,"target_low":44.0},{"ticker":"GS","consensus":"Hold","analyst_count":54,"target_consensus":821.25,"target_high":1048.0,"target_low":604.0},{"ticker":"MA","consensus":"Buy","analyst_count":63,"target_consensus":674.36,"target_high":735.0,"target_low":610.0},{"ticker":"JPM","consensus":"Buy","analyst_count":60,"target_consensus":326.33,"target_high":391.0,"target_low":245.0},{"ticker":"AAPL","consensus":"Buy","analyst_count":109,"target_consensus":299.08,"target_high":350.0,"target_low":220.0},{"ticker":"NVDA","consensus":"Buy","analyst_count":79,"target_consensus":264.34,"target_high":352.0,"target_low":140.0},{"ticker":"ABBV","consensus":"Buy","analyst_count":39,"target_consensus":258.63,"target_high":289.0,"target_low":240.0},{"ticker":"LLY","consensus":"Buy","analyst_count":44,"target_consensus":1151.07,"target_high":1300.0,"target_low":830.0},{"ticker":"CVX","consensus":"Buy","analyst_count":51,"target_consensus":175.7,"target_high":206.0,"target_low":158.0},{"ticker":"XOM","consensus":"Hold","analyst_count":53,"target_consensus":142.22,"target_high":158.0,"target_low":126.0}],"records":[{"ticker":"VZ","momentum_12_1":0.06583,"quality_raw":0.219,"value_raw":0.37159,"composite_score":0.8498,"rs_score":-0.16081,"ma_50":40.48,"ma_150":41.84,"ma_200":42.26,"sepa_pass":false,"rank":1,"action":"BUY"},{"ticker":"GS","momentum_12_1":0.55651,"quality_raw":0.2535,"value_raw":0.21986,"composite_score":0.70244,"rs_score":0.51842,"ma_50":860.44,"ma_150":779.38,"ma_200":725.01,"sepa_pass":true,"rank":2,"action":"BUY"},{"ticker":"MA","momentum_12_1":0.11809,"quality_raw":1.2235,"value_raw":0.02157,"composite_score":0.69147,"rs_score":-0.12296,"ma_50":556.73,"ma_150":565.66,"ma_200":562.34,"sepa_pass":false,"rank":3,"action":"BUY"},{"ticker":"JPM","momentum_12_1":0.29317,"quality_raw":0.3005,"value_raw":0.22092,"composite_score":0.52395,"rs_score":0.06098,"ma_50":314.93,"ma_150":302.76,"ma_200":289.52,"sepa_pass":false,"rank":4,"action":"BUY"},{"ticker":"AAPL","momentum_12_1":0.17503,"quality_raw":1.0155,"value_raw":0.02402,"composite_score":0.48965,"rs_score":-0.08216,"ma_50":271.8,"ma_150":244.37,"ma_200":233.89,"sepa_pass":false,"rank":5,"action":"BUY"},{"ticker":"NVDA","momentum_12_1":0.33796,"quality_raw":0.853,"value_raw":0.02413,"composite_score":0.43352,"rs_score":0.23014,"ma_50":184.81,"ma_150":178.1,"ma_200":163.68,"sepa_pass":false,"rank":6,"action":"BUY"},{"ticker":"ABBV","momentum_12_1":0.29564,"quality_raw":0.8675,"value_raw":0.01291,"composite_score":0.36536,"rs_score":0.04566,"ma_50":226.2,"ma_150":213.89,"ma_200":206.83,"sepa_pass":false,"rank":7,"action":"BUY"},{"ticker":"LLY","momentum_12_1":0.42593,"quality_raw":0.724,"value_raw":0.02195,"composite_score":0.34121,"rs_score":0.19768,"ma_50":1039.66,"ma_150":859.99,"ma_200":838.54,"sepa_pass":false,"rank":8,"action":"BUY"},{"ticker":"CVX","momentum_12_1":-0.04525,"quality_raw":0.08585,"value_raw":0.31481,"composite_score":0.33705,"rs_score":-0.13001,"ma_50":153.36,"ma_150":153.47,"ma_200":150.06,"sepa_pass":false,"rank":9,"action":"BUY"},{"ticker":"XOM","momentum_12_1":0.07328,"quality_raw":0.1125,"value_raw":0.27562,"composite_score":0.31401,"rs_score":-0.01212,"ma_50":118.89,"ma_150":114.1,"ma_200":112.05,"sepa_pass":false,"rank":10,"action":"BUY"},{"ticker":"GOOGL","momentum_12_1":0.62512,"quality_raw":0.3295,"value_raw":0.06403,"composite_score":0.20134,"rs_score":0.56559,"ma_50":308.31,"ma_150":246.83,"ma_200":225.5,"sepa_pass":true,"rank":11,"action":"BUY"},{"ticker":"GOOG","momentum_12_1":0.61905,"quality_raw":0.3295,"value_raw":0.06336,"composite_score":0.19292,"rs_score":0.55481,"ma_50":309.01,"ma_150":247.57,"ma_200":226.48,"sepa_pass":true,"rank":12,"action":"BUY"},{"ticker":"AMD","momentum_12_1":0.7881,"quality_raw":0.0951,"value_raw":0.09453,"composite_score":0.18269,"rs_score":0.77428,"ma_50":220.88,"ma_150":189.62,"ma_200":168.05,"sepa_pass":true,"rank":13,"action":"BUY"},{"ticker":"GE","momentum_12_1":0.7018,"quality_raw":0.3135,"value_raw":0.03928,"composite_score":0.14671,"rs_score":0.61997,"ma_50":304.47,"ma_150":286.15,"ma_200":267.96,"sepa_pass":true,"rank":14,"action":"BUY"},{"ticker":"RTX","momentum_12_1":0.52432,"quality_raw":0.1155,"value_raw":0.13666,"composite_score":0.14419,"rs_score":0.48361,"ma_50":179.55,"ma_150":164.68,"ma_200":156.13,"sepa_pass":true,"rank":15,"action":"BUY"},{"ticker":"HD","momentum_12_1":-0.09112,"quality_raw":0.8795,"value_raw":0.03578,"composite_score":0.12102,"rs_score":-0.2237,"ma_50":356.23,"ma_150":376.89,"ma_200":373.37,"sepa_pass":false,"rank":16,"action":"BUY"},{"ticker":"CAT","momentum_12_1":0.58721,"quality_raw":0.32,"value_raw":0.05119,"composite_score":0.09983,"rs_score":0.55272,"ma_50":584.45,"ma_150":490.2,"ma_200":448.85,"sepa_pass":true,"rank":17,"action":"BUY"},{"ticker":"AMAT","momentum_12_1":0.50458,"quality_raw":0.3195,"value_raw":0.05683,"composite_score":0.04692,"rs_score":0.64846,"ma_50":258.21,"ma_150":213.57,"ma_200":198.69,"sepa_pass":true,"rank":18,"action":"BUY"},{"ticker":"ABT","momentum_12_1":0.1367,"quality_raw":0.25,"value_raw":0.14949,"composite_score":0.01238,"rs_score":-0.09604,"ma_50":126.03,"ma_150":129.51,"ma_200":129.93,"sepa_pass":false,"rank":19,"action":"BUY"},{"ticker":"MRK","momentum_12_1":0.00612,"quality_raw":0.4015,"value_raw":0.12914,"composite_score":-0.00155,"rs_score":-0.07543,"ma_50":100.38,"ma_150":88.87,"ma_200":86.5,"sepa_pass":false,"rank":20,"action":"BUY"},{"ticker":"V","momentum_12_1":0.12229,"quality_raw":0.589,"value_raw":0.04294,"composite_score":-0.02153,"rs_score":-0.1285,"ma_50":339.15,"ma_150":344.04,"ma_200":345.05,"sepa_pass":false,"rank":21,"action":"HOLD"},{"ticker":"AVGO","momentum_12_1":0.51228,"quality_raw":0.314,"value_raw":0.03159,"composite_score":-0.06003,"rs_score":0.33754,"ma_50":358.39,"ma_150":327.14,"ma_200":297.15,"sepa_pass":false,"rank":22,"action":"HOLD"},{"ticker":"CSCO","momentum_12_1":0.31889,"quality_raw":0.23,"value_raw":0.09775,"composite_score":-0.06459,"rs_score":0.0793,"ma_50":76.25,"ma_150":71.08,"ma_200":68.35,"sepa_pass":false,"rank":23,"action":"HOLD"},{"ticker":"ORCL","momentum_12_1":0.18303,"quality_raw":0.505,"value_raw":0.03926,"composite_score":-0.08803,"rs_score":0.02555,"ma_50":207.11,"ma_150":240.1,"ma_200":217.51,"sepa_pass":false,"rank":24,"action":"HOLD"},{"ticker":"IBM","momentum_12_1":0.4175,"quality_raw":0.237,"value_raw":0.06252,"composite_score":-0.11421,"rs_score":0.17928,"ma_50":303.77,"ma_150":282.48,"ma_200":274.54,"sepa_pass":false,"rank":25,"action":"HOLD"},{"ticker":"MSFT","momentum_12_1":0.1423,"quality_raw":0.4055,"value_raw":0.06572,"composite_score":-0.13995,"rs_score":-0.09042,"ma_50":485.92,"ma_150":501.85,"ma_200":481.87,"sepa_pass":false,"rank":26,"action":"HOLD"},{"ticker":"KO","momentum_12_1":0.14394,"quality_raw":0.374,"value_raw":0.07292,"composite_score":-0.14801,"rs_score":-0.05299,"ma_50":70.47,"ma_150":69.36,"ma_200":69.9,"sepa_pass":false,"rank":27,"action":"HOLD"},{"ticker":"META","momentum_12_1":0.08963,"quality_raw":0.3635,"value_raw":0.07755,"composite_score":-0.19179,"rs_score":-0.14435,"ma_50":639.5,"ma_150":701.79,"ma_200":675.55,"sepa_pass":false,"rank":28,"action":"HOLD"},{"ticker":"DHR","momentum_12_1":-0.03825,"quality_raw":0.1377,"value_raw":0.1618,"composite_score":-0.23966,"rs_score":-0.17947,"ma_50":226.71,"ma_150":210.36,"ma_200":205.95,"sepa_pass":false,"rank":29,"action":"HOLD"},{"ticker":"NFLX","momentum_12_1":0.13194,"quality_raw":0.3555,"value_raw":0.04765,"composite_score":-0.28982,"rs_score":-0.12614,"ma_50":100.13,"ma_150":114.15,"ma_200":113.11,"sepa_pass":false,"rank":30,"action":"HOLD"},{"ticker":"TMO","momentum_12_1":0.03397,"quality_raw":0.162,"value_raw":0.12437,"composite_score":-0.30092,"rs_score":-0.06755,"ma_50":584.29,"ma_150":513.08,"ma_200":490.2,"sepa_pass":false,"rank":31,"action":"HOLD"},{"ticker":"PM","momentum_12_1":0.33713,"quality_raw":0.2035,"value_raw":0.04239,"composite_score":-0.31636,"rs_score":0.26754,"ma_50":156.64,"ma_150":163.36,"ma_200":164.78,"sepa_pass":false,"rank":32,"action":"HOLD"},{"ticker":"LIN","momentum_12_1":-0.02411,"quality_raw":0.2295,"value_raw":0.10996,"composite_score":-0.3297,"rs_score":-0.15919,"ma_50":419.76,"ma_150":451.05,"ma_200":451.99,"sepa_pass":false,"rank":33,"action":"HOLD"},{"ticker":"ADBE","momentum_12_1":-0.14916,"quality_raw":0.4595,"value_raw":0.06787,"composite_score":-0.33086,"rs_score":-0.45221,"ma_50":334.92,"ma_150":350.91,"ma_200":359.37,"sepa_pass":false,"rank":34,"action":"HOLD"},{"ticker":"PG","momentum_12_1":-0.09146,"quality_raw":0.2975,"value_raw":0.10308,"composite_score":-0.33445,"rs_score":-0.28362,"ma_50":144.84,"ma_150":151.82,"ma_200":154.87,"sepa_pass":false,"rank":35,"action":"HOLD"},{"ticker":"QCOM","momentum_12_1":0.12368,"quality_raw":0.2475,"value_raw":0.07048,"composite_score":-0.33804,"rs_score":-0.17737,"ma_50":172.63,"ma_150":164.83,"ma_200":159.91,"sepa_pass":false,"rank":36,"action":"HOLD"},{"ticker":"WMT","momentum_12_1":0.28638,"quality_raw":0.13715,"value_raw":0.06471,"composite_score":-0.35291,"rs_score":0.12389,"ma_50":110.6,"ma_150":103.69,"ma_200":101.54,"sepa_pass":false,"rank":37,"action":"HOLD"},{"ticker":"PEP","momentum_12_1":0.04326,"quality_raw":0.2705,"value_raw":0.06927,"composite_score":-0.38805,"rs_score":-0.17785,"ma_50":145.39,"ma_150":143.46,"ma_200":141.55,"sepa_pass":false,"rank":38,"action":"HOLD"},{"ticker":"CRM","momentum_12_1":-0.21314,"quality_raw":0.1805,"value_raw":0.13767,"composite_score":-0.44882,"rs_score":-0.46723,"ma_50":249.43,"ma_150":251.8,"ma_200":255.77,"sepa_pass":false,"rank":39,"action":"HOLD"},{"ticker":"TXN","momentum_12_1":-0.08026,"quality_raw":0.3325,"value_raw":0.06257,"composite_score":-0.45145,"rs_score":-0.21166,"ma_50":173.38,"ma_150":185.11,"ma_200":181.76,"sepa_pass":false,"rank":40,"action":"HOLD"},{"ticker":"AMZN","momentum_12_1":0.02195,"quality_raw":0.177,"value_raw":0.08427,"composite_score":-0.46303,"rs_score":-0.09525,"ma_50":233.57,"ma_150":227.33,"ma_200":218.99,"sepa_pass":false,"rank":41,"action":"HOLD"},{"ticker":"MCD","momentum_12_1":0.13193,"quality_raw":0.2345,"value_raw":0.03821,"composite_score":-0.48385,"rs_score":-0.093,"ma_50":308.1,"ma_150":304.31,"ma_200":306.27,"sepa_pass":false,"rank":42,"action":"HOLD"},{"ticker":"UNH","momentum_12_1":-0.37268,"quality_raw":0.10655,"value_raw":0.18348,"composite_score":-0.49569,"rs_score":-0.56564,"ma_50":330.08,"ma_150":320.95,"ma_200":340.75,"sepa_pass":false,"rank":43,"action":"HOLD"},{"ticker":"INTU","momentum_12_1":0.04937,"quality_raw":0.1885,"value_raw":0.0651,"composite_score":-0.50445,"rs_score":-0.29999,"ma_50":650.75,"ma_150":692.23,"ma_200":683.04,"sepa_pass":false,"rank":44,"action":"HOLD"},{"ticker":"ACN","momentum_12_1":-0.21299,"quality_raw":0.21,"value_raw":0.11084,"composite_score":-0.52496,"rs_score":-0.36428,"ma_50":262.25,"ma_150":262.31,"ma_200":273.01,"sepa_pass":false,"rank":45,"action":"HOLD"},{"ticker":"COST","momentum_12_1":-0.06178,"quality_raw":0.1698,"value_raw":0.0468,"composite_score":-0.70838,"rs_score":-0.14594,"ma_50":897.0,"ma_150":935.58,"ma_200":950.5,"sepa_pass":false,"rank":46,"action":"HOLD"},{"ticker":"ADI","momentum_12_1":0.3065,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.21838,"ma_50":265.63,"ma_150":247.87,"ma_200":236.52,"sepa_pass":false,"rank":47,"action":"HOLD"},{"ticker":"AMGN","momentum_12_1":0.21793,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.04658,"ma_50":329.96,"ma_150":303.8,"ma_200":298.56,"sepa_pass":false,"rank":48,"action":"HOLD"},{"ticker":"ANET","momentum_12_1":0.09555,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.05257,"ma_50":129.64,"ma_150":129.84,"ma_200":118.53,"sepa_pass":false,"rank":49,"action":"HOLD"},{"ticker":"APH","momentum_12_1":0.84858,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.00622,"ma_50":137.82,"ma_150":121.04,"ma_200":110.42,"sepa_pass":true,"rank":50,"action":"HOLD"},{"ticker":"AXP","momentum_12_1":0.2737,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.00078,"ma_50":368.14,"ma_150":337.32,"ma_200":322.08,"sepa_pass":false,"rank":51,"action":"HOLD"},{"ticker":"BA","momentum_12_1":0.23039,"quality_raw":-0.102,"value_raw":null,"composite_score":null,"rs_score":0.29427,"ma_50":206.92,"ma_150":215.82,"ma_200":208.27,"sepa_pass":false,"rank":52,"action":"HOLD"},{"ticker":"BAC","momentum_12_1":0.20861,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.04071,"ma_50":54.09,"ma_150":50.72,"ma_200":48.33,"sepa_pass":false,"rank":53,"action":"HOLD"},{"ticker":"BKNG","momentum_12_1":0.14206,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.10234,"ma_50":5165.14,"ma_150":5369.13,"ma_200":5286.88,"sepa_pass":false,"rank":54,"action":"HOLD"},{"ticker":"BLK","momentum_12_1":0.12354,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.01185,"ma_50":1070.34,"ma_150":1096.73,"ma_200":1055.67,"sepa_pass":false,"rank":55,"action":"HOLD"},{"ticker":"BMY","momentum_12_1":-0.02601,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.17324,"ma_50":51.35,"ma_150":47.95,"ma_200":48.33,"sepa_pass":false,"rank":56,"action":"HOLD"},{"ticker":"BSX","momentum_12_1":-0.03617,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.24778,"ma_50":97.24,"ma_150":100.61,"ma_200":100.66,"sepa_pass":false,"rank":57,"action":"HOLD"},{"ticker":"BX","momentum_12_1":-0.1121,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.23929,"ma_50":150.16,"ma_150":159.82,"ma_200":153.96,"sepa_pass":false,"rank":58,"action":"HOLD"},{"ticker":"C","momentum_12_1":0.53469,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.40907,"ma_50":109.57,"ma_150":99.16,"ma_200":91.96,"sepa_pass":true,"rank":59,"action":"HOLD"},{"ticker":"CB","momentum_12_1":0.17739,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.05495,"ma_50":301.56,"ma_150":285.51,"ma_200":286.2,"sepa_pass":false,"rank":60,"action":"HOLD"},{"ticker":"COF","momentum_12_1":0.29824,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.09383,"ma_50":230.63,"ma_150":220.91,"ma_200":211.39,"sepa_pass":false,"rank":61,"action":"HOLD"},{"ticker":"COP","momentum_12_1":-0.10031,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.24576,"ma_50":92.2,"ma_150":92.83,"ma_200":91.96,"sepa_pass":false,"rank":62,"action":"HOLD"},{"ticker":"CRWD","momentum_12_1":0.40061,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.11829,"ma_50":499.53,"ma_150":481.39,"ma_200":466.05,"sepa_pass":false,"rank":63,"action":"HOLD"},{"ticker":"DE","momentum_12_1":0.12884,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.00234,"ma_50":477.79,"ma_150":484.49,"ma_200":484.21,"sepa_pass":false,"rank":64,"action":"HOLD"},{"ticker":"DIS","momentum_12_1":0.02192,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.1401,"ma_50":110.02,"ma_150":114.37,"ma_200":110.82,"sepa_pass":false,"rank":65,"action":"HOLD"},{"ticker":"ETN","momentum_12_1":-0.02037,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.20867,"ma_50":338.48,"ma_150":355.33,"ma_200":341.64,"sepa_pass":false,"rank":66,"action":"HOLD"},{"ticker":"GEV","momentum_12_1":0.78243,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.49106,"ma_50":622.4,"ma_150":601.88,"ma_200":550.54,"sepa_pass":true,"rank":67,"action":"HOLD"},{"ticker":"GILD","momentum_12_1":0.31626,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.1435,"ma_50":123.09,"ma_150":117.17,"ma_200":114.34,"sepa_pass":false,"rank":68,"action":"HOLD"},{"ticker":"HON","momentum_12_1":-0.09634,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.20495,"ma_50":196.98,"ma_150":209.76,"ma_200":210.4,"sepa_pass":false,"rank":69,"action":"HOLD"},{"ticker":"INTC","momentum_12_1":0.95365,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.32764,"ma_50":38.84,"ma_150":31.08,"ma_200":28.44,"sepa_pass":true,"rank":70,"action":"HOLD"},{"ticker":"ISRG","momentum_12_1":0.0383,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.18446,"ma_50":565.13,"ma_150":511.58,"ma_200":514.55,"sepa_pass":false,"rank":71,"action":"HOLD"},{"ticker":"JNJ","momentum_12_1":0.47959,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.32786,"ma_50":203.89,"ma_150":183.68,"ma_200":176.23,"sepa_pass":true,"rank":72,"action":"HOLD"},{"ticker":"KKR","momentum_12_1":-0.06154,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.27486,"ma_50":127.15,"ma_150":132.57,"ma_200":128.14,"sepa_pass":false,"rank":73,"action":"HOLD"},{"ticker":"KLAC","momentum_12_1":0.74701,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.01409,"ma_50":1238.6,"ma_150":1062.04,"ma_200":976.87,"sepa_pass":true,"rank":74,"action":"HOLD"},{"ticker":"LMT","momentum_12_1":-0.00008,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.00383,"ma_50":480.84,"ma_150":470.85,"ma_200":470.18,"sepa_pass":false,"rank":75,"action":"HOLD"},{"ticker":"LOW","momentum_12_1":-0.00959,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.08624,"ma_50":243.66,"ma_150":242.1,"ma_200":237.66,"sepa_pass":false,"rank":76,"action":"HOLD"},{"ticker":"LRCX","momentum_12_1":1.18892,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.70825,"ma_50":169.94,"ma_150":132.84,"ma_200":118.59,"sepa_pass":true,"rank":77,"action":"HOLD"},{"ticker":"MDT","momentum_12_1":0.15625,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.02774,"ma_50":98.36,"ma_150":94.13,"ma_200":91.69,"sepa_pass":false,"rank":78,"action":"HOLD"},{"ticker":"MS","momentum_12_1":0.42666,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.34548,"ma_50":173.97,"ma_150":157.3,"ma_200":147.97,"sepa_pass":true,"rank":79,"action":"HOLD"},{"ticker":"MU","momentum_12_1":1.4394,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":2.26855,"ma_50":263.18,"ma_150":184.52,"ma_200":160.01,"sepa_pass":true,"rank":80,"action":"HOLD"},{"ticker":"NEE","momentum_12_1":0.20109,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.02,"ma_50":82.32,"ma_150":77.64,"ma_200":75.46,"sepa_pass":false,"rank":81,"action":"SELL"},{"ticker":"NEM","momentum_12_1":1.48232,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.65485,"ma_50":95.94,"ma_150":80.24,"ma_200":73.25,"sepa_pass":true,"rank":82,"action":"SELL"},{"ticker":"NOW","momentum_12_1":-0.25802,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.55308,"ma_50":160.01,"ma_150":178.42,"ma_200":180.3,"sepa_pass":false,"rank":83,"action":"SELL"},{"ticker":"PANW","momentum_12_1":0.08969,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.08849,"ma_50":193.49,"ma_150":196.35,"ma_200":192.78,"sepa_pass":false,"rank":84,"action":"SELL"},{"ticker":"PFE","momentum_12_1":0.00076,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.20872,"ma_50":25.29,"ma_150":24.92,"ma_200":24.47,"sepa_pass":false,"rank":85,"action":"SELL"},{"ticker":"PGR","momentum_12_1":-0.01418,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.34018,"ma_50":222.12,"ma_150":236.74,"ma_200":246.65,"sepa_pass":false,"rank":86,"action":"SELL"},{"ticker":"PH","momentum_12_1":0.36547,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.27089,"ma_50":870.4,"ma_150":779.08,"ma_200":739.95,"sepa_pass":false,"rank":87,"action":"SELL"},{"ticker":"PLD","momentum_12_1":0.20847,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.03877,"ma_50":127.44,"ma_150":117.21,"ma_200":114.05,"sepa_pass":false,"rank":88,"action":"SELL"},{"ticker":"PLTR","momentum_12_1":1.78031,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":1.49751,"ma_50":178.6,"ma_150":169.31,"ma_200":155.01,"sepa_pass":false,"rank":89,"action":"SELL"},{"ticker":"SCHW","momentum_12_1":0.31711,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.23149,"ma_50":96.75,"ma_150":94.92,"ma_200":91.79,"sepa_pass":false,"rank":90,"action":"SELL"},{"ticker":"SPGI","momentum_12_1":0.03129,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.0632,"ma_50":508.98,"ma_150":516.39,"ma_200":511.31,"sepa_pass":false,"rank":91,"action":"SELL"},{"ticker":"SYK","momentum_12_1":-0.02064,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.18988,"ma_50":360.03,"ma_150":374.96,"ma_200":374.22,"sepa_pass":false,"rank":92,"action":"SELL"},{"ticker":"T","momentum_12_1":0.11514,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.1005,"ma_50":24.81,"ma_150":26.76,"ma_200":26.93,"sepa_pass":false,"rank":93,"action":"SELL"},{"ticker":"TJX","momentum_12_1":0.31424,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.1206,"ma_50":152.14,"ma_150":140.06,"ma_200":136.96,"sepa_pass":false,"rank":94,"action":"SELL"},{"ticker":"TMUS","momentum_12_1":-0.08413,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.29884,"ma_50":203.27,"ma_150":225.12,"ma_200":230.8,"sepa_pass":false,"rank":95,"action":"SELL"},{"ticker":"TSLA","momentum_12_1":0.19919,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.08253,"ma_50":443.2,"ma_150":392.63,"ma_200":368.28,"sepa_pass":false,"rank":96,"action":"SELL"},{"ticker":"UBER","momentum_12_1":0.26249,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.11233,"ma_50":86.37,"ma_150":90.99,"ma_200":88.5,"sepa_pass":false,"rank":97,"action":"SELL"},{"ticker":"UNP","momentum_12_1":0.04835,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":-0.1841,"ma_50":229.71,"ma_150":226.93,"ma_200":225.47,"sepa_pass":false,"rank":98,"action":"SELL"},{"ticker":"WELL","momentum_12_1":0.5013,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.29422,"ma_50":192.39,"ma_150":174.48,"ma_200":168.03,"sepa_pass":false,"rank":99,"action":"SELL"},{"ticker":"WFC","momentum_12_1":0.30496,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":0.06059,"ma_50":89.85,"ma_150":84.02,"ma_200":80.78,"sepa_pass":false,"rank":100,"action":"SELL"}]},{"id":"sp500_bottom100","name":"S&P 500 Bottom 100","universe_size":100,"buy_count":20,"sell_count":20,"sepa_count":16,"sepa_candidates":[{"ticker":"HII","momentum_12_1":0.66722,"quality_raw":null,"value_raw":null,"composite_score":1.02007,"rs_score":0.93253,"ma_50":333.81,"ma_150":290.53,"ma_200":273.05,"sepa_pass":true,"rank":1,"action":"BUY"},{"ticker":"IVZ","momentum_12_1":0.57057,"quality_raw":null,"value_raw":null,"composite_score":0.88669,"rs_score":0.58359,"ma_50":25.68,"ma_150":22.37,"ma_200":20.32,"sepa_pass":true,"rank":2,"action":"BUY"},{"ticker":"TKO","momentum_12_1":0.44958,"quality_raw":null,"value_raw":null,"composite_score":0.71974,"rs_score":0.27055,"ma_50":198.34,"ma_150":188.37,"ma_200":180.68,"sepa_pass":true,"rank":4,"action":"BUY"},{"ticker":"HAS","momentum_12_1":0.43236,"quality_raw":null,"value_raw":null,"composite_score":0.69597,"rs_score":0.34559,"ma_50":81.49,"ma_150":77.95,"ma_200":73.78,"sepa_pass":true,"rank":5,"action":"BUY"},{"ticker":"GL","momentum_12_1":0.23345,"quality_raw":null,"value_raw":null,"composite_score":0.42149,"rs_score":0.03714,"ma_50":136.57,"ma_150":134.74,"ma_200":131.4,"sepa_pass":true,"rank":8,"action":"BUY"},{"ticker":"EVRG","momentum_12_1":0.21091,"quality_raw":null,"value_raw":null,"composite_score":0.39039,"rs_score":0.04901,"ma_50":74.57,"ma_150":73.11,"ma_200":71.59,"sepa_pass":true,"rank":11,"action":"BUY"},{"ticker":"AES","momentum_12_1":0.16962,"quality_raw":null,"value_raw":null,"composite_score":0.33341,"rs_score":0.02954,"ma_50":14.0,"ma_150":13.38,"ma_200":12.7,"sepa_pass":true,"rank":12,"action":"BUY"},{"ticker":"SOLV","momentum_12_1":0.16669,"quality_raw":null,"value_raw":null,"composite_score":0.32937,"rs_score":-0.043,"ma_50":80.12,"ma_150":75.39,"ma_200":74.04,"sepa_pass":true,"rank":13,"action":"BUY"},{"ticker":"NDSN","momentum_12_1":0.14647,"quality_raw":null,"value_raw":null,"composite_score":0.30147,"rs_score":0.12195,"ma_50":240.3,"ma_150":228.6,"ma_200":220.28,"sepa_pass":true,"rank":14,"action":"BUY"},{"ticker":"AIZ","momentum_12_1":0.1393,"quality_raw":null,"value_raw":null,"composite_score":0.29157,"rs_score":-0.02926,"ma_50":230.65,"ma_150":213.51,"ma_200":209.2,"sepa_pass":true,"rank":15,"action":"BUY"},{"ticker":"LNT","momentum_12_1":0.13566,"quality_raw":null,"value_raw":null,"composite_score":0.28655,"rs_score":-0.02862,"ma_50":66.33,"ma_150":65.35,"ma_200":64.34,"sepa_pass":true,"rank":16,"action":"BUY"},{"ticker":"TXT","momentum_12_1":0.12686,"quality_raw":null,"value_raw":null,"composite_score":0.2744,"rs_score":0.00984,"ma_50":85.73,"ma_150":82.8,"ma_200":79.84,"sepa_pass":true,"rank":18,"action":"BUY"},{"ticker":"CRL","momentum_12_1":0.1127,"quality_raw":null,"value_raw":null,"composite_score":0.25487,"rs_score":0.06586,"ma_50":189.45,"ma_150":171.47,"ma_200":161.0,"sepa_pass":true,"rank":19,"action":"BUY"},{"ticker":"MRNA","momentum_12_1":-0.13175,"quality_raw":null,"value_raw":null,"composite_score":-0.08246,"rs_score":-0.04683,"ma_50":28.96,"ma_150":27.99,"ma_200":27.56,"sepa_pass":true,"rank":63,"action":"HOLD"},{"ticker":"IPG","momentum_12_1":null,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":null,"ma_50":null,"ma_150":null,"ma_200":null,"sepa_pass":true,"rank":99,"action":"SELL"},{"ticker":"WBA","momentum_12_1":null,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":null,"ma_50":null,"ma_150":null,"ma_200":null,"sepa_pass":true,"rank":100,"action":"SELL"}],"sepa_charts":[{"ticker":"HII","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[172.3,193.59,193.93,195.97,197.03,195.01,191.73,195.51,196.16,207.13,208.57,207.43,201.71,201.47,205.89,206.25,203.27,203.15,205.32,204.04,202.2,204.93,199.22,184.95,183.31,187.54,200.08,200.89,215.74,219.95,217.98,215.6,219.48,217.86,217.22,217.93,221.9,226.05,228.35,230.37,230.34,227.48,230.02,233.18,232.9,230.21,232.95,231.63,229.74,225.73,223.11,228.16,230.05,229.35,228.02,223.38,224.49,224.74,227.84,225.6,223.68,223.06,222.8,227.96,224.79,224.78,226.49,228.07,223.3,226.15,229.12,232.73,229.26,234.08,234.21,234.54,237.1,231.63,235.12,239.83,238.65,241.46,246.31,250.15,252.08,253.53,247.95,248.92,258.11,258.18,258.5,253.68,253.82,255.35,254.49,252.93,253.96,265.56,263.33,264.82,262.49,260.84,258.52,278.86,269.83,265.67,270.92,267.49,266.45,264.69,266.65,268.0,269.43,267.46,266.25,267.6,265.4,267.09,266.48,269.98,270.72,271.74,276.39,275.27,270.79,269.71,269.33,269.98,271.13,269.94,267.07,271.93,276.07,274.71,273.02,273.19,272.46,274.69,275.13,276.16,276.01,277.51,271.25,278.77,279.53,287.91,286.01,282.22,284.24,288.49,285.38,290.83,286.14,282.99,287.9,291.94,284.96,282.66,280.02,285.77,287.53,283.64,290.09,299.91,301.69,299.14,298.42,319.07,322.02,317.54,315.9,306.68,305.43,309.56,318.66,324.19,317.89,312.67,313.97,309.74,309.16,309.74,301.83,305.49,309.92,314.73,314.31,313.62,306.65,307.2,309.23,315.88,304.58,315.88,314.95,323.14,326.72,326.92,329.16,326.8,321.29,322.63,336.64,353.52,354.52,355.45,351.13,345.73,341.98,340.07,349.75,363.48,367.6,356.45,378.47,386.99,398.25,411.66,415.39,418.86],"ma50":[185.75,185.74,185.86,185.97,186.11,186.16,186.16,186.26,186.41,186.78,187.2,187.58,187.88,188.13,188.46,188.78,188.94,189.06,189.19,189.25,189.24,189.17,189.05,188.67,188.28,187.97,188.06,188.22,188.62,189.07,189.5,189.9,190.38,191.54,192.51,193.51,194.59,195.84,197.19,198.57,199.79,200.86,201.9,203.16,204.44,205.54,206.73,207.88,208.96,210.02,211.04,211.73,212.45,213.12,213.74,214.31,214.96,215.55,216.18,216.55,216.85,217.17,217.59,218.12,218.5,218.87,219.33,219.83,220.19,220.63,221.17,221.73,222.33,223.31,224.33,225.27,226.01,226.62,227.01,227.41,227.82,228.34,228.87,229.52,230.22,230.93,231.45,231.91,232.5,233.06,233.62,234.15,234.62,235.07,235.5,235.95,236.37,237.05,237.72,238.5,239.29,239.95,240.51,241.51,242.34,243.19,244.12,244.97,245.74,246.52,247.38,248.28,249.22,250.01,250.83,251.69,252.47,253.25,254.11,254.99,255.82,256.6,257.54,258.37,259.1,259.8,260.45,261.22,261.94,262.54,263.11,263.72,264.31,264.8,265.22,265.61,266.1,266.62,266.96,267.32,267.67,268.15,268.49,268.96,269.46,270.16,270.8,271.14,271.56,272.03,272.49,273.09,273.64,273.72,274.08,274.61,274.89,275.19,275.46,275.89,276.3,276.62,277.03,277.68,278.39,279.02,279.68,280.72,281.83,282.78,283.68,284.38,284.96,285.65,286.61,287.7,288.67,289.52,290.38,291.17,292.02,292.77,293.29,293.9,294.64,295.47,296.31,297.09,297.72,298.34,299.0,299.77,300.44,301.18,301.89,302.59,303.41,304.3,305.2,305.96,306.68,307.32,308.33,309.74,311.07,312.34,313.67,314.93,316.17,317.25,318.5,320.09,321.64,322.77,324.31,326.07,328.06,329.92,331.78,333.81],"ma150":[222.99,222.43,221.86,221.3,220.83,220.38,219.95,219.54,219.16,218.83,218.49,218.11,217.71,217.27,216.85,216.42,215.97,215.49,215.05,214.59,214.11,213.63,213.11,212.48,211.82,211.18,210.68,210.19,209.82,209.49,209.16,208.86,208.61,208.34,208.04,207.73,207.44,207.15,206.88,206.64,206.39,206.19,206.01,205.83,205.62,205.4,205.18,204.99,204.8,204.58,204.36,204.16,203.98,203.82,203.61,203.36,203.13,202.89,202.66,202.42,202.17,201.95,201.72,201.55,201.35,201.15,200.97,200.82,201.07,201.32,201.57,201.84,202.01,202.25,202.46,202.65,202.87,203.05,203.32,203.62,203.91,204.24,204.61,204.98,205.33,205.7,206.03,206.36,206.76,207.18,207.63,208.03,208.47,208.92,209.32,209.74,210.15,210.65,211.13,211.57,212.03,212.47,212.94,213.53,214.06,214.55,215.08,215.59,216.11,216.62,217.14,217.68,218.23,218.75,219.26,219.78,220.25,220.71,221.16,221.62,222.08,222.5,222.97,223.45,223.9,224.35,224.84,225.35,225.86,226.34,226.81,227.32,227.85,228.62,229.32,230.02,230.71,231.46,232.22,232.98,233.69,234.38,235.01,235.73,236.47,237.22,237.97,238.69,239.41,240.19,240.94,241.59,242.2,242.78,243.39,244.03,244.66,245.24,245.8,246.32,246.85,247.36,247.94,248.6,249.24,249.86,250.49,251.27,252.04,252.8,253.56,254.24,254.94,255.78,256.68,257.59,258.37,259.12,259.77,260.37,260.98,261.61,262.16,262.74,263.36,264.0,264.62,265.2,265.73,266.24,266.76,267.35,267.85,268.4,268.95,269.57,270.19,270.83,271.49,272.17,272.82,273.45,274.16,274.99,275.83,276.71,277.56,278.36,279.12,279.89,280.73,281.66,282.63,283.49,284.51,285.59,286.74,287.96,289.24,290.53],"ma200":[230.37,230.08,229.77,229.47,229.18,228.88,228.57,228.28,227.98,227.76,227.56,227.34,227.08,226.84,226.61,226.39,226.15,225.92,225.71,225.5,225.3,225.12,224.93,224.64,224.33,224.03,223.78,223.53,223.35,223.21,223.06,222.9,222.77,222.62,222.47,222.35,222.24,222.16,222.07,221.96,221.86,221.72,221.53,221.36,221.19,221.03,220.86,220.69,220.51,220.27,220.0,219.76,219.51,219.25,219.06,218.86,218.7,218.54,218.41,218.26,218.08,217.88,217.68,217.48,217.26,217.03,216.81,216.57,216.33,216.1,215.88,215.66,215.42,215.19,214.94,214.7,214.51,214.3,214.12,213.97,213.83,213.73,213.67,213.63,213.59,213.53,213.44,213.34,213.29,213.24,213.19,213.18,213.16,213.14,213.09,213.04,212.98,213.0,213.03,213.06,213.09,213.11,213.11,213.24,213.29,213.32,213.38,213.41,213.43,213.45,213.48,213.53,213.6,213.66,213.72,213.79,213.84,213.93,214.33,214.74,215.14,215.53,215.89,216.28,216.62,216.94,217.26,217.59,217.97,218.35,218.71,219.11,219.54,219.93,220.3,220.68,221.05,221.42,221.81,222.22,222.64,223.06,223.47,223.93,224.36,224.84,225.32,225.77,226.23,226.68,227.14,227.63,228.12,228.58,229.07,229.57,230.03,230.49,230.95,231.43,231.93,232.41,232.93,233.48,234.04,234.59,235.11,235.71,236.33,236.91,237.48,237.97,238.47,239.0,239.58,240.18,240.79,241.39,241.99,242.55,243.11,243.68,244.21,244.94,245.65,246.38,247.11,247.86,248.59,249.32,250.02,250.73,251.36,252.09,252.82,253.56,254.33,255.09,255.86,256.63,257.38,258.02,258.73,259.52,260.31,261.11,261.91,262.66,263.39,264.05,264.76,265.54,266.37,267.14,268.01,268.91,269.89,270.93,271.98,273.05],"rs_line":[1.0,1.11162,1.13369,1.13923,1.17674,1.17444,1.14859,1.18706,1.1669,1.22273,1.24468,1.22454,1.19423,1.196,1.20074,1.19995,1.1969,1.19938,1.23711,1.2212,1.20678,1.21538,1.24276,1.22548,1.21678,1.26467,1.221,1.28213,1.35277,1.36591,1.35748,1.37318,1.39591,1.41939,1.37933,1.36272,1.35894,1.37443,1.38788,1.3914,1.39066,1.36373,1.35879,1.3854,1.3954,1.37351,1.38024,1.37417,1.31935,1.28782,1.27125,1.2937,1.29621,1.29085,1.2877,1.28311,1.28898,1.29929,1.29038,1.28513,1.26918,1.26708,1.25851,1.28036,1.26289,1.26897,1.26563,1.27331,1.23965,1.25906,1.27055,1.30516,1.27358,1.31156,1.31249,1.32133,1.32269,1.27805,1.29658,1.31229,1.29938,1.30842,1.33513,1.34983,1.34961,1.36756,1.3382,1.33542,1.38083,1.38608,1.38515,1.36516,1.36136,1.36124,1.35765,1.34677,1.35206,1.40189,1.38966,1.39164,1.37975,1.3747,1.36419,1.47706,1.45305,1.40923,1.4444,1.41527,1.41095,1.39079,1.40386,1.39611,1.39877,1.38841,1.38537,1.3927,1.38879,1.40135,1.40378,1.40071,1.41076,1.41017,1.43104,1.42021,1.40548,1.41032,1.40075,1.39249,1.40248,1.3929,1.37492,1.3959,1.40547,1.39902,1.38305,1.38582,1.38383,1.38867,1.38788,1.38651,1.39335,1.40539,1.38005,1.41023,1.41012,1.44694,1.43251,1.4119,1.42203,1.43813,1.42792,1.44657,1.42737,1.45087,1.45374,1.47594,1.43429,1.43247,1.41108,1.42523,1.43403,1.42202,1.44579,1.48261,1.47402,1.45769,1.45348,1.57134,1.58069,1.55577,1.56631,1.51534,1.52553,1.54464,1.56562,1.58915,1.5574,1.55767,1.56441,1.55784,1.56809,1.56499,1.54863,1.55195,1.55161,1.56101,1.54824,1.53646,1.5092,1.50911,1.51384,1.54527,1.48716,1.54699,1.54376,1.57347,1.58721,1.60544,1.61889,1.61169,1.60214,1.59677,1.65602,1.72829,1.72529,1.72375,1.70298,1.68278,1.66657,1.66963,1.71401,1.76951,1.77899,1.73061,1.83771,1.86673,1.91803,1.98659,2.01449,2.0258],"rs_score":0.93253},{"ticker":"IVZ","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[16.0,16.41,15.75,15.63,14.82,15.24,15.25,14.95,15.28,15.44,15.33,15.57,15.52,15.32,15.86,15.97,15.69,15.55,15.19,15.17,15.19,15.69,13.83,12.81,12.71,12.14,13.65,12.69,12.78,12.97,13.08,12.64,12.8,12.46,13.49,13.51,14.07,13.93,13.94,13.96,13.93,13.92,14.41,14.33,14.18,14.33,14.75,14.83,15.59,15.65,15.48,15.32,15.44,15.33,15.16,14.64,14.58,14.38,14.76,14.49,14.75,14.46,14.38,14.45,14.42,14.25,14.39,14.68,14.81,15.07,14.95,14.53,14.83,14.52,14.72,14.81,14.93,15.29,15.25,15.58,15.7,15.77,16.17,16.59,16.73,16.72,16.69,16.95,17.4,17.43,17.34,16.74,16.88,17.28,19.92,20.2,21.25,21.44,21.43,21.81,21.68,21.72,21.48,21.01,20.61,21.0,21.17,21.1,20.57,20.72,20.45,21.04,21.52,21.34,21.12,21.0,20.83,20.78,20.67,21.55,21.62,21.93,22.05,22.06,21.89,21.65,21.7,21.96,21.99,22.0,22.23,22.16,22.55,22.43,22.34,22.1,22.17,22.65,22.49,22.57,22.43,22.18,22.36,22.72,23.0,22.94,23.09,23.61,24.04,24.13,24.1,24.0,23.9,22.47,23.29,23.45,23.6,22.8,22.79,22.84,22.94,22.78,22.68,23.0,23.46,23.96,24.1,23.48,23.7,23.58,23.24,23.37,23.39,23.37,23.64,23.88,24.66,23.98,23.52,22.44,22.66,22.92,22.7,23.22,23.81,24.23,24.53,24.45,24.66,24.24,24.39,25.21,26.24,25.81,26.54,26.93,27.0,26.26,26.04,26.03,26.4,26.48,27.0,27.34,27.09,27.21,26.96,26.84,26.46,26.27,26.94,28.16,28.25,27.69,28.27,28.57,28.76,28.3,28.25,29.39],"ma50":[17.73,17.72,17.7,17.67,17.62,17.57,17.51,17.46,17.42,17.37,17.33,17.28,17.25,17.21,17.19,17.18,17.16,17.14,17.11,17.07,17.03,16.99,16.92,16.83,16.73,16.62,16.5,16.38,16.25,16.12,16.02,15.9,15.78,15.65,15.54,15.44,15.34,15.26,15.17,15.08,14.98,14.9,14.83,14.77,14.7,14.64,14.59,14.54,14.51,14.48,14.47,14.45,14.45,14.44,14.45,14.43,14.42,14.41,14.4,14.38,14.37,14.35,14.32,14.31,14.28,14.24,14.22,14.2,14.19,14.19,14.19,14.16,14.18,14.22,14.26,14.31,14.34,14.39,14.44,14.49,14.54,14.6,14.67,14.75,14.82,14.88,14.94,15.0,15.06,15.13,15.2,15.26,15.31,15.37,15.48,15.6,15.73,15.86,15.98,16.1,16.23,16.35,16.47,16.59,16.7,16.82,16.96,17.09,17.21,17.33,17.45,17.58,17.72,17.86,17.99,18.13,18.26,18.38,18.49,18.62,18.76,18.91,19.05,19.2,19.34,19.48,19.62,19.75,19.88,20.01,20.14,20.27,20.4,20.52,20.63,20.74,20.85,20.96,21.06,21.16,21.27,21.37,21.48,21.59,21.65,21.71,21.75,21.79,21.84,21.89,21.94,21.98,22.03,22.06,22.11,22.16,22.21,22.24,22.29,22.33,22.38,22.42,22.44,22.47,22.52,22.58,22.64,22.7,22.76,22.8,22.83,22.86,22.89,22.91,22.95,22.99,23.05,23.09,23.12,23.13,23.14,23.16,23.16,23.17,23.2,23.25,23.29,23.33,23.37,23.41,23.45,23.51,23.58,23.65,23.72,23.8,23.87,23.93,23.97,24.01,24.05,24.1,24.16,24.26,24.34,24.41,24.48,24.56,24.63,24.7,24.78,24.89,25.0,25.09,25.19,25.28,25.38,25.47,25.56,25.68],"ma150":[17.45,17.44,17.43,17.42,17.41,17.4,17.41,17.4,17.4,17.4,17.4,17.39,17.39,17.38,17.37,17.37,17.36,17.35,17.34,17.33,17.32,17.31,17.29,17.26,17.23,17.2,17.18,17.15,17.13,17.11,17.09,17.07,17.05,17.03,17.01,16.99,16.98,16.96,16.93,16.91,16.89,16.87,16.85,16.83,16.8,16.78,16.76,16.75,16.73,16.72,16.7,16.69,16.68,16.66,16.64,16.62,16.6,16.58,16.55,16.52,16.5,16.48,16.46,16.44,16.42,16.39,16.37,16.35,16.33,16.31,16.3,16.27,16.25,16.22,16.2,16.18,16.16,16.14,16.13,16.11,16.1,16.09,16.08,16.08,16.07,16.06,16.05,16.04,16.04,16.03,16.03,16.02,16.01,16.01,16.02,16.03,16.05,16.07,16.09,16.12,16.14,16.18,16.21,16.23,16.25,16.28,16.3,16.32,16.34,16.36,16.38,16.4,16.43,16.46,16.48,16.52,16.55,16.57,16.6,16.63,16.66,16.69,16.72,16.75,16.78,16.8,16.82,16.84,16.86,16.87,16.9,16.93,16.95,16.97,17.0,17.02,17.04,17.07,17.1,17.12,17.15,17.18,17.21,17.24,17.28,17.32,17.36,17.4,17.44,17.49,17.55,17.6,17.65,17.7,17.75,17.81,17.86,17.91,17.97,18.01,18.07,18.11,18.16,18.21,18.26,18.32,18.37,18.43,18.48,18.54,18.59,18.64,18.71,18.78,18.85,18.93,19.0,19.08,19.15,19.21,19.28,19.34,19.41,19.48,19.55,19.62,19.69,19.76,19.83,19.9,19.97,20.05,20.13,20.2,20.28,20.37,20.45,20.53,20.6,20.67,20.74,20.81,20.89,20.97,21.05,21.13,21.22,21.3,21.38,21.45,21.54,21.63,21.72,21.81,21.9,22.0,22.09,22.18,22.27,22.37],"ma200":[16.98,16.98,16.98,16.98,16.97,16.97,16.96,16.96,16.96,16.96,16.96,16.96,16.96,16.96,16.96,16.96,16.97,16.97,16.97,16.97,16.97,16.97,16.97,16.96,16.95,16.94,16.93,16.92,16.9,16.89,16.89,16.87,16.86,16.85,16.84,16.84,16.83,16.83,16.82,16.81,16.8,16.78,16.77,16.76,16.75,16.74,16.73,16.72,16.72,16.71,16.7,16.69,16.69,16.68,16.67,16.66,16.66,16.65,16.65,16.65,16.64,16.63,16.62,16.61,16.6,16.59,16.57,16.56,16.55,16.55,16.53,16.52,16.51,16.5,16.49,16.48,16.47,16.46,16.46,16.46,16.45,16.45,16.46,16.46,16.46,16.47,16.47,16.47,16.47,16.47,16.47,16.47,16.46,16.46,16.47,16.49,16.51,16.52,16.54,16.56,16.58,16.61,16.63,16.64,16.66,16.67,16.69,16.7,16.72,16.73,16.74,16.75,16.77,16.79,16.81,16.83,16.84,16.85,16.87,16.89,16.91,16.93,16.95,16.97,16.99,17.0,17.02,17.04,17.07,17.09,17.11,17.14,17.16,17.19,17.21,17.23,17.25,17.27,17.29,17.32,17.34,17.36,17.38,17.41,17.43,17.45,17.47,17.5,17.53,17.56,17.59,17.63,17.66,17.69,17.72,17.75,17.78,17.8,17.83,17.85,17.88,17.91,17.93,17.96,17.99,18.03,18.07,18.1,18.14,18.17,18.2,18.23,18.26,18.29,18.32,18.35,18.38,18.4,18.42,18.44,18.46,18.48,18.5,18.52,18.55,18.58,18.6,18.64,18.67,18.7,18.72,18.76,18.8,18.84,18.89,18.94,18.98,19.03,19.07,19.12,19.17,19.22,19.28,19.34,19.4,19.46,19.52,19.58,19.63,19.69,19.74,19.81,19.87,19.93,19.99,20.06,20.12,20.19,20.25,20.32],"rs_line":[1.0,1.01472,0.99151,0.97847,0.95315,0.98838,0.98381,0.97748,0.97884,0.98152,0.98518,0.98982,0.9895,0.97937,0.99605,1.00055,0.99489,0.98864,0.9856,0.97774,0.97627,1.00206,0.92905,0.91404,0.90853,0.88159,0.89704,0.87217,0.86296,0.86737,0.87718,0.86695,0.87667,0.87419,0.92246,0.90973,0.9279,0.91208,0.91239,0.90798,0.90567,0.89865,0.91667,0.91684,0.91489,0.9207,0.94113,0.94744,0.96413,0.96149,0.94983,0.93545,0.93684,0.92915,0.92194,0.90558,0.90151,0.89526,0.9002,0.88888,0.90127,0.88454,0.87472,0.87399,0.87241,0.86631,0.86593,0.88259,0.88538,0.9035,0.89276,0.87749,0.88717,0.87611,0.88831,0.89849,0.89691,0.9085,0.90562,0.91803,0.92053,0.92024,0.94388,0.96403,0.96456,0.97122,0.97001,0.97925,1.00242,1.00769,1.00058,0.9701,0.97496,0.99199,1.14438,1.15827,1.2183,1.21883,1.21786,1.23424,1.22719,1.2327,1.22062,1.19841,1.19518,1.19956,1.21544,1.20221,1.17299,1.17241,1.15942,1.18031,1.20311,1.19294,1.18341,1.17695,1.17379,1.17409,1.17258,1.20401,1.21326,1.22552,1.22943,1.22565,1.2235,1.21912,1.21535,1.21971,1.22493,1.22248,1.23241,1.22499,1.23628,1.23011,1.21868,1.20725,1.21258,1.23308,1.22171,1.22028,1.21935,1.20961,1.22508,1.23771,1.24945,1.24152,1.24539,1.27197,1.29516,1.29536,1.29856,1.28551,1.28387,1.24059,1.26643,1.27669,1.27917,1.24429,1.23672,1.22668,1.23207,1.22987,1.21725,1.22442,1.23434,1.25731,1.26405,1.24523,1.25278,1.24411,1.24088,1.24351,1.25807,1.25576,1.25075,1.26056,1.30101,1.28648,1.26201,1.21539,1.2377,1.24708,1.25423,1.2703,1.28369,1.29416,1.3012,1.28991,1.30696,1.28232,1.28581,1.32807,1.37971,1.36119,1.40089,1.41211,1.4125,1.38872,1.37917,1.38241,1.41766,1.4113,1.4303,1.43935,1.4197,1.42099,1.40808,1.40682,1.3886,1.38892,1.42174,1.47629,1.47225,1.44773,1.47821,1.48408,1.49161,1.47069,1.47534,1.53071],"rs_score":0.58359},{"ticker":"TKO","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[146.7,152.3,146.99,143.73,142.12,145.15,147.27,140.85,139.62,145.63,145.47,149.85,150.4,149.88,152.91,154.6,154.61,151.88,149.7,152.81,152.99,158.58,150.44,139.58,141.18,138.96,148.54,145.09,144.35,148.13,149.65,147.96,149.22,143.09,148.13,150.96,155.28,157.1,160.43,162.96,162.91,163.16,166.43,166.83,167.94,169.68,168.96,159.66,160.6,164.48,162.21,161.46,163.48,163.99,162.74,159.84,156.23,157.72,158.95,158.81,156.74,157.81,159.55,163.11,165.9,168.92,165.94,163.33,164.6,164.92,163.93,163.08,168.41,167.96,175.95,174.96,175.53,176.89,174.94,176.16,179.35,181.95,175.61,177.46,177.14,176.34,172.97,171.8,172.89,172.0,174.48,168.79,169.13,169.35,170.79,168.7,166.49,167.71,168.0,170.05,170.74,168.15,167.81,168.01,165.61,165.76,163.45,155.61,160.74,163.29,180.0,186.02,191.28,191.0,188.85,185.56,184.9,182.61,184.24,186.17,183.72,185.16,185.65,190.14,189.56,185.35,186.61,190.08,194.0,200.47,196.43,195.13,202.24,202.44,204.49,200.29,201.38,202.8,201.11,199.67,202.29,195.79,195.79,199.04,205.33,201.96,198.76,198.0,197.35,198.15,197.96,194.15,186.47,187.05,188.6,189.97,191.21,187.83,189.28,186.82,186.16,186.97,186.85,186.85,187.51,187.45,186.6,187.78,188.4,187.71,187.35,187.24,181.0,182.56,179.17,179.68,181.68,182.64,184.09,184.75,186.56,188.37,176.49,178.17,181.65,187.42,193.37,193.89,193.98,194.64,194.9,200.87,202.22,203.82,197.11,196.94,204.3,208.42,207.45,210.65,211.62,211.61,213.44,215.49,215.7,217.98,217.44,216.11,214.17,209.0,206.94,203.65,202.81,202.91,202.09,199.63,199.09,208.89,207.98,208.88],"ma50":[152.83,153.03,153.1,153.1,153.11,153.11,153.16,153.1,153.03,153.1,153.15,153.3,153.48,153.64,153.85,154.14,154.38,154.56,154.67,154.89,155.11,155.39,155.54,155.29,155.05,154.76,154.57,154.33,154.07,153.92,153.78,153.58,153.35,152.98,152.62,152.17,151.75,151.36,151.08,150.83,150.64,150.58,150.63,150.79,150.93,151.21,151.39,151.58,151.78,152.11,152.43,152.61,152.94,153.34,153.76,154.05,154.23,154.57,154.95,155.22,155.44,155.6,155.78,156.05,156.31,156.59,156.82,157.05,157.35,157.59,157.81,157.9,158.26,158.83,159.52,160.24,160.78,161.42,162.03,162.59,163.18,163.86,164.39,165.08,165.66,166.17,166.52,166.81,167.06,167.24,167.48,167.59,167.64,167.69,167.75,167.73,167.68,167.84,167.99,168.1,168.27,168.41,168.49,168.57,168.63,168.75,168.89,168.85,168.89,168.98,169.44,170.01,170.64,171.2,171.66,171.99,172.37,172.75,173.15,173.57,173.97,174.41,174.75,175.2,175.47,175.68,175.9,176.16,176.54,177.03,177.37,177.64,178.17,178.67,179.22,179.69,180.26,180.88,181.45,182.0,182.56,183.1,183.63,184.22,184.91,185.58,186.22,186.83,187.42,187.98,188.52,189.04,189.42,189.8,190.26,190.74,191.3,191.94,192.51,192.98,193.11,193.13,193.04,192.95,192.93,192.96,193.0,193.1,193.19,193.22,193.29,193.33,193.24,193.09,192.88,192.76,192.67,192.52,192.32,192.0,191.81,191.67,191.16,190.67,190.21,189.96,189.8,189.62,189.48,189.38,189.23,189.33,189.46,189.55,189.39,189.29,189.4,189.61,189.81,190.06,190.33,190.68,191.22,191.79,192.33,192.89,193.42,193.98,194.48,194.92,195.34,195.67,195.99,196.31,196.61,196.85,197.1,197.52,197.91,198.34],"ma150":[133.14,133.43,133.68,133.91,134.13,134.38,134.64,134.85,135.05,135.25,135.43,135.63,135.84,136.05,136.29,136.54,136.78,137.0,137.2,137.44,137.67,137.95,138.16,138.31,138.47,138.61,138.81,138.99,139.18,139.4,139.63,139.86,140.1,140.28,140.5,140.73,140.96,141.19,141.43,141.7,141.97,142.25,142.55,142.84,143.12,143.43,143.74,143.98,144.21,144.46,144.7,144.93,145.17,145.41,145.65,145.87,146.08,146.28,146.48,146.68,146.86,147.06,147.28,147.6,147.94,148.29,148.62,148.94,149.25,149.56,149.87,150.16,150.48,150.81,151.19,151.56,151.95,152.35,152.73,153.11,153.47,153.81,154.1,154.37,154.64,154.91,155.14,155.37,155.6,155.85,156.1,156.3,156.47,156.64,156.84,157.03,157.2,157.36,157.53,157.69,157.84,158.02,158.18,158.34,158.5,158.64,158.76,158.84,158.95,159.1,159.34,159.64,159.97,160.29,160.6,160.91,161.19,161.45,161.72,162.02,162.3,162.57,162.85,163.11,163.35,163.56,163.75,163.97,164.21,164.52,164.78,165.03,165.3,165.58,165.83,166.01,166.18,166.35,166.53,166.69,166.89,167.09,167.3,167.57,167.87,168.17,168.43,168.75,169.06,169.4,169.74,170.02,170.28,170.57,170.88,171.18,171.47,171.79,172.12,172.39,172.66,172.91,173.15,173.4,173.63,173.85,174.06,174.3,174.56,174.79,175.02,175.21,175.42,175.7,175.96,176.23,176.45,176.7,176.96,177.21,177.45,177.72,177.91,178.14,178.36,178.61,178.86,179.11,179.33,179.54,179.75,180.0,180.24,180.49,180.68,180.87,181.1,181.43,181.74,182.05,182.38,182.71,183.04,183.39,183.74,184.13,184.54,184.93,185.29,185.63,185.96,186.27,186.56,186.82,187.06,187.27,187.49,187.79,188.08,188.37],"ma200":[126.73,126.97,127.18,127.37,127.54,127.73,127.93,128.11,128.27,128.45,128.64,128.85,129.05,129.26,129.49,129.72,129.96,130.18,130.39,130.61,130.84,131.09,131.32,131.5,131.68,131.85,132.06,132.25,132.43,132.64,132.84,133.04,133.25,133.42,133.59,133.8,134.01,134.24,134.5,134.76,135.02,135.3,135.6,135.91,136.22,136.55,136.87,137.14,137.4,137.69,137.96,138.23,138.5,138.77,139.04,139.3,139.54,139.78,140.03,140.24,140.43,140.62,140.83,141.05,141.29,141.55,141.79,142.02,142.24,142.48,142.71,142.93,143.19,143.44,143.73,144.02,144.31,144.6,144.89,145.2,145.52,145.86,146.17,146.48,146.79,147.09,147.35,147.59,147.84,148.09,148.35,148.58,148.82,149.05,149.28,149.5,149.73,149.94,150.15,150.37,150.59,150.8,151.0,151.2,151.39,151.59,151.78,151.92,152.08,152.25,152.51,152.79,153.12,153.5,153.87,154.22,154.56,154.89,155.23,155.56,155.89,156.22,156.55,156.91,157.26,157.59,157.94,158.3,158.68,159.09,159.45,159.77,160.11,160.44,160.79,161.1,161.42,161.75,162.06,162.39,162.71,163.0,163.26,163.53,163.86,164.17,164.45,164.73,165.0,165.26,165.51,165.77,165.99,166.2,166.44,166.66,166.9,167.11,167.34,167.57,167.78,168.01,168.23,168.46,168.68,168.92,169.14,169.37,169.59,169.82,170.04,170.26,170.45,170.6,170.73,170.86,170.98,171.11,171.24,171.39,171.53,171.69,171.77,171.85,171.93,172.0,172.08,172.17,172.27,172.36,172.48,172.65,172.84,173.06,173.25,173.45,173.67,173.97,174.25,174.56,174.89,175.19,175.52,175.88,176.24,176.61,176.96,177.34,177.71,178.02,178.33,178.6,178.86,179.13,179.37,179.6,179.82,180.11,180.4,180.68],"rs_line":[1.0,1.02713,1.00924,0.98135,0.99691,1.0267,1.0362,1.00442,0.9755,1.0097,1.01961,1.039,1.04584,1.04501,1.04738,1.05642,1.06925,1.05317,1.05938,1.07418,1.07242,1.10461,1.10223,1.08625,1.10067,1.1006,1.06466,1.08759,1.06308,1.08043,1.09459,1.10683,1.11466,1.09493,1.10476,1.10868,1.1169,1.12189,1.14523,1.15601,1.15519,1.14883,1.15471,1.16416,1.18178,1.18903,1.17579,1.11249,1.08324,1.10213,1.08553,1.07526,1.08186,1.08405,1.07942,1.07835,1.05358,1.07094,1.05731,1.06253,1.04456,1.05286,1.05851,1.07599,1.09469,1.12003,1.08909,1.07099,1.07324,1.0784,1.06768,1.07415,1.09881,1.10532,1.15807,1.15768,1.15009,1.14634,1.13307,1.13211,1.14691,1.158,1.11801,1.12469,1.11389,1.11718,1.09643,1.08252,1.08633,1.08455,1.09809,1.06684,1.06543,1.06032,1.07012,1.05503,1.04106,1.03984,1.04129,1.04957,1.05409,1.04084,1.04005,1.04521,1.04745,1.0327,1.0235,0.967,0.99971,1.00772,1.11304,1.13815,1.16634,1.16452,1.15412,1.13426,1.13639,1.1253,1.13992,1.13444,1.12446,1.12855,1.12896,1.15219,1.15556,1.13833,1.13989,1.15147,1.17863,1.21495,1.18772,1.17646,1.20928,1.21088,1.21666,1.19332,1.2013,1.20415,1.19152,1.17742,1.1994,1.16456,1.16996,1.18261,1.21656,1.1921,1.16923,1.16342,1.15962,1.16016,1.16336,1.13421,1.0925,1.12635,1.11852,1.12802,1.13036,1.118,1.12027,1.09433,1.09048,1.10095,1.09375,1.08489,1.07602,1.07283,1.06745,1.08615,1.08617,1.08017,1.09103,1.08662,1.0618,1.0699,1.0339,1.03447,1.04541,1.06866,1.07732,1.09135,1.11138,1.11784,1.06355,1.06309,1.06813,1.09179,1.11873,1.11565,1.12128,1.12302,1.12064,1.15412,1.15968,1.17237,1.13476,1.12631,1.16569,1.20212,1.19834,1.22016,1.23941,1.23006,1.23319,1.23733,1.2329,1.24156,1.23861,1.23544,1.22585,1.20518,1.19112,1.16443,1.15277,1.15707,1.15251,1.131,1.12617,1.18397,1.18464,1.18653],"rs_score":0.27055},{"ticker":"HAS","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[61.81,63.04,63.51,64.35,63.93,62.95,61.86,59.3,59.79,60.22,59.96,60.62,60.38,60.57,61.6,61.04,61.49,61.38,60.59,61.49,62.14,62.69,54.99,53.96,53.17,50.71,55.18,51.0,52.04,53.35,52.49,51.88,52.65,51.54,52.1,52.69,60.37,60.99,61.34,61.57,61.9,60.71,61.75,61.19,60.92,61.43,61.78,61.52,65.56,65.83,65.21,66.47,67.21,68.18,68.36,66.28,66.4,65.83,67.38,66.28,66.8,66.71,65.55,65.68,65.43,65.18,66.32,67.57,68.85,69.04,69.5,67.81,69.77,67.5,67.93,68.63,70.6,72.58,71.68,72.31,73.13,73.82,76.99,78.22,77.64,76.55,76.51,76.68,77.1,75.37,75.79,74.84,75.92,77.19,77.81,77.67,77.57,76.84,75.05,74.98,76.3,76.3,76.0,75.16,74.63,76.89,76.97,77.05,77.35,77.49,77.57,78.25,80.32,80.55,81.14,81.51,80.05,79.69,79.41,81.85,81.06,81.6,81.56,81.6,81.17,79.75,79.03,80.4,79.73,79.36,78.64,77.66,79.95,78.38,76.0,74.69,73.92,74.88,74.15,74.71,74.82,75.23,74.56,75.59,76.95,75.85,75.31,75.17,75.89,74.78,74.83,75.57,74.64,70.95,72.41,73.14,74.13,74.4,74.81,74.79,74.83,75.16,77.94,76.7,78.09,77.94,77.96,76.55,76.31,75.85,75.98,76.87,76.61,76.57,78.15,78.43,79.13,78.9,77.71,77.04,76.04,76.47,76.76,79.2,79.35,81.57,82.67,82.6,82.69,81.65,82.47,81.85,81.1,81.13,79.86,82.16,83.96,81.55,81.1,80.41,81.35,82.03,81.98,81.56,81.41,81.63,82.56,82.83,82.67,82.0,82.97,85.58,87.24,87.02,89.14,86.72,86.64,86.87,85.42,86.89],"ma50":[59.44,59.54,59.68,59.82,59.96,60.08,60.17,60.22,60.31,60.39,60.46,60.54,60.61,60.68,60.77,60.85,60.93,61.03,61.11,61.19,61.28,61.38,61.34,61.26,61.18,61.02,60.96,60.8,60.65,60.56,60.48,60.38,60.25,60.09,59.95,59.82,59.82,59.85,59.87,59.88,59.9,59.89,59.74,59.61,59.49,59.35,59.22,59.13,59.14,59.19,59.25,59.32,59.4,59.47,59.56,59.63,59.72,59.85,60.0,60.12,60.26,60.38,60.49,60.59,60.66,60.75,60.84,60.97,61.13,61.28,61.43,61.53,61.83,62.1,62.39,62.75,63.06,63.49,63.89,64.27,64.68,65.12,65.6,66.14,66.65,67.12,67.45,67.76,68.08,68.35,68.63,68.91,69.2,69.52,69.85,70.18,70.5,70.8,70.99,71.17,71.4,71.59,71.77,71.91,72.03,72.25,72.46,72.68,72.88,73.11,73.32,73.55,73.85,74.14,74.46,74.78,75.06,75.3,75.51,75.77,76.0,76.28,76.51,76.79,77.06,77.28,77.45,77.61,77.77,77.91,78.02,78.1,78.15,78.16,78.12,78.09,78.04,78.0,77.94,77.93,77.91,77.92,77.89,77.86,77.84,77.8,77.76,77.72,77.74,77.74,77.71,77.69,77.67,77.58,77.54,77.46,77.41,77.35,77.3,77.25,77.19,77.13,77.08,77.01,76.95,76.87,76.83,76.77,76.71,76.59,76.49,76.39,76.29,76.19,76.13,76.11,76.11,76.08,76.04,75.99,75.94,75.91,75.85,75.87,75.93,76.07,76.25,76.4,76.57,76.71,76.86,77.0,77.13,77.24,77.3,77.42,77.6,77.72,77.83,77.94,78.07,78.2,78.35,78.56,78.74,78.91,79.08,79.25,79.4,79.55,79.71,79.92,80.1,80.31,80.53,80.71,80.88,81.09,81.27,81.49],"ma150":[64.47,64.46,64.44,64.44,64.44,64.43,64.43,64.4,64.38,64.35,64.32,64.3,64.28,64.25,64.22,64.19,64.16,64.13,64.09,64.05,64.01,63.97,63.89,63.79,63.7,63.58,63.5,63.39,63.28,63.19,63.09,62.99,62.89,62.78,62.67,62.56,62.49,62.42,62.35,62.29,62.23,62.15,62.09,62.02,61.94,61.87,61.79,61.72,61.68,61.64,61.59,61.55,61.52,61.49,61.46,61.43,61.39,61.36,61.33,61.28,61.25,61.22,61.19,61.18,61.18,61.17,61.18,61.18,61.21,61.23,61.25,61.26,61.3,61.32,61.34,61.37,61.42,61.49,61.54,61.61,61.69,61.77,61.87,61.98,62.08,62.16,62.24,62.33,62.41,62.48,62.55,62.6,62.66,62.73,62.82,62.9,62.99,63.07,63.16,63.26,63.36,63.49,63.62,63.73,63.85,63.98,64.12,64.25,64.4,64.54,64.68,64.82,64.98,65.14,65.3,65.46,65.61,65.76,65.92,66.08,66.24,66.4,66.56,66.72,66.88,67.02,67.16,67.3,67.44,67.58,67.73,67.86,68.0,68.13,68.24,68.34,68.43,68.54,68.63,68.72,68.81,68.91,68.94,69.0,69.06,69.11,69.16,69.22,69.29,69.37,69.45,69.54,69.61,69.65,69.71,69.78,69.86,69.96,70.06,70.16,70.26,70.35,70.47,70.58,70.69,70.8,70.91,71.01,71.12,71.21,71.31,71.4,71.54,71.7,71.86,72.05,72.21,72.39,72.56,72.72,72.88,73.04,73.2,73.39,73.57,73.76,73.91,74.05,74.2,74.33,74.47,74.61,74.74,74.87,75.0,75.13,75.28,75.42,75.52,75.62,75.72,75.83,75.93,76.02,76.1,76.21,76.31,76.43,76.53,76.63,76.74,76.87,77.01,77.15,77.31,77.46,77.59,77.72,77.83,77.95],"ma200":[63.24,63.25,63.27,63.29,63.3,63.3,63.31,63.3,63.3,63.29,63.29,63.29,63.3,63.3,63.33,63.34,63.35,63.37,63.38,63.39,63.41,63.44,63.4,63.37,63.33,63.28,63.24,63.19,63.15,63.13,63.1,63.07,63.04,63.02,62.99,62.97,62.99,63.01,63.03,63.05,63.06,63.06,63.06,63.06,63.07,63.08,63.09,63.11,63.14,63.16,63.17,63.17,63.18,63.2,63.22,63.23,63.25,63.26,63.28,63.29,63.31,63.32,63.33,63.34,63.33,63.33,63.33,63.34,63.35,63.36,63.37,63.36,63.37,63.37,63.37,63.37,63.39,63.41,63.43,63.46,63.49,63.52,63.57,63.62,63.67,63.7,63.73,63.76,63.78,63.81,63.83,63.84,63.86,63.89,63.92,63.95,63.97,63.99,64.01,64.02,64.04,64.06,64.08,64.09,64.11,64.13,64.16,64.19,64.21,64.24,64.27,64.3,64.35,64.42,64.5,64.58,64.65,64.71,64.78,64.86,64.94,65.01,65.1,65.19,65.27,65.35,65.43,65.52,65.6,65.69,65.77,65.85,65.94,66.02,66.09,66.14,66.19,66.25,66.29,66.34,66.39,66.43,66.47,66.51,66.57,66.63,66.68,66.74,66.81,66.88,66.95,67.04,67.13,67.2,67.27,67.35,67.44,67.53,67.62,67.72,67.81,67.9,68.01,68.1,68.21,68.31,68.42,68.52,68.62,68.71,68.8,68.9,68.99,69.09,69.19,69.29,69.39,69.5,69.59,69.68,69.78,69.88,69.96,70.06,70.16,70.28,70.39,70.5,70.61,70.72,70.82,70.93,70.99,71.06,71.12,71.19,71.27,71.35,71.43,71.51,71.61,71.7,71.79,71.88,71.97,72.06,72.16,72.28,72.4,72.51,72.62,72.75,72.88,73.01,73.15,73.28,73.4,73.53,73.66,73.78],"rs_line":[1.0,1.00905,1.03495,1.04279,1.06434,1.05681,1.03302,1.00365,0.99147,0.99096,0.99746,0.99757,0.99651,1.00232,1.00143,0.98994,1.00929,1.01017,1.01766,1.02589,1.03382,1.03641,0.95623,0.99667,0.98383,0.95324,0.93869,0.90734,0.90961,0.92355,0.91122,0.9211,0.93344,0.93604,0.92222,0.91843,1.0306,1.03372,1.03925,1.03662,1.04176,1.01455,1.01683,1.01342,1.01745,1.02168,1.02039,1.01739,1.04952,1.04693,1.03574,1.05062,1.05563,1.0697,1.07614,1.06128,1.06278,1.0609,1.06376,1.05249,1.05657,1.05633,1.03215,1.02833,1.02469,1.02573,1.03307,1.05159,1.06547,1.07146,1.07433,1.06006,1.08042,1.05428,1.06116,1.07779,1.09788,1.11634,1.10188,1.10294,1.10993,1.11507,1.16333,1.17658,1.15873,1.15104,1.15107,1.14675,1.14978,1.12795,1.13208,1.12268,1.13509,1.14706,1.15712,1.15285,1.1512,1.13075,1.10404,1.09837,1.11799,1.12095,1.11795,1.10975,1.12029,1.13693,1.14392,1.1364,1.14178,1.135,1.13842,1.1363,1.16238,1.1656,1.1769,1.18252,1.16768,1.16552,1.1661,1.18376,1.17751,1.18041,1.17715,1.17357,1.17439,1.16246,1.14576,1.15596,1.14966,1.14152,1.12855,1.11128,1.13462,1.11271,1.07321,1.05616,1.04657,1.05523,1.04268,1.04561,1.05288,1.06203,1.05745,1.06595,1.08209,1.06261,1.05147,1.0483,1.05836,1.03915,1.04372,1.04779,1.0379,1.014,1.01923,1.03076,1.0401,1.05104,1.05087,1.03977,1.04034,1.05039,1.08282,1.05696,1.06357,1.05871,1.05847,1.05089,1.04417,1.03593,1.05015,1.05879,1.06665,1.06504,1.07032,1.0717,1.08066,1.0957,1.07936,1.08011,1.07512,1.07704,1.09786,1.12158,1.10741,1.12778,1.13515,1.12804,1.13444,1.11811,1.12544,1.11616,1.10384,1.10757,1.09118,1.11521,1.13699,1.11636,1.11188,1.10544,1.13081,1.13171,1.12418,1.11149,1.1044,1.1035,1.11619,1.12384,1.12304,1.12226,1.13345,1.16137,1.1769,1.17773,1.20655,1.16608,1.16318,1.1686,1.15477,1.17145],"rs_score":0.34559},{"ticker":"GL","dates":["2025-03-04","2025-03-05","2025-03-06","2025-03-07","2025-03-10","2025-03-11","2025-03-12","2025-03-13","2025-03-14","2025-03-17","2025-03-18","2025-03-19","2025-03-20","2025-03-21","2025-03-24","2025-03-25","2025-03-26","2025-03-27","2025-03-28","2025-03-31","2025-04-01","2025-04-02","2025-04-03","2025-04-04","2025-04-07","2025-04-08","2025-04-09","2025-04-10","2025-04-11","2025-04-14","2025-04-15","2025-04-16","2025-04-17","2025-04-21","2025-04-22","2025-04-23","2025-04-24","2025-04-25","2025-04-28","2025-04-29","2025-04-30","2025-05-01","2025-05-02","2025-05-05","2025-05-06","2025-05-07","2025-05-08","2025-05-09","2025-05-12","2025-05-13","2025-05-14","2025-05-15","2025-05-16","2025-05-19","2025-05-20","2025-05-21","2025-05-22","2025-05-23","2025-05-27","2025-05-28","2025-05-29","2025-05-30","2025-06-02","2025-06-03","2025-06-04","2025-06-05","2025-06-06","2025-06-09","2025-06-10","2025-06-11","2025-06-12","2025-06-13","2025-06-16","2025-06-17","2025-06-18","2025-06-20","2025-06-23","2025-06-24","2025-06-25","2025-06-26","2025-06-27","2025-06-30","2025-07-01","2025-07-02","2025-07-03","2025-07-07","2025-07-08","2025-07-09","2025-07-10","2025-07-11","2025-07-14","2025-07-15","2025-07-16","2025-07-17","2025-07-18","2025-07-21","2025-07-22","2025-07-23","2025-07-24","2025-07-25","2025-07-28","2025-07-29","2025-07-30","2025-07-31","2025-08-01","2025-08-04","2025-08-05","2025-08-06","2025-08-07","2025-08-08","2025-08-11","2025-08-12","2025-08-13","2025-08-14","2025-08-15","2025-08-18","2025-08-19","2025-08-20","2025-08-21","2025-08-22","2025-08-25","2025-08-26","2025-08-27","2025-08-28","2025-08-29","2025-09-02","2025-09-03","2025-09-04","2025-09-05","2025-09-08","2025-09-09","2025-09-10","2025-09-11","2025-09-12","2025-09-15","2025-09-16","2025-09-17","2025-09-18","2025-09-19","2025-09-22","2025-09-23","2025-09-24","2025-09-25","2025-09-26","2025-09-29","2025-09-30","2025-10-01","2025-10-02","2025-10-03","2025-10-06","2025-10-07","2025-10-08","2025-10-09","2025-10-10","2025-10-13","2025-10-14","2025-10-15","2025-10-16","2025-10-17","2025-10-20","2025-10-21","2025-10-22","2025-10-23","2025-10-24","2025-10-27","2025-10-28","2025-10-29","2025-10-30","2025-10-31","2025-11-03","2025-11-04","2025-11-05","2025-11-06","2025-11-07","2025-11-10","2025-11-11","2025-11-12","2025-11-13","2025-11-14","2025-11-17","2025-11-18","2025-11-19","2025-11-20","2025-11-21","2025-11-24","2025-11-25","2025-11-26","2025-11-28","2025-12-01","2025-12-02","2025-12-03","2025-12-04","2025-12-05","2025-12-08","2025-12-09","2025-12-10","2025-12-11","2025-12-12","2025-12-15","2025-12-16","2025-12-17","2025-12-18","2025-12-19","2025-12-22","2025-12-23","2025-12-24","2025-12-26","2025-12-29","2025-12-30","2025-12-31","2026-01-02","2026-01-05","2026-01-06","2026-01-07","2026-01-08","2026-01-09","2026-01-12","2026-01-13","2026-01-14","2026-01-15"],"close":[124.15,126.22,124.43,125.49,122.58,124.57,122.35,121.95,125.41,127.62,126.97,127.4,128.6,126.83,129.79,129.9,130.53,131.42,129.77,131.72,132.13,133.09,127.51,117.22,114.33,113.29,122.63,118.6,119.5,121.23,122.79,121.22,121.25,117.17,121.68,122.79,123.92,122.96,123.6,123.97,123.34,117.72,121.83,121.49,120.34,120.96,121.23,121.94,120.72,120.09,119.28,120.57,122.07,122.21,122.19,120.2,119.56,119.41,122.26,120.05,120.97,121.87,122.24,122.8,120.29,119.77,121.7,120.66,120.09,119.78,120.77,119.79,120.63,119.41,119.71,120.59,122.11,122.91,121.42,123.04,123.89,124.29,124.9,120.29,121.2,121.21,121.09,117.6,119.13,118.13,120.69,117.74,119.9,121.6,122.09,120.29,122.83,124.81,131.52,135.13,134.16,143.27,141.05,140.47,137.24,139.34,139.51,141.23,140.5,140.55,139.05,139.74,139.0,138.56,135.43,135.99,136.77,139.1,139.62,141.24,139.39,139.69,140.49,140.46,139.95,139.95,140.57,141.45,139.81,140.37,140.46,139.02,142.49,142.27,142.43,140.86,142.8,143.63,145.43,145.25,146.55,143.3,143.03,144.56,143.52,142.97,140.98,139.44,137.58,134.0,135.64,136.03,136.45,136.0,136.46,139.87,138.1,133.61,134.78,135.43,136.01,135.63,135.7,133.62,134.99,134.37,131.73,132.44,131.51,130.64,133.38,133.75,131.83,132.24,132.77,132.31,133.97,133.16,131.81,131.43,131.85,130.74,130.37,132.42,133.27,135.37,134.87,134.73,132.53,131.15,130.82,130.82,131.37,133.02,133.09,134.91,139.04,139.46,140.65,140.74,138.73,138.53,139.64,142.53,142.37,143.5,142.21,141.76,141.46,139.86,138.42,140.63,139.64,139.76,142.47,141.95,142.87,141.93,142.41,139.82],"ma50":[118.18,118.62,118.99,119.31,119.57,119.85,120.08,120.33,120.64,120.96,121.25,121.57,121.92,122.23,122.54,122.89,123.24,123.59,123.86,124.15,124.43,124.7,124.84,124.81,124.71,124.56,124.58,124.52,124.46,124.44,124.45,124.43,124.39,124.33,124.3,124.31,124.36,124.39,124.39,124.43,124.42,124.3,124.25,124.23,124.18,124.13,124.11,124.07,123.93,123.76,123.67,123.55,123.51,123.44,123.43,123.35,123.29,123.24,123.18,123.03,122.91,122.79,122.67,122.59,122.4,122.19,122.02,121.8,121.61,121.37,121.14,120.88,120.74,120.78,120.89,121.04,121.03,121.11,121.15,121.19,121.21,121.27,121.34,121.41,121.4,121.36,121.31,121.2,121.11,120.99,120.94,120.94,120.9,120.91,120.94,120.93,120.96,121.02,121.23,121.53,121.83,122.29,122.66,123.03,123.33,123.71,124.11,124.55,124.91,125.32,125.69,126.04,126.38,126.69,127.0,127.32,127.62,127.99,128.38,128.81,129.18,129.58,129.98,130.4,130.8,131.19,131.56,131.93,132.3,132.65,132.98,133.27,133.62,134.06,134.49,134.88,135.31,135.84,136.36,136.9,137.42,137.93,138.39,138.85,139.28,139.74,140.1,140.39,140.51,140.49,140.52,140.38,140.28,140.19,140.18,140.19,140.16,140.01,139.89,139.79,139.73,139.65,139.58,139.48,139.47,139.44,139.34,139.21,139.05,138.83,138.71,138.6,138.42,138.26,138.11,137.96,137.83,137.66,137.5,137.32,137.15,136.99,136.74,136.55,136.36,136.25,136.1,135.92,135.66,135.38,135.06,134.81,134.58,134.35,134.14,133.98,133.94,133.94,134.0,134.14,134.2,134.25,134.31,134.44,134.56,134.63,134.72,134.88,135.01,135.1,135.15,135.25,135.33,135.45,135.6,135.75,135.98,136.17,136.38,136.57],"ma150":[108.91,109.13,109.33,109.55,109.75,109.97,110.2,110.42,110.66,110.9,111.14,111.38,111.61,111.83,112.06,112.28,112.49,112.72,112.94,113.15,113.36,113.57,113.74,113.83,113.89,113.95,114.06,114.15,114.25,114.37,114.5,114.63,114.76,114.86,114.98,115.09,115.21,115.32,115.43,115.55,115.65,115.71,115.8,115.88,115.99,116.09,116.21,116.32,116.42,116.51,116.62,116.73,116.83,116.93,117.03,117.11,117.16,117.22,117.31,117.38,117.45,117.52,117.6,117.69,117.79,117.88,117.98,118.07,118.17,118.27,118.39,118.49,118.56,118.63,118.7,118.78,118.85,118.94,119.02,119.11,119.21,119.31,119.42,119.49,119.56,119.63,119.69,119.73,119.78,119.84,119.91,119.99,120.08,120.19,120.31,120.42,120.54,120.68,120.85,121.04,121.23,121.49,121.72,121.93,122.11,122.3,122.49,122.71,122.91,123.1,123.28,123.47,123.66,123.84,123.98,124.14,124.29,124.46,124.62,124.78,124.92,125.05,125.19,125.33,125.47,125.6,125.72,125.85,125.97,126.09,126.21,126.32,126.45,126.6,126.73,126.85,126.99,127.14,127.29,127.44,127.6,127.72,127.85,128.0,128.13,128.26,128.39,128.49,128.56,128.6,128.67,128.74,128.82,128.89,128.98,129.08,129.19,129.27,129.33,129.38,129.44,129.5,129.54,129.59,129.62,129.65,129.66,129.67,129.68,129.67,129.68,129.68,129.71,129.81,129.94,130.06,130.14,130.24,130.32,130.39,130.45,130.51,130.57,130.67,130.75,130.83,130.91,130.98,131.04,131.09,131.14,131.23,131.29,131.37,131.45,131.55,131.67,131.78,131.92,132.05,132.18,132.3,132.42,132.56,132.69,132.85,133.0,133.15,133.27,133.41,133.52,133.65,133.76,133.88,134.02,134.17,134.31,134.45,134.6,134.74],"ma200":[102.64,102.84,103.04,103.24,103.42,103.62,103.81,104.02,104.23,104.45,104.68,104.9,105.13,105.35,105.59,105.82,106.07,106.32,106.56,106.82,107.07,107.34,107.59,107.77,107.94,108.1,108.29,108.47,108.65,108.84,109.04,109.24,109.43,109.6,109.79,110.0,110.22,110.42,110.62,110.82,111.0,111.16,111.33,111.49,111.65,111.81,111.97,112.14,112.3,112.45,112.6,112.74,112.88,113.02,113.17,113.32,113.47,113.62,113.79,113.93,114.08,114.23,114.38,114.52,114.64,114.76,114.87,114.99,115.1,115.21,115.31,115.4,115.49,115.57,115.64,115.72,115.8,115.89,115.97,116.08,116.18,116.29,116.41,116.5,116.58,116.66,116.73,116.79,116.85,116.91,116.97,117.02,117.08,117.14,117.23,117.3,117.39,117.49,117.63,117.77,117.92,118.12,118.29,118.46,118.6,118.76,118.9,119.05,119.21,119.36,119.51,119.65,119.79,119.94,120.09,120.24,120.39,120.55,120.72,120.91,121.09,121.26,121.41,121.57,121.72,121.88,122.03,122.19,122.34,122.5,122.65,122.8,122.97,123.13,123.29,123.44,123.6,123.76,123.93,124.1,124.29,124.48,124.66,124.86,125.05,125.25,125.43,125.6,125.77,125.9,126.05,126.21,126.36,126.49,126.63,126.77,126.91,127.03,127.16,127.28,127.39,127.51,127.64,127.75,127.85,127.96,128.06,128.15,128.22,128.29,128.37,128.44,128.49,128.56,128.63,128.69,128.75,128.81,128.85,128.9,128.95,128.99,129.03,129.09,129.14,129.2,129.27,129.34,129.38,129.43,129.46,129.5,129.53,129.58,129.64,129.69,129.78,129.85,129.92,129.98,130.05,130.12,130.19,130.28,130.38,130.47,130.57,130.67,130.75,130.81,130.87,130.93,130.99,131.05,131.12,131.18,131.24,131.29,131.36,131.4],"rs_line":[1.0,1.00586,1.00952,1.01244,1.01603,1.04118,1.01722,1.0276,1.03537,1.04555,1.05159,1.04378,1.05667,1.04492,1.05049,1.04886,1.06668,1.07681,1.08515,1.09411,1.09442,1.09544,1.10392,1.07794,1.05324,1.06026,1.0386,1.0505,1.03992,1.04484,1.06125,1.0715,1.07024,1.05945,1.07232,1.06559,1.05323,1.03758,1.04258,1.03915,1.03346,0.97943,0.9988,1.00176,1.00064,1.00158,0.99687,1.00399,0.96215,0.95085,0.94323,0.9488,0.95455,0.9546,0.95767,0.95822,0.95274,0.95808,0.96097,0.94909,0.9526,0.96077,0.95829,0.95722,0.9379,0.93838,0.94381,0.9349,0.92524,0.92549,0.92945,0.93233,0.93002,0.92855,0.93102,0.94285,0.9454,0.9412,0.92926,0.93435,0.93616,0.93471,0.9396,0.90084,0.90055,0.90739,0.90699,0.8756,0.8845,0.88016,0.89753,0.87935,0.89249,0.89964,0.90393,0.88892,0.90756,0.91441,0.96325,0.98553,0.9787,1.04792,1.03298,1.03261,1.02567,1.02578,1.03226,1.03705,1.03255,1.02493,1.016,1.01028,1.0015,0.99824,0.97798,0.98224,0.99326,1.01287,1.02076,1.01698,1.0081,1.00605,1.00952,1.00574,1.0081,1.01563,1.01463,1.01252,1.00368,1.00523,1.00356,0.99041,1.00676,1.00554,1.00134,0.99167,1.00658,1.00772,1.01814,1.01209,1.02674,1.00717,1.00993,1.01492,1.00479,0.99719,0.97997,0.96815,0.95525,0.92707,0.94191,0.93901,0.94465,0.96769,0.95629,0.98139,0.96468,0.93972,0.9426,0.93739,0.94142,0.9437,0.93862,0.91674,0.91534,0.90872,0.89044,0.9052,0.8959,0.88831,0.91782,0.91718,0.91382,0.91576,0.90531,0.90011,0.9109,0.92067,0.91148,0.9174,0.92813,0.91677,0.92833,0.93362,0.92599,0.93181,0.92201,0.91605,0.90523,0.89414,0.88882,0.88817,0.89021,0.90411,0.90536,0.9117,0.93743,0.95048,0.96004,0.96328,0.96009,0.95152,0.95334,0.96705,0.96157,0.9658,0.95722,0.9576,0.95674,0.95298,0.94144,0.95015,0.93788,0.94172,0.96008,0.95029,0.95495,0.95057,0.95849,0.9385],"rs_score":0.03714}],"analyst_panel":[{"ticker":"HII","consensus":"Hold","analyst_count":27,"target_consensus":344.0,"target_high":412.0,"target_low":264.0},{"ticker":"IVZ","consensus":"Hold","analyst_count":28,"target_consensus":27.97,"target_high":31.0,"target_low":24.0},{"ticker":"WYNN","consensus":"Buy","analyst_count":45,"target_consensus":147.67,"target_high":164.0,"target_low":127.0},{"ticker":"TKO","consensus":"Buy","analyst_count":18,"target_consensus":228.1,"target_high":250.0,"target_low":210.0},{"ticker":"HAS","consensus":"Buy","analyst_count":32,"target_consensus":96.33,"target_high":99.0,"target_low":94.0},{"ticker":"PSKY","consensus":"Sell","analyst_count":28,"target_consensus":13.5,"target_high":16.0,"target_low":12.0},{"ticker":"ALLE","consensus":"Hold","analyst_count":22,"target_consensus":185.0,"target_high":190.0,"target_low":180.0},{"ticker":"GL","consensus":"Buy","analyst_count":28,"target_consensus":167.0,"target_high":176.0,"target_low":158.0},{"ticker":"BEN","consensus":"Hold","analyst_count":27,"target_consensus":25.0,"target_high":25.0,"target_low":25.0},{"ticker":"UHS","consensus":"Hold","analyst_count":43,"target_consensus":241.5,"target_high":274.0,"target_low":203.0}],"records":[{"ticker":"HII","momentum_12_1":0.66722,"quality_raw":null,"value_raw":null,"composite_score":1.02007,"rs_score":0.93253,"ma_50":333.81,"ma_150":290.53,"ma_200":273.05,"sepa_pass":true,"rank":1,"action":"BUY"},{"ticker":"IVZ","momentum_12_1":0.57057,"quality_raw":null,"value_raw":null,"composite_score":0.88669,"rs_score":0.58359,"ma_50":25.68,"ma_150":22.37,"ma_200":20.32,"sepa_pass":true,"rank":2,"action":"BUY"},{"ticker":"WYNN","momentum_12_1":0.5434,"quality_raw":null,"value_raw":null,"composite_score":0.8492,"rs_score":0.24581,"ma_50":123.43,"ma_150":117.08,"ma_200":108.74,"sepa_pass":false,"rank":3,"action":"BUY"},{"ticker":"TKO","momentum_12_1":0.44958,"quality_raw":null,"value_raw":null,"composite_score":0.71974,"rs_score":0.27055,"ma_50":198.34,"ma_150":188.37,"ma_200":180.68,"sepa_pass":true,"rank":4,"action":"BUY"},{"ticker":"HAS","momentum_12_1":0.43236,"quality_raw":null,"value_raw":null,"composite_score":0.69597,"rs_score":0.34559,"ma_50":81.49,"ma_150":77.95,"ma_200":73.78,"sepa_pass":true,"rank":5,"action":"BUY"},{"ticker":"PSKY","momentum_12_1":0.31115,"quality_raw":null,"value_raw":null,"composite_score":0.52872,"rs_score":-0.08031,"ma_50":14.23,"ma_150":14.71,"ma_200":13.94,"sepa_pass":false,"rank":6,"action":"BUY"},{"ticker":"ALLE","momentum_12_1":0.25672,"quality_raw":null,"value_raw":null,"composite_score":0.45361,"rs_score":0.07101,"ma_50":162.38,"ma_150":163.58,"ma_200":156.66,"sepa_pass":false,"rank":7,"action":"BUY"},{"ticker":"GL","momentum_12_1":0.23345,"quality_raw":null,"value_raw":null,"composite_score":0.42149,"rs_score":0.03714,"ma_50":136.57,"ma_150":134.74,"ma_200":131.4,"sepa_pass":true,"rank":8,"action":"BUY"},{"ticker":"BEN","momentum_12_1":0.2169,"quality_raw":null,"value_raw":null,"composite_score":0.39865,"rs_score":0.14894,"ma_50":23.44,"ma_150":23.86,"ma_200":22.91,"sepa_pass":false,"rank":9,"action":"BUY"},{"ticker":"UHS","momentum_12_1":0.21563,"quality_raw":null,"value_raw":null,"composite_score":0.3969,"rs_score":-0.08026,"ma_50":224.8,"ma_150":199.04,"ma_200":194.76,"sepa_pass":false,"rank":10,"action":"BUY"},{"ticker":"EVRG","momentum_12_1":0.21091,"quality_raw":null,"value_raw":null,"composite_score":0.39039,"rs_score":0.04901,"ma_50":74.57,"ma_150":73.11,"ma_200":71.59,"sepa_pass":true,"rank":11,"action":"BUY"},{"ticker":"AES","momentum_12_1":0.16962,"quality_raw":null,"value_raw":null,"composite_score":0.33341,"rs_score":0.02954,"ma_50":14.0,"ma_150":13.38,"ma_200":12.7,"sepa_pass":true,"rank":12,"action":"BUY"},{"ticker":"SOLV","momentum_12_1":0.16669,"quality_raw":null,"value_raw":null,"composite_score":0.32937,"rs_score":-0.043,"ma_50":80.12,"ma_150":75.39,"ma_200":74.04,"sepa_pass":true,"rank":13,"action":"BUY"},{"ticker":"NDSN","momentum_12_1":0.14647,"quality_raw":null,"value_raw":null,"composite_score":0.30147,"rs_score":0.12195,"ma_50":240.3,"ma_150":228.6,"ma_200":220.28,"sepa_pass":true,"rank":14,"action":"BUY"},{"ticker":"AIZ","momentum_12_1":0.1393,"quality_raw":null,"value_raw":null,"composite_score":0.29157,"rs_score":-0.02926,"ma_50":230.65,"ma_150":213.51,"ma_200":209.2,"sepa_pass":true,"rank":15,"action":"BUY"},{"ticker":"LNT","momentum_12_1":0.13566,"quality_raw":null,"value_raw":null,"composite_score":0.28655,"rs_score":-0.02862,"ma_50":66.33,"ma_150":65.35,"ma_200":64.34,"sepa_pass":true,"rank":16,"action":"BUY"},{"ticker":"MGM","momentum_12_1":0.12931,"quality_raw":null,"value_raw":null,"composite_score":0.27778,"rs_score":-0.11924,"ma_50":34.85,"ma_150":35.17,"ma_200":34.19,"sepa_pass":false,"rank":17,"action":"BUY"},{"ticker":"TXT","momentum_12_1":0.12686,"quality_raw":null,"value_raw":null,"composite_score":0.2744,"rs_score":0.00984,"ma_50":85.73,"ma_150":82.8,"ma_200":79.84,"sepa_pass":true,"rank":18,"action":"BUY"},{"ticker":"CRL","momentum_12_1":0.1127,"quality_raw":null,"value_raw":null,"composite_score":0.25487,"rs_score":0.06586,"ma_50":189.45,"ma_150":171.47,"ma_200":161.0,"sepa_pass":true,"rank":19,"action":"BUY"},{"ticker":"JKHY","momentum_12_1":0.08865,"quality_raw":null,"value_raw":null,"composite_score":0.22167,"rs_score":-0.0795,"ma_50":177.78,"ma_150":168.76,"ma_200":170.84,"sepa_pass":false,"rank":20,"action":"BUY"},{"ticker":"HSIC","momentum_12_1":0.08587,"quality_raw":null,"value_raw":null,"composite_score":0.21784,"rs_score":-0.09348,"ma_50":74.85,"ma_150":70.47,"ma_200":69.88,"sepa_pass":false,"rank":21,"action":"HOLD"},{"ticker":"HST","momentum_12_1":0.0787,"quality_raw":null,"value_raw":null,"composite_score":0.20795,"rs_score":-0.12016,"ma_50":17.85,"ma_150":16.91,"ma_200":16.34,"sepa_pass":false,"rank":22,"action":"HOLD"},{"ticker":"HOLX","momentum_12_1":0.07108,"quality_raw":null,"value_raw":null,"composite_score":0.19743,"rs_score":-0.12037,"ma_50":74.68,"ma_150":69.67,"ma_200":66.95,"sepa_pass":false,"rank":23,"action":"HOLD"},{"ticker":"PNW","momentum_12_1":0.06163,"quality_raw":null,"value_raw":null,"composite_score":0.18439,"rs_score":-0.0755,"ma_50":88.75,"ma_150":89.74,"ma_200":90.31,"sepa_pass":false,"rank":24,"action":"HOLD"},{"ticker":"DPZ","momentum_12_1":0.05148,"quality_raw":null,"value_raw":null,"composite_score":0.17038,"rs_score":-0.20583,"ma_50":416.23,"ma_150":435.16,"ma_200":444.75,"sepa_pass":false,"rank":25,"action":"HOLD"},{"ticker":"PNR","momentum_12_1":0.04747,"quality_raw":null,"value_raw":null,"composite_score":0.16484,"rs_score":-0.12231,"ma_50":104.86,"ma_150":105.99,"ma_200":102.46,"sepa_pass":false,"rank":26,"action":"HOLD"},{"ticker":"MTCH","momentum_12_1":0.02935,"quality_raw":null,"value_raw":null,"composite_score":0.13984,"rs_score":-0.19187,"ma_50":32.7,"ma_150":33.84,"ma_200":32.81,"sepa_pass":false,"rank":27,"action":"HOLD"},{"ticker":"SMCI","momentum_12_1":0.02751,"quality_raw":null,"value_raw":null,"composite_score":0.13731,"rs_score":-0.22539,"ma_50":33.22,"ma_150":43.51,"ma_200":41.89,"sepa_pass":false,"rank":28,"action":"HOLD"},{"ticker":"FFIV","momentum_12_1":0.01898,"quality_raw":null,"value_raw":null,"composite_score":0.12554,"rs_score":-0.1275,"ma_50":251.39,"ma_150":289.57,"ma_200":285.34,"sepa_pass":false,"rank":29,"action":"HOLD"},{"ticker":"BXP","momentum_12_1":0.01892,"quality_raw":null,"value_raw":null,"composite_score":0.12545,"rs_score":-0.23427,"ma_50":69.64,"ma_150":70.55,"ma_200":69.34,"sepa_pass":false,"rank":30,"action":"HOLD"},{"ticker":"APA","momentum_12_1":0.0169,"quality_raw":null,"value_raw":null,"composite_score":0.12267,"rs_score":-0.14235,"ma_50":24.76,"ma_150":22.55,"ma_200":21.13,"sepa_pass":false,"rank":31,"action":"HOLD"},{"ticker":"GEN","momentum_12_1":0.0129,"quality_raw":null,"value_raw":null,"composite_score":0.11714,"rs_score":-0.21703,"ma_50":26.78,"ma_150":28.36,"ma_200":27.97,"sepa_pass":false,"rank":32,"action":"HOLD"},{"ticker":"J","momentum_12_1":0.01278,"quality_raw":null,"value_raw":null,"composite_score":0.11698,"rs_score":-0.13156,"ma_50":140.05,"ma_150":143.42,"ma_200":138.07,"sepa_pass":false,"rank":33,"action":"HOLD"},{"ticker":"SJM","momentum_12_1":-0.00226,"quality_raw":null,"value_raw":null,"composite_score":0.09623,"rs_score":-0.16087,"ma_50":101.91,"ma_150":104.76,"ma_200":106.87,"sepa_pass":false,"rank":34,"action":"HOLD"},{"ticker":"VTRS","momentum_12_1":-0.00512,"quality_raw":null,"value_raw":null,"composite_score":0.09228,"rs_score":-0.09346,"ma_50":11.46,"ma_150":10.32,"ma_200":9.82,"sepa_pass":false,"rank":35,"action":"HOLD"},{"ticker":"LW","momentum_12_1":-0.00602,"quality_raw":null,"value_raw":null,"composite_score":0.09104,"rs_score":-0.45466,"ma_50":52.97,"ma_150":55.53,"ma_200":55.02,"sepa_pass":false,"rank":36,"action":"HOLD"},{"ticker":"GNRC","momentum_12_1":-0.0129,"quality_raw":null,"value_raw":null,"composite_score":0.08155,"rs_score":-0.18323,"ma_50":150.99,"ma_150":164.31,"ma_200":153.09,"sepa_pass":false,"rank":37,"action":"HOLD"},{"ticker":"DAY","momentum_12_1":-0.01716,"quality_raw":null,"value_raw":null,"composite_score":0.07566,"rs_score":-0.20676,"ma_50":69.08,"ma_150":65.08,"ma_200":63.13,"sepa_pass":false,"rank":38,"action":"HOLD"},{"ticker":"FRT","momentum_12_1":-0.02943,"quality_raw":null,"value_raw":null,"composite_score":0.05873,"rs_score":-0.2099,"ma_50":99.14,"ma_150":97.64,"ma_200":96.8,"sepa_pass":false,"rank":39,"action":"HOLD"},{"ticker":"AVY","momentum_12_1":-0.02969,"quality_raw":null,"value_raw":null,"composite_score":0.05838,"rs_score":-0.19024,"ma_50":178.0,"ma_150":173.77,"ma_200":174.08,"sepa_pass":false,"rank":40,"action":"HOLD"},{"ticker":"AOS","momentum_12_1":-0.03411,"quality_raw":null,"value_raw":null,"composite_score":0.05228,"rs_score":-0.17864,"ma_50":67.19,"ma_150":69.08,"ma_200":68.23,"sepa_pass":false,"rank":41,"action":"HOLD"},{"ticker":"REG","momentum_12_1":-0.03411,"quality_raw":null,"value_raw":null,"composite_score":0.05228,"rs_score":-0.20049,"ma_50":69.39,"ma_150":70.66,"ma_200":70.9,"sepa_pass":false,"rank":42,"action":"HOLD"},{"ticker":"NWS","momentum_12_1":-0.03749,"quality_raw":null,"value_raw":null,"composite_score":0.04761,"rs_score":-0.17949,"ma_50":29.6,"ma_150":31.78,"ma_200":31.68,"sepa_pass":false,"rank":43,"action":"HOLD"},{"ticker":"AKAM","momentum_12_1":-0.04471,"quality_raw":null,"value_raw":null,"composite_score":0.03764,"rs_score":-0.17854,"ma_50":86.93,"ma_150":80.21,"ma_200":79.49,"sepa_pass":false,"rank":44,"action":"HOLD"},{"ticker":"OMC","momentum_12_1":-0.0505,"quality_raw":null,"value_raw":null,"composite_score":0.02966,"rs_score":-0.23528,"ma_50":76.33,"ma_150":75.76,"ma_200":75.47,"sepa_pass":false,"rank":45,"action":"HOLD"},{"ticker":"BALL","momentum_12_1":-0.05149,"quality_raw":null,"value_raw":null,"composite_score":0.02829,"rs_score":-0.16126,"ma_50":50.63,"ma_150":52.2,"ma_200":51.98,"sepa_pass":false,"rank":46,"action":"HOLD"},{"ticker":"NWSA","momentum_12_1":-0.05445,"quality_raw":null,"value_raw":null,"composite_score":0.02421,"rs_score":-0.21988,"ma_50":26.03,"ma_150":27.9,"ma_200":27.72,"sepa_pass":false,"rank":47,"action":"HOLD"},{"ticker":"EPAM","momentum_12_1":-0.06464,"quality_raw":null,"value_raw":null,"composite_score":0.01015,"rs_score":-0.24,"ma_50":197.45,"ma_150":174.05,"ma_200":172.09,"sepa_pass":false,"rank":48,"action":"HOLD"},{"ticker":"KIM","momentum_12_1":-0.06861,"quality_raw":null,"value_raw":null,"composite_score":0.00467,"rs_score":-0.24491,"ma_50":20.33,"ma_150":21.17,"ma_200":21.05,"sepa_pass":false,"rank":49,"action":"HOLD"},{"ticker":"CPT","momentum_12_1":-0.06994,"quality_raw":null,"value_raw":null,"composite_score":0.00283,"rs_score":-0.22609,"ma_50":105.71,"ma_150":107.75,"ma_200":109.66,"sepa_pass":false,"rank":50,"action":"HOLD"},{"ticker":"EG","momentum_12_1":-0.08297,"quality_raw":null,"value_raw":null,"composite_score":-0.01515,"rs_score":-0.29264,"ma_50":324.14,"ma_150":334.01,"ma_200":337.2,"sepa_pass":false,"rank":51,"action":"HOLD"},{"ticker":"MOS","momentum_12_1":-0.08401,"quality_raw":null,"value_raw":null,"composite_score":-0.01658,"rs_score":-0.17282,"ma_50":24.87,"ma_150":30.78,"ma_200":30.87,"sepa_pass":false,"rank":52,"action":"HOLD"},{"ticker":"COO","momentum_12_1":-0.08506,"quality_raw":null,"value_raw":null,"composite_score":-0.01804,"rs_score":-0.26534,"ma_50":78.28,"ma_150":73.28,"ma_200":74.49,"sepa_pass":false,"rank":53,"action":"HOLD"},{"ticker":"ESS","momentum_12_1":-0.08859,"quality_raw":null,"value_raw":null,"composite_score":-0.0229,"rs_score":-0.2978,"ma_50":257.45,"ma_150":265.45,"ma_200":269.05,"sepa_pass":false,"rank":54,"action":"HOLD"},{"ticker":"SWK","momentum_12_1":-0.09968,"quality_raw":null,"value_raw":null,"composite_score":-0.03822,"rs_score":-0.16426,"ma_50":72.77,"ma_150":72.02,"ma_200":70.06,"sepa_pass":false,"rank":55,"action":"HOLD"},{"ticker":"MHK","momentum_12_1":-0.1122,"quality_raw":null,"value_raw":null,"composite_score":-0.05549,"rs_score":-0.20416,"ma_50":111.01,"ma_150":117.73,"ma_200":114.48,"sepa_pass":false,"rank":56,"action":"HOLD"},{"ticker":"ZBH","momentum_12_1":-0.11728,"quality_raw":null,"value_raw":null,"composite_score":-0.06249,"rs_score":-0.34145,"ma_50":91.64,"ma_150":96.17,"ma_200":96.6,"sepa_pass":false,"rank":57,"action":"HOLD"},{"ticker":"BBY","momentum_12_1":-0.11969,"quality_raw":null,"value_raw":null,"composite_score":-0.06582,"rs_score":-0.36608,"ma_50":73.42,"ma_150":73.27,"ma_200":71.88,"sepa_pass":false,"rank":58,"action":"HOLD"},{"ticker":"TAP","momentum_12_1":-0.12032,"quality_raw":null,"value_raw":null,"composite_score":-0.06669,"rs_score":-0.25454,"ma_50":46.71,"ma_150":47.84,"ma_200":50.04,"sepa_pass":false,"rank":59,"action":"HOLD"},{"ticker":"MAA","momentum_12_1":-0.12334,"quality_raw":null,"value_raw":null,"composite_score":-0.07086,"rs_score":-0.29427,"ma_50":133.91,"ma_150":139.5,"ma_200":144.07,"sepa_pass":false,"rank":60,"action":"HOLD"},{"ticker":"INVH","momentum_12_1":-0.13029,"quality_raw":null,"value_raw":null,"composite_score":-0.08046,"rs_score":-0.31415,"ma_50":27.48,"ma_150":29.53,"ma_200":30.55,"sepa_pass":false,"rank":61,"action":"HOLD"},{"ticker":"UDR","momentum_12_1":-0.1311,"quality_raw":null,"value_raw":null,"composite_score":-0.08157,"rs_score":-0.28881,"ma_50":35.7,"ma_150":37.55,"ma_200":38.54,"sepa_pass":false,"rank":62,"action":"HOLD"},{"ticker":"MRNA","momentum_12_1":-0.13175,"quality_raw":null,"value_raw":null,"composite_score":-0.08246,"rs_score":-0.04683,"ma_50":28.96,"ma_150":27.99,"ma_200":27.56,"sepa_pass":true,"rank":63,"action":"HOLD"},{"ticker":"MAS","momentum_12_1":-0.14421,"quality_raw":null,"value_raw":null,"composite_score":-0.09966,"rs_score":-0.25032,"ma_50":64.01,"ma_150":67.25,"ma_200":66.19,"sepa_pass":false,"rank":64,"action":"HOLD"},{"ticker":"IEX","momentum_12_1":-0.1671,"quality_raw":null,"value_raw":null,"composite_score":-0.13125,"rs_score":-0.27871,"ma_50":175.81,"ma_150":171.42,"ma_200":172.95,"sepa_pass":false,"rank":65,"action":"HOLD"},{"ticker":"NCLH","momentum_12_1":-0.16731,"quality_raw":null,"value_raw":null,"composite_score":-0.13153,"rs_score":-0.30941,"ma_50":20.57,"ma_150":22.47,"ma_200":21.26,"sepa_pass":false,"rank":66,"action":"HOLD"},{"ticker":"CF","momentum_12_1":-0.17097,"quality_raw":null,"value_raw":null,"composite_score":-0.13658,"rs_score":-0.27735,"ma_50":79.97,"ma_150":86.24,"ma_200":85.32,"sepa_pass":false,"rank":67,"action":"HOLD"},{"ticker":"MKTX","momentum_12_1":-0.17278,"quality_raw":null,"value_raw":null,"composite_score":-0.13909,"rs_score":-0.38277,"ma_50":172.21,"ma_150":185.7,"ma_200":194.06,"sepa_pass":false,"rank":68,"action":"HOLD"},{"ticker":"DOC","momentum_12_1":-0.17279,"quality_raw":null,"value_raw":null,"composite_score":-0.1391,"rs_score":-0.31763,"ma_50":17.05,"ma_150":17.68,"ma_200":17.73,"sepa_pass":false,"rank":69,"action":"HOLD"},{"ticker":"RVTY","momentum_12_1":-0.17933,"quality_raw":null,"value_raw":null,"composite_score":-0.14812,"rs_score":-0.23376,"ma_50":99.07,"ma_150":94.41,"ma_200":94.26,"sepa_pass":false,"rank":70,"action":"HOLD"},{"ticker":"LKQ","momentum_12_1":-0.18155,"quality_raw":null,"value_raw":null,"composite_score":-0.15119,"rs_score":-0.27913,"ma_50":30.49,"ma_150":32.04,"ma_200":34.15,"sepa_pass":false,"rank":71,"action":"HOLD"},{"ticker":"PAYC","momentum_12_1":-0.19901,"quality_raw":null,"value_raw":null,"composite_score":-0.17527,"rs_score":-0.43738,"ma_50":162.57,"ma_150":200.92,"ma_200":210.06,"sepa_pass":false,"rank":72,"action":"HOLD"},{"ticker":"HRL","momentum_12_1":-0.20027,"quality_raw":null,"value_raw":null,"composite_score":-0.17701,"rs_score":-0.3653,"ma_50":23.23,"ma_150":25.76,"ma_200":26.85,"sepa_pass":false,"rank":73,"action":"HOLD"},{"ticker":"TECH","momentum_12_1":-0.21464,"quality_raw":null,"value_raw":null,"composite_score":-0.19685,"rs_score":-0.25286,"ma_50":61.19,"ma_150":57.21,"ma_200":55.43,"sepa_pass":false,"rank":74,"action":"HOLD"},{"ticker":"CDW","momentum_12_1":-0.22341,"quality_raw":null,"value_raw":null,"composite_score":-0.20896,"rs_score":-0.47993,"ma_50":140.85,"ma_150":158.24,"ma_200":160.86,"sepa_pass":false,"rank":75,"action":"HOLD"},{"ticker":"ALGN","momentum_12_1":-0.22679,"quality_raw":null,"value_raw":null,"composite_score":-0.21361,"rs_score":-0.37429,"ma_50":153.32,"ma_150":153.83,"ma_200":159.13,"sepa_pass":false,"rank":76,"action":"HOLD"},{"ticker":"DVA","momentum_12_1":-0.25895,"quality_raw":null,"value_raw":null,"composite_score":-0.25799,"rs_score":-0.53569,"ma_50":116.77,"ma_150":128.91,"ma_200":132.28,"sepa_pass":false,"rank":77,"action":"HOLD"},{"ticker":"CPB","momentum_12_1":-0.27158,"quality_raw":null,"value_raw":null,"composite_score":-0.27542,"rs_score":-0.49591,"ma_50":29.05,"ma_150":30.94,"ma_200":32.21,"sepa_pass":false,"rank":78,"action":"HOLD"},{"ticker":"SWKS","momentum_12_1":-0.2752,"quality_raw":null,"value_raw":null,"composite_score":-0.28042,"rs_score":-0.55061,"ma_50":65.39,"ma_150":71.51,"ma_200":69.95,"sepa_pass":false,"rank":79,"action":"HOLD"},{"ticker":"CZR","momentum_12_1":-0.27659,"quality_raw":null,"value_raw":null,"composite_score":-0.28233,"rs_score":-0.42524,"ma_50":22.75,"ma_150":25.0,"ma_200":25.5,"sepa_pass":false,"rank":80,"action":"HOLD"},{"ticker":"ERIE","momentum_12_1":-0.28201,"quality_raw":null,"value_raw":null,"composite_score":-0.28981,"rs_score":-0.48096,"ma_50":286.6,"ma_150":321.55,"ma_200":335.13,"sepa_pass":false,"rank":81,"action":"SELL"},{"ticker":"POOL","momentum_12_1":-0.29834,"quality_raw":null,"value_raw":null,"composite_score":-0.31235,"rs_score":-0.4012,"ma_50":241.94,"ma_150":284.68,"ma_200":289.74,"sepa_pass":false,"rank":82,"action":"SELL"},{"ticker":"EMN","momentum_12_1":-0.30466,"quality_raw":null,"value_raw":null,"composite_score":-0.32108,"rs_score":-0.42541,"ma_50":62.9,"ma_150":66.66,"ma_200":69.8,"sepa_pass":false,"rank":83,"action":"SELL"},{"ticker":"CAG","momentum_12_1":-0.31132,"quality_raw":null,"value_raw":null,"composite_score":-0.33027,"rs_score":-0.52223,"ma_50":17.27,"ma_150":18.58,"ma_200":19.92,"sepa_pass":false,"rank":84,"action":"SELL"},{"ticker":"BLDR","momentum_12_1":-0.32149,"quality_raw":null,"value_raw":null,"composite_score":-0.3443,"rs_score":-0.35298,"ma_50":108.13,"ma_150":121.49,"ma_200":120.03,"sepa_pass":false,"rank":85,"action":"SELL"},{"ticker":"ZBRA","momentum_12_1":-0.32736,"quality_raw":null,"value_raw":null,"composite_score":-0.35239,"rs_score":-0.53271,"ma_50":253.34,"ma_150":291.3,"ma_200":284.8,"sepa_pass":false,"rank":86,"action":"SELL"},{"ticker":"FDS","momentum_12_1":-0.357,"quality_raw":null,"value_raw":null,"composite_score":-0.3933,"rs_score":-0.5512,"ma_50":282.45,"ma_150":336.75,"ma_200":362.47,"sepa_pass":false,"rank":87,"action":"SELL"},{"ticker":"CLX","momentum_12_1":-0.36037,"quality_raw":null,"value_raw":null,"composite_score":-0.39795,"rs_score":-0.4896,"ma_50":103.48,"ma_150":116.03,"ma_200":121.08,"sepa_pass":false,"rank":88,"action":"SELL"},{"ticker":"BAX","momentum_12_1":-0.36218,"quality_raw":null,"value_raw":null,"composite_score":-0.40045,"rs_score":-0.52378,"ma_50":18.92,"ma_150":23.14,"ma_200":24.93,"sepa_pass":false,"rank":89,"action":"SELL"},{"ticker":"GDDY","momentum_12_1":-0.37305,"quality_raw":null,"value_raw":null,"composite_score":-0.41545,"rs_score":-0.64543,"ma_50":125.04,"ma_150":142.7,"ma_200":151.99,"sepa_pass":false,"rank":90,"action":"SELL"},{"ticker":"LYB","momentum_12_1":-0.42451,"quality_raw":null,"value_raw":null,"composite_score":-0.48646,"rs_score":-0.51342,"ma_50":44.92,"ma_150":51.28,"ma_200":52.99,"sepa_pass":false,"rank":91,"action":"SELL"},{"ticker":"MOH","momentum_12_1":-0.43373,"quality_raw":null,"value_raw":null,"composite_score":-0.49918,"rs_score":-0.53012,"ma_50":158.99,"ma_150":184.41,"ma_200":218.01,"sepa_pass":false,"rank":92,"action":"SELL"},{"ticker":"KMX","momentum_12_1":-0.48574,"quality_raw":null,"value_raw":null,"composite_score":-0.57094,"rs_score":-0.57925,"ma_50":38.86,"ma_150":50.8,"ma_200":54.95,"sepa_pass":false,"rank":93,"action":"SELL"},{"ticker":"DECK","momentum_12_1":-0.49554,"quality_raw":null,"value_raw":null,"composite_score":-0.58447,"rs_score":-0.68903,"ma_50":94.96,"ma_150":101.7,"ma_200":104.44,"sepa_pass":false,"rank":94,"action":"SELL"},{"ticker":"IT","momentum_12_1":-0.5071,"quality_raw":null,"value_raw":null,"composite_score":-0.60043,"rs_score":-0.72808,"ma_50":237.34,"ma_150":275.45,"ma_200":312.11,"sepa_pass":false,"rank":95,"action":"SELL"},{"ticker":"ARE","momentum_12_1":-0.51528,"quality_raw":null,"value_raw":null,"composite_score":-0.61172,"rs_score":-0.60361,"ma_50":50.72,"ma_150":68.67,"ma_200":70.16,"sepa_pass":false,"rank":96,"action":"SELL"},{"ticker":"ENPH","momentum_12_1":-0.5207,"quality_raw":null,"value_raw":null,"composite_score":-0.6192,"rs_score":-0.64877,"ma_50":31.46,"ma_150":35.21,"ma_200":38.33,"sepa_pass":false,"rank":97,"action":"SELL"},{"ticker":"TTD","momentum_12_1":-0.69005,"quality_raw":null,"value_raw":null,"composite_score":-0.85288,"rs_score":-0.87873,"ma_50":39.46,"ma_150":54.06,"ma_200":56.17,"sepa_pass":false,"rank":98,"action":"SELL"},{"ticker":"IPG","momentum_12_1":null,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":null,"ma_50":null,"ma_150":null,"ma_200":null,"sepa_pass":true,"rank":99,"action":"SELL"},{"ticker":"WBA","momentum_12_1":null,"quality_raw":null,"value_raw":null,"composite_score":null,"rs_score":null,"ma_50":null,"ma_150":null,"ma_200":null,"sepa_pass":true,"rank":100,"action":"SELL"}]}],"as_of_date":"2026-01-15","fundamentals_as_of":"2026-01-13","analyst_as_of":"2026-01-15","signal":"Composite (momentum + quality + value)","price_failures":[]};
\ No newline at end of file
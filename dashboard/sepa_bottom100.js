@@ -7,6 +7,69 @@ const sepaCharts = document.getElementById("sepaCharts");
 
 let chartInstances = [];
 
+const DATA_ROOT = "data/";
+
+function fetchJson(path) {
+  return fetch(`${DATA_ROOT}${path}`).then((response) => {
+    if (!response.ok) {
+      throw new Error(`${response.status} loading ${path}`);
+    }
+    return response.json();
+  });
+}
+
+function loadScript(src) {
+  return new Promise((resolve, reject) => {
+    const script = document.createElement("script");
+    script.src = src;
+    script.onload = resolve;
+    script.onerror = () => reject(new Error(`Failed to load ${src}`));
+    document.body.appendChild(script);
+  });
+}
+
+// Falls back to the full bundle when the split files cannot be fetched,
+// e.g. when the page is opened from disk.
+function loadManifest() {
+  return fetchJson("manifest.json").catch(() => {
+    const bundle = window.TOP50_DATA
+      ? Promise.resolve()
+      : loadScript(`${DATA_ROOT}top50_signals.js`);
+    return bundle.then(() => window.TOP50_DATA);
+  });
+}
+
+// Charts written with CHART_ENCODING=f32 hold base64 float32 series that
+// index into a shared date axis; NaN marks missing points.
+function decodeFloat32(encoded) {
+  const binary = atob(encoded);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i += 1) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return new Float32Array(bytes.buffer);
+}
+
+function decodeChart(chart, axis) {
+  if (chart.encoding !== "f32") {
+    return chart;
+  }
+  return {
+    ticker: chart.ticker,
+    rs_score: chart.rs_score,
+    dates: axis.dates.slice(chart.axis_start, chart.axis_start + chart.length),
+    close: decodeFloat32(chart.close),
+    ma50: decodeFloat32(chart.ma50),
+    ma150: decodeFloat32(chart.ma150),
+    ma200: decodeFloat32(chart.ma200),
+    rs_line: decodeFloat32(chart.rs_line),
+  };
+}
+
+function formatNumber(value, digits) {
+  return value === null || value === undefined ? "-" : Number(value).toFixed(digits);
+}
+
 function renderSepaTable(rows) {
   if (!rows.length) {
     return "<p>No SEPA candidates</p>";
@@ -17,10 +80,10 @@ function renderSepaTable(rows) {
       (row) => `
       <tr>
         <td>${row.ticker}</td>
-        <td>${row.rs_score === null ? "-" : row.rs_score.toFixed(4)}</td>
-        <td>${row.ma_50 === null ? "-" : row.ma_50.toFixed(2)}</td>
-        <td>${row.ma_150 === null ? "-" : row.ma_150.toFixed(2)}</td>
-        <td>${row.ma_200 === null ? "-" : row.ma_200.toFixed(2)}</td>
+        <td>${formatNumber(row.rs_score, 4)}</td>
+        <td>${formatNumber(row.ma_50, 2)}</td>
+        <td>${formatNumber(row.ma_150, 2)}</td>
+        <td>${formatNumber(row.ma_200, 2)}</td>
       </tr>
     `
     )
@@ -58,9 +121,7 @@ function renderCharts(charts) {
       (item, index) => `
       <div class="chart-card">
         <h3>${item.ticker}</h3>
-        <p class="chart-meta">RS score: ${
-          item.rs_score === null ? "-" : item.rs_score.toFixed(4)
-        }</p>
+        <p class="chart-meta">RS score: ${formatNumber(item.rs_score, 4)}</p>
         <canvas id="chart-${index}" height="180"></canvas>
       </div>
     `
@@ -107,7 +168,7 @@ function renderCharts(charts) {
       ],
     };
 
-    if (item.rs_line && item.rs_line.some((val) => val !== null)) {
+    if (item.rs_line && item.rs_line.some((val) => Number.isFinite(val))) {
       data.datasets.push({
         label: "RS Line",
         data: item.rs_line,
@@ -184,19 +245,24 @@ function applyData(data) {
   universeSize.textContent = universe.universe_size;
   sepaCount.textContent = universe.sepa_count ?? 0;
 
-  sepaTable.innerHTML = renderSepaTable(universe.sepa_candidates || []);
-  renderCharts(universe.sepa_charts || []);
-}
+  const sepa = universe.sepa_candidates
+    ? Promise.resolve({ sepa_candidates: universe.sepa_candidates })
+    : fetchJson(universe.sepa_path);
+  const charts = universe.sepa_charts
+    ? Promise.resolve(universe.sepa_charts)
+    : Promise.all((universe.charts || []).map((chart) => fetchJson(chart.path)));
+  const axis = data.chart_axis_path
+    ? fetchJson(data.chart_axis_path)
+    : Promise.resolve(null);
 
-if (window.TOP50_DATA) {
-  applyData(window.TOP50_DATA);
-} else {
-  fetch("data/top50_signals.json")
-    .then((response) => response.json())
-    .then((data) => {
-      applyData(data);
-    })
-    .catch((error) => {
-      asOf.textContent = `Failed to load data: ${error}`;
-    });
+  return Promise.all([sepa, charts, axis]).then(([sepaData, chartData, axisData]) => {
+    sepaTable.innerHTML = renderSepaTable(sepaData.sepa_candidates || []);
+    renderCharts(chartData.map((chart) => decodeChart(chart, axisData)));
+  });
 }
+
+loadManifest()
+  .then((data) => applyData(data))
+  .catch((error) => {
+    asOf.textContent = `Failed to load data: ${error}`;
+  });
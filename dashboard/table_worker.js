@@ -0,0 +1,112 @@
+// Filtering, sorting and search for the full-universe table.
+//
+// Loaded by app.js as a Web Worker, and also as a plain script so the same
+// functions can run on the main thread where workers are unavailable (e.g.
+// index.html opened from disk). Rows are identified by their position in the
+// universe's records; a query returns the matching positions in display
+// order, which app.js renders a screenful at a time.
+
+const TABLE_SORT_FIELDS = ["ticker", "rank", "composite_score", "momentum_12_1"];
+
+function isMissing(value) {
+  return value === null || value === undefined;
+}
+
+function compareValues(a, b) {
+  if (a < b) {
+    return -1;
+  }
+  return a > b ? 1 : 0;
+}
+
+// Same layout as table_index() in scripts/update_top50_dashboard.py, for data
+// written before the generator emitted it and for the full bundle.
+function buildTableIndex(columns) {
+  const rows = columns.ticker.length;
+  const sort = {};
+  TABLE_SORT_FIELDS.forEach((field) => {
+    const values = columns[field];
+    const present = [];
+    const missing = [];
+    for (let i = 0; i < rows; i += 1) {
+      (isMissing(values[i]) ? missing : present).push(i);
+    }
+    present.sort((a, b) => compareValues(values[a], values[b]) || a - b);
+    sort[field] = present.concat(missing);
+  });
+  const actions = {};
+  columns.action.forEach((action, i) => {
+    (actions[action] = actions[action] || []).push(i);
+  });
+  return { rows, sort, actions };
+}
+
+function prepareTable(columns, index) {
+  const rows = columns.ticker.length;
+  const table = {
+    index: index && index.rows === rows ? index : buildTableIndex(columns),
+    tickers: columns.ticker.map((ticker) => String(ticker).toUpperCase()),
+    missing: {},
+    actionMasks: {},
+  };
+  // Orders keep missing values last, so descending order walks the present
+  // part backwards and still appends the missing ones.
+  TABLE_SORT_FIELDS.forEach((field) => {
+    table.missing[field] = columns[field].filter(isMissing).length;
+  });
+  Object.entries(table.index.actions).forEach(([action, positions]) => {
+    const mask = new Uint8Array(rows);
+    positions.forEach((i) => {
+      mask[i] = 1;
+    });
+    table.actionMasks[action] = mask;
+  });
+  return table;
+}
+
+function queryTable(table, query) {
+  const field = table.index.sort[query.sort] ? query.sort : "rank";
+  const order = table.index.sort[field];
+  const present = order.length - table.missing[field];
+  const mask =
+    query.action === "ALL" ? null : table.actionMasks[query.action] || new Uint8Array(0);
+  const search = query.search;
+  const result = new Int32Array(order.length);
+  let count = 0;
+
+  const visit = (i) => {
+    if ((mask && !mask[i]) || (search && !table.tickers[i].includes(search))) {
+      return;
+    }
+    result[count] = i;
+    count += 1;
+  };
+
+  if (query.descending) {
+    for (let k = present - 1; k >= 0; k -= 1) {
+      visit(order[k]);
+    }
+  } else {
+    for (let k = 0; k < present; k += 1) {
+      visit(order[k]);
+    }
+  }
+  for (let k = present; k < order.length; k += 1) {
+    visit(order[k]);
+  }
+  return result.slice(0, count);
+}
+
+if (typeof WorkerGlobalScope !== "undefined" && self instanceof WorkerGlobalScope) {
+  let table = null;
+
+  self.onmessage = (event) => {
+    const message = event.data;
+    if (message.type === "load") {
+      table = prepareTable(message.columns, message.index);
+    } else if (message.type === "query" && table) {
+      const rows = queryTable(table, message.query);
+      self.postMessage({ id: message.id, rows }, [rows.buffer]);
+    }
+  };
+}
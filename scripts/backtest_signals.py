@@ -0,0 +1,283 @@
+"""Vectorized backtest of the composite momentum/quality/value signal.
+
+Evaluates the same composite and BUY/SELL quintiles as the live refresh
+(compute_signal, then assign_actions) at every rebalance date in one pass
+over the date x ticker matrix. Prices come from the local price store and
+universes from the latest dashboard payload, so no API calls are made.
+
+Fundamentals are a single current snapshot and universes are today's
+constituents, so results carry look-ahead and survivorship bias.
+"""
+
+import argparse
+import json
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from update_top50_dashboard import (
+    KeyedCache,
+    build_indicator_panel,
+    fundamentals_frame,
+    load_price_store_index,
+    load_stored_prices,
+)
+
+PERIODS_PER_YEAR = {"monthly": 12, "weekly": 52}
+PRICE_FILL_LIMIT = 5
+
+
+def rebalance_dates(index: pd.DatetimeIndex, freq: str) -> pd.DatetimeIndex:
+    """Last trading day of each month (or week) in the index."""
+    periods = index.to_period("W" if freq == "weekly" else "M")
+    return pd.DatetimeIndex(index.to_series().groupby(periods).max().values)
+
+
+def cross_sectional_z(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Row-wise z-scores over masked entries, matching compute_signal's zscore.
+
+    Rows with no valid values or zero dispersion score 0 for every eligible
+    ticker; ineligible tickers are NaN.
+    """
+    masked = np.where(mask, values, np.nan)
+    count = np.sum(~np.isnan(masked), axis=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(masked, axis=1)
+        std = np.nanstd(masked, axis=1, ddof=1)
+        z = (masked - mean[:, None]) / std[:, None]
+    degenerate = (count == 0) | (std == 0)
+    z[degenerate[:, None] & mask] = 0.0
+    z[~mask] = np.nan
+    return z
+
+
+def score_rebalances(panel: dict, fundamentals: dict, tickers: list, dates) -> dict:
+    """Composite scores, ranks and actions for every rebalance date."""
+    close = panel["close"]
+    tickers = [t for t in tickers if t in close.columns]
+    momentum = panel["momentum_12_1"].loc[dates, tickers].to_numpy(dtype=float)
+    price = close.loc[dates, tickers].to_numpy(dtype=float)
+    eligible = ~np.isnan(momentum) & (np.nan_to_num(price) > 5)
+
+    metrics = fundamentals_frame(fundamentals, tickers)
+    pe = metrics["pe_ratio"].to_numpy()
+    pb = metrics["pb_ratio"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yields = np.vstack(
+            [np.where(pe > 0, 1.0 / pe, np.nan), np.where(pb > 0, 1.0 / pb, np.nan)]
+        )
+        margin = metrics["operating_margin"].fillna(metrics["profit_margin"])
+        quality_parts = np.vstack([metrics["roe"].to_numpy(), margin.to_numpy()])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        value = np.nanmean(yields, axis=0)
+        quality = np.nanmean(quality_parts, axis=0)
+
+    shape = momentum.shape
+    composite = (
+        cross_sectional_z(momentum, eligible)
+        + cross_sectional_z(np.broadcast_to(quality, shape), eligible)
+        + cross_sectional_z(np.broadcast_to(value, shape), eligible)
+    ) / 3.0
+
+    # The live ranking (assign_actions over compute_signal's frame) ranks
+    # every available ticker: scored ones by composite, best first, then the
+    # rest (unscored, or missing a factor) in ticker order. Quintiles are
+    # taken over all of them, so the bottom one can hold unscored names, and
+    # SELL wins where the two overlap in a tiny universe.
+    total = len(tickers)
+    n = max(1, total // 5)
+    by_name = np.argsort(tickers, kind="stable")
+    key = np.where(eligible & ~np.isnan(composite), -composite, np.inf)
+    order = by_name[np.argsort(key[:, by_name], axis=1, kind="stable")]
+    rank = np.empty(shape, dtype=float)
+    np.put_along_axis(
+        rank, order, np.broadcast_to(np.arange(1.0, total + 1), shape), axis=1
+    )
+    sell = rank > total - n
+    buy = (rank <= n) & ~sell
+
+    return {
+        "dates": pd.DatetimeIndex(dates),
+        "tickers": tickers,
+        "composite": composite,
+        "rank": rank,
+        "eligible": eligible,
+        "buy": buy,
+        "sell": sell,
+    }
+
+
+def basket_returns(forward: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    weights = mask & ~np.isnan(forward)
+    counts = weights.sum(axis=1)
+    sums = np.where(weights, forward, 0.0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 0, sums / counts, 0.0)
+
+
+def turnover(mask: np.ndarray) -> np.ndarray:
+    """One-way turnover of an equal-weight basket between rebalances."""
+    counts = mask.sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = np.where(counts > 0, mask / counts, 0.0)
+    changes = np.abs(np.diff(weights, axis=0)).sum(axis=1) / 2.0
+    return np.concatenate([[1.0 if counts[0, 0] else 0.0], changes])
+
+
+def max_drawdown(equity: pd.Series) -> float:
+    if equity.empty:
+        return 0.0
+    return float((equity / equity.cummax() - 1).min())
+
+
+def backtest_universe(
+    panel: dict, fundamentals: dict, tickers: list, freq: str = "monthly"
+) -> tuple:
+    """Equity curves and summary statistics for one universe."""
+    close = panel["close"]
+    first_signal = panel["momentum_12_1"].dropna(how="all").index.min()
+    if pd.isna(first_signal):
+        return pd.DataFrame(), {}
+    dates = rebalance_dates(close.index[close.index >= first_signal], freq)
+    if len(dates) < 2:
+        return pd.DataFrame(), {}
+
+    scores = score_rebalances(panel, fundamentals, tickers, dates)
+    filled = close.ffill(limit=PRICE_FILL_LIMIT).loc[dates]
+    prices = filled[scores["tickers"]].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        forward = prices[1:] / prices[:-1] - 1
+
+    buy = scores["buy"][:-1]
+    sell = scores["sell"][:-1]
+    eligible = scores["eligible"][:-1]
+    buy_ret = basket_returns(forward, buy)
+    sell_ret = basket_returns(forward, sell)
+    universe_ret = basket_returns(forward, eligible)
+
+    curve = pd.DataFrame(
+        {
+            "buy_return": buy_ret,
+            "sell_return": sell_ret,
+            "long_short_return": buy_ret - sell_ret,
+            "universe_return": universe_ret,
+            "buy_turnover": turnover(buy),
+            "sell_turnover": turnover(sell),
+        },
+        index=pd.DatetimeIndex(dates[1:], name="date"),
+    )
+    if "SPY" in filled.columns:
+        spy = filled["SPY"].to_numpy(dtype=float)
+        curve["spy_return"] = np.nan_to_num(spy[1:] / spy[:-1] - 1)
+    for leg in ["buy", "sell", "long_short", "universe", "spy"]:
+        if f"{leg}_return" in curve:
+            curve[f"{leg}_equity"] = (1 + curve[f"{leg}_return"]).cumprod()
+
+    # A pick "hits" when it beats the equal-weight universe over the period.
+    beat = forward > universe_ret[:, None]
+    valid_buy = buy & ~np.isnan(forward)
+    valid_sell = sell & ~np.isnan(forward)
+    years = len(curve) / PERIODS_PER_YEAR[freq]
+
+    def annualized(equity: pd.Series) -> float:
+        if equity.empty or years <= 0 or equity.iloc[-1] <= 0:
+            return 0.0
+        return float(equity.iloc[-1] ** (1 / years) - 1)
+
+    summary = {
+        "start": curve.index[0].date().isoformat(),
+        "end": curve.index[-1].date().isoformat(),
+        "rebalances": len(curve),
+        "avg_universe_size": float(eligible.sum(axis=1).mean()),
+        "buy_total_return": float(curve["buy_equity"].iloc[-1] - 1),
+        "buy_annualized_return": annualized(curve["buy_equity"]),
+        "buy_max_drawdown": max_drawdown(curve["buy_equity"]),
+        "long_short_total_return": float(curve["long_short_equity"].iloc[-1] - 1),
+        "long_short_annualized_return": annualized(curve["long_short_equity"]),
+        "universe_total_return": float(curve["universe_equity"].iloc[-1] - 1),
+        "avg_buy_turnover": float(curve["buy_turnover"].iloc[1:].mean())
+        if len(curve) > 1
+        else 0.0,
+        "buy_hit_rate": float((beat & valid_buy).sum() / max(1, valid_buy.sum())),
+        "sell_hit_rate": float((~beat & valid_sell).sum() / max(1, valid_sell.sum())),
+        "long_short_period_hit_rate": float((curve["long_short_return"] > 0).mean()),
+    }
+    return curve, summary
+
+
+def load_close_from_store(store_dir: str, tickers) -> pd.DataFrame:
+    index = load_price_store_index(store_dir)
+    close_data = {}
+    for ticker in tickers:
+        if ticker not in index:
+            continue
+        series = load_stored_prices(store_dir, ticker)
+        if series is not None and not series.empty:
+            close_data[ticker] = series
+    return pd.DataFrame(close_data).sort_index()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--freq", choices=sorted(PERIODS_PER_YEAR), default="monthly")
+    parser.add_argument("--store-dir", help="Price store (default .cache/prices)")
+    parser.add_argument("--payload", help="Dashboard payload listing universes")
+    parser.add_argument(
+        "--fundamentals", help="Fundamentals cache (.json or .sqlite)"
+    )
+    parser.add_argument("--out-dir", help="Output directory (default analysis_outputs)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    data_dir = os.path.join(root_dir, "dashboard", "data")
+    store_dir = args.store_dir or os.path.join(root_dir, ".cache", "prices")
+    payload_path = args.payload or os.path.join(data_dir, "top50_signals.json")
+    fundamentals_path = args.fundamentals or os.path.join(
+        data_dir, "fundamentals_cache.json"
+    )
+    out_dir = args.out_dir or os.path.join(root_dir, "analysis_outputs")
+
+    with open(payload_path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    universes = {
+        u["id"]: {"name": u["name"], "tickers": [r["ticker"] for r in u["records"]]}
+        for u in payload.get("universes", [])
+    }
+    base_path, ext = os.path.splitext(fundamentals_path)
+    backend = "sqlite" if ext == ".sqlite" else "json"
+    fundamentals = KeyedCache(base_path, backend).data()
+    if not fundamentals:
+        print("No fundamentals cache found; quality and value z-scores will be 0.")
+
+    all_tickers = sorted({t for u in universes.values() for t in u["tickers"]})
+    close = load_close_from_store(store_dir, all_tickers + ["SPY"])
+    if close.empty:
+        raise SystemExit(f"No stored prices under {store_dir}. Run a refresh first.")
+    panel = build_indicator_panel(close)
+
+    os.makedirs(out_dir, exist_ok=True)
+    summaries = {}
+    for universe_id, info in universes.items():
+        curve, summary = backtest_universe(
+            panel, fundamentals, info["tickers"], args.freq
+        )
+        if curve.empty:
+            continue
+        curve.to_csv(os.path.join(out_dir, f"backtest_{universe_id}_{args.freq}.csv"))
+        summaries[universe_id] = {"name": info["name"], **summary}
+
+    summary_path = os.path.join(out_dir, f"backtest_summary_{args.freq}.json")
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump({"freq": args.freq, "universes": summaries}, f, indent=2)
+    print(f"Wrote {summary_path} ({len(summaries)} universes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""Offline benchmark of the signal pipeline on synthetic market data.
+
+Generates close matrices (random walks with late listings, delistings and
+scattered gaps) and fundamentals at several scales, then times each stage
+of the refresh and records its peak traced memory. Results are written to
+analysis_outputs/benchmarks/ and can be compared against an earlier run to
+catch regressions. No network access or API key is needed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+import update_top50_dashboard as pipeline
+from update_top50_dashboard import (
+    CLOSE_LOOKBACK,
+    END_DATE,
+    IndicatorState,
+    SEPA_CHART_COUNT,
+    advance_indicator_state,
+    append_signal_history,
+    assemble_close_matrix,
+    assign_actions,
+    build_indicator_panel,
+    build_sepa_chart,
+    compute_signal,
+    frame_records,
+    peak_rss_mb,
+    write_dashboard_data,
+)
+
+TICKER_SCALES = [100, 1000, 5000]
+YEAR_SCALES = [3, 20]
+TRADING_DAYS_PER_YEAR = 252
+# A stage is flagged when it is this much slower than the baseline.
+REGRESSION_TOLERANCE = 0.25
+
+
+def synthetic_close(tickers: int, years: int, seed: int = 0) -> pd.DataFrame:
+    """Business-day close matrix of geometric random walks plus SPY.
+
+    About a fifth of the tickers list part-way through the window and a
+    twentieth are delisted before the end; 0.1% of the remaining bars are
+    missing at random.
+    """
+    rng = np.random.default_rng(seed)
+    days = years * TRADING_DAYS_PER_YEAR
+    index = pd.bdate_range(end=END_DATE, periods=days, name="date")
+    drift = rng.normal(0.0003, 0.0004, tickers + 1)
+    vol = rng.uniform(0.01, 0.035, tickers + 1)
+    returns = rng.standard_normal((days, tickers + 1)) * vol + drift
+    start = rng.uniform(3, 300, tickers + 1)
+    close = start * np.exp(np.cumsum(returns, axis=0))
+
+    rows = np.arange(days)[:, None]
+    listed = np.zeros(tickers + 1, dtype=int)
+    late = rng.random(tickers + 1) < 0.2
+    listed[late] = rng.integers(1, days, late.sum())
+    delisted = np.full(tickers + 1, days)
+    gone = rng.random(tickers + 1) < 0.05
+    delisted[gone] = rng.integers(days // 2, days, gone.sum())
+    listed[-1], delisted[-1] = 0, days  # SPY trades throughout
+    missing = (rows < listed) | (rows >= delisted) | (rng.random(close.shape) < 0.001)
+    close[missing] = np.nan
+
+    columns = [f"T{i:05d}" for i in range(tickers)] + ["SPY"]
+    return pd.DataFrame(close, index=index, columns=columns)
+
+
+def synthetic_fundamentals(tickers, seed: int = 0) -> dict:
+    """Fundamentals like fetch_fundamentals returns, with gaps and negatives."""
+    rng = np.random.default_rng(seed + 1)
+    fundamentals = {}
+    for ticker in tickers:
+        if rng.random() < 0.05:
+            continue
+        values = {
+            "pe_ratio": rng.normal(22, 15),
+            "pb_ratio": rng.lognormal(1.0, 0.8),
+            "roe": rng.normal(0.15, 0.2),
+            "operating_margin": rng.normal(0.15, 0.1),
+            "profit_margin": rng.normal(0.1, 0.1),
+        }
+        fundamentals[ticker] = {
+            key: None if rng.random() < 0.05 else float(value)
+            for key, value in values.items()
+        }
+    return fundamentals
+
+
+class StageTimer:
+    """Wall time and traced peak memory of each stage, best of the repeats."""
+
+    def __init__(self):
+        self.stages = {}
+
+    def run(self, name: str, func, *args):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        result = func(*args)
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        entry = self.stages.setdefault(name, {"seconds": seconds, "peak_mb": 0.0})
+        entry["seconds"] = round(min(entry["seconds"], seconds), 4)
+        entry["peak_mb"] = round(max(entry["peak_mb"], (peak - base) / 2**20), 1)
+        return result
+
+
+def benchmark_scale(
+    tickers: int,
+    years: int,
+    repeat: int,
+    chart_count: int,
+    dtype=np.float64,
+    lookback: int = None,
+) -> dict:
+    synthetic = synthetic_close(tickers, years)
+    close_data = {t: synthetic[t].dropna() for t in synthetic.columns}
+    del synthetic
+    universe = [t for t in close_data if t != "SPY"]
+    fundamentals = synthetic_fundamentals(universe)
+    timer = StageTimer()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for attempt in range(repeat):
+            close = timer.run(
+                "assemble_close_matrix",
+                assemble_close_matrix,
+                close_data,
+                dtype,
+                lookback,
+            )
+            spy_close = close["SPY"].dropna()
+            panel = timer.run("build_indicator_panel", build_indicator_panel, close)
+            # A daily refresh: the persisted state is one session behind.
+            state = IndicatorState.from_close(close.iloc[:-1])
+            timer.run("advance_indicator_state", advance_indicator_state, state, close)
+            ranked, latest_date = timer.run(
+                "compute_signal",
+                compute_signal,
+                close,
+                fundamentals,
+                universe,
+                spy_close,
+                panel,
+            )
+            ranked = assign_actions(ranked)
+            records = timer.run("frame_records", frame_records, ranked)
+
+            candidates = [r for r in records if r["sepa_pass"]][:chart_count]
+            charts = timer.run(
+                "build_sepa_charts",
+                lambda: [
+                    build_sepa_chart(panel, spy_close, r["ticker"], r["rs_score"])
+                    for r in candidates
+                ],
+            )
+            payload = {
+                "as_of_date": latest_date.date().isoformat(),
+                "universes": [
+                    {
+                        "id": "synthetic",
+                        "name": "Synthetic",
+                        "universe_size": len(records),
+                        "buy_count": sum(r["action"] == "BUY" for r in records),
+                        "sell_count": sum(r["action"] == "SELL" for r in records),
+                        "sepa_count": len(candidates),
+                        "sepa_candidates": candidates,
+                        "sepa_charts": [c for c in charts if c is not None],
+                        "analyst_panel": [],
+                        "records": records,
+                    }
+                ],
+                "price_failures": [],
+            }
+            out_dir = os.path.join(tmp_dir, f"out_{attempt}")
+            timer.run("write_outputs", write_dashboard_data, out_dir, payload)
+            history_dir = os.path.join(tmp_dir, f"history_{attempt}")
+            timer.run(
+                "append_signal_history",
+                append_signal_history,
+                history_dir,
+                "synthetic",
+                latest_date,
+                ranked,
+            )
+            del panel
+
+    return {
+        "tickers": tickers,
+        "years": years,
+        "days": len(close),
+        "close_mb": round(close.memory_usage(index=False).sum() / 2**20, 1),
+        "sepa_charts": len(candidates),
+        "stages": timer.stages,
+        "total_seconds": round(sum(s["seconds"] for s in timer.stages.values()), 4),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Print stage timings against a baseline run; return the regressions."""
+    regressions = []
+    for scale, current in results.items():
+        previous = baseline.get("results", {}).get(scale)
+        if not previous:
+            continue
+        for stage, entry in current["stages"].items():
+            before = previous["stages"].get(stage)
+            if not before or not before["seconds"]:
+                continue
+            ratio = entry["seconds"] / before["seconds"]
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag = "  REGRESSION"
+                regressions.append(f"{scale} {stage}")
+            print(
+                f"{scale:>12} {stage:<24} {before['seconds']:>9.4f}s "
+                f"-> {entry['seconds']:>9.4f}s  x{ratio:.2f}{flag}"
+            )
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--tickers",
+        type=int,
+        nargs="+",
+        default=TICKER_SCALES,
+        help="Ticker counts to run (default 100 1000 5000)",
+    )
+    parser.add_argument(
+        "--years",
+        type=int,
+        nargs="+",
+        default=YEAR_SCALES,
+        help="History lengths in years (default 3 20)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    parser.add_argument(
+        "--charts",
+        type=int,
+        default=SEPA_CHART_COUNT,
+        help="SEPA charts to build per scale",
+    )
+    parser.add_argument(
+        "--dtype",
+        choices=["float64", "float32"],
+        default="float64",
+        help="Close matrix dtype (CLOSE_DTYPE in the refresh)",
+    )
+    parser.add_argument(
+        "--full-history",
+        action="store_true",
+        help="Keep every session instead of the refresh's lookback window",
+    )
+    parser.add_argument("--compare", metavar="PATH", help="Baseline results file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=REGRESSION_TOLERANCE,
+        help="Allowed slowdown before a stage is flagged (default 0.25)",
+    )
+    parser.add_argument(
+        "--out-dir", help="Output directory (default analysis_outputs/benchmarks)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    out_dir = args.out_dir or os.path.join(root_dir, "analysis_outputs", "benchmarks")
+
+    tracemalloc.start()
+    results = {}
+    for years in args.years:
+        for tickers in args.tickers:
+            scale = f"{tickers}x{years}y"
+            results[scale] = benchmark_scale(
+                tickers,
+                years,
+                args.repeat,
+                args.charts,
+                np.dtype(args.dtype),
+                None if args.full_history else CLOSE_LOOKBACK,
+            )
+            print(f"{scale:>12} {results[scale]['total_seconds']:>9.3f}s")
+            for stage, entry in results[scale]["stages"].items():
+                print(
+                    f"{'':>12} {stage:<24} {entry['seconds']:>9.4f}s "
+                    f"{entry['peak_mb']:>8.1f} MB"
+                )
+    tracemalloc.stop()
+
+    created = datetime.now(timezone.utc)
+    report = {
+        "created_at": created.isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "pyarrow": pipeline.pyarrow is not None,
+        "orjson": pipeline.orjson is not None,
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "dtype": args.dtype,
+        "full_history": args.full_history,
+        "results": results,
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, f"benchmark_{created:%Y%m%dT%H%M%SZ}.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {out_path}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            raise SystemExit(f"{len(regressions)} stage(s) regressed.")
+
+
+if __name__ == "__main__":
+    main()
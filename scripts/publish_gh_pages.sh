@@ -10,7 +10,15 @@ if [ ! -d "$WORKTREE_DIR" ]; then
   exit 1
 fi
 
-rsync -a --delete --exclude ".git" --exclude "data/*cache*.json" "$ROOT_DIR/dashboard/" "$WORKTREE_DIR/"
+# The refresh lists the dashboard files whose content changed; when there
+# are none (weekends, holidays) there is nothing worth a commit.
+REPORT="$ROOT_DIR/dashboard/data/run_report.json"
+if [ -f "$REPORT" ] && python3 -c 'import json, sys; sys.exit(json.load(open(sys.argv[1])).get("changed_files", [None]) != [])' "$REPORT"; then
+  echo "No dashboard changes in the last refresh; nothing to publish."
+  exit 0
+fi
+
+rsync -a --delete --exclude ".git" --exclude "data/*cache*" "$ROOT_DIR/dashboard/" "$WORKTREE_DIR/"
 
 cd "$WORKTREE_DIR"
 
@@ -0,0 +1,332 @@
+"""Local HTTP/JSON query service over the latest dashboard rankings.
+
+Loads the records a refresh writes (manifest.json plus each universe's
+records.json) into in-memory indexes by ticker, universe, action, SEPA flag
+and composite score, and answers screener queries with pagination without
+touching the files again. A background thread watches the files and swaps
+in a freshly built index after a refresh rewrites them.
+
+Endpoints (all GET, JSON):
+  /health                  as-of date, record count, last load time
+  /universes               universe summaries from the manifest
+  /tickers/<ticker>        the ticker's record in every universe
+  /screen                  filtered, sorted, paginated records; parameters:
+                           universe, action, sepa_pass, min_score,
+                           max_score, sort (field, "-field" descending),
+                           offset, limit
+"""
+
+import argparse
+import bisect
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from update_top50_dashboard import RECORD_FLOAT_FIELDS, encode_json
+
+DEFAULT_PORT = 8050
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+RELOAD_SECONDS = 1.0
+SORT_FIELDS = set(RECORD_FLOAT_FIELDS) | {"ticker", "rank", "action", "universe"}
+UNIVERSE_FIELDS = [
+    "id",
+    "name",
+    "universe_size",
+    "buy_count",
+    "sell_count",
+    "sepa_count",
+]
+
+
+class QueryError(ValueError):
+    """A bad request parameter, answered with HTTP 400."""
+
+
+class SignalIndex:
+    """Immutable indexes over one load of the dashboard records.
+
+    Rows are numbered in universe order, then rank, so every index holds
+    ascending row ids and a filtered result is already in natural order.
+    A reload builds a new SignalIndex and swaps the reference, so queries
+    never see a half-built one.
+    """
+
+    def __init__(self, manifest: dict, records: dict):
+        self.as_of_date = manifest.get("as_of_date")
+        self.records_paths = [
+            universe["records_path"] for universe in manifest.get("universes", [])
+        ]
+        self.loaded_at = datetime.now(timezone.utc).isoformat()
+        self.universes = [
+            {field: universe.get(field) for field in UNIVERSE_FIELDS}
+            for universe in manifest.get("universes", [])
+        ]
+        self.rows = []
+        self.by_universe = {}
+        self.by_ticker = {}
+        self.by_action = {}
+        self.by_sepa = {True: [], False: []}
+        scored = []
+        for universe in self.universes:
+            ids = self.by_universe.setdefault(universe["id"], [])
+            for record in records.get(universe["id"], []):
+                row_id = len(self.rows)
+                self.rows.append({"universe": universe["id"], **record})
+                ids.append(row_id)
+                self.by_ticker.setdefault(record["ticker"].upper(), []).append(row_id)
+                self.by_action.setdefault(record.get("action"), []).append(row_id)
+                self.by_sepa[bool(record.get("sepa_pass"))].append(row_id)
+                if record.get("composite_score") is not None:
+                    scored.append((record["composite_score"], row_id))
+        scored.sort()
+        self.scores = [score for score, _ in scored]
+        self.score_ids = [row_id for _, row_id in scored]
+
+    def score_range(self, low: float = None, high: float = None) -> set:
+        start = 0 if low is None else bisect.bisect_left(self.scores, low)
+        stop = len(self.scores)
+        if high is not None:
+            stop = bisect.bisect_right(self.scores, high)
+        return set(self.score_ids[start:stop])
+
+    def ticker(self, ticker: str) -> list:
+        return [self.rows[i] for i in self.by_ticker.get(ticker.upper(), [])]
+
+    def screen(self, params: dict) -> dict:
+        """Rows matching every filter, sorted and sliced to one page."""
+        candidates = []
+        if "universe" in params:
+            universe = params["universe"]
+            if universe not in self.by_universe:
+                raise QueryError(f"Unknown universe {universe!r}.")
+            candidates.append(self.by_universe[universe])
+        if "action" in params:
+            candidates.append(self.by_action.get(params["action"].upper(), []))
+        sepa_pass = parse_bool(params, "sepa_pass")
+        if sepa_pass is not None:
+            candidates.append(self.by_sepa[sepa_pass])
+        low = parse_number(params, "min_score")
+        high = parse_number(params, "max_score")
+
+        # Walk the smallest id list and probe the rest as sets.
+        candidates.sort(key=len)
+        ids = candidates[0] if candidates else range(len(self.rows))
+        filters = [set(c) for c in candidates[1:]]
+        if low is not None or high is not None:
+            filters.append(self.score_range(low, high))
+        matched = [i for i in ids if all(i in f for f in filters)]
+
+        sort = params.get("sort")
+        if sort:
+            field = sort.lstrip("-")
+            if field not in SORT_FIELDS:
+                raise QueryError(f"Cannot sort by {field!r}.")
+            descending = sort.startswith("-")
+            present = [i for i in matched if self.rows[i].get(field) is not None]
+            missing = [i for i in matched if self.rows[i].get(field) is None]
+            present.sort(key=lambda i: self.rows[i][field], reverse=descending)
+            matched = present + missing  # nulls last either way
+
+        offset = parse_int(params, "offset", 0)
+        limit = min(parse_int(params, "limit", DEFAULT_LIMIT), MAX_LIMIT)
+        return {
+            "as_of_date": self.as_of_date,
+            "total": len(matched),
+            "offset": offset,
+            "limit": limit,
+            "results": [self.rows[i] for i in matched[offset : offset + limit]],
+        }
+
+
+def parse_bool(params: dict, name: str):
+    if name not in params:
+        return None
+    value = params[name].lower()
+    if value not in ("true", "false", "1", "0"):
+        raise QueryError(f"{name} must be true or false.")
+    return value in ("true", "1")
+
+
+def parse_number(params: dict, name: str):
+    if name not in params:
+        return None
+    try:
+        return float(params[name])
+    except ValueError:
+        raise QueryError(f"{name} must be a number.") from None
+
+
+def parse_int(params: dict, name: str, default: int) -> int:
+    try:
+        value = int(params.get(name, default))
+    except ValueError:
+        raise QueryError(f"{name} must be an integer.") from None
+    if value < 0:
+        raise QueryError(f"{name} must not be negative.")
+    return value
+
+
+def file_stamp(path: str) -> tuple:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (path, None)
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+
+def load_index(data_dir: str, stamps: list = None) -> SignalIndex:
+    """Load the manifest and the records files it lists.
+
+    Each file's size and mtime are appended to stamps just before it is
+    read, so a rewrite during the load is seen as a change afterwards.
+    """
+    stamps = [] if stamps is None else stamps
+    path = os.path.join(data_dir, "manifest.json")
+    stamps.append(file_stamp(path))
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    records = {}
+    for universe in manifest.get("universes", []):
+        path = os.path.join(data_dir, universe["records_path"])
+        stamps.append(file_stamp(path))
+        with open(path, "r", encoding="utf-8") as f:
+            records[universe["id"]] = json.load(f)["records"]
+    return SignalIndex(manifest, records)
+
+
+class IndexWatcher:
+    """Holds the current index and rebuilds it when the data files change.
+
+    Only the files' sizes and mtimes are polled, so an idle server costs a
+    few stat calls per interval. A failed reload (say, a refresh still
+    midway) keeps the previous index and is retried on the next change.
+    """
+
+    def __init__(self, data_dir: str, interval: float = RELOAD_SECONDS):
+        self.data_dir = data_dir
+        self.interval = interval
+        self.signature = None
+        self.index = None
+        self.reload()
+
+    def _files(self) -> list:
+        # The files load_index read: the manifest and the records it lists.
+        files = [os.path.join(self.data_dir, "manifest.json")]
+        if self.index is not None:
+            files += [os.path.join(self.data_dir, p) for p in self.index.records_paths]
+        return files
+
+    def reload(self) -> bool:
+        if tuple(map(file_stamp, self._files())) == self.signature:
+            return False
+        stamps = []
+        try:
+            index = load_index(self.data_dir, stamps)
+        except (OSError, ValueError, KeyError) as exc:
+            if self.index is None:
+                raise SystemExit(f"Cannot load {self.data_dir}: {exc}") from exc
+            print(f"Reload failed, keeping the {self.index.as_of_date} data: {exc}")
+            return False
+        # Stamped before each read: a file rewritten during the load still
+        # differs on the next poll and is reloaded then.
+        self.index = index
+        self.signature = tuple(stamps)
+        print(f"Loaded {len(index.rows)} records as of {index.as_of_date}")
+        return True
+
+    def watch(self):
+        while True:
+            time.sleep(self.interval)
+            self.reload()
+
+
+class SignalHandler(BaseHTTPRequestHandler):
+    # Keep-alive for clients polling in a loop; without TCP_NODELAY the body
+    # write would wait on the client's delayed ACK of the headers.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    watcher = None
+
+    def do_GET(self):
+        index = self.watcher.index
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip("/")
+        try:
+            if path == "/health":
+                self.send_json(
+                    {
+                        "as_of_date": index.as_of_date,
+                        "records": len(index.rows),
+                        "loaded_at": index.loaded_at,
+                    }
+                )
+            elif path == "/universes":
+                self.send_json(
+                    {"as_of_date": index.as_of_date, "universes": index.universes}
+                )
+            elif path.startswith("/tickers/"):
+                ticker = path[len("/tickers/") :]
+                rows = index.ticker(ticker)
+                if not rows:
+                    self.send_json({"error": f"Unknown ticker {ticker!r}."}, 404)
+                else:
+                    self.send_json({"as_of_date": index.as_of_date, "records": rows})
+            elif path == "/screen":
+                self.send_json(index.screen(params))
+            else:
+                self.send_json({"error": f"Unknown path {url.path!r}."}, 404)
+        except QueryError as exc:
+            self.send_json({"error": str(exc)}, 400)
+
+    def send_json(self, payload: dict, status: int = 200):
+        body = encode_json(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # hundreds of requests a second would flood the console
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", help="Dashboard data (default dashboard/data)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--reload-seconds",
+        type=float,
+        default=RELOAD_SECONDS,
+        help="How often to check the data files for a new refresh",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    data_dir = args.data_dir or os.path.join(root_dir, "dashboard", "data")
+
+    watcher = IndexWatcher(data_dir, args.reload_seconds)
+    threading.Thread(target=watcher.watch, daemon=True).start()
+    SignalHandler.watcher = watcher
+    server = ThreadingHTTPServer((args.host, args.port), SignalHandler)
+    print(f"Serving {data_dir} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,28 @@
+import argparse
+import base64
+import cProfile
+import functools
+import gzip
+import hashlib
+import http.client
 import json
+import math
 import os
+import shutil
+import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
-from io import StringIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
+from io import BytesIO, StringIO
+from multiprocessing import shared_memory
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -14,27 +30,707 @@ try:
 except ImportError:
     load_dotenv = None
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+try:
+    import pyarrow  # noqa: F401  (enables Parquet storage)
+except ImportError:
+    pyarrow = None
+
 START_DATE = "2023-01-01"
 END_DATE = "2026-02-01"
 CACHE_DAYS = 7
-FMP_API_URL = "https://financialmodelingprep.com/stable"
-SP500_URL = (
-    "https://raw.githubusercontent.com/datasets/s-and-p-500-companies/"
-    "main/data/constituents.csv"
-)
-NASDAQ100_URL = "https://en.wikipedia.org/wiki/Nasdaq-100"
+FMP_API_URL = os.getenv("FMP_API_URL", "https://financialmodelingprep.com/stable")
+FMP_MAX_WORKERS = 8
+FMP_REQUESTS_PER_MINUTE = 300
+FETCH_ATTEMPTS = 3
+FMP_BATCH_SIZE = 100
+# Stored bars inside this many calendar days of the last one are re-fetched so
+# late corrections and split/dividend restatements are picked up.
+PRICE_OVERLAP_DAYS = 10
+RESTATEMENT_TOLERANCE = 0.005
+# Checkpoint writes are throttled; cached stages are flushed every chunk.
+CHECKPOINT_SECONDS = 2.0
+CHECKPOINT_CHUNK = 50
+# Constituent snapshots are re-downloaded after this many days unless the
+# source sets refresh_days; market caps are refreshed daily.
+CONSTITUENT_REFRESH_DAYS = 7
+MARKET_CAP_REFRESH_DAYS = 1
+USER_AGENT = "jf-alpha-dashboard/1.0"
+HTTP_TIMEOUT = 30
+# How long cached responses are served without revalidation, in calendar days
+# (1 = same UTC day). Classes are matched against the URL in order. Ratios and
+# analyst data age in the per-ticker caches, which only refresh entries at
+# least a day old, so their responses must not outlive the day either;
+# otherwise a refresh would restamp an old body with today's date.
+HTTP_CACHE_RULES = [
+    ("historical-price-eod", "prices"),
+    ("quote", "quotes"),
+    ("ratios", "ratios"),
+    ("grades-consensus", "analyst"),
+    ("price-target-consensus", "analyst"),
+]
+HTTP_CACHE_TTL_DAYS = {
+    "prices": 1,
+    "quotes": 1,
+    "ratios": 1,
+    "analyst": 1,
+}
+CHART_DAYS = 220
+# Sessions of history the refresh needs: momentum and RS look back 252
+# sessions, and every charted bar needs a full 200-day average behind it.
+CLOSE_LOOKBACK = max(252 + 1, CHART_DAYS + 200 - 1)
+# Incremental indicator state is rebuilt from the close matrix after this
+# many appended sessions, and drift beyond the tolerance is reported.
+INDICATOR_VERIFY_EVERY = 20
+INDICATOR_DRIFT_TOLERANCE = 1e-9
+SEPA_CHART_COUNT = 5
+CHART_SERIES = ["close", "ma50", "ma150", "ma200", "rs_line"]
+# Dashboard output precision: prices to the cent, everything else to 5 dp.
+PRICE_DECIMALS = 2
+VALUE_DECIMALS = 5
+PRICE_FIELDS = {
+    "close",
+    "ma50",
+    "ma150",
+    "ma200",
+    "ma_50",
+    "ma_150",
+    "ma_200",
+    "target_consensus",
+    "target_high",
+    "target_low",
+}
+RECORD_FLOAT_FIELDS = [
+    "momentum_12_1",
+    "quality_raw",
+    "value_raw",
+    "composite_score",
+    "rs_score",
+    "ma_50",
+    "ma_150",
+    "ma_200",
+]
+# Columns the dashboard's full-universe table can sort by (see table_index).
+TABLE_SORT_FIELDS = ["ticker", "rank", "composite_score", "momentum_12_1"]
+HISTORY_COLUMNS = [
+    "date",
+    "ticker",
+    "composite_score",
+    "momentum_z",
+    "quality_z",
+    "value_z",
+    "rank",
+    "action",
+    "sepa_pass",
+]
+FUNDAMENTAL_FIELDS = [
+    "pe_ratio",
+    "pb_ratio",
+    "roe",
+    "operating_margin",
+    "profit_margin",
+]
+# Factor nodes a composite can weight; each is z-scored within the universe.
+COMPOSITE_FACTORS = [
+    "momentum_12_1",
+    "return_252",
+    "rs_score",
+    "quality_raw",
+    "value_raw",
+]
+# The dashboard's ranking unless universes.toml redefines it.
+DEFAULT_COMPOSITE = "default"
+DEFAULT_COMPOSITES = {
+    DEFAULT_COMPOSITE: {
+        "factors": {"momentum_12_1": 1.0, "quality_raw": 1.0, "value_raw": 1.0},
+        "winsorize": 0.0,
+    }
+}
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    scale = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+class RunStats:
+    """Per-stage wall time and HTTP counters for one refresh run.
+
+    Counters are attributed to the innermost open stage, including calls
+    made from fetch worker threads, and to the run totals. sleep_seconds is
+    summed over threads (rate-limit waits plus retry backoff).
+    """
+
+    COUNTERS = [
+        "http_calls",
+        "bytes_downloaded",
+        "retries",
+        "http_429",
+        "errors",
+        "sleep_seconds",
+        "cache_hits",
+        "not_modified",
+        "replayed",
+    ]
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.reset()
+
+    def reset(self):
+        """Forget recorded stages, e.g. in a pool worker forked mid-stage."""
+        with self.lock:
+            self.stack = []
+            self.stages = {}
+            self.totals = dict.fromkeys(self.COUNTERS, 0)
+
+    @contextmanager
+    def stage(self, name: str):
+        with self.lock:
+            entry = self.stages.setdefault(
+                name, {"calls": 0, "seconds": 0.0, **dict.fromkeys(self.COUNTERS, 0)}
+            )
+            entry["calls"] += 1
+            self.stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                entry["seconds"] += time.perf_counter() - start
+                entry["peak_rss_mb"] = peak_rss_mb()
+                self.stack.remove(name)
+
+    def count(self, key: str, amount=1):
+        with self.lock:
+            self.totals[key] += amount
+            if self.stack:
+                self.stages[self.stack[-1]][key] += amount
+
+    def export(self) -> dict:
+        with self.lock:
+            return {
+                "stages": {name: dict(entry) for name, entry in self.stages.items()},
+                "totals": dict(self.totals),
+            }
+
+    def merge(self, exported: dict):
+        """Add stages and counters recorded elsewhere (a pool worker's export)."""
+        with self.lock:
+            for name, entry in exported["stages"].items():
+                mine = self.stages.setdefault(
+                    name,
+                    {"calls": 0, "seconds": 0.0, **dict.fromkeys(self.COUNTERS, 0)},
+                )
+                for key, value in entry.items():
+                    if key == "peak_rss_mb":
+                        mine[key] = max(mine.get(key, 0.0), value)
+                    else:
+                        mine[key] += value
+            for key, value in exported["totals"].items():
+                self.totals[key] += value
+
+    def report(self, **extra) -> dict:
+        with self.lock:
+            stages = {
+                name: {
+                    key: round(value, 3) if isinstance(value, float) else value
+                    for key, value in entry.items()
+                }
+                for name, entry in self.stages.items()
+            }
+            totals = {
+                key: round(value, 3) if isinstance(value, float) else value
+                for key, value in self.totals.items()
+            }
+        started_at = datetime.fromtimestamp(self.started, timezone.utc)
+        return {
+            "started_at": started_at.isoformat(),
+            "wall_seconds": round(time.time() - self.started, 3),
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": stages,
+            "totals": totals,
+            **extra,
+        }
+
+
+RUN_STATS = RunStats()
+
+
+def timed_stage(name: str):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with RUN_STATS.stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def strip_api_key(url: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k.lower() != "apikey"]
+    return urlunsplit(parts._replace(query=urlencode(sorted(query))))
+
+
+def http_cache_class(url: str):
+    for pattern, cache_class in HTTP_CACHE_RULES:
+        if pattern in url:
+            return cache_class
+    return None
+
+
+class ResponseArchive:
+    """SQLite archive of HTTP responses for record/replay runs.
+
+    Entries are keyed like the HTTP cache, by URL without the API key, so an
+    archive recorded with one key replays with none. Bodies are stored
+    gzip-compressed along with the status, so recorded errors replay too.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, status INTEGER, body BLOB, recorded_at TEXT)"
+            )
+
+    def load(self, url: str):
+        """(status, body) recorded for the URL, or None."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status, body FROM responses WHERE url = ?",
+                (strip_api_key(url),),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], gzip.decompress(row[1])
+
+    def store(self, url: str, status: int, body: bytes):
+        recorded_at = datetime.now(timezone.utc).isoformat()
+        data = gzip.compress(body, compresslevel=6)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (strip_api_key(url), status, data, recorded_at),
+            )
+
+
+class HttpClient:
+    """Keep-alive HTTP client with an optional on-disk response cache.
+
+    Idle connections are pooled per host and shared by all fetch threads, so
+    thousands of FMP calls reuse a handful of TCP/TLS sessions. Cached bodies
+    are keyed by URL without the API key and served until their class TTL
+    lapses; after that they are revalidated with ETag/Last-Modified.
+
+    With an archive, every response (including HTTP errors) is recorded;
+    with replay=True responses come only from the archive and the network
+    is never touched. A limiter passed to get() is only charged for requests
+    that actually go out, so fresh cache hits cost nothing.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = None,
+        max_idle: int = FMP_MAX_WORKERS,
+        archive: ResponseArchive = None,
+        replay: bool = False,
+    ):
+        self.cache_dir = cache_dir
+        self.max_idle = max_idle
+        self.archive = archive
+        self.replay = replay
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def _acquire(self, scheme: str, netloc: str):
+        with self.lock:
+            pool = self.idle.get((scheme, netloc))
+            if pool:
+                return pool.pop()
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=HTTP_TIMEOUT)
+        return http.client.HTTPConnection(netloc, timeout=HTTP_TIMEOUT)
+
+    def _release(self, scheme: str, netloc: str, conn):
+        with self.lock:
+            pool = self.idle.setdefault((scheme, netloc), [])
+            if len(pool) < self.max_idle:
+                pool.append(conn)
+                return
+        conn.close()
+
+    def _send(self, url: str, headers: dict):
+        parts = urlsplit(url)
+        path = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh one before giving up.
+        for fresh in (False, True):
+            conn = self._acquire(parts.scheme, parts.netloc)
+            if fresh:
+                conn.close()
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if fresh:
+                    raise
+                continue
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(parts.scheme, parts.netloc, conn)
+            return response, body
+
+    def _request(self, url: str, headers: dict):
+        for _ in range(5):
+            response, body = self._send(url, headers)
+            location = response.getheader("Location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            RUN_STATS.count("bytes_downloaded", len(body))
+            if response.getheader("Content-Encoding", "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return response, body
+        raise HTTPError(url, 310, "Too many redirects", response.headers, None)
+
+    def _cache_paths(self, url: str):
+        key = hashlib.sha256(strip_api_key(url).encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.json", f"{base}.body.gz"
+
+    def _cache_load(self, url: str):
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return meta, gzip.decompress(f.read())
+        except (OSError, ValueError):
+            return None, None
+
+    def _cache_store(self, url: str, meta: dict, body: bytes = None):
+        meta_path, body_path = self._cache_paths(url)
+        if body is not None:
+            write_file_atomic(body_path, gzip.compress(body, compresslevel=6))
+        write_file_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def invalidate(self, url: str):
+        if not self.cache_dir:
+            return
+        for path in self._cache_paths(url):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def get(self, url: str, limiter: "TokenBucket" = None) -> bytes:
+        if self.replay:
+            entry = self.archive.load(url)
+            if entry is None:
+                raise HTTPError(url, 404, "Not in replay archive", None, None)
+            RUN_STATS.count("replayed")
+            status, body = entry
+            if status >= 400:
+                raise HTTPError(url, status, "Replayed error", None, None)
+            return body
+        if self.archive is None:
+            return self._fetch(url, limiter)
+        try:
+            body = self._fetch(url, limiter)
+        except HTTPError as exc:
+            self.archive.store(url, exc.code, b"")
+            raise
+        self.archive.store(url, 200, body)
+        return body
+
+    def _fetch(self, url: str, limiter: "TokenBucket" = None) -> bytes:
+        cache_class = http_cache_class(url) if self.cache_dir else None
+        meta, cached = self._cache_load(url) if cache_class else (None, None)
+        today = datetime.utcnow().date()
+        if meta is not None:
+            fetched = datetime.strptime(meta["fetched_on"], "%Y-%m-%d").date()
+            if (today - fetched).days < HTTP_CACHE_TTL_DAYS[cache_class]:
+                RUN_STATS.count("cache_hits")
+                return cached
+
+        headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+        }
+        if meta is not None and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta is not None and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        if limiter is not None:
+            limiter.acquire()
+        RUN_STATS.count("http_calls")
+        response, body = self._request(url, headers)
+        if response.status == 304 and meta is not None:
+            RUN_STATS.count("not_modified")
+            meta["fetched_on"] = today.isoformat()
+            self._cache_store(url, meta)
+            return cached
+        if response.status >= 400:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+
+        if cache_class:
+            meta = {
+                "url": strip_api_key(url),
+                "class": cache_class,
+                "fetched_on": today.isoformat(),
+                "etag": response.getheader("ETag"),
+                "last_modified": response.getheader("Last-Modified"),
+            }
+            self._cache_store(url, meta, body)
+        return body
+
+    def prune(self, max_age_days: int = 2 * CACHE_DAYS):
+        """Drop cache entries (e.g. dated price URLs) nobody will ask for again."""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+        today = datetime.utcnow().date()
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for name in filenames:
+                if not name.endswith(".json"):
+                    continue
+                meta_path = os.path.join(dirpath, name)
+                try:
+                    with open(meta_path, "r", encoding="utf-8") as f:
+                        fetched_on = json.load(f)["fetched_on"]
+                    fetched = datetime.strptime(fetched_on, "%Y-%m-%d").date()
+                except (OSError, ValueError, KeyError):
+                    fetched = None
+                if fetched is None or (today - fetched).days > max_age_days:
+                    for path in (meta_path, meta_path[: -len(".json")] + ".body.gz"):
+                        if os.path.exists(path):
+                            os.remove(path)
+
+
+_http_client = HttpClient()
+
+
+def configure_http_client(
+    cache_dir: str = None, archive: ResponseArchive = None, replay: bool = False
+) -> HttpClient:
+    global _http_client
+    max_idle = int(os.getenv("FMP_MAX_WORKERS", FMP_MAX_WORKERS))
+    _http_client = HttpClient(cache_dir, max_idle, archive, replay)
+    _http_client.prune()
+    return _http_client
+
+
+def get_http_client() -> HttpClient:
+    return _http_client
 
 
 def fetch_json(url: str):
-    request = Request(url, headers={"User-Agent": "jf-alpha-dashboard/1.0"})
-    with urlopen(request) as response:
-        return json.loads(response.read().decode("utf-8"))
+    """An FMP JSON payload; network requests draw on the shared rate limit."""
+    client = get_http_client()
+    payload = json.loads(client.get(url, get_rate_limiter()).decode("utf-8"))
+    # FMP reports bad keys and plan limits with a 200; never cache those.
+    if isinstance(payload, dict) and (
+        payload.get("Error Message") or payload.get("error")
+    ):
+        client.invalidate(url)
+    return payload
 
 
 def fetch_html(url: str) -> str:
-    request = Request(url, headers={"User-Agent": "jf-alpha-dashboard/1.0"})
-    with urlopen(request) as response:
-        return response.read().decode("utf-8")
+    return get_http_client().get(url).decode("utf-8")
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every FMP request in a run."""
+
+    def __init__(self, requests_per_minute: float, burst: float = None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = burst if burst is not None else max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if now >= self.blocked_until and self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = max(
+                    self.blocked_until - now, (1.0 - self.tokens) / self.rate
+                )
+            RUN_STATS.count("sleep_seconds", wait)
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold back all callers, e.g. after a 429 with Retry-After."""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    # Built lazily so FMP_REQUESTS_PER_MINUTE can come from .env, which main()
+    # loads after import.
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            rpm = float(
+                os.getenv("FMP_REQUESTS_PER_MINUTE", FMP_REQUESTS_PER_MINUTE)
+            )
+            _rate_limiter = TokenBucket(rpm)
+        return _rate_limiter
+
+
+def retry_after_seconds(exc: HTTPError):
+    value = exc.headers.get("Retry-After") if exc.headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def call_with_retries(func, attempts: int = FETCH_ATTEMPTS):
+    """Run one FMP call, backing off on errors and 429s.
+
+    The rate limit itself is taken by HttpClient just before a request goes
+    out, so calls answered from the cache never wait for a token.
+    """
+    if get_http_client().replay:
+        # Archived responses: retries cannot help.
+        return func()
+    limiter = get_rate_limiter()
+    for attempt in range(attempts):
+        try:
+            return func()
+        except Exception as exc:
+            is_429 = isinstance(exc, HTTPError) and exc.code == 429
+            RUN_STATS.count("http_429" if is_429 else "errors")
+            if attempt == attempts - 1:
+                raise
+            RUN_STATS.count("retries")
+            if is_429:
+                delay = retry_after_seconds(exc)
+                limiter.pause(delay if delay is not None else 6.0 * (attempt + 1))
+            else:
+                RUN_STATS.count("sleep_seconds", 1.5 * (attempt + 1))
+                time.sleep(1.5 * (attempt + 1))
+
+
+def fetch_fmp_json(url: str, default=None):
+    try:
+        return call_with_retries(lambda: fetch_json(url))
+    except Exception:
+        return default
+
+
+def fetch_concurrently(fetch_one, symbols) -> dict:
+    """Apply fetch_one to each symbol on a bounded pool, keeping input order."""
+    workers = int(os.getenv("FMP_MAX_WORKERS", FMP_MAX_WORKERS))
+    symbols = list(symbols)
+    if workers <= 1 or len(symbols) <= 1:
+        return {symbol: fetch_one(symbol) for symbol in symbols}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(symbols, pool.map(fetch_one, symbols)))
+
+
+_unsupported_batch_endpoints = set()
+
+
+def fetch_fmp_batch(endpoint: str, symbols, api_key: str) -> dict:
+    """Items from a multi-symbol FMP endpoint, keyed by symbol.
+
+    Symbols are sorted and chunked (so chunk URLs stay cacheable) and the
+    chunks fetched concurrently. If the plan rejects the endpoint, it is
+    skipped for the rest of the run; callers fetch whatever is missing from
+    the result one symbol at a time.
+    """
+    if os.getenv("FMP_BATCH", "1").lower() in ("0", "false", "no"):
+        return {}
+    chunk_size = int(os.getenv("FMP_BATCH_SIZE", FMP_BATCH_SIZE))
+    symbols = sorted(set(symbols))
+    chunks = [
+        tuple(symbols[i : i + chunk_size]) for i in range(0, len(symbols), chunk_size)
+    ]
+
+    def fetch_chunk(chunk):
+        if endpoint in _unsupported_batch_endpoints:
+            return {}
+        params = {"symbols": ",".join(chunk), "apikey": api_key}
+        url = f"{FMP_API_URL}/{endpoint}?{urlencode(params)}"
+        try:
+            payload = call_with_retries(lambda: fetch_json(url))
+        except HTTPError as exc:
+            if 400 <= exc.code < 500 and exc.code != 429:
+                _unsupported_batch_endpoints.add(endpoint)
+            return {}
+        except Exception:
+            return {}
+        if not isinstance(payload, list):
+            _unsupported_batch_endpoints.add(endpoint)
+            return {}
+        return {
+            item["symbol"]: item
+            for item in payload
+            if isinstance(item, dict) and item.get("symbol") in chunk
+        }
+
+    items = {}
+    for chunk_items in fetch_concurrently(fetch_chunk, chunks).values():
+        items.update(chunk_items)
+    return items
 
 
 def parse_float(value):
@@ -46,117 +742,437 @@ def parse_float(value):
         return None
 
 
-def fetch_close_series(tickers):
+def parse_price_history(payload, symbol: str, allow_empty: bool = False) -> pd.Series:
+    if isinstance(payload, dict):
+        if payload.get("error") or payload.get("status") == "error":
+            raise ValueError("FMP error response")
+        history = payload.get("historical", [])
+    else:
+        history = payload
+    if not history:
+        if allow_empty:
+            return pd.Series(dtype=float, name=symbol)
+        raise ValueError("Empty price response")
+    df = pd.DataFrame(history)[["date", "close"]]
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df = df.dropna(subset=["date"])
+    df = df[(df["date"] >= START_DATE) & (df["date"] < END_DATE)]
+    if df.empty and not allow_empty:
+        raise ValueError("No price rows in date range")
+    return df.set_index("date")["close"].rename(symbol).sort_index()
+
+
+def write_file_atomic(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def frame_path(base_path: str) -> str:
+    """Columnar file path: Parquet with pyarrow, gzipped CSV otherwise."""
+    return f"{base_path}.parquet" if pyarrow else f"{base_path}.csv.gz"
+
+
+def read_frame(path: str, filters=None) -> pd.DataFrame:
+    if pyarrow:
+        return pd.read_parquet(path, filters=filters)
+    df = pd.read_csv(path, parse_dates=["date"], float_precision="round_trip")
+    for column, op, value in filters or []:
+        if op == "==":
+            df = df[df[column] == value]
+        elif op == "in":
+            df = df[df[column].isin(value)]
+    return df
+
+
+def write_frame(df: pd.DataFrame, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    if pyarrow:
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_csv(tmp_path, index=False, compression="gzip")
+    os.replace(tmp_path, path)
+
+
+def price_store_path(store_dir: str, symbol: str) -> str:
+    return frame_path(os.path.join(store_dir, symbol.replace("/", "_")))
+
+
+def load_stored_prices(store_dir: str, symbol: str):
+    path = price_store_path(store_dir, symbol)
+    if not os.path.exists(path):
+        return None
+    try:
+        df = read_frame(path)
+        return df.set_index("date")["close"].rename(symbol).sort_index()
+    except Exception:
+        return None
+
+
+def save_stored_prices(store_dir: str, series: pd.Series):
+    df = series.rename("close").rename_axis("date").reset_index()
+    write_frame(df, price_store_path(store_dir, series.name))
+
+
+def load_price_store_index(store_dir: str) -> dict:
+    path = os.path.join(store_dir, "index.json")
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_price_store_index(store_dir: str, index: dict):
+    data = json.dumps(index, indent=2, sort_keys=True).encode("utf-8")
+    write_file_atomic(os.path.join(store_dir, "index.json"), data)
+
+
+def last_expected_bar() -> pd.Timestamp:
+    """Most recent session whose close should already be published."""
+    end = min(pd.Timestamp(END_DATE), pd.Timestamp(datetime.utcnow().date()))
+    return (end - pd.offsets.BDay(1)).normalize()
+
+
+def merge_price_update(stored: pd.Series, update: pd.Series):
+    """Merge fresh bars into stored ones; None means history was restated."""
+    overlap = stored.index.intersection(update.index)
+    if len(overlap):
+        drift = (update.loc[overlap] / stored.loc[overlap] - 1).abs()
+        if (drift > RESTATEMENT_TOLERANCE).any():
+            return None
+    merged = pd.concat([stored[~stored.index.isin(update.index)], update])
+    return merged.sort_index()
+
+
+class RunCheckpoint:
+    """Per-stage progress of one refresh, persisted to a work directory.
+
+    A checkpoint belongs to the trading session it was fetching for; with
+    resume, stages recorded for the same session are skipped and price
+    tickers already stored are not requested again. Without resume the run
+    starts clean but still records progress for a later resume.
+    """
+
+    def __init__(self, work_dir: str, resume: bool = False):
+        self.path = os.path.join(work_dir, "checkpoint.json")
+        self.lock = threading.Lock()
+        self.saved_at = 0.0
+        session = last_expected_bar().date().isoformat()
+        state = None
+        if resume and os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+            except Exception:
+                state = None
+        if not state or state.get("session") != session:
+            state = {"session": session, "stages": {}, "done": {}}
+        self.state = state
+        self.resumed = bool(state["stages"] or state["done"])
+
+    def get(self, stage: str):
+        return self.state["stages"].get(stage)
+
+    def put(self, stage: str, value):
+        with self.lock:
+            self.state["stages"][stage] = value
+        self.save()
+
+    def completed(self, stage: str) -> set:
+        with self.lock:
+            return set(self.state["done"].get(stage, []))
+
+    def mark(self, stage: str, key: str):
+        """Record one finished item; writes are throttled to CHECKPOINT_SECONDS."""
+        with self.lock:
+            self.state["done"].setdefault(stage, []).append(key)
+            due = time.time() - self.saved_at >= CHECKPOINT_SECONDS
+        if due:
+            self.save()
+
+    def save(self):
+        with self.lock:
+            data = json.dumps(self.state, sort_keys=True).encode("utf-8")
+            self.saved_at = time.time()
+            write_file_atomic(self.path, data)
+
+
+def assemble_close_matrix(
+    close_data: dict, dtype=np.float64, lookback: int = None
+) -> pd.DataFrame:
+    """Close matrix on the union trading calendar, filled in place.
+
+    Same shape and values as pd.DataFrame(close_data).sort_index(), but
+    written straight into one preallocated array of the given dtype, and
+    optionally cut to the last lookback sessions (extended for gaps, see
+    lookback_start). The outer join of hundreds of float64 Series is never
+    materialized.
+    """
+    # The last 2 * lookback sessions of the union are all among the last
+    # 2 * lookback dates of some series, so only those tails need to be merged.
+    tail = slice(-2 * lookback, None) if lookback else slice(None)
+    calendar = np.unique(
+        np.concatenate([series.index.values[tail] for series in close_data.values()])
+    )[tail]
+    if lookback and len(calendar):
+        calendar = calendar[calendar >= lookback_start(close_data, calendar, lookback)]
+    matrix = np.full((len(calendar), len(close_data)), np.nan, dtype=dtype)
+    for column, series in enumerate(close_data.values()):
+        dates = series.index.values
+        keep = dates >= calendar[0] if len(calendar) else slice(0)
+        rows = np.searchsorted(calendar, dates[keep])
+        matrix[rows, column] = series.to_numpy()[keep]
+    names = {series.index.name for series in close_data.values()}
+    index = pd.DatetimeIndex(calendar, name=names.pop() if len(names) == 1 else None)
+    return pd.DataFrame(matrix, index=index, columns=list(close_data), copy=False)
+
+
+def lookback_start(close_data: dict, calendar, lookback: int):
+    """First session to keep so every current ticker has lookback usable bars.
+
+    Charts drop a ticker's missing bars, and the bars SPY lacks, before
+    taking moving averages, so a ticker with gaps needs that many extra
+    sessions for its earliest charted bar to get a full 200-day average.
+    Only tickers trading on the last session can be charted. The window
+    stops at the start of calendar (the last 2 * lookback sessions).
+    """
+    # Positions are into calendar, so older bars outside it drop out.
+    usable = np.ones(len(calendar), dtype=bool)
+    if "SPY" in close_data:
+        usable = np.isin(calendar, close_data["SPY"].index.values)
+    first = max(0, len(calendar) - lookback)
+    for series in close_data.values():
+        dates = series.index.values[-2 * lookback :]
+        if not len(dates) or dates[-1] != calendar[-1]:
+            continue
+        positions = np.searchsorted(calendar, dates[dates >= calendar[0]])
+        positions = positions[usable[positions]]
+        if len(positions):
+            first = min(first, positions[max(0, len(positions) - lookback)])
+    return calendar[first]
+
+
+@timed_stage("fetch_close_series")
+def fetch_close_series(
+    tickers,
+    store_dir: str = None,
+    checkpoint=None,
+    dtype=np.float64,
+    lookback: int = None,
+):
     api_key = os.getenv("FMP_API_KEY")
     if not api_key:
         raise SystemExit("Missing FMP_API_KEY in environment.")
 
-    close_data = {}
-    failures = []
+    store_index = load_price_store_index(store_dir) if store_dir else {}
+    expected_last = last_expected_bar()
+    # Tickers already stored earlier in this session (only set on resume).
+    done = checkpoint.completed("prices") if checkpoint and store_dir else set()
 
-    for sym in tickers:
+    def request_history(sym, start, allow_empty=False):
         params = {
             "symbol": sym,
-            "from": START_DATE,
+            "from": start,
             "to": END_DATE,
             "apikey": api_key,
         }
         url = f"{FMP_API_URL}/historical-price-eod/full?{urlencode(params)}"
-        for attempt in range(3):
-            try:
-                payload = fetch_json(url)
-                if isinstance(payload, dict):
-                    if payload.get("error") or payload.get("status") == "error":
-                        raise ValueError("FMP error response")
-                    history = payload.get("historical", [])
-                else:
-                    history = payload
-                if not history:
-                    raise ValueError("Empty price response")
-                df = pd.DataFrame(history)[["date", "close"]]
-                df["date"] = pd.to_datetime(df["date"], errors="coerce")
-                df = df.dropna(subset=["date"])
-                df = df[(df["date"] >= START_DATE) & (df["date"] < END_DATE)]
-                if df.empty:
-                    raise ValueError("No price rows in date range")
-                close_data[sym] = df.set_index("date")["close"].rename(sym)
-                break
-            except Exception as exc:
-                if isinstance(exc, HTTPError) and exc.code == 429:
-                    time.sleep(6.0)
-                else:
-                    time.sleep(1.5)
-                if attempt == 2:
-                    failures.append(sym)
-        time.sleep(0.6)
+        return call_with_retries(
+            lambda: parse_price_history(fetch_json(url), sym, allow_empty)
+        )
+
+    def fetch_one(sym):
+        stored = None
+        if sym in done or store_index.get(sym, {}).get("from") == START_DATE:
+            stored = load_stored_prices(store_dir, sym)
+        if stored is not None and stored.empty:
+            stored = None
+        if sym in done and stored is not None:
+            return stored, False
+        try:
+            if stored is not None:
+                if stored.index.max() >= expected_last:
+                    return stored, False
+                start = stored.index.max() - timedelta(days=PRICE_OVERLAP_DAYS)
+                update = request_history(
+                    sym, start.date().isoformat(), allow_empty=True
+                )
+                series = merge_price_update(stored, update)
+                if series is None:
+                    series = request_history(sym, START_DATE)
+            else:
+                series = request_history(sym, START_DATE)
+        except Exception:
+            # Fall back to the stale stored bars but still report the failure.
+            return stored, True
+        if store_dir:
+            save_stored_prices(store_dir, series)
+            if checkpoint:
+                checkpoint.mark("prices", sym)
+        return series, False
+
+    results = fetch_concurrently(fetch_one, tickers)
+    close_data = {
+        sym: series for sym, (series, _) in results.items() if series is not None
+    }
+    failures = [sym for sym, (_, failed) in results.items() if failed]
+
+    if store_dir:
+        for sym, series in close_data.items():
+            store_index[sym] = {
+                "from": START_DATE,
+                "last": series.index.max().date().isoformat(),
+            }
+        save_price_store_index(store_dir, store_index)
 
     if not close_data:
         raise SystemExit("No price data downloaded from FMP. Aborting.")
 
-    close = pd.DataFrame(close_data).sort_index()
+    close = assemble_close_matrix(close_data, dtype, lookback)
     return close, failures
 
 
-def load_fundamentals_cache(cache_path: str):
-    if not os.path.exists(cache_path):
-        return None
-    try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-        as_of = datetime.strptime(payload.get("as_of", ""), "%Y-%m-%d").date()
-        if datetime.utcnow().date() - as_of > timedelta(days=CACHE_DAYS):
-            return None
-        return payload
-    except Exception:
-        return None
-
+class KeyedCache:
+    """Per-ticker cache where every entry carries the date it was fetched.
+
+    Entries are refreshed a bounded slice at a time (missing first, then the
+    oldest), so a full refresh is spread over the TTL instead of landing on
+    one run. The JSON backend rewrites the file atomically; the SQLite
+    backend upserts only the entries that changed.
+    """
+
+    def __init__(self, base_path: str, backend: str = "json"):
+        self.backend = backend
+        self.path = f"{base_path}.{'sqlite' if backend == 'sqlite' else 'json'}"
+        self.entries = self._load()
+        self.dirty = set()
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            if self.backend == "sqlite":
+                with closing(sqlite3.connect(self.path)) as conn:
+                    rows = conn.execute(
+                        "SELECT ticker, fetched_on, data FROM entries"
+                    ).fetchall()
+                return {
+                    ticker: {"fetched_on": fetched_on, "data": json.loads(data)}
+                    for ticker, fetched_on, data in rows
+                }
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError, sqlite3.Error):
+            return {}
+        if "entries" in payload:
+            return payload["entries"]
+        # Older files stamped the whole cache with a single as_of date.
+        as_of = payload.get("as_of")
+        if not as_of:
+            return {}
+        return {
+            ticker: {"fetched_on": as_of, "data": data}
+            for ticker, data in payload.get("data", {}).items()
+        }
 
-def load_analyst_cache(cache_path: str):
-    if not os.path.exists(cache_path):
-        return None
-    try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-        as_of = datetime.strptime(payload.get("as_of", ""), "%Y-%m-%d").date()
-        if datetime.utcnow().date() - as_of > timedelta(days=CACHE_DAYS):
-            return None
-        return payload
-    except Exception:
-        return None
+    def age_days(self, ticker: str, today) -> int:
+        fetched_on = datetime.strptime(self.entries[ticker]["fetched_on"], "%Y-%m-%d")
+        return (today - fetched_on.date()).days
+
+    def select_refresh(self, tickers, ttl_days: int, budget: int = None) -> list:
+        """Missing tickers plus the oldest entries, up to the daily budget.
+
+        The default budget refreshes about len(tickers) / ttl_days entries per
+        run, so each entry is renewed roughly once per TTL.
+        """
+        today = datetime.utcnow().date()
+        tickers = list(dict.fromkeys(tickers))
+        missing = [t for t in tickers if t not in self.entries]
+        if budget is None:
+            budget = math.ceil(len(tickers) / max(1, ttl_days))
+        cached = sorted(
+            (t for t in tickers if t in self.entries),
+            key=lambda t: self.age_days(t, today),
+            reverse=True,
+        )
+        oldest = [t for t in cached if self.age_days(t, today) > 0]
+        return missing + oldest[: max(0, budget - len(missing))]
+
+    def update(self, data: dict, fetched_on: str = None):
+        fetched_on = fetched_on or datetime.utcnow().date().isoformat()
+        for ticker, value in data.items():
+            self.entries[ticker] = {"fetched_on": fetched_on, "data": value}
+            self.dirty.add(ticker)
+
+    def data(self, tickers=None) -> dict:
+        keys = self.entries if tickers is None else tickers
+        return {t: self.entries[t]["data"] for t in keys if t in self.entries}
+
+    def oldest(self, tickers=None):
+        keys = self.entries if tickers is None else tickers
+        dates = [self.entries[t]["fetched_on"] for t in keys if t in self.entries]
+        return min(dates) if dates else None
+
+    def save(self):
+        if not self.dirty:
+            return
+        if self.backend == "sqlite":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with closing(sqlite3.connect(self.path)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries "
+                    "(ticker TEXT PRIMARY KEY, fetched_on TEXT, data TEXT)"
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                    [
+                        (
+                            ticker,
+                            self.entries[ticker]["fetched_on"],
+                            json.dumps(self.entries[ticker]["data"]),
+                        )
+                        for ticker in self.dirty
+                    ],
+                )
+        else:
+            payload = {"as_of": self.oldest(), "entries": self.entries}
+            write_file_atomic(self.path, json.dumps(payload, indent=2).encode("utf-8"))
+        self.dirty.clear()
 
 
+@timed_stage("fetch_fundamentals")
 def fetch_fundamentals(tickers):
     api_key = os.getenv("FMP_API_KEY")
     if not api_key:
         raise SystemExit("Missing FMP_API_KEY in environment.")
 
-    data = {}
-    for symbol in tickers:
+    def fetch_one(symbol):
         params = {"symbol": symbol, "apikey": api_key}
         url = f"{FMP_API_URL}/ratios?{urlencode(params)}"
-        payload = {}
-        for attempt in range(3):
-            try:
-                payload = fetch_json(url)
-                break
-            except Exception as exc:
-                if isinstance(exc, HTTPError) and exc.code == 429:
-                    time.sleep(6.0)
-                else:
-                    time.sleep(1.5)
+        payload = fetch_fmp_json(url)
+        if payload is None:
+            return None
         ratios = payload[0] if isinstance(payload, list) and payload else {}
-        data[symbol] = {
+        return {
             "pe_ratio": parse_float(ratios.get("priceEarningsRatio")),
             "pb_ratio": parse_float(ratios.get("priceToBookRatio")),
             "roe": parse_float(ratios.get("returnOnEquity")),
             "operating_margin": parse_float(ratios.get("operatingProfitMargin")),
             "profit_margin": parse_float(ratios.get("netProfitMargin")),
         }
-        time.sleep(0.3)
 
-    return data
+    # Failed symbols are left out so the caller keeps (or retries) them.
+    results = fetch_concurrently(fetch_one, tickers)
+    return {symbol: data for symbol, data in results.items() if data is not None}
 
 
+@timed_stage("fetch_analyst_data")
 def fetch_analyst_data(tickers, cached=None):
     api_key = os.getenv("FMP_API_KEY")
     if not api_key:
@@ -165,35 +1181,17 @@ def fetch_analyst_data(tickers, cached=None):
     cached = cached or {}
     results = dict(cached)
 
-    for symbol in tickers:
-        if symbol in results:
-            continue
-
+    def fetch_one(symbol):
         grades_params = {"symbol": symbol, "apikey": api_key}
         grades_url = f"{FMP_API_URL}/grades-consensus?{urlencode(grades_params)}"
         target_url = f"{FMP_API_URL}/price-target-consensus?{urlencode(grades_params)}"
 
-        grades_payload = []
-        target_payload = []
-        for attempt in range(3):
-            try:
-                grades_payload = fetch_json(grades_url)
-                break
-            except Exception as exc:
-                if isinstance(exc, HTTPError) and exc.code == 429:
-                    time.sleep(6.0)
-                else:
-                    time.sleep(1.5)
-
-        for attempt in range(3):
-            try:
-                target_payload = fetch_json(target_url)
-                break
-            except Exception as exc:
-                if isinstance(exc, HTTPError) and exc.code == 429:
-                    time.sleep(6.0)
-                else:
-                    time.sleep(1.5)
+        grades_payload = fetch_fmp_json(grades_url)
+        target_payload = fetch_fmp_json(target_url)
+        if grades_payload is None or target_payload is None:
+            return None
+        grades_payload = grades_payload or [{}]
+        target_payload = target_payload or [{}]
 
         grades = grades_payload[0] if isinstance(grades_payload, list) else {}
         target = target_payload[0] if isinstance(target_payload, list) else {}
@@ -207,7 +1205,7 @@ def fetch_analyst_data(tickers, cached=None):
         ]
         analyst_count = int(sum(c for c in counts if c is not None)) if counts else None
 
-        results[symbol] = {
+        return {
             "consensus": grades.get("consensus"),
             "analyst_count": analyst_count,
             "target_consensus": parse_float(target.get("targetConsensus")),
@@ -215,399 +1213,1850 @@ def fetch_analyst_data(tickers, cached=None):
             "target_low": parse_float(target.get("targetLow")),
         }
 
-        time.sleep(0.4)
-
+    missing = [symbol for symbol in tickers if symbol not in results]
+    fetched = fetch_concurrently(fetch_one, missing)
+    results.update({s: data for s, data in fetched.items() if data is not None})
     return results
 
 
+@timed_stage("fetch_market_caps")
 def fetch_market_caps(tickers):
     api_key = os.getenv("FMP_API_KEY")
     if not api_key:
         raise SystemExit("Missing FMP_API_KEY in environment.")
 
-    caps = {}
-    for symbol in tickers:
+    quotes = fetch_fmp_batch("batch-quote", tickers, api_key)
+
+    def fetch_one(symbol):
+        if symbol in quotes:
+            return parse_float(quotes[symbol].get("marketCap"))
         params = {"symbol": symbol, "apikey": api_key}
         url = f"{FMP_API_URL}/quote?{urlencode(params)}"
-        payload = []
-        for attempt in range(3):
-            try:
-                payload = fetch_json(url)
-                break
-            except Exception as exc:
-                if isinstance(exc, HTTPError) and exc.code == 429:
-                    time.sleep(6.0)
-                else:
-                    time.sleep(1.5)
+        payload = fetch_fmp_json(url, default=[])
         if isinstance(payload, list) and payload:
-            item = payload[0]
-            market_cap = parse_float(item.get("marketCap"))
-            if market_cap is not None:
-                caps[symbol] = market_cap
-        time.sleep(0.4)
+            return parse_float(payload[0].get("marketCap"))
+        return None
 
-    return caps
+    results = fetch_concurrently(fetch_one, tickers)
+    return {symbol: cap for symbol, cap in results.items() if cap is not None}
+
+
+class TableParser(HTMLParser):
+    """Cell text of every <table> in a page, as lists of rows.
+
+    Stands in for pd.read_html so constituent pages parse without lxml or
+    BeautifulSoup. Nested tables are collected separately.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.tables = []
+        self.open_tables = []
+        self.row = None
+        self.cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self.open_tables.append([])
+        elif tag == "tr" and self.open_tables:
+            self.row = []
+        elif tag in ("td", "th") and self.row is not None:
+            self.cell = []
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th") and self.cell is not None:
+            self.row.append(" ".join("".join(self.cell).split()))
+            self.cell = None
+        elif tag == "tr" and self.row is not None:
+            if self.row:
+                self.open_tables[-1].append(self.row)
+            self.row = None
+        elif tag == "table" and self.open_tables:
+            self.tables.append(self.open_tables.pop())
+
+    def handle_data(self, data):
+        if self.cell is not None:
+            self.cell.append(data)
+
+
+def fetch_constituents(source: dict) -> list:
+    """Ticker list from a CSV file or the first matching HTML table column."""
+    kind = source.get("kind", "csv")
+    text = fetch_html(source["url"])
+    if kind == "csv":
+        table = pd.read_csv(StringIO(text))
+        return table[source.get("column", "Symbol")].dropna().unique().tolist()
+    if kind == "html_table":
+        column = source.get("column", "ticker").lower()
+        parser = TableParser()
+        parser.feed(text)
+        for rows in parser.tables:
+            header = [cell.lower() for cell in rows[0]] if rows else []
+            matches = [i for i, cell in enumerate(header) if column in cell]
+            if matches:
+                i = matches[0]
+                return [row[i] for row in rows[1:] if len(row) > i and row[i]]
+        raise ValueError(f"No table with a {column!r} column at {source['url']}")
+    raise ValueError(f"Unknown constituent source kind {kind!r}")
+
+
+def cached_snapshot(path: str, refresh_days: int, fetch, key=None, offline=False):
+    """Data from a dated JSON snapshot, re-fetched once it is refresh_days old.
+
+    A snapshot taken for a different key (source URL, ticker set) is stale.
+    Offline, any existing snapshot is used regardless of age; online, a
+    failed fetch falls back to the stale snapshot when there is one.
+    """
+    snapshot = None
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except Exception:
+            snapshot = None
+    if offline:
+        if snapshot is None:
+            raise SystemExit(f"Offline mode needs a snapshot at {path}.")
+        return snapshot["data"]
+
+    today = datetime.utcnow().date()
+    if snapshot is not None and snapshot.get("key") == key:
+        age = (today - datetime.fromisoformat(snapshot["fetched_on"]).date()).days
+        if age < refresh_days:
+            return snapshot["data"]
+    try:
+        data = fetch()
+    except Exception as exc:
+        if snapshot is None:
+            raise
+        print(f"Using stale snapshot {path} ({exc})")
+        return snapshot["data"]
+    record = {"fetched_on": today.isoformat(), "key": key, "data": data}
+    write_file_atomic(path, json.dumps(record, indent=2).encode("utf-8"))
+    return data
 
 
-def get_sp500_tickers():
-    table = pd.read_csv(SP500_URL)
-    return table["Symbol"].dropna().unique().tolist()
+def load_universe_config(path: str) -> dict:
+    if tomllib is None:
+        raise SystemExit("Reading universes.toml needs Python 3.11+ (tomllib).")
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
+    if not config.get("universes"):
+        raise SystemExit(f"No [[universes]] defined in {path}.")
+    return config
+
+
+def load_composites(config: dict) -> dict:
+    """Composite definitions from the universes config, validated.
+
+    `[composites.<name>]` tables add to (or replace) the built-in default;
+    each has `factors = { <factor> = <weight>, ... }` and an optional
+    `winsorize` quantile applied before z-scoring.
+    """
+    composites = dict(DEFAULT_COMPOSITES)
+    for name, spec in config.get("composites", {}).items():
+        factors = spec.get("factors") or {}
+        unknown = sorted(set(factors) - set(COMPOSITE_FACTORS))
+        if unknown:
+            raise SystemExit(f"Composite {name!r}: unknown factors {unknown}.")
+        if not factors or not sum(factors.values()):
+            raise SystemExit(f"Composite {name!r}: factor weights must not sum to 0.")
+        winsorize = float(spec.get("winsorize", 0.0))
+        if not 0.0 <= winsorize < 0.5:
+            raise SystemExit(f"Composite {name!r}: winsorize must be in [0, 0.5).")
+        composites[name] = {
+            "factors": {factor: float(w) for factor, w in factors.items()},
+            "winsorize": winsorize,
+        }
+    for universe in config["universes"]:
+        name = universe.get("composite", DEFAULT_COMPOSITE)
+        if name not in composites:
+            raise SystemExit(f"Universe {universe['id']!r}: no composite {name!r}.")
+    return composites
+
+
+def describe_composite(definition: dict) -> str:
+    if definition == DEFAULT_COMPOSITES[DEFAULT_COMPOSITE]:
+        return "Composite (momentum + quality + value)"
+    terms = " + ".join(
+        f"{weight:g}×{factor}" for factor, weight in definition["factors"].items()
+    )
+    return f"Composite ({terms})"
 
 
-def get_nasdaq100_tickers():
-    html = fetch_html(NASDAQ100_URL)
-    tables = pd.read_html(StringIO(html))
-    for table in tables:
-        cols = [str(c).lower() for c in table.columns]
-        if any("ticker" in c for c in cols):
-            tickers = table[table.columns[0]].dropna().astype(str).tolist()
-            return tickers
-    raise SystemExit("Failed to parse Nasdaq-100 tickers from Wikipedia.")
+def fundamentals_frame(fundamentals: dict, tickers) -> pd.DataFrame:
+    """Fundamentals dict as a float frame indexed by ticker (NaN when missing)."""
+    tickers = list(tickers)
+    rows = [fundamentals.get(ticker) or {} for ticker in tickers]
+    frame = pd.DataFrame(rows, index=tickers)
+    return frame.reindex(columns=FUNDAMENTAL_FIELDS).astype(float)
 
 
-def compute_signal(
-    close: pd.DataFrame, fundamentals: dict, tickers: list, spy_close: pd.Series
-) -> tuple:
-    signal_12_1 = close.shift(21) / close.shift(252) - 1
-    latest_date = signal_12_1.dropna(how="all").index.max()
+def zscore(series: pd.Series) -> pd.Series:
+    valid_vals = series.dropna()
+    if valid_vals.empty or valid_vals.std() == 0:
+        return pd.Series(0.0, index=series.index)
+    return (series - valid_vals.mean()) / valid_vals.std()
 
-    available = [t for t in tickers if t in signal_12_1.columns]
-    if not available:
-        return pd.DataFrame(), latest_date
 
-    latest_sig = signal_12_1.loc[latest_date, available]
-    latest_px = close.loc[latest_date, available]
+@timed_stage("build_indicator_panel")
+def build_indicator_panel(close: pd.DataFrame) -> dict:
+    """Rolling indicators over the full close matrix, computed once per run.
 
-    valid = latest_sig.dropna()
-    valid = valid[latest_px[valid.index] > 5]
-    if valid.empty:
-        return pd.DataFrame(), latest_date
+    Columns are independent, so the panel is built over the union of all
+    universes and sliced per universe and per chart.
+    """
+    # Rolling means come back as float64; keep a float32 matrix float32.
+    dtype = np.result_type(*close.dtypes) if close.shape[1] else np.float64
+    close_252 = close.shift(252)
+    ma200 = close.rolling(200).mean().astype(dtype)
+    return {
+        "close": close,
+        "ma50": close.rolling(50).mean().astype(dtype),
+        "ma150": close.rolling(150).mean().astype(dtype),
+        "ma200": ma200,
+        "ma200_prev": ma200.shift(20),
+        "return_252": close / close_252 - 1,
+        "momentum_12_1": close.shift(21) / close_252 - 1,
+    }
 
-    momentum = valid.sort_values(ascending=False).rename("momentum_12_1")
 
-    # Relative strength vs SPY (12-month return difference)
-    spy_return = None
-    if latest_date in spy_close.index:
-        spy_return = spy_close.loc[latest_date] / spy_close.shift(252).loc[latest_date] - 1
+class IndicatorState:
+    """Per-ticker rolling state that advances the panel one session at a time.
+
+    Keeps a ring of the last 253 closes (today and 252 sessions back),
+    running sums and NaN counts for the 50/150/200-session means, and a ring
+    of the last 21 MA200 values for the 20-session lag. Appending a session
+    therefore costs O(tickers) whatever the history length. Values match the
+    last row of build_indicator_panel up to float rounding; a rebuild every
+    INDICATOR_VERIFY_EVERY sessions resets the sums and measures the drift.
+    """
+
+    ROWS = 253
+    WINDOWS = (50, 150, 200)
+    MA200_LAG = 20
+    FIELDS = ["ma50", "ma150", "ma200", "ma200_prev", "return_252", "momentum_12_1"]
+
+    def __init__(self, arrays: dict):
+        self.tickers = [str(t) for t in arrays["tickers"]]
+        self.dates = arrays["dates"]
+        self.closes = arrays["closes"]
+        self.sums = arrays["sums"]
+        self.nans = arrays["nans"]
+        self.ma200 = arrays["ma200"]
+        self.head = int(arrays["head"])
+        self.ma_head = int(arrays["ma_head"])
+        self.updates = int(arrays["updates"])
+
+    @classmethod
+    def from_close(cls, close: pd.DataFrame) -> "IndicatorState":
+        """Full rebuild from the close matrix; sessions before it count as NaN."""
+        values = close.to_numpy(dtype=np.float64)
+        n_rows, n_tickers = values.shape
+        tail = values[-cls.ROWS :]
+        closes = np.full((cls.ROWS, n_tickers), np.nan)
+        closes[cls.ROWS - len(tail) :] = tail
+        dates = np.full(cls.ROWS, np.datetime64("NaT"), dtype="datetime64[ns]")
+        dates[cls.ROWS - len(tail) :] = close.index.values[-cls.ROWS :]
+        sums = np.stack([np.nansum(values[-w:], axis=0) for w in cls.WINDOWS])
+        nans = np.stack(
+            [
+                np.isnan(values[-w:]).sum(axis=0) + max(0, w - n_rows)
+                for w in cls.WINDOWS
+            ]
+        )
+        lagged = close.iloc[-(200 + cls.MA200_LAG) :].astype(np.float64)
+        history = lagged.rolling(200).mean().to_numpy()[-(cls.MA200_LAG + 1) :]
+        ma200 = np.full((cls.MA200_LAG + 1, n_tickers), np.nan)
+        ma200[cls.MA200_LAG + 1 - len(history) :] = history
+        return cls(
+            {
+                "tickers": list(close.columns),
+                "dates": dates,
+                "closes": closes,
+                "sums": sums,
+                "nans": nans,
+                "ma200": ma200,
+                "head": 0,
+                "ma_head": 0,
+                "updates": 0,
+            }
+        )
 
-    rs_scores = {}
-    for ticker in momentum.index:
-        if spy_return is None:
-            rs_scores[ticker] = None
-            continue
-        series = close[ticker]
-        if latest_date not in series.index:
-            rs_scores[ticker] = None
-            continue
-        stock_return = series.loc[latest_date] / series.shift(252).loc[latest_date] - 1
-        rs_scores[ticker] = stock_return - spy_return
-
-    value_rows = {}
-    quality_rows = {}
-    for ticker in momentum.index:
-        metrics = fundamentals.get(ticker, {})
-        pe = metrics.get("pe_ratio")
-        pb = metrics.get("pb_ratio")
-        roe = metrics.get("roe")
-        op_margin = metrics.get("operating_margin")
-        profit_margin = metrics.get("profit_margin")
-
-        value_parts = []
-        if pe and pe > 0:
-            value_parts.append(1.0 / pe)
-        if pb and pb > 0:
-            value_parts.append(1.0 / pb)
-        value_rows[ticker] = sum(value_parts) / len(value_parts) if value_parts else None
-
-        quality_parts = []
-        if roe is not None:
-            quality_parts.append(roe)
-        margin = op_margin if op_margin is not None else profit_margin
-        if margin is not None:
-            quality_parts.append(margin)
-        quality_rows[ticker] = (
-            sum(quality_parts) / len(quality_parts) if quality_parts else None
+    @classmethod
+    def load(cls, path: str):
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return cls({key: data[key] for key in data.files})
+        except Exception:
+            return None
+
+    def save(self, path: str):
+        buffer = BytesIO()
+        np.savez(
+            buffer,
+            tickers=np.array(self.tickers),
+            dates=self.dates,
+            closes=self.closes,
+            sums=self.sums,
+            nans=self.nans,
+            ma200=self.ma200,
+            head=self.head,
+            ma_head=self.ma_head,
+            updates=self.updates,
         )
+        write_file_atomic(path, buffer.getvalue())
+
+    @property
+    def last_date(self) -> pd.Timestamp:
+        return pd.Timestamp(self.dates[(self.head - 1) % self.ROWS])
+
+    def _ordered(self, ring: np.ndarray, head: int) -> np.ndarray:
+        return np.roll(ring, -head, axis=0)
+
+    def matches(self, close: pd.DataFrame) -> bool:
+        """Whether the ring holds the last sessions of close exactly."""
+        rows = min(len(close), self.ROWS)
+        dates = self._ordered(self.dates, self.head)[self.ROWS - rows :]
+        if not np.array_equal(dates, close.index.values[-rows:]):
+            return False
+        ring = self._ordered(self.closes, self.head)[self.ROWS - rows :]
+        recent = close.iloc[-rows:].to_numpy(dtype=np.float64)
+        return bool(np.array_equal(ring, recent, equal_nan=True))
+
+    def append(self, date, values: np.ndarray):
+        """Advance by one session."""
+        values = values.astype(np.float64)
+        pos = self.head
+        for i, window in enumerate(self.WINDOWS):
+            leaving = self.closes[(pos - window) % self.ROWS]
+            self.sums[i] += np.nan_to_num(values) - np.nan_to_num(leaving)
+            self.nans[i] += np.isnan(values).astype(int) - np.isnan(leaving)
+        self.closes[pos] = values
+        self.dates[pos] = np.datetime64(date, "ns")
+        self.head = (pos + 1) % self.ROWS
+        self.ma200[self.ma_head] = self.latest_mean(2)
+        self.ma_head = (self.ma_head + 1) % len(self.ma200)
+        self.updates += 1
+
+    def latest_mean(self, i: int) -> np.ndarray:
+        with np.errstate(invalid="ignore"):
+            return np.where(self.nans[i] == 0, self.sums[i] / self.WINDOWS[i], np.nan)
+
+    def latest(self) -> dict:
+        """Indicator values at last_date, as arrays in ticker order."""
+        def close_back(sessions):
+            return self.closes[(self.head - 1 - sessions) % self.ROWS]
+
+        today = close_back(0)
+        base = close_back(252)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "ma50": self.latest_mean(0),
+                "ma150": self.latest_mean(1),
+                "ma200": self.latest_mean(2),
+                "ma200_prev": self.ma200[self.ma_head % len(self.ma200)],
+                "return_252": today / base - 1,
+                "momentum_12_1": close_back(21) / base - 1,
+            }
 
-    value_series = pd.Series(value_rows, name="value_raw")
-    quality_series = pd.Series(quality_rows, name="quality_raw")
+    def drift(self, other: "IndicatorState") -> float:
+        """Largest relative difference between the two states' indicators."""
+        ours, theirs = self.latest(), other.latest()
+        worst = 0.0
+        for field in self.FIELDS:
+            a, b = ours[field], theirs[field]
+            both = np.isfinite(a) & np.isfinite(b)
+            if (np.isnan(a) != np.isnan(b)).any():
+                return float("inf")
+            if both.any():
+                scale = np.maximum(np.abs(b[both]), 1e-12)
+                worst = max(worst, float(np.max(np.abs(a[both] - b[both]) / scale)))
+        return worst
+
+
+@timed_stage("advance_indicator_state")
+def advance_indicator_state(state, close: pd.DataFrame) -> tuple:
+    """Bring the state up to close's last session.
+
+    Returns (state, status): "incremental" when only new sessions were
+    appended, "verified" when the periodic rebuild replaced it, and
+    "rebuilt" when the state was missing or no longer matched the matrix
+    (new tickers, restated bars, a gap of more than one ring of sessions).
+    """
+    tickers = [str(t) for t in close.columns]
+    if (
+        state is None
+        or state.tickers != tickers
+        or state.last_date not in close.index
+        or not state.matches(close.loc[: state.last_date])
+    ):
+        return IndicatorState.from_close(close), "rebuilt"
+
+    start = close.index.get_loc(state.last_date) + 1
+    values = close.to_numpy()
+    for row, date in enumerate(close.index[start:], start):
+        state.append(date, values[row])
+
+    if state.updates >= INDICATOR_VERIFY_EVERY:
+        fresh = IndicatorState.from_close(close)
+        drift = state.drift(fresh)
+        if drift > INDICATOR_DRIFT_TOLERANCE:
+            print(f"Indicator state drifted by {drift:.3g}; replaced by a rebuild.")
+        return fresh, "verified"
+    return state, "incremental"
+
+
+def latest_indicator_panel(close: pd.DataFrame, state: IndicatorState) -> dict:
+    """Panel with only the last session's indicators, from the state.
+
+    compute_signal reads only that row; build_sepa_chart recomputes the
+    moving averages of the few tickers it charts.
+    """
+    index = pd.DatetimeIndex([state.last_date], name=close.index.name)
+    dtype = np.result_type(*close.dtypes) if close.shape[1] else np.float64
+    panel = {"close": close}
+    for field, values in state.latest().items():
+        panel[field] = pd.DataFrame(
+            values[None, :].astype(dtype), index=index, columns=close.columns
+        )
+    return panel
 
-    def zscore(series: pd.Series) -> pd.Series:
-        valid_vals = series.dropna()
-        if valid_vals.empty or valid_vals.std() == 0:
-            return pd.Series(0.0, index=series.index)
-        return (series - valid_vals.mean()) / valid_vals.std()
 
-    momentum_z = zscore(momentum)
-    quality_z = zscore(quality_series)
-    value_z = zscore(value_series)
+FACTOR_NODES = {}
 
-    composite = (momentum_z + quality_z + value_z) / 3.0
 
-    ma50 = close[available].rolling(50).mean().loc[latest_date]
-    ma150 = close[available].rolling(150).mean().loc[latest_date]
-    ma200 = close[available].rolling(200).mean().loc[latest_date]
-    ma200_prev = close[available].rolling(200).mean().shift(20).loc[latest_date]
+def factor_node(name: str, *inputs: str, per_universe: bool = False):
+    """Register a node of the factor graph, computed from its input nodes.
 
-    rs_series = pd.Series(rs_scores, name="rs_score")
-    rs_valid = rs_series.dropna()
-    rs_threshold = rs_valid.quantile(0.8) if not rs_valid.empty else None
+    Market nodes are values at the latest session for every ticker in the
+    panel (Series, or scalars); they are called as func(engine, *inputs).
+    Per-universe nodes are called as func(engine, tickers, *inputs).
+    """
+
+    def register(func):
+        FACTOR_NODES[name] = (inputs, per_universe, func)
+        return func
+
+    return register
 
-    sepa_rows = {}
-    for ticker in momentum.index:
-        price = latest_px[ticker]
-        sma50 = ma50.get(ticker)
-        sma150 = ma150.get(ticker)
-        sma200 = ma200.get(ticker)
-        sma200_prev = ma200_prev.get(ticker)
-        rs_score = rs_series.get(ticker)
-
-        if any(pd.isna(x) for x in [price, sma50, sma150, sma200, sma200_prev]):
-            sepa_rows[ticker] = False
-            continue
-        if rs_threshold is not None and (rs_score is None or rs_score < rs_threshold):
-            sepa_rows[ticker] = False
-            continue
 
-        sepa_rows[ticker] = bool(
-            price > sma50
-            and price > sma150
-            and price > sma200
-            and sma50 > sma150
-            and sma150 > sma200
-            and sma200 > sma200_prev
+class FactorEngine:
+    """Memoized evaluation of the factor graph over one indicator panel.
+
+    Each node is computed at most once per panel (market nodes) or per
+    panel and universe, and shared by every universe and composite that
+    reads it, so extra composites only add their weighted sums.
+    """
+
+    def __init__(self, panel: dict, fundamentals: dict, spy_close: pd.Series):
+        self.panel = panel
+        self.fundamentals = fundamentals
+        self.spy_close = spy_close
+        self._memo = {}
+
+    def _memoized(self, key, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def get(self, name: str, tickers=None):
+        inputs, per_universe, func = FACTOR_NODES[name]
+        if not per_universe:
+            return self._memoized(
+                (name,), lambda: func(self, *[self.get(i, tickers) for i in inputs])
+            )
+        return self._memoized(
+            (name, tuple(tickers)),
+            lambda: func(self, tickers, *[self.get(i, tickers) for i in inputs]),
         )
 
-    ranked = pd.DataFrame(
+    def zscore(self, name: str, tickers, winsorize: float = 0.0) -> pd.Series:
+        """Universe z-score of a factor over the scored tickers."""
+
+        def compute():
+            values = self.get(name)[self.get("momentum", tickers).index]
+            if winsorize:
+                values = values.clip(
+                    values.quantile(winsorize), values.quantile(1 - winsorize)
+                )
+            return zscore(values)
+
+        return self._memoized(("zscore", name, winsorize, tuple(tickers)), compute)
+
+    def composite(self, tickers, definition: dict) -> pd.Series:
+        """Weighted mean of the definition's factor z-scores."""
+        total = None
+        for name, weight in definition["factors"].items():
+            part = weight * self.zscore(name, tickers, definition["winsorize"])
+            total = part if total is None else total + part
+        return total / sum(definition["factors"].values())
+
+    def rank(self, tickers, definition: dict = None) -> tuple:
+        """The universe's ranked frame under a composite, and the session."""
+        definition = definition or DEFAULT_COMPOSITES[DEFAULT_COMPOSITE]
+        latest_date = self.get("latest_date")
+        if pd.isna(latest_date) or self.get("scored_frame", tickers).empty:
+            return pd.DataFrame(), latest_date
+        ranked = self.get("scored_frame", tickers).copy()
+        position = ranked.columns.get_loc("rs_score")
+        ranked.insert(position, "composite_score", self.composite(tickers, definition))
+        return ranked.sort_values("composite_score", ascending=False), latest_date
+
+
+@factor_node("latest_date")
+def _latest_date(engine):
+    return engine.panel["momentum_12_1"].dropna(how="all").index.max()
+
+
+def _panel_row(field: str):
+    def compute(engine, latest_date):
+        return engine.panel[field].loc[latest_date]
+
+    return compute
+
+
+for _field in [
+    "close",
+    "ma50",
+    "ma150",
+    "ma200",
+    "ma200_prev",
+    "return_252",
+    "momentum_12_1",
+]:
+    factor_node(_field, "latest_date")(_panel_row(_field))
+
+
+@factor_node("spy_return", "latest_date")
+def _spy_return(engine, latest_date):
+    spy_close = engine.spy_close
+    if latest_date not in spy_close.index:
+        return None
+    return spy_close.loc[latest_date] / spy_close.shift(252).loc[latest_date] - 1
+
+
+@factor_node("rs_score", "return_252", "spy_return")
+def _rs_score(engine, stock_return, spy_return):
+    """Relative strength vs SPY (12-month return difference)."""
+    if spy_return is None:
+        return pd.Series(float("nan"), index=stock_return.index)
+    return stock_return - spy_return
+
+
+@factor_node("fundamentals")
+def _fundamentals(engine):
+    return fundamentals_frame(engine.fundamentals, engine.panel["close"].columns)
+
+
+@factor_node("value_raw", "fundamentals")
+def _value_raw(engine, metrics):
+    """Mean of the positive earnings and book yields."""
+    pe = metrics["pe_ratio"]
+    pb = metrics["pb_ratio"]
+    yields = pd.concat([(1.0 / pe).where(pe > 0), (1.0 / pb).where(pb > 0)], axis=1)
+    return yields.mean(axis=1)
+
+
+@factor_node("quality_raw", "fundamentals")
+def _quality_raw(engine, metrics):
+    """Mean of ROE and operating margin (net margin when operating is missing)."""
+    margin = metrics["operating_margin"].fillna(metrics["profit_margin"])
+    return pd.concat([metrics["roe"], margin], axis=1).mean(axis=1)
+
+
+@factor_node("sepa_trend", "close", "ma50", "ma150", "ma200", "ma200_prev")
+def _sepa_trend(engine, price, sma50, sma150, sma200, sma200_prev):
+    """Trend template conditions, requiring every input to be present."""
+    complete = (
+        pd.concat([price, sma50, sma150, sma200, sma200_prev], axis=1)
+        .notna()
+        .all(axis=1)
+    )
+    return complete & (
+        (price > sma50)
+        & (price > sma150)
+        & (price > sma200)
+        & (sma50 > sma150)
+        & (sma150 > sma200)
+        & (sma200 > sma200_prev)
+    )
+
+
+@factor_node("available", per_universe=True)
+def _available(engine, tickers):
+    columns = engine.panel["momentum_12_1"].columns
+    return [t for t in tickers if t in columns]
+
+
+@factor_node("momentum", "available", "momentum_12_1", "close", per_universe=True)
+def _momentum(engine, tickers, available, signal, price):
+    """Momentum of the scored tickers (signal present, price above $5), best first."""
+    valid = signal[available].dropna()
+    valid = valid[price[available][valid.index] > 5]
+    return valid.sort_values(ascending=False)
+
+
+@factor_node("sepa_pass", "momentum", "rs_score", "sepa_trend", per_universe=True)
+def _sepa_pass(engine, tickers, momentum, rs_score, trend):
+    """Trend template plus RS in the universe's top quintile."""
+    scored = momentum.index
+    rs_series = rs_score[scored]
+    rs_valid = rs_series.dropna()
+    rs_threshold = rs_valid.quantile(0.8) if not rs_valid.empty else None
+    # A missing RS score does not fail the RS filter, only a low one does.
+    rs_ok = ~(rs_series < rs_threshold) if rs_threshold is not None else True
+    return trend[scored] & rs_ok
+
+
+@factor_node("scored_frame", "available", "momentum", per_universe=True)
+def _scored_frame(engine, tickers, available, momentum):
+    """Every output column but the composite, shared by all composites."""
+    if not available or momentum.empty:
+        return pd.DataFrame()
+    scored = momentum.index
+    return pd.DataFrame(
         {
             "momentum_12_1": momentum,
-            "quality_raw": quality_series,
-            "value_raw": value_series,
-            "momentum_z": momentum_z,
-            "quality_z": quality_z,
-            "value_z": value_z,
-            "composite_score": composite,
-            "rs_score": pd.Series(rs_scores, name="rs_score"),
-            "ma_50": ma50,
-            "ma_150": ma150,
-            "ma_200": ma200,
-            "sepa_pass": pd.Series(sepa_rows, name="sepa_pass"),
+            "quality_raw": engine.get("quality_raw")[scored],
+            "value_raw": engine.get("value_raw")[scored],
+            "momentum_z": engine.zscore("momentum_12_1", tickers),
+            "quality_z": engine.zscore("quality_raw", tickers),
+            "value_z": engine.zscore("value_raw", tickers),
+            "rs_score": engine.get("rs_score")[scored],
+            "ma_50": engine.get("ma50")[available],
+            "ma_150": engine.get("ma150")[available],
+            "ma_200": engine.get("ma200")[available],
+            "sepa_pass": engine.get("sepa_pass", tickers),
         }
-    ).sort_values("composite_score", ascending=False)
+    )
 
-    return ranked, latest_date
 
+@timed_stage("compute_signal")
+def compute_signal(
+    close: pd.DataFrame,
+    fundamentals: dict,
+    tickers: list,
+    spy_close: pd.Series,
+    panel: dict = None,
+    composite: dict = None,
+    engine: FactorEngine = None,
+) -> tuple:
+    if engine is None:
+        if panel is None:
+            panel = build_indicator_panel(close)
+        engine = FactorEngine(panel, fundamentals, spy_close)
+    return engine.rank(tickers, composite)
+
+
+def assign_actions(ranked: pd.DataFrame) -> pd.DataFrame:
+    """Rank the sorted frame and mark the top and bottom quintiles."""
+    total = len(ranked)
+    n = max(1, total // 5)
+    ranked["rank"] = range(1, total + 1)
+    ranked["action"] = "HOLD"
+    ranked.loc[ranked.index[:n], "action"] = "BUY"
+    ranked.loc[ranked.index[-n:], "action"] = "SELL"
+    return ranked
+
+
+@timed_stage("build_sepa_charts")
+def build_sepa_chart(panel: dict, spy_close: pd.Series, ticker: str, rs_score):
+    close = panel["close"]
+    if ticker not in close.columns:
+        return None
+    series = close[ticker].dropna()
+    spy_series = spy_close.reindex(series.index).dropna()
+    series = series.loc[spy_series.index]
+
+    # Reuse the panel's moving averages unless dropping NaN/SPY-less bars
+    # shifted the rolling windows, in which case recompute on the series.
+    contiguous = not series.empty and len(series) == len(
+        close.loc[series.index[0] : series.index[-1]]
+    )
+    if contiguous and len(panel["ma50"]) == len(close):
+        ma50_series = panel["ma50"][ticker]
+        ma150_series = panel["ma150"][ticker]
+        ma200_series = panel["ma200"][ticker]
+    else:
+        # A latest-session panel has no MA history: compute it for this
+        # ticker on the calendar column (same values as the full panel).
+        source = close[ticker] if contiguous else series
+        ma50_series = source.rolling(50).mean()
+        ma150_series = source.rolling(150).mean()
+        ma200_series = source.rolling(200).mean()
+
+    tail = series.index[-CHART_DAYS:]
+    dates = [d.date().isoformat() for d in tail]
 
-def build_universes():
-    sp500 = get_sp500_tickers()
-    nasdaq100 = get_nasdaq100_tickers()
+    def to_list(s):
+        return [None if pd.isna(v) else float(v) for v in s.loc[tail]]
 
-    sp500_caps = fetch_market_caps(sp500)
-    sorted_caps_desc = sorted(sp500_caps.items(), key=lambda x: x[1], reverse=True)
-    sorted_caps_asc = list(reversed(sorted_caps_desc))
-    top100 = [ticker for ticker, _ in sorted_caps_desc][:100]
-    bottom100 = [ticker for ticker, _ in sorted_caps_asc][:100]
+    rs_line = series.loc[tail] / spy_series.loc[tail]
+    rs_norm = rs_line / rs_line.iloc[0] if not rs_line.empty else rs_line
 
     return {
-        "nasdaq100": {
-            "name": "Nasdaq-100",
-            "tickers": nasdaq100,
-        },
-        "sp500_top100": {
-            "name": "S&P 500 Top 100",
-            "tickers": top100,
-        },
-        "sp500_bottom100": {
-            "name": "S&P 500 Bottom 100",
-            "tickers": bottom100,
-        },
+        "ticker": ticker,
+        "dates": dates,
+        "close": to_list(series),
+        "ma50": to_list(ma50_series),
+        "ma150": to_list(ma150_series),
+        "ma200": to_list(ma200_series),
+        "rs_line": to_list(rs_norm),
+        "rs_score": rs_score,
     }
 
 
-def main():
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    if load_dotenv:
-        load_dotenv(dotenv_path=os.path.join(root_dir, ".env"))
+def frame_records(ranked: pd.DataFrame) -> list:
+    """Dashboard records from the ranked frame, built a column at a time.
 
-    universes = build_universes()
-    base_tickers = sorted({t for u in universes.values() for t in u["tickers"]})
-    all_tickers = list(base_tickers)
-    if "SPY" not in all_tickers:
-        all_tickers.append("SPY")
+    Floats are rounded for output and NaN/inf become None here, so the
+    records are ready to encode without another pass over every value.
+    """
+    columns = {"ticker": ranked.index.tolist()}
+    for field in RECORD_FLOAT_FIELDS:
+        digits = PRICE_DECIMALS if field in PRICE_FIELDS else VALUE_DECIMALS
+        values = ranked[field].to_numpy(dtype=float).tolist()
+        columns[field] = [
+            round(v, digits) if math.isfinite(v) else None for v in values
+        ]
+    columns["sepa_pass"] = [bool(v) for v in ranked["sepa_pass"].tolist()]
+    columns["rank"] = ranked["rank"].astype(int).tolist()
+    columns["action"] = ranked["action"].tolist()
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def score_universe(
+    engine: FactorEngine, info: dict, chart_count: int, composites: dict = None
+):
+    """Rank one universe and build its records and SEPA charts.
+
+    The universe is ranked by its own composite (the default unless it sets
+    `composite`); every other composite is ranked too and returned under
+    "variants" for the signal history. Returns None when no ticker in the
+    universe could be scored.
+    """
+    composites = composites or DEFAULT_COMPOSITES
+    primary = info.get("composite", DEFAULT_COMPOSITE)
+    ranked, latest_date = compute_signal(
+        engine.panel["close"],
+        engine.fundamentals,
+        info["tickers"],
+        engine.spy_close,
+        composite=composites[primary],
+        engine=engine,
+    )
+    if len(ranked) == 0:
+        return None
 
-    close, failures = fetch_close_series(all_tickers)
-    spy_close = close.get("SPY", pd.Series(dtype=float))
+    assign_actions(ranked)
+    records = frame_records(ranked)
+
+    sepa_candidates = [r for r in records if r["sepa_pass"]]
+    sepa_charts = []
+    for candidate in sepa_candidates[:chart_count]:
+        chart = build_sepa_chart(
+            engine.panel,
+            engine.spy_close,
+            candidate["ticker"],
+            candidate.get("rs_score"),
+        )
+        if chart is not None:
+            sepa_charts.append(chart)
 
-    cache_path = os.path.join(root_dir, "dashboard", "data", "fundamentals_cache.json")
-    cache = load_fundamentals_cache(cache_path)
-    if cache:
-        fundamentals = cache.get("data", {})
-        fundamentals_as_of = cache.get("as_of")
-    else:
-        fundamentals = fetch_fundamentals(base_tickers)
-        fundamentals_as_of = datetime.utcnow().date().isoformat()
-        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump({"as_of": fundamentals_as_of, "data": fundamentals}, f, indent=2)
-
-    analyst_cache_path = os.path.join(
-        root_dir, "dashboard", "data", "analyst_cache.json"
+    variants = {
+        name: assign_actions(engine.rank(info["tickers"], definition)[0])
+        for name, definition in composites.items()
+        if name != primary
+    }
+
+    return {
+        "latest_date": latest_date,
+        "ranked": ranked,
+        "records": records,
+        "sepa_candidates": sepa_candidates,
+        "sepa_charts": sepa_charts,
+        "variants": variants,
+    }
+
+
+def share_panel(panel: dict) -> tuple:
+    """Copy the indicator panel into one shared-memory block.
+
+    Fields are laid out back to back, so a latest-session panel (one row
+    per indicator next to the full close matrix) shares just as well.
+    Returns the block (the caller closes and unlinks it) and the small spec
+    workers need to map it back into DataFrames without copying.
+    """
+    fields = list(panel)
+    dtype = np.result_type(*(panel[field].dtypes.max() for field in fields))
+    total = sum(panel[field].size for field in fields)
+    block = shared_memory.SharedMemory(create=True, size=max(1, total * dtype.itemsize))
+    layout = []
+    offset = 0
+    for field in fields:
+        frame = panel[field]
+        view = np.ndarray(
+            frame.shape, dtype=dtype, buffer=block.buf, offset=offset * dtype.itemsize
+        )
+        view[:] = frame.to_numpy(dtype=dtype)
+        layout.append((field, frame.shape, offset, frame.index))
+        offset += frame.size
+    spec = {
+        "name": block.name,
+        "dtype": dtype.str,
+        "fields": layout,
+        "columns": panel["close"].columns,
+    }
+    return block, spec
+
+
+_worker_state = {}
+
+
+def _attach_panel(spec: dict, fundamentals: dict, spy_close: pd.Series):
+    block = shared_memory.SharedMemory(name=spec["name"])
+    dtype = np.dtype(spec["dtype"])
+    panel = {}
+    for field, shape, offset, index in spec["fields"]:
+        values = np.ndarray(
+            shape, dtype=dtype, buffer=block.buf, offset=offset * dtype.itemsize
+        )
+        panel[field] = pd.DataFrame(
+            values, index=index, columns=spec["columns"], copy=False
+        )
+    # The block must stay open for as long as the views are in use.
+    _worker_state.update(
+        block=block, engine=FactorEngine(panel, fundamentals, spy_close)
     )
-    analyst_cache = load_analyst_cache(analyst_cache_path)
-    analyst_data = analyst_cache.get("data", {}) if analyst_cache else {}
-    analyst_as_of = analyst_cache.get("as_of") if analyst_cache else None
 
-    universe_payloads = []
-    as_of_date = None
 
-    for universe_id, info in universes.items():
-        ranked, latest_date = compute_signal(
-            close, fundamentals, info["tickers"], spy_close
+def _score_shared(info: dict, chart_count: int, composites: dict) -> tuple:
+    # Stages timed here land in this process's RUN_STATS; send them back to
+    # the parent with the result.
+    RUN_STATS.reset()
+    result = score_universe(_worker_state["engine"], info, chart_count, composites)
+    return result, RUN_STATS.export()
+
+
+@timed_stage("score_universes")
+def score_universes(
+    panel: dict,
+    fundamentals: dict,
+    spy_close: pd.Series,
+    universes: dict,
+    chart_count: int,
+    workers: int = 1,
+    composites: dict = None,
+) -> dict:
+    """Score every universe, across a process pool when workers > 1.
+
+    The panel is shared with the workers through shared memory, so each one
+    maps the same matrices instead of receiving a pickled copy, and keeps
+    its own factor engine across the universes it scores. Each worker
+    computes the market-level factor nodes again, so the pool only pays off
+    for large universes. Results come back in universe order, and the
+    workers' stage timings are merged into RUN_STATS.
+    """
+    workers = min(workers, len(universes))
+    if workers <= 1:
+        engine = FactorEngine(panel, fundamentals, spy_close)
+        return {
+            universe_id: score_universe(engine, info, chart_count, composites)
+            for universe_id, info in universes.items()
+        }
+
+    block, spec = share_panel(panel)
+    try:
+        with ProcessPoolExecutor(
+            workers,
+            initializer=_attach_panel,
+            initargs=(spec, fundamentals, spy_close),
+        ) as pool:
+            futures = {
+                universe_id: pool.submit(
+                    _score_shared, info, chart_count, composites
+                )
+                for universe_id, info in universes.items()
+            }
+            scored = {}
+            for universe_id, future in futures.items():
+                scored[universe_id], stats = future.result()
+                RUN_STATS.merge(stats)
+            return scored
+    finally:
+        block.close()
+        block.unlink()
+
+
+def history_partition_path(history_dir: str, universe_id: str, year: int) -> str:
+    """A compacted year: every date of that year in one file."""
+    return frame_path(os.path.join(history_dir, universe_id, str(year)))
+
+
+def history_date_path(history_dir: str, universe_id: str, as_of: pd.Timestamp) -> str:
+    return frame_path(
+        os.path.join(
+            history_dir, universe_id, str(as_of.year), as_of.date().isoformat()
         )
-        as_of_date = latest_date
+    )
 
-        total = len(ranked)
-        if total == 0:
-            continue
 
-        n = max(1, total // 5)
-        ranked["rank"] = range(1, total + 1)
-        ranked["action"] = "HOLD"
-        ranked.loc[ranked.index[:n], "action"] = "BUY"
-        ranked.loc[ranked.index[-n:], "action"] = "SELL"
-
-        records = []
-        for ticker, row in ranked.reset_index().iterrows():
-            records.append(
-                {
-                    "ticker": row["index"],
-                    "momentum_12_1": float(row["momentum_12_1"]),
-                    "quality_raw": None
-                    if pd.isna(row["quality_raw"])
-                    else float(row["quality_raw"]),
-                    "value_raw": None
-                    if pd.isna(row["value_raw"])
-                    else float(row["value_raw"]),
-                    "composite_score": float(row["composite_score"]),
-                    "rs_score": None
-                    if pd.isna(row["rs_score"])
-                    else float(row["rs_score"]),
-                    "ma_50": None if pd.isna(row["ma_50"]) else float(row["ma_50"]),
-                    "ma_150": None
-                    if pd.isna(row["ma_150"])
-                    else float(row["ma_150"]),
-                    "ma_200": None
-                    if pd.isna(row["ma_200"])
-                    else float(row["ma_200"]),
-                    "sepa_pass": bool(row["sepa_pass"]),
-                    "rank": int(row["rank"]),
-                    "action": row["action"],
-                }
+def append_signal_history(
+    history_dir: str, universe_id: str, as_of: pd.Timestamp, ranked: pd.DataFrame
+):
+    """Write one date's ranking as its own file in the universe's history.
+
+    Files already written are never read or rewritten, so the cost stays
+    flat through the year and an interrupted write can lose at most that
+    date. Dates already stored are left alone, so re-running a refresh for
+    the same date is a no-op.
+    """
+    path = history_date_path(history_dir, universe_id, as_of)
+    if os.path.exists(path):
+        return False
+    compacted = history_partition_path(history_dir, universe_id, as_of.year)
+    if os.path.exists(compacted) and not read_frame(
+        compacted, filters=[("date", "==", as_of)]
+    ).empty:
+        return False
+
+    rows = ranked.rename_axis("ticker").reset_index()
+    rows["date"] = as_of
+    rows["sepa_pass"] = rows["sepa_pass"].fillna(False).astype(bool)
+    # Sorted by ticker so Parquet row-group statistics can skip on lookups.
+    write_frame(rows[HISTORY_COLUMNS].sort_values("ticker"), path)
+    return True
+
+
+def compact_signal_history(history_dir: str, universe_id: str, before_year: int):
+    """Merge the date files of each year before before_year into one file.
+
+    Finished years are read far more often than written, so they are kept
+    as a single file again. The merged file is written before any date file
+    is removed, and load_signal_history drops duplicate rows, so an
+    interrupted compaction loses nothing.
+    """
+    universe_dir = os.path.join(history_dir, universe_id)
+    if not os.path.isdir(universe_dir):
+        return
+    for name in sorted(os.listdir(universe_dir)):
+        year_dir = os.path.join(universe_dir, name)
+        if not (name.isdigit() and int(name) < before_year and os.path.isdir(year_dir)):
+            continue
+        path = history_partition_path(history_dir, universe_id, int(name))
+        frames = [read_frame(path)] if os.path.exists(path) else []
+        date_files = [
+            os.path.join(year_dir, f)
+            for f in sorted(os.listdir(year_dir))
+            if not f.endswith(".tmp")
+        ]
+        frames += [read_frame(f) for f in date_files]
+        if frames:
+            rows = pd.concat(frames, ignore_index=True)[HISTORY_COLUMNS]
+            rows = rows.drop_duplicates(["date", "ticker"])
+            write_frame(rows.sort_values(["ticker", "date"]), path)
+        shutil.rmtree(year_dir)
+
+
+def load_signal_history(
+    history_dir: str, universe_id: str, ticker=None, start=None, end=None
+) -> pd.DataFrame:
+    """History rows for a universe, optionally for one ticker and date range.
+
+    Reads compacted years (<year>.parquet) and per-date files
+    (<year>/<date>.parquet) alike.
+    """
+    universe_dir = os.path.join(history_dir, universe_id)
+    if not os.path.isdir(universe_dir):
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    filters = [("ticker", "==", ticker)] if ticker else None
+
+    paths = []
+    for name in sorted(os.listdir(universe_dir)):
+        year = name.split(".", 1)[0]
+        if not year.isdigit() or name.endswith(".tmp"):
+            continue
+        if (start is not None and int(year) < start.year) or (
+            end is not None and int(year) > end.year
+        ):
+            continue
+        path = os.path.join(universe_dir, name)
+        if not os.path.isdir(path):
+            paths.append(path)
+            continue
+        for date_name in sorted(os.listdir(path)):
+            day = date_name.split(".", 1)[0]
+            if date_name.endswith(".tmp") or (
+                (start is not None and day < start.date().isoformat())
+                or (end is not None and day > end.date().isoformat())
+            ):
+                continue
+            paths.append(os.path.join(path, date_name))
+    frames = [read_frame(path, filters=filters) for path in paths]
+    if not frames:
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+
+    history = pd.concat(frames, ignore_index=True)
+    history = history.drop_duplicates(["date", "ticker"])
+    if start is not None:
+        history = history[history["date"] >= start]
+    if end is not None:
+        history = history[history["date"] <= end]
+    return history.sort_values(["date", "rank"]).reset_index(drop=True)
+
+
+@timed_stage("build_universes")
+def build_universes(config: dict, snapshot_dir: str, offline: bool = False) -> dict:
+    """Resolve the configured universes to ticker lists.
+
+    Source constituents and market caps come from local snapshots while
+    those are fresh, so most runs make no constituent requests at all.
+    """
+    sources = config.get("sources", {})
+    constituents = {}
+    for universe in config["universes"]:
+        for name in universe.get("sources", []):
+            if name in constituents:
+                continue
+            if name not in sources:
+                raise SystemExit(f"Universe {universe['id']!r}: no source {name!r}.")
+            source = sources[name]
+            constituents[name] = cached_snapshot(
+                os.path.join(snapshot_dir, f"{name}.json"),
+                source.get("refresh_days", CONSTITUENT_REFRESH_DAYS),
+                lambda source=source: fetch_constituents(source),
+                key=source["url"],
+                offline=offline,
             )
 
-        sepa_candidates = [r for r in records if r["sepa_pass"]]
-        sepa_top = sepa_candidates[:5]
+    def base_tickers(universe):
+        tickers = []
+        for name in universe.get("sources", []):
+            tickers += constituents[name]
+        tickers += universe.get("tickers", [])
+        return list(dict.fromkeys(tickers))
 
-        sepa_charts = []
-        for candidate in sepa_top:
-            ticker = candidate["ticker"]
-            if ticker not in close.columns:
-                continue
-            series = close[ticker].dropna()
-            spy_series = spy_close.reindex(series.index).dropna()
-            series = series.loc[spy_series.index]
-
-            ma50_series = series.rolling(50).mean()
-            ma150_series = series.rolling(150).mean()
-            ma200_series = series.rolling(200).mean()
-
-            tail = series.index[-220:] if len(series.index) > 220 else series.index
-            dates = [d.date().isoformat() for d in tail]
-
-            def to_list(s):
-                return [None if pd.isna(v) else float(v) for v in s.loc[tail]]
-
-            rs_line = series.loc[tail] / spy_series.loc[tail]
-            rs_norm = rs_line / rs_line.iloc[0] if not rs_line.empty else rs_line
-
-            sepa_charts.append(
-                {
-                    "ticker": ticker,
-                    "dates": dates,
-                    "close": to_list(series),
-                    "ma50": to_list(ma50_series),
-                    "ma150": to_list(ma150_series),
-                    "ma200": to_list(ma200_series),
-                    "rs_line": to_list(rs_norm),
-                    "rs_score": candidate.get("rs_score"),
-                }
+    sized = sorted(
+        {t for u in config["universes"] if u.get("market_cap") for t in base_tickers(u)}
+    )
+    caps = {}
+    if sized:
+        caps = cached_snapshot(
+            os.path.join(snapshot_dir, "market_caps.json"),
+            MARKET_CAP_REFRESH_DAYS,
+            lambda: fetch_market_caps(sized),
+            key=hashlib.sha256(" ".join(sized).encode("utf-8")).hexdigest(),
+            offline=offline,
+        )
+
+    universes = {}
+    for universe in config["universes"]:
+        tickers = base_tickers(universe)
+        order = universe.get("market_cap")
+        if order:
+            if order not in ("top", "bottom"):
+                raise SystemExit(
+                    f"Universe {universe['id']!r}: market_cap must be top or bottom."
+                )
+            ranked = sorted(
+                ((t, caps[t]) for t in tickers if t in caps),
+                key=lambda x: x[1],
+                reverse=True,
             )
+            if order == "bottom":
+                ranked.reverse()
+            tickers = [ticker for ticker, _ in ranked][: universe.get("count")]
+        universes[universe["id"]] = {
+            "name": universe["name"],
+            "tickers": tickers,
+            "composite": universe.get("composite", DEFAULT_COMPOSITE),
+        }
+    return universes
+
+
+def round_payload(value, key: str = None):
+    """Round floats for output and turn NaN/inf into null."""
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return None
+        return round(value, PRICE_DECIMALS if key in PRICE_FIELDS else VALUE_DECIMALS)
+    if isinstance(value, dict):
+        return {k: round_payload(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [round_payload(v, key) for v in value]
+    return value
+
+
+def encode_json(value) -> str:
+    if orjson:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), allow_nan=False)
+
+
+class OutputTracker:
+    """Content hashes of the dashboard files, so unchanged ones are left alone.
+
+    A file is rewritten only when the sha256 of its new content differs
+    from the file on disk, which keeps its mtime (and rsync, git and CDN
+    caches) untouched. The hash, size and mtime of every file are kept in
+    a JSON manifest, so files that have not been touched since are not
+    re-read to hash them. Paths written with new content or removed are
+    collected in `changed`, relative to the root.
+    """
+
+    def __init__(self, root: str, manifest_path: str = None):
+        self.root = os.path.abspath(root)
+        self.manifest_path = manifest_path
+        self.entries = {}
+        if manifest_path and os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            if manifest.get("root") == self.root:
+                self.entries = manifest.get("files", {})
+        self.changed = []
+        self.seen = set()
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def _current(self, path: str):
+        """Hash of the file on disk, or None when there is none."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        entry = self.entries.get(self._relative(path))
+        if entry and (entry["size"], entry["mtime_ns"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return entry["sha256"]
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def _remember(self, path: str, digest: str):
+        stat = os.stat(path)
+        self.entries[self._relative(path)] = {
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
 
-        buy_list = [r for r in records if r["action"] == "BUY"][:10]
-        analyst_tickers = [r["ticker"] for r in buy_list]
-        if analyst_tickers:
-            analyst_data = fetch_analyst_data(analyst_tickers, analyst_data)
-            analyst_as_of = datetime.utcnow().date().isoformat()
-            os.makedirs(os.path.dirname(analyst_cache_path), exist_ok=True)
-            with open(analyst_cache_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {"as_of": analyst_as_of, "data": analyst_data}, f, indent=2
+    def keep(self, path: str):
+        """Note a file this run produced but left as it was."""
+        self.seen.add(self._relative(path))
+        digest = self._current(path)
+        if digest is not None:
+            self._remember(path, digest)
+
+    def unchanged(self, path: str, digest: str) -> bool:
+        self.seen.add(self._relative(path))
+        if self._current(path) != digest:
+            return False
+        self._remember(path, digest)
+        return True
+
+    def record(self, path: str, digest: str = None):
+        """Note a file that was just written (hashed from disk if needed)."""
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        self.seen.add(self._relative(path))
+        self._remember(path, digest)
+        self.changed.append(self._relative(path))
+
+    def write(self, path: str, data: bytes) -> bool:
+        """Write data atomically unless the file already holds it."""
+        digest = hashlib.sha256(data).hexdigest()
+        if self.unchanged(path, digest):
+            return False
+        write_file_atomic(path, data)
+        self.record(path, digest)
+        return True
+
+    def remove(self, path: str):
+        if os.path.exists(path):
+            os.remove(path)
+            self.changed.append(self._relative(path))
+        self.entries.pop(self._relative(path), None)
+
+    def prune(self, directory: str):
+        """Remove files this run did not produce.
+
+        That is every other file under directory, and anywhere else only
+        files an earlier run wrote (say .gz siblings before precompression
+        was turned off).
+        """
+        for relative in sorted(set(self.entries) - self.seen):
+            self.remove(os.path.join(self.root, relative))
+        for dir_path, _, file_names in os.walk(directory, topdown=False):
+            for name in file_names:
+                path = os.path.join(dir_path, name)
+                if self._relative(path) not in self.seen:
+                    self.remove(path)
+            if not os.listdir(dir_path):
+                os.rmdir(dir_path)
+
+    def save(self):
+        if self.manifest_path:
+            manifest = {"root": self.root, "files": self.entries}
+            text = json.dumps(manifest, indent=2, sort_keys=True)
+            write_file_atomic(self.manifest_path, text.encode("utf-8"))
+
+
+def write_output(
+    path: str, text: str, precompress: bool = False, tracker: OutputTracker = None
+):
+    """Write text (and .gz/.br siblings), skipping unchanged files if tracked."""
+    data = text.encode("utf-8")
+    if tracker is None:
+        write_file_atomic(path, data)
+        changed = True
+    else:
+        changed = tracker.write(path, data)
+    if not precompress:
+        return
+    siblings = {f"{path}.gz": lambda: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli:
+        siblings[f"{path}.br"] = lambda: brotli.compress(data)
+    for target, compress in siblings.items():
+        if tracker is None:
+            write_file_atomic(target, compress())
+        elif changed or not os.path.exists(target):
+            tracker.write(target, compress())
+        else:
+            tracker.keep(target)
+
+
+class OutputStream:
+    """Text fanned out to several files as it is produced.
+
+    Each file gets its own prefix and suffix and, with precompress, streamed
+    .gz/.br siblings. Everything is written under temporary names and moved
+    into place by close(), so readers never see a partial file. Each file's
+    content is hashed as it streams, so close() can leave a file that did
+    not change (and its siblings) in place.
+    """
+
+    def __init__(self):
+        self.sinks = []
+
+    def add(self, path: str, prefix: str = "", suffix: str = "", precompress=False):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        targets = [(path, None)]
+        if precompress:
+            targets.append((f"{path}.gz", "gzip"))
+            if brotli:
+                targets.append((f"{path}.br", "brotli"))
+        for target, codec in targets:
+            raw = open(f"{target}.tmp", "wb")
+            sink = {
+                "path": target,
+                "base": path,
+                "raw": raw,
+                "suffix": suffix.encode("utf-8"),
+            }
+            if codec == "gzip":
+                gz = gzip.GzipFile(
+                    filename="", mode="wb", compresslevel=9, fileobj=raw, mtime=0
+                )
+                sink.update(write=gz.write, finish=gz.close)
+            elif codec == "brotli":
+                compressor = brotli.Compressor()
+                sink.update(
+                    write=lambda data, c=compressor, f=raw: f.write(c.process(data)),
+                    finish=lambda c=compressor, f=raw: f.write(c.finish()),
                 )
+            else:
+                digest = hashlib.sha256()
+
+                def write(data, f=raw, h=digest):
+                    h.update(data)
+                    f.write(data)
+
+                sink.update(write=write, finish=lambda: None, digest=digest)
+            sink["write"](prefix.encode("utf-8"))
+            self.sinks.append(sink)
+
+    def write(self, text: str):
+        data = text.encode("utf-8")
+        for sink in self.sinks:
+            sink["write"](data)
+
+    def close(self, tracker: OutputTracker = None):
+        for sink in self.sinks:
+            sink["write"](sink["suffix"])
+            sink["finish"]()
+            sink["raw"].close()
+        unchanged = {
+            sink["path"]
+            for sink in self.sinks
+            if tracker is not None
+            and "digest" in sink
+            and tracker.unchanged(sink["path"], sink["digest"].hexdigest())
+        }
+        for sink in self.sinks:
+            path = sink["path"]
+            if sink["base"] in unchanged and os.path.exists(path):
+                os.remove(f"{path}.tmp")
+                tracker.keep(path)
+                continue
+            os.replace(f"{path}.tmp", path)
+            if tracker is not None:
+                digest = sink.get("digest")
+                tracker.record(path, digest.hexdigest() if digest else None)
+        self.sinks = []
+
+    def abort(self):
+        for sink in self.sinks:
+            sink["raw"].close()
+            if os.path.exists(f"{sink['path']}.tmp"):
+                os.remove(f"{sink['path']}.tmp")
+        self.sinks = []
+
+
+def encode_float32(values) -> str:
+    """Base64 of a little-endian float32 array, with NaN for missing values."""
+    array = np.array([np.nan if v is None else v for v in values], dtype="<f4")
+    return base64.b64encode(array.tobytes()).decode("ascii")
+
+
+def encode_chart(chart: dict, axis_positions: dict) -> dict:
+    """Compact chart: a slice of the shared date axis plus float32 series.
+
+    Dates missing from a chart inside its slice are filled with NaN.
+    """
+    start = axis_positions[chart["dates"][0]]
+    length = axis_positions[chart["dates"][-1]] - start + 1
+    offsets = [axis_positions[d] - start for d in chart["dates"]]
+    encoded = {
+        "ticker": chart["ticker"],
+        "rs_score": chart["rs_score"],
+        "encoding": "f32",
+        "axis_start": start,
+        "length": length,
+    }
+    for key in CHART_SERIES:
+        values = [None] * length
+        for offset, value in zip(offsets, chart[key]):
+            values[offset] = value
+        encoded[key] = encode_float32(values)
+    return encoded
+
+
+def table_index(records: list) -> dict:
+    """Precomputed orderings for the dashboard's full-universe table.
+
+    For every sortable column, the record positions in ascending order with
+    missing values last, plus the positions holding each action. The
+    dashboard's table worker filters by walking one of these orders instead
+    of sorting thousands of rows on every change.
+    """
+    orders = {}
+    for field in TABLE_SORT_FIELDS:
+        values = [record.get(field) for record in records]
+        missing = [i for i, value in enumerate(values) if value is None]
+        present = sorted(
+            (i for i, value in enumerate(values) if value is not None),
+            key=values.__getitem__,
+        )
+        orders[field] = present + missing
+    actions = {}
+    for i, record in enumerate(records):
+        actions.setdefault(record.get("action"), []).append(i)
+    return {"rows": len(records), "sort": orders, "actions": actions}
 
-        analyst_panel = []
-        for rec in buy_list:
-            meta = analyst_data.get(rec["ticker"], {})
-            analyst_panel.append(
-                {
-                    "ticker": rec["ticker"],
-                    "consensus": meta.get("consensus"),
-                    "analyst_count": meta.get("analyst_count"),
-                    "target_consensus": meta.get("target_consensus"),
-                    "target_high": meta.get("target_high"),
-                    "target_low": meta.get("target_low"),
-                }
-            )
 
-        universe_payloads.append(
+def chart_axis(universes) -> list:
+    """Sorted union of the chart dates across universes."""
+    return sorted(
+        {
+            d
+            for universe in universes
+            for chart in universe["sepa_charts"]
+            for d in chart["dates"]
+        }
+    )
+
+
+class DashboardWriter:
+    """Writes the dashboard files one universe at a time.
+
+    The dashboard loads manifest.json first and fetches a universe's records
+    (with the table index over them), SEPA list or charts only when that
+    view is shown. top50_signals.json/.js keep the full snapshot for other
+    consumers and for file:// viewing; they are streamed as universes are
+    added, reusing each section's encoding, so the full payload is never
+    held or encoded as one object. With
+    chart_encoding="f32" chart files hold base64 float32 series indexed into
+    one shared date axis (chart_axis.json), which must be given up front.
+
+    Records and SEPA candidates are expected to be rounded already (see
+    frame_records); the rest of each universe is rounded here. Files go
+    through an OutputTracker, so only those whose content changed are
+    rewritten, and close() removes universe files a run no longer produces.
+    """
+
+    def __init__(
+        self,
+        out_dir: str,
+        precompress: bool = False,
+        chart_encoding: str = "json",
+        axis: list = None,
+        tracker: OutputTracker = None,
+    ):
+        self.out_dir = out_dir
+        self.precompress = precompress
+        self.tracker = tracker or OutputTracker(out_dir)
+        self.axis_positions = None
+        axis_path = os.path.join(out_dir, "chart_axis.json")
+        if chart_encoding == "f32":
+            self.axis_positions = {d: i for i, d in enumerate(axis or [])}
+            self.write("chart_axis.json", encode_json({"dates": axis or []}))
+        else:
+            self.tracker.remove(axis_path)
+
+        self.manifest_universes = []
+        self.bundle = OutputStream()
+        self.bundle.add(
+            os.path.join(out_dir, "top50_signals.json"), precompress=precompress
+        )
+        self.bundle.add(
+            os.path.join(out_dir, "top50_signals.js"), "window.TOP50_DATA = ", ";"
+        )
+        self.bundle.write('{"universes":[')
+
+    def write(self, relative_path: str, text: str):
+        write_output(
+            os.path.join(self.out_dir, relative_path),
+            text,
+            self.precompress,
+            self.tracker,
+        )
+
+    def add_universe(self, universe: dict):
+        universe_id = universe["id"]
+        base = f"universes/{universe_id}"
+        records = encode_json(universe["records"])
+        sepa_candidates = encode_json(universe["sepa_candidates"])
+        analyst_panel = encode_json(round_payload(universe["analyst_panel"]))
+        self.write(
+            f"{base}/records.json",
+            f'{{"records":{records},"analyst_panel":{analyst_panel}}}',
+        )
+        self.write(f"{base}/sepa.json", f'{{"sepa_candidates":{sepa_candidates}}}')
+        self.write(f"{base}/index.json", encode_json(table_index(universe["records"])))
+
+        charts = []
+        encoded_charts = []
+        for chart in round_payload(universe["sepa_charts"]):
+            chart_path = f"{base}/charts/{chart['ticker'].replace('/', '_')}.json"
+            encoded = encode_json(chart)
+            if self.axis_positions is not None and chart["dates"]:
+                chart_data = encode_chart(chart, self.axis_positions)
+                self.write(chart_path, encode_json(chart_data))
+            else:
+                self.write(chart_path, encoded)
+            encoded_charts.append(encoded)
+            charts.append({"ticker": chart["ticker"], "path": chart_path})
+
+        summary = {
+            "id": universe_id,
+            "name": universe["name"],
+            "universe_size": universe["universe_size"],
+            "buy_count": universe["buy_count"],
+            "sell_count": universe["sell_count"],
+            "sepa_count": universe["sepa_count"],
+        }
+        self.manifest_universes.append(
             {
-                "id": universe_id,
-                "name": info["name"],
-                "universe_size": total,
-                "buy_count": int((ranked["action"] == "BUY").sum()),
-                "sell_count": int((ranked["action"] == "SELL").sum()),
-                "sepa_count": len(sepa_candidates),
-                "sepa_candidates": sepa_candidates,
-                "sepa_charts": sepa_charts,
-                "analyst_panel": analyst_panel,
-                "records": records,
+                **summary,
+                "records_path": f"{base}/records.json",
+                "sepa_path": f"{base}/sepa.json",
+                "index_path": f"{base}/index.json",
+                "charts": charts,
             }
         )
+        if len(self.manifest_universes) > 1:
+            self.bundle.write(",")
+        self.bundle.write(
+            f"{encode_json(summary)[:-1]},"
+            f'"sepa_candidates":{sepa_candidates},'
+            f'"sepa_charts":[{",".join(encoded_charts)}],'
+            f'"analyst_panel":{analyst_panel},'
+            f'"records":{records}}}'
+        )
 
-    payload = {
-        "as_of_date": as_of_date.date().isoformat() if as_of_date else "",
-        "fundamentals_as_of": fundamentals_as_of,
-        "analyst_as_of": analyst_as_of,
-        "signal": "Composite (momentum + quality + value)",
-        "universes": universe_payloads,
-        "price_failures": failures,
-    }
+    def close(self, meta: dict):
+        """Write the manifest and finish the bundle with the run metadata."""
+        meta = round_payload(meta)
+        manifest = {**meta, "universes": self.manifest_universes}
+        if self.axis_positions is not None:
+            manifest["chart_axis_path"] = "chart_axis.json"
+        self.write("manifest.json", encode_json(manifest))
+        tail = encode_json(meta)[1:]
+        self.bundle.write("]}" if tail == "}" else f"],{tail}")
+        self.bundle.close(self.tracker)
+        self.tracker.prune(os.path.join(self.out_dir, "universes"))
+        self.tracker.save()
+
+    def abort(self):
+        self.bundle.abort()
+
+
+def write_dashboard_data(
+    out_dir: str, payload: dict, precompress: bool = False, chart_encoding: str = "json"
+):
+    """Write a complete in-memory payload (see DashboardWriter)."""
+    payload = round_payload(payload)
+    writer = DashboardWriter(
+        out_dir, precompress, chart_encoding, chart_axis(payload["universes"])
+    )
+    try:
+        for universe in payload["universes"]:
+            writer.add_universe(universe)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close({k: v for k, v in payload.items() if k != "universes"})
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh the dashboard dataset.")
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write cProfile stats for the run to PATH (view with pstats/snakeviz)",
+    )
+    parser.add_argument(
+        "--offline-universes",
+        action="store_true",
+        help="Build universes from the constituent and market-cap snapshots only",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue today's checkpointed run: skip finished stages and stored "
+        "tickers, and retry only the price failures",
+    )
+    parser.add_argument(
+        "--out-dir",
+        help="Output directory (default dashboard/data, or the replay state dir)",
+    )
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record",
+        metavar="ARCHIVE",
+        help="Record every HTTP response to ARCHIVE (SQLite) for later replay",
+    )
+    archive.add_argument(
+        "--replay",
+        metavar="ARCHIVE",
+        help="Serve every HTTP request from ARCHIVE; no network or API key needed",
+    )
+    return parser.parse_args(argv)
+
+
+def write_github_outputs(changed_files: list):
+    """Expose the changed dashboard files to later GitHub Actions steps.
 
-    out_dir = os.path.join(root_dir, "dashboard", "data")
-    os.makedirs(out_dir, exist_ok=True)
+    run_report.json changes on every run and is not counted, so a run that
+    produced the same dashboard (weekends, holidays) reports changed=false.
+    """
+    path = os.getenv("GITHUB_OUTPUT")
+    if not path:
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(f"changed={'true' if changed_files else 'false'}\n")
+        f.write("changed_files<<EOF\n")
+        f.writelines(f"{name}\n" for name in changed_files)
+        f.write("EOF\n")
 
-    out_path = os.path.join(out_dir, "top50_signals.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
 
-    js_path = os.path.join(out_dir, "top50_signals.js")
-    with open(js_path, "w", encoding="utf-8") as f:
-        f.write("window.TOP50_DATA = ")
-        json.dump(payload, f)
-        f.write(";")
+def main(argv=None):
+    args = parse_args(argv)
+    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if load_dotenv:
+        load_dotenv(dotenv_path=os.path.join(root_dir, ".env"))
+
+    out_dir = args.out_dir or os.path.join(root_dir, "dashboard", "data")
+    state_dir = None
+    archive_path = args.record or args.replay
+    if archive_path:
+        if args.replay and not os.path.exists(args.replay):
+            raise SystemExit(f"No replay archive at {args.replay}.")
+        # Recording and replaying both start from empty local state, so the
+        # replay makes exactly the requests that were recorded. Each mode has
+        # its own directory, so a replay leaves the recorded output in place.
+        name = os.path.splitext(os.path.basename(archive_path))[0]
+        mode = "replay" if args.replay else "record"
+        state_dir = os.path.join(root_dir, ".cache", "replay", name, mode)
+        shutil.rmtree(state_dir, ignore_errors=True)
+        out_dir = args.out_dir or os.path.join(state_dir, "data")
+        if args.replay and not os.getenv("FMP_API_KEY"):
+            os.environ["FMP_API_KEY"] = "replay"
+    profiler = cProfile.Profile() if args.profile else None
+    status = "failed"
+    summary = {}
+    if profiler:
+        profiler.enable()
+    try:
+        summary = run_refresh(
+            root_dir,
+            out_dir,
+            resume=args.resume,
+            offline_universes=args.offline_universes,
+            state_dir=state_dir,
+            archive_path=archive_path,
+            replay=bool(args.replay),
+        )
+        status = "ok"
+        write_github_outputs(summary["changed_files"])
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+        report = RUN_STATS.report(status=status, **summary)
+        write_output(
+            os.path.join(out_dir, "run_report.json"), json.dumps(report, indent=2)
+        )
+
+
+def run_refresh(
+    root_dir: str,
+    out_dir: str,
+    resume: bool = False,
+    offline_universes: bool = False,
+    state_dir: str = None,
+    archive_path: str = None,
+    replay: bool = False,
+) -> dict:
+    state_dir = state_dir or os.path.join(root_dir, ".cache")
+    cache_dir = None
+    # A recording must see the network, not responses cached by earlier runs.
+    use_cache = os.getenv("HTTP_CACHE", "1").lower() not in ("0", "false", "no")
+    if use_cache and not archive_path:
+        cache_dir = os.getenv(
+            "HTTP_CACHE_DIR", os.path.join(root_dir, ".cache", "http")
+        )
+    archive = ResponseArchive(archive_path) if archive_path else None
+    if cache_dir or archive:
+        configure_http_client(cache_dir, archive, replay)
+
+    checkpoint = RunCheckpoint(
+        os.getenv("WORK_DIR", os.path.join(state_dir, "run")), resume
+    )
+    if checkpoint.resumed:
+        previous = checkpoint.get("prices") or {}
+        print(
+            f"Resuming run for {checkpoint.state['session']}: "
+            f"{len(checkpoint.completed('prices'))} tickers stored, "
+            f"{len(previous.get('failures', []))} price failures to retry"
+        )
+
+    config = load_universe_config(
+        os.getenv("UNIVERSES_CONFIG", os.path.join(root_dir, "universes.toml"))
+    )
+    composites = load_composites(config)
+    # Stored as [id, universe] pairs (the checkpoint is written with sorted
+    # keys) and put back in config order, which the dashboard shows them in.
+    saved = dict(checkpoint.get("universes") or [])
+    universe_ids = [universe["id"] for universe in config["universes"]]
+    if set(saved) == set(universe_ids):
+        universes = {universe_id: saved[universe_id] for universe_id in universe_ids}
+    else:
+        snapshot_dir = os.getenv(
+            "CONSTITUENTS_DIR", os.path.join(state_dir, "constituents")
+        )
+        universes = build_universes(config, snapshot_dir, offline_universes)
+        checkpoint.put("universes", list(universes.items()))
+    base_tickers = sorted({t for u in universes.values() for t in u["tickers"]})
+    all_tickers = list(base_tickers)
+    if "SPY" not in all_tickers:
+        all_tickers.append("SPY")
+
+    price_store_dir = os.getenv(
+        "PRICE_STORE_DIR", os.path.join(state_dir, "prices")
+    )
+    # Only the sessions the signal and charts read are kept in memory; the
+    # price store (and the backtest, which reads it) keeps full history.
+    full_history = os.getenv("CLOSE_HISTORY", "").lower() == "full"
+    close, failures = fetch_close_series(
+        all_tickers,
+        price_store_dir,
+        checkpoint,
+        dtype=np.dtype(os.getenv("CLOSE_DTYPE", "float64")),
+        lookback=None if full_history else CLOSE_LOOKBACK,
+    )
+    checkpoint.put("prices", {"failures": failures})
+    spy_close = close.get("SPY", pd.Series(dtype=float))
+
+    cache_backend = os.getenv("CACHE_BACKEND", "json")
+    refresh_budget = os.getenv("CACHE_REFRESH_BUDGET")
+    refresh_budget = int(refresh_budget) if refresh_budget else None
+
+    fundamentals_cache = KeyedCache(
+        os.path.join(out_dir, "fundamentals_cache"), cache_backend
+    )
+    refresh = fundamentals_cache.select_refresh(
+        base_tickers, CACHE_DAYS, refresh_budget
+    )
+    # Saved per chunk so an interrupted run keeps what it fetched; rows
+    # fetched today are not selected again on resume.
+    for start in range(0, len(refresh), CHECKPOINT_CHUNK):
+        chunk = refresh[start : start + CHECKPOINT_CHUNK]
+        fundamentals_cache.update(fetch_fundamentals(chunk))
+        fundamentals_cache.save()
+    fundamentals = fundamentals_cache.data(base_tickers)
+    fundamentals_as_of = fundamentals_cache.oldest(base_tickers)
+
+    analyst_cache = KeyedCache(os.path.join(out_dir, "analyst_cache"), cache_backend)
+
+    history_dir = os.getenv(
+        "SIGNAL_HISTORY_DIR", os.path.join(state_dir, "signal_history")
+    )
+    chart_count = int(os.getenv("SEPA_CHART_COUNT", SEPA_CHART_COUNT))
+    panel = None
+    indicator_status = "full"
+    if os.getenv("INDICATOR_STATE", "1").lower() not in ("0", "false", "no"):
+        indicator_dir = os.getenv(
+            "INDICATOR_STATE_DIR", os.path.join(state_dir, "indicators")
+        )
+        state_path = os.path.join(indicator_dir, "state.npz")
+        indicator_state, indicator_status = advance_indicator_state(
+            IndicatorState.load(state_path), close
+        )
+        indicator_state.save(state_path)
+        if np.isfinite(indicator_state.latest()["momentum_12_1"]).any():
+            panel = latest_indicator_panel(close, indicator_state)
+    if panel is None:
+        panel = build_indicator_panel(close)
+    universe_sizes = {}
+    analyst_seen = []
+    as_of_date = None
+
+    workers = int(os.getenv("UNIVERSE_WORKERS", "1"))
+    scored = score_universes(
+        panel, fundamentals, spy_close, universes, chart_count, workers, composites
+    )
+
+    # Each universe is written as soon as its analyst panel is ready.
+    precompress = os.getenv("PRECOMPRESS_OUTPUTS", "").lower() in ("1", "true", "yes")
+    chart_encoding = os.getenv("CHART_ENCODING", "json")
+    with RUN_STATS.stage("write_outputs"):
+        writer = DashboardWriter(
+            out_dir,
+            precompress,
+            chart_encoding,
+            chart_axis(r for r in scored.values() if r is not None),
+            OutputTracker(
+                out_dir,
+                os.getenv(
+                    "OUTPUT_HASHES", os.path.join(state_dir, "outputs", "hashes.json")
+                ),
+            ),
+        )
+
+    try:
+        for universe_id, info in universes.items():
+            result = scored[universe_id]
+            if result is None:
+                continue
+            ranked = result["ranked"]
+            records = result["records"]
+            sepa_candidates = result["sepa_candidates"]
+            as_of_date = result["latest_date"]
+            total = len(ranked)
+            histories = {universe_id: ranked}
+            for name, variant in result["variants"].items():
+                histories[f"{universe_id}.{name}"] = variant
+            for history_id, frame in histories.items():
+                append_signal_history(history_dir, history_id, as_of_date, frame)
+                compact_signal_history(history_dir, history_id, as_of_date.year)
+
+            buy_list = [r for r in records if r["action"] == "BUY"][:10]
+            analyst_tickers = [r["ticker"] for r in buy_list]
+            analyst_seen.extend(analyst_tickers)
+            refresh = analyst_cache.select_refresh(
+                analyst_tickers, CACHE_DAYS, refresh_budget
+            )
+            if refresh:
+                analyst_cache.update(fetch_analyst_data(refresh))
+                analyst_cache.save()
+            analyst_data = analyst_cache.data(analyst_tickers)
+
+            analyst_panel = []
+            for rec in buy_list:
+                meta = analyst_data.get(rec["ticker"], {})
+                analyst_panel.append(
+                    {
+                        "ticker": rec["ticker"],
+                        "consensus": meta.get("consensus"),
+                        "analyst_count": meta.get("analyst_count"),
+                        "target_consensus": meta.get("target_consensus"),
+                        "target_high": meta.get("target_high"),
+                        "target_low": meta.get("target_low"),
+                    }
+                )
+
+            with RUN_STATS.stage("write_outputs"):
+                writer.add_universe(
+                    {
+                        "id": universe_id,
+                        "name": info["name"],
+                        "universe_size": total,
+                        "buy_count": int((ranked["action"] == "BUY").sum()),
+                        "sell_count": int((ranked["action"] == "SELL").sum()),
+                        "sepa_count": len(sepa_candidates),
+                        "sepa_candidates": sepa_candidates,
+                        "sepa_charts": result["sepa_charts"],
+                        "analyst_panel": analyst_panel,
+                        "records": records,
+                    }
+                )
+            universe_sizes[universe_id] = total
+            scored[universe_id] = None  # written; let it be freed
+
+        analyst_as_of = analyst_cache.oldest(analyst_seen) if analyst_seen else None
+        meta = {
+            "as_of_date": as_of_date.date().isoformat() if as_of_date else "",
+            "fundamentals_as_of": fundamentals_as_of,
+            "analyst_as_of": analyst_as_of,
+            "signal": describe_composite(composites[DEFAULT_COMPOSITE]),
+            "price_failures": failures,
+        }
+        with RUN_STATS.stage("write_outputs"):
+            writer.close(meta)
+    except BaseException:
+        writer.abort()
+        raise
+    out_path = os.path.join(out_dir, "manifest.json")
 
     print(
-        f"Wrote {out_path} ({len(universe_payloads)} universes) as of {payload['as_of_date']}"
+        f"Wrote {out_path} ({len(universe_sizes)} universes) as of {meta['as_of_date']}"
     )
+    changed = writer.tracker.changed
+    if changed:
+        print(f"{len(changed)} dashboard files changed")
+    else:
+        print("No dashboard files changed.")
+    return {
+        "as_of_date": meta["as_of_date"],
+        "tickers": len(all_tickers),
+        "universes": universe_sizes,
+        "price_failures": len(failures),
+        "indicator_state": indicator_status,
+        "changed_files": changed,
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+"""The backtest's BUY/SELL baskets against the live ranking on one date."""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from backtest_signals import score_rebalances  # noqa: E402
+from benchmark_pipeline import synthetic_close, synthetic_fundamentals  # noqa: E402
+from update_top50_dashboard import (  # noqa: E402
+    assign_actions,
+    build_indicator_panel,
+    compute_signal,
+)
+
+
+def live_and_backtest(seed: int, penny: int, tickers: int = 400):
+    close = synthetic_close(tickers, 3, seed)
+    universe = [t for t in close.columns if t != "SPY"]
+    # Penny stocks on the last session are available but not scored.
+    close.iloc[-1, :penny] = 2.0
+    fundamentals = synthetic_fundamentals(universe, seed)
+    panel = build_indicator_panel(close)
+
+    ranked, latest_date = compute_signal(
+        close, fundamentals, universe, close["SPY"].dropna(), panel
+    )
+    live = assign_actions(ranked)
+    scores = score_rebalances(panel, fundamentals, universe, [latest_date])
+    tickers = np.array(scores["tickers"])
+    return live, scores, tickers
+
+
+def test_baskets_match_live_ranking():
+    # Fewer, then more unscored tickers than fit in the SELL quintile.
+    for seed, penny in [(0, 0), (1, 100)]:
+        live, scores, tickers = live_and_backtest(seed, penny)
+        for action in ("BUY", "SELL"):
+            basket = tickers[scores[action.lower()][0]]
+            assert set(basket) == set(live.index[live["action"] == action])
+
+
+def test_ranks_match_live_ranking():
+    live, scores, tickers = live_and_backtest(2, 40)
+    rank = dict(zip(tickers, scores["rank"][0]))
+    assert [rank[t] for t in live.index] == live["rank"].tolist()
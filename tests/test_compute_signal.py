@@ -0,0 +1,244 @@
+"""compute_signal against the per-ticker implementation it replaced.
+
+baseline_compute_signal is the loop version as it stood before the
+vectorized rewrite, kept verbatim (bar line wrapping) as the reference.
+The one intended difference: the loops let a NaN ROE or margin turn the
+whole quality score NaN, while compute_signal treats it as missing, like
+None. NaN ratios are therefore only fed in where the two agree (P/E, P/B).
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from benchmark_pipeline import synthetic_close, synthetic_fundamentals  # noqa: E402
+from update_top50_dashboard import assign_actions, compute_signal  # noqa: E402
+
+FLOAT_COLUMNS = [
+    "momentum_12_1",
+    "quality_raw",
+    "value_raw",
+    "momentum_z",
+    "quality_z",
+    "value_z",
+    "composite_score",
+    "rs_score",
+    "ma_50",
+    "ma_150",
+    "ma_200",
+]
+
+
+def baseline_compute_signal(
+    close: pd.DataFrame, fundamentals: dict, tickers: list, spy_close: pd.Series
+) -> tuple:
+    signal_12_1 = close.shift(21) / close.shift(252) - 1
+    latest_date = signal_12_1.dropna(how="all").index.max()
+
+    available = [t for t in tickers if t in signal_12_1.columns]
+    if not available:
+        return pd.DataFrame(), latest_date
+
+    latest_sig = signal_12_1.loc[latest_date, available]
+    latest_px = close.loc[latest_date, available]
+
+    valid = latest_sig.dropna()
+    valid = valid[latest_px[valid.index] > 5]
+    if valid.empty:
+        return pd.DataFrame(), latest_date
+
+    momentum = valid.sort_values(ascending=False).rename("momentum_12_1")
+
+    # Relative strength vs SPY (12-month return difference)
+    spy_return = None
+    if latest_date in spy_close.index:
+        spy_return = (
+            spy_close.loc[latest_date] / spy_close.shift(252).loc[latest_date] - 1
+        )
+
+    rs_scores = {}
+    for ticker in momentum.index:
+        if spy_return is None:
+            rs_scores[ticker] = None
+            continue
+        series = close[ticker]
+        if latest_date not in series.index:
+            rs_scores[ticker] = None
+            continue
+        stock_return = series.loc[latest_date] / series.shift(252).loc[latest_date] - 1
+        rs_scores[ticker] = stock_return - spy_return
+
+    value_rows = {}
+    quality_rows = {}
+    for ticker in momentum.index:
+        metrics = fundamentals.get(ticker, {})
+        pe = metrics.get("pe_ratio")
+        pb = metrics.get("pb_ratio")
+        roe = metrics.get("roe")
+        op_margin = metrics.get("operating_margin")
+        profit_margin = metrics.get("profit_margin")
+
+        value_parts = []
+        if pe and pe > 0:
+            value_parts.append(1.0 / pe)
+        if pb and pb > 0:
+            value_parts.append(1.0 / pb)
+        value_rows[ticker] = (
+            sum(value_parts) / len(value_parts) if value_parts else None
+        )
+
+        quality_parts = []
+        if roe is not None:
+            quality_parts.append(roe)
+        margin = op_margin if op_margin is not None else profit_margin
+        if margin is not None:
+            quality_parts.append(margin)
+        quality_rows[ticker] = (
+            sum(quality_parts) / len(quality_parts) if quality_parts else None
+        )
+
+    value_series = pd.Series(value_rows, name="value_raw")
+    quality_series = pd.Series(quality_rows, name="quality_raw")
+
+    def zscore(series: pd.Series) -> pd.Series:
+        valid_vals = series.dropna()
+        if valid_vals.empty or valid_vals.std() == 0:
+            return pd.Series(0.0, index=series.index)
+        return (series - valid_vals.mean()) / valid_vals.std()
+
+    momentum_z = zscore(momentum)
+    quality_z = zscore(quality_series)
+    value_z = zscore(value_series)
+
+    composite = (momentum_z + quality_z + value_z) / 3.0
+
+    ma50 = close[available].rolling(50).mean().loc[latest_date]
+    ma150 = close[available].rolling(150).mean().loc[latest_date]
+    ma200 = close[available].rolling(200).mean().loc[latest_date]
+    ma200_prev = close[available].rolling(200).mean().shift(20).loc[latest_date]
+
+    rs_series = pd.Series(rs_scores, name="rs_score")
+    rs_valid = rs_series.dropna()
+    rs_threshold = rs_valid.quantile(0.8) if not rs_valid.empty else None
+
+    sepa_rows = {}
+    for ticker in momentum.index:
+        price = latest_px[ticker]
+        sma50 = ma50.get(ticker)
+        sma150 = ma150.get(ticker)
+        sma200 = ma200.get(ticker)
+        sma200_prev = ma200_prev.get(ticker)
+        rs_score = rs_series.get(ticker)
+
+        if any(pd.isna(x) for x in [price, sma50, sma150, sma200, sma200_prev]):
+            sepa_rows[ticker] = False
+            continue
+        if rs_threshold is not None and (rs_score is None or rs_score < rs_threshold):
+            sepa_rows[ticker] = False
+            continue
+
+        sepa_rows[ticker] = bool(
+            price > sma50
+            and price > sma150
+            and price > sma200
+            and sma50 > sma150
+            and sma150 > sma200
+            and sma200 > sma200_prev
+        )
+
+    ranked = pd.DataFrame(
+        {
+            "momentum_12_1": momentum,
+            "quality_raw": quality_series,
+            "value_raw": value_series,
+            "momentum_z": momentum_z,
+            "quality_z": quality_z,
+            "value_z": value_z,
+            "composite_score": composite,
+            "rs_score": pd.Series(rs_scores, name="rs_score"),
+            "ma_50": ma50,
+            "ma_150": ma150,
+            "ma_200": ma200,
+            "sepa_pass": pd.Series(sepa_rows, name="sepa_pass"),
+        }
+    ).sort_values("composite_score", ascending=False)
+
+    return ranked, latest_date
+
+
+def synthetic_inputs(tickers: int = 300, seed: int = 0):
+    close = synthetic_close(tickers, 3, seed)
+    universe = [t for t in close.columns if t != "SPY"]
+    fundamentals = synthetic_fundamentals(universe, seed)
+    # Edge cases the loops special-cased: NaN values, zero and negative
+    # multiples, and a ticker with every field missing.
+    rng = np.random.default_rng(seed + 2)
+    for ticker in rng.choice(list(fundamentals), 40, replace=False):
+        metrics = fundamentals[ticker]
+        field = rng.choice(["pe_ratio", "pb_ratio"])
+        metrics[field] = float("nan")
+        metrics["pb_ratio"] = -abs(metrics["pb_ratio"] or 1.0)
+    fundamentals[universe[0]] = {"pe_ratio": 0.0, "pb_ratio": None}
+    fundamentals[universe[1]] = {}
+    return close, fundamentals, universe
+
+
+def assert_equivalent(close, fundamentals, universe):
+    spy_close = close["SPY"].dropna()
+    expected, expected_date = baseline_compute_signal(
+        close, fundamentals, universe, spy_close
+    )
+    actual, actual_date = compute_signal(close, fundamentals, universe, spy_close)
+    assert actual_date == expected_date
+
+    expected = assign_actions(expected)
+    actual = assign_actions(actual)
+    assert actual.index.tolist() == expected.index.tolist()
+    assert actual["rank"].tolist() == expected["rank"].tolist()
+    assert actual["action"].tolist() == expected["action"].tolist()
+    # Available tickers that are not scored have no SEPA flag in either.
+    assert actual["sepa_pass"].isna().tolist() == expected["sepa_pass"].isna().tolist()
+    assert actual["sepa_pass"].dropna().tolist() == (
+        expected["sepa_pass"].dropna().tolist()
+    )
+    for column in FLOAT_COLUMNS:
+        np.testing.assert_allclose(
+            actual[column].to_numpy(dtype=float),
+            expected[column].to_numpy(dtype=float),
+            rtol=1e-9,
+            atol=1e-12,
+            err_msg=column,
+        )
+
+
+def test_matches_baseline():
+    assert_equivalent(*synthetic_inputs())
+
+
+def test_matches_baseline_for_a_subset_universe():
+    close, fundamentals, universe = synthetic_inputs(seed=3)
+    assert_equivalent(close, fundamentals, universe[::3])
+
+
+def test_nan_quality_inputs_count_as_missing():
+    close, fundamentals, universe = synthetic_inputs(seed=7)
+    spy_close = close["SPY"].dropna()
+    ranked, _ = compute_signal(close, fundamentals, universe, spy_close)
+    first, second = ranked["momentum_12_1"].dropna().index[:2]
+    metrics = {"roe": float("nan"), "operating_margin": 0.2, "profit_margin": 0.1}
+    fundamentals[first] = metrics
+    fundamentals[second] = {**metrics, "roe": 0.3, "operating_margin": float("nan")}
+
+    ranked, _ = compute_signal(close, fundamentals, universe, spy_close)
+    assert ranked.loc[first, "quality_raw"] == 0.2
+    assert ranked.loc[second, "quality_raw"] == 0.2
+
+
+def test_matches_baseline_without_spy_history():
+    close, fundamentals, universe = synthetic_inputs(seed=5)
+    close["SPY"] = close["SPY"].where(close.index < close.index[-5])
+    assert_equivalent(close, fundamentals, universe)